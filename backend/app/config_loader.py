@@ -87,11 +87,14 @@ CLASSIFICATION_ENV_OVERRIDES: dict[str, tuple[str, ...]] = {
     "worker_hard_deadline_seconds": ("CLASSIFICATION__WORKER_HARD_DEADLINE_SECONDS",),
     "background_worker_hard_deadline_seconds": ("CLASSIFICATION__BACKGROUND_WORKER_HARD_DEADLINE_SECONDS",),
     "worker_ready_timeout_seconds": ("CLASSIFICATION__WORKER_READY_TIMEOUT_SECONDS",),
+    "worker_hot_standby_enabled": ("CLASSIFICATION__WORKER_HOT_STANDBY_ENABLED",),
     "worker_restart_window_seconds": ("CLASSIFICATION__WORKER_RESTART_WINDOW_SECONDS",),
     "worker_restart_threshold": ("CLASSIFICATION__WORKER_RESTART_THRESHOLD",),
     "worker_breaker_cooldown_seconds": ("CLASSIFICATION__WORKER_BREAKER_COOLDOWN_SECONDS",),
     "live_event_stale_drop_seconds": ("CLASSIFICATION__LIVE_EVENT_STALE_DROP_SECONDS",),
     "live_event_coalescing_enabled": ("CLASSIFICATION__LIVE_EVENT_COALESCING_ENABLED",),
+    "live_event_refresh_enabled": ("CLASSIFICATION__LIVE_EVENT_REFRESH_ENABLED",),
+    "live_event_refresh_min_interval_seconds": ("CLASSIFICATION__LIVE_EVENT_REFRESH_MIN_INTERVAL_SECONDS",),
     "ai_pricing_json": ("CLASSIFICATION__AI_PRICING_JSON",),
     "max_classification_results": ("CLASSIFICATION__MAX_CLASSIFICATION_RESULTS",),
 }
@@ -237,6 +240,8 @@ def load_settings_instance(settings_cls: type[Any], config_path: Path) -> Any:
             os.environ.get("CLASSIFICATION__BACKGROUND_WORKER_HARD_DEADLINE_SECONDS", "120.0")
         ),
         "worker_ready_timeout_seconds": float(os.environ.get("CLASSIFICATION__WORKER_READY_TIMEOUT_SECONDS", "20.0")),
+        "worker_hot_standby_enabled": os.environ.get("CLASSIFICATION__WORKER_HOT_STANDBY_ENABLED", "false").lower()
+        == "true",
         "worker_restart_window_seconds": float(os.environ.get("CLASSIFICATION__WORKER_RESTART_WINDOW_SECONDS", "60.0")),
         "worker_restart_threshold": int(os.environ.get("CLASSIFICATION__WORKER_RESTART_THRESHOLD", "3")),
         "worker_breaker_cooldown_seconds": float(
@@ -245,6 +250,11 @@ def load_settings_instance(settings_cls: type[Any], config_path: Path) -> Any:
         "live_event_stale_drop_seconds": float(os.environ.get("CLASSIFICATION__LIVE_EVENT_STALE_DROP_SECONDS", "30.0")),
         "live_event_coalescing_enabled": os.environ.get("CLASSIFICATION__LIVE_EVENT_COALESCING_ENABLED", "true").lower()
         == "true",
+        "live_event_refresh_enabled": os.environ.get("CLASSIFICATION__LIVE_EVENT_REFRESH_ENABLED", "false").lower()
+        == "true",
+        "live_event_refresh_min_interval_seconds": float(
+            os.environ.get("CLASSIFICATION__LIVE_EVENT_REFRESH_MIN_INTERVAL_SECONDS", "30.0")
+        ),
         "ai_pricing_json": os.environ.get("CLASSIFICATION__AI_PRICING_JSON", "[]"),
         "max_classification_results": int(os.environ.get("CLASSIFICATION__MAX_CLASSIFICATION_RESULTS", "5")),
         "bird_crop_source_priority": os.environ.get("CLASSIFICATION__BIRD_CROP_SOURCE_PRIORITY", "frigate_hints_first"),
@@ -356,6 +356,10 @@ class ClassificationSettings(BaseModel):
         le=300.0,
         description="Timeout while waiting for a classifier worker to load and report ready",
     )
+    worker_hot_standby_enabled: bool = Field(
+        default=False,
+        description="Keep one pre-loaded spare classifier worker per pool so a replaced worker is swapped in instantly",
+    )
     worker_restart_window_seconds: float = Field(
         default=60.0, ge=1.0, le=3600.0, description="Rolling window for classifier worker restart budget"
     )
@@ -371,6 +375,16 @@ class ClassificationSettings(BaseModel):
     live_event_coalescing_enabled: bool = Field(
         default=True, description="Coalesce duplicate live image classification requests before admission"
     )
+    live_event_refresh_enabled: bool = Field(
+        default=False,
+        description="Re-classify a live event on Frigate updates only when its best snapshot improves",
+    )
+    live_event_refresh_min_interval_seconds: float = Field(
+        default=30.0,
+        ge=1.0,
+        le=3600.0,
+        description="Minimum seconds between live event re-classifications without a snapshot improvement",
+    )
     ai_pricing_json: str = Field(default="[]", description="JSON string containing AI pricing overrides")
     bird_model_region_override: str = Field(
         default="auto",
@@ -1,18 +1,25 @@
 import os
+import re
 import sys
 import shutil
 import asyncio
+import sqlite3
 import time
 import aiosqlite
 import structlog
+from aiosqlite.context import contextmanager as aiosqlite_contextmanager
 from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from app.db_write_batcher import DatabaseWriteBatcher, run_in_savepoint
+from app.repositories.schema_snapshot import invalidate_schema_snapshots
 
 log = structlog.get_logger()
 
+# Number of read-only connections; writes always use one dedicated writer.
 DEFAULT_DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
 DEFAULT_DB_BUSY_TIMEOUT_MS = int(os.environ.get("DB_BUSY_TIMEOUT_MS", "30000"))
 DB_POOL_SLOW_ACQUIRE_WARN_MS = float(os.environ.get("DB_POOL_SLOW_ACQUIRE_WARN_MS", "250"))
@@ -22,6 +29,27 @@ DB_POOL_SLOW_ACQUIRE_WARN_MS = float(os.environ.get("DB_POOL_SLOW_ACQUIRE_WARN_M
 DB_POOL_WAIT_WINDOW_SECONDS = float(os.environ.get("DB_POOL_WAIT_WINDOW_SECONDS", "300"))
 # Hard cap on in-memory samples to bound memory under sustained load.
 DB_POOL_WAIT_SAMPLE_CAP = int(os.environ.get("DB_POOL_WAIT_SAMPLE_CAP", "4096"))
+# Live-pipeline writes arriving within this window share one transaction.
+DB_WRITE_BATCH_WINDOW_MS = max(0.0, float(os.environ.get("DB_WRITE_BATCH_WINDOW_MS", "3")))
+DB_WRITE_BATCH_MAX_OPS = max(1, int(os.environ.get("DB_WRITE_BATCH_MAX_OPS", "64")))
+# Scheduled WAL checkpoints; 0 leaves checkpointing to SQLite's autocheckpoint.
+DB_WAL_CHECKPOINT_INTERVAL_SECONDS = max(0.0, float(os.environ.get("DB_WAL_CHECKPOINT_INTERVAL_SECONDS", "60")))
+# Above this WAL size the scheduled checkpoint truncates the file instead of
+# only copying pages back (PASSIVE), so a burst does not leave a huge -wal.
+DB_WAL_TRUNCATE_BYTES = max(0, int(os.environ.get("DB_WAL_TRUNCATE_BYTES", str(64 * 1024 * 1024))))
+# Planner statistics (sqlite_stat1) are refreshed on the writer on this schedule
+# (0 disables) so index choices follow table growth. DB_ANALYZE_LIMIT > 0
+# samples instead of reading every index (SQLite's analysis_limit); sampled
+# counts can mislead the planner, so the default is a full pass (well under a
+# second per 500k detections).
+DB_ANALYZE_INTERVAL_SECONDS = max(0.0, float(os.environ.get("DB_ANALYZE_INTERVAL_SECONDS", "21600")))
+DB_ANALYZE_LIMIT = max(0, int(os.environ.get("DB_ANALYZE_LIMIT", "0")))
+
+# Prepared statements kept per connection by sqlite3 (its default is 128);
+# repository query builders emit stable text so repeated requests hit it.
+DB_STATEMENT_CACHE_SIZE = max(0, int(os.environ.get("DB_STATEMENT_CACHE_SIZE", "256")))
+
+T = TypeVar("T")
 
 
 def _is_testing() -> bool:
@@ -224,21 +252,91 @@ async def _verify_schema(backend_dir: str, db_path: str) -> None:
                 raise RuntimeError(f"Database schema missing columns: {missing}")
 
 
-class DatabasePool:
-    """Simple connection pool for aiosqlite.
-
-    SQLite benefits from connection reuse but has limited write concurrency.
-    This pool maintains a small number of connections (default: 5) with
-    WAL mode enabled for better concurrent read performance.
-    """
-
-    def __init__(self, database_path: str, pool_size: int = DEFAULT_DB_POOL_SIZE):
-        self.database_path = database_path
-        self.pool_size = pool_size
-        self._pool: asyncio.Queue = asyncio.Queue(maxsize=pool_size)
-        self._all_connections: set[aiosqlite.Connection] = set()
-        self._initialized = False
-        self._lock = asyncio.Lock()
+async def _open_connection(database_path: str, *, read_only: bool = False) -> aiosqlite.Connection:
+    if read_only:
+        # `mode=ro` refuses writes at the VFS level; `query_only` also rejects
+        # them at statement level, so a misrouted write fails loudly.
+        conn = await aiosqlite.connect(
+            f"{Path(database_path).resolve().as_uri()}?mode=ro",
+            uri=True,
+            timeout=max(1.0, DEFAULT_DB_BUSY_TIMEOUT_MS / 1000.0),
+            check_same_thread=False,  # Required for connection pool
+            cached_statements=DB_STATEMENT_CACHE_SIZE,
+        )
+        await conn.execute("PRAGMA query_only=ON;")
+    else:
+        conn = await aiosqlite.connect(
+            database_path,
+            timeout=max(1.0, DEFAULT_DB_BUSY_TIMEOUT_MS / 1000.0),
+            check_same_thread=False,  # Required for connection pool
+            cached_statements=DB_STATEMENT_CACHE_SIZE,
+        )
+        # Enable WAL mode for better concurrency
+        await conn.execute("PRAGMA journal_mode=WAL;")
+        await conn.execute("PRAGMA synchronous=NORMAL;")
+        await conn.execute("PRAGMA foreign_keys=ON;")
+        if DB_WAL_CHECKPOINT_INTERVAL_SECONDS > 0:
+            # Checkpoints are scheduled by the pool instead of landing on
+            # whichever commit happens to cross the autocheckpoint threshold.
+            await conn.execute("PRAGMA wal_autocheckpoint=0;")
+    await conn.execute(f"PRAGMA busy_timeout={DEFAULT_DB_BUSY_TIMEOUT_MS};")
+    # Optimize for read-heavy workloads
+    await conn.execute("PRAGMA cache_size=-64000;")  # 64MB cache
+    await conn.execute("PRAGMA temp_store=MEMORY;")
+    await conn.commit()
+    return conn
+
+
+# Pragmas a read-only connection can answer; any other pragma goes to the writer.
+_READ_ONLY_PRAGMAS = frozenset(
+    {
+        "compile_options",
+        "database_list",
+        "foreign_key_list",
+        "freelist_count",
+        "index_info",
+        "index_list",
+        "index_xinfo",
+        "integrity_check",
+        "journal_mode",
+        "page_count",
+        "page_size",
+        "quick_check",
+        "schema_version",
+        "table_info",
+        "table_xinfo",
+        "user_version",
+    }
+)
+_DML_KEYWORD_RE = re.compile(r"\b(INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+
+
+def is_read_statement(sql: str) -> bool:
+    """True when ``sql`` can run on a read-only connection."""
+    statement = sql.lstrip()
+    keyword = statement[:8].split(None, 1)[0].upper() if statement else ""
+    keyword = keyword.split("(", 1)[0]
+    if keyword in {"SELECT", "VALUES", "EXPLAIN"}:
+        return True
+    if keyword == "WITH":
+        return _DML_KEYWORD_RE.search(statement) is None
+    if keyword == "PRAGMA":
+        if "=" in statement:
+            return False
+        name = statement[6:].strip().split("(", 1)[0].strip().rstrip(";").split(".")[-1].lower()
+        return name in _READ_ONLY_PRAGMAS
+    return False
+
+
+class _ConnectionSlots:
+    """FIFO queue of interchangeable connections with acquire-wait diagnostics."""
+
+    def __init__(self, name: str, size: int, factory: Callable[[], Awaitable[aiosqlite.Connection]]):
+        self.name = name
+        self.size = size
+        self._factory = factory
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self._connections: set[aiosqlite.Connection] = set()
         self._acquire_count = 0
         self._slow_acquire_count = 0
         self._acquire_wait_total_ms = 0.0
@@ -248,49 +346,27 @@ class DatabasePool:
         # forever. Bounded by DB_POOL_WAIT_SAMPLE_CAP for memory safety.
         self._wait_samples: deque[tuple[float, float]] = deque(maxlen=DB_POOL_WAIT_SAMPLE_CAP)
 
-    async def _create_connection(self) -> aiosqlite.Connection:
-        """Create a new database connection with optimal settings."""
-        conn = await aiosqlite.connect(
-            self.database_path,
-            timeout=max(1.0, DEFAULT_DB_BUSY_TIMEOUT_MS / 1000.0),
-            check_same_thread=False,  # Required for connection pool
-        )
-        # Enable WAL mode for better concurrency
-        await conn.execute("PRAGMA journal_mode=WAL;")
-        await conn.execute("PRAGMA synchronous=NORMAL;")
-        await conn.execute("PRAGMA foreign_keys=ON;")
-        await conn.execute(f"PRAGMA busy_timeout={DEFAULT_DB_BUSY_TIMEOUT_MS};")
-        # Optimize for read-heavy workloads
-        await conn.execute("PRAGMA cache_size=-64000;")  # 64MB cache
-        await conn.execute("PRAGMA temp_store=MEMORY;")
-        await conn.commit()
-        self._all_connections.add(conn)
+    async def _create(self) -> aiosqlite.Connection:
+        conn = await self._factory()
+        self._connections.add(conn)
         return conn
 
-    async def initialize(self):
-        """Initialize the connection pool."""
-        async with self._lock:
-            if self._initialized:
-                return
-
-            log.info("Initializing database connection pool", pool_size=self.pool_size, db_path=self.database_path)
-
-            # Create initial pool of connections
-            for _ in range(self.pool_size):
-                conn = await self._create_connection()
-                await self._pool.put(conn)
-
-            self._initialized = True
-            log.info("Database connection pool initialized")
-
-    async def acquire(self) -> aiosqlite.Connection:
-        """Acquire a connection from the pool."""
-        if not self._initialized:
-            await self.initialize()
+    async def fill(self) -> None:
+        for _ in range(self.size):
+            await self._queue.put(await self._create())
 
-        # Get connection from pool (waits if none available)
+    async def acquire(self, timeout: float | None = None) -> aiosqlite.Connection:
         started = time.monotonic()
-        conn = await self._pool.get()
+        if timeout is None:
+            conn = await self._queue.get()
+        else:
+            try:
+                conn = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                self._record_wait_sample((time.monotonic() - started) * 1000.0)
+                raise sqlite3.OperationalError(
+                    f"database is locked: no {self.name} connection within {timeout:.0f}s"
+                ) from None
         waited_ms = (time.monotonic() - started) * 1000.0
         self._acquire_count += 1
         self._acquire_wait_total_ms += waited_ms
@@ -299,56 +375,45 @@ class DatabasePool:
             self._slow_acquire_count += 1
             log.warning(
                 "Slow DB pool acquire",
+                pool=self.name,
                 waited_ms=round(waited_ms, 1),
-                queue_available=self._pool.qsize(),
-                pool_size=self.pool_size,
+                queue_available=self._queue.qsize(),
+                pool_size=self.size,
                 busy_timeout_ms=DEFAULT_DB_BUSY_TIMEOUT_MS,
             )
         return conn
 
-    async def release(self, conn: aiosqlite.Connection):
-        """Release a connection back to the pool."""
+    async def release(self, conn: aiosqlite.Connection) -> None:
         try:
             # Rollback any uncommitted transactions
             await conn.rollback()
-            await self._pool.put(conn)
+            await self._queue.put(conn)
         except Exception as e:
             # Connection is corrupt, create a new one
-            log.warning("Discarding corrupt connection", error=str(e))
+            log.warning("Discarding corrupt connection", pool=self.name, error=str(e))
             try:
                 await conn.close()
             except Exception:
                 pass
-            self._all_connections.discard(conn)
-            # Create replacement connection
-            new_conn = await self._create_connection()
-            await self._pool.put(new_conn)
+            self._connections.discard(conn)
+            await self._queue.put(await self._create())
 
-    async def close_all(self):
-        """Close all connections in the pool."""
-        async with self._lock:
-            if not self._initialized:
-                return
-
-            log.info("Closing database connection pool")
-            while not self._pool.empty():
-                try:
-                    conn = self._pool.get_nowait()
-                    await conn.close()
-                    self._all_connections.discard(conn)
-                except Exception as e:
-                    log.warning("Error closing connection", error=str(e))
-
-            for conn in list(self._all_connections):
-                try:
-                    await conn.close()
-                except Exception as e:
-                    log.warning("Error closing checked-out connection", error=str(e))
-                finally:
-                    self._all_connections.discard(conn)
+    async def close_all(self) -> None:
+        while not self._queue.empty():
+            try:
+                conn = self._queue.get_nowait()
+                await conn.close()
+                self._connections.discard(conn)
+            except Exception as e:
+                log.warning("Error closing connection", pool=self.name, error=str(e))
 
-            self._initialized = False
-            log.info("Database connection pool closed")
+        for conn in list(self._connections):
+            try:
+                await conn.close()
+            except Exception as e:
+                log.warning("Error closing checked-out connection", pool=self.name, error=str(e))
+            finally:
+                self._connections.discard(conn)
 
     def _record_wait_sample(self, waited_ms: float) -> None:
         """Record a wait sample, pruning entries older than the window.
@@ -379,21 +444,305 @@ class DatabasePool:
     def get_status(self) -> dict:
         avg_wait_ms = (self._acquire_wait_total_ms / self._acquire_count) if self._acquire_count > 0 else 0.0
         return {
-            "initialized": self._initialized,
-            "pool_size": self.pool_size,
-            "available_connections": self._pool.qsize(),
+            "pool_size": self.size,
+            "available_connections": self._queue.qsize(),
             "acquire_count": self._acquire_count,
             "slow_acquire_count": self._slow_acquire_count,
             "acquire_wait_avg_ms": round(avg_wait_ms, 2),
             "acquire_wait_max_ms": round(self._windowed_wait_max_ms(), 2),
             "acquire_wait_lifetime_max_ms": round(self._acquire_wait_lifetime_max_ms, 2),
+        }
+
+
+class DatabasePool:
+    """Connection pool for aiosqlite split into one writer and read-only readers.
+
+    SQLite allows a single writer at a time, so writes share one dedicated
+    connection handed out in FIFO order; reads are spread over ``pool_size``
+    ``mode=ro`` connections (default: 5) and never queue behind writes. WAL
+    checkpoints run on a schedule through the writer queue rather than inside
+    whichever commit crosses the autocheckpoint threshold.
+    """
+
+    def __init__(self, database_path: str, pool_size: int = DEFAULT_DB_POOL_SIZE):
+        self.database_path = database_path
+        self.pool_size = pool_size
+        self.readers = _ConnectionSlots("read", pool_size, lambda: _open_connection(self.database_path, read_only=True))
+        self.writer = _ConnectionSlots("write", 1, lambda: _open_connection(self.database_path))
+        # (task, connection) while a RoutedConnection holds the writer.
+        self._routed_writer: Optional[tuple[Optional[asyncio.Task], aiosqlite.Connection]] = None
+        self._initialized = False
+        self._lock = asyncio.Lock()
+        self._checkpoint_task: asyncio.Task | None = None
+        self._statistics_task: asyncio.Task | None = None
+        self._checkpoint_count = 0
+        self._analyze_count = 0
+        self._analyze_failures = 0
+        self._last_analyze: Optional[dict] = None
+        self._checkpoint_failures = 0
+        self._last_checkpoint: Optional[dict] = None
+
+    async def initialize(self):
+        """Initialize the connection pool."""
+        async with self._lock:
+            if self._initialized:
+                return
+
+            log.info("Initializing database connection pool", pool_size=self.pool_size, db_path=self.database_path)
+
+            # The writer goes first: it creates the WAL and shared-memory files
+            # a read-only connection cannot create itself.
+            await self.writer.fill()
+            await self.readers.fill()
+            if DB_WAL_CHECKPOINT_INTERVAL_SECONDS > 0:
+                self._checkpoint_task = asyncio.create_task(self._checkpoint_loop(), name="db_wal_checkpoint")
+            if DB_ANALYZE_INTERVAL_SECONDS > 0:
+                self._statistics_task = asyncio.create_task(self._statistics_loop(), name="db_analyze")
+
+            self._initialized = True
+            log.info("Database connection pool initialized")
+
+    async def acquire_reader(self) -> aiosqlite.Connection:
+        if not self._initialized:
+            await self.initialize()
+        return await self.readers.acquire()
+
+    async def acquire_writer(self) -> aiosqlite.Connection:
+        if not self._initialized:
+            await self.initialize()
+        # Waiting longer than SQLite's own busy timeout means the writer is
+        # held by something stuck (or by the waiting caller itself); fail the
+        # same way a locked database would.
+        return await self.writer.acquire(timeout=max(1.0, DEFAULT_DB_BUSY_TIMEOUT_MS / 1000.0))
+
+    def writer_held_by_current_task(self) -> Optional[aiosqlite.Connection]:
+        """The writer, if the calling task holds it through a :class:`RoutedConnection`."""
+        held = self._routed_writer
+        if held is None:
+            return None
+        task, conn = held
+        try:
+            current = asyncio.current_task()
+        except RuntimeError:
+            return None
+        return conn if task is not None and task is current else None
+
+    @asynccontextmanager
+    async def writer_connection(self):
+        conn = await self.acquire_writer()
+        try:
+            yield conn
+        finally:
+            await self.writer.release(conn)
+
+    async def close_all(self):
+        """Close all connections in the pool."""
+        async with self._lock:
+            if not self._initialized:
+                return
+
+            log.info("Closing database connection pool")
+            tasks = [task for task in (self._checkpoint_task, self._statistics_task) if task is not None]
+            self._checkpoint_task = self._statistics_task = None
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.readers.close_all()
+            await self.writer.close_all()
+
+            self._initialized = False
+            log.info("Database connection pool closed")
+
+    def wal_size_bytes(self) -> int:
+        try:
+            return os.path.getsize(f"{self.database_path}-wal")
+        except OSError:
+            return 0
+
+    async def checkpoint(self, mode: Optional[str] = None) -> dict:
+        """Run a WAL checkpoint on the writer; TRUNCATE once the WAL is large."""
+        wal_bytes = self.wal_size_bytes()
+        if mode is None:
+            mode = "TRUNCATE" if wal_bytes >= DB_WAL_TRUNCATE_BYTES else "PASSIVE"
+        started = time.monotonic()
+        async with self.writer_connection() as conn:
+            async with conn.execute(f"PRAGMA wal_checkpoint({mode})") as cursor:
+                row = await cursor.fetchone()
+        result = {
+            "mode": mode,
+            "busy": bool(row[0]) if row else False,
+            "log_frames": int(row[1]) if row else 0,
+            "checkpointed_frames": int(row[2]) if row else 0,
+            "wal_bytes_before": wal_bytes,
+            "wal_bytes_after": self.wal_size_bytes(),
+            "duration_ms": round((time.monotonic() - started) * 1000.0, 2),
+            "completed_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._checkpoint_count += 1
+        self._last_checkpoint = result
+        if result["busy"]:
+            log.info("WAL checkpoint could not finish past active readers", **result)
+        return result
+
+    async def refresh_statistics(self) -> dict:
+        """Re-run ANALYZE on the writer so the planner sees current row counts.
+
+        ANALYZE bumps the schema version, so the read-only connections reload
+        the new statistics on their next statement.
+        """
+        started = time.monotonic()
+        async with self.writer_connection() as conn:
+            await conn.execute(f"PRAGMA analysis_limit={DB_ANALYZE_LIMIT}")
+            await conn.execute("ANALYZE")
+            await conn.commit()
+        result = {
+            "analysis_limit": DB_ANALYZE_LIMIT,
+            "duration_ms": round((time.monotonic() - started) * 1000.0, 2),
+            "completed_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._analyze_count += 1
+        self._last_analyze = result
+        return result
+
+    async def _statistics_loop(self) -> None:
+        while True:
+            await asyncio.sleep(DB_ANALYZE_INTERVAL_SECONDS)
+            try:
+                await self.refresh_statistics()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._analyze_failures += 1
+                log.warning("Scheduled ANALYZE failed", error=str(e))
+
+    async def _checkpoint_loop(self) -> None:
+        while True:
+            await asyncio.sleep(DB_WAL_CHECKPOINT_INTERVAL_SECONDS)
+            try:
+                await self.checkpoint()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._checkpoint_failures += 1
+                log.warning("Scheduled WAL checkpoint failed", error=str(e))
+
+    def get_status(self) -> dict:
+        read = self.readers.get_status()
+        write = self.writer.get_status()
+        acquire_count = read["acquire_count"] + write["acquire_count"]
+        total_wait_ms = self.readers._acquire_wait_total_ms + self.writer._acquire_wait_total_ms
+        return {
+            "initialized": self._initialized,
+            "pool_size": self.pool_size,
+            "available_connections": read["available_connections"],
+            "acquire_count": acquire_count,
+            "slow_acquire_count": read["slow_acquire_count"] + write["slow_acquire_count"],
+            "acquire_wait_avg_ms": round(total_wait_ms / acquire_count, 2) if acquire_count else 0.0,
+            "acquire_wait_max_ms": max(read["acquire_wait_max_ms"], write["acquire_wait_max_ms"]),
+            "acquire_wait_lifetime_max_ms": max(
+                read["acquire_wait_lifetime_max_ms"], write["acquire_wait_lifetime_max_ms"]
+            ),
             "acquire_wait_window_seconds": DB_POOL_WAIT_WINDOW_SECONDS,
             "slow_acquire_warn_ms": DB_POOL_SLOW_ACQUIRE_WARN_MS,
+            "pools": {"read": read, "write": write},
+            "wal": {
+                "size_bytes": self.wal_size_bytes(),
+                "checkpoint_interval_seconds": DB_WAL_CHECKPOINT_INTERVAL_SECONDS,
+                "truncate_threshold_bytes": DB_WAL_TRUNCATE_BYTES,
+                "checkpoint_count": self._checkpoint_count,
+                "checkpoint_failures": self._checkpoint_failures,
+                "last_checkpoint": dict(self._last_checkpoint) if self._last_checkpoint else None,
+            },
+            "statistics": {
+                "analyze_interval_seconds": DB_ANALYZE_INTERVAL_SECONDS,
+                "analysis_limit": DB_ANALYZE_LIMIT,
+                "analyze_count": self._analyze_count,
+                "analyze_failures": self._analyze_failures,
+                "last_analyze": dict(self._last_analyze) if self._last_analyze else None,
+            },
         }
 
 
+class RoutedConnection:
+    """Connection handle yielded by :func:`get_db`.
+
+    Each statement is routed by what it does: reads run on a read-only pooled
+    connection, and the first write takes the single writer. The writer is kept
+    (and every statement goes to it, so uncommitted rows and ``changes()`` stay
+    visible) until ``commit``/``rollback`` hands it back to the queue.
+
+    Reads issued before the first write see the latest commit, not one snapshot
+    shared with the write. A read-modify-write that needs one snapshot starts
+    with ``BEGIN`` (or ``BEGIN IMMEDIATE``), which takes the writer up front.
+    """
+
+    def __init__(self, pool: DatabasePool):
+        self._pool = pool
+        self._reader: Optional[aiosqlite.Connection] = None
+        self._writer: Optional[aiosqlite.Connection] = None
+
+    @property
+    def schema_cache_key(self) -> DatabasePool:
+        # Every connection of a pool sees the same schema.
+        return self._pool
+
+    async def _connection_for(self, sql: str) -> aiosqlite.Connection:
+        if self._writer is not None:
+            return self._writer
+        if is_read_statement(sql):
+            if self._reader is None:
+                self._reader = await self._pool.acquire_reader()
+            return self._reader
+        return await self._take_writer()
+
+    async def _take_writer(self) -> aiosqlite.Connection:
+        if self._writer is None:
+            self._writer = await self._pool.acquire_writer()
+            self._pool._routed_writer = (asyncio.current_task(), self._writer)
+        return self._writer
+
+    @aiosqlite_contextmanager
+    async def execute(self, sql: str, parameters: Any = None) -> aiosqlite.Cursor:
+        conn = await self._connection_for(sql)
+        return await conn.execute(sql, parameters)
+
+    @aiosqlite_contextmanager
+    async def executemany(self, sql: str, parameters: Any) -> aiosqlite.Cursor:
+        writer = await self._take_writer()
+        return await writer.executemany(sql, parameters)
+
+    async def commit(self) -> None:
+        if self._writer is None:
+            return
+        await self._writer.commit()
+        await self._release_writer()
+
+    async def rollback(self) -> None:
+        if self._writer is None:
+            return
+        await self._writer.rollback()
+        await self._release_writer()
+
+    async def _release_writer(self) -> None:
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            held = self._pool._routed_writer
+            if held is not None and held[1] is writer:
+                self._pool._routed_writer = None
+            await self._pool.writer.release(writer)
+
+    async def close(self) -> None:
+        # Uncommitted writes are rolled back by the release, as before.
+        await self._release_writer()
+        reader, self._reader = self._reader, None
+        if reader is not None:
+            await self._pool.readers.release(reader)
+
+
 # Global connection pool
 _db_pool: Optional[DatabasePool] = None
+# Groups live-pipeline writes into shared transactions on the pool's writer.
+_db_write_batcher: Optional[DatabaseWriteBatcher] = None
 
 
 def is_db_pool_initialized() -> bool:
@@ -415,13 +764,54 @@ def get_db_pool_status() -> dict:
             "acquire_wait_lifetime_max_ms": 0.0,
             "acquire_wait_window_seconds": DB_POOL_WAIT_WINDOW_SECONDS,
             "slow_acquire_warn_ms": DB_POOL_SLOW_ACQUIRE_WARN_MS,
+            "pools": {},
+            "wal": {
+                "size_bytes": 0,
+                "checkpoint_interval_seconds": DB_WAL_CHECKPOINT_INTERVAL_SECONDS,
+                "truncate_threshold_bytes": DB_WAL_TRUNCATE_BYTES,
+                "checkpoint_count": 0,
+                "checkpoint_failures": 0,
+                "last_checkpoint": None,
+            },
+            "statistics": {
+                "analyze_interval_seconds": DB_ANALYZE_INTERVAL_SECONDS,
+                "analysis_limit": DB_ANALYZE_LIMIT,
+                "analyze_count": 0,
+                "analyze_failures": 0,
+                "last_analyze": None,
+            },
+            "write_batcher": _write_batcher_status(),
         }
-    return _db_pool.get_status()
+    status = _db_pool.get_status()
+    status["write_batcher"] = _write_batcher_status()
+    return status
+
+
+def _write_batcher_status() -> dict:
+    if _db_write_batcher is None:
+        return {
+            "running": False,
+            "window_ms": DB_WRITE_BATCH_WINDOW_MS,
+            "max_batch_ops": DB_WRITE_BATCH_MAX_OPS,
+            "queue_depth": 0,
+            "batch_count": 0,
+            "op_count": 0,
+            "failed_op_count": 0,
+            "failed_batch_count": 0,
+            "batch_size_avg": 0.0,
+            "batch_size_max": 0,
+            "batch_size_last": 0,
+            "commit_latency_avg_ms": 0.0,
+            "commit_latency_last_ms": 0.0,
+            "commit_latency_max_ms": 0.0,
+            "queue_wait_max_ms": 0.0,
+        }
+    return _db_write_batcher.get_status()
 
 
 async def init_db():
     """Initialize database and connection pool."""
-    global _db_pool
+    global _db_pool, _db_write_batcher
     if _db_pool is not None and _db_pool._initialized:
         await close_db()
 
@@ -532,14 +922,28 @@ async def init_db():
         await _verify_schema(backend_dir, db_path)
         log.info("Database schema verification completed")
 
+    # Migrations may have added tables or columns repositories probe for.
+    invalidate_schema_snapshots()
+
     # Initialize connection pool
     _db_pool = DatabasePool(db_path, pool_size=DEFAULT_DB_POOL_SIZE)
     await _db_pool.initialize()
 
+    _db_write_batcher = DatabaseWriteBatcher(
+        _db_pool.writer_connection,
+        window_ms=DB_WRITE_BATCH_WINDOW_MS,
+        max_batch_ops=DB_WRITE_BATCH_MAX_OPS,
+    )
+    await _db_write_batcher.start()
+
 
 async def close_db():
     """Close database connection pool."""
-    global _db_pool
+    global _db_pool, _db_write_batcher
+    if _db_write_batcher is not None:
+        # Drain queued writes before the pool (and the process) goes away.
+        await _db_write_batcher.stop()
+        _db_write_batcher = None
     if _db_pool:
         await _db_pool.close_all()
         _db_pool = None
@@ -549,6 +953,9 @@ async def close_db():
 async def get_db():
     """Get a database connection from the pool.
 
+    With the pool initialized this is a :class:`RoutedConnection`: reads run on
+    read-only connections and writes on the single writer.
+
     Usage:
         async with get_db() as db:
             cursor = await db.execute("SELECT * FROM table")
@@ -565,8 +972,33 @@ async def get_db():
             yield db
         return
 
-    conn = await _db_pool.acquire()
+    conn = RoutedConnection(_db_pool)
     try:
         yield conn
     finally:
-        await _db_pool.release(conn)
+        await conn.close()
+
+
+async def run_batched_write(op: Callable[[Any], Awaitable[T]]) -> T:
+    """Run a live-pipeline write through the batching writer.
+
+    ``op`` receives a connection and may commit as usual; inside a batch its
+    commit is deferred to the batch's single commit. The call returns only once
+    the write is committed, so a following read on any connection sees it.
+    Without a running batcher (before ``init_db``, or from another event loop)
+    the write runs and commits through :func:`get_db` on its own.
+
+    If the calling task already holds the writer through an uncommitted
+    :func:`get_db` write, waiting for the writer would wait on itself; the op
+    runs inline in a savepoint of that transaction and commits with it.
+    """
+    held = _db_pool.writer_held_by_current_task() if _db_pool is not None else None
+    if held is not None:
+        return await run_in_savepoint(held, op, "nested_write")
+    batcher = _db_write_batcher
+    if batcher is not None and batcher.accepts_from_current_loop():
+        return await batcher.submit(op)
+    async with get_db() as db:
+        result = await op(db)
+        await db.commit()
+        return result
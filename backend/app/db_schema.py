@@ -13,7 +13,7 @@ from sqlalchemy import (
     Date,
     PrimaryKeyConstraint,
 )
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 metadata = MetaData()
 
@@ -72,7 +72,7 @@ detections = Table(
 # Indices for detections
 Index("idx_detections_time", detections.c.detection_time)
 Index("idx_detections_species", detections.c.display_name)
-Index("idx_detections_hidden", detections.c.is_hidden)
+Index("idx_detections_hidden_time", detections.c.detection_time, sqlite_where=text("is_hidden = 1"))
 Index("idx_detections_camera", detections.c.camera_name)
 Index("idx_detections_camera_time", detections.c.camera_name, detections.c.detection_time)
 Index("idx_detections_scientific", detections.c.scientific_name)
@@ -82,6 +82,19 @@ Index("idx_detections_frigate_event", detections.c.frigate_event)
 Index("idx_detections_video_status", detections.c.video_classification_status)
 Index("idx_detections_notified_at", detections.c.notified_at)
 Index("idx_detections_frigate_status", detections.c.frigate_status)
+# Visible rows only, covering the leaderboard/timeline aggregates and visible counts.
+Index(
+    "idx_detections_visible_time",
+    detections.c.detection_time,
+    detections.c.taxa_id,
+    detections.c.scientific_name,
+    detections.c.display_name,
+    detections.c.common_name,
+    detections.c.score,
+    detections.c.camera_name,
+    detections.c.is_hidden,
+    sqlite_where=text("(is_hidden = 0 OR is_hidden IS NULL)"),
+)
 
 audio_detections = Table(
     "audio_detections",
@@ -266,6 +279,56 @@ species_daily_rollup = Table(
 Index("idx_species_rollup_date", species_daily_rollup.c.rollup_date)
 Index("idx_species_rollup_canonical", species_daily_rollup.c.canonical_key)
 Index("idx_species_rollup_display", species_daily_rollup.c.display_name)
+Index("idx_species_rollup_canonical_date", species_daily_rollup.c.canonical_key, species_daily_rollup.c.rollup_date)
+
+# Visible detections per UTC hour; maintained by triggers on detections (see migration b4c5d6e7f8a0).
+detection_hourly_cube = Table(
+    "detection_hourly_cube",
+    metadata,
+    Column("bucket_hour", String, nullable=False),
+    Column("canonical_key", String, nullable=False),
+    Column("camera_name", String, nullable=False),
+    Column("detection_count", Integer, nullable=False, server_default="0"),
+    Column("score_sum", Float, nullable=False, server_default="0"),
+    Column("score_count", Integer, nullable=False, server_default="0"),
+    Column("score_max", Float, nullable=False, server_default="0"),
+    PrimaryKeyConstraint("bucket_hour", "canonical_key", "camera_name"),
+)
+
+# Upstream reference data (iNat, eBird, GBIF, BirdNET-Go); blobs live on disk under blob_path.
+reference_cache = Table(
+    "reference_cache",
+    metadata,
+    Column("source", String, nullable=False),
+    Column("cache_key", String, nullable=False),
+    Column("payload", String),
+    Column("blob_path", String),
+    Column("blob_bytes", Integer, nullable=False, server_default="0"),
+    Column("media_type", String),
+    Column("fetched_at", TIMESTAMP, nullable=False),
+    Column("accessed_at", TIMESTAMP, nullable=False),
+    PrimaryKeyConstraint("source", "cache_key"),
+)
+
+Index("idx_reference_cache_fetched", reference_cache.c.source, reference_cache.c.fetched_at)
+Index("idx_reference_cache_blob_access", reference_cache.c.accessed_at, sqlite_where=text("blob_path IS NOT NULL"))
+
+# Classifier results keyed by media content, model artifact and input policy; reused by reprocessing jobs.
+inference_memo = Table(
+    "inference_memo",
+    metadata,
+    Column("media_sha256", String, nullable=False),
+    Column("model_sha256", String, nullable=False),
+    Column("policy_sha256", String, nullable=False),
+    Column("kind", String, nullable=False),
+    Column("results", String, nullable=False),
+    Column("diagnostics", String),
+    Column("created_at", TIMESTAMP, nullable=False),
+    Column("accessed_at", TIMESTAMP, nullable=False),
+    PrimaryKeyConstraint("media_sha256", "model_sha256", "policy_sha256"),
+)
+
+Index("idx_inference_memo_accessed", inference_memo.c.accessed_at)
 
 
 detection_favorites = Table(
@@ -0,0 +1,234 @@
+"""Single-writer actor that groups live-pipeline writes into shared transactions.
+
+Every detection upsert, video/primary classification update and notification
+stamp used to commit on its own pooled connection, so a burst of MQTT events
+paid one WAL commit (and one fight for SQLite's write lock) per statement. The
+batcher takes the pool's single writer once per batch; writes submitted within
+a few milliseconds of each other run inside one ``BEGIN IMMEDIATE`` transaction, each
+under its own savepoint so a failing write is rolled back alone, and the batch
+commits once.
+
+A submitter's future resolves only after that commit, so anything it reads next
+on any connection already sees its write (read-your-writes is preserved).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, TypeVar
+
+import aiosqlite
+import structlog
+
+log = structlog.get_logger()
+
+T = TypeVar("T")
+WriteOp = Callable[[Any], Awaitable[Any]]
+
+# Commit-latency samples kept for the status average.
+_LATENCY_SAMPLE_CAP = 512
+
+
+class _SavepointConnection:
+    """Connection view handed to one batched write.
+
+    Repository write methods commit (and occasionally roll back) themselves.
+    Inside a batch the commit belongs to the actor, so ``commit`` is a no-op
+    and ``rollback`` only undoes this write's savepoint.
+    """
+
+    def __init__(self, conn: aiosqlite.Connection, savepoint: str):
+        self._conn = conn
+        self._savepoint = savepoint
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    @property
+    def schema_cache_key(self) -> Any:
+        # Share the writer's schema snapshot instead of re-reading sqlite_master per write.
+        return getattr(self._conn, "schema_cache_key", None) or self._conn
+
+    async def commit(self) -> None:
+        return None
+
+    async def rollback(self) -> None:
+        await self._conn.execute(f"ROLLBACK TO {self._savepoint}")
+
+
+async def run_in_savepoint(conn: aiosqlite.Connection, op: Callable[[Any], Awaitable[T]], savepoint: str) -> T:
+    """Run ``op`` under its own savepoint on an open writer; a failure rolls back only ``op``.
+
+    ``op``'s own commit is deferred to whoever owns the enclosing transaction.
+    """
+    await conn.execute(f"SAVEPOINT {savepoint}")
+    try:
+        result = await op(_SavepointConnection(conn, savepoint))
+    except Exception:
+        await conn.execute(f"ROLLBACK TO {savepoint}")
+        await conn.execute(f"RELEASE {savepoint}")
+        raise
+    await conn.execute(f"RELEASE {savepoint}")
+    return result
+
+
+@dataclass
+class _PendingWrite:
+    op: WriteOp
+    future: asyncio.Future
+    enqueued_at: float
+
+
+class DatabaseWriteBatcher:
+    def __init__(
+        self,
+        writer: Callable[[], AbstractAsyncContextManager[aiosqlite.Connection]],
+        *,
+        window_ms: float,
+        max_batch_ops: int,
+    ):
+        self._writer = writer
+        self.window_ms = max(0.0, float(window_ms))
+        self.max_batch_ops = max(1, int(max_batch_ops))
+        self._queue: asyncio.Queue[_PendingWrite] | None = None
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._batch_count = 0
+        self._op_count = 0
+        self._failed_op_count = 0
+        self._failed_batch_count = 0
+        self._max_batch_size = 0
+        self._last_batch_size = 0
+        self._commit_latency_ms: deque[float] = deque(maxlen=_LATENCY_SAMPLE_CAP)
+        self._commit_latency_max_ms = 0.0
+        self._queue_wait_max_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run(), name="db_write_batcher")
+
+    async def stop(self) -> None:
+        """Drain queued writes, then stop the actor."""
+        task = self._task
+        if task is not None and not task.done():
+            if self._queue is not None and asyncio.get_running_loop() is self._loop:
+                await self._queue.join()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        self._task = None
+        self._queue = None
+        self._loop = None
+
+    def accepts_from_current_loop(self) -> bool:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return self.running and loop is self._loop
+
+    async def submit(self, op: Callable[[Any], Awaitable[T]]) -> T:
+        """Run ``op(conn)`` in the next batch; returns its result once committed."""
+        if self._queue is None:
+            raise RuntimeError("DB write batcher is not running")
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_PendingWrite(op=op, future=future, enqueued_at=time.monotonic()))
+        return await future
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            first = await queue.get()
+            batch = [first]
+            deadline = time.monotonic() + self.window_ms / 1000.0
+            while len(batch) < self.max_batch_ops:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._execute_batch(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _execute_batch(self, batch: list[_PendingWrite]) -> None:
+        started = time.monotonic()
+        for pending in batch:
+            self._queue_wait_max_ms = max(self._queue_wait_max_ms, (started - pending.enqueued_at) * 1000.0)
+        results: list[tuple[_PendingWrite, bool, Any]] = []
+        try:
+            # Releasing the writer rolls back whatever a failed batch left open.
+            async with self._writer() as conn:
+                await conn.execute("BEGIN IMMEDIATE")
+                for index, pending in enumerate(batch):
+                    try:
+                        result = await run_in_savepoint(conn, pending.op, f"write_{index}")
+                    except Exception as e:
+                        results.append((pending, False, e))
+                        continue
+                    results.append((pending, True, result))
+                commit_started = time.monotonic()
+                await conn.commit()
+                commit_ms = (time.monotonic() - commit_started) * 1000.0
+        except Exception as e:
+            # The transaction itself failed (writer busy, broken connection):
+            # nothing in this batch was committed, so every submitter sees it.
+            self._failed_batch_count += 1
+            log.error("Batched DB write failed", batch_size=len(batch), error=str(e))
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+            return
+
+        self._record_batch(len(batch), commit_ms)
+        for pending, ok, value in results:
+            if pending.future.done():
+                continue
+            if ok:
+                pending.future.set_result(value)
+            else:
+                self._failed_op_count += 1
+                pending.future.set_exception(value)
+
+    def _record_batch(self, size: int, commit_ms: float) -> None:
+        self._batch_count += 1
+        self._op_count += size
+        self._last_batch_size = size
+        self._max_batch_size = max(self._max_batch_size, size)
+        self._commit_latency_ms.append(commit_ms)
+        self._commit_latency_max_ms = max(self._commit_latency_max_ms, commit_ms)
+
+    def get_status(self) -> dict:
+        latencies = self._commit_latency_ms
+        return {
+            "running": self.running,
+            "window_ms": self.window_ms,
+            "max_batch_ops": self.max_batch_ops,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "batch_count": self._batch_count,
+            "op_count": self._op_count,
+            "failed_op_count": self._failed_op_count,
+            "failed_batch_count": self._failed_batch_count,
+            "batch_size_avg": round(self._op_count / self._batch_count, 2) if self._batch_count else 0.0,
+            "batch_size_max": self._max_batch_size,
+            "batch_size_last": self._last_batch_size,
+            "commit_latency_avg_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            "commit_latency_last_ms": round(latencies[-1], 2) if latencies else 0.0,
+            "commit_latency_max_ms": round(self._commit_latency_max_ms, 2),
+            "queue_wait_max_ms": round(self._queue_wait_max_ms, 2),
+        }
@@ -1,3 +1,4 @@
+from app.utils.import_profile import startup_import_profiler
 from fastapi import FastAPI, Depends, HTTPException, status, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse, Response, JSONResponse
@@ -15,7 +16,7 @@ import sys  # Trigger CI rebuild
 from time import monotonic
 from contextlib import asynccontextmanager
 from typing import Awaitable, Callable
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST, Counter
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST, Counter, Gauge
 from pydantic import BaseModel
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
@@ -38,6 +39,18 @@ from app.services.auto_video_classifier_service import auto_video_classifier
 from app.services.high_quality_snapshot_service import high_quality_snapshot_service
 from app.services.notification_dispatcher import notification_dispatcher
 from app.services.frigate_client import frigate_client
+from app.services.ai_service import ai_service
+from app.services.taxonomy.label_taxonomy_table import label_taxonomy_table
+from app.services.lifecycle_graph import LifecyclePhase, run_lifecycle_graph
+from app.services.maintenance_scheduler import (
+    MAINTENANCE_MEDIA_FILES_PER_SECOND,
+    MAINTENANCE_MEDIA_SLICE_FILES,
+    MAINTENANCE_RETENTION_ROWS_PER_SECOND,
+    MAINTENANCE_RETENTION_SLICE_ROWS,
+    MaintenanceTask,
+    SliceResult,
+    maintenance_scheduler,
+)
 from app.repositories.detection_repository import DetectionRepository
 from app.routers import (
     events,
@@ -72,6 +85,11 @@ from app.ratelimit import limiter
 from app.auth import AuthContext
 from app.auth import get_auth_context_with_legacy
 
+startup_status.record_import_profile(
+    startup_import_profiler.stop(),
+    started_monotonic=startup_import_profiler.started_monotonic,
+)
+
 
 # Version management
 def get_base_version() -> str:
@@ -157,6 +175,10 @@ EVENTS_PROCESSED = Counter("events_processed_total", "Total number of events pro
 DETECTIONS_TOTAL = Counter("detections_total", "Total number of bird detections")
 API_REQUESTS = Counter("api_requests_total", "Total API requests")
 RATE_LIMIT_EXCEEDED = Counter("rate_limit_exceeded_total", "Total rate limit violations")
+TIME_TO_FIRST_HTTP_OK = Gauge(
+    "startup_time_to_first_http_ok_seconds",
+    "Seconds from web shell import to its first 2xx response",
+)
 
 
 def _is_testing() -> bool:
@@ -176,141 +198,175 @@ cleanup_running = True
 CLEANUP_INTERVAL_HOURS = 24  # Run cleanup every 24 hours
 
 
-async def run_cleanup():
-    """Execute cleanup of old detections and media cache."""
-    try:
-        now = datetime.now(timezone.utc)
-        favorite_event_ids: set[str] = set()
-
-        # Detection cleanup
-        if settings.maintenance.retention_days > 0 and settings.maintenance.cleanup_enabled:
-            cutoff = now - timedelta(days=settings.maintenance.retention_days)
-            async with get_db() as db:
-                repo = DetectionRepository(db)
-                favorite_event_ids = await repo.get_favorite_frigate_event_ids()
-                deleted_count = await repo.delete_older_than(cutoff, preserve_favorites=True)
-                deleted_audio_count = await repo.delete_audio_detections_older_than(cutoff)
-            if deleted_count > 0:
-                log.info(
-                    "Automatic cleanup completed",
-                    deleted_count=deleted_count,
-                    retention_days=settings.maintenance.retention_days,
-                    cutoff=cutoff.isoformat(),
-                )
-            if deleted_audio_count > 0:
-                log.info(
-                    "Automatic audio cleanup completed",
-                    deleted_count=deleted_audio_count,
-                    retention_days=settings.maintenance.retention_days,
-                    cutoff=cutoff.isoformat(),
-                )
+def _pass_cutoff(cursor: dict, retention_days: int) -> datetime:
+    # The cutoff is fixed when a pass starts so resumed slices keep deleting
+    # against the same boundary.
+    if cursor.get("cutoff"):
+        return datetime.fromisoformat(cursor["cutoff"])
+    return datetime.now(timezone.utc) - timedelta(days=retention_days)
 
-        # Media cache cleanup
-        if settings.media_cache.enabled:
-            cache_retention = settings.media_cache.retention_days
-            if cache_retention == 0:
-                cache_retention = settings.maintenance.retention_days
-            if cache_retention > 0:
-                if not favorite_event_ids:
-                    async with get_db() as db:
-                        repo = DetectionRepository(db)
-                        favorite_event_ids = await repo.get_favorite_frigate_event_ids()
-                cache_stats = await media_cache.cleanup_old_media(
-                    cache_retention,
-                    protected_event_ids=favorite_event_ids,
-                )
-                if cache_stats["snapshots_deleted"] > 0 or cache_stats["clips_deleted"] > 0:
-                    log.info("Media cache cleanup completed", **cache_stats)
-
-        # Video share-link cleanup
-        deleted_share_links = await proxy.cleanup_expired_video_share_links()
-        if deleted_share_links > 0:
-            log.info("Video share-link cleanup completed", deleted_count=deleted_share_links)
-
-        # Scheduled media-integrity scan. The UI writes the single daily toggle to
-        # both legacy booleans; preserve one-sided legacy configs as scoped scans.
-        if settings.maintenance.auto_purge_missing_clips and settings.maintenance.auto_purge_missing_snapshots:
-            try:
-                from app.routers.settings import _purge_missing_all_media
-
-                result = await _purge_missing_all_media()
-                if any(
-                    result.get(key, 0) > 0
-                    for key in ("deleted_count", "marked_missing_count", "kept_count", "cleared_missing_count")
-                ):
-                    log.info("Scheduled media integrity scan completed", **result)
-            except Exception as e:
-                log.error("Scheduled media integrity scan failed", error=str(e))
-        elif settings.maintenance.auto_purge_missing_clips:
-            try:
-                from app.routers.settings import _purge_missing_media
-
-                result = await _purge_missing_media("clip")
-                if any(
-                    result.get(key, 0) > 0
-                    for key in ("deleted_count", "marked_missing_count", "kept_count", "cleared_missing_count")
-                ):
-                    log.info("Scheduled purge missing clips completed", **result)
-            except Exception as e:
-                log.error("Scheduled purge missing clips failed", error=str(e))
-        elif settings.maintenance.auto_purge_missing_snapshots:
-            try:
-                from app.routers.settings import _purge_missing_media
-
-                result = await _purge_missing_media("snapshot")
-                if any(
-                    result.get(key, 0) > 0
-                    for key in ("deleted_count", "marked_missing_count", "kept_count", "cleared_missing_count")
-                ):
-                    log.info("Scheduled purge missing snapshots completed", **result)
-            except Exception as e:
-                log.error("Scheduled purge missing snapshots failed", error=str(e))
-
-        # Scheduled analyze unknowns
-        if settings.maintenance.auto_analyze_unknowns:
-            try:
-                from app.routers.settings import _run_analyze_unknowns
-
-                result = await _run_analyze_unknowns()
-                if result.get("accepted", 0) > 0:
-                    log.info("Scheduled analyze unknowns completed", **result)
-            except Exception as e:
-                log.error("Scheduled analyze unknowns failed", error=str(e))
 
-    except Exception as e:
-        log.error("Error during cleanup execution", error=str(e))
+def _retention_enabled() -> bool:
+    return settings.maintenance.retention_days > 0 and settings.maintenance.cleanup_enabled
 
 
-async def cleanup_scheduler():
-    """Background task that runs cleanup on a fixed interval."""
-    global cleanup_running
+def _media_cache_retention_days() -> int:
+    cache_retention = settings.media_cache.retention_days
+    if cache_retention == 0:
+        cache_retention = settings.maintenance.retention_days
+    return cache_retention
 
-    # Run cleanup once on startup (handles missed cleanups from downtime)
-    log.info("Running startup cleanup...")
-    await run_cleanup()
 
-    # Then run on fixed interval
-    while cleanup_running:
-        try:
-            # Sleep for the interval, checking for cancellation periodically
-            for _ in range(CLEANUP_INTERVAL_HOURS):
-                if not cleanup_running:
-                    break
-                await asyncio.sleep(3600)  # check every hour
+async def _detection_retention_slice(cursor: dict) -> SliceResult:
+    cutoff = _pass_cutoff(cursor, settings.maintenance.retention_days)
+    async with get_db() as db:
+        deleted = await DetectionRepository(db).delete_older_than(
+            cutoff,
+            chunk_size=MAINTENANCE_RETENTION_SLICE_ROWS,
+            preserve_favorites=True,
+            max_chunks=1,
+        )
+    return SliceResult(
+        processed=deleted,
+        done=deleted < MAINTENANCE_RETENTION_SLICE_ROWS,
+        cursor={"cutoff": cutoff.isoformat()},
+        stats={"deleted_count": deleted},
+    )
+
+
+async def _audio_retention_slice(cursor: dict) -> SliceResult:
+    cutoff = _pass_cutoff(cursor, settings.maintenance.retention_days)
+    async with get_db() as db:
+        deleted = await DetectionRepository(db).delete_audio_detections_older_than(
+            cutoff,
+            chunk_size=MAINTENANCE_RETENTION_SLICE_ROWS,
+            max_chunks=1,
+        )
+    return SliceResult(
+        processed=deleted,
+        done=deleted < MAINTENANCE_RETENTION_SLICE_ROWS,
+        cursor={"cutoff": cutoff.isoformat()},
+        stats={"deleted_count": deleted},
+    )
+
+
+async def _media_cache_retention_slice(cursor: dict) -> SliceResult:
+    # Re-read per slice so an event favorited mid-pass is still protected.
+    async with get_db() as db:
+        favorite_event_ids = await DetectionRepository(db).get_favorite_frigate_event_ids()
+    result = await media_cache.cleanup_old_media_slice(
+        _media_cache_retention_days(),
+        protected_event_ids=favorite_event_ids,
+        cursor=cursor,
+        max_files=MAINTENANCE_MEDIA_SLICE_FILES,
+    )
+    stats = {
+        key: int(result[key])
+        for key in ("snapshots_deleted", "clips_deleted", "previews_deleted", "bytes_freed", "protected_skipped")
+    }
+    return SliceResult(
+        processed=int(result["scanned"]), done=bool(result["done"]), cursor=result["cursor"], stats=stats
+    )
+
+
+async def _share_link_cleanup_slice(cursor: dict) -> SliceResult:
+    deleted_share_links = await proxy.cleanup_expired_video_share_links()
+    if deleted_share_links > 0:
+        log.info("Video share-link cleanup completed", deleted_count=deleted_share_links)
+    return SliceResult(processed=deleted_share_links, done=True, stats={"deleted_count": deleted_share_links})
+
+
+async def _media_integrity_slice(cursor: dict) -> SliceResult:
+    # The UI writes the single daily toggle to both legacy booleans; preserve
+    # one-sided legacy configs as scoped scans. Scheduled runs are already
+    # incremental (only Frigate's retention boundary and detections recorded
+    # since the previous run are re-checked), so one slice covers the pass.
+    from app.routers.settings import _purge_missing_all_media, _purge_missing_media
 
-            if cleanup_running:
-                await run_cleanup()
+    if settings.maintenance.auto_purge_missing_clips and settings.maintenance.auto_purge_missing_snapshots:
+        label = "Scheduled media integrity scan completed"
+        result = await _purge_missing_all_media(full=False)
+    elif settings.maintenance.auto_purge_missing_clips:
+        label = "Scheduled purge missing clips completed"
+        result = await _purge_missing_media("clip", full=False)
+    else:
+        label = "Scheduled purge missing snapshots completed"
+        result = await _purge_missing_media("snapshot", full=False)
+    counts = {
+        key: int(result.get(key, 0) or 0)
+        for key in ("deleted_count", "marked_missing_count", "kept_count", "cleared_missing_count")
+    }
+    if any(value > 0 for value in counts.values()):
+        log.info(label, **result)
+    return SliceResult(processed=int(result.get("checked", 0) or 0), done=True, stats=counts)
+
+
+async def _analyze_unknowns_slice(cursor: dict) -> SliceResult:
+    from app.routers.settings import _run_analyze_unknowns
+
+    result = await _run_analyze_unknowns()
+    accepted = int(result.get("accepted", 0) or 0)
+    if accepted > 0:
+        log.info("Scheduled analyze unknowns completed", **result)
+    return SliceResult(processed=accepted, done=True, stats={"accepted": accepted})
+
+
+def _maintenance_tasks() -> list[MaintenanceTask]:
+    """Scheduled maintenance, in the order the old single cleanup pass ran it."""
+    return [
+        MaintenanceTask(
+            "detection_retention",
+            _detection_retention_slice,
+            units_per_second=MAINTENANCE_RETENTION_ROWS_PER_SECOND,
+            enabled=_retention_enabled,
+        ),
+        MaintenanceTask(
+            "audio_retention",
+            _audio_retention_slice,
+            units_per_second=MAINTENANCE_RETENTION_ROWS_PER_SECOND,
+            enabled=_retention_enabled,
+        ),
+        MaintenanceTask(
+            "media_cache_retention",
+            _media_cache_retention_slice,
+            units_per_second=MAINTENANCE_MEDIA_FILES_PER_SECOND,
+            enabled=lambda: settings.media_cache.enabled and _media_cache_retention_days() > 0,
+        ),
+        MaintenanceTask("share_link_cleanup", _share_link_cleanup_slice, units_per_second=0),
+        MaintenanceTask(
+            "media_integrity_scan",
+            _media_integrity_slice,
+            units_per_second=0,
+            enabled=lambda: bool(
+                settings.maintenance.auto_purge_missing_clips or settings.maintenance.auto_purge_missing_snapshots
+            ),
+        ),
+        MaintenanceTask(
+            "analyze_unknowns",
+            _analyze_unknowns_slice,
+            units_per_second=0,
+            enabled=lambda: bool(settings.maintenance.auto_analyze_unknowns),
+        ),
+    ]
 
+
+async def cleanup_scheduler():
+    """Background task that runs time-sliced maintenance on a fixed interval."""
+    while cleanup_running:
+        try:
+            # Resumes an unfinished pass (or runs one missed during downtime)
+            # right away, then waits out the interval between passes.
+            await maintenance_scheduler.run_forever(
+                _maintenance_tasks,
+                interval_seconds=CLEANUP_INTERVAL_HOURS * 3600,
+                should_continue=lambda: cleanup_running,
+            )
         except asyncio.CancelledError:
             break
         except Exception as e:
             log.error("Cleanup task error", error=str(e))
             # On error, wait 1 hour before retrying
             await asyncio.sleep(3600)
-        except BaseException as e:
-            # Catch-all for anything else (unlikely but safe)
-            log.critical("Cleanup task critical failure", error=str(e))
-            await asyncio.sleep(3600)
 
 
 def _record_startup_warning(app: FastAPI, phase: str, error: str) -> None:
@@ -326,8 +382,11 @@ async def _run_lifecycle_phase(
     fatal: bool,
     startup_phase: str | None = None,
     startup_progress: int | None = None,
-) -> None:
-    """Run startup/shutdown phase with explicit timing and failure context."""
+) -> bool:
+    """Run startup/shutdown phase with explicit timing and failure context.
+
+    Returns False when a non-fatal phase failed and was recorded as a warning.
+    """
     if startup_phase is not None and startup_progress is not None:
         await asyncio.to_thread(startup_status.publish, startup_phase, startup_progress)
     started_at = monotonic()
@@ -348,9 +407,10 @@ async def _run_lifecycle_phase(
             await asyncio.to_thread(startup_status.mark_failed, startup_phase or phase)
             raise RuntimeError(f"Lifecycle phase failed: {phase}") from e
         _record_startup_warning(app, phase, str(e))
-    else:
-        duration_ms = round((monotonic() - started_at) * 1000, 2)
-        log.info("Lifecycle phase completed", phase=phase, duration_ms=duration_ms)
+        return False
+    duration_ms = round((monotonic() - started_at) * 1000, 2)
+    log.info("Lifecycle phase completed", phase=phase, duration_ms=duration_ms)
+    return True
 
 
 def _log_startup_diagnostics(test_mode: bool) -> None:
@@ -372,109 +432,159 @@ async def _start_mqtt_service_task() -> None:
     global event_processor
     if event_processor is None:
         event_processor = EventProcessor()
+    # Connect as soon as the DB is up; events arriving before the downstream
+    # workers are started wait in MQTT's bounded pre-ready buffer.
+    mqtt_service.hold_dispatch()
     create_background_task(mqtt_service.start(event_processor), name="mqtt_service_start")
 
 
-async def _start_cleanup_scheduler_task() -> None:
-    global cleanup_task
-    cleanup_task = create_background_task(cleanup_scheduler(), name="cleanup_scheduler")
+async def _init_classifier() -> None:
+    await asyncio.to_thread(get_classifier)
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    global cleanup_task, cleanup_running
-    test_mode = _is_testing()
+async def _reconcile_retired_model_selection() -> None:
+    from app.services.model_manager import model_manager
 
-    # Startup
-    cleanup_running = True
-    cleanup_task = None
-    app.state.startup_warnings = []
-    startup_started_at = datetime.now(timezone.utc)
-    app.state.startup_started_at = startup_started_at.isoformat()
-    app.state.startup_instance_id = f"{startup_started_at.strftime('%Y%m%dT%H%M%S.%fZ')}-{os.getpid()}"
-    _log_startup_diagnostics(test_mode)
-    if test_mode:
-        # Keep tests fast and deterministic: skip migrations + external/background services.
-        log.info("Test mode enabled: skipping DB init and background services startup")
-    else:
-        await _run_lifecycle_phase(
-            app,
-            "db_init",
-            init_db,
-            fatal=True,
-            startup_phase="database",
-            startup_progress=68,
-        )
-        await _run_lifecycle_phase(
-            app,
+    try:
+        await model_manager.reconcile_retired_model_selection()
+    finally:
+        create_background_task(model_manager.ensure_installed_model_configs(), name="model_config_refresh")
+
+
+def _startup_lifecycle_phases() -> list[LifecyclePhase]:
+    """Startup phases and what each needs; independent phases run concurrently."""
+    downstream = (
+        "notification_dispatcher_start",
+        "label_taxonomy_preload_start",
+        "telemetry_start",
+        "auto_video_classifier_start",
+        "high_quality_snapshot_start",
+        "full_visit_clip_start",
+    )
+    return [
+        LifecyclePhase("db_init", init_db, fatal=True, startup_phase="database", startup_progress=68),
+        # Reconciliation only rewrites the model selection on disk; the
+        # classifier must load after it so it picks up the replacement model.
+        LifecyclePhase(
+            "retired_model_reconciliation",
+            _reconcile_retired_model_selection,
+            startup_phase="starting_services",
+            startup_progress=70,
+        ),
+        # Non-fatal, as when the classifier was built inside the MQTT start: a
+        # model that fails to load leaves the API up to report and repair it.
+        LifecyclePhase("classifier_init", _init_classifier, depends_on=("retired_model_reconciliation",)),
+        LifecyclePhase(
             "notification_dispatcher_start",
             notification_dispatcher.start,
-            fatal=False,
+            depends_on=("db_init",),
             startup_phase="starting_services",
             startup_progress=76,
-        )
-        from app.services.model_manager import model_manager
-
-        await _run_lifecycle_phase(
-            app,
-            "retired_model_reconciliation",
-            model_manager.reconcile_retired_model_selection,
-            fatal=False,
+        ),
+        # The classifier queues its label-table rebuild from a worker thread;
+        # start the preloader afterwards so that request is scheduled.
+        LifecyclePhase(
+            "label_taxonomy_preload_start",
+            label_taxonomy_table.start,
+            depends_on=("db_init", "classifier_init"),
             startup_phase="starting_services",
-            startup_progress=72,
-        )
-        create_background_task(model_manager.ensure_installed_model_configs(), name="model_config_refresh")
-        await _run_lifecycle_phase(
-            app,
+            startup_progress=78,
+        ),
+        LifecyclePhase(
             "telemetry_start",
             telemetry_service.start,
-            fatal=False,
+            depends_on=("db_init",),
             startup_phase="starting_services",
             startup_progress=83,
-        )
-        await _run_lifecycle_phase(
-            app,
+        ),
+        LifecyclePhase(
             "auto_video_classifier_start",
             auto_video_classifier.start,
-            fatal=False,
+            depends_on=("db_init", "classifier_init"),
             startup_phase="starting_services",
             startup_progress=86,
-        )
-        await _run_lifecycle_phase(
-            app,
+        ),
+        LifecyclePhase(
             "high_quality_snapshot_start",
             high_quality_snapshot_service.start,
-            fatal=False,
+            depends_on=("db_init", "classifier_init"),
             startup_phase="starting_services",
             startup_progress=89,
-        )
-        await _run_lifecycle_phase(
-            app,
+        ),
+        LifecyclePhase(
             "full_visit_clip_start",
             full_visit_clip_service.start,
-            fatal=False,
+            depends_on=("db_init",),
             startup_phase="starting_services",
             startup_progress=92,
-        )
-        # Intake opens only after every downstream worker can accept work.
-        await _run_lifecycle_phase(
-            app,
+        ),
+        LifecyclePhase(
             "mqtt_service_task_start",
             _start_mqtt_service_task,
-            fatal=False,
+            depends_on=("db_init",),
+            startup_phase="starting_services",
+            startup_progress=80,
+        ),
+        # Intake opens only after every downstream worker can accept work.
+        LifecyclePhase(
+            "mqtt_dispatch_release",
+            mqtt_service.release_dispatch,
+            depends_on=("mqtt_service_task_start", "classifier_init", *downstream),
             startup_phase="starting_services",
             startup_progress=94,
-        )
-        await _run_lifecycle_phase(
-            app,
+        ),
+        LifecyclePhase(
             "cleanup_scheduler_task_start",
             _start_cleanup_scheduler_task,
-            fatal=False,
+            depends_on=("db_init",),
             startup_phase="starting_services",
             startup_progress=95,
+        ),
+    ]
+
+
+async def _start_cleanup_scheduler_task() -> None:
+    global cleanup_task
+    cleanup_task = create_background_task(cleanup_scheduler(), name="cleanup_scheduler")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global cleanup_task, cleanup_running
+    test_mode = _is_testing()
+
+    # Startup
+    cleanup_running = True
+    cleanup_task = None
+    app.state.startup_warnings = []
+    startup_started_at = datetime.now(timezone.utc)
+    app.state.startup_started_at = startup_started_at.isoformat()
+    app.state.startup_instance_id = f"{startup_started_at.strftime('%Y%m%dT%H%M%S.%fZ')}-{os.getpid()}"
+    _log_startup_diagnostics(test_mode)
+    if test_mode:
+        # Keep tests fast and deterministic: skip migrations + external/background services.
+        log.info("Test mode enabled: skipping DB init and background services startup")
+    else:
+        report = await run_lifecycle_graph(
+            _startup_lifecycle_phases(),
+            lambda phase: _run_lifecycle_phase(
+                app,
+                phase.name,
+                phase.action,
+                fatal=phase.fatal,
+                startup_phase=phase.startup_phase,
+                startup_progress=phase.startup_progress,
+            ),
         )
         backfill.start_watchdog()
         await asyncio.to_thread(startup_status.publish, "finalizing", 97)
+        await asyncio.to_thread(startup_status.record_lifecycle, report)
+        log.info(
+            "Startup lifecycle graph completed",
+            total_ms=report["total_ms"],
+            critical_path=report["critical_path"],
+            critical_path_ms=report["critical_path_ms"],
+        )
         log.info(
             "Background cleanup scheduler started",
             interval_hours=CLEANUP_INTERVAL_HOURS,
@@ -502,7 +612,9 @@ async def lifespan(app: FastAPI):
         await _run_lifecycle_phase(app, "auto_video_classifier_stop", auto_video_classifier.stop, fatal=False)
         await _run_lifecycle_phase(app, "full_visit_clip_stop", full_visit_clip_service.stop, fatal=False)
         await _run_lifecycle_phase(app, "telemetry_stop", telemetry_service.stop, fatal=False)
+        await _run_lifecycle_phase(app, "label_taxonomy_preload_stop", label_taxonomy_table.stop, fatal=False)
         await _run_lifecycle_phase(app, "frigate_client_close", frigate_client.close, fatal=False)
+        await _run_lifecycle_phase(app, "ai_service_close", ai_service.close, fatal=False)
         await _run_lifecycle_phase(app, "classifier_shutdown", shutdown_classifier, fatal=False)
     await close_db()  # Close database connection pool
 
@@ -783,6 +895,11 @@ async def check_https_warning(request: Request, call_next):
 async def count_requests(request, call_next):
     API_REQUESTS.inc()
     response = await _safe_call_next(request, call_next)
+    if not startup_status.first_http_ok_recorded and 200 <= response.status_code < 300:
+        await asyncio.to_thread(startup_status.mark_first_http_ok)
+        elapsed_ms = startup_status.snapshot().get("time_to_first_http_ok_ms")
+        if elapsed_ms is not None:
+            TIME_TO_FIRST_HTTP_OK.set(elapsed_ms / 1000.0)
     return response
 
 
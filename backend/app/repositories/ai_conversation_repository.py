@@ -44,14 +44,16 @@ class AIConversationRepository:
         ]
 
     async def add_turn(self, frigate_event: str, role: str, content: str) -> ConversationTurn:
-        await self.db.execute(
+        cursor = await self.db.execute(
             "INSERT INTO ai_conversation_turns (frigate_event, role, content) VALUES (?, ?, ?)",
             (frigate_event, role, content),
         )
+        turn_rowid = cursor.lastrowid
+        await cursor.close()
         await self.db.commit()
         async with self.db.execute(
-            "SELECT id, frigate_event, role, content, created_at "
-            "FROM ai_conversation_turns WHERE rowid = last_insert_rowid()"
+            "SELECT id, frigate_event, role, content, created_at FROM ai_conversation_turns WHERE rowid = ?",
+            (turn_rowid,),
         ) as cursor:
             row = await cursor.fetchone()
         return ConversationTurn(
@@ -19,8 +19,11 @@ class AIUsageRepository:
         input_tokens: int,
         output_tokens: int,
         timestamp: Optional[datetime] = None,
+        job_id: Optional[str] = None,
+        queue_ms: Optional[int] = None,
+        duration_ms: Optional[int] = None,
     ) -> None:
-        """Record an AI API usage event."""
+        """Record an AI API usage event, optionally tied to the AI job that made the call."""
         if timestamp is None:
             timestamp = datetime.utcnow()
 
@@ -28,9 +31,23 @@ class AIUsageRepository:
 
         try:
             await self.db.execute(
-                """INSERT INTO ai_usage_log (timestamp, provider, model, feature, input_tokens, output_tokens, total_tokens)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (timestamp.isoformat(), provider, model, feature, input_tokens, output_tokens, total_tokens),
+                """INSERT INTO ai_usage_log (
+                       timestamp, provider, model, feature, input_tokens, output_tokens, total_tokens,
+                       job_id, queue_ms, duration_ms
+                   )
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    timestamp.isoformat(),
+                    provider,
+                    model,
+                    feature,
+                    input_tokens,
+                    output_tokens,
+                    total_tokens,
+                    job_id,
+                    queue_ms,
+                    duration_ms,
+                ),
             )
             await self.db.commit()
         except Exception as e:
@@ -98,8 +115,41 @@ class AIUsageRepository:
                     }
                 )
 
+        summary["jobs"] = await self.get_job_stats(start_date, end_date)
         return summary
 
+    async def get_job_stats(self, start_date: datetime, end_date: datetime) -> dict[str, JsonValue]:
+        """Per-job throughput and token usage for queued AI calls in a time range."""
+        stats = {
+            "jobs": 0,
+            "avg_tokens_per_job": 0.0,
+            "avg_queue_ms": 0.0,
+            "avg_duration_ms": 0.0,
+            "jobs_per_hour": 0.0,
+        }
+        async with self.db.execute(
+            """SELECT COUNT(*), AVG(tokens), AVG(queue_ms), AVG(duration_ms), MIN(first_at), MAX(last_at)
+               FROM (
+                   SELECT job_id, SUM(total_tokens) AS tokens, MAX(queue_ms) AS queue_ms,
+                          SUM(duration_ms) AS duration_ms, MIN(timestamp) AS first_at, MAX(timestamp) AS last_at
+                   FROM ai_usage_log
+                   WHERE timestamp >= ? AND timestamp <= ? AND job_id IS NOT NULL
+                   GROUP BY job_id
+               )""",
+            (start_date.isoformat(), end_date.isoformat()),
+        ) as cursor:
+            row = await cursor.fetchone()
+        if not row or not row[0]:
+            return stats
+        stats["jobs"] = row[0]
+        stats["avg_tokens_per_job"] = float(row[1] or 0)
+        stats["avg_queue_ms"] = float(row[2] or 0)
+        stats["avg_duration_ms"] = float(row[3] or 0)
+        # Throughput over the span the jobs actually ran in, floored at one minute.
+        span_hours = max((datetime.fromisoformat(row[5]) - datetime.fromisoformat(row[4])).total_seconds(), 60.0) / 3600
+        stats["jobs_per_hour"] = row[0] / span_hours
+        return stats
+
     async def clear_history(self) -> int:
         """Clear all usage logs. Returns number of rows deleted."""
         async with self.db.execute("DELETE FROM ai_usage_log") as cursor:
@@ -1,9 +1,12 @@
+from collections.abc import AsyncIterator
 from typing import Optional
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta, date, timezone
 import aiosqlite
 import asyncio
 import json
+import os
 import re
 import unicodedata
 import structlog
@@ -14,6 +17,7 @@ from app.utils.canonical_species import (
     should_hide_species_label,
 )
 from app.utils.api_datetime import serialize_api_datetime, serialize_storage_datetime, utc_naive_now
+from app.repositories.schema_snapshot import get_schema_snapshot, invalidate_schema_snapshots
 
 log = structlog.get_logger()
 
@@ -30,6 +34,133 @@ DETECTION_SELECT_COLUMNS = """d.id, d.detection_time, d.detection_index, d.score
                       d.video_classification_input_source, d.video_classification_diagnostics"""
 
 
+_TAXONOMY_FILTER_JOIN = """
+            LEFT JOIN taxonomy_cache tc_filter
+                ON ((d.scientific_name IS NOT NULL AND LOWER(tc_filter.scientific_name) = LOWER(d.scientific_name))
+                    OR (d.scientific_name IS NULL AND (LOWER(tc_filter.scientific_name) = LOWER(d.display_name)
+                        OR LOWER(tc_filter.common_name) = LOWER(d.display_name))))
+            """
+# Days of detections recomputed per transaction by rebuild_hourly_cube.
+HOURLY_CUBE_REBUILD_CHUNK_DAYS = max(1, int(os.environ.get("HOURLY_CUBE_REBUILD_CHUNK_DAYS", "7")))
+# Same bucket/key/camera expressions as the detection_hourly_cube triggers.
+_HOURLY_CUBE_REBUILD_SQL = """
+    INSERT INTO detection_hourly_cube
+        (bucket_hour, canonical_key, camera_name, detection_count, score_sum, score_count, score_max)
+    SELECT
+        strftime('%Y-%m-%d %H:00:00', d.detection_time),
+        COALESCE(CAST(d.taxa_id AS TEXT), LOWER(d.scientific_name), LOWER(d.display_name), ''),
+        COALESCE(d.camera_name, ''),
+        COUNT(*),
+        SUM(COALESCE(d.score, 0)),
+        COUNT(d.score),
+        MAX(COALESCE(d.score, 0))
+    FROM detections d
+    WHERE d.detection_time >= ? AND d.detection_time < ?
+      AND (d.is_hidden = 0 OR d.is_hidden IS NULL)
+    GROUP BY 1, 2, 3
+"""
+
+_DETECTION_LIST_ORDER = {
+    "newest": " ORDER BY d.detection_time DESC",
+    "oldest": " ORDER BY d.detection_time ASC",
+    "confidence": " ORDER BY d.score DESC, d.detection_time DESC",
+}
+
+
+@dataclass(frozen=True)
+class _DetectionFilterShape:
+    """Everything about a get_all/get_count filter that changes the SQL text (not its parameters)."""
+
+    has_taxonomy_cache: bool
+    include_hidden: bool
+    start_date: bool
+    end_date: bool
+    species_condition: Optional[str]
+    species_any_conditions: tuple[str, ...]
+    taxa_id: bool
+    camera: bool
+    # "any", "only", "exclude", or "none" (favorite_only and exclude_favorites together)
+    favorites: str
+    audio_confirmed_only: bool
+    frigate_event: bool
+
+
+@lru_cache(maxsize=256)
+def _detection_filter_sql(kind: str, shape: _DetectionFilterShape, sort: Optional[str]) -> str:
+    """Build (once per shape) the query text for get_all ("list"), get_count ("count")
+    or iter_export ("export", or "export_after" when resuming from a keyset cursor).
+
+    Identical filters always produce the identical string, so sqlite3's
+    per-connection statement cache reuses the prepared statement.
+    """
+    if kind == "count":
+        query = """
+            SELECT COUNT(*)
+            FROM detections d
+        """
+        # Without a favorites filter the join only costs a lookup per row.
+        if shape.favorites != "any":
+            query += """    LEFT JOIN detection_favorites f ON f.detection_id = d.id
+        """
+    else:
+        query = (
+            """
+            SELECT """
+            + DETECTION_SELECT_COLUMNS
+            + """
+            FROM detections d
+            LEFT JOIN detection_favorites f ON f.detection_id = d.id
+        """
+        )
+    # The taxonomy join cannot use an index (it matches on LOWER() with OR), so
+    # it is only added when a species/taxa condition actually reads tc_filter.
+    if shape.has_taxonomy_cache and (shape.species_condition or shape.species_any_conditions or shape.taxa_id):
+        query += _TAXONOMY_FILTER_JOIN
+
+    # Condition order must match the parameter order built by _detection_filter.
+    conditions = []
+    # By default, exclude hidden detections
+    if not shape.include_hidden:
+        conditions.append("(d.is_hidden = 0 OR d.is_hidden IS NULL)")
+    if shape.start_date:
+        conditions.append("d.detection_time >= ?")
+    if shape.end_date:
+        conditions.append("d.detection_time <= ?")
+    if shape.species_condition:
+        conditions.append(shape.species_condition)
+    if shape.species_any_conditions:
+        conditions.append("(" + " OR ".join(shape.species_any_conditions) + ")")
+    if shape.taxa_id:
+        if shape.has_taxonomy_cache:
+            conditions.append("COALESCE(d.taxa_id, tc_filter.taxa_id) = ?")
+        else:
+            conditions.append("d.taxa_id = ?")
+    if shape.camera:
+        conditions.append("d.camera_name = ?")
+    if shape.favorites == "none":
+        conditions.append("1 = 0")
+    elif shape.favorites == "only":
+        conditions.append("f.detection_id IS NOT NULL")
+    elif shape.favorites == "exclude":
+        conditions.append("f.detection_id IS NULL")
+    if shape.audio_confirmed_only:
+        conditions.append("d.audio_confirmed = 1")
+    if shape.frigate_event:
+        conditions.append("d.frigate_event = ?")
+    if kind == "export_after":
+        # (detection_time, id) keyset; the plain range term lets the time index seek to it.
+        conditions.append("d.detection_time >= ? AND (d.detection_time > ? OR d.id > ?)")
+
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    if kind == "list":
+        query += _DETECTION_LIST_ORDER[sort or "newest"]
+        query += " LIMIT ? OFFSET ?"
+    elif kind in ("export", "export_after"):
+        query += " ORDER BY d.detection_time ASC, d.id ASC"
+    return query
+
+
 @dataclass
 class Detection:
     detection_time: datetime
@@ -95,6 +226,14 @@ class TimezoneRepairRow:
     display_name: str
 
 
+@dataclass
+class MediaReconciliationRow:
+    frigate_event: str
+    detection_time: datetime
+    camera_name: str
+    frigate_status: str
+
+
 def _parse_datetime(value: object) -> datetime:
     """Parse datetime from SQLite storage format."""
     if isinstance(value, datetime):
@@ -112,6 +251,12 @@ def _parse_datetime(value: object) -> datetime:
     return utc_naive_now()
 
 
+def _hour_bounds(start: datetime, end: datetime) -> tuple[str, str]:
+    """detection_hourly_cube bounds covering every hour that overlaps [start, end)."""
+    first_hour = start.replace(minute=0, second=0, microsecond=0)
+    return first_hour.strftime("%Y-%m-%d %H:00:00"), end.isoformat(sep=" ")
+
+
 def _normalize_species_lookup_name(value: str | None) -> str:
     """Normalize species names for accent-insensitive fallback matching."""
     if not value:
@@ -349,7 +494,6 @@ def _row_to_detection(row: aiosqlite.Row) -> Detection:
 class DetectionRepository:
     def __init__(self, db: aiosqlite.Connection) -> None:
         self.db = db
-        self._table_exists_cache: dict[str, bool] = {}
 
     async def replace_snapshot_candidates(
         self,
@@ -717,17 +861,7 @@ class DetectionRepository:
         return int(row[0]) if row and row[0] is not None else 0
 
     async def _table_exists(self, table_name: str) -> bool:
-        cached = self._table_exists_cache.get(table_name)
-        if cached is not None:
-            return cached
-        async with self.db.execute(
-            "SELECT 1 FROM sqlite_master WHERE type='table' AND name = ? LIMIT 1",
-            (table_name,),
-        ) as cursor:
-            row = await cursor.fetchone()
-        exists = row is not None
-        self._table_exists_cache[table_name] = exists
-        return exists
+        return (await get_schema_snapshot(self.db)).has_table(table_name)
 
     _ALLOWED_PRAGMA_TABLES: frozenset[str] = frozenset(
         {
@@ -745,11 +879,8 @@ class DetectionRepository:
     async def _table_columns(self, table_name: str) -> set[str]:
         if table_name not in self._ALLOWED_PRAGMA_TABLES:
             raise ValueError(f"Unexpected table name passed to _table_columns: {table_name!r}")
-        if not await self._table_exists(table_name):
-            return set()
-        async with self.db.execute(f"PRAGMA table_info({table_name})") as cursor:
-            rows = await cursor.fetchall()
-        return {row[1] for row in rows if row and len(row) > 1}
+        snapshot = await get_schema_snapshot(self.db)
+        return set(await snapshot.columns(self.db, table_name))
 
     async def get_by_frigate_event(self, frigate_event: str) -> Optional[Detection]:
         async with self.db.execute(
@@ -857,8 +988,9 @@ class DetectionRepository:
             "UPDATE detections SET detection_time = ? WHERE id = ?",
             (detection_time, detection_id),
         )
+        changed = await self._last_statement_changes()
         await self.db.commit()
-        return await self._last_statement_changes()
+        return changed
 
     async def get_recent_full_visit_candidates(
         self,
@@ -1115,6 +1247,25 @@ class DetectionRepository:
             )
             return False
 
+    async def list_unanalyzed_event_ids(self, start: datetime, end: datetime, limit: int = 500) -> list[str]:
+        """Visible events in ``[start, end)`` without an AI analysis, newest first."""
+        safe_limit = max(1, min(int(limit), 5000))
+        async with self.db.execute(
+            """
+            SELECT frigate_event
+            FROM detections
+            WHERE detection_time >= ? AND detection_time < ?
+              AND (is_hidden = 0 OR is_hidden IS NULL)
+              AND ai_analysis IS NULL
+              AND frigate_event IS NOT NULL
+            ORDER BY detection_time DESC
+            LIMIT ?
+            """,
+            (start, end, safe_limit),
+        ) as cursor:
+            rows = await cursor.fetchall()
+        return [str(row[0]) for row in rows]
+
     async def update_ai_analysis(self, frigate_event: str, analysis: str) -> datetime:
         """Update AI naturalist analysis for an event."""
         now = utc_naive_now()
@@ -1601,87 +1752,19 @@ class DetectionRepository:
         audio_confirmed_only: bool = False,
         frigate_event: str | None = None,
     ) -> list[Detection]:
-        has_taxonomy_cache = await self._table_exists("taxonomy_cache")
-        query = (
-            """
-            SELECT """
-            + DETECTION_SELECT_COLUMNS
-            + """
-            FROM detections d
-            LEFT JOIN detection_favorites f ON f.detection_id = d.id
-        """
+        shape, params = await self._detection_filter(
+            start_date=start_date,
+            end_date=end_date,
+            species=species,
+            species_any=species_any,
+            taxa_id=taxa_id,
+            camera=camera,
+            include_hidden=include_hidden,
+            favorites="only" if favorite_only else "any",
+            audio_confirmed_only=audio_confirmed_only,
+            frigate_event=frigate_event,
         )
-        if has_taxonomy_cache:
-            query += """
-            LEFT JOIN taxonomy_cache tc_filter
-                ON ((d.scientific_name IS NOT NULL AND LOWER(tc_filter.scientific_name) = LOWER(d.scientific_name))
-                    OR (d.scientific_name IS NULL AND (LOWER(tc_filter.scientific_name) = LOWER(d.display_name)
-                        OR LOWER(tc_filter.common_name) = LOWER(d.display_name))))
-            """
-        params: list = []
-        conditions = []
-
-        # By default, exclude hidden detections
-        if not include_hidden:
-            conditions.append("(d.is_hidden = 0 OR d.is_hidden IS NULL)")
-
-        if start_date:
-            conditions.append("d.detection_time >= ?")
-            params.append(start_date.isoformat(sep=" "))
-        if end_date:
-            conditions.append("d.detection_time <= ?")
-            params.append(end_date.isoformat(sep=" "))
-        if species:
-            species_condition, species_params = await self._build_canonical_species_condition(
-                detection_alias="d",
-                species_name=species,
-                has_taxonomy_cache=has_taxonomy_cache,
-            )
-            conditions.append(species_condition)
-            params.extend(species_params)
-        if species_any:
-            any_clauses: list[str] = []
-            any_params: list = []
-            for species_name in species_any:
-                clause, clause_params = await self._build_canonical_species_condition(
-                    detection_alias="d",
-                    species_name=species_name,
-                    has_taxonomy_cache=has_taxonomy_cache,
-                )
-                any_clauses.append(clause)
-                any_params.extend(clause_params)
-            if any_clauses:
-                conditions.append("(" + " OR ".join(any_clauses) + ")")
-                params.extend(any_params)
-        if taxa_id is not None:
-            if has_taxonomy_cache:
-                conditions.append("COALESCE(d.taxa_id, tc_filter.taxa_id) = ?")
-            else:
-                conditions.append("d.taxa_id = ?")
-            params.append(taxa_id)
-        if camera:
-            conditions.append("d.camera_name = ?")
-            params.append(camera)
-        if favorite_only:
-            conditions.append("f.detection_id IS NOT NULL")
-        if audio_confirmed_only:
-            conditions.append("d.audio_confirmed = 1")
-        if frigate_event:
-            conditions.append("d.frigate_event = ?")
-            params.append(frigate_event)
-
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
-        # Apply sort order
-        if sort == "oldest":
-            query += " ORDER BY d.detection_time ASC"
-        elif sort == "confidence":
-            query += " ORDER BY d.score DESC, d.detection_time DESC"
-        else:  # newest (default)
-            query += " ORDER BY d.detection_time DESC"
-
-        query += " LIMIT ? OFFSET ?"
+        query = _detection_filter_sql("list", shape, sort if sort in ("oldest", "confidence") else "newest")
         params.extend([limit, offset])
 
         async with self.db.execute(query, params) as cursor:
@@ -1702,79 +1785,127 @@ class DetectionRepository:
         audio_confirmed_only: bool = False,
     ) -> int:
         """Get total count of detections, optionally filtered."""
-        has_taxonomy_cache = await self._table_exists("taxonomy_cache")
-        query = """
-            SELECT COUNT(*)
-            FROM detections d
-            LEFT JOIN detection_favorites f ON f.detection_id = d.id
-        """
-        if has_taxonomy_cache:
-            query += """
-            LEFT JOIN taxonomy_cache tc_filter
-                ON ((d.scientific_name IS NOT NULL AND LOWER(tc_filter.scientific_name) = LOWER(d.scientific_name))
-                    OR (d.scientific_name IS NULL AND (LOWER(tc_filter.scientific_name) = LOWER(d.display_name)
-                        OR LOWER(tc_filter.common_name) = LOWER(d.display_name))))
-            """
-        params: list = []
-        conditions = []
+        if favorite_only and exclude_favorites:
+            favorites = "none"
+        elif favorite_only:
+            favorites = "only"
+        elif exclude_favorites:
+            favorites = "exclude"
+        else:
+            favorites = "any"
+        shape, params = await self._detection_filter(
+            start_date=start_date,
+            end_date=end_date,
+            species=species,
+            species_any=species_any,
+            taxa_id=taxa_id,
+            camera=camera,
+            include_hidden=include_hidden,
+            favorites=favorites,
+            audio_confirmed_only=audio_confirmed_only,
+        )
 
-        # By default, exclude hidden detections
-        if not include_hidden:
-            conditions.append("(d.is_hidden = 0 OR d.is_hidden IS NULL)")
+        async with self.db.execute(_detection_filter_sql("count", shape, None), params) as cursor:
+            row = await cursor.fetchone()
+            return row[0] if row else 0
 
+    async def iter_export(
+        self,
+        *,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        species: str | None = None,
+        species_any: list[str] | None = None,
+        taxa_id: int | None = None,
+        camera: str | None = None,
+        include_hidden: bool = False,
+        favorite_only: bool = False,
+        audio_confirmed_only: bool = False,
+        after: tuple[str, int] | None = None,
+    ) -> AsyncIterator[tuple[str, Detection]]:
+        """Stream get_all-filtered detections oldest first from a single cursor.
+
+        Yields ``(stored detection_time, detection)``; the stored time and id of
+        the last row form the ``after`` keyset cursor that resumes the stream.
+        Rows are fetched in small chunks, so memory stays flat however many match.
+        """
+        shape, params = await self._detection_filter(
+            start_date=start_date,
+            end_date=end_date,
+            species=species,
+            species_any=species_any,
+            taxa_id=taxa_id,
+            camera=camera,
+            include_hidden=include_hidden,
+            favorites="only" if favorite_only else "any",
+            audio_confirmed_only=audio_confirmed_only,
+        )
+        kind = "export"
+        if after is not None:
+            kind = "export_after"
+            params.extend([after[0], after[0], after[1]])
+        async with self.db.execute(_detection_filter_sql(kind, shape, None), params) as cursor:
+            async for row in cursor:
+                yield str(row[1]), _row_to_detection(row)
+
+    async def _detection_filter(
+        self,
+        *,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        species: str | None,
+        species_any: list[str] | None,
+        taxa_id: int | None,
+        camera: str | None,
+        include_hidden: bool,
+        favorites: str,
+        audio_confirmed_only: bool,
+        frigate_event: str | None = None,
+    ) -> tuple["_DetectionFilterShape", list]:
+        """Split a get_all/get_count filter into its SQL shape and bound parameters."""
+        has_taxonomy_cache = await self._table_exists("taxonomy_cache")
+        params: list = []
         if start_date:
-            conditions.append("d.detection_time >= ?")
             params.append(start_date.isoformat(sep=" "))
         if end_date:
-            conditions.append("d.detection_time <= ?")
             params.append(end_date.isoformat(sep=" "))
+        species_condition = None
         if species:
             species_condition, species_params = await self._build_canonical_species_condition(
                 detection_alias="d",
                 species_name=species,
                 has_taxonomy_cache=has_taxonomy_cache,
             )
-            conditions.append(species_condition)
             params.extend(species_params)
-        if species_any:
-            any_clauses: list[str] = []
-            any_params: list = []
-            for species_name in species_any:
-                clause, clause_params = await self._build_canonical_species_condition(
-                    detection_alias="d",
-                    species_name=species_name,
-                    has_taxonomy_cache=has_taxonomy_cache,
-                )
-                any_clauses.append(clause)
-                any_params.extend(clause_params)
-            if any_clauses:
-                conditions.append("(" + " OR ".join(any_clauses) + ")")
-                params.extend(any_params)
+        any_clauses: list[str] = []
+        for species_name in species_any or []:
+            clause, clause_params = await self._build_canonical_species_condition(
+                detection_alias="d",
+                species_name=species_name,
+                has_taxonomy_cache=has_taxonomy_cache,
+            )
+            any_clauses.append(clause)
+            params.extend(clause_params)
         if taxa_id is not None:
-            if has_taxonomy_cache:
-                conditions.append("COALESCE(d.taxa_id, tc_filter.taxa_id) = ?")
-            else:
-                conditions.append("d.taxa_id = ?")
             params.append(taxa_id)
         if camera:
-            conditions.append("d.camera_name = ?")
             params.append(camera)
-        if favorite_only and exclude_favorites:
-            conditions.append("1 = 0")
-        elif favorite_only:
-            conditions.append("f.detection_id IS NOT NULL")
-        elif exclude_favorites:
-            conditions.append("f.detection_id IS NULL")
-
-        if audio_confirmed_only:
-            conditions.append("d.audio_confirmed = 1")
-
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
-        async with self.db.execute(query, params) as cursor:
-            row = await cursor.fetchone()
-            return row[0] if row else 0
+        if frigate_event:
+            params.append(frigate_event)
+        shape = _DetectionFilterShape(
+            has_taxonomy_cache=has_taxonomy_cache,
+            include_hidden=include_hidden,
+            start_date=bool(start_date),
+            end_date=bool(end_date),
+            species_condition=species_condition,
+            species_any_conditions=tuple(any_clauses),
+            taxa_id=taxa_id is not None,
+            camera=bool(camera),
+            favorites=favorites,
+            audio_confirmed_only=audio_confirmed_only,
+            frigate_event=bool(frigate_event),
+        )
+        return shape, params
 
     async def get_unique_species(self) -> list[str]:
         """Get list of unique species names, sorted alphabetically."""
@@ -1867,6 +1998,49 @@ class DetectionRepository:
             rows = await cursor.fetchall()
             return [row[0] for row in rows]
 
+    async def get_frigate_detection_time_bounds(self) -> tuple[datetime, datetime] | None:
+        """Oldest and newest detection time across Frigate-backed detections."""
+        async with self.db.execute(
+            """
+            SELECT MIN(detection_time), MAX(detection_time)
+            FROM detections
+            WHERE frigate_event NOT LIKE 'manual\\_%' ESCAPE '\\'
+            """
+        ) as cursor:
+            row = await cursor.fetchone()
+        if not row or row[0] is None:
+            return None
+        return _parse_datetime(row[0]), _parse_datetime(row[1])
+
+    async def list_media_reconciliation_rows(
+        self,
+        *,
+        detected_from: datetime,
+        detected_before: datetime,
+    ) -> list[MediaReconciliationRow]:
+        """Frigate-backed detections in ``[detected_from, detected_before)``, ordered by event id."""
+        async with self.db.execute(
+            """
+            SELECT frigate_event, detection_time, camera_name, COALESCE(frigate_status, 'present')
+            FROM detections
+            WHERE detection_time >= ?
+              AND detection_time < ?
+              AND frigate_event NOT LIKE 'manual\\_%' ESCAPE '\\'
+            ORDER BY frigate_event ASC
+            """,
+            (detected_from, detected_before),
+        ) as cursor:
+            rows = await cursor.fetchall()
+        return [
+            MediaReconciliationRow(
+                frigate_event=str(row[0]),
+                detection_time=_parse_datetime(row[1]),
+                camera_name=str(row[2] or ""),
+                frigate_status=str(row[3] or "present"),
+            )
+            for row in rows
+        ]
+
     async def apply_manual_species_tag(
         self,
         *,
@@ -2170,12 +2344,19 @@ class DetectionRepository:
         cutoff_date: datetime,
         chunk_size: int = 1000,
         preserve_favorites: bool = False,
+        max_chunks: int | None = None,
     ) -> int:
-        """Delete detections older than the cutoff date in chunks to avoid locking."""
+        """Delete detections older than the cutoff date in chunks to avoid locking.
+
+        ``max_chunks`` bounds the work done by one call so scheduled maintenance
+        can delete in slices; calling again resumes with the remaining rows.
+        """
         total_deleted = 0
         cutoff_str = cutoff_date.isoformat(sep=" ")
+        chunks = 0
 
-        while True:
+        while max_chunks is None or chunks < max_chunks:
+            chunks += 1
             # Delete a chunk of rows
             # We use the rowid (implicit or explicit) or limit if supported by the build
             # Standard SQLite DELETE LIMIT requires compilation option, so we use subquery
@@ -2208,6 +2389,7 @@ class DetectionRepository:
         self,
         cutoff_date: datetime,
         chunk_size: int = 1000,
+        max_chunks: int | None = None,
     ) -> int:
         """Delete BirdNET-Go audio detections older than the cutoff date in chunks.
 
@@ -2217,8 +2399,10 @@ class DetectionRepository:
         """
         total_deleted = 0
         cutoff_str = serialize_storage_datetime(cutoff_date)
+        chunks = 0
 
-        while True:
+        while max_chunks is None or chunks < max_chunks:
+            chunks += 1
             query = """
                 DELETE FROM audio_detections
                 WHERE id IN (
@@ -2288,16 +2472,19 @@ class DetectionRepository:
             return (_parse_datetime(row[0]) if row[0] else None, _parse_datetime(row[1]) if row[1] else None)
 
     async def get_timebucket_counts_hourly(self, start: datetime, end: datetime) -> dict[str, int]:
-        """Counts grouped by UTC hour bucket within [start, end)."""
+        """Counts grouped by UTC hour bucket for the hours overlapping [start, end).
+
+        Served from ``detection_hourly_cube``; the hour containing ``start``
+        is counted whole.
+        """
         query = """
-            SELECT strftime('%Y-%m-%dT%H:00:00Z', detection_time) as bucket, COUNT(*) as c
-            FROM detections
-            WHERE detection_time >= ? AND detection_time < ?
-              AND (is_hidden = 0 OR is_hidden IS NULL)
-            GROUP BY bucket
-            ORDER BY bucket ASC
+            SELECT strftime('%Y-%m-%dT%H:00:00Z', bucket_hour) as bucket, SUM(detection_count) as c
+            FROM detection_hourly_cube
+            WHERE bucket_hour >= ? AND bucket_hour < ?
+            GROUP BY bucket_hour
+            ORDER BY bucket_hour ASC
         """
-        async with self.db.execute(query, (start, end)) as cursor:
+        async with self.db.execute(query, _hour_bounds(start, end)) as cursor:
             rows = await cursor.fetchall()
         return {row[0]: int(row[1] or 0) for row in rows if row and row[0]}
 
@@ -2367,30 +2554,19 @@ class DetectionRepository:
         - avg_confidence
         """
         if bucket == "hour":
+            # Hour buckets come from detection_hourly_cube (see get_timebucket_counts_hourly).
             query = """
                 SELECT
-                    strftime('%Y-%m-%dT%H:00:00Z', d.detection_time) as bucket,
-                    COUNT(*) as c,
-                    COUNT(DISTINCT COALESCE(
-                        CAST(d.taxa_id AS TEXT),
-                        LOWER(d.scientific_name),
-                        (
-                            SELECT LOWER(tc.scientific_name)
-                            FROM taxonomy_cache tc
-                            WHERE LOWER(d.display_name) = LOWER(tc.scientific_name)
-                               OR LOWER(d.display_name) = LOWER(tc.common_name)
-                            LIMIT 1
-                        ),
-                        LOWER(d.display_name)
-                    )) as unique_species,
-                    AVG(d.score) as avg_confidence
-                FROM detections d
-                WHERE d.detection_time >= ? AND d.detection_time < ?
-                  AND (d.is_hidden = 0 OR d.is_hidden IS NULL)
-                GROUP BY bucket
-                ORDER BY bucket ASC
+                    strftime('%Y-%m-%dT%H:00:00Z', bucket_hour) as bucket,
+                    SUM(detection_count) as c,
+                    COUNT(DISTINCT canonical_key) as unique_species,
+                    SUM(score_sum) / NULLIF(SUM(score_count), 0) as avg_confidence
+                FROM detection_hourly_cube
+                WHERE bucket_hour >= ? AND bucket_hour < ?
+                GROUP BY bucket_hour
+                ORDER BY bucket_hour ASC
             """
-            params = (start, end)
+            params = _hour_bounds(start, end)
         elif bucket == "halfday":
             query = """
                 SELECT
@@ -2524,6 +2700,7 @@ class DetectionRepository:
         """Counts by timeline bucket for selected species labels.
 
         species_map maps output species names to one or more display_name labels.
+        Hour buckets use the same bounds as the hourly cube (see ``_hour_bounds``).
         """
         if not species_map:
             return {}
@@ -2554,7 +2731,7 @@ class DetectionRepository:
                 GROUP BY bucket_key, display_name, scientific_name
                 ORDER BY bucket_key ASC
             """
-            params = (start, end, *labels_params, *labels_params)
+            params = (*_hour_bounds(start, end), *labels_params, *labels_params)
         elif bucket == "halfday":
             query = f"""
                 SELECT
@@ -2667,10 +2844,14 @@ class DetectionRepository:
 
         Uses the same canonical/unknown matching rules as the main species queries,
         so selections like "Unknown Bird" also include hidden noncanonical labels.
+        Hour buckets use the same bounds as the hourly cube (see ``_hour_bounds``),
+        so compare lines line up with the main series.
         """
         if not species_names:
             return {}
 
+        bounds = _hour_bounds(start, end) if bucket == "hour" else (start, end)
+
         out: dict[str, dict[str, int]] = {}
 
         for species_name in species_names:
@@ -2737,7 +2918,7 @@ class DetectionRepository:
                     ORDER BY m ASC
                 """
 
-            params = [start, end, *species_params]
+            params = [*bounds, *species_params]
             async with self.db.execute(query, params) as cursor:
                 rows = await cursor.fetchall()
 
@@ -2778,18 +2959,15 @@ class DetectionRepository:
         start: datetime,
         end: datetime,
     ) -> list[tuple[datetime, int]]:
-        """Return visible detection counts grouped by UTC hour buckets."""
+        """Return visible detection counts grouped by UTC hour buckets (from the hourly cube)."""
         query = """
-            SELECT
-                strftime('%Y-%m-%d %H:00:00', detection_time) as bucket_start,
-                COUNT(*) as c
-            FROM detections
-            WHERE detection_time >= ? AND detection_time < ?
-              AND (is_hidden = 0 OR is_hidden IS NULL)
-            GROUP BY bucket_start
-            ORDER BY bucket_start ASC
+            SELECT bucket_hour, SUM(detection_count) as c
+            FROM detection_hourly_cube
+            WHERE bucket_hour >= ? AND bucket_hour < ?
+            GROUP BY bucket_hour
+            ORDER BY bucket_hour ASC
         """
-        async with self.db.execute(query, (start, end)) as cursor:
+        async with self.db.execute(query, _hour_bounds(start, end)) as cursor:
             rows = await cursor.fetchall()
 
         out: list[tuple[datetime, int]] = []
@@ -3244,11 +3422,70 @@ class DetectionRepository:
                 await self.db.execute(statement)
 
             await self.db.commit()
+            # The swap recreated the table under the same name; drop cached column sets.
+            invalidate_schema_snapshots()
             return len(rows)
         except Exception:
             await self.db.rollback()
             raise
 
+    async def rebuild_hourly_cube(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        *,
+        chunk_days: int | None = None,
+    ) -> int:
+        """Recompute detection_hourly_cube for the hours in [start, end) from detections.
+
+        Triggers keep the cube current; this repairs it chunk by chunk, one
+        transaction per chunk, so the writer is never held for a whole-table
+        pass. Without bounds the whole cube is rebuilt. Returns the number of
+        cube rows written.
+        """
+        if not await self._table_exists("detection_hourly_cube"):
+            return 0
+        full_rebuild = start is None and end is None
+        if start is None or end is None:
+            oldest, newest = await self.get_detection_time_bounds()
+            if oldest is None or newest is None:
+                if full_rebuild:
+                    await self.db.execute("DELETE FROM detection_hourly_cube")
+                    await self.db.commit()
+                return 0
+            start = start or oldest
+            end = end or newest + timedelta(hours=1)
+
+        cursor_hour = start.replace(minute=0, second=0, microsecond=0)
+        end_hour = end.replace(minute=0, second=0, microsecond=0)
+        if end_hour < end:
+            end_hour += timedelta(hours=1)
+        if full_rebuild:
+            await self.db.execute(
+                "DELETE FROM detection_hourly_cube WHERE bucket_hour < ? OR bucket_hour >= ?",
+                (cursor_hour.strftime("%Y-%m-%d %H:00:00"), end_hour.strftime("%Y-%m-%d %H:00:00")),
+            )
+            await self.db.commit()
+
+        step = timedelta(days=chunk_days or HOURLY_CUBE_REBUILD_CHUNK_DAYS)
+        written = 0
+        while cursor_hour < end_hour:
+            chunk_end = min(cursor_hour + step, end_hour)
+            bounds = (cursor_hour.strftime("%Y-%m-%d %H:00:00"), chunk_end.strftime("%Y-%m-%d %H:00:00"))
+            try:
+                await self.db.execute(
+                    "DELETE FROM detection_hourly_cube WHERE bucket_hour >= ? AND bucket_hour < ?",
+                    bounds,
+                )
+                async with self.db.execute(_HOURLY_CUBE_REBUILD_SQL, bounds) as cursor:
+                    written += cursor.rowcount or 0
+                await self.db.commit()
+            except Exception:
+                await self.db.rollback()
+                raise
+            cursor_hour = chunk_end
+        return written
+
     async def get_rollup_metrics(self, lookback_days: int = 30) -> dict[str, dict]:
         """Aggregate rollup metrics for leaderboard windows."""
         window = f"-{lookback_days} day"
@@ -1,10 +1,44 @@
 """Persistence operations for eBird export data."""
 
-from collections.abc import AsyncIterator
 from datetime import datetime
 
 import aiosqlite
 
+# English common name for a (taxa_id, scientific_name) pair, aliased ``g``.
+_ENGLISH_COMMON_NAME_SQL = """
+    COALESCE(
+      (SELECT tt.common_name FROM taxonomy_translations tt
+       WHERE g.taxa_id IS NOT NULL AND tt.taxa_id = g.taxa_id
+         AND tt.language_code = 'en' LIMIT 1),
+      (SELECT tt.common_name FROM taxonomy_translations tt
+       JOIN taxonomy_cache tc ON tc.taxa_id = tt.taxa_id
+       WHERE g.scientific_name IS NOT NULL
+         AND LOWER(tc.scientific_name) = LOWER(g.scientific_name)
+         AND tt.language_code = 'en' LIMIT 1),
+      (SELECT tc.common_name FROM taxonomy_cache tc
+       WHERE g.scientific_name IS NOT NULL
+         AND LOWER(tc.scientific_name) = LOWER(g.scientific_name)
+         AND LOWER(tc.common_name) != LOWER(tc.scientific_name)
+       ORDER BY tc.id ASC LIMIT 1),
+      (SELECT tc.common_name FROM taxonomy_cache tc
+       WHERE g.taxa_id IS NOT NULL AND tc.taxa_id = g.taxa_id
+         AND LOWER(tc.common_name) != LOWER(tc.scientific_name)
+       ORDER BY tc.id ASC LIMIT 1)
+    )
+"""
+
+
+def _range_clause(start: datetime | None, end_exclusive: datetime | None) -> tuple[str, list[object]]:
+    clauses: list[str] = []
+    params: list[object] = []
+    if start is not None:
+        clauses.append("d.detection_time >= ?")
+        params.append(start)
+    if end_exclusive is not None:
+        clauses.append("d.detection_time < ?")
+        params.append(end_exclusive)
+    return "".join(f" AND {clause}" for clause in clauses), params
+
 
 class EbirdRepository:
     """Read detection rows used to build an eBird spreadsheet export."""
@@ -12,49 +46,61 @@ class EbirdRepository:
     def __init__(self, db: aiosqlite.Connection) -> None:
         self.db = db
 
-    async def iter_export_rows(
+    async def get_export_name_groups(
         self, *, start: datetime | None, end_exclusive: datetime | None
-    ) -> AsyncIterator[aiosqlite.Row]:
-        clauses: list[str] = []
-        params: list[datetime] = []
-        if start is not None:
-            clauses.append("d.detection_time >= ?")
-            params.append(start)
-        if end_exclusive is not None:
-            clauses.append("d.detection_time < ?")
-            params.append(end_exclusive)
-        date_clause = f" AND {' AND '.join(clauses)}" if clauses else ""
+    ) -> list[aiosqlite.Row]:
+        """Distinct name combinations of the visible detections in range, with their English name.
+
+        Rows are ``(taxa_id, scientific_name, common_name, display_name,
+        english_common_name)``; the taxonomy lookups run once per group
+        instead of once per detection.
+        """
+        range_clause, params = _range_clause(start, end_exclusive)
+        async with self.db.execute(
+            f"""
+            SELECT g.taxa_id, g.scientific_name, g.common_name, g.display_name,
+                   {_ENGLISH_COMMON_NAME_SQL} AS english_common_name
+            FROM (
+                -- DISTINCT keeps only the distinct keys in its temp b-tree; GROUP BY would sort every row.
+                SELECT DISTINCT d.taxa_id, d.scientific_name, d.common_name, d.display_name
+                FROM detections d
+                WHERE d.is_hidden = 0{range_clause}
+            ) g
+            """,
+            params,
+        ) as cursor:
+            return list(await cursor.fetchall())
+
+    async def get_export_page(
+        self,
+        *,
+        start: datetime | None,
+        end_exclusive: datetime | None,
+        before: tuple[object, int] | None,
+        limit: int,
+    ) -> list[aiosqlite.Row]:
+        """One newest-first page of visible detections, resuming below the ``(detection_time, id)`` keyset.
 
+        Rows are ``(id, taxa_id, display_name, scientific_name, detection_time,
+        score, camera_name, common_name, video_classification_provider,
+        video_classification_backend)``.
+        """
+        range_clause, params = _range_clause(start, end_exclusive)
+        if before is not None:
+            # The plain range term lets the time index seek to the keyset.
+            range_clause += " AND d.detection_time <= ? AND (d.detection_time < ? OR d.id < ?)"
+            params.extend([before[0], before[0], before[1]])
+        params.append(limit)
         async with self.db.execute(
             f"""
-            SELECT d.display_name, d.scientific_name, d.detection_time, d.score,
+            SELECT d.id, d.taxa_id, d.display_name, d.scientific_name, d.detection_time, d.score,
                    d.camera_name, d.common_name, d.video_classification_provider,
-                   d.video_classification_backend,
-                   COALESCE(
-                     (SELECT tt.common_name FROM taxonomy_translations tt
-                      WHERE d.taxa_id IS NOT NULL AND tt.taxa_id = d.taxa_id
-                        AND tt.language_code = 'en' LIMIT 1),
-                     (SELECT tt.common_name FROM taxonomy_translations tt
-                      JOIN taxonomy_cache tc ON tc.taxa_id = tt.taxa_id
-                      WHERE d.scientific_name IS NOT NULL
-                        AND LOWER(tc.scientific_name) = LOWER(d.scientific_name)
-                        AND tt.language_code = 'en' LIMIT 1),
-                     (SELECT tc.common_name FROM taxonomy_cache tc
-                      WHERE d.scientific_name IS NOT NULL
-                        AND LOWER(tc.scientific_name) = LOWER(d.scientific_name)
-                        AND LOWER(tc.common_name) != LOWER(tc.scientific_name)
-                      ORDER BY tc.id ASC LIMIT 1),
-                     (SELECT tc.common_name FROM taxonomy_cache tc
-                      WHERE d.taxa_id IS NOT NULL AND tc.taxa_id = d.taxa_id
-                        AND LOWER(tc.common_name) != LOWER(tc.scientific_name)
-                      ORDER BY tc.id ASC LIMIT 1)
-                   ) AS english_common_name
+                   d.video_classification_backend
             FROM detections d
-            WHERE d.is_hidden = 0
-            {date_clause}
-            ORDER BY d.detection_time DESC
+            WHERE d.is_hidden = 0{range_clause}
+            ORDER BY d.detection_time DESC, d.id DESC
+            LIMIT ?
             """,
             params,
         ) as cursor:
-            async for row in cursor:
-                yield row
+            return list(await cursor.fetchall())
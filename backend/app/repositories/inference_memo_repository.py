@@ -0,0 +1,88 @@
+"""Persistence operations for the classifier inference memo."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+import aiosqlite
+
+
+@dataclass(frozen=True)
+class InferenceMemoRow:
+    kind: str
+    results: str
+    diagnostics: str | None
+
+
+class InferenceMemoRepository:
+    """Own SQL for ``inference_memo`` rows keyed by (media, model, policy) hashes."""
+
+    def __init__(self, db: aiosqlite.Connection) -> None:
+        self.db = db
+
+    async def get(self, media_sha256: str, model_sha256: str, policy_sha256: str) -> InferenceMemoRow | None:
+        async with self.db.execute(
+            """SELECT kind, results, diagnostics FROM inference_memo
+               WHERE media_sha256 = ? AND model_sha256 = ? AND policy_sha256 = ?""",
+            (media_sha256, model_sha256, policy_sha256),
+        ) as cursor:
+            row = await cursor.fetchone()
+        if not row:
+            return None
+        return InferenceMemoRow(kind=str(row[0]), results=str(row[1]), diagnostics=row[2])
+
+    async def put(
+        self,
+        media_sha256: str,
+        model_sha256: str,
+        policy_sha256: str,
+        *,
+        kind: str,
+        results: str,
+        diagnostics: str | None,
+        created_at: datetime,
+    ) -> None:
+        await self.db.execute(
+            """INSERT INTO inference_memo
+                   (media_sha256, model_sha256, policy_sha256, kind, results, diagnostics, created_at, accessed_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(media_sha256, model_sha256, policy_sha256) DO UPDATE SET
+                   kind = excluded.kind,
+                   results = excluded.results,
+                   diagnostics = excluded.diagnostics,
+                   created_at = excluded.created_at,
+                   accessed_at = excluded.accessed_at""",
+            (media_sha256, model_sha256, policy_sha256, kind, results, diagnostics, created_at, created_at),
+        )
+        await self.db.commit()
+
+    async def touch(self, media_sha256: str, model_sha256: str, policy_sha256: str, accessed_at: datetime) -> None:
+        await self.db.execute(
+            """UPDATE inference_memo SET accessed_at = ?
+               WHERE media_sha256 = ? AND model_sha256 = ? AND policy_sha256 = ?""",
+            (accessed_at, media_sha256, model_sha256, policy_sha256),
+        )
+        await self.db.commit()
+
+    async def count(self) -> int:
+        async with self.db.execute("SELECT COUNT(*) FROM inference_memo") as cursor:
+            row = await cursor.fetchone()
+        return int(row[0] or 0) if row else 0
+
+    async def evict(self, max_entries: int) -> int:
+        """Delete least recently accessed rows until at most ``max_entries`` remain."""
+        excess = await self.count() - max(0, int(max_entries))
+        if excess <= 0:
+            return 0
+        await self.db.execute(
+            """DELETE FROM inference_memo WHERE rowid IN (
+                   SELECT rowid FROM inference_memo ORDER BY accessed_at ASC LIMIT ?
+               )""",
+            (excess,),
+        )
+        await self.db.commit()
+        return excess
+
+    async def clear(self) -> int:
+        cursor = await self.db.execute("DELETE FROM inference_memo")
+        await self.db.commit()
+        return int(cursor.rowcount or 0)
@@ -0,0 +1,130 @@
+"""Persistence operations for the upstream reference-data cache."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+import aiosqlite
+
+
+@dataclass(frozen=True)
+class ReferenceCacheEntry:
+    payload: str | None
+    blob_path: str | None
+    media_type: str | None
+    fetched_at: datetime
+    accessed_at: datetime
+
+
+def _as_datetime(value: object) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+
+
+class ReferenceCacheRepository:
+    """Own SQL for ``reference_cache`` rows; blob files are managed by the service."""
+
+    def __init__(self, db: aiosqlite.Connection) -> None:
+        self.db = db
+
+    async def get(self, source: str, cache_key: str) -> ReferenceCacheEntry | None:
+        async with self.db.execute(
+            """SELECT payload, blob_path, media_type, fetched_at, accessed_at
+               FROM reference_cache WHERE source = ? AND cache_key = ?""",
+            (source, cache_key),
+        ) as cursor:
+            row = await cursor.fetchone()
+        if not row:
+            return None
+        return ReferenceCacheEntry(
+            payload=row[0],
+            blob_path=row[1],
+            media_type=row[2],
+            fetched_at=_as_datetime(row[3]),
+            accessed_at=_as_datetime(row[4]),
+        )
+
+    async def put(
+        self,
+        source: str,
+        cache_key: str,
+        *,
+        payload: str | None,
+        blob_path: str | None,
+        blob_bytes: int,
+        media_type: str | None,
+        fetched_at: datetime,
+    ) -> None:
+        await self.db.execute(
+            """INSERT INTO reference_cache
+                   (source, cache_key, payload, blob_path, blob_bytes, media_type, fetched_at, accessed_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(source, cache_key) DO UPDATE SET
+                   payload = excluded.payload,
+                   blob_path = excluded.blob_path,
+                   blob_bytes = excluded.blob_bytes,
+                   media_type = excluded.media_type,
+                   fetched_at = excluded.fetched_at,
+                   accessed_at = excluded.accessed_at""",
+            (source, cache_key, payload, blob_path, blob_bytes, media_type, fetched_at, fetched_at),
+        )
+        await self.db.commit()
+
+    async def touch(self, source: str, cache_key: str, accessed_at: datetime) -> None:
+        await self.db.execute(
+            "UPDATE reference_cache SET accessed_at = ? WHERE source = ? AND cache_key = ?",
+            (accessed_at, source, cache_key),
+        )
+        await self.db.commit()
+
+    async def delete(self, source: str, cache_key: str | None = None) -> list[str]:
+        """Delete one entry (or a whole source) and return the blob paths it referenced."""
+        if cache_key is None:
+            where, params = "source = ?", [source]
+        else:
+            where, params = "source = ? AND cache_key = ?", [source, cache_key]
+        async with self.db.execute(
+            f"SELECT blob_path FROM reference_cache WHERE {where} AND blob_path IS NOT NULL", params
+        ) as cursor:
+            blob_paths = [str(row[0]) for row in await cursor.fetchall()]
+        await self.db.execute(f"DELETE FROM reference_cache WHERE {where}", params)
+        await self.db.commit()
+        return blob_paths
+
+    async def delete_fetched_before(self, source: str, cutoff: datetime) -> list[str]:
+        """Drop a source's entries fetched before ``cutoff``; returns their blob paths."""
+        async with self.db.execute(
+            "SELECT blob_path FROM reference_cache WHERE source = ? AND fetched_at < ? AND blob_path IS NOT NULL",
+            (source, cutoff),
+        ) as cursor:
+            blob_paths = [str(row[0]) for row in await cursor.fetchall()]
+        await self.db.execute("DELETE FROM reference_cache WHERE source = ? AND fetched_at < ?", (source, cutoff))
+        await self.db.commit()
+        return blob_paths
+
+    async def blob_bytes_total(self) -> int:
+        async with self.db.execute(
+            "SELECT COALESCE(SUM(blob_bytes), 0) FROM reference_cache WHERE blob_path IS NOT NULL"
+        ) as cursor:
+            row = await cursor.fetchone()
+        return int(row[0] or 0) if row else 0
+
+    async def evict_blobs(self, max_bytes: int) -> list[str]:
+        """Delete least recently accessed blob entries until the total fits ``max_bytes``."""
+        total = await self.blob_bytes_total()
+        if total <= max_bytes:
+            return []
+        victims: list[tuple[str, str, str]] = []
+        async with self.db.execute(
+            """SELECT source, cache_key, blob_path, blob_bytes FROM reference_cache
+               WHERE blob_path IS NOT NULL ORDER BY accessed_at ASC"""
+        ) as cursor:
+            async for row in cursor:
+                if total <= max_bytes:
+                    break
+                victims.append((str(row[0]), str(row[1]), str(row[2])))
+                total -= int(row[3] or 0)
+        await self.db.executemany(
+            "DELETE FROM reference_cache WHERE source = ? AND cache_key = ?",
+            [(source, cache_key) for source, cache_key, _path in victims],
+        )
+        await self.db.commit()
+        return [path for _source, _key, path in victims]
@@ -0,0 +1,63 @@
+"""Cached view of which tables (and columns) exist in the database.
+
+Repositories gate optional joins and features on tables such as
+``taxonomy_cache`` or ``classification_feedback``. Asking ``sqlite_master`` on
+every call cost an extra query per API request, so the answer is kept per
+connection (shared by every connection of one pool) and only reloaded after
+``invalidate_schema_snapshots``, which runs once migrations finish and after a
+repository swaps tables at runtime.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any
+
+_generation = 0
+_snapshots: "weakref.WeakKeyDictionary[Any, tuple[int, SchemaSnapshot]]" = weakref.WeakKeyDictionary()
+
+
+class SchemaSnapshot:
+    def __init__(self, tables: frozenset[str]) -> None:
+        self.tables = tables
+        self._columns: dict[str, frozenset[str]] = {}
+
+    def has_table(self, table_name: str) -> bool:
+        return table_name in self.tables
+
+    async def columns(self, db: Any, table_name: str) -> frozenset[str]:
+        """Column names of ``table_name``; callers must only pass trusted table names."""
+        cached = self._columns.get(table_name)
+        if cached is not None:
+            return cached
+        if table_name not in self.tables:
+            return frozenset()
+        async with db.execute(f"PRAGMA table_info({table_name})") as cursor:
+            rows = await cursor.fetchall()
+        columns = frozenset(row[1] for row in rows if row and len(row) > 1)
+        self._columns[table_name] = columns
+        return columns
+
+
+def _cache_key(db: Any) -> Any:
+    # Pooled handles share one key (the pool); raw connections are their own key.
+    return getattr(db, "schema_cache_key", None) or db
+
+
+async def get_schema_snapshot(db: Any) -> SchemaSnapshot:
+    key = _cache_key(db)
+    entry = _snapshots.get(key)
+    if entry is not None and entry[0] == _generation:
+        return entry[1]
+    generation = _generation
+    async with db.execute("SELECT name FROM sqlite_master WHERE type='table'") as cursor:
+        rows = await cursor.fetchall()
+    snapshot = SchemaSnapshot(frozenset(str(row[0]) for row in rows if row and row[0]))
+    _snapshots[key] = (generation, snapshot)
+    return snapshot
+
+
+def invalidate_schema_snapshots() -> None:
+    """Force every connection to reload its snapshot on next use."""
+    global _generation
+    _generation += 1
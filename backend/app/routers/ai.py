@@ -1,15 +1,16 @@
 from fastapi import APIRouter, HTTPException, Request, Depends, Response
 from pydantic import BaseModel
-from datetime import datetime, timezone
+from datetime import datetime, time, timedelta, timezone, tzinfo
 import base64
 import asyncio
 import hashlib
 import json
 from pathlib import Path
 import structlog
+from app.services.ai_job_queue import ai_job_queue
 from app.services.ai_service import AIAnalysisError, ai_service
 from app.services.frigate_client import frigate_client
-from app.repositories.detection_repository import DetectionRepository
+from app.repositories.detection_repository import Detection, DetectionRepository
 from app.repositories.leaderboard_analysis_repository import LeaderboardAnalysisRepository
 from app.repositories.ai_conversation_repository import AIConversationRepository
 from app.database import get_db
@@ -53,6 +54,34 @@ class ConversationRequest(BaseModel):
     message: str
 
 
+class AIBatchResponse(BaseModel):
+    batch_id: str
+    queued: int
+    skipped: int
+
+
+class AIQueueLaneStatus(BaseModel):
+    provider: str
+    active: int
+    waiting: int
+    paused_for_seconds: float
+
+
+class AIQueueBatchStatus(BaseModel):
+    batch_id: str
+    total: int
+    completed: int
+    failed: int
+    skipped: int
+    running: bool
+    elapsed_seconds: float
+
+
+class AIQueueStatusResponse(BaseModel):
+    lanes: list[AIQueueLaneStatus]
+    batches: list[AIQueueBatchStatus]
+
+
 def _serialize_timestamp(value: datetime | None) -> str:
     serialized = serialize_api_datetime(value)
     return serialized or ""
@@ -88,6 +117,9 @@ async def _load_ai_analysis_frames(
             recording_path = None
 
         if recording_path:
+            cached = ai_service.frame_cache.get(event_id, "recording", frame_count)
+            if cached:
+                return cached, "recording"
             try:
                 recording_bytes = await asyncio.to_thread(Path(recording_path).read_bytes)
                 frames = await asyncio.to_thread(
@@ -97,12 +129,16 @@ async def _load_ai_analysis_frames(
                     clip_variant="recording",
                 )
                 if frames:
+                    ai_service.frame_cache.put(event_id, "recording", frame_count, frames)
                     return frames, "recording"
                 log.warning("recording_clip_frame_extraction_failed", event_id=event_id)
             except OSError as exc:
                 log.warning("recording_clip_read_failed", event_id=event_id, error=str(exc))
 
     if settings.frigate.clips_enabled:
+        cached = ai_service.frame_cache.get(event_id, "event", frame_count)
+        if cached:
+            return cached, "event"
         clip_bytes, clip_error = await frigate_client.get_clip_with_error(event_id)
         if clip_bytes:
             frames = ai_service.extract_frames_from_clip(
@@ -111,6 +147,7 @@ async def _load_ai_analysis_frames(
                 clip_variant="event",
             )
             if frames:
+                ai_service.frame_cache.put(event_id, "event", frame_count, frames)
                 return frames, "event"
             log.warning("clip_frame_extraction_failed", event_id=event_id)
         else:
@@ -119,6 +156,63 @@ async def _load_ai_analysis_frames(
     return [], None
 
 
+async def _generate_event_analysis(
+    detection: Detection,
+    *,
+    lang: str,
+    user_tz: tzinfo,
+    use_clip: bool = True,
+    frame_count: int = 5,
+    batch_id: str | None = None,
+) -> str | None:
+    """Load clip frames (or the snapshot) for a detection and analyze them through the AI queue."""
+    event_id = detection.frigate_event
+    frames: list[bytes] = []
+    frame_source: str | None = None
+    frame_count = max(1, min(frame_count, 10))
+    if use_clip:
+        frames, frame_source = await _load_ai_analysis_frames(
+            event_id,
+            frame_count=frame_count,
+            lang=lang,
+        )
+
+    image_data = None
+    if not frames:
+        image_data = await frigate_client.get_snapshot(event_id, crop=True, quality=90)
+        if not image_data:
+            raise HTTPException(status_code=502, detail=i18n_service.translate("errors.ai.image_fetch_failed", lang))
+
+    # Metadata for prompt
+    local_time = detection.detection_time.replace(tzinfo=timezone.utc).astimezone(user_tz)
+    temp_unit = settings.location.temperature_unit
+    metadata = {
+        "temperature": detection.temperature,
+        "temp_unit": temp_unit,
+        "weather_condition": detection.weather_condition,
+        "time": local_time.strftime("%H:%M"),
+    }
+    if frames:
+        metadata["frame_count"] = len(frames)
+        metadata["frame_source"] = frame_source or "event"
+    else:
+        metadata["frame_source"] = "snapshot"
+
+    return await ai_job_queue.run(
+        "analysis",
+        lambda: ai_service.analyze_detection(
+            species=detection.display_name,
+            image_data=image_data,
+            metadata=metadata,
+            image_list=frames if frames else None,
+            language=lang,
+            mime_type="image/jpeg",
+        ),
+        event_id=event_id,
+        batch_id=batch_id,
+    )
+
+
 @router.post("/events/{event_id}/analyze", response_model=AIAnalysisResponse)
 async def analyze_event(
     event_id: str,
@@ -159,49 +253,14 @@ async def analyze_event(
             convo_repo = AIConversationRepository(db)
             await convo_repo.delete_turns(event_id)
 
-        frames: list[bytes] = []
-        frame_source: str | None = None
-        frame_count = max(1, min(frame_count, 10))
-        if use_clip:
-            frames, frame_source = await _load_ai_analysis_frames(
-                event_id,
-                frame_count=frame_count,
-                lang=lang,
-            )
-
-        image_data = None
-        if not frames:
-            image_data = await frigate_client.get_snapshot(event_id, crop=True, quality=90)
-            if not image_data:
-                raise HTTPException(
-                    status_code=502, detail=i18n_service.translate("errors.ai.image_fetch_failed", lang)
-                )
-
-        # Metadata for prompt
-        user_tz = get_user_timezone(request)
-        local_time = detection.detection_time.replace(tzinfo=timezone.utc).astimezone(user_tz)
-        temp_unit = settings.location.temperature_unit
-        metadata = {
-            "temperature": detection.temperature,
-            "temp_unit": temp_unit,
-            "weather_condition": detection.weather_condition,
-            "time": local_time.strftime("%H:%M"),
-        }
-        if frames:
-            metadata["frame_count"] = len(frames)
-            metadata["frame_source"] = frame_source or "event"
-        else:
-            metadata["frame_source"] = "snapshot"
-
         # Generate new analysis
         log.info("generating_new_analysis", event_id=event_id, force=force)
-        analysis = await ai_service.analyze_detection(
-            species=detection.display_name,
-            image_data=image_data,
-            metadata=metadata,
-            image_list=frames if frames else None,
-            language=lang,
-            mime_type="image/jpeg",
+        analysis = await _generate_event_analysis(
+            detection,
+            lang=lang,
+            user_tz=get_user_timezone(request),
+            use_clip=use_clip,
+            frame_count=frame_count,
         )
         _raise_for_ai_error(analysis)
 
@@ -232,6 +291,55 @@ async def get_leaderboard_analysis(
         )
 
 
+@router.post("/ai/analyze/today", response_model=AIBatchResponse, status_code=202)
+async def analyze_today(request: Request, auth: AuthContext = Depends(get_auth_context_with_legacy)):
+    """Queue an analysis for every visible detection from the user's current day that has none yet."""
+    if not auth.is_owner:
+        raise HTTPException(status_code=403, detail="Owner access required to generate AI analysis.")
+    if not settings.llm.enabled or not settings.llm.api_key:
+        raise HTTPException(status_code=400, detail="AI analysis is disabled or API key is missing.")
+
+    lang = get_user_language(request)
+    user_tz = get_user_timezone(request)
+    local_today = datetime.now(user_tz).date()
+    start = datetime.combine(local_today, time.min, tzinfo=user_tz).astimezone(timezone.utc).replace(tzinfo=None)
+    end = (
+        datetime.combine(local_today + timedelta(days=1), time.min, tzinfo=user_tz)
+        .astimezone(timezone.utc)
+        .replace(tzinfo=None)
+    )
+    async with get_db() as db:
+        event_ids = await DetectionRepository(db).list_unanalyzed_event_ids(start, end)
+
+    async def analyze_one(event_id: str, batch_id: str) -> bool:
+        async with get_db() as db:
+            detection = await DetectionRepository(db).get_by_frigate_event(event_id)
+        if not detection or detection.ai_analysis:
+            return False
+        analysis = await _generate_event_analysis(detection, lang=lang, user_tz=user_tz, batch_id=batch_id)
+        if not analysis or isinstance(analysis, AIAnalysisError):
+            log.warning("ai_batch_analysis_failed", event_id=event_id, batch_id=batch_id, error=analysis)
+            return False
+        async with get_db() as db:
+            await DetectionRepository(db).update_ai_analysis(event_id, analysis)
+        return True
+
+    batch = ai_job_queue.start_batch(event_ids, analyze_one)
+    log.info("ai_batch_queued", batch_id=batch.batch_id, events=len(batch.event_ids), skipped=batch.skipped)
+    return AIBatchResponse(batch_id=batch.batch_id, queued=len(batch.event_ids), skipped=batch.skipped)
+
+
+@router.get("/ai/queue", response_model=AIQueueStatusResponse)
+async def get_ai_queue_status(auth: AuthContext = Depends(get_auth_context_with_legacy)):
+    if not auth.is_owner:
+        raise HTTPException(status_code=403, detail="Owner access required.")
+    status = ai_job_queue.status()
+    return AIQueueStatusResponse(
+        lanes=[AIQueueLaneStatus(**lane) for lane in status["lanes"]],
+        batches=[AIQueueBatchStatus(**batch) for batch in status["batches"]],
+    )
+
+
 @router.post("/leaderboard/analyze", response_model=LeaderboardAnalysisResponse)
 async def analyze_leaderboard(
     request: Request, body: LeaderboardAnalysisRequest, auth: AuthContext = Depends(get_auth_context_with_legacy)
@@ -262,7 +370,9 @@ async def analyze_leaderboard(
         except Exception:
             raise HTTPException(status_code=400, detail="Invalid image payload.")
 
-        analysis = await ai_service.analyze_chart(image_bytes, body.config, language=lang, mime_type=mime_type)
+        analysis = await ai_job_queue.run(
+            "chart", lambda: ai_service.analyze_chart(image_bytes, body.config, language=lang, mime_type=mime_type)
+        )
         _raise_for_ai_error(analysis)
         if not analysis:
             raise HTTPException(status_code=502, detail="AI analysis failed.")
@@ -318,7 +428,7 @@ async def post_event_conversation(
             question=body.message,
             language=lang,
         )
-        reply = await ai_service.chat_detection(prompt)
+        reply = await ai_job_queue.run("chat", lambda: ai_service.chat_detection(prompt), event_id=event_id)
         _raise_for_ai_error(reply)
         if reply:
             await convo_repo.add_turn(event_id, "assistant", reply)
@@ -7,6 +7,7 @@ import structlog
 from pydantic import BaseModel
 from typing import Literal
 from app.services.audio.audio_service import audio_service
+from app.services.reference_cache import reference_cache
 from app.config import settings
 from app.auth import AuthContext
 from app.auth import get_auth_context_with_legacy
@@ -390,6 +391,8 @@ async def get_audio_spectrogram(
     Cached for a day client-side. BirdNET-Go itself returns the image with
     a 30-day immutable cache header — we keep ours shorter so YA-WAMF can
     invalidate by changing birdnet_url without long-lived stale URLs.
+    Server-side the PNG is kept in the reference cache, keyed by the
+    BirdNET-Go URL, so it survives restarts and BirdNET-Go downtime.
     """
     base_url = (settings.frigate.birdnet_url or "").rstrip("/")
     if not base_url:
@@ -397,19 +400,25 @@ async def get_audio_spectrogram(
     if birdnet_id <= 0:
         raise HTTPException(status_code=400, detail="Invalid detection id")
     target = f"{base_url}/api/v2/spectrogram/{birdnet_id}"
-    try:
-        async with httpx.AsyncClient(timeout=8.0) as client:
-            response = await client.get(target, params={"width": width})
-    except httpx.HTTPError as exc:
-        log.warning("birdnet_spectrogram_proxy_failed", id=birdnet_id, error=str(exc))
-        raise HTTPException(status_code=502, detail="BirdNET-Go unreachable")
-    if response.status_code == 404:
-        raise HTTPException(status_code=404, detail="Spectrogram not found")
-    if response.status_code >= 400:
-        raise HTTPException(status_code=502, detail=f"BirdNET-Go returned {response.status_code}")
-    media_type = response.headers.get("content-type", "image/png")
+
+    async def fetch_spectrogram() -> tuple[bytes, str]:
+        try:
+            async with httpx.AsyncClient(timeout=8.0) as client:
+                response = await client.get(target, params={"width": width})
+        except httpx.HTTPError as exc:
+            log.warning("birdnet_spectrogram_proxy_failed", id=birdnet_id, error=str(exc))
+            raise HTTPException(status_code=502, detail="BirdNET-Go unreachable")
+        if response.status_code == 404:
+            raise HTTPException(status_code=404, detail="Spectrogram not found")
+        if response.status_code >= 400:
+            raise HTTPException(status_code=502, detail=f"BirdNET-Go returned {response.status_code}")
+        return response.content, response.headers.get("content-type", "image/png")
+
+    content, media_type = await reference_cache.get_blob(
+        "birdnet_spectrogram", f"{target}?width={width}", fetch_spectrogram
+    )
     return Response(
-        content=response.content,
+        content=content,
         media_type=media_type,
         headers={"Cache-Control": "private, max-age=86400"},
     )
@@ -1,8 +1,5 @@
 import asyncio
 from typing import Optional
-import csv
-import io
-import math
 from datetime import date, datetime, time, timedelta
 
 import structlog
@@ -11,11 +8,10 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from app.auth import get_auth_context_with_legacy
-from app.database import get_db
 from app.config import settings
+from app.services.ebird_export import iter_ebird_csv
 from app.services.ebird_service import ebird_service
 from app.services.taxonomy.taxonomy_service import taxonomy_service
-from app.repositories.ebird_repository import EbirdRepository
 
 log = structlog.get_logger()
 router = APIRouter(prefix="/ebird", tags=["ebird"])
@@ -58,177 +54,6 @@ def _require_ebird_api():
         raise HTTPException(status_code=400, detail="eBird integration is disabled")
 
 
-def _format_ebird_row(
-    *,
-    export_common_name: str,
-    scientific_name: str | None,
-    checklist_start: datetime,
-    count: int,
-    best_score: float,
-    camera_name: str | None,
-    duration_minutes: int,
-    video_classification_provider: str | None,
-    video_classification_backend: str | None,
-    used_scientific_fallback: bool = False,
-) -> list[str]:
-    date_str = checklist_start.strftime("%m/%d/%Y")
-    time_str = checklist_start.strftime("%H:%M")
-
-    genus = ""
-    species = ""
-    if scientific_name:
-        parts = scientific_name.strip().split(" ", 1)
-        if len(parts) > 0:
-            genus = parts[0]
-        if len(parts) > 1:
-            species = parts[1]
-
-    location_name = f"Home ({camera_name})" if camera_name else "Home"
-    lat = settings.location.latitude
-    lon = settings.location.longitude
-    state = str(getattr(settings.location, "state", "") or "").strip()
-    country = str(getattr(settings.location, "country", "") or "").strip()
-    submission_parts = ["Exported from YA-WAMF"]
-
-    provider = str(video_classification_provider or "").strip()
-    backend = str(video_classification_backend or "").strip()
-    if provider:
-        submission_parts.append(f"provider {provider}")
-    if backend:
-        submission_parts.append(f"backend {backend}")
-
-    try:
-        confidence = float(best_score)
-    except (TypeError, ValueError):
-        confidence = None
-    if confidence is not None and math.isfinite(confidence):
-        submission_parts.append(f"confidence {confidence:.2f}")
-
-    if used_scientific_fallback:
-        submission_parts.append("common name unavailable")
-    submission_comment = "; ".join(submission_parts)
-
-    species_comment_parts: list[str] = []
-    if confidence is not None and math.isfinite(confidence):
-        species_comment_parts.append(f"AI confidence {confidence:.2f}")
-    if used_scientific_fallback:
-        species_comment_parts.append("common name unavailable")
-    species_comment = "; ".join(species_comment_parts)
-
-    # Feeder cameras can fire many detections for the same visiting bird, so a
-    # checklist row should stay conservative instead of turning trigger count
-    # into claimed individual abundance for eBird import.
-    return [
-        export_common_name,
-        genus,
-        species,
-        "1",
-        species_comment,
-        location_name,
-        f"{lat:.6f}" if lat is not None else "",
-        f"{lon:.6f}" if lon is not None else "",
-        date_str,
-        time_str,
-        state,
-        country,
-        "Stationary",
-        "1",
-        str(max(0, int(duration_minutes))),
-        "N",
-        "",
-        "",
-        submission_comment,
-    ]
-
-
-def _is_english_safe_name(value: str | None) -> bool:
-    candidate = str(value or "").strip()
-    if not candidate:
-        return False
-    if candidate.lower() == "unknown bird":
-        return False
-    return candidate.isascii()
-
-
-def _resolve_export_common_name(
-    *,
-    display_name: str | None,
-    common_name: str | None,
-    english_common_name: str | None,
-    scientific_name: str | None,
-) -> str:
-    # Pre-compute the scientific name in lowercase for comparison.
-    # This guards against the case where the scientific name was stored verbatim
-    # in the common_name or display_name field (e.g. "Parus major" as common name),
-    # which happens with manual tags by scientific name or taxonomy cache corruption.
-    sci_lower = str(scientific_name or "").strip().lower()
-
-    def is_usable_common_name(val: str | None) -> bool:
-        if not _is_english_safe_name(val):
-            return False
-        # Reject if the value IS the scientific name — it is not a common name.
-        if sci_lower and str(val).strip().lower() == sci_lower:
-            return False
-        return True
-
-    # 1. Prefer the resolved English common name from taxonomy cache
-    if is_usable_common_name(english_common_name):
-        return str(english_common_name).strip()
-
-    # 2. Try the stored common name (e.g. from model labels)
-    if is_usable_common_name(common_name):
-        return str(common_name).strip()
-
-    # 3. Try the display name
-    if is_usable_common_name(display_name):
-        return str(display_name).strip()
-
-    # 4. Fall back to the scientific name.
-    # eBird import accepts scientific names in the Common Name column when matched
-    # against their taxonomy, so this is safe as a last resort.
-    if scientific_name and scientific_name.strip():
-        return str(scientific_name).strip()
-
-    return ""
-
-
-def _is_exportable_ebird_detection(
-    *,
-    display_name: str | None,
-    common_name: str | None,
-    english_common_name: str | None,
-    scientific_name: str | None,
-) -> bool:
-    normalized_display = str(display_name or "").strip().lower()
-    normalized_common = str(common_name or "").strip().lower()
-
-    if normalized_display == "unknown bird" or normalized_common == "unknown bird":
-        return False
-
-    if not _resolve_export_common_name(
-        display_name=display_name,
-        common_name=common_name,
-        english_common_name=english_common_name,
-        scientific_name=scientific_name,
-    ):
-        return False
-    return True
-
-
-def _parse_detection_time(value: object) -> datetime | None:
-    if isinstance(value, datetime):
-        return value
-    if isinstance(value, str):
-        try:
-            return datetime.fromisoformat(value)
-        except ValueError:
-            try:
-                return datetime.strptime(value, "%Y-%m-%d %H:%M:%S.%f")
-            except ValueError:
-                return None
-    return None
-
-
 @router.get("/export", response_class=StreamingResponse)
 async def export_ebird_csv(
     from_date: Optional[str] = Query(
@@ -239,6 +64,8 @@ async def export_ebird_csv(
 ):
     """
     Export all non-hidden detections in eBird Record Format CSV.
+
+    Streamed a day of checklists at a time; see ``app.services.ebird_export``.
     """
     try:
         requested_from = date.fromisoformat(from_date) if from_date else None
@@ -252,234 +79,11 @@ async def export_ebird_csv(
     start = datetime.combine(requested_from, time.min) if requested_from else None
     end_exclusive = datetime.combine(requested_to + timedelta(days=1), time.min) if requested_to else None
 
-    async def iter_csv():
-        f = io.StringIO()
-        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
-        parsed_rows: list[
-            tuple[str, str | None, datetime, float, str | None, str | None, str | None, str | None, str | None, date]
-        ] = []
-
-        # eBird spreadsheet import is strict about column order and often treats headers as data,
-        # so this endpoint emits headerless rows in the standard 19-column record format.
-
-        async with get_db() as db:
-            async for row in EbirdRepository(db).iter_export_rows(start=start, end_exclusive=end_exclusive):
-                (
-                    display_name,
-                    scientific_name,
-                    detection_time,
-                    score,
-                    camera_name,
-                    common_name,
-                    video_classification_provider,
-                    video_classification_backend,
-                    english_common_name,
-                ) = row
-                if not _is_exportable_ebird_detection(
-                    display_name=display_name,
-                    common_name=common_name,
-                    english_common_name=english_common_name,
-                    scientific_name=scientific_name,
-                ):
-                    continue
-                dt = _parse_detection_time(detection_time)
-                if dt is None:
-                    continue
-                bucket = dt.date()
-                parsed_rows.append(
-                    (
-                        display_name,
-                        scientific_name,
-                        dt,
-                        score,
-                        camera_name,
-                        common_name,
-                        video_classification_provider,
-                        video_classification_backend,
-                        english_common_name,
-                        bucket,
-                    )
-                )
-
-            # Pre-enrichment pass: for rows where no local source provides a
-            # usable English common name (e.g. taxonomy_cache only has a
-            # localised name like "Большая синица" and taxonomy_translations has
-            # no English entry), attempt a taxonomy lookup via taxonomy_service.
-            # get_localized_common_name('en') checks taxonomy_translations first
-            # and only calls iNaturalist if no English entry is cached yet —
-            # so the hot path is a single SQLite read per distinct species.
-            # We skip enrichment when common_name or display_name already
-            # provides a usable English value so we don't replace e.g.
-            # "Common Blackbird" with a different iNat preferred name.
-            sci_to_enrich: set[str] = set()
-            for _row in parsed_rows:
-                _display, _sci, _, _, _, _common, _, _, _en, _ = _row
-                if not _sci:
-                    continue
-                _sci_lower = str(_sci).strip().lower()
-
-                def _locally_usable(val: str | None) -> bool:
-                    v = str(val or "").strip()
-                    return bool(v) and v.lower() != _sci_lower and _is_english_safe_name(v)
-
-                if not _locally_usable(_en) and not _locally_usable(_common) and not _locally_usable(_display):
-                    sci_to_enrich.add(_sci)
-            enrichment_map: dict[str, str] = {}
-            if sci_to_enrich:
-                enrich_sem = asyncio.Semaphore(5)
-
-                async def _enrich_english(sci: str) -> tuple[str, str | None]:
-                    async with enrich_sem:
-                        try:
-                            tax = await taxonomy_service.get_names(sci)
-                            taxa_id = tax.get("taxa_id")
-                            if taxa_id:
-                                en = await taxonomy_service.get_localized_common_name(taxa_id, "en")
-                                if en and _is_english_safe_name(en) and en.strip().lower() != sci.strip().lower():
-                                    return sci, en
-                            # taxonomy_cache common_name as fallback (already English
-                            # when populated by _lookup_inaturalist with locale=en)
-                            common = tax.get("common_name")
-                            if (
-                                common
-                                and _is_english_safe_name(common)
-                                and common.strip().lower() != sci.strip().lower()
-                            ):
-                                return sci, common
-                        except Exception as exc:
-                            log.warning("eBird export enrichment failed", scientific_name=sci, error=str(exc))
-                    return sci, None
-
-                pairs = await asyncio.gather(*(_enrich_english(sci) for sci in sci_to_enrich))
-                enrichment_map = {sci: name for sci, name in pairs if name}
-
-            # ------------------------------------------------------------------
-            # Aggregate into eBird checklists.
-            #
-            # eBird Record Format groups observations by date + location into a
-            # single "checklist".  Each species appears once per checklist with:
-            #   - count  = number of individuals observed
-            #   - date / start time = the earliest detection in the checklist
-            #   - duration = span from first to last detection (minutes)
-            # ------------------------------------------------------------------
-            # checklist key = (date, camera_name)
-            ChecklistKey = tuple[date, str | None]
-            checklist_start: dict[ChecklistKey, datetime] = {}
-            checklist_end: dict[ChecklistKey, datetime] = {}
-
-            # species key within a checklist = resolved export common name
-            # value = (count, best_score, scientific_name, provider, backend)
-            species_agg: dict[
-                tuple[ChecklistKey, str],
-                tuple[int, float, str | None, str | None, str | None],
-            ] = {}
-            # Preserve insertion order for deterministic output
-            checklist_species_order: list[tuple[ChecklistKey, str]] = []
-
-            for (
-                display_name,
-                scientific_name,
-                dt,
-                score,
-                camera_name,
-                common_name,
-                video_classification_provider,
-                video_classification_backend,
-                english_common_name,
-                bucket,
-            ) in parsed_rows:
-                effective_english = english_common_name or enrichment_map.get(scientific_name or "")
-                export_name = _resolve_export_common_name(
-                    display_name=display_name,
-                    common_name=common_name,
-                    english_common_name=effective_english,
-                    scientific_name=scientific_name,
-                )
-                ck: ChecklistKey = (bucket, camera_name)
-
-                # Update checklist time span
-                prev_start = checklist_start.get(ck)
-                if prev_start is None or dt < prev_start:
-                    checklist_start[ck] = dt
-                prev_end = checklist_end.get(ck)
-                if prev_end is None or dt > prev_end:
-                    checklist_end[ck] = dt
-
-                # Aggregate species within checklist
-                species_key = (ck, export_name)
-                existing = species_agg.get(species_key)
-                try:
-                    score_f = float(score)
-                    if not math.isfinite(score_f):
-                        score_f = float("nan")
-                except (TypeError, ValueError):
-                    score_f = float("nan")
-                if existing is None:
-                    species_agg[species_key] = (
-                        1,
-                        score_f,
-                        scientific_name,
-                        video_classification_provider,
-                        video_classification_backend,
-                    )
-                    checklist_species_order.append(species_key)
-                else:
-                    prev_count, prev_best, prev_sci, prev_prov, prev_back = existing
-                    # Keep metadata from the highest-scoring detection
-                    if score_f > prev_best:
-                        species_agg[species_key] = (
-                            prev_count + 1,
-                            score_f,
-                            scientific_name,
-                            video_classification_provider,
-                            video_classification_backend,
-                        )
-                    else:
-                        species_agg[species_key] = (
-                            prev_count + 1,
-                            prev_best,
-                            prev_sci,
-                            prev_prov,
-                            prev_back,
-                        )
-
-            # Emit one row per species per checklist
-            for species_key in checklist_species_order:
-                ck, export_name = species_key
-                count, best_score, scientific_name, provider, backend = species_agg[species_key]
-                start_dt = checklist_start[ck]
-                end_dt = checklist_end[ck]
-                duration = max(0, int((end_dt - start_dt).total_seconds() // 60))
-
-                # Detect when the export name is a scientific name fallback.
-                sci_lower = str(scientific_name or "").strip().lower()
-                is_sci_fallback = bool(sci_lower and export_name.strip().lower() == sci_lower)
-
-                writer.writerow(
-                    _format_ebird_row(
-                        export_common_name=export_name,
-                        scientific_name=scientific_name,
-                        checklist_start=start_dt,
-                        count=count,
-                        best_score=best_score,
-                        camera_name=ck[1],
-                        duration_minutes=duration,
-                        video_classification_provider=provider,
-                        video_classification_backend=backend,
-                        used_scientific_fallback=is_sci_fallback,
-                    )
-                )
-
-                f.seek(0)
-                data = f.read()
-                if data:
-                    yield data
-                f.truncate(0)
-                f.seek(0)
-
     filename = f"ebird_export_{datetime.now().strftime('%Y%m%d')}.csv"
     return StreamingResponse(
-        iter_csv(), media_type="text/csv", headers={"Content-Disposition": f"attachment; filename={filename}"}
+        iter_ebird_csv(start=start, end_exclusive=end_exclusive),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
 
 
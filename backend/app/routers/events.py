@@ -2,11 +2,11 @@ import asyncio
 import time
 import unicodedata
 from fastapi import APIRouter, HTTPException, Query, Request, Depends
+from fastapi.responses import StreamingResponse
 from typing import List, Optional, Literal
 from datetime import datetime, date, timedelta
 from pydantic import BaseModel, Field
 import structlog
-from PIL import Image
 
 from app.database import get_db
 from app.models import DetectionListItemResponse, DetectionResponse
@@ -16,6 +16,13 @@ from app.services.classifier_service import get_classifier
 from app.services.frigate_client import frigate_client
 from app.services.auto_video_classifier_service import auto_video_classifier
 from app.services.media_cache import media_cache
+from app.services.detection_export import (
+    ExportFilters,
+    decode_export_cursor,
+    iter_csv,
+    iter_export_records,
+    iter_ndjson,
+)
 from app.services.broadcaster import broadcaster
 from app.services.taxonomy.taxonomy_service import taxonomy_service
 from app.services.audio.audio_service import audio_service
@@ -38,11 +45,14 @@ from app.utils.canonical_species import (
     unknown_species_labels,
     user_facing_species_fields,
 )
+from app.utils.lazy_imports import lazy_module
+
+Image = lazy_module("PIL.Image")
 
 router = APIRouter()
 
 
-def decode_image_bytes(contents: bytes) -> Image.Image:
+def decode_image_bytes(contents: bytes) -> "Image.Image":
     """Fully decode image bytes outside the async event loop."""
     from io import BytesIO
 
@@ -812,6 +822,65 @@ async def get_events(
         return response_events
 
 
+@router.get("/events/export", response_class=StreamingResponse)
+async def export_events(
+    request: Request,
+    export_format: Literal["ndjson", "csv"] = Query(default="ndjson", alias="format", description="Output format"),
+    start_date: Optional[date] = Query(default=None, description="Export events from this date (inclusive)"),
+    end_date: Optional[date] = Query(default=None, description="Export events until this date (inclusive)"),
+    species: Optional[str] = Query(default=None, description="Filter by species name"),
+    camera: Optional[str] = Query(default=None, description="Filter by camera name"),
+    favorites: bool = Query(default=False, description="Only export favorited detections"),
+    audio_confirmed_only: bool = Query(default=False, description="Only export detections with audio confirmation"),
+    include_hidden: bool = Query(default=False, description="Include hidden/ignored detections"),
+    after: Optional[str] = Query(
+        default=None, max_length=512, description="export_cursor of the last record received; resumes after it"
+    ),
+    auth: AuthContext = Depends(require_owner),
+):
+    """Stream every matching detection, oldest first, as NDJSON or CSV.
+
+    Uses the same filters as ``/events`` but no paging, no Frigate clip checks
+    and cached taxonomy names only; see ``app.services.detection_export``.
+    """
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=400, detail="Invalid date range; expected start_date <= end_date")
+    resume_after = None
+    if after:
+        try:
+            resume_after = decode_export_cursor(after)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    species_name, taxa_id = parse_species_filter(species)
+    species_name, species_aliases = resolve_species_display_filter_aliases(species_name, taxa_id)
+    filters = ExportFilters(
+        start=datetime.combine(start_date, datetime.min.time()) if start_date else None,
+        end=datetime.combine(end_date + timedelta(days=1), datetime.min.time()) if end_date else None,
+        species=species_name,
+        species_any=species_aliases,
+        taxa_id=taxa_id,
+        camera=camera,
+        include_hidden=include_hidden,
+        favorite_only=favorites,
+        audio_confirmed_only=audio_confirmed_only,
+    )
+    records = iter_export_records(
+        filters,
+        lang=get_user_language(request),
+        unknown_labels=list(settings.classification.unknown_bird_labels or []),
+        after=resume_after,
+    )
+    stamp = datetime.now().strftime("%Y%m%d")
+    if export_format == "csv":
+        body, media_type, filename = iter_csv(records), "text/csv", f"detections_{stamp}.csv"
+    else:
+        body, media_type, filename = iter_ndjson(records), "application/x-ndjson", f"detections_{stamp}.ndjson"
+    return StreamingResponse(
+        body, media_type=media_type, headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+
 class HiddenCountResponse(BaseModel):
     """Response for hidden count endpoint."""
 
@@ -1407,6 +1476,7 @@ async def reclassify_event(
                         event_data=event_data,
                         provenance=snapshot_provenance,
                     ),
+                    memoize=True,
                 )
                 for result in results:
                     if isinstance(result, dict):
@@ -14,6 +14,7 @@ from app.auth import require_owner, AuthContext
 from app.auth import get_auth_context_with_legacy
 from app.services.inaturalist_service import inaturalist_service, INAT_AUTHORIZE_URL, INAT_TOKEN_URL, INAT_BASE_URL
 from app.services.i18n_service import i18n_service
+from app.services.reference_cache import reference_cache
 from app.utils.language import get_user_language
 from app.database import get_db
 from app.repositories.detection_repository import DetectionRepository
@@ -277,26 +278,30 @@ async def inaturalist_seasonality(
         params["lng"] = lng
         params["radius"] = radius
 
-    try:
+    async def fetch_histogram() -> dict:
         async with httpx.AsyncClient(timeout=10.0) as client:
             resp = await client.get(f"{INAT_BASE_URL}/observations/histogram", params=params)
             resp.raise_for_status()
-            data = resp.json()
-
-            # Transform { "1": 10, "2": 20 } into array [10, 20, ...]
-            # iNat months are 1-12
-            histogram = data.get("results", {}).get("month_of_year", {})
-            values = []
-            for i in range(1, 13):
-                values.append(histogram.get(str(i), 0))
-
-            return {
-                "status": "ok",
-                "taxon_id": taxon_id,
-                "local": lat is not None,
-                "month_counts": values,
-                "total_observations": sum(values),
-            }
+            return resp.json()
+
+    cache_key = "|".join(f"{name}={value}" for name, value in sorted(params.items()))
+    try:
+        data = await reference_cache.get_json("inat_seasonality", cache_key, fetch_histogram)
     except Exception as e:
         log.error("inat_seasonality_failed", taxon_id=taxon_id, error=str(e))
         raise HTTPException(status_code=502, detail="Failed to fetch seasonality data")
+
+    # Transform { "1": 10, "2": 20 } into array [10, 20, ...]
+    # iNat months are 1-12
+    histogram = data.get("results", {}).get("month_of_year", {})
+    values = []
+    for i in range(1, 13):
+        values.append(histogram.get(str(i), 0))
+
+    return {
+        "status": "ok",
+        "taxon_id": taxon_id,
+        "local": lat is not None,
+        "month_counts": values,
+        "total_observations": sum(values),
+    }
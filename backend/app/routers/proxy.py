@@ -993,6 +993,7 @@ async def _fetch_recording_clip_ready(event_id: str, lang: str) -> bool:
 
 async def _ensure_preview_assets(event_id: str, lang: str) -> str:
     """Ensure preview sprite + manifest exist in media cache."""
+    from app.services.event_track_index import event_track_indexes
     from app.services.media_cache import media_cache
     from app.services.video_preview_service import video_preview_service
 
@@ -1061,7 +1062,8 @@ async def _ensure_preview_assets(event_id: str, lang: str) -> str:
 
         try:
             started = perf_counter()
-            sprite_bytes, cues = video_preview_service.generate(clip_path)
+            track_index = await event_track_indexes.get(event_id)
+            sprite_bytes, cues = video_preview_service.generate(clip_path, track_index=track_index)
             manifest_json = json.dumps(
                 {
                     "version": 1,
@@ -29,9 +29,10 @@ from app.services.inaturalist_service import inaturalist_service
 from app.services.frigate_client import frigate_client
 from app.services.timezone_repair_service import timezone_repair_service
 from app.services.media_cache import media_cache
+from app.services.inference_memo import inference_memo
 from app.services.maintenance_coordinator import maintenance_coordinator
 from app.services.ai_service import AIService
-from app.services.frigate_missing_policy import apply_missing_policy, clear_missing_state_if_present
+from app.services.media_reconciliation_service import media_reconciliation_service
 from app.services.smtp_service import smtp_service
 from app.services.bird_model_region_resolver import normalize_bird_model_region
 from app.config_models import (
@@ -64,7 +65,6 @@ def _validated_birdnet_base_url(value: str | None) -> str:
 
 
 log = structlog.get_logger()
-PURGE_CHECK_CONCURRENCY = 8
 BATCH_ANALYSIS_CHECK_CONCURRENCY = 8
 BATCH_ANALYSIS_MAX_QUEUE_PER_RUN = 50
 BATCH_ANALYSIS_MAX_SCAN_PER_RUN = 200
@@ -386,6 +386,8 @@ class PurgeMissingMediaResponse(BaseModel):
     cleared_missing_count: int
     checked: int
     missing: int
+    mode: Optional[str] = None
+    frigate_calls: int = 0
     message: Optional[str] = None
 
 
@@ -2057,195 +2059,13 @@ async def clear_favorites(auth: AuthContext = Depends(require_owner)):
     }
 
 
-async def _purge_missing_media(kind: Literal["clip", "snapshot"]) -> dict:
-    if kind == "clip" and not settings.frigate.clips_enabled:
-        return {
-            "status": "skipped",
-            "deleted_count": 0,
-            "marked_missing_count": 0,
-            "kept_count": 0,
-            "cleared_missing_count": 0,
-            "checked": 0,
-            "missing": 0,
-            "message": "Clip fetching is disabled in settings.",
-        }
-
-    async with get_db() as db:
-        repo = DetectionRepository(db)
-        event_ids = await repo.get_all_frigate_event_ids()
-
-    if not event_ids:
-        return {
-            "status": "completed",
-            "deleted_count": 0,
-            "marked_missing_count": 0,
-            "kept_count": 0,
-            "cleared_missing_count": 0,
-            "checked": 0,
-            "missing": 0,
-            "message": "No detections found",
-        }
-
-    # Check Frigate availability before performing mass purge.
-    try:
-        version = await frigate_client.get_version()
-    except Exception:
-        version = None
-    if not version:
-        return {
-            "status": "failed",
-            "deleted_count": 0,
-            "marked_missing_count": 0,
-            "kept_count": 0,
-            "cleared_missing_count": 0,
-            "checked": 0,
-            "missing": 0,
-            "message": "Frigate is not reachable. Aborting purge.",
-        }
-
-    semaphore = asyncio.Semaphore(PURGE_CHECK_CONCURRENCY)
-
-    async def check(event_id: str) -> tuple[str, bool, str | None]:
-        async with semaphore:
-            event_data, error = await frigate_client.get_event_with_error(event_id)
-            if not event_data:
-                return event_id, True, error or "event_not_found"
-            if kind == "clip":
-                has_media = bool(event_data.get("has_clip", False))
-                return event_id, not has_media, None if has_media else "clip_unavailable"
-            has_media = bool(event_data.get("has_snapshot", True))
-            return event_id, not has_media, None if has_media else "snapshot_unavailable"
-
-    results = await asyncio.gather(*(check(event_id) for event_id in event_ids))
-    missing_count = sum(1 for _event_id, missing, _error in results if missing)
-    deleted_count = 0
-    marked_missing_count = 0
-    kept_count = 0
-    cleared_missing_count = 0
-    async with get_db() as db:
-        repo = DetectionRepository(db)
-        for event_id, missing, error in results:
-            if missing:
-                counts = await apply_missing_policy(
-                    repo=repo,
-                    frigate_event=event_id,
-                    error=error or f"{kind}_unavailable",
-                    source="maintenance_scan",
-                    media_kind=kind,
-                )
-                deleted_count += counts["deleted_count"]
-                marked_missing_count += counts["marked_missing_count"]
-                kept_count += counts["kept_count"]
-                continue
-            if await clear_missing_state_if_present(
-                repo=repo,
-                frigate_event=event_id,
-                source="maintenance_scan",
-                media_kind=kind,
-            ):
-                cleared_missing_count += 1
-
-    return {
-        "status": "completed",
-        "deleted_count": deleted_count,
-        "marked_missing_count": marked_missing_count,
-        "kept_count": kept_count,
-        "cleared_missing_count": cleared_missing_count,
-        "checked": len(event_ids),
-        "missing": missing_count,
-    }
-
+async def _purge_missing_media(kind: Literal["clip", "snapshot"], *, full: bool = True) -> dict:
+    """Reconcile one media kind against Frigate; ``full=False`` re-checks only the retention boundary."""
+    return await media_reconciliation_service.reconcile(kind, full=full)
 
-async def _purge_missing_all_media() -> dict:
-    async with get_db() as db:
-        repo = DetectionRepository(db)
-        event_ids = await repo.get_all_frigate_event_ids()
-
-    if not event_ids:
-        return {
-            "status": "completed",
-            "deleted_count": 0,
-            "marked_missing_count": 0,
-            "kept_count": 0,
-            "cleared_missing_count": 0,
-            "checked": 0,
-            "missing": 0,
-            "message": "No detections found",
-        }
-
-    try:
-        version = await frigate_client.get_version()
-    except Exception:
-        version = None
-    if not version:
-        return {
-            "status": "failed",
-            "deleted_count": 0,
-            "marked_missing_count": 0,
-            "kept_count": 0,
-            "cleared_missing_count": 0,
-            "checked": 0,
-            "missing": 0,
-            "message": "Frigate is not reachable. Aborting purge.",
-        }
-
-    semaphore = asyncio.Semaphore(PURGE_CHECK_CONCURRENCY)
-
-    async def check(event_id: str) -> tuple[str, bool, str | None]:
-        async with semaphore:
-            event_data, error = await frigate_client.get_event_with_error(event_id)
-            if not event_data:
-                return event_id, True, error or "event_not_found"
 
-            missing_reasons: list[str] = []
-            if settings.frigate.clips_enabled and not bool(event_data.get("has_clip", False)):
-                missing_reasons.append("clip_unavailable")
-            if not bool(event_data.get("has_snapshot", True)):
-                missing_reasons.append("snapshot_unavailable")
-
-            if missing_reasons:
-                return event_id, True, ",".join(missing_reasons)
-            return event_id, False, None
-
-    results = await asyncio.gather(*(check(event_id) for event_id in event_ids))
-    missing_count = sum(1 for _event_id, missing, _error in results if missing)
-    deleted_count = 0
-    marked_missing_count = 0
-    kept_count = 0
-    cleared_missing_count = 0
-
-    async with get_db() as db:
-        repo = DetectionRepository(db)
-        for event_id, missing, error in results:
-            if missing:
-                counts = await apply_missing_policy(
-                    repo=repo,
-                    frigate_event=event_id,
-                    error=error or "media_unavailable",
-                    source="maintenance_scan",
-                    media_kind="media",
-                )
-                deleted_count += counts["deleted_count"]
-                marked_missing_count += counts["marked_missing_count"]
-                kept_count += counts["kept_count"]
-                continue
-            if await clear_missing_state_if_present(
-                repo=repo,
-                frigate_event=event_id,
-                source="maintenance_scan",
-                media_kind="media",
-            ):
-                cleared_missing_count += 1
-
-    return {
-        "status": "completed",
-        "deleted_count": deleted_count,
-        "marked_missing_count": marked_missing_count,
-        "kept_count": kept_count,
-        "cleared_missing_count": cleared_missing_count,
-        "checked": len(event_ids),
-        "missing": missing_count,
-    }
+async def _purge_missing_all_media(*, full: bool = True) -> dict:
+    return await media_reconciliation_service.reconcile("media", full=full)
 
 
 def _get_camera_retention_days(frigate_config: object, camera_name: str) -> float | None:
@@ -2519,6 +2339,7 @@ async def get_analysis_status(response: Response, auth: AuthContext = Depends(re
         **auto_video_classifier.get_status(),
         "queue_limit": BATCH_ANALYSIS_MAX_QUEUE_PER_RUN,
         "scan_limit": BATCH_ANALYSIS_MAX_SCAN_PER_RUN,
+        "inference_memo": inference_memo.get_status(),
     }
 
 
@@ -26,6 +26,7 @@ from app.services.taxonomy.taxonomy_service import taxonomy_service
 from app.services.i18n_service import i18n_service
 from app.services.classifier_service import get_classifier
 from app.services.ebird_service import ebird_service
+from app.services.reference_cache import reference_cache
 from app.utils.classifier_labels import collapse_classifier_label
 from app.utils.canonical_species import should_hide_species_label, user_facing_species_fields
 from app.utils.api_datetime import serialize_api_datetime
@@ -40,8 +41,7 @@ from app.ratelimit import guest_rate_limit
 router = APIRouter()
 log = structlog.get_logger()
 
-# Species info cache with TTL
-_wiki_cache: dict[str, tuple[SpeciesInfo, datetime]] = {}
+# Species info freshness; stale entries are still served while they refresh in the background.
 CACHE_TTL_SUCCESS = timedelta(hours=24)
 CACHE_TTL_FAILURE = timedelta(minutes=1)  # Short TTL for failures to allow retries
 
@@ -50,8 +50,6 @@ WIKIPEDIA_USER_AGENT = "YA-WAMF/2.0 (Bird Watching App; https://github.com/Jellm
 
 GBIF_MATCH_URL = "https://api.gbif.org/v1/species/match"
 GBIF_TILE_URL = "https://api.gbif.org/v2/map/occurrence/density/{z}/{x}/{y}@1x.png"
-GBIF_CACHE_TTL = timedelta(hours=24)
-_gbif_cache: dict[str, tuple[int | None, datetime]] = {}
 SPECIES_SEARCH_HYDRATE_MAX = 30
 SPECIES_SEARCH_HYDRATE_CONCURRENCY = 6
 SPECIES_SEARCH_HYDRATE_LOOKUP_TIMEOUT = 2.5
@@ -134,28 +132,26 @@ async def _get_gbif_taxon_key(name: str) -> int | None:
     if not name:
         return None
     normalized = name.strip().lower()
-    cached = _gbif_cache.get(normalized)
-    if cached and datetime.now() - cached[1] < GBIF_CACHE_TTL:
-        return cached[0]
 
-    params = {"name": name}
-    try:
+    async def fetch_match() -> dict:
         async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(GBIF_MATCH_URL, params=params)
+            resp = await client.get(GBIF_MATCH_URL, params={"name": name})
             resp.raise_for_status()
             data = resp.json()
+        return {"usage_key": data.get("usageKey") or data.get("speciesKey") or None}
+
+    try:
+        match = await reference_cache.get_json("gbif_taxon_key", normalized, fetch_match)
     except Exception as e:
         log.warning("GBIF match failed", species=name, error=str(e))
         return None
 
-    key = data.get("usageKey") or data.get("speciesKey") or None
+    key = match.get("usage_key")
     if key is not None:
         try:
             key = int(key)
         except (TypeError, ValueError):
             key = None
-
-    _gbif_cache[normalized] = (key, datetime.now())
     return key
 
 
@@ -388,27 +384,15 @@ def _accumulate_local_distributions(
         monthly[local_dt.month - 1] += count
 
 
-async def _get_cached_species_info(
-    species_name: str, taxa_id: int | None, language: str, refresh: bool
-) -> SpeciesInfo | None:
-    if refresh:
-        return None
-
-    cache_key = f"{species_name}:{language}"
-    if cache_key in _wiki_cache:
-        info, cached_at = _wiki_cache[cache_key]
-        if _is_cache_valid(info, cached_at):
-            log.debug("Returning cached species info (memory)", species=species_name)
-            return info
-
+async def _get_cached_species_info(species_name: str, taxa_id: int | None, language: str) -> SpeciesInfo | None:
+    """Return the stored species info regardless of age; callers decide on freshness."""
     async with get_db() as db:
         row = await SpeciesRepository(db).get_cached_info(species_name=species_name, taxa_id=taxa_id, language=language)
 
     if not row:
         return None
 
-    cached_at = _parse_cached_at(row[11])
-    info = SpeciesInfo(
+    return SpeciesInfo(
         title=row[0] or species_name,
         description=row[1],
         extract=row[2],
@@ -420,17 +404,10 @@ async def _get_cached_species_info(
         summary_source_url=row[8],
         scientific_name=row[9],
         conservation_status=row[10],
-        cached_at=cached_at,
+        cached_at=_parse_cached_at(row[11]),
         taxa_id=row[12],
     )
 
-    if _is_cache_valid(info, cached_at):
-        _wiki_cache[cache_key] = (info, cached_at or datetime.now())
-        log.debug("Returning cached species info (db)", species=species_name)
-        return info
-
-    return None
-
 
 async def _save_species_info(species_name: str, taxa_id: int | None, language: str, info: SpeciesInfo) -> None:
     cached_at = datetime.now()
@@ -1309,10 +1286,6 @@ async def clear_species_cache(
     species_name: str, _auth: AuthContext = Depends(require_owner)
 ) -> SpeciesCacheClearResponse:
     """Clear the Wikipedia cache for a species."""
-    cache_prefix = f"{species_name}:"
-    for cache_key in list(_wiki_cache):
-        if cache_key == species_name or cache_key.startswith(cache_prefix):
-            del _wiki_cache[cache_key]
     taxa_id = await _lookup_taxa_id(species_name)
     async with get_db() as db:
         await SpeciesRepository(db).clear_cached_info(species_name, taxa_id)
@@ -1349,10 +1322,26 @@ async def get_species_info(
         )
 
     taxa_id = await _lookup_taxa_id(species_name, language=lang)
-    cached_info = await _get_cached_species_info(species_name, taxa_id, lang, refresh)
+    cache_key = f"{species_name}:{lang}"
+    cached_info = None if refresh else await _get_cached_species_info(species_name, taxa_id, lang)
     if cached_info:
-        return cached_info
+        if _is_cache_valid(cached_info, cached_info.cached_at):
+            log.debug("Returning cached species info", species=species_name)
+            return cached_info
+        if cached_info.thumbnail_url or cached_info.extract:
+            # Stale but usable: render from local data and refresh from upstream in the background.
+            reference_cache.refresh_in_background(
+                "species_info", cache_key, lambda: _fetch_species_info(species_name, taxa_id, lang)
+            )
+            return cached_info
+
+    return await reference_cache.coalesce(
+        "species_info", cache_key, lambda: _fetch_species_info(species_name, taxa_id, lang)
+    )
+
 
+async def _fetch_species_info(species_name: str, taxa_id: int | None, lang: str) -> SpeciesInfo:
+    """Build species info from the configured summary providers and store it."""
     summary_sources = _resolve_summary_sources()
     primary = summary_sources[0]
 
@@ -1474,7 +1463,6 @@ async def get_species_info(
 
     # Cache the result
     await _save_species_info(species_name, taxa_id, lang, info)
-    _wiki_cache[f"{species_name}:{lang}"] = (info, info.cached_at or datetime.now())
 
     is_success = bool(info.thumbnail_url or info.extract)
     log.info(
@@ -642,11 +642,12 @@ async def get_detection_timeline_span(
                 )
 
         points_by_key = {point.bucket_start: point for point in points}
-        hourly_counts = await repo.get_timebucket_counts_hourly(window_start, window_end)
+        # One row per UTC hour from the activity cube; shifted into local buckets here.
         hourly_metrics = await repo.get_timebucket_metrics(window_start, window_end, "hour")
         metric_rollups: dict[str, dict[str, float | int]] = {}
 
-        for bucket_key, count in hourly_counts.items():
+        for bucket_key, metrics in hourly_metrics.items():
+            count = int(metrics.get("count") or 0)
             utc_bucket = _parse_utc_bucket_key(bucket_key)
             local_key, _label = _localized_bucket_key_and_label(
                 utc_bucket,
@@ -657,16 +658,14 @@ async def get_detection_timeline_span(
             point = points_by_key.get(local_key)
             if not point:
                 continue
-            point.count += int(count)
+            point.count += count
 
-            metrics = hourly_metrics.get(bucket_key, {})
             rollup = metric_rollups.setdefault(local_key, {"unique_species": 0, "confidence_sum": 0.0, "weight": 0})
             rollup["unique_species"] = max(int(rollup["unique_species"]), int(metrics.get("unique_species") or 0))
             avg_confidence = metrics.get("avg_confidence")
-            weight = int(metrics.get("count") or count or 0)
-            if avg_confidence is not None and weight > 0:
-                rollup["confidence_sum"] = float(rollup["confidence_sum"]) + (float(avg_confidence) * weight)
-                rollup["weight"] = int(rollup["weight"]) + weight
+            if avg_confidence is not None and count > 0:
+                rollup["confidence_sum"] = float(rollup["confidence_sum"]) + (float(avg_confidence) * count)
+                rollup["weight"] = int(rollup["weight"]) + count
 
         for point in points:
             metrics = metric_rollups.get(point.bucket_start, {})
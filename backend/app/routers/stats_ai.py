@@ -34,6 +34,14 @@ class AIUsageDaily(BaseModel):
     estimated_cost_usd: float = 0.0
 
 
+class AIUsageJobStats(BaseModel):
+    jobs: int = 0
+    avg_tokens_per_job: float = 0.0
+    avg_queue_ms: float = 0.0
+    avg_duration_ms: float = 0.0
+    jobs_per_hour: float = 0.0
+
+
 class AIUsageResponse(BaseModel):
     span: str
     from_date: str
@@ -46,6 +54,7 @@ class AIUsageResponse(BaseModel):
     pricing_configured: bool = False
     breakdown: List[AIUsageBreakdown]
     daily: List[AIUsageDaily]
+    jobs: AIUsageJobStats = AIUsageJobStats()
 
 
 class AIUsageClearResponse(BaseModel):
@@ -144,6 +153,7 @@ async def get_ai_usage(
         pricing_configured=pricing_configured,
         breakdown=enriched_breakdown,
         daily=daily_stats,
+        jobs=AIUsageJobStats(**raw_summary["jobs"]),
     )
 
 
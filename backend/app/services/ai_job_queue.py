@@ -0,0 +1,366 @@
+"""Rate-aware queue in front of the configured AI provider.
+
+Every provider call (event analyses, leaderboard charts, conversations and
+batch jobs) runs as a job on its provider's lane. A lane caps concurrent
+requests and meters them through a token bucket. A 429/503 that names a
+Retry-After pauses the whole lane for that long, so the callers behind it wait
+instead of hitting the same limit. Interactive callers that would wait longer
+than ``AI_QUEUE_INTERACTIVE_MAX_WAIT_SECONDS`` for a slot or a token get a 429
+with Retry-After instead. Batch jobs wait and retry retryable failures up to
+``AI_QUEUE_MAX_ATTEMPTS`` times.
+
+Each job runs with ``current_ai_job`` set, so the usage rows it records carry
+its id, queue wait and duration.
+"""
+
+import asyncio
+import math
+import os
+import time
+import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+import structlog
+
+from app.config import settings
+from app.services.ai_service import AIAnalysisError, AIJobContext, current_ai_job
+from app.utils.tasks import create_background_task
+
+log = structlog.get_logger()
+
+AI_QUEUE_PROVIDER_CONCURRENCY = max(1, int(os.environ.get("AI_QUEUE_PROVIDER_CONCURRENCY", "2")))
+AI_QUEUE_REQUESTS_PER_MINUTE = max(1, int(os.environ.get("AI_QUEUE_REQUESTS_PER_MINUTE", "30")))
+AI_QUEUE_BURST = max(1, int(os.environ.get("AI_QUEUE_BURST", "5")))
+AI_QUEUE_MAX_ATTEMPTS = max(1, int(os.environ.get("AI_QUEUE_MAX_ATTEMPTS", "3")))
+AI_QUEUE_INTERACTIVE_MAX_WAIT_SECONDS = max(0.0, float(os.environ.get("AI_QUEUE_INTERACTIVE_MAX_WAIT_SECONDS", "30")))
+# Batch events whose frames are loaded while earlier ones wait for the provider.
+AI_QUEUE_BATCH_CONCURRENCY = max(1, int(os.environ.get("AI_QUEUE_BATCH_CONCURRENCY", "4")))
+# Lane pause after a 429/503 that did not say how long to back off.
+AI_QUEUE_DEFAULT_BACKOFF_SECONDS = 30
+AI_QUEUE_HISTORY = 200
+
+AIResult = Optional[str]
+
+
+class TokenBucket:
+    """Request budget for one provider: ``burst`` requests up front, refilled at ``rate_per_minute``."""
+
+    def __init__(self, rate_per_minute: int, burst: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.clock = clock
+        self.updated = clock()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        now = self.clock()
+        self._refill(now)
+        self.tokens -= 1
+        debt = max(0.0, -self.tokens / self.rate)
+        return max(debt, self.paused_until - now)
+
+    def refund(self) -> None:
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out requests for ``seconds`` (the provider's Retry-After)."""
+        now = self.clock()
+        self._refill(now)
+        self.paused_until = max(self.paused_until, now + seconds)
+        self.tokens = min(self.tokens, 0.0)
+
+    def paused_for(self) -> float:
+        return max(0.0, self.paused_until - self.clock())
+
+
+@dataclass
+class _Lane:
+    semaphore: asyncio.Semaphore
+    bucket: TokenBucket
+    loop: asyncio.AbstractEventLoop
+    active: int = 0
+    waiting: int = 0
+
+
+@dataclass
+class AIJob:
+    job_id: str
+    provider: str
+    feature: str
+    event_id: str | None = None
+    batch_id: str | None = None
+    status: str = "queued"
+    attempts: int = 0
+    queue_ms: int = 0
+    duration_ms: int | None = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    error: str | None = None
+
+
+@dataclass
+class AIBatch:
+    batch_id: str
+    event_ids: list[str]
+    skipped: int = 0
+    completed: int = 0
+    failed: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: float | None = None
+
+    @property
+    def running(self) -> bool:
+        return self.finished_at is None
+
+
+class AIJobQueue:
+    """Per-provider concurrency and rate limits for AI provider calls."""
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = AI_QUEUE_PROVIDER_CONCURRENCY,
+        requests_per_minute: int = AI_QUEUE_REQUESTS_PER_MINUTE,
+        burst: int = AI_QUEUE_BURST,
+    ) -> None:
+        self.concurrency = concurrency
+        self.requests_per_minute = requests_per_minute
+        self.burst = burst
+        self._lanes: dict[str, _Lane] = {}
+        self._jobs: deque[AIJob] = deque(maxlen=AI_QUEUE_HISTORY)
+        self._batches: dict[str, AIBatch] = {}
+        self._batch_tasks: dict[str, asyncio.Task] = {}
+
+    def _lane(self, provider: str) -> _Lane:
+        loop = asyncio.get_running_loop()
+        lane = self._lanes.get(provider)
+        # Semaphores are bound to the loop they first block on.
+        if lane is None or lane.loop is not loop:
+            lane = self._lanes[provider] = _Lane(
+                semaphore=asyncio.Semaphore(self.concurrency),
+                bucket=TokenBucket(self.requests_per_minute, self.burst),
+                loop=loop,
+            )
+        return lane
+
+    async def run(
+        self,
+        feature: str,
+        call: Callable[[], Awaitable[AIResult]],
+        *,
+        event_id: str | None = None,
+        batch_id: str | None = None,
+    ) -> AIResult:
+        """Run one provider call as a queued job and return its result.
+
+        Jobs without a ``batch_id`` are interactive: they never wait longer than
+        ``AI_QUEUE_INTERACTIVE_MAX_WAIT_SECONDS`` and are not retried.
+        """
+        provider = str(settings.llm.provider or "unknown").lower()
+        job = AIJob(job_id=uuid.uuid4().hex, provider=provider, feature=feature, event_id=event_id, batch_id=batch_id)
+        self._jobs.append(job)
+        lane = self._lane(provider)
+        max_attempts = 1 if batch_id is None else AI_QUEUE_MAX_ATTEMPTS
+        queued_at = time.monotonic()
+        result: AIResult = None
+        while job.attempts < max_attempts:
+            job.attempts += 1
+            result = await self._attempt(job, lane, call, queued_at, interactive=batch_id is None)
+            if not isinstance(result, AIAnalysisError):
+                job.status = "succeeded"
+                return result
+            job.error = str(result)
+            if not result.retryable:
+                break
+        job.status = "failed"
+        return result
+
+    async def _attempt(
+        self,
+        job: AIJob,
+        lane: _Lane,
+        call: Callable[[], Awaitable[AIResult]],
+        queued_at: float,
+        *,
+        interactive: bool,
+    ) -> AIResult:
+        if interactive:
+            paused_for = lane.bucket.paused_for()
+            if time.monotonic() - queued_at + paused_for > AI_QUEUE_INTERACTIVE_MAX_WAIT_SECONDS:
+                return self._busy_error(paused_for)
+        lane.waiting += 1
+        started = False
+        acquired = False
+        try:
+            if interactive:
+                # Batch jobs can hold every slot for a long time; bound the wait
+                # for one here too, not just the token-bucket delay after it.
+                remaining_wait = AI_QUEUE_INTERACTIVE_MAX_WAIT_SECONDS - (time.monotonic() - queued_at)
+                try:
+                    await asyncio.wait_for(lane.semaphore.acquire(), timeout=max(0.0, remaining_wait))
+                except asyncio.TimeoutError:
+                    return self._busy_error(max(lane.bucket.paused_for(), AI_QUEUE_INTERACTIVE_MAX_WAIT_SECONDS))
+            else:
+                await lane.semaphore.acquire()
+            acquired = True
+            wait = lane.bucket.reserve()
+            while wait > 0:
+                if interactive and time.monotonic() - queued_at + wait > AI_QUEUE_INTERACTIVE_MAX_WAIT_SECONDS:
+                    lane.bucket.refund()
+                    return self._busy_error(wait)
+                await asyncio.sleep(wait)
+                # A sibling may have hit a rate limit while this job slept.
+                wait = lane.bucket.paused_for()
+            lane.waiting -= 1
+            started = True
+            lane.active += 1
+            try:
+                result = await self._call(job, call, queued_at)
+            finally:
+                lane.active -= 1
+        finally:
+            if acquired:
+                lane.semaphore.release()
+            if not started:
+                lane.waiting -= 1
+
+        if isinstance(result, AIAnalysisError) and result.http_status_hint in (429, 503):
+            backoff = result.retry_after_seconds or AI_QUEUE_DEFAULT_BACKOFF_SECONDS
+            lane.bucket.pause(backoff)
+            log.warning(
+                "ai_queue_provider_throttled",
+                provider=job.provider,
+                status=result.http_status_hint,
+                pause_seconds=backoff,
+                job_id=job.job_id,
+            )
+        return result
+
+    async def _call(self, job: AIJob, call: Callable[[], Awaitable[AIResult]], queued_at: float) -> AIResult:
+        started_at = time.monotonic()
+        job.status = "running"
+        job.queue_ms = int((started_at - queued_at) * 1000)
+        context = AIJobContext(job_id=job.job_id, queue_ms=job.queue_ms, started_at=started_at)
+        token = current_ai_job.set(context)
+        try:
+            return await call()
+        except Exception:
+            job.status = "failed"
+            raise
+        finally:
+            current_ai_job.reset(token)
+            job.duration_ms = int((time.monotonic() - started_at) * 1000)
+            job.input_tokens += context.input_tokens
+            job.output_tokens += context.output_tokens
+
+    @staticmethod
+    def _busy_error(wait_seconds: float) -> AIAnalysisError:
+        return AIAnalysisError(
+            "The AI provider is rate-limited right now. Try again shortly.",
+            http_status_hint=429,
+            retryable=True,
+            retry_after_seconds=max(1, math.ceil(wait_seconds)),
+        )
+
+    def start_batch(self, event_ids: list[str], worker: Callable[[str, str], Awaitable[bool]]) -> AIBatch:
+        """Run ``worker(event_id, batch_id)`` for each event in the background.
+
+        Events already queued by a running batch are skipped. ``worker``
+        returns whether the event was analyzed.
+        """
+        in_flight = {event_id for batch in self._batches.values() if batch.running for event_id in batch.event_ids}
+        unique = [event_id for event_id in dict.fromkeys(event_ids) if event_id not in in_flight]
+        batch = AIBatch(batch_id=uuid.uuid4().hex, event_ids=unique, skipped=len(event_ids) - len(unique))
+        self._batches[batch.batch_id] = batch
+        self._prune_batches()
+        self._batch_tasks[batch.batch_id] = create_background_task(
+            self._run_batch(batch, worker), name=f"ai_batch:{batch.batch_id}"
+        )
+        return batch
+
+    async def _run_batch(self, batch: AIBatch, worker: Callable[[str, str], Awaitable[bool]]) -> None:
+        prefetch = asyncio.Semaphore(AI_QUEUE_BATCH_CONCURRENCY)
+
+        async def one(event_id: str) -> None:
+            async with prefetch:
+                try:
+                    analyzed = await worker(event_id, batch.batch_id)
+                except Exception as exc:
+                    log.warning("ai_batch_event_failed", batch_id=batch.batch_id, event_id=event_id, error=str(exc))
+                    analyzed = False
+            if analyzed:
+                batch.completed += 1
+            else:
+                batch.failed += 1
+
+        try:
+            await asyncio.gather(*(one(event_id) for event_id in batch.event_ids))
+        finally:
+            batch.finished_at = time.monotonic()
+            self._batch_tasks.pop(batch.batch_id, None)
+            log.info(
+                "ai_batch_finished",
+                batch_id=batch.batch_id,
+                completed=batch.completed,
+                failed=batch.failed,
+                seconds=round(batch.finished_at - batch.started_at, 1),
+            )
+
+    def _prune_batches(self) -> None:
+        finished = [batch_id for batch_id, batch in self._batches.items() if not batch.running]
+        for batch_id in finished[: max(0, len(self._batches) - 20)]:
+            del self._batches[batch_id]
+
+    async def wait_for_batch(self, batch_id: str) -> None:
+        task = self._batch_tasks.get(batch_id)
+        if task is not None:
+            await asyncio.shield(task)
+
+    def status(self) -> dict:
+        now = time.monotonic()
+        return {
+            "lanes": [
+                {
+                    "provider": provider,
+                    "active": lane.active,
+                    "waiting": lane.waiting,
+                    "paused_for_seconds": round(lane.bucket.paused_for(), 1),
+                }
+                for provider, lane in self._lanes.items()
+            ],
+            "batches": [
+                {
+                    "batch_id": batch.batch_id,
+                    "total": len(batch.event_ids),
+                    "completed": batch.completed,
+                    "failed": batch.failed,
+                    "skipped": batch.skipped,
+                    "running": batch.running,
+                    "elapsed_seconds": round((batch.finished_at or now) - batch.started_at, 1),
+                }
+                for batch in self._batches.values()
+            ],
+            "recent_jobs": [asdict(job) for job in list(self._jobs)[-20:]],
+        }
+
+    def reset(self) -> None:
+        """Forget lanes, jobs and batches (tests and settings changes)."""
+        for task in self._batch_tasks.values():
+            task.cancel()
+        self._lanes.clear()
+        self._jobs.clear()
+        self._batches.clear()
+        self._batch_tasks.clear()
+
+
+ai_job_queue = AIJobQueue()
@@ -1,20 +1,39 @@
+import asyncio
 import httpx
 import structlog
 import base64
+import os
+import string
+import tempfile
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Literal, Optional
-import tempfile
-import cv2
-import numpy as np
 from app.config import settings
 
 from app.database import get_db
 from app.repositories.ai_usage_repository import AIUsageRepository
 from app.utils.tasks import create_background_task
+from app.utils.lazy_imports import lazy_module
+
+cv2 = lazy_module("cv2")
+np = lazy_module("numpy")
 
 log = structlog.get_logger()
 
+# Provider API roots; overridable so a local fake provider can stand in for the real one.
+AI_PROVIDER_BASE_URLS = {
+    "gemini": os.environ.get("LLM_GEMINI_BASE_URL", "https://generativelanguage.googleapis.com"),
+    "openai": os.environ.get("LLM_OPENAI_BASE_URL", "https://api.openai.com"),
+    "claude": os.environ.get("LLM_CLAUDE_BASE_URL", "https://api.anthropic.com"),
+    "openrouter": os.environ.get("LLM_OPENROUTER_BASE_URL", "https://openrouter.ai/api"),
+}
+AI_PROVIDER_TIMEOUT_SECONDS = 30.0
+# Extracted clip frames kept for re-analysis and batch jobs; 0 disables the cache.
+AI_FRAME_CACHE_MAX_BYTES = max(0, int(os.environ.get("AI_FRAME_CACHE_MAX_BYTES", str(64 * 1024 * 1024))))
+
 
 AIConnectionFailureStage = Literal["configuration", "provider", "vision", "multi_frame", "response"]
 
@@ -51,28 +70,168 @@ class AIAnalysisError(str):
         return value
 
 
+class PromptText(str):
+    """Rendered prompt that remembers the leading part which is identical across requests.
+
+    Providers that support prompt caching get ``stable_prefix`` as its own
+    content block marked cacheable; everyone else sees the plain string.
+    """
+
+    stable_prefix: str
+
+    def __new__(cls, text: str, *, stable_prefix: str = "") -> "PromptText":
+        value = super().__new__(cls, text)
+        value.stable_prefix = stable_prefix if text.startswith(stable_prefix) else ""
+        return value
+
+    @property
+    def variable_suffix(self) -> str:
+        return self[len(self.stable_prefix) :]
+
+
+@dataclass
+class AIJobContext:
+    """The queued AI job a provider call is running for; usage rows are tagged with it."""
+
+    job_id: str
+    queue_ms: int
+    started_at: float
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+current_ai_job: ContextVar[AIJobContext | None] = ContextVar("current_ai_job", default=None)
+
+
+class _SafeDict(dict):
+    def __missing__(self, key: str) -> str:
+        return f"{{{key}}}"
+
+
+class ExtractedFrameCache:
+    """Byte-bounded LRU of JPEG frames extracted from an event's clip."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str, int], list[bytes]] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, event_id: str, source: str, frame_count: int) -> list[bytes] | None:
+        key = (event_id, source, frame_count)
+        frames = self._entries.get(key)
+        if frames is not None:
+            self._entries.move_to_end(key)
+        return frames
+
+    def put(self, event_id: str, source: str, frame_count: int, frames: list[bytes]) -> None:
+        size = sum(len(frame) for frame in frames)
+        if not frames or size > self.max_bytes:
+            return
+        key = (event_id, source, frame_count)
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= sum(len(frame) for frame in previous)
+        self._entries[key] = frames
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _key, evicted = self._entries.popitem(last=False)
+            self._bytes -= sum(len(frame) for frame in evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+
 class AIService:
     """Service to interact with LLMs for behavioral analysis."""
 
+    def __init__(self) -> None:
+        self._clients: dict[str, tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+        self.frame_cache = ExtractedFrameCache(AI_FRAME_CACHE_MAX_BYTES)
+
+    def _client(self, provider: str) -> httpx.AsyncClient:
+        """One pooled client per provider, so analyses reuse connections instead of reconnecting."""
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(provider)
+        # Pooled connections are bound to the loop that opened them.
+        if entry is None or entry[1] is not loop:
+            entry = self._clients[provider] = (httpx.AsyncClient(timeout=AI_PROVIDER_TIMEOUT_SECONDS), loop)
+        return entry[0]
+
+    async def close(self) -> None:
+        """Close the pooled provider clients opened on the running loop."""
+        entries, self._clients = list(self._clients.values()), {}
+        loop = asyncio.get_running_loop()
+        for client, client_loop in entries:
+            if client_loop is loop:
+                await client.aclose()
+
     async def _record_usage(self, provider: str, model: str, feature: str, input_tokens: int, output_tokens: int):
         """Record usage to database asynchronously via background task."""
+        job = current_ai_job.get()
+        job_id = queue_ms = duration_ms = None
+        if job is not None:
+            job.input_tokens += input_tokens
+            job.output_tokens += output_tokens
+            job_id, queue_ms = job.job_id, job.queue_ms
+            duration_ms = int((time.monotonic() - job.started_at) * 1000)
 
         async def _save():
             try:
                 async with get_db() as db:
                     repo = AIUsageRepository(db)
-                    await repo.record_usage(provider, model, feature, input_tokens, output_tokens)
+                    await repo.record_usage(
+                        provider,
+                        model,
+                        feature,
+                        input_tokens,
+                        output_tokens,
+                        job_id=job_id,
+                        queue_ms=queue_ms,
+                        duration_ms=duration_ms,
+                    )
             except Exception as e:
                 log.error("Failed to record AI usage in background", error=str(e))
 
         create_background_task(_save(), name=f"ai_usage_log:{provider}")
 
-    def _render_prompt(self, template: str, context: dict) -> str:
-        class _SafeDict(dict):
-            def __missing__(self, key: str) -> str:
-                return f"{{{key}}}"
+    def _render_prompt(self, template: str, context: dict, volatile: frozenset[str] = frozenset()) -> PromptText:
+        """Render ``template``; the text before the first ``volatile`` placeholder is the stable prefix."""
+        rendered = template.format_map(_SafeDict(context))
+        if not isinstance(template, str) or not volatile:
+            return PromptText(str(rendered))
+        pieces: list[str] = []
+        for literal, field, spec, conversion in string.Formatter().parse(template):
+            pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+            if field is None:
+                continue
+            if field in volatile:
+                break
+            pieces.append("{" + field + (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "") + "}")
+        return PromptText(rendered, stable_prefix="".join(pieces).format_map(_SafeDict(context)))
 
-        return template.format_map(_SafeDict(context))
+    @staticmethod
+    def _cacheable_text_parts(prompt: str, cache_control: bool) -> list[dict]:
+        """Text content blocks with the stable prompt prefix split out and marked for provider caching."""
+        prefix = getattr(prompt, "stable_prefix", "")
+        if not cache_control or not prefix.strip():
+            return [{"type": "text", "text": str(prompt)}]
+        return [
+            {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": prompt.variable_suffix},
+        ]
+
+    def _provider_failure(self, message: str, exc: Exception) -> AIAnalysisError:
+        """Mark a provider failure with the status hint and Retry-After the queue throttles on."""
+        response = exc.response if isinstance(exc, httpx.HTTPStatusError) else None
+        status = response.status_code if response is not None else None
+        hint = status if status in (429, 503) else (400 if status is not None and 400 <= status < 500 else 502)
+        return AIAnalysisError(
+            message,
+            http_status_hint=hint,
+            retryable=status is None or status in (408, 429, 500, 502, 503, 504),
+            retry_after_seconds=self._retry_after_seconds(response),
+        )
 
     # Five repeated 1280x720 JPEGs mirror the default production frame count, dimensions, media
     # type, and approximate payload size. The deterministic frame is generated lazily so a large
@@ -191,7 +350,7 @@ class AIService:
 
         try:
             if provider == "gemini":
-                url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
+                url = f"{AI_PROVIDER_BASE_URLS['gemini']}/v1beta/models/{model}:generateContent?key={api_key}"
                 payload = {
                     "contents": [
                         {
@@ -218,7 +377,7 @@ class AIService:
                 return AIConnectionTestResult(False, "AI returned an empty response.", 502, "response", True)
 
             if provider == "openai":
-                url = "https://api.openai.com/v1/chat/completions"
+                url = f"{AI_PROVIDER_BASE_URLS['openai']}/v1/chat/completions"
                 headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
                 vision_content = [
                     {"type": "text", "text": prompt},
@@ -239,7 +398,7 @@ class AIService:
                 return AIConnectionTestResult(False, "AI returned an empty response.", 502, "response", True)
 
             if provider == "claude":
-                url = "https://api.anthropic.com/v1/messages"
+                url = f"{AI_PROVIDER_BASE_URLS['claude']}/v1/messages"
                 headers = {"x-api-key": api_key, "anthropic-version": "2023-06-01", "Content-Type": "application/json"}
                 payload = {
                     "model": model,
@@ -273,7 +432,7 @@ class AIService:
                 return AIConnectionTestResult(False, "AI returned an empty response.", 502, "response", True)
 
             if provider == "openrouter":
-                url = "https://openrouter.ai/api/v1/chat/completions"
+                url = f"{AI_PROVIDER_BASE_URLS['openrouter']}/v1/chat/completions"
                 headers = {
                     "Authorization": f"Bearer {api_key}",
                     "Content-Type": "application/json",
@@ -397,7 +556,7 @@ class AIService:
         self, prompt: str, images: list[tuple[bytes, str]], feature: str = "analysis"
     ) -> Optional[str]:
         """Analyze using Google Gemini API."""
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{settings.llm.model}:generateContent?key={settings.llm.api_key}"
+        url = f"{AI_PROVIDER_BASE_URLS['gemini']}/v1beta/models/{settings.llm.model}:generateContent?key={settings.llm.api_key}"
 
         parts = [{"text": prompt}]
         for image_data, mime_type in images:
@@ -415,39 +574,39 @@ class AIService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(url, json=payload)
-                resp.raise_for_status()
-
-                data = resp.json()
-                # Extract text from response
-                candidates = data.get("candidates", [])
-                if candidates:
-                    # Log usage
-                    usage = data.get("usageMetadata", {})
-                    if usage:
-                        await self._record_usage(
-                            provider="gemini",
-                            model=settings.llm.model,
-                            feature=feature,
-                            input_tokens=usage.get("promptTokenCount", 0),
-                            output_tokens=usage.get("candidatesTokenCount", 0),
-                        )
-
-                    content = candidates[0].get("content", {})
-                    parts = content.get("parts", [])
-                    if parts:
-                        return parts[0].get("text")
-
-                log.warning("Gemini returned no candidates", response=resp.text)
-                return AIAnalysisError("AI returned an empty response.", retryable=True)
+            client = self._client("gemini")
+            resp = await client.post(url, json=payload)
+            resp.raise_for_status()
+
+            data = resp.json()
+            # Extract text from response
+            candidates = data.get("candidates", [])
+            if candidates:
+                # Log usage
+                usage = data.get("usageMetadata", {})
+                if usage:
+                    await self._record_usage(
+                        provider="gemini",
+                        model=settings.llm.model,
+                        feature=feature,
+                        input_tokens=usage.get("promptTokenCount", 0),
+                        output_tokens=usage.get("candidatesTokenCount", 0),
+                    )
+
+                content = candidates[0].get("content", {})
+                parts = content.get("parts", [])
+                if parts:
+                    return parts[0].get("text")
+
+            log.warning("Gemini returned no candidates", response=resp.text)
+            return AIAnalysisError("AI returned an empty response.", retryable=True)
         except Exception as e:
             safe_error = self._redact_secret(str(e), settings.llm.api_key)
             log.error("Gemini analysis failed", error=safe_error)
-            return f"Error during AI analysis: {safe_error}"
+            return self._provider_failure(f"Error during AI analysis: {safe_error}", e)
 
     async def _generate_gemini_text(self, prompt: str, feature: str = "chat") -> Optional[str]:
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{settings.llm.model}:generateContent?key={settings.llm.api_key}"
+        url = f"{AI_PROVIDER_BASE_URLS['gemini']}/v1beta/models/{settings.llm.model}:generateContent?key={settings.llm.api_key}"
         payload = {
             "contents": [{"parts": [{"text": prompt}]}],
             "generationConfig": {
@@ -458,39 +617,39 @@ class AIService:
             },
         }
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(url, json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-                candidates = data.get("candidates", [])
-                if candidates:
-                    # Log usage
-                    usage = data.get("usageMetadata", {})
-                    if usage:
-                        await self._record_usage(
-                            provider="gemini",
-                            model=settings.llm.model,
-                            feature=feature,
-                            input_tokens=usage.get("promptTokenCount", 0),
-                            output_tokens=usage.get("candidatesTokenCount", 0),
-                        )
-
-                    content = candidates[0].get("content", {})
-                    parts = content.get("parts", [])
-                    if parts:
-                        return parts[0].get("text")
-                log.warning("Gemini returned no candidates", response=resp.text)
-                return "AI returned an empty response."
+            client = self._client("gemini")
+            resp = await client.post(url, json=payload)
+            resp.raise_for_status()
+            data = resp.json()
+            candidates = data.get("candidates", [])
+            if candidates:
+                # Log usage
+                usage = data.get("usageMetadata", {})
+                if usage:
+                    await self._record_usage(
+                        provider="gemini",
+                        model=settings.llm.model,
+                        feature=feature,
+                        input_tokens=usage.get("promptTokenCount", 0),
+                        output_tokens=usage.get("candidatesTokenCount", 0),
+                    )
+
+                content = candidates[0].get("content", {})
+                parts = content.get("parts", [])
+                if parts:
+                    return parts[0].get("text")
+            log.warning("Gemini returned no candidates", response=resp.text)
+            return "AI returned an empty response."
         except Exception as e:
             safe_error = self._redact_secret(str(e), settings.llm.api_key)
             log.error("Gemini text generation failed", error=safe_error)
-            return f"Error during AI analysis: {safe_error}"
+            return self._provider_failure(f"Error during AI analysis: {safe_error}", e)
 
     async def _analyze_openai_prompt(
         self, prompt: str, images: list[tuple[bytes, str]], feature: str = "analysis"
     ) -> Optional[str]:
         """Analyze using OpenAI API (GPT-4o)."""
-        url = "https://api.openai.com/v1/chat/completions"
+        url = f"{AI_PROVIDER_BASE_URLS['openai']}/v1/chat/completions"
 
         content = [{"type": "text", "text": prompt}]
         for image_data, mime_type in images:
@@ -499,76 +658,83 @@ class AIService:
 
         headers = {"Authorization": f"Bearer {settings.llm.api_key}", "Content-Type": "application/json"}
 
-        payload = {"model": settings.llm.model, "messages": [{"role": "user", "content": content}], "max_tokens": 500}
+        payload = {
+            "model": settings.llm.model,
+            "messages": [{"role": "user", "content": content}],
+            "max_tokens": 500,
+            # Routes requests sharing the prompt prefix to the same cache shard.
+            "prompt_cache_key": f"ya-wamf:{feature}",
+        }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(url, headers=headers, json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-
-                # Log usage
-                usage = data.get("usage", {})
-                if usage:
-                    await self._record_usage(
-                        provider="openai",
-                        model=settings.llm.model,
-                        feature=feature,
-                        input_tokens=usage.get("prompt_tokens", 0),
-                        output_tokens=usage.get("completion_tokens", 0),
-                    )
-
-                choices = data.get("choices", [])
-                if choices:
-                    return choices[0].get("message", {}).get("content")
-
-                return AIAnalysisError("AI returned an empty response.", retryable=True)
+            client = self._client("openai")
+            resp = await client.post(url, headers=headers, json=payload)
+            resp.raise_for_status()
+            data = resp.json()
+
+            # Log usage
+            usage = data.get("usage", {})
+            if usage:
+                await self._record_usage(
+                    provider="openai",
+                    model=settings.llm.model,
+                    feature=feature,
+                    input_tokens=usage.get("prompt_tokens", 0),
+                    output_tokens=usage.get("completion_tokens", 0),
+                )
+
+            choices = data.get("choices", [])
+            if choices:
+                return choices[0].get("message", {}).get("content")
+
+            return AIAnalysisError("AI returned an empty response.", retryable=True)
         except Exception as e:
             log.error("OpenAI analysis failed", error=str(e))
-            return f"Error during AI analysis: {str(e)}"
+            return self._provider_failure(f"Error during AI analysis: {str(e)}", e)
 
     async def _generate_openai_text(self, prompt: str, feature: str = "chat") -> Optional[str]:
-        url = "https://api.openai.com/v1/chat/completions"
+        url = f"{AI_PROVIDER_BASE_URLS['openai']}/v1/chat/completions"
         headers = {"Authorization": f"Bearer {settings.llm.api_key}", "Content-Type": "application/json"}
         payload = {"model": settings.llm.model, "messages": [{"role": "user", "content": prompt}], "max_tokens": 500}
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(url, headers=headers, json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-
-                # Log usage
-                usage = data.get("usage", {})
-                if usage:
-                    await self._record_usage(
-                        provider="openai",
-                        model=settings.llm.model,
-                        feature=feature,
-                        input_tokens=usage.get("prompt_tokens", 0),
-                        output_tokens=usage.get("completion_tokens", 0),
-                    )
-
-                choices = data.get("choices", [])
-                if choices:
-                    return choices[0].get("message", {}).get("content")
-                return "AI returned an empty response."
+            client = self._client("openai")
+            resp = await client.post(url, headers=headers, json=payload)
+            resp.raise_for_status()
+            data = resp.json()
+
+            # Log usage
+            usage = data.get("usage", {})
+            if usage:
+                await self._record_usage(
+                    provider="openai",
+                    model=settings.llm.model,
+                    feature=feature,
+                    input_tokens=usage.get("prompt_tokens", 0),
+                    output_tokens=usage.get("completion_tokens", 0),
+                )
+
+            choices = data.get("choices", [])
+            if choices:
+                return choices[0].get("message", {}).get("content")
+            return "AI returned an empty response."
         except Exception as e:
             log.error("OpenAI text generation failed", error=str(e))
-            return f"Error during AI analysis: {str(e)}"
+            return self._provider_failure(f"Error during AI analysis: {str(e)}", e)
 
     async def _analyze_claude_prompt(
         self, prompt: str, images: list[tuple[bytes, str]], feature: str = "analysis"
     ) -> Optional[str]:
         """Analyze using Anthropic Claude API."""
-        url = "https://api.anthropic.com/v1/messages"
+        url = f"{AI_PROVIDER_BASE_URLS['claude']}/v1/messages"
 
-        content = []
+        text_parts = self._cacheable_text_parts(prompt, cache_control=True)
+        content = text_parts[:-1]
         for image_data, mime_type in images:
             image_base64 = base64.b64encode(image_data).decode("utf-8")
             content.append(
                 {"type": "image", "source": {"type": "base64", "media_type": mime_type, "data": image_base64}}
             )
-        content.append({"type": "text", "text": prompt})
+        content.append(text_parts[-1])
 
         headers = {
             "x-api-key": settings.llm.api_key,
@@ -579,33 +745,33 @@ class AIService:
         payload = {"model": settings.llm.model, "max_tokens": 1024, "messages": [{"role": "user", "content": content}]}
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(url, headers=headers, json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-
-                # Log usage
-                usage = data.get("usage", {})
-                if usage:
-                    await self._record_usage(
-                        provider="claude",
-                        model=settings.llm.model,
-                        feature=feature,
-                        input_tokens=usage.get("input_tokens", 0),
-                        output_tokens=usage.get("output_tokens", 0),
-                    )
-
-                content = data.get("content", [])
-                if content and len(content) > 0:
-                    return content[0].get("text")
-
-                return "AI returned an empty response."
+            client = self._client("claude")
+            resp = await client.post(url, headers=headers, json=payload)
+            resp.raise_for_status()
+            data = resp.json()
+
+            # Log usage
+            usage = data.get("usage", {})
+            if usage:
+                await self._record_usage(
+                    provider="claude",
+                    model=settings.llm.model,
+                    feature=feature,
+                    input_tokens=usage.get("input_tokens", 0),
+                    output_tokens=usage.get("output_tokens", 0),
+                )
+
+            content = data.get("content", [])
+            if content and len(content) > 0:
+                return content[0].get("text")
+
+            return "AI returned an empty response."
         except Exception as e:
             log.error("Claude analysis failed", error=str(e))
-            return f"Error during AI analysis: {str(e)}"
+            return self._provider_failure(f"Error during AI analysis: {str(e)}", e)
 
     async def _generate_claude_text(self, prompt: str, feature: str = "chat") -> Optional[str]:
-        url = "https://api.anthropic.com/v1/messages"
+        url = f"{AI_PROVIDER_BASE_URLS['claude']}/v1/messages"
         headers = {
             "x-api-key": settings.llm.api_key,
             "anthropic-version": "2023-06-01",
@@ -614,43 +780,45 @@ class AIService:
         payload = {
             "model": settings.llm.model,
             "max_tokens": 1024,
-            "messages": [{"role": "user", "content": [{"type": "text", "text": prompt}]}],
+            "messages": [{"role": "user", "content": self._cacheable_text_parts(prompt, cache_control=True)}],
         }
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(url, headers=headers, json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-
-                # Log usage
-                usage = data.get("usage", {})
-                if usage:
-                    await self._record_usage(
-                        provider="claude",
-                        model=settings.llm.model,
-                        feature=feature,
-                        input_tokens=usage.get("input_tokens", 0),
-                        output_tokens=usage.get("output_tokens", 0),
-                    )
-
-                content = data.get("content", [])
-                if content and len(content) > 0:
-                    return content[0].get("text")
-                return "AI returned an empty response."
+            client = self._client("claude")
+            resp = await client.post(url, headers=headers, json=payload)
+            resp.raise_for_status()
+            data = resp.json()
+
+            # Log usage
+            usage = data.get("usage", {})
+            if usage:
+                await self._record_usage(
+                    provider="claude",
+                    model=settings.llm.model,
+                    feature=feature,
+                    input_tokens=usage.get("input_tokens", 0),
+                    output_tokens=usage.get("output_tokens", 0),
+                )
+
+            content = data.get("content", [])
+            if content and len(content) > 0:
+                return content[0].get("text")
+            return "AI returned an empty response."
         except Exception as e:
             log.error("Claude text generation failed", error=str(e))
-            return f"Error during AI analysis: {str(e)}"
+            return self._provider_failure(f"Error during AI analysis: {str(e)}", e)
 
     async def _analyze_openrouter_prompt(
         self, prompt: str, images: list[tuple[bytes, str]], feature: str = "analysis"
     ) -> Optional[str]:
         """Analyze using OpenRouter (OpenAI-compatible API with vision support)."""
-        url = "https://openrouter.ai/api/v1/chat/completions"
+        url = f"{AI_PROVIDER_BASE_URLS['openrouter']}/v1/chat/completions"
 
-        content = [{"type": "text", "text": prompt}]
+        text_parts = self._cacheable_text_parts(prompt, cache_control=True)
+        content = text_parts[:1]
         for image_data, mime_type in images:
             image_base64 = base64.b64encode(image_data).decode("utf-8")
             content.append({"type": "image_url", "image_url": {"url": f"data:{mime_type};base64,{image_base64}"}})
+        content.extend(text_parts[1:])
 
         headers = {
             "Authorization": f"Bearer {settings.llm.api_key}",
@@ -666,26 +834,26 @@ class AIService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(url, headers=headers, json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-
-                usage = data.get("usage", {})
-                if usage:
-                    await self._record_usage(
-                        provider="openrouter",
-                        model=settings.llm.model,
-                        feature=feature,
-                        input_tokens=usage.get("prompt_tokens", 0),
-                        output_tokens=usage.get("completion_tokens", 0),
-                    )
-
-                choices = data.get("choices", [])
-                if choices:
-                    return choices[0].get("message", {}).get("content")
-
-                return AIAnalysisError("AI returned an empty response.", retryable=True)
+            client = self._client("openrouter")
+            resp = await client.post(url, headers=headers, json=payload)
+            resp.raise_for_status()
+            data = resp.json()
+
+            usage = data.get("usage", {})
+            if usage:
+                await self._record_usage(
+                    provider="openrouter",
+                    model=settings.llm.model,
+                    feature=feature,
+                    input_tokens=usage.get("prompt_tokens", 0),
+                    output_tokens=usage.get("completion_tokens", 0),
+                )
+
+            choices = data.get("choices", [])
+            if choices:
+                return choices[0].get("message", {}).get("content")
+
+            return AIAnalysisError("AI returned an empty response.", retryable=True)
         except httpx.HTTPStatusError as e:
             try:
                 detail = e.response.json().get("error", {}).get("message") or e.response.text
@@ -711,7 +879,7 @@ class AIService:
 
     async def _generate_openrouter_text(self, prompt: str, feature: str = "chat") -> Optional[str]:
         """Generate text using OpenRouter (OpenAI-compatible API)."""
-        url = "https://openrouter.ai/api/v1/chat/completions"
+        url = f"{AI_PROVIDER_BASE_URLS['openrouter']}/v1/chat/completions"
         headers = {
             "Authorization": f"Bearer {settings.llm.api_key}",
             "Content-Type": "application/json",
@@ -724,25 +892,25 @@ class AIService:
             "max_tokens": 500,
         }
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(url, headers=headers, json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-
-                usage = data.get("usage", {})
-                if usage:
-                    await self._record_usage(
-                        provider="openrouter",
-                        model=settings.llm.model,
-                        feature=feature,
-                        input_tokens=usage.get("prompt_tokens", 0),
-                        output_tokens=usage.get("completion_tokens", 0),
-                    )
-
-                choices = data.get("choices", [])
-                if choices:
-                    return choices[0].get("message", {}).get("content")
-                return AIAnalysisError("AI returned an empty response.", retryable=True)
+            client = self._client("openrouter")
+            resp = await client.post(url, headers=headers, json=payload)
+            resp.raise_for_status()
+            data = resp.json()
+
+            usage = data.get("usage", {})
+            if usage:
+                await self._record_usage(
+                    provider="openrouter",
+                    model=settings.llm.model,
+                    feature=feature,
+                    input_tokens=usage.get("prompt_tokens", 0),
+                    output_tokens=usage.get("completion_tokens", 0),
+                )
+
+            choices = data.get("choices", [])
+            if choices:
+                return choices[0].get("message", {}).get("content")
+            return AIAnalysisError("AI returned an empty response.", retryable=True)
         except httpx.HTTPStatusError as e:
             try:
                 detail = e.response.json().get("error", {}).get("message") or e.response.text
@@ -766,6 +934,13 @@ class AIService:
             log.error("OpenRouter text generation failed", error=str(e))
             return AIAnalysisError(f"AI analysis failed: {str(e)}", retryable=True)
 
+    # Placeholders whose values change per request; prompt caching stops at the first one.
+    ANALYSIS_PROMPT_VOLATILE_FIELDS = frozenset({"frame_note", "species", "time", "weather_str"})
+    CONVERSATION_PROMPT_VOLATILE_FIELDS = frozenset({"history", "question"})
+    CHART_PROMPT_VOLATILE_FIELDS = frozenset(
+        {"timeframe", "total_count", "series", "weather_notes", "sun_notes", "notes"}
+    )
+
     def _build_prompt(self, species: str, metadata: dict, language: Optional[str] = None) -> str:
         """Construct the prompt for the LLM."""
         temp = metadata.get("temperature")
@@ -804,6 +979,7 @@ class AIService:
                 "weather_str": weather_str,
                 "language_note": language_note,
             },
+            volatile=self.ANALYSIS_PROMPT_VOLATILE_FIELDS,
         )
 
     def build_conversation_prompt(
@@ -828,6 +1004,7 @@ class AIService:
                 "question": question,
                 "language_note": language_note,
             },
+            volatile=self.CONVERSATION_PROMPT_VOLATILE_FIELDS,
         )
 
     def _build_chart_prompt(self, metadata: dict, language: Optional[str] = None) -> str:
@@ -855,6 +1032,7 @@ class AIService:
                 "language_note": language_note,
                 "notes": notes,
             },
+            volatile=self.CHART_PROMPT_VOLATILE_FIELDS,
         )
 
     def extract_frames_from_clip(
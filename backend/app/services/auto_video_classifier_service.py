@@ -10,19 +10,21 @@ import tempfile
 import structlog
 import time
 from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional, Dict, Literal, cast
+from typing import Awaitable, Optional, Dict, Literal, cast
 from io import BytesIO
-from PIL import Image
 
 from app.config import settings
 from app.services.frigate_client import frigate_client
 from app.services.high_quality_snapshot_service import high_quality_snapshot_service
 from app.services import classifier_service as classifier_service_module
 from app.services.broadcaster import broadcaster
+from app.services.classifier_supervisor import VideoPauseClock, current_video_pause_clock
 from app.services.media_cache import media_cache
 from app.services.video_classification_waiter import video_classification_waiter
 from app.services.error_diagnostics import error_diagnostics_history
+from app.services.event_track_index import EventTrackIndex, event_track_indexes
 from app.services.frigate_missing_policy import apply_missing_policy
 from app.services.maintenance_coordinator import maintenance_coordinator
 from app.services.classification_input_provenance import (
@@ -37,6 +39,9 @@ from app.utils.system_stats import get_ram_usage_string
 from app.utils.canonical_species import should_hide_species_label, user_facing_species_fields
 from app.utils.api_datetime import serialize_api_datetime, utc_naive_now  # noqa: F401 - compatibility for tests
 from app.utils.video_analysis import rank_video_top_frames
+from app.utils.lazy_imports import lazy_module
+
+Image = lazy_module("PIL.Image")
 
 log = structlog.get_logger()
 
@@ -59,6 +64,14 @@ MAINTENANCE_STATUS_DIAGNOSTIC_COOLDOWN_SECONDS = 60.0
 # maintenance coordinator slot it holds is released.
 _MAX_JOB_AGE_SECONDS = 600  # 10 minutes — any job exceeding this is stuck
 _HQ_SNAPSHOT_TIMEOUT_SECONDS = 120.0  # generous ceiling for post-classification HQ work
+# Jobs admitted beyond the inference limit. They fetch and validate their clip
+# while earlier jobs are still analyzing, then wait at the inference gate, so
+# Frigate polling and clip delays no longer hold an inference slot.
+VIDEO_CLASSIFIER_PREFETCH_DEPTH = max(0, int(os.getenv("VIDEO_CLASSIFIER_PREFETCH_DEPTH", "2")))
+_INFERENCE_GATE_RECHECK_SECONDS = 1.0
+# Upper bound on top-level boxes walked when probing a cached MP4 container.
+_MP4_PROBE_MAX_BOXES = 256
+PIPELINE_STAGES = ("fetch", "inference", "persist")
 
 # ---------------------------------------------------------------------------
 # Circuit-breaker failure classification
@@ -145,6 +158,67 @@ VideoClassificationWorkerError = classifier_service_module.VideoClassificationWo
 JobSource = Literal["live", "manual", "maintenance"]
 
 
+@dataclass(frozen=True)
+class CachedClip:
+    """A validated clip that already lives in the media cache.
+
+    Classification reads it through a hard-link pin (see ``media_cache.pin_clip``)
+    instead of copying it to a temp file.
+    """
+
+    path: Path
+
+
+ClipSource = bytes | CachedClip
+
+
+class _PipelineStage:
+    """Occupancy accounting for one stage of the per-event video pipeline."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.waiting = 0
+        self.completed = 0
+        self.job_seconds = 0.0
+        self._occupied_seconds = 0.0
+        self._occupied_since: float | None = None
+        self._window_started_at = time.monotonic()
+
+    def enter(self) -> float:
+        now = time.monotonic()
+        if self.active == 0:
+            self._occupied_since = now
+        self.active += 1
+        return now
+
+    def leave(self, entered_at: float) -> None:
+        now = time.monotonic()
+        self.active = max(0, self.active - 1)
+        self.completed += 1
+        self.job_seconds += max(0.0, now - entered_at)
+        if self.active == 0 and self._occupied_since is not None:
+            self._occupied_seconds += now - self._occupied_since
+            self._occupied_since = None
+
+    def snapshot(self) -> dict[str, object]:
+        now = time.monotonic()
+        occupied = self._occupied_seconds
+        if self._occupied_since is not None:
+            occupied += now - self._occupied_since
+        elapsed = max(1e-6, now - self._window_started_at)
+        return {
+            "active": self.active,
+            "backlog": self.waiting,
+            "completed": self.completed,
+            "busy_seconds": round(self.job_seconds, 3),
+            "utilization": round(min(1.0, occupied / elapsed), 4),
+        }
+
+
+def _empty_pipeline_stages() -> dict[str, _PipelineStage]:
+    return {name: _PipelineStage() for name in PIPELINE_STAGES}
+
+
 def _empty_breaker_state() -> dict[JobSource, dict[str, object]]:
     return {
         "live": {
@@ -186,8 +260,9 @@ class AutoVideoClassifierService:
         # `_classifier` is exposed as a property that re-resolves against the
         # singleton on every access — see issue #50. Tests that overwrite
         # `service._classifier = mock` use the property setter, which pins the
-        # mock for the lifetime of that test.
-        self._classifier_ref = get_classifier()
+        # mock for the lifetime of that test. The singleton is built on first
+        # access (during startup) rather than when this module is imported.
+        self._classifier_ref = None
         self._breaker_state = _empty_breaker_state()
         self._timeout_state = _empty_timeout_state()
         self._pending_queue: asyncio.Queue[tuple[str, str, bool, bool, JobSource]] = asyncio.Queue(
@@ -212,6 +287,11 @@ class AutoVideoClassifierService:
         # so stop()/reset_state() can cancel them and so we never schedule a
         # second concurrent retry for the same event_id.
         self._precheck_retry_tasks: Dict[str, asyncio.Task] = {}
+        # Per-event pipeline position: stage name and the monotonic time the
+        # event entered it. Inference admission is gated on the stage counts.
+        self._pipeline_stages = _empty_pipeline_stages()
+        self._event_stages: dict[str, tuple[str, float]] = {}
+        self._inference_slot_freed = asyncio.Event()
 
     @property
     def _classifier(self):  # type: ignore[override]
@@ -240,6 +320,9 @@ class AutoVideoClassifierService:
         # Belt-and-braces idempotency for stop/start cycles and tests.
         media_cache.unregister_recording_clip_listener(self._on_recording_clip_cached)
         media_cache.register_recording_clip_listener(self._on_recording_clip_cached)
+        # No job is running yet, so any pinned clip is left over from a previous run.
+        with contextlib.suppress(Exception):
+            await media_cache.clear_pinned_clips()
         self._processor_task = create_background_task(self._process_queue_loop(), name="video_classifier_queue")
         self._stale_task = create_background_task(self._stale_watchdog_loop(), name="video_classifier_stale_watchdog")
         recovered = await self._restore_unfinished_jobs()
@@ -407,7 +490,10 @@ class AutoVideoClassifierService:
                     await asyncio.sleep(1)
                     continue
 
-                if len(self._active_tasks) >= effective_max:
+                # Admit a few jobs beyond the inference limit so their clip fetch
+                # overlaps running inference; _acquire_inference_slot enforces
+                # effective_max for the analyzing stage itself.
+                if len(self._active_tasks) >= effective_max + VIDEO_CLASSIFIER_PREFETCH_DEPTH:
                     await asyncio.sleep(1)
                     continue
 
@@ -601,7 +687,12 @@ class AutoVideoClassifierService:
             if task.done():
                 continue
             metadata = self._active_metadata.get(event_id) or {}
-            started_at = metadata.get("started_at")
+            if metadata.get("phase") == "waiting_for_inference":
+                # Prefetched jobs parked on the inference gate are queued, not stuck.
+                continue
+            # Once a job holds an inference slot its clock restarts there, so time
+            # spent waiting behind other analyses never counts toward the limit.
+            started_at = metadata.get("inference_started_at", metadata.get("started_at"))
             if not isinstance(started_at, (int, float)):
                 continue
             job_age = now - float(started_at)
@@ -840,6 +931,7 @@ class AutoVideoClassifierService:
             "live_queued": throttle_state["live_queued"],
             "mqtt_in_flight": throttle_state["mqtt_in_flight"],
             "mqtt_in_flight_capacity": throttle_state["mqtt_capacity"],
+            "pipeline": self._pipeline_status(),
             **maintenance_summary,
         }
 
@@ -1280,6 +1372,87 @@ class AutoVideoClassifierService:
         if completed:
             log.debug("Cleaned up completed tasks", count=len(completed))
 
+    def _enter_pipeline_stage(self, event_id: str, stage: str) -> None:
+        self._leave_pipeline_stage(event_id)
+        self._event_stages[event_id] = (stage, self._pipeline_stages[stage].enter())
+
+    def _leave_pipeline_stage(self, event_id: str) -> None:
+        current = self._event_stages.pop(event_id, None)
+        if current is None:
+            return
+        stage, entered_at = current
+        self._pipeline_stages[stage].leave(entered_at)
+        if stage == "inference":
+            self._inference_slot_freed.set()
+
+    def _inference_limit(self) -> int:
+        configured = int(settings.classification.video_classification_max_concurrent or 1)
+        return max(1, int(self._get_mqtt_throttle_state(configured)["effective_max_concurrent"]))
+
+    async def _acquire_inference_slot(self, event_id: str) -> None:
+        """Wait until fewer than the effective concurrency limit are analyzing.
+
+        Prefetched jobs wait here with their clip ready instead of holding a
+        slot while Frigate finalizes the clip.
+        """
+        self._leave_pipeline_stage(event_id)
+        stage = self._pipeline_stages["inference"]
+        if stage.active and stage.active >= self._inference_limit():
+            stage.waiting += 1
+            self._note_job_progress(event_id, phase="waiting_for_inference")
+            try:
+                while stage.active and stage.active >= self._inference_limit():
+                    self._inference_slot_freed.clear()
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(
+                            self._inference_slot_freed.wait(),
+                            timeout=_INFERENCE_GATE_RECHECK_SECONDS,
+                        )
+            finally:
+                stage.waiting -= 1
+        self._enter_pipeline_stage(event_id, "inference")
+        metadata = self._active_metadata.get(event_id)
+        if isinstance(metadata, dict):
+            metadata["inference_started_at"] = time.monotonic()
+
+    @staticmethod
+    async def _await_video_classification(
+        coro: Awaitable[list[dict]],
+        *,
+        timeout: float,
+        pause_clock: VideoPauseClock,
+    ) -> list[dict]:
+        """Like ``asyncio.wait_for``, but the timeout is extended by preemption pauses.
+
+        Time the video worker spent paused for live inference is reported on
+        ``pause_clock`` and does not count against ``timeout``.
+        """
+        token = current_video_pause_clock.set(pause_clock)
+        try:
+            task = asyncio.ensure_future(coro)
+        finally:
+            current_video_pause_clock.reset(token)
+        started = time.monotonic()
+        try:
+            while True:
+                remaining = timeout + pause_clock.paused_seconds() - (time.monotonic() - started)
+                if remaining <= 0:
+                    raise asyncio.TimeoutError()
+                done, _pending = await asyncio.wait({task}, timeout=remaining)
+                if done:
+                    return task.result()
+        finally:
+            if not task.done():
+                # Cancelling aborts the supervised worker request, as wait_for would.
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await task
+
+    def _pipeline_status(self) -> dict[str, object]:
+        stages = {name: stage.snapshot() for name, stage in self._pipeline_stages.items()}
+        stages["fetch"]["backlog"] = self._pending_queue.qsize()
+        return {"prefetch_depth": VIDEO_CLASSIFIER_PREFETCH_DEPTH, "stages": stages}
+
     def _build_classification_input_context(
         self,
         *,
@@ -1288,6 +1461,7 @@ class AutoVideoClassifierService:
         is_cropped: bool,
         clip_variant: Literal["event", "recording"] = "event",
         clip_start_timestamp: float | None = None,
+        track_index: EventTrackIndex | None = None,
     ) -> dict[str, object]:
         context: dict[str, object] = {
             "is_cropped": bool(is_cropped),
@@ -1313,6 +1487,10 @@ class AutoVideoClassifierService:
                     path_data.append([list(point[:2]), item[1]])
             if path_data:
                 context["frigate_path_data"] = path_data
+        # The index recorded when the event ended keeps the full path and in-view
+        # flags, so the classifier can sample only frames showing the bird.
+        if track_index is not None:
+            context["frigate_track_index"] = track_index.to_dict()
         if clip_start_timestamp is not None:
             try:
                 normalized_clip_start = float(clip_start_timestamp)
@@ -1346,6 +1524,7 @@ class AutoVideoClassifierService:
             source=source,
         )
         tmp_path: str | None = None  # pre-declared so CancelledError handler is always safe
+        self._enter_pipeline_stage(frigate_event, "fetch")
         try:
 
             def snapshot_fallback_requested() -> bool:
@@ -1560,11 +1739,11 @@ class AutoVideoClassifierService:
                     return
 
             # 2. Prefer a cached recording/full-visit clip when available.
-            clip_bytes, clip_error, clip_variant, clip_start_timestamp = await self._load_preferred_clip(
+            clip, clip_error, clip_variant, clip_start_timestamp = await self._load_preferred_clip(
                 frigate_event,
                 skip_delay=skip_delay,
             )
-            if not clip_bytes:
+            if not clip:
                 if snapshot_fallback_requested():
                     log.info(
                         "Falling back to snapshot classification because video is unavailable",
@@ -1608,21 +1787,38 @@ class AutoVideoClassifierService:
                 )
                 return
 
-            # 3. Save to temp file for processing (write offloaded so large clips don't
-            # block the loop).  mkstemp reserves the path synchronously so tmp_path is
-            # always set before the first cancellation-risk await, avoiding a NameError
-            # in the CancelledError cleanup path if the task is cancelled mid-write.
-            _fd, tmp_path = tempfile.mkstemp(suffix=".mp4")
-            os.close(_fd)
-            try:
-                await asyncio.to_thread(Path(tmp_path).write_bytes, clip_bytes)
-            except BaseException:
-                with contextlib.suppress(OSError):
-                    await asyncio.to_thread(os.remove, tmp_path)
-                raise
+            # 3. Cached clips are pinned with a hard link (no copy) so cleanup cannot
+            # delete or replace them mid-decode; the pin is removed like a temp file.
+            # Downloaded bytes are saved to a temp file (write offloaded so large
+            # clips don't block the loop). mkstemp reserves the path synchronously
+            # so tmp_path is always set before the first cancellation-risk await,
+            # avoiding a NameError in the CancelledError cleanup path if the task
+            # is cancelled mid-write.
+            if isinstance(clip, CachedClip):
+                try:
+                    tmp_path = str(await media_cache.pin_clip(clip.path))
+                except OSError as exc:
+                    log.warning(
+                        "Could not pin cached clip; classifying it in place",
+                        event_id=frigate_event,
+                        error=str(exc),
+                    )
+                clip_path = tmp_path if tmp_path is not None else str(clip.path)
+            else:
+                _fd, tmp_path = tempfile.mkstemp(suffix=".mp4")
+                os.close(_fd)
+                try:
+                    await asyncio.to_thread(Path(tmp_path).write_bytes, clip)
+                except BaseException:
+                    with contextlib.suppress(OSError):
+                        await asyncio.to_thread(os.remove, tmp_path)
+                    raise
+                clip_path = tmp_path
 
             try:
-                # 4. Run classification
+                # 4. Run classification once an inference slot frees up; the
+                # fetch above overlapped with whatever was analyzing before.
+                await self._acquire_inference_slot(frigate_event)
                 await self._update_status(frigate_event, "processing", error=None, broadcast=False)
                 self._note_job_progress(
                     frigate_event,
@@ -1686,7 +1882,9 @@ class AutoVideoClassifierService:
                     )
 
                 timeout = settings.classification.video_classification_timeout_seconds
+                pause_clock = VideoPauseClock()
                 try:
+                    track_index = await event_track_indexes.get(frigate_event)
                     input_context = self._build_classification_input_context(
                         event_id=frigate_event,
                         event_data=event_data,
@@ -1697,29 +1895,35 @@ class AutoVideoClassifierService:
                             if clip_start_timestamp is not None
                             else (event_data or {}).get("start_time")
                         ),
+                        track_index=track_index,
                     )
-                    results = await asyncio.wait_for(
+                    results = await self._await_video_classification(
                         self._classifier.classify_video_async(
-                            tmp_path,
+                            clip_path,
                             max_frames=settings.classification.video_classification_frames,
                             progress_callback=progress_callback,
                             camera_name=camera,
                             input_context=input_context,
                             propagate_worker_failure=True,
                             diagnostics_callback=capture_video_diagnostics,
+                            # Re-runs (unknowns analysis, manual, restored jobs) reuse unchanged results.
+                            memoize=(source != "live"),
                         ),
                         timeout=timeout,
+                        pause_clock=pause_clock,
                     )
                 except asyncio.TimeoutError:
+                    self._enter_pipeline_stage(frigate_event, "persist")
                     log.warning("Video classification timed out", event_id=frigate_event, timeout_seconds=timeout)
                     timeout_context = {
                         "timeout_seconds": timeout,
+                        "preempted_seconds": round(pause_clock.paused_seconds(), 3),
                         "source": source,
                         "camera": camera,
-                        "clip_bytes": len(clip_bytes),
+                        "clip_bytes": await asyncio.to_thread(self._clip_size_sync, clip),
                         "max_frames": settings.classification.video_classification_frames,
                     }
-                    timeout_context.update(await asyncio.to_thread(self._clip_probe_context_sync, tmp_path))
+                    timeout_context.update(await asyncio.to_thread(self._clip_probe_context_sync, clip_path))
 
                     # Signal the classifier that a maintenance video timeout
                     # just happened. Combined with live lease expiries this
@@ -1780,6 +1984,7 @@ class AutoVideoClassifierService:
                     )
                     return
                 except VideoClassificationWorkerError as exc:
+                    self._enter_pipeline_stage(frigate_event, "persist")
                     reason_code = exc.reason_code
                     self._record_diagnostic(
                         frigate_event,
@@ -1798,6 +2003,9 @@ class AutoVideoClassifierService:
                     )
                     return
 
+                # Release the inference slot before persisting so the next clip
+                # starts analyzing while results and HQ snapshots are written.
+                self._enter_pipeline_stage(frigate_event, "persist")
                 if results and manual_reclassification_requested():
                     from app.services.detection_service import DetectionService
 
@@ -1863,10 +2071,12 @@ class AutoVideoClassifierService:
                     # A hang here holds the maintenance coordinator slot forever.
                     if settings.media_cache.high_quality_event_snapshots:
                         try:
+                            # Cached clips are only read into memory for this step.
+                            hq_clip_bytes = await asyncio.to_thread(self._clip_bytes_sync, clip)
                             await asyncio.wait_for(
                                 high_quality_snapshot_service.replace_from_clip_bytes(
                                     frigate_event,
-                                    clip_bytes,
+                                    hq_clip_bytes,
                                     event_data=event_data,
                                     clip_variant=clip_variant,
                                 ),
@@ -1943,13 +2153,14 @@ class AutoVideoClassifierService:
                     )
 
             finally:
-                # Always cleanup temp file
-                with contextlib.suppress(OSError):
-                    await asyncio.to_thread(os.remove, tmp_path)
+                # Always cleanup the temp file or clip pin; cached clips are never removed here.
+                if tmp_path is not None:
+                    with contextlib.suppress(OSError):
+                        await asyncio.to_thread(os.remove, tmp_path)
 
         except asyncio.CancelledError:
             log.info("Video classification task cancelled", event_id=frigate_event)
-            # tmp_path is set by mkstemp before any await, so it is always available here.
+            # tmp_path is set by mkstemp before any await; for cached clips it is the pin.
             if tmp_path is not None:
                 with contextlib.suppress(OSError):
                     await asyncio.to_thread(os.remove, tmp_path)
@@ -1992,6 +2203,8 @@ class AutoVideoClassifierService:
                 outcome="failed",
                 reason="video_exception",
             )
+        finally:
+            self._leave_pipeline_stage(frigate_event)
 
     def _record_diagnostic(
         self,
@@ -2110,8 +2323,13 @@ class AutoVideoClassifierService:
         frigate_event: str,
         *,
         skip_delay: bool = False,
-    ) -> tuple[Optional[bytes], Optional[str], Literal["event", "recording"], float | None]:
-        """Prefer a cached recording/full-visit clip when available, otherwise poll the event clip."""
+    ) -> tuple[Optional[ClipSource], Optional[str], Literal["event", "recording"], float | None]:
+        """Prefer a cached recording/full-visit clip when available, otherwise poll the event clip.
+
+        Clips already in the media cache are validated and returned as a
+        ``CachedClip`` so they are classified in place; only clips fetched from
+        Frigate are returned as bytes.
+        """
         recording_start_ts: float | int | None = None
         try:
             (
@@ -2125,14 +2343,10 @@ class AutoVideoClassifierService:
             )
             if recording_cached_path:
                 log.info("Using cached recording clip for auto video classification", event_id=frigate_event)
-                clip_bytes = await asyncio.to_thread(Path(recording_cached_path).read_bytes)
-                if (
-                    clip_bytes
-                    and (clip_bytes.startswith(b"\x00\x00\x00\x18ftyp") or b"ftyp" in clip_bytes[:32])
-                    and await self._clip_decodes(clip_bytes)
-                ):
+                cached_clip = await self._validated_cached_clip(recording_cached_path)
+                if cached_clip is not None:
                     return (
-                        clip_bytes,
+                        cached_clip,
                         None,
                         "recording",
                         float(recording_start_ts) if recording_start_ts is not None else None,
@@ -2152,18 +2366,14 @@ class AutoVideoClassifierService:
         partial_recording_path = media_cache.get_recording_clip_path(frigate_event)
         if partial_recording_path:
             try:
-                clip_bytes = await asyncio.to_thread(Path(partial_recording_path).read_bytes)
-                if (
-                    clip_bytes
-                    and (clip_bytes.startswith(b"\x00\x00\x00\x18ftyp") or b"ftyp" in clip_bytes[:32])
-                    and await self._clip_decodes(clip_bytes)
-                ):
+                cached_clip = await self._validated_cached_clip(partial_recording_path)
+                if cached_clip is not None:
                     log.info(
                         "Using retained partial recording clip for auto video classification",
                         event_id=frigate_event,
                     )
                     return (
-                        clip_bytes,
+                        cached_clip,
                         None,
                         "recording",
                         float(recording_start_ts) if recording_start_ts is not None else None,
@@ -2183,14 +2393,10 @@ class AutoVideoClassifierService:
         cached_clip_path = media_cache.get_clip_path(frigate_event)
         if cached_clip_path:
             try:
-                clip_bytes = await asyncio.to_thread(Path(cached_clip_path).read_bytes)
-                if (
-                    clip_bytes
-                    and (clip_bytes.startswith(b"\x00\x00\x00\x18ftyp") or b"ftyp" in clip_bytes[:32])
-                    and await self._clip_decodes(clip_bytes)
-                ):
+                cached_clip = await self._validated_cached_clip(cached_clip_path)
+                if cached_clip is not None:
                     log.info("Using cached event clip for auto video classification", event_id=frigate_event)
-                    return clip_bytes, None, "event", None
+                    return cached_clip, None, "event", None
                 log.warning(
                     "Cached event clip was invalid; falling back to Frigate fetch",
                     event_id=frigate_event,
@@ -2207,17 +2413,91 @@ class AutoVideoClassifierService:
         return clip_bytes, clip_error, "event", None
 
     @staticmethod
-    def _clip_decodes_sync(clip_bytes: bytes) -> bool:
-        """Synchronous inner check — runs in a thread so it cannot block the event loop."""
+    def _has_mp4_signature(header: bytes) -> bool:
+        return bool(header) and (header.startswith(b"\x00\x00\x00\x18ftyp") or b"ftyp" in header[:32])
+
+    @staticmethod
+    def _read_clip_header_sync(path: Path) -> bytes:
+        with open(path, "rb") as handle:
+            return handle.read(32)
+
+    @staticmethod
+    def _mp4_container_complete_sync(path: Path) -> bool:
+        """Walk the top-level MP4 box headers without decoding any frames.
+
+        A truncated or half-written file ends mid-box or lacks ``moov``/``mdat``;
+        decode errors beyond that surface from the classification pass itself.
+        """
+        try:
+            file_size = path.stat().st_size
+            box_types: set[bytes] = set()
+            with open(path, "rb") as handle:
+                offset = 0
+                for _ in range(_MP4_PROBE_MAX_BOXES):
+                    if offset >= file_size:
+                        break
+                    handle.seek(offset)
+                    header = handle.read(8)
+                    if len(header) < 8:
+                        return False
+                    box_size = int.from_bytes(header[:4], "big")
+                    if box_size == 1:
+                        large_size = handle.read(8)
+                        if len(large_size) < 8:
+                            return False
+                        box_size = int.from_bytes(large_size, "big")
+                    elif box_size == 0:
+                        box_size = file_size - offset
+                    if box_size < 8 or offset + box_size > file_size:
+                        return False
+                    box_types.add(header[4:8])
+                    offset += box_size
+        except OSError:
+            return False
+        return b"moov" in box_types and b"mdat" in box_types
+
+    async def _validated_cached_clip(self, cached_path: str | Path) -> CachedClip | None:
+        """Cheaply validate a media-cache clip; classify_video does the only decode."""
+        path = Path(cached_path)
+        header = await asyncio.to_thread(self._read_clip_header_sync, path)
+        if self._has_mp4_signature(header) and await asyncio.to_thread(self._mp4_container_complete_sync, path):
+            return CachedClip(path=path)
+        return None
+
+    @staticmethod
+    def _clip_size_sync(clip: ClipSource) -> int:
+        if isinstance(clip, CachedClip):
+            try:
+                return clip.path.stat().st_size
+            except OSError:
+                return 0
+        return len(clip)
+
+    @staticmethod
+    def _clip_bytes_sync(clip: ClipSource) -> bytes:
+        if isinstance(clip, CachedClip):
+            return clip.path.read_bytes()
+        return clip
+
+    @staticmethod
+    def _clip_decodes_sync(clip: bytes | Path) -> bool:
+        """Synchronous inner check — runs in a thread so it cannot block the event loop.
+
+        Paths are opened in place; only raw bytes are spilled to a temp file.
+        """
         import cv2
 
         tmp_path = None
         try:
-            with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp:
-                tmp.write(clip_bytes)
-                tmp_path = tmp.name
+            if isinstance(clip, (bytes, bytearray)):
+                with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp:
+                    tmp.write(clip)
+                    tmp_path = tmp.name
+                video_path = tmp_path
+            else:
+                video_path = str(clip)
 
-            cap = cv2.VideoCapture(tmp_path)
+            cap = cv2.VideoCapture(video_path)
             if not cap.isOpened():
                 cap.release()
                 return False
@@ -2229,8 +2509,8 @@ class AutoVideoClassifierService:
                 with contextlib.suppress(OSError):
                     os.remove(tmp_path)
 
-    async def _clip_decodes(self, clip_bytes: bytes) -> bool:
-        """Ensure clip bytes decode into at least one frame.
+    async def _clip_decodes(self, clip: bytes | Path) -> bool:
+        """Ensure clip bytes (or a cached clip path) decode into at least one frame.
 
         cv2.VideoCapture and cap.read() are synchronous and can block
         indefinitely on corrupt or truncated MP4s.  Running them in a
@@ -2239,7 +2519,7 @@ class AutoVideoClassifierService:
         """
         try:
             return await asyncio.wait_for(
-                asyncio.to_thread(self._clip_decodes_sync, clip_bytes),
+                asyncio.to_thread(self._clip_decodes_sync, clip),
                 timeout=30.0,
             )
         except asyncio.TimeoutError:
@@ -2554,6 +2834,7 @@ class AutoVideoClassifierService:
                     camera_name=camera,
                     input_context=input_context,
                     queue_timeout_seconds=SNAPSHOT_FALLBACK_BACKGROUND_IMAGE_ADMISSION_TIMEOUT_SECONDS,
+                    memoize=True,
                 )
                 last_unavailable_error = None
                 break
@@ -63,7 +63,15 @@ class BackfillService:
         # property re-resolves against the singleton on every access so a
         # settings-driven reload doesn't leave us with a closed instance.
         self._classifier_ref: ClassifierService | None = classifier
-        self.detection_service = DetectionService(self.classifier)
+        self._detection_service: DetectionService | None = None
+
+    @property
+    def detection_service(self) -> DetectionService:
+        # Built on first use: the router instantiates this service at import,
+        # before startup should pay for constructing the classifier.
+        if self._detection_service is None:
+            self._detection_service = DetectionService(self.classifier)
+        return self._detection_service
 
     @property
     def classifier(self) -> ClassifierService:
@@ -273,6 +281,7 @@ class BackfillService:
                     provenance=snapshot_provenance,
                 ),
                 queue_timeout_seconds=BACKFILL_BACKGROUND_IMAGE_ADMISSION_TIMEOUT_SECONDS,
+                memoize=True,
             )
 
             if not results:
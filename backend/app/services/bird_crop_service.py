@@ -9,11 +9,14 @@ from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, Callable
 
-import numpy as np
 import structlog
-from PIL import Image
 
 from app.config import settings
+from app.services.compiled_model_cache import openvino_cache_dir
+from app.utils.lazy_imports import lazy_module
+
+np = lazy_module("numpy")
+Image = lazy_module("PIL.Image")
 
 log = structlog.get_logger()
 
@@ -67,10 +70,8 @@ class _OpenVINODetectorSession:
         self.device = str(device or "CPU")
         self._lock = threading.Lock()
         self._core = core_cls()
-        cache_dir = os.getenv("OPENVINO_CACHE_DIR", "/tmp/openvino_cache")
-        os.makedirs(cache_dir, exist_ok=True)
         try:
-            self._core.set_property({"CACHE_DIR": cache_dir})
+            self._core.set_property({"CACHE_DIR": openvino_cache_dir()})
         except Exception:
             pass
         model = self._core.read_model(str(model_path))
@@ -156,6 +157,7 @@ class BirdCropService:
     CLASSIFICATION_TILE_GRID_SIZE = 2
     CLASSIFICATION_TILE_OVERLAP_RATIO = 0.20
     CLASSIFICATION_TILE_MODEL_INPUT_SIZE = 416
+    TILE_MERGE_IOU_THRESHOLD = 0.45
     ACCURATE_TIER_MIN_CROP_SIZE = 64
 
     def __init__(
@@ -266,39 +268,20 @@ class BirdCropService:
                 False,
             )
 
-        try:
-            candidates = self._infer_candidates(model, image)
-        except Exception as exc:
-            active_provider = str((model or {}).get("provider") or "cpu") if isinstance(model, dict) else "cpu"
-            if not self.strict_provider and active_provider != "cpu":
-                try:
-                    model = self._replace_tier_with_cpu(detector_tier, failed_provider=active_provider)
-                    candidates = self._infer_candidates(model, image)
-                except Exception as fallback_exc:
-                    log.warning(
-                        "Bird crop inference and CPU fallback failed",
-                        detector_tier=detector_tier,
-                        provider=active_provider,
-                        error=str(fallback_exc),
-                    )
-                    return (
-                        self._empty_result(
-                            "inference_failed",
-                            detector_tier=detector_tier,
-                            fallback_reason=fallback_reason,
-                        ),
-                        True,
-                    )
-            else:
-                log.warning("Bird crop inference failed", detector_tier=detector_tier, error=str(exc))
-                return (
-                    self._empty_result(
-                        "inference_failed",
-                        detector_tier=detector_tier,
-                        fallback_reason=fallback_reason,
-                    ),
-                    True,
-                )
+        candidates = self._run_with_provider_fallback(
+            model,
+            detector_tier,
+            lambda active_model: self._infer_candidates(active_model, image),
+        )
+        if candidates is None:
+            return (
+                self._empty_result(
+                    "inference_failed",
+                    detector_tier=detector_tier,
+                    fallback_reason=fallback_reason,
+                ),
+                True,
+            )
 
         return (
             self._select_best_valid_candidate(
@@ -313,6 +296,32 @@ class BirdCropService:
             True,
         )
 
+    def _run_with_provider_fallback(
+        self,
+        model: Any,
+        detector_tier: str,
+        infer: Callable[[Any], Any],
+    ) -> Any | None:
+        """Run ``infer`` on the tier model, retrying once on CPU; ``None`` means inference failed."""
+        try:
+            return infer(model)
+        except Exception as exc:
+            active_provider = str((model or {}).get("provider") or "cpu") if isinstance(model, dict) else "cpu"
+            if self.strict_provider or active_provider == "cpu":
+                log.warning("Bird crop inference failed", detector_tier=detector_tier, error=str(exc))
+                return None
+            try:
+                model = self._replace_tier_with_cpu(detector_tier, failed_provider=active_provider)
+                return infer(model)
+            except Exception as fallback_exc:
+                log.warning(
+                    "Bird crop inference and CPU fallback failed",
+                    detector_tier=detector_tier,
+                    provider=active_provider,
+                    error=str(fallback_exc),
+                )
+                return None
+
     def generate_classification_crop(self, image: Image.Image) -> dict[str, Any]:
         """Use the detector tier validated for automatic classifier image preparation."""
         return self.generate_crop(image, detector_tier="accurate")
@@ -422,19 +431,46 @@ class BirdCropService:
         return self._annotate_candidate_strategy(result, strategy=strategy), available
 
     def _generate_sliced_classification_candidate_crop(self, image: Image.Image) -> dict[str, Any] | None:
+        """Detect on all tiles in one pass and merge cross-tile duplicates before selection.
+
+        Each tile keeps its own selection policy (expansion and minimum output
+        size are clamped to the tile, as a per-tile call would), so merging only
+        removes lower-confidence copies of a bird already seen by another tile.
+        """
         tile_boxes = self._classification_tile_boxes(image.size)
         if not tile_boxes:
             return None
+        try:
+            model = self._ensure_model_for_tier("accurate")
+        except Exception as exc:  # pragma: no cover - defensive guard
+            self._model_error = str(exc)
+            self._model_errors["accurate"] = str(exc)
+            log.warning("Bird crop model load failed", detector_tier="accurate", error=str(exc))
+            model = None
+        if model is None:
+            return None
+
+        tiles = [image.crop(tile_box) for tile_box in tile_boxes]
+        tile_candidates = self._run_with_provider_fallback(
+            model,
+            "accurate",
+            lambda active_model: self._infer_tile_candidates(active_model, tiles),
+        )
+        if tile_candidates is None:
+            return None
+        tile_candidates = self._merge_tile_candidates(tile_candidates, tile_boxes, image.size)
 
         selected: list[dict[str, Any]] = []
-        for tile_box in tile_boxes:
-            tile = image.crop(tile_box)
-            tile_result, available = self._generate_classification_candidate_for_tier(
+        for tile, tile_box, candidates in zip(tiles, tile_boxes, tile_candidates):
+            tile_result = self._select_best_valid_candidate(
                 tile,
-                strategy="sliced_2x2",
+                candidates,
+                detector_tier="accurate",
+                fallback_reason=None,
+                confidence_threshold_ceiling=self.CLASSIFICATION_CANDIDATE_CONFIDENCE_FLOOR,
+                min_crop_size_ceiling=self.CLASSIFICATION_CANDIDATE_MIN_DETECTION_SIZE,
+                minimum_output_size=self.CLASSIFICATION_CANDIDATE_MIN_OUTPUT_SIZE,
             )
-            if not available:
-                return None
             if tile_result.get("reason") != "selected":
                 continue
             selected.append(
@@ -450,6 +486,104 @@ class BirdCropService:
             return None
         return max(selected, key=lambda result: float(result.get("confidence") or 0.0))
 
+    def _infer_tile_candidates(self, model: Any, tiles: list[Image.Image]) -> list[list[dict[str, Any]]]:
+        """Return tile-relative candidates, using one batched session run when the model allows it."""
+        batched = self.run_detector_batch_outputs(model, tiles) if self._supports_batched_tiles(model) else None
+        if batched is None:
+            return [self._infer_candidates(model, tile) for tile in tiles]
+        output_names = [str(name or "") for name in (model.get("output_names") or [])]
+        detector_config = dict(model.get("detector_config") or {})
+        detector_tier = str(model.get("detector_tier") or self._requested_detector_tier())
+        return [
+            self._parse_detector_outputs(
+                outputs,
+                transform=transform,
+                image_size=tile.size,
+                output_names=output_names,
+                detector_tier=detector_tier,
+                detector_config=detector_config,
+            )
+            for tile, (outputs, transform) in zip(tiles, batched)
+        ]
+
+    @staticmethod
+    def _supports_batched_tiles(model: Any) -> bool:
+        if not isinstance(model, dict):
+            return False
+        return model.get("session") is not None and bool(model.get("dynamic_batch", False))
+
+    def _merge_tile_candidates(
+        self,
+        tile_candidates: list[list[dict[str, Any]]],
+        tile_boxes: list[tuple[int, int, int, int]],
+        image_size: tuple[int, int],
+        *,
+        iou_threshold: float = TILE_MERGE_IOU_THRESHOLD,
+    ) -> list[list[dict[str, Any]]]:
+        """Drop candidates that a higher-confidence detection from another tile already covers.
+
+        Boxes are shifted into image coordinates and compared in a single
+        pairwise IoU matrix (Fast-NMS style: a box is suppressed by any
+        higher-scoring box from a different tile). Candidates without a usable
+        box or confidence pass through so selection can still report them.
+        """
+        boxes: list[tuple[float, float, float, float]] = []
+        scores: list[float] = []
+        owners: list[tuple[int, int]] = []
+        for tile_index, candidates in enumerate(tile_candidates):
+            for candidate_index, candidate in enumerate(candidates or []):
+                box = self._extract_box(candidate) if isinstance(candidate, dict) else None
+                confidence = self._coerce_confidence(candidate)
+                if box is None or confidence is None:
+                    continue
+                boxes.append(box)
+                scores.append(confidence)
+                owners.append((tile_index, candidate_index))
+        if len(boxes) < 2:
+            return [list(candidates or []) for candidates in tile_candidates]
+
+        owner_array = np.asarray(owners, dtype=np.int64)
+        tile_ids = owner_array[:, 0]
+        offsets = np.asarray(tile_boxes, dtype=np.float64)[tile_ids][:, [0, 1, 0, 1]]
+        width, height = image_size
+        image_boxes = np.clip(
+            np.asarray(boxes, dtype=np.float64) + offsets,
+            0.0,
+            np.asarray([width, height, width, height], dtype=np.float64),
+        )
+        order = np.argsort(-np.asarray(scores, dtype=np.float64), kind="stable")
+        image_boxes = image_boxes[order]
+        tile_ids = tile_ids[order]
+        areas = np.maximum(0.0, image_boxes[:, 2] - image_boxes[:, 0]) * np.maximum(
+            0.0, image_boxes[:, 3] - image_boxes[:, 1]
+        )
+        inter_w = np.maximum(
+            0.0,
+            np.minimum(image_boxes[:, None, 2], image_boxes[None, :, 2])
+            - np.maximum(image_boxes[:, None, 0], image_boxes[None, :, 0]),
+        )
+        inter_h = np.maximum(
+            0.0,
+            np.minimum(image_boxes[:, None, 3], image_boxes[None, :, 3])
+            - np.maximum(image_boxes[:, None, 1], image_boxes[None, :, 1]),
+        )
+        inter = inter_w * inter_h
+        union = areas[:, None] + areas[None, :] - inter
+        iou = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0.0)
+        iou[tile_ids[:, None] == tile_ids[None, :]] = 0.0
+        suppressed = np.triu(iou, k=1).max(axis=0) > float(iou_threshold)
+        dropped = {tuple(owner) for owner in owner_array[order][suppressed].tolist()}
+        if dropped:
+            log.debug("Merged duplicate tile detections", suppressed=len(dropped), candidates=len(boxes))
+        return [
+            [
+                candidate
+                for candidate_index, candidate in enumerate(candidates or [])
+                if (tile_index, candidate_index) not in dropped
+            ]
+            for tile_index, candidates in enumerate(tile_candidates)
+        ]
+
     def _classification_tile_boxes(self, image_size: tuple[int, int]) -> list[tuple[int, int, int, int]]:
         width, height = (max(0, int(image_size[0])), max(0, int(image_size[1])))
         model_input = self.CLASSIFICATION_TILE_MODEL_INPUT_SIZE
@@ -740,6 +874,7 @@ class BirdCropService:
             "input_layout": input_layout,
             "input_type": str(getattr(model_input, "type", "") or ""),
             "dynamic_input_hw": dynamic_input_hw,
+            "dynamic_batch": self._has_dynamic_batch(input_shape),
             "preferred_input_height": preferred_input_size,
             "preferred_input_width": preferred_input_size,
             "preprocessing": preprocessing,
@@ -879,6 +1014,18 @@ class BirdCropService:
         status["provider_fallbacks"] = dict(self._provider_fallbacks)
         return status
 
+    def get_model_fingerprint(self) -> dict[str, Any]:
+        """Identify the installed detector artifacts by path, size and mtime without hashing them."""
+        fingerprint: dict[str, Any] = {}
+        for tier in ("fast", "accurate"):
+            model_path = self._resolve_model_path(tier)
+            try:
+                stat = model_path.stat() if model_path is not None else None
+            except OSError:
+                stat = None
+            fingerprint[tier] = [str(model_path), stat.st_size, stat.st_mtime_ns] if stat is not None else None
+        return fingerprint
+
     def run_detector_outputs(self, model: Any, image: Image.Image) -> tuple[list[Any], dict[str, float]]:
         """Run one detector and return raw outputs plus its geometric transform."""
         if not isinstance(model, dict):
@@ -886,20 +1033,56 @@ class BirdCropService:
         session = model.get("session")
         if session is None:
             raise RuntimeError("Detector session is not loaded")
-        input_tensor, transform = self._prepare_detector_input(
-            image,
-            input_width=int(model.get("input_width") or 640),
-            input_height=int(model.get("input_height") or 640),
-            input_layout=str(model.get("input_layout") or "nchw").strip().lower(),
-            input_type=str(model.get("input_type") or "tensor(float)").strip().lower(),
-            dynamic_input_hw=bool(model.get("dynamic_input_hw", False)),
-            preferred_input_width=int(model.get("preferred_input_width") or 0),
-            preferred_input_height=int(model.get("preferred_input_height") or 0),
-            preprocessing=dict(model.get("preprocessing") or {}),
-        )
+        input_tensor, transform = self._prepare_detector_input(image, **self._detector_input_options(model))
         outputs = session.run(None, {str(model.get("input_name") or "images"): input_tensor})
         return list(outputs or []), transform
 
+    def run_detector_batch_outputs(
+        self,
+        model: Any,
+        images: list[Image.Image],
+    ) -> list[tuple[list[Any], dict[str, float]]] | None:
+        """Run one detector call over equally shaped inputs and split the outputs per image.
+
+        Returns ``None`` when the prepared inputs do not share a shape or an
+        output has no per-image leading axis; callers then fall back to one
+        call per image.
+        """
+        if not isinstance(model, dict):
+            raise TypeError("Raw detector output is only available for managed sessions")
+        session = model.get("session")
+        if session is None:
+            raise RuntimeError("Detector session is not loaded")
+        if not images:
+            return []
+        options = self._detector_input_options(model)
+        prepared = [self._prepare_detector_input(image, **options) for image in images]
+        if len({tensor.shape for tensor, _transform in prepared}) != 1:
+            return None
+        batch = np.concatenate([tensor for tensor, _transform in prepared], axis=0)
+        raw_outputs = session.run(None, {str(model.get("input_name") or "images"): batch})
+        outputs = [np.asarray(output) for output in (raw_outputs or [])]
+        if any(output.ndim == 0 or output.shape[0] != len(images) for output in outputs):
+            log.debug("Detector outputs are not batch-major; running tiles separately", batch_size=len(images))
+            return None
+        return [
+            ([output[index : index + 1] for output in outputs], transform)
+            for index, (_tensor, transform) in enumerate(prepared)
+        ]
+
+    @staticmethod
+    def _detector_input_options(model: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "input_width": int(model.get("input_width") or 640),
+            "input_height": int(model.get("input_height") or 640),
+            "input_layout": str(model.get("input_layout") or "nchw").strip().lower(),
+            "input_type": str(model.get("input_type") or "tensor(float)").strip().lower(),
+            "dynamic_input_hw": bool(model.get("dynamic_input_hw", False)),
+            "preferred_input_width": int(model.get("preferred_input_width") or 0),
+            "preferred_input_height": int(model.get("preferred_input_height") or 0),
+            "preprocessing": dict(model.get("preprocessing") or {}),
+        }
+
     def _infer_candidates(self, model: Any, image: Image.Image) -> list[dict[str, Any]]:
         infer_fn = getattr(model, "infer", None)
         if callable(infer_fn):
@@ -946,6 +1129,16 @@ class BirdCropService:
                 return True
         return False
 
+    @staticmethod
+    def _has_dynamic_batch(shape: Any) -> bool:
+        if not isinstance(shape, (list, tuple)) or len(shape) < 4:
+            return False
+        try:
+            int(shape[0])
+        except (TypeError, ValueError):
+            return True
+        return False
+
     def _resolve_input_hw(self, shape: Any, *, layout: str = "nchw") -> tuple[int, int]:
         if isinstance(shape, (list, tuple)) and len(shape) >= 4:
             candidates: list[tuple[Any, Any]] = []
@@ -210,7 +210,9 @@ class CanonicalIdentityRepairService:
         oldest = await repo.get_oldest_detection_date()
         if oldest is None:
             return 0
-        return await repo.rebuild_all_rollups(oldest.date(), datetime.utcnow().date())
+        rebuilt = await repo.rebuild_all_rollups(oldest.date(), datetime.utcnow().date())
+        await repo.rebuild_hourly_cube()
+        return rebuilt
 
     async def run(
         self,
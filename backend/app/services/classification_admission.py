@@ -68,6 +68,188 @@ class _WorkItem:
     task: asyncio.Task[Any] | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class CapacitySignals:
+    """Load observed by the coordinator since the previous capacity evaluation."""
+
+    live_queue_wait_seconds: float
+    background_queue_wait_seconds: float
+    live_queued: int
+    live_running: int
+    background_queued: int
+    live_rejected: int
+    lease_latency_inflation: float | None = None
+    cpu_percent: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "live_queue_wait_seconds": round(self.live_queue_wait_seconds, 3),
+            "background_queue_wait_seconds": round(self.background_queue_wait_seconds, 3),
+            "live_queued": self.live_queued,
+            "live_running": self.live_running,
+            "background_queued": self.background_queued,
+            "live_rejected": self.live_rejected,
+            "lease_latency_inflation": (
+                round(self.lease_latency_inflation, 3) if self.lease_latency_inflation is not None else None
+            ),
+            "cpu_percent": self.cpu_percent,
+        }
+
+
+class AdmissionCapacityController:
+    """Resize live/background admission capacity within bounds from queue wait, lease latency and CPU load.
+
+    Live queue wait or live rejections raise live capacity (straight to the
+    outstanding live demand) and shed one background slot. Lease latency
+    inflation (p95 over the runtime baseline) or a busy host shed background
+    slots without touching live. Once live has been quiet for
+    ``live_hold_seconds`` live capacity steps back down and background steps
+    back up to its starting size, and a background backlog may grow background
+    further while the host has headroom.
+    """
+
+    HISTORY_LIMIT = 50
+
+    def __init__(
+        self,
+        *,
+        live_bounds: tuple[int, int],
+        background_bounds: tuple[int, int],
+        interval_seconds: float = 1.0,
+        live_queue_wait_target_seconds: float = 0.05,
+        background_queue_wait_target_seconds: float = 2.0,
+        live_hold_seconds: float = 10.0,
+        lease_latency_inflation_high: float = 2.0,
+        cpu_high_percent: float = 85.0,
+        cpu_low_percent: float = 60.0,
+        lease_latency_inflation_provider: Callable[[], float | None] | None = None,
+        cpu_percent_provider: Callable[[], float | None] | None = None,
+    ) -> None:
+        self.live_bounds = self._normalize_bounds(live_bounds)
+        self.background_bounds = self._normalize_bounds(background_bounds)
+        self.interval_seconds = max(0.01, float(interval_seconds))
+        self._live_queue_wait_target_seconds = max(0.0, float(live_queue_wait_target_seconds))
+        self._background_queue_wait_target_seconds = max(0.0, float(background_queue_wait_target_seconds))
+        self._live_hold_seconds = max(0.0, float(live_hold_seconds))
+        self._lease_latency_inflation_high = max(1.0, float(lease_latency_inflation_high))
+        self._cpu_high_percent = float(cpu_high_percent)
+        self._cpu_low_percent = min(float(cpu_low_percent), self._cpu_high_percent)
+        self._lease_latency_inflation_provider = lease_latency_inflation_provider
+        self._cpu_percent_provider = cpu_percent_provider
+        self._background_baseline: int | None = None
+        self._last_live_pressure_at: float | None = None
+        self._last_signals: CapacitySignals | None = None
+        self._evaluations = 0
+        self._adjustments = 0
+        self._history: deque[dict[str, Any]] = deque(maxlen=self.HISTORY_LIMIT)
+
+    @staticmethod
+    def _normalize_bounds(bounds: tuple[int, int]) -> tuple[int, int]:
+        minimum = max(1, int(bounds[0]))
+        return minimum, max(minimum, int(bounds[1]))
+
+    @staticmethod
+    def _clamp(value: int, bounds: tuple[int, int]) -> int:
+        return max(bounds[0], min(bounds[1], value))
+
+    def clamp_initial(self, live_capacity: int, background_capacity: int) -> tuple[int, int]:
+        live = self._clamp(int(live_capacity), self.live_bounds)
+        background = self._clamp(int(background_capacity), self.background_bounds)
+        self._background_baseline = background
+        return live, background
+
+    def observe_host(self) -> tuple[float | None, float | None]:
+        """Read lease latency inflation and host CPU percent; unreadable sources are ``None``."""
+        return self._read_provider(self._lease_latency_inflation_provider), self._read_provider(
+            self._cpu_percent_provider
+        )
+
+    @staticmethod
+    def _read_provider(provider: Callable[[], float | None] | None) -> float | None:
+        if provider is None:
+            return None
+        try:
+            value = provider()
+        except Exception:
+            return None
+        return float(value) if isinstance(value, (int, float)) else None
+
+    def decide(
+        self,
+        signals: CapacitySignals,
+        *,
+        live_capacity: int,
+        background_capacity: int,
+        now: float,
+    ) -> tuple[int, int] | None:
+        """Return the new ``(live, background)`` capacity, or ``None`` when nothing changes."""
+        self._evaluations += 1
+        self._last_signals = signals
+        if self._background_baseline is None:
+            self._background_baseline = self._clamp(background_capacity, self.background_bounds)
+        live = live_capacity
+        background = background_capacity
+        cpu_high = signals.cpu_percent is not None and signals.cpu_percent >= self._cpu_high_percent
+        lease_inflated = (
+            signals.lease_latency_inflation is not None
+            and signals.lease_latency_inflation >= self._lease_latency_inflation_high
+        )
+
+        if signals.live_rejected > 0 or (
+            signals.live_queued > 0 and signals.live_queue_wait_seconds >= self._live_queue_wait_target_seconds
+        ):
+            self._last_live_pressure_at = now
+            reason = "live_rejections" if signals.live_rejected > 0 else "live_queue_wait"
+            live = max(live + 1, signals.live_running + signals.live_queued)
+            background -= 1
+        elif lease_inflated or cpu_high:
+            reason = "lease_latency_high" if lease_inflated else "cpu_high"
+            background -= 1
+        else:
+            live_quiet = (
+                self._last_live_pressure_at is None or now - self._last_live_pressure_at >= self._live_hold_seconds
+            )
+            reason = "live_pressure_cleared"
+            if live_quiet and signals.live_queued == 0:
+                live -= 1
+                if background < self._background_baseline:
+                    background += 1
+                elif (
+                    signals.background_queued > 0
+                    and signals.background_queue_wait_seconds >= self._background_queue_wait_target_seconds
+                    and (signals.cpu_percent is None or signals.cpu_percent <= self._cpu_low_percent)
+                ):
+                    reason = "background_backlog"
+                    background += 1
+
+        live = self._clamp(live, self.live_bounds)
+        background = self._clamp(background, self.background_bounds)
+        if (live, background) == (live_capacity, background_capacity):
+            return None
+        self._adjustments += 1
+        self._history.append(
+            {
+                "timestamp": time.time(),
+                "reason": reason,
+                "live_capacity": [live_capacity, live],
+                "background_capacity": [background_capacity, background],
+                "signals": signals.as_dict(),
+            }
+        )
+        return live, background
+
+    def get_metrics(self) -> dict[str, Any]:
+        return {
+            "live_bounds": list(self.live_bounds),
+            "background_bounds": list(self.background_bounds),
+            "interval_seconds": self.interval_seconds,
+            "evaluations": self._evaluations,
+            "adjustments": self._adjustments,
+            "last_signals": self._last_signals.as_dict() if self._last_signals is not None else None,
+            "history": list(self._history),
+        }
+
+
 class ClassificationAdmissionCoordinator:
     """Coordinate live/background admission with lease reclaim and stale-completion rejection."""
 
@@ -83,9 +265,15 @@ class ClassificationAdmissionCoordinator:
         background_lease_timeout_seconds: float,
         default_queue_timeout_seconds: float = 0.25,
         background_starvation_threshold_seconds: float = 2.0,
+        capacity_controller: AdmissionCapacityController | None = None,
     ) -> None:
         self._live_capacity = max(1, int(live_capacity))
         self._background_capacity = max(1, int(background_capacity))
+        self._capacity_controller = capacity_controller
+        if capacity_controller is not None:
+            self._live_capacity, self._background_capacity = capacity_controller.clamp_initial(
+                self._live_capacity, self._background_capacity
+            )
         self._default_lease_timeout_seconds = {
             "live": max(0.01, float(live_lease_timeout_seconds)),
             "background": max(0.01, float(background_lease_timeout_seconds)),
@@ -107,6 +295,10 @@ class ClassificationAdmissionCoordinator:
         self._abandoned: Counter[str] = Counter()
         self._rejected: Counter[str] = Counter()
         self._late_completions_ignored = 0
+        # Peak queue wait of work admitted, and rejections counted, since the last capacity evaluation.
+        self._admitted_wait_peak: dict[WorkPriority, float] = {"live": 0.0, "background": 0.0}
+        self._rejected_at_last_evaluation: Counter[str] = Counter()
+        self._next_capacity_evaluation_at = 0.0
         self._recent_outcomes: deque[dict[str, Any]] = deque(maxlen=self.RECENT_OUTCOME_LIMIT)
         self._closed = False
         self._reaper_task: asyncio.Task[None] | None = None
@@ -234,6 +426,9 @@ class ClassificationAdmissionCoordinator:
                 "oldest_running_age_seconds": self._oldest_active_age_seconds("background"),
             },
             "late_completions_ignored": self._late_completions_ignored,
+            "capacity_controller": (
+                self._capacity_controller.get_metrics() if self._capacity_controller is not None else None
+            ),
             "recent_outcomes": list(self._recent_outcomes),
             "background_throttled": self._is_live_pressure_active(),
             "background_starvation_relief_active": self._is_background_starvation_relief_active(),
@@ -252,12 +447,45 @@ class ClassificationAdmissionCoordinator:
                 await asyncio.sleep(self.REAPER_INTERVAL_SECONDS)
                 async with self._condition:
                     expired_callbacks = self._reclaim_expired_locked()
+                    self._evaluate_capacity_locked()
                     self._schedule_locked()
                     self._condition.notify_all()
                 await self._dispatch_lease_expired_callbacks(expired_callbacks)
         except asyncio.CancelledError:
             raise
 
+    def _evaluate_capacity_locked(self) -> None:
+        controller = self._capacity_controller
+        now = time.monotonic()
+        if controller is None or now < self._next_capacity_evaluation_at:
+            return
+        self._next_capacity_evaluation_at = now + controller.interval_seconds
+        lease_latency_inflation, cpu_percent = controller.observe_host()
+        signals = CapacitySignals(
+            live_queue_wait_seconds=max(
+                self._admitted_wait_peak["live"], self._oldest_pending_age_seconds("live") or 0.0
+            ),
+            background_queue_wait_seconds=max(
+                self._admitted_wait_peak["background"], self._oldest_pending_age_seconds("background") or 0.0
+            ),
+            live_queued=len(self._pending["live"]),
+            live_running=self._running["live"],
+            background_queued=len(self._pending["background"]),
+            live_rejected=self._rejected["live"] - self._rejected_at_last_evaluation["live"],
+            lease_latency_inflation=lease_latency_inflation,
+            cpu_percent=cpu_percent,
+        )
+        self._admitted_wait_peak = {"live": 0.0, "background": 0.0}
+        self._rejected_at_last_evaluation = Counter(self._rejected)
+        decision = controller.decide(
+            signals,
+            live_capacity=self._live_capacity,
+            background_capacity=self._background_capacity,
+            now=now,
+        )
+        if decision is not None:
+            self._live_capacity, self._background_capacity = decision
+
     def _schedule_locked(self) -> None:
         if self._closed:
             return
@@ -277,6 +505,9 @@ class ClassificationAdmissionCoordinator:
     def _admit_locked(self, item: _WorkItem) -> None:
         item.state = "running"
         item.admitted_at = time.monotonic()
+        self._admitted_wait_peak[item.priority] = max(
+            self._admitted_wait_peak[item.priority], item.admitted_at - item.enqueued_at
+        )
         item.deadline_at = item.admitted_at + item.lease_timeout_seconds
         item.lease_token += 1
         token = item.lease_token
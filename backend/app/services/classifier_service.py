@@ -1,7 +1,7 @@
+from __future__ import annotations
+
 import structlog
-import numpy as np
 import os
-import cv2
 import asyncio
 import contextlib
 import inspect
@@ -9,6 +9,8 @@ import base64
 import ctypes
 import hashlib
 import importlib
+import importlib.metadata
+import importlib.util
 import io
 import json
 import math
@@ -19,44 +21,73 @@ import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from PIL import Image
 from typing import Optional, Any, Awaitable, Callable, Literal
 
+from app.services import compiled_model_cache
+from app.services.compiled_model_cache import openvino_cache_dir
 from app.services.inference_health import InferenceHealth, Outcome, RuntimeKey
 from app.services.startup_status import startup_status
 from app.utils.canonical_species import should_hide_species_label
+from app.utils.lazy_imports import lazy_module
 from app.utils.runtime_flavor import get_image_flavor, image_flavor_warning, packaged_inference_providers
 
-# TFLite runtime
-try:
-    import tflite_runtime.interpreter as tflite
-except ImportError:
-    try:
-        import ai_edge_litert.interpreter as tflite
-    except ImportError:
+np = lazy_module("numpy")
+cv2 = lazy_module("cv2")
+Image = lazy_module("PIL.Image")
+
+# Inference runtimes are probed on first use rather than at import: the web
+# shell imports this module even when inference runs in worker processes.
+# Each global stays _UNPROBED until its accessor resolves it (tests patch the
+# globals directly, and a patched value is returned as-is).
+_UNPROBED: Any = object()
+tflite: Any = _UNPROBED
+ort: Any = _UNPROBED
+ONNX_AVAILABLE: Any = _UNPROBED
+_OPENVINO_SUPPORT: Any = _UNPROBED
+OpenVINOCore: Any = _UNPROBED
+OPENVINO_AVAILABLE: Any = _UNPROBED
+
+
+def _import_optional(*module_names: str) -> Any:
+    for module_name in module_names:
         try:
-            import tensorflow.lite as tflite
+            return importlib.import_module(module_name)
         except ImportError:
-            tflite = None
+            continue
+    return None
+
+
+def _tflite_module() -> Any:
+    """TFLite interpreter module (tflite-runtime, LiteRT or TensorFlow), or None."""
+    global tflite
+    if tflite is _UNPROBED:
+        tflite = _import_optional("tflite_runtime.interpreter", "ai_edge_litert.interpreter", "tensorflow.lite")
+    return tflite
 
 
 def _tflite_runtime_name() -> str:
-    module_name = str(getattr(tflite, "__name__", "") or "")
+    runtime = _tflite_module()
+    module_name = str(getattr(runtime, "__name__", "") or "")
     if module_name.startswith("ai_edge_litert"):
         return "litert"
     if module_name.startswith("tflite_runtime"):
         return "tflite-runtime"
-    return "tensorflow" if tflite is not None else "unavailable"
+    return "tensorflow" if runtime is not None else "unavailable"
 
 
-# ONNX runtime (for high-accuracy models)
-try:
-    import onnxruntime as ort
+def _onnxruntime_module() -> Any:
+    """ONNX Runtime (for high-accuracy models), or None."""
+    global ort, ONNX_AVAILABLE
+    if ort is _UNPROBED:
+        ort = _import_optional("onnxruntime")
+    if ONNX_AVAILABLE is _UNPROBED:
+        ONNX_AVAILABLE = ort is not None
+    return ort
 
-    ONNX_AVAILABLE = True
-except ImportError:
-    ort = None
-    ONNX_AVAILABLE = False
+
+def _onnx_available() -> bool:
+    _onnxruntime_module()
+    return bool(ONNX_AVAILABLE)
 
 
 def _preload_onnxruntime_cuda_runtime_libraries() -> None:
@@ -67,9 +98,10 @@ def _preload_onnxruntime_cuda_runtime_libraries() -> None:
     than a standard system library path, so we ask ORT to preload them
     explicitly before probing or creating CUDA sessions.
     """
-    if ort is None:
+    runtime = _onnxruntime_module()
+    if runtime is None:
         return
-    preload_dlls = getattr(ort, "preload_dlls", None)
+    preload_dlls = getattr(runtime, "preload_dlls", None)
     if not callable(preload_dlls):
         return
     preload_dlls(directory="")
@@ -125,16 +157,62 @@ def _detect_openvino_support() -> dict:
     }
 
 
-# OpenVINO runtime (optional; single-image Intel acceleration path)
-_OPENVINO_SUPPORT = _detect_openvino_support()
-OpenVINOCore = _OPENVINO_SUPPORT["core_class"]
-OPENVINO_AVAILABLE = bool(_OPENVINO_SUPPORT["available"])
+def _openvino_support() -> dict:
+    """OpenVINO runtime (optional; single-image Intel acceleration path), probed once."""
+    global _OPENVINO_SUPPORT, OpenVINOCore, OPENVINO_AVAILABLE
+    if _OPENVINO_SUPPORT is _UNPROBED:
+        _OPENVINO_SUPPORT = _detect_openvino_support()
+    if OpenVINOCore is _UNPROBED:
+        OpenVINOCore = _OPENVINO_SUPPORT["core_class"]
+    if OPENVINO_AVAILABLE is _UNPROBED:
+        OPENVINO_AVAILABLE = bool(_OPENVINO_SUPPORT["available"])
+    return _OPENVINO_SUPPORT
+
+
+def _openvino_status() -> dict:
+    """OpenVINO support for status reports, without importing OpenVINO into this process.
+
+    Until a model load resolves ``_openvino_support``, the installed package's
+    metadata stands in (the device probe already runs in a subprocess).
+    """
+    if _OPENVINO_SUPPORT is not _UNPROBED:
+        support = dict(_OPENVINO_SUPPORT)
+    else:
+        try:
+            installed = importlib.util.find_spec("openvino") is not None
+        except (ImportError, ValueError):
+            installed = False
+        try:
+            version = importlib.metadata.version("openvino") if installed else None
+        except importlib.metadata.PackageNotFoundError:
+            version = None
+        support = {
+            "available": installed,
+            "core_class": None,
+            "version": version,
+            "import_path": None,
+            "import_error": None if installed else "OpenVINO not installed",
+        }
+    if OPENVINO_AVAILABLE is not _UNPROBED:
+        support["available"] = bool(OPENVINO_AVAILABLE and OpenVINOCore is not None)
+    return support
+
 
 from app.config import settings  # noqa: E402
 from app.models.ai_models import ClassificationInputContext, CropGeneratorConfig  # noqa: E402
 from app.services.bird_crop_service import bird_crop_service  # noqa: E402
 from app.services.crop_source_resolver import crop_source_resolver  # noqa: E402
+from app.services.event_track_index import EventTrackIndex  # noqa: E402
+from app.services.inference_memo import (  # noqa: E402
+    InferenceMemoEntry,
+    InferenceMemoKey,
+    file_content_sha256,
+    image_content_sha256,
+    inference_memo,
+    policy_sha256,
+)
 from app.services.classification_admission import (  # noqa: E402
+    AdmissionCapacityController,
     ClassificationAdmissionCoordinator,
     ClassificationAdmissionTimeoutError,
     ClassificationLeaseExpiredError,
@@ -148,6 +226,7 @@ from app.services.classifier_supervisor import (  # noqa: E402
     ClassifierWorkerStartupTimeoutError,
 )
 from app.services.personalization_service import personalization_service  # noqa: E402
+from app.services.system_telemetry import SystemTelemetrySampler  # noqa: E402
 from app.services.video_classification_policy import (  # noqa: E402
     SourceTemporalConsensus,
     VIDEO_MIN_FRAME_SEPARATION_SECONDS,
@@ -185,6 +264,25 @@ CLASSIFIER_BACKGROUND_IMAGE_LEASE_TIMEOUT_SECONDS = max(
     0.1,
     float(os.getenv("CLASSIFIER_BACKGROUND_IMAGE_LEASE_TIMEOUT_SECONDS", "45")),
 )
+# Adaptive admission capacity: live/background pools resize between their configured
+# size and these ceilings from queue wait, lease latency inflation and host CPU load.
+CLASSIFIER_ADAPTIVE_CAPACITY_ENABLED = (
+    os.getenv("CLASSIFIER_ADAPTIVE_CAPACITY_ENABLED", "true").strip().lower() != "false"
+)
+CLASSIFIER_ADAPTIVE_LIVE_MAX_CAPACITY = max(1, int(os.getenv("CLASSIFIER_ADAPTIVE_LIVE_MAX_CAPACITY", "4")))
+CLASSIFIER_ADAPTIVE_BACKGROUND_MAX_CAPACITY = max(1, int(os.getenv("CLASSIFIER_ADAPTIVE_BACKGROUND_MAX_CAPACITY", "2")))
+CLASSIFIER_ADAPTIVE_CAPACITY_INTERVAL_SECONDS = max(
+    0.1,
+    float(os.getenv("CLASSIFIER_ADAPTIVE_CAPACITY_INTERVAL_SECONDS", "1.0")),
+)
+CLASSIFIER_ADAPTIVE_CPU_HIGH_PERCENT = max(
+    1.0,
+    float(os.getenv("CLASSIFIER_ADAPTIVE_CPU_HIGH_PERCENT", "85")),
+)
+# Live inference pauses in-flight worker video classification between frames.
+CLASSIFIER_VIDEO_PREEMPTION_ENABLED = (
+    os.getenv("CLASSIFIER_VIDEO_PREEMPTION_ENABLED", "true").strip().lower() != "false"
+)
 CLASSIFIER_LIVE_GPU_LEASE_FALLBACK_THRESHOLD = max(
     1,
     int(os.getenv("CLASSIFIER_LIVE_GPU_LEASE_FALLBACK_THRESHOLD", "3")),
@@ -341,6 +439,63 @@ def _select_video_frame_indices(
     return np.array(sorted(selected), dtype=int)
 
 
+def _select_tracked_video_frame_indices(
+    track_index: EventTrackIndex | None,
+    *,
+    clip_start: float | None,
+    fps: float,
+    total_frames: int,
+    sample_count: int,
+    clip_variant: str = "event",
+) -> np.ndarray | None:
+    """Sample only frames where the event track has the bird in view.
+
+    The usual centre-weighted distribution is applied to the concatenated
+    in-view frames, and short visits get fewer samples than the frame budget
+    (at most one per ``VIDEO_MIN_FRAME_SEPARATION_SECONDS``). Returns ``None``
+    when the track does not cover the clip so callers keep clip-wide sampling.
+    """
+    if track_index is None or clip_start is None or not math.isfinite(fps) or fps <= 0.0:
+        return None
+    ranges = track_index.visible_frame_ranges(clip_start=clip_start, fps=fps, frame_count=total_frames)
+    visible_frames = sum(last - first + 1 for first, last in ranges)
+    if visible_frames <= 0:
+        return None
+    spacing = max(1, int(round(fps * VIDEO_MIN_FRAME_SEPARATION_SECONDS)))
+    budget = min(int(sample_count), max(1, math.ceil(visible_frames / spacing)))
+    positions = _select_video_frame_indices(total_frames=visible_frames, sample_count=budget, clip_variant=clip_variant)
+    indices: list[int] = []
+    for position in positions:
+        remaining = int(position)
+        for first, last in ranges:
+            span = last - first + 1
+            if remaining < span:
+                indices.append(first + remaining)
+                break
+            remaining -= span
+    return np.array(indices, dtype=int)
+
+
+def _nchw_preprocessing_plan(
+    input_size: int,
+    preprocessing: dict[str, Any],
+    mean: np.ndarray,
+    std: np.ndarray,
+    *,
+    uint8_passthrough: bool = False,
+) -> dict[str, Any]:
+    """Plan shared by the ONNX and OpenVINO ``_preprocess`` implementations."""
+    return {
+        "runtime": "nchw_float32" if not uint8_passthrough else "nhwc_uint8",
+        "input_size": int(input_size),
+        "preprocessing": dict(preprocessing or {}),
+        "mean": np.asarray(mean, dtype=np.float64).ravel().tolist(),
+        "std": np.asarray(std, dtype=np.float64).ravel().tolist(),
+        "default_resize_mode": "letterbox",
+        "default_padding_color": 128,
+    }
+
+
 def _invoke_model_classify(
     model: Any,
     image: Image.Image,
@@ -888,16 +1043,17 @@ def _detect_acceleration_capabilities() -> dict:
     except Exception:
         dev_dri_entries = []
 
+    openvino_support = _openvino_status()
     caps = {
-        "ort_available": bool(ONNX_AVAILABLE and ort is not None),
+        "ort_available": bool(_onnx_available() and ort is not None),
         "cuda_provider_installed": False,
         "cuda_hardware_available": False,
         "cuda_available": False,
         "cuda_probe_error": None,
-        "openvino_available": bool(OPENVINO_AVAILABLE and OpenVINOCore is not None),
-        "openvino_version": _OPENVINO_SUPPORT.get("version"),
-        "openvino_import_path": _OPENVINO_SUPPORT.get("import_path"),
-        "openvino_import_error": _OPENVINO_SUPPORT.get("import_error"),
+        "openvino_available": bool(openvino_support["available"]),
+        "openvino_version": openvino_support.get("version"),
+        "openvino_import_path": openvino_support.get("import_path"),
+        "openvino_import_error": openvino_support.get("import_error"),
         "openvino_probe_error": None,
         "openvino_gpu_probe_error": None,
         "intel_gpu_available": False,
@@ -1721,13 +1877,14 @@ class ModelInstance:
                 log.warning(f"{self.name} model not found", path=self.model_path)
                 return False
 
-            if tflite is None:
+            runtime = _tflite_module()
+            if runtime is None:
                 self.error = "TFLite runtime not installed"
                 log.error("TFLite runtime not installed")
                 return False
 
             try:
-                self.interpreter = tflite.Interpreter(model_path=self.model_path)
+                self.interpreter = runtime.Interpreter(model_path=self.model_path)
                 self.interpreter.allocate_tensors()
                 self.input_details = self.interpreter.get_input_details()
                 self.output_details = self.interpreter.get_output_details()
@@ -1752,24 +1909,34 @@ class ModelInstance:
             processed = processed.resize((target_width, target_height), _resolve_interpolation(self.preprocessing))
         return np.array(processed, dtype=np.float32)
 
-    def _run_inference(self, image: Image.Image) -> np.ndarray:
-        """Internal method to run inference and return probability vector.
+    def _input_target_size(self) -> tuple[int, int]:
+        input_shape = self.input_details[0]["shape"]
+        # Shape is typically [1, height, width, 3] for image models
+        if len(input_shape) == 4:
+            return int(input_shape[2]), int(input_shape[1])
+        return 300, 300  # Default fallback
 
-        Args:
-            image: PIL Image to classify
+    def preprocessing_plan(self) -> dict[str, Any]:
+        """Describe everything ``preprocess`` depends on; equal plans yield equal tensors."""
+        input_details = self.input_details[0]
+        quant_params = input_details.get("quantization_parameters", {}) or {}
+        target_width, target_height = self._input_target_size()
+        return {
+            "runtime": "tflite",
+            "target_size": [target_width, target_height],
+            "input_dtype": str(input_details.get("dtype")),
+            "quantization": {
+                "scales": np.asarray(quant_params.get("scales", []), dtype=np.float32).tolist(),
+                "zero_points": np.asarray(quant_params.get("zero_points", []), dtype=np.float32).tolist(),
+            },
+            "preprocessing": dict(self.preprocessing),
+        }
 
-        Returns:
-            Normalized probability vector as numpy array
-        """
+    def preprocess(self, image: Image.Image) -> np.ndarray:
+        """Return the batched input tensor ``_run_inference`` would feed the interpreter."""
         # Get expected input size from model
         input_details = self.input_details[0]
-        input_shape = input_details["shape"]
-
-        # Shape is typically [1, height, width, 3] for image models
-        if len(input_shape) == 4:
-            target_height, target_width = input_shape[1], input_shape[2]
-        else:
-            target_height, target_width = 300, 300  # Default fallback
+        target_width, target_height = self._input_target_size()
 
         # Preprocess image
         input_data = self._preprocess_image(image, target_width, target_height)
@@ -1835,7 +2002,21 @@ class ModelInstance:
                 )
 
         # Add batch dimension
-        input_data = np.expand_dims(input_data, axis=0)
+        return np.expand_dims(input_data, axis=0)
+
+    def _run_inference(self, image: Image.Image) -> np.ndarray:
+        """Internal method to run inference and return probability vector.
+
+        Args:
+            image: PIL Image to classify
+
+        Returns:
+            Normalized probability vector as numpy array
+        """
+        return self._run_tensor_inference(self.preprocess(image))
+
+    def _run_tensor_inference(self, input_data: np.ndarray) -> np.ndarray:
+        input_details = self.input_details[0]
 
         # Run inference protected by lock
         with self._lock:
@@ -1912,9 +2093,16 @@ class ModelInstance:
             return []
 
         # Run inference and get probability vector
-        results = self._run_inference(image)
+        return self._results_from_probabilities(self._run_inference(image))
+
+    def classify_tensor(self, input_tensor: np.ndarray, top_k: int | None = None) -> list[dict]:
+        """Classify an already preprocessed tensor from ``preprocess``."""
+        if not self.loaded or not self.interpreter:
+            return []
+        return self._results_from_probabilities(self._run_tensor_inference(input_tensor), top_k=top_k)
 
-        max_results = settings.classification.max_classification_results
+    def _results_from_probabilities(self, results: np.ndarray, top_k: int | None = None) -> list[dict]:
+        max_results = top_k or settings.classification.max_classification_results
         grouped_labels = _resolve_grouped_labels(
             self.labels,
             label_grouping=self.label_grouping,
@@ -1964,6 +2152,66 @@ class ModelInstance:
         }
 
 
+def _create_onnxruntime_session(model_path: str, providers: list[str], *, intra_op_num_threads: int = 4):
+    """Create an ORT session, reusing a persisted optimized graph when one matches.
+
+    Returns ``(session, cache_state)`` where the state is ``hit``, ``stored``,
+    ``miss`` (cacheable but not written) or ``disabled``.
+    """
+
+    ort = _onnxruntime_module()
+
+    def _session_options(optimization_level: Any) -> Any:
+        options = ort.SessionOptions()
+        options.graph_optimization_level = optimization_level
+        options.intra_op_num_threads = intra_op_num_threads
+        return options
+
+    cached_path = compiled_model_cache.onnxruntime_optimized_model_path(
+        model_path,
+        providers=providers,
+        options={"graph_optimization_level": "all", "intra_op_num_threads": intra_op_num_threads},
+    )
+    if cached_path is not None and cached_path.is_file():
+        try:
+            # The cached graph is already optimized; re-running the optimizer is
+            # exactly the start-up cost the cache exists to skip.
+            session = ort.InferenceSession(
+                str(cached_path),
+                _session_options(ort.GraphOptimizationLevel.ORT_DISABLE_ALL),
+                providers=providers,
+            )
+            compiled_model_cache.touch(cached_path)
+            return session, "hit"
+        except Exception as exc:
+            log.warning("Discarding unreadable ORT optimized model cache", path=str(cached_path), error=str(exc))
+            with contextlib.suppress(OSError):
+                cached_path.unlink()
+
+    sess_options = _session_options(ort.GraphOptimizationLevel.ORT_ENABLE_ALL)
+    staged: Path | None = None
+    if cached_path is not None:
+        try:
+            cached_path.parent.mkdir(parents=True, exist_ok=True)
+            staged = compiled_model_cache.staging_path(cached_path)
+            sess_options.optimized_model_filepath = str(staged)
+        except OSError:
+            staged = None
+    try:
+        session = ort.InferenceSession(model_path, sess_options, providers=providers)
+    except BaseException:
+        if staged is not None:
+            with contextlib.suppress(OSError):
+                staged.unlink(missing_ok=True)
+        raise
+    if cached_path is None:
+        return session, "disabled"
+    if staged is not None and compiled_model_cache.publish_staged(staged, cached_path):
+        compiled_model_cache.prune()
+        return session, "stored"
+    return session, "miss"
+
+
 class ONNXModelInstance:
     """Represents a loaded ONNX model with its labels (for high-accuracy models)."""
 
@@ -1985,6 +2233,7 @@ class ONNXModelInstance:
         self.input_size = input_size
         self.ort_providers = list(ort_providers or ["CPUExecutionProvider"])
         self.session = None
+        self.compiled_cache: str | None = None
         self.labels: list[str] = []
         self.grouped_labels: list[str] = []
         self.loaded = False
@@ -2000,7 +2249,7 @@ class ONNXModelInstance:
         if self.loaded:
             return True
 
-        if not ONNX_AVAILABLE:
+        if not _onnx_available():
             self.error = "ONNX Runtime not installed"
             log.error("ONNX Runtime not installed")
             return False
@@ -2023,19 +2272,19 @@ class ONNXModelInstance:
             return False
 
         try:
-            # Configure ONNX Runtime session with CPU optimizations
-            sess_options = ort.SessionOptions()
-            sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
-            sess_options.intra_op_num_threads = 4  # Use multiple threads
-
             # Use providers resolved by ClassifierService (already validated/fallback-aware)
             providers = list(self.ort_providers or ["CPUExecutionProvider"])
             if "CUDAExecutionProvider" in providers:
                 _preload_onnxruntime_cuda_runtime_libraries()
-            self.session = ort.InferenceSession(self.model_path, sess_options, providers=providers)
+            self.session, self.compiled_cache = _create_onnxruntime_session(self.model_path, providers)
             self.loaded = True
             self.error = None
-            log.info(f"{self.name} ONNX model loaded successfully", input_size=self.input_size, providers=providers)
+            log.info(
+                f"{self.name} ONNX model loaded successfully",
+                input_size=self.input_size,
+                providers=providers,
+                compiled_cache=self.compiled_cache,
+            )
             return True
         except Exception as e:
             self.error = f"Failed to load ONNX model: {str(e)}"
@@ -2061,6 +2310,19 @@ class ONNXModelInstance:
         arr = arr.transpose(2, 0, 1)  # HWC -> CHW (ONNX expects NCHW)
         return arr[np.newaxis, ...].astype(np.float32)  # Add batch dimension
 
+    def preprocessing_plan(self) -> dict[str, Any]:
+        """Describe everything ``_preprocess`` depends on; equal plans yield equal tensors."""
+        return _nchw_preprocessing_plan(
+            self.input_size,
+            self.preprocessing,
+            self.mean,
+            self.std,
+            uint8_passthrough=self.preprocessing.get("normalization") == "uint8",
+        )
+
+    def preprocess(self, image: Image.Image) -> np.ndarray:
+        return self._preprocess(image)
+
     def _softmax(self, x: np.ndarray) -> np.ndarray:
         """Apply softmax to convert logits to probabilities."""
         return _safe_softmax(x, context=f"{self.name}:onnx")
@@ -2107,7 +2369,12 @@ class ONNXModelInstance:
             log.warning(f"{self.name} ONNX model not loaded, cannot classify")
             return []
 
-        input_tensor = self._preprocess(image)
+        return self.classify_tensor(self._preprocess(image), top_k=top_k)
+
+    def classify_tensor(self, input_tensor: np.ndarray, top_k: int = 5) -> list[dict]:
+        """Classify an already preprocessed tensor from ``preprocess``."""
+        if not self.loaded or not self.session:
+            return []
         input_name = self.session.get_inputs()[0].name
         outputs = self._run_inference(input_name, input_tensor)
         probs = self._probabilities_from_outputs(outputs)
@@ -2188,6 +2455,7 @@ class ONNXModelInstance:
             "model_path": self.model_path,
             "runtime": "onnx",
             "input_size": self.input_size,
+            "compiled_cache": self.compiled_cache,
         }
 
 
@@ -2311,6 +2579,7 @@ class OpenVINOModelInstance:
         if self.loaded:
             return True
 
+        _openvino_support()
         if not OPENVINO_AVAILABLE or OpenVINOCore is None:
             self.error = "OpenVINO runtime not installed"
             log.error("OpenVINO runtime not installed")
@@ -2337,9 +2606,7 @@ class OpenVINOModelInstance:
 
             # Enable caching so GPU model compilation isn't repeated from scratch
             # on every worker process startup, avoiding readiness timeouts.
-            cache_dir = os.getenv("OPENVINO_CACHE_DIR", "/tmp/openvino_cache")
-            os.makedirs(cache_dir, exist_ok=True)
-            self.core.set_property({"CACHE_DIR": cache_dir})
+            self.core.set_property({"CACHE_DIR": openvino_cache_dir()})
 
             model = self.core.read_model(self.model_path)
 
@@ -2449,14 +2716,25 @@ class OpenVINOModelInstance:
         arr = arr.transpose(2, 0, 1)  # NCHW
         return arr[np.newaxis, ...].astype(np.float32)
 
+    def preprocessing_plan(self) -> dict[str, Any]:
+        """Describe everything ``_preprocess`` depends on; equal plans yield equal tensors."""
+        return _nchw_preprocessing_plan(self.input_size, self.preprocessing, self.mean, self.std)
+
+    def preprocess(self, image: Image.Image) -> np.ndarray:
+        return self._preprocess(image)
+
     def _softmax(self, x: np.ndarray) -> np.ndarray:
         return _safe_softmax(x, context=f"{self.name}:openvino")
 
     def _infer_output_tensor(self, image: Image.Image) -> np.ndarray:
+        if self.compiled_model is None or self.input_name is None:
+            return np.array([])
+        return self._infer_prepared_tensor(self._preprocess(image))
+
+    def _infer_prepared_tensor(self, input_tensor: np.ndarray) -> np.ndarray:
         if self.compiled_model is None or self.input_name is None:
             return np.array([])
 
-        input_tensor = self._preprocess(image)
         # _preprocess emits NCHW [1,3,H,W]. Some exported models (e.g. MobileNet)
         # expect NHWC [1,H,W,3]; feed whatever the compiled model declares.
         try:
@@ -2477,12 +2755,15 @@ class OpenVINOModelInstance:
             raw = next(iter(outputs.values()))
         return np.asarray(raw)
 
-    def _infer_logits(self, image: Image.Image) -> np.ndarray:
-        raw = self._infer_output_tensor(image)
+    @staticmethod
+    def _first_batch_row(raw: np.ndarray) -> np.ndarray:
         if raw.ndim > 0 and raw.shape[0] == 1:
             return raw[0]
         return raw
 
+    def _infer_logits(self, image: Image.Image) -> np.ndarray:
+        return self._first_batch_row(self._infer_output_tensor(image))
+
     def classify(self, image: Image.Image, top_k: int = 5, input_context: Any | None = None) -> list[dict]:
         if not self.loaded or self.compiled_model is None:
             log.warning(f"{self.name} OpenVINO model not loaded, cannot classify")
@@ -2490,39 +2771,58 @@ class OpenVINOModelInstance:
         try:
             input_tensor = self._preprocess(image)
             logits = self._infer_logits(image)
-            if logits.size == 0:
-                return []
-            probs = self._softmax(logits)
-            if probs.size == 0:
-                raise InvalidInferenceOutputError(
-                    backend="openvino",
-                    provider=self.device_name,
-                    detail=f"{self.name} inference produced no finite probabilities",
-                    diagnostics=self._collect_runtime_diagnostics(
-                        input_tensor=input_tensor,
-                        logits=logits,
-                    ),
-                )
-            grouped_labels = _resolve_grouped_labels(
-                self.labels,
-                label_grouping=self.label_grouping,
-                existing_grouped_labels=self.grouped_labels,
-            )
-            return _build_classification_results(
-                probs,
-                self.labels,
-                top_k=top_k,
-                grouped_labels=grouped_labels,
-            )
+            return self._results_from_logits(input_tensor, logits, top_k=top_k)
         except InvalidInferenceOutputError:
             raise
         except Exception as e:
             log.error(f"OpenVINO inference failed for {self.name}", error=str(e), device=self.device_name)
+            raise self._runtime_exception_error(e) from e
+
+    def classify_tensor(self, input_tensor: np.ndarray, top_k: int = 5) -> list[dict]:
+        """Classify an already preprocessed tensor from ``preprocess``."""
+        if not self.loaded or self.compiled_model is None:
+            return []
+        try:
+            logits = self._first_batch_row(self._infer_prepared_tensor(input_tensor))
+            return self._results_from_logits(input_tensor, logits, top_k=top_k)
+        except InvalidInferenceOutputError:
+            raise
+        except Exception as e:
+            log.error(f"OpenVINO inference failed for {self.name}", error=str(e), device=self.device_name)
+            raise self._runtime_exception_error(e) from e
+
+    def _runtime_exception_error(self, exc: Exception) -> InvalidInferenceOutputError:
+        return InvalidInferenceOutputError(
+            backend="openvino",
+            provider=str(self.device_name),
+            detail=f"{self.name} runtime exception: {_summarize_runtime_exception(exc)}",
+        )
+
+    def _results_from_logits(self, input_tensor: np.ndarray, logits: np.ndarray, *, top_k: int) -> list[dict]:
+        if logits.size == 0:
+            return []
+        probs = self._softmax(logits)
+        if probs.size == 0:
             raise InvalidInferenceOutputError(
                 backend="openvino",
-                provider=str(self.device_name),
-                detail=f"{self.name} runtime exception: {_summarize_runtime_exception(e)}",
-            ) from e
+                provider=self.device_name,
+                detail=f"{self.name} inference produced no finite probabilities",
+                diagnostics=self._collect_runtime_diagnostics(
+                    input_tensor=input_tensor,
+                    logits=logits,
+                ),
+            )
+        grouped_labels = _resolve_grouped_labels(
+            self.labels,
+            label_grouping=self.label_grouping,
+            existing_grouped_labels=self.grouped_labels,
+        )
+        return _build_classification_results(
+            probs,
+            self.labels,
+            top_k=top_k,
+            grouped_labels=grouped_labels,
+        )
 
     def classify_raw(self, image: Image.Image) -> np.ndarray:
         if not self.loaded or self.compiled_model is None:
@@ -2611,11 +2911,21 @@ class ClassifierService:
                 getattr(settings.classification, "live_worker_count", image_workers) or image_workers
             )
             background_admission_capacity = int(getattr(settings.classification, "background_worker_count", 1) or 1)
+        capacity_controller = self._build_admission_capacity_controller(
+            live_admission_capacity, background_admission_capacity
+        )
+        live_executor_workers = image_workers
+        background_executor_workers = 1
+        if capacity_controller is not None:
+            live_executor_workers = max(image_workers, capacity_controller.live_bounds[1])
+            background_executor_workers = capacity_controller.background_bounds[1]
         self._image_executor = ThreadPoolExecutor(max_workers=image_workers, thread_name_prefix="ml_image_worker")
         self._live_image_executor = ThreadPoolExecutor(
-            max_workers=image_workers, thread_name_prefix="ml_live_image_worker"
+            max_workers=live_executor_workers, thread_name_prefix="ml_live_image_worker"
+        )
+        self._background_image_executor = ThreadPoolExecutor(
+            max_workers=background_executor_workers, thread_name_prefix="ml_background_worker"
         )
-        self._background_image_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ml_background_worker")
         self._video_executor = ThreadPoolExecutor(max_workers=video_workers, thread_name_prefix="ml_video_worker")
         self._image_admission_timeouts = 0
         self._live_image_admission_timeouts = 0
@@ -2625,6 +2935,7 @@ class ClassifierService:
             live_lease_timeout_seconds=CLASSIFIER_LIVE_IMAGE_LEASE_TIMEOUT_SECONDS,
             background_lease_timeout_seconds=CLASSIFIER_BACKGROUND_IMAGE_LEASE_TIMEOUT_SECONDS,
             default_queue_timeout_seconds=CLASSIFIER_IMAGE_ADMISSION_TIMEOUT_SECONDS,
+            capacity_controller=capacity_controller,
         )
         # Backward-compatible alias for any external references.
         self._executor = self._image_executor
@@ -2661,6 +2972,8 @@ class ClassifierService:
                 worker_ready_timeout_seconds=float(
                     getattr(settings.classification, "worker_ready_timeout_seconds", 20.0) or 20.0
                 ),
+                hot_standby=bool(getattr(settings.classification, "worker_hot_standby_enabled", False)),
+                video_preemption=CLASSIFIER_VIDEO_PREEMPTION_ENABLED,
                 video_worker_ready_timeout_seconds=max(
                     float(getattr(settings.classification, "worker_ready_timeout_seconds", 20.0) or 20.0),
                     min(60.0, max(30.0, video_timeout_seconds / 2.0)),
@@ -2693,6 +3006,8 @@ class ClassifierService:
             cooldown_seconds=CLASSIFIER_LIVE_GPU_LEASE_FALLBACK_COOLDOWN_SECONDS,
         )
         self._bird_model_artifact_metadata: dict[str, Any] = {}
+        self._inference_memo_model_stamp: tuple[Any, ...] | None = None
+        self._inference_memo_model_sha256: str | None = None
         self._model_config_warnings: list[str] = []
         self._bird_model_compatibility: dict[str, Any] = {}
         self._accel_caps_ttl_seconds = CLASSIFIER_ACCEL_PROBE_TTL_SECONDS
@@ -2707,6 +3022,20 @@ class ClassifierService:
                 startup_status.mark_failed("loading_model")
                 raise
             startup_status.publish("model_ready" if self.model_loaded else "model_unavailable", 60)
+        self._request_label_taxonomy_preload()
+
+    def _request_label_taxonomy_preload(self) -> None:
+        """Resolve the active bird model's labels into the in-memory taxonomy table (web process only)."""
+        if self._worker_process_mode:
+            return
+        from app.services.taxonomy.label_taxonomy_table import label_taxonomy_table
+
+        try:
+            labels = list(self.labels)
+        except Exception as exc:
+            log.warning("Label taxonomy preload skipped", error=str(exc))
+            return
+        label_taxonomy_table.request_rebuild(labels, model_key=self._resolve_active_model_id())
 
     def _get_model_paths(self, model_file: str, labels_file: str) -> tuple[str, str]:
         """Get full paths for model and labels files."""
@@ -2798,7 +3127,7 @@ class ClassifierService:
         startup_self_test_enabled = _openvino_gpu_startup_self_test_enabled() and not self._worker_process_mode
         return {
             "startup_self_test_enabled": startup_self_test_enabled,
-            "cache_dir": os.getenv("OPENVINO_CACHE_DIR", "/tmp/openvino_cache"),
+            "cache_dir": openvino_cache_dir(),
             "requested_compile_properties": {
                 "PERFORMANCE_HINT": "LATENCY",
                 "NUM_STREAMS": "1",
@@ -4048,6 +4377,7 @@ class ClassifierService:
             # should be using supervisor workers instead.
             if self._worker_process_mode or self._image_execution_mode != "subprocess":
                 self._init_bird_model()
+        self._request_label_taxonomy_preload()
 
         # 2. If we have a supervisor (main process in subprocess mode),
         # tell it to restart all workers to pick up the new model.
@@ -4199,6 +4529,43 @@ class ClassifierService:
             "starvation_relief_active": bool(admission_metrics.get("background_starvation_relief_active")),
         }
 
+    def _build_admission_capacity_controller(
+        self, live_capacity: int, background_capacity: int
+    ) -> AdmissionCapacityController | None:
+        if not CLASSIFIER_ADAPTIVE_CAPACITY_ENABLED:
+            return None
+        if self._image_execution_mode == "subprocess":
+            # Supervisor worker pools have a fixed process count, so admission can only
+            # shed background leases below the pool size; it never grows past a pool.
+            live_bounds = (live_capacity, live_capacity)
+            background_bounds = (1, background_capacity)
+        else:
+            live_bounds = (live_capacity, max(live_capacity, CLASSIFIER_ADAPTIVE_LIVE_MAX_CAPACITY))
+            background_bounds = (1, max(background_capacity, CLASSIFIER_ADAPTIVE_BACKGROUND_MAX_CAPACITY))
+        # A private sampler keeps its CPU deltas independent of the telemetry endpoint's.
+        cpu_sampler = SystemTelemetrySampler()
+        return AdmissionCapacityController(
+            live_bounds=live_bounds,
+            background_bounds=background_bounds,
+            interval_seconds=CLASSIFIER_ADAPTIVE_CAPACITY_INTERVAL_SECONDS,
+            live_queue_wait_target_seconds=min(0.1, CLASSIFIER_LIVE_IMAGE_ADMISSION_TIMEOUT_SECONDS / 2.0),
+            cpu_high_percent=CLASSIFIER_ADAPTIVE_CPU_HIGH_PERCENT,
+            cpu_low_percent=CLASSIFIER_ADAPTIVE_CPU_HIGH_PERCENT - 25.0,
+            lease_latency_inflation_provider=self._admission_lease_latency_inflation,
+            cpu_percent_provider=lambda: cpu_sampler.sample().cpu_percent,
+        )
+
+    def _admission_lease_latency_inflation(self) -> float | None:
+        """Largest runtime lease-latency p95 relative to its benchmark baseline."""
+        inflation: float | None = None
+        for runtime in self._inference_health.snapshot()["runtimes"].values():
+            baseline = runtime.get("baseline_p95_latency_seconds")
+            p95 = (runtime.get("latency_seconds") or {}).get("p95")
+            if not isinstance(baseline, (int, float)) or baseline <= 0 or not isinstance(p95, (int, float)):
+                continue
+            inflation = max(inflation or 0.0, p95 / baseline)
+        return inflation
+
     def get_admission_status(self) -> dict:
         admission_metrics = self._classification_admission.get_metrics()
         status = {
@@ -4221,6 +4588,7 @@ class ClassifierService:
             "background_throttled": bool(admission_metrics["background_throttled"]),
             "background_starvation_relief_active": bool(admission_metrics.get("background_starvation_relief_active")),
             "late_completions_ignored": int(admission_metrics["late_completions_ignored"]),
+            "capacity_controller": admission_metrics.get("capacity_controller"),
         }
         supervisor_metrics = self._get_supervisor_metrics()
         if supervisor_metrics is not None:
@@ -4242,7 +4610,8 @@ class ClassifierService:
         ) or self._inference_health.most_recent_recovery()
 
         # Determine which TFLite runtime is actually in use
-        tflite_type = _tflite_runtime_name() if tflite is not None else "none"
+        tflite_type = _tflite_runtime_name() if _tflite_module() is not None else "none"
+        openvino_installed = bool(_openvino_status()["available"])
 
         runtime_recovery = {
             "invalid_output_failures": self._runtime_invalid_output_failures,
@@ -4285,8 +4654,11 @@ class ClassifierService:
             "execution_mode": self._image_execution_mode,
             "runtimes": {
                 "tflite": {"installed": tflite is not None, "type": tflite_type},
-                "onnx": {"installed": ONNX_AVAILABLE, "available": ort is not None},
-                "openvino": {"installed": OPENVINO_AVAILABLE, "available": OpenVINOCore is not None},
+                "onnx": {"installed": _onnx_available(), "available": ort is not None},
+                "openvino": {
+                    "installed": openvino_installed,
+                    "available": openvino_installed if OpenVINOCore is _UNPROBED else OpenVINOCore is not None,
+                },
             },
             "models": {
                 name: {
@@ -4408,8 +4780,8 @@ class ClassifierService:
             "packaged_inference_providers": list(packaged_providers),
             "image_flavor_warning": image_flavor_warning(image_flavor, selected_provider),
             "runtime": _tflite_runtime_name(),
-            "runtime_installed": tflite is not None,
-            "onnx_available": ONNX_AVAILABLE,
+            "runtime_installed": _tflite_module() is not None,
+            "onnx_available": _onnx_available(),
             "active_model_id": active_model_id,
             "effective_model_id": effective_model_id,
             "openvino_available": bool(self._accel_caps.get("openvino_available")),
@@ -4602,6 +4974,102 @@ class ClassifierService:
         configured_model = str(getattr(settings.classification, "model", "") or "").strip()
         return configured_model or "unknown"
 
+    def _resolve_inference_memo_model_sha256(self, spec: dict[str, Any]) -> str | None:
+        """Fingerprint the active model artifact and labels; rehashed only when the files change."""
+        model_path = str(spec.get("model_path") or "")
+        paths = (model_path, f"{model_path}.data", str(spec.get("labels_path") or ""))
+        stamp_parts: list[Any] = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                stamp_parts.append((path, stat.st_size, stat.st_mtime_ns))
+            except OSError:
+                stamp_parts.append((path, None))
+        if stamp_parts[0][1] is None:
+            return None
+        stamp = tuple(stamp_parts)
+        if stamp != self._inference_memo_model_stamp:
+            metadata = _extract_model_artifact_metadata(model_path)
+            model_sha256 = metadata.get("model_sha256")
+            digest = None
+            if model_sha256:
+                digest = hashlib.sha256(
+                    "|".join(
+                        str(value or "")
+                        for value in (model_sha256, metadata.get("weights_sha256"), _safe_sha256_file(paths[2]))
+                    ).encode("utf-8")
+                ).hexdigest()
+            self._inference_memo_model_stamp = stamp
+            self._inference_memo_model_sha256 = digest
+        return self._inference_memo_model_sha256
+
+    def _inference_memo_key_sync(
+        self,
+        kind: str,
+        media_sha256: str | None,
+        input_context: ClassificationInputContext,
+        params: dict[str, Any],
+    ) -> InferenceMemoKey | None:
+        if not media_sha256:
+            return None
+        spec = self._resolve_active_bird_model_spec()
+        model_sha256 = self._resolve_inference_memo_model_sha256(spec)
+        if not model_sha256:
+            return None
+        policy = {
+            "kind": kind,
+            "model_id": spec.get("model_id"),
+            "input_size": spec.get("input_size"),
+            "preprocessing": spec.get("preprocessing"),
+            "label_grouping": spec.get("label_grouping"),
+            "crop_generator": spec.get("crop_generator"),
+            "crop_policy": bird_crop_service.get_classification_candidate_crop_policy(),
+            "crop_models": bird_crop_service.get_model_fingerprint(),
+            "classification_settings": settings.classification.model_dump(),
+            "input_context": input_context.model_dump(),
+            **params,
+        }
+        return InferenceMemoKey(
+            kind=kind,
+            media_sha256=media_sha256,
+            model_sha256=model_sha256,
+            policy_sha256=policy_sha256(policy),
+        )
+
+    async def _inference_memo_key(
+        self,
+        kind: Literal["image", "video"],
+        media: Any,
+        input_context: ClassificationInputContext,
+        **params: Any,
+    ) -> InferenceMemoKey | None:
+        """Key a reprocessing request by media content, model artifact and preprocessing/crop policy."""
+
+        def build() -> InferenceMemoKey | None:
+            media_sha256 = image_content_sha256(media) if kind == "image" else file_content_sha256(media)
+            return self._inference_memo_key_sync(kind, media_sha256, input_context, params)
+
+        try:
+            return await asyncio.to_thread(build)
+        except Exception as exc:
+            log.debug("Inference memo key unavailable; running inference", kind=kind, error=str(exc))
+            return None
+
+    async def _with_inference_memo(
+        self,
+        memo_key: InferenceMemoKey | None,
+        run: Callable[[], Awaitable[list[dict]]],
+    ) -> list[dict]:
+        if memo_key is None:
+            return await run()
+        entry = await inference_memo.get(memo_key)
+        if entry is not None:
+            return entry.results
+        results = await run()
+        if results:
+            await inference_memo.put(memo_key, results)
+        return results
+
     def _input_context_extra(self, input_context: ClassificationInputContext, key: str) -> Any | None:
         extra = getattr(input_context, "__pydantic_extra__", {}) or {}
         if key in extra:
@@ -4631,72 +5099,43 @@ class ClassifierService:
             }
         return None
 
+    def _video_track_index(self, input_context: ClassificationInputContext) -> EventTrackIndex | None:
+        """Event track for a clip: the cached index when supplied, else built from the path hints."""
+        cached = EventTrackIndex.from_dict(self._input_context_extra(input_context, "frigate_track_index"))
+        if cached is not None:
+            return cached
+        return EventTrackIndex.from_path_data(
+            self._input_context_extra(input_context, "frigate_path_data"),
+            self._input_context_extra(input_context, "frigate_box"),
+        )
+
     def _tracked_frigate_box_for_frame(
         self,
         input_context: ClassificationInputContext,
         *,
         frame_offset_seconds: float | None,
+        track_index: EventTrackIndex | None = None,
     ) -> list[float] | None:
         """Align Frigate's tracked path with the actual clip timeline."""
-        raw_path_data = self._input_context_extra(input_context, "frigate_path_data")
-        raw_box = self._input_context_extra(input_context, "frigate_box")
-        raw_clip_start = self._input_context_extra(input_context, "clip_start_timestamp")
-        if (
-            not isinstance(raw_path_data, list)
-            or not isinstance(raw_box, (list, tuple))
-            or len(raw_box) != 4
-            or frame_offset_seconds is None
-        ):
+        if track_index is None:
+            track_index = self._video_track_index(input_context)
+        if track_index is None or track_index.box_size is None or frame_offset_seconds is None:
             return None
         try:
-            clip_start = float(raw_clip_start)
+            clip_start = float(self._input_context_extra(input_context, "clip_start_timestamp"))
             offset = float(frame_offset_seconds)
-            _left, _top, width, height = [float(value) for value in raw_box]
         except (TypeError, ValueError):
             return None
-        if (
-            not all(math.isfinite(value) for value in (clip_start, offset, width, height))
-            or offset < 0.0
-            or not (0.0 < width <= 1.0)
-            or not (0.0 < height <= 1.0)
-        ):
-            return None
-
-        path_points: list[tuple[float, float, float]] = []
-        for item in raw_path_data:
-            if not isinstance(item, (list, tuple)) or len(item) < 2:
-                continue
-            point = item[0]
-            if not isinstance(point, (list, tuple)) or len(point) < 2:
-                continue
-            try:
-                x = float(point[0])
-                y = float(point[1])
-                timestamp = float(item[1])
-            except (TypeError, ValueError):
-                continue
-            if all(math.isfinite(value) for value in (x, y, timestamp)) and 0.0 <= x <= 1.0 and 0.0 <= y <= 1.0:
-                path_points.append((timestamp, x, y))
-        if not path_points:
-            return None
-
-        target_timestamp = clip_start + offset
-        point_timestamp, bottom_center_x, bottom_y = min(
-            path_points,
-            key=lambda item: abs(item[0] - target_timestamp),
-        )
-        if abs(point_timestamp - target_timestamp) > 0.75:
+        if not all(math.isfinite(value) for value in (clip_start, offset)) or offset < 0.0:
             return None
-
-        left = max(0.0, min(1.0 - width, bottom_center_x - width / 2.0))
-        top = max(0.0, min(1.0 - height, bottom_y - height))
-        return [left, top, width, height]
+        return track_index.box_at(clip_start + offset, max_distance_seconds=0.75)
 
     def _video_frame_input_context(
         self,
         input_context: ClassificationInputContext,
         *,
         frame_offset_seconds: float | None,
+        track_index: EventTrackIndex | None = None,
     ) -> ClassificationInputContext:
         """Return crop hints that are valid at this frame's clip timestamp.
 
@@ -4709,13 +5148,15 @@ class ClassifierService:
         frame_context_payload = dict(input_context.model_dump())
         clip_variant = str(self._input_context_extra(input_context, "clip_variant") or "event").strip().lower()
         raw_path_data = self._input_context_extra(input_context, "frigate_path_data")
-        requires_time_aligned_hint = clip_variant == "recording" or bool(raw_path_data)
+        requires_time_aligned_hint = clip_variant == "recording" or bool(raw_path_data) or track_index is not None
         if requires_time_aligned_hint:
             frame_context_payload.pop("frigate_box", None)
             frame_context_payload.pop("frigate_region", None)
+            frame_context_payload.pop("frigate_track_index", None)
             tracked_box = self._tracked_frigate_box_for_frame(
                 input_context,
                 frame_offset_seconds=frame_offset_seconds,
+                track_index=track_index,
             )
             if tracked_box is not None:
                 frame_context_payload["frigate_box"] = tracked_box
@@ -5436,7 +5877,10 @@ class ClassifierService:
     ) -> list[dict]:
         async def _runner() -> list[dict]:
             loop = asyncio.get_running_loop()
-            return await loop.run_in_executor(executor, fn, *args)
+            if priority != "live":
+                return await loop.run_in_executor(executor, fn, *args)
+            async with self._video_preemption_scope():
+                return await loop.run_in_executor(executor, fn, *args)
 
         return await self._run_coordinated_inference(
             priority,
@@ -5446,6 +5890,13 @@ class ClassifierService:
             context=context,
         )
 
+    def _video_preemption_scope(self) -> contextlib.AbstractAsyncContextManager[None]:
+        """Pause in-flight worker video classification while in-process live inference runs."""
+        supervisor = self._video_supervisor
+        if isinstance(supervisor, ClassifierSupervisor) and supervisor is not self._classifier_supervisor:
+            return supervisor.live_work()
+        return contextlib.nullcontext()
+
     async def _abort_supervised_request_after_lease_expiry(
         self,
         *,
@@ -5595,12 +6046,22 @@ class ClassifierService:
         camera_name: Optional[str] = None,
         model_id: Optional[str] = None,
         input_context: Any | None = None,
+        *,
+        memoize: bool = False,
     ) -> list[dict]:
-        """Async wrapper for classify to prevent blocking the event loop."""
+        """Async wrapper for classify to prevent blocking the event loop.
+
+        ``memoize`` is for reprocessing: an unchanged image under an unchanged
+        model and policy reuses the stored result instead of re-inferring.
+        """
         normalized_input_context = _normalize_classification_input_context(input_context)
+        memo_key = await self._inference_memo_key("image", image, normalized_input_context) if memoize else None
         try:
-            base_results = await self._run_image_inference(
-                self.classify, image, camera_name, model_id, normalized_input_context
+            base_results = await self._with_inference_memo(
+                memo_key,
+                lambda: self._run_image_inference(
+                    self.classify, image, camera_name, model_id, normalized_input_context
+                ),
             )
         except BackgroundImageClassificationUnavailableError:
             return []
@@ -5683,27 +6144,31 @@ class ClassifierService:
         model_id: Optional[str] = None,
         input_context: Any | None = None,
         queue_timeout_seconds: float | None = None,
+        *,
+        memoize: bool = False,
     ) -> list[dict]:
         """Background image-classification path using low-priority workers.
 
         Intended for backfill/batch-style work so live MQTT classification
-        remains responsive under sustained load.
+        remains responsive under sustained load. With ``memoize`` an unchanged
+        image under an unchanged model and policy skips inference entirely.
         """
         normalized_input_context = _normalize_classification_input_context(input_context)
         context = self._classification_admission_context(model_id=model_id)
-        if self._image_execution_mode == "subprocess":
-            base_results = await self._run_coordinated_supervised_inference(
-                "background",
-                "background_image_inference",
-                image,
-                camera_name,
-                model_id,
-                normalized_input_context,
-                queue_timeout_seconds=queue_timeout_seconds,
-                context=context,
-            )
-        else:
-            base_results = await self._run_coordinated_executor_inference(
+
+        async def run() -> list[dict]:
+            if self._image_execution_mode == "subprocess":
+                return await self._run_coordinated_supervised_inference(
+                    "background",
+                    "background_image_inference",
+                    image,
+                    camera_name,
+                    model_id,
+                    normalized_input_context,
+                    queue_timeout_seconds=queue_timeout_seconds,
+                    context=context,
+                )
+            return await self._run_coordinated_executor_inference(
                 "background",
                 self._background_image_executor,
                 "background_image_inference",
@@ -5716,6 +6181,9 @@ class ClassifierService:
                 context=context,
             )
 
+        memo_key = await self._inference_memo_key("image", image, normalized_input_context) if memoize else None
+        base_results = await self._with_inference_memo(memo_key, run)
+
         if not base_results:
             return base_results
         if not bool(getattr(settings.classification, "personalized_rerank_enabled", False)):
@@ -5742,6 +6210,44 @@ class ClassifierService:
             )
             return base_results
 
+    async def classify_batch_async_background(
+        self,
+        images: list[Image.Image],
+        *,
+        input_contexts: list[Any | None] | None = None,
+        queue_timeout_seconds: float | None = None,
+    ) -> list[list[dict]]:
+        """Classify several images on the background path in one call.
+
+        All images are submitted together so the admission queue and the
+        background workers see the whole batch at once instead of one image
+        per round trip. Results keep the input order; an image whose
+        classification fails yields an empty list rather than failing the batch.
+        """
+        contexts = list(input_contexts or [])
+        contexts.extend([None] * (len(images) - len(contexts)))
+        outcomes = await asyncio.gather(
+            *(
+                self.classify_async_background(
+                    image,
+                    input_context=context,
+                    queue_timeout_seconds=queue_timeout_seconds,
+                )
+                for image, context in zip(images, contexts)
+            ),
+            return_exceptions=True,
+        )
+        results: list[list[dict]] = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                if isinstance(outcome, asyncio.CancelledError):
+                    raise outcome
+                log.debug("Background batch classification item failed", error=str(outcome))
+                results.append([])
+            else:
+                results.append(outcome)
+        return results
+
     def classify_wildlife(self, image: Image.Image, input_context: Any | None = None) -> list[dict]:
         """Classify an image using the wildlife model."""
         wildlife = self._get_wildlife_model()
@@ -5805,6 +6311,7 @@ class ClassifierService:
         max_frames: Optional[int] = None,
         progress_callback=None,
         input_context: Any | None = None,
+        preemption_point=None,
     ) -> list[dict]:
         """
         Classify a video clip using Temporal Ensemble (Soft Voting) with Normal Distribution sampling.
@@ -5814,6 +6321,8 @@ class ClassifierService:
             stride: Legacy parameter, no longer used for sampling but kept for API compatibility.
             max_frames: Maximum number of frames to process.
             progress_callback: Optional callback function.
+            preemption_point: Optional callable invoked between frames with the frames done so far,
+                the frame total and the per-source score accumulators; it may block to yield to live work.
 
         Returns:
             List of classifications with aggregated scores.
@@ -5845,11 +6354,27 @@ class ClassifierService:
 
             sample_count = min(max_frames, total_frames)
             clip_variant = str(self._input_context_extra(normalized_input_context, "clip_variant") or "event")
-            frame_indices = _select_video_frame_indices(
+            track_index = self._video_track_index(normalized_input_context)
+            try:
+                clip_start = float(self._input_context_extra(normalized_input_context, "clip_start_timestamp"))
+            except (TypeError, ValueError):
+                clip_start = None
+            frame_indices = _select_tracked_video_frame_indices(
+                track_index,
+                clip_start=clip_start if clip_start is not None and math.isfinite(clip_start) else None,
+                fps=float(fps or 0.0),
                 total_frames=total_frames,
                 sample_count=sample_count,
                 clip_variant=clip_variant,
             )
+            frame_sampling = "event_track"
+            if frame_indices is None:
+                frame_sampling = "clip_distribution"
+                frame_indices = _select_video_frame_indices(
+                    total_frames=total_frames,
+                    sample_count=sample_count,
+                    clip_variant=clip_variant,
+                )
 
             if bool(normalized_input_context.is_cropped):
                 supplied_source = str(
@@ -5893,6 +6418,8 @@ class ClassifierService:
             last_frame_thumb = None
 
             for i, idx in enumerate(frame_indices, 1):
+                if preemption_point is not None:
+                    preemption_point(i - 1, len(frame_indices), scores_by_input_source)
                 # Seek to frame
                 cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
                 ret, frame = cap.read()
@@ -5923,6 +6450,7 @@ class ClassifierService:
                 frame_input_context = self._video_frame_input_context(
                     normalized_input_context,
                     frame_offset_seconds=frame_offset_sec,
+                    track_index=track_index,
                 )
 
                 candidate_scores: dict[str, np.ndarray] = {}
@@ -6092,6 +6620,7 @@ class ClassifierService:
                 "maximum_pooled_frames": VIDEO_SPARSE_POOL_MAX_FRAMES,
                 "minimum_frame_separation_seconds": VIDEO_MIN_FRAME_SEPARATION_SECONDS,
                 "sampled_frames": len(frame_indices),
+                "frame_sampling": frame_sampling,
                 "processed_frames": processed_frame_count,
                 "minimum_frame_score": round(minimum_frame_score, 4),
                 "sources": consensus_diagnostics,
@@ -6189,23 +6718,16 @@ class ClassifierService:
             if cap is not None:
                 cap.release()
 
-    async def classify_video_async(
+    async def _run_video_inference(
         self,
         video_path: str,
-        stride: int = 5,
-        max_frames: Optional[int] = None,
-        progress_callback=None,
-        camera_name: Optional[str] = None,
-        model_id: Optional[str] = None,
-        input_context: Any | None = None,
-        propagate_worker_failure: bool = False,
-        diagnostics_callback: Callable[[dict[str, Any]], Awaitable[None] | None] | None = None,
+        stride: int,
+        max_frames: int,
+        progress_callback,
+        normalized_input_context: ClassificationInputContext,
+        *,
+        propagate_worker_failure: bool,
     ) -> list[dict]:
-        """Async wrapper for video classification."""
-        normalized_input_context = _normalize_classification_input_context(input_context)
-        if max_frames is None:
-            max_frames = settings.classification.video_classification_frames
-
         if self._video_supervisor is not None:
             work_id = f"video-{time.monotonic_ns()}"
             lease_token = 1
@@ -6311,6 +6833,155 @@ class ClassifierService:
                     normalized_input_context,
                 )
 
+        return base_results
+
+    async def _replay_memoized_video(self, entry: InferenceMemoEntry, progress_callback) -> list[dict]:
+        """Rebuild a video result from the memo, re-emitting the recorded per-frame progress."""
+        diagnostics = dict(entry.diagnostics or {})
+        if progress_callback is not None:
+            for frame in diagnostics.get("frames") or []:
+                if not isinstance(frame, list) or len(frame) != 8:
+                    continue
+                current_frame, total_frames, frame_score, top_label, frame_index, clip_total, model_name, offset = frame
+                try:
+                    callback_result = progress_callback(
+                        current_frame,
+                        total_frames,
+                        frame_score,
+                        top_label,
+                        None,
+                        frame_index,
+                        clip_total,
+                        model_name,
+                        offset,
+                    )
+                    if inspect.isawaitable(callback_result):
+                        await callback_result
+                except Exception as exc:
+                    log.debug("Memoized video progress replay failed", error=str(exc))
+        results = list(entry.results)
+        video_diagnostics = diagnostics.get("video_diagnostics")
+        if isinstance(video_diagnostics, dict):
+            results.append({"_video_diagnostics": {**video_diagnostics, "inference_memo": "hit"}})
+        return results
+
+    async def classify_video_async(
+        self,
+        video_path: str,
+        stride: int = 5,
+        max_frames: Optional[int] = None,
+        progress_callback=None,
+        camera_name: Optional[str] = None,
+        model_id: Optional[str] = None,
+        input_context: Any | None = None,
+        propagate_worker_failure: bool = False,
+        diagnostics_callback: Callable[[dict[str, Any]], Awaitable[None] | None] | None = None,
+        *,
+        memoize: bool = False,
+    ) -> list[dict]:
+        """Async wrapper for video classification.
+
+        With ``memoize`` an unchanged clip under an unchanged model and policy
+        replays the stored result, frame scores and diagnostics instead of
+        decoding and classifying the clip again.
+        """
+        normalized_input_context = _normalize_classification_input_context(input_context)
+        if max_frames is None:
+            max_frames = settings.classification.video_classification_frames
+
+        memo_key = None
+        if memoize:
+            memo_key = await self._inference_memo_key(
+                "video",
+                video_path,
+                normalized_input_context,
+                stride=stride,
+                max_frames=max_frames,
+            )
+        memo_entry = await inference_memo.get(memo_key) if memo_key is not None else None
+        if memo_entry is not None:
+            base_results = await self._replay_memoized_video(memo_entry, progress_callback)
+        elif memo_key is not None:
+            recorded_frames: list[list[Any]] = []
+
+            async def recording_progress_callback(
+                current_frame,
+                total_frames,
+                frame_score,
+                top_label,
+                frame_thumb=None,
+                frame_index=None,
+                clip_total=None,
+                model_name=None,
+                frame_offset_seconds=None,
+            ):
+                recorded_frames.append(
+                    [
+                        current_frame,
+                        total_frames,
+                        frame_score,
+                        top_label,
+                        frame_index,
+                        clip_total,
+                        model_name,
+                        frame_offset_seconds,
+                    ]
+                )
+                if progress_callback is None:
+                    return
+                callback_result = progress_callback(
+                    current_frame,
+                    total_frames,
+                    frame_score,
+                    top_label,
+                    frame_thumb,
+                    frame_index,
+                    clip_total,
+                    model_name,
+                    frame_offset_seconds,
+                )
+                if inspect.isawaitable(callback_result):
+                    await callback_result
+
+            base_results = await self._run_video_inference(
+                video_path,
+                stride,
+                max_frames,
+                recording_progress_callback,
+                normalized_input_context,
+                propagate_worker_failure=propagate_worker_failure,
+            )
+            memo_results = [
+                item
+                for item in base_results
+                if not (isinstance(item, dict) and isinstance(item.get("_video_diagnostics"), dict))
+            ]
+            if memo_results:
+                await inference_memo.put(
+                    memo_key,
+                    memo_results,
+                    diagnostics={
+                        "video_diagnostics": next(
+                            (
+                                item["_video_diagnostics"]
+                                for item in base_results
+                                if isinstance(item, dict) and isinstance(item.get("_video_diagnostics"), dict)
+                            ),
+                            None,
+                        ),
+                        "frames": recorded_frames,
+                    },
+                )
+        else:
+            base_results = await self._run_video_inference(
+                video_path,
+                stride,
+                max_frames,
+                progress_callback,
+                normalized_input_context,
+                propagate_worker_failure=propagate_worker_failure,
+            )
+
         diagnostics = next(
             (
                 item.get("_video_diagnostics")
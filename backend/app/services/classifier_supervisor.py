@@ -1,13 +1,20 @@
 import asyncio
+import contextlib
 import inspect
 import itertools
 import time
 from collections import deque
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Literal
+from typing import Any, AsyncIterator, Awaitable, Callable, Literal
 
 from .classifier_worker_client import ClassifierWorkerClient
-from .classifier_worker_protocol import build_classify_request, build_classify_video_request
+from .classifier_worker_protocol import (
+    build_classify_request,
+    build_classify_video_request,
+    build_preempt_request,
+    build_resume_request,
+)
 
 
 WorkPriority = Literal["live", "background", "video"]
@@ -54,6 +61,46 @@ class _Assignment:
     started_at: float
     future: asyncio.Future[list[dict[str, Any]]]
     progress_callback: Callable[..., Awaitable[None] | None] | None = None
+    preempted_at: float | None = None
+    paused_seconds: float = 0.0
+    reported_paused_seconds: float = 0.0
+    last_pause_reported_at: float | None = None
+
+    def elapsed_seconds(self, now: float) -> float:
+        """Time spent on the request, excluding time a video spent preempted by live work."""
+        paused = self.paused_seconds + (now - self.preempted_at if self.preempted_at is not None else 0.0)
+        return now - self.started_at - paused
+
+
+@dataclass
+class VideoPauseClock:
+    """Preemption pauses of the video request dispatched under this context.
+
+    Callers that put their own deadline around video classification extend it
+    by ``paused_seconds()``, so time spent yielding to live work is not counted.
+    """
+
+    assignment: _Assignment | None = None
+
+    def paused_seconds(self, now: float | None = None) -> float:
+        assignment = self.assignment
+        if assignment is None:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        paused = assignment.reported_paused_seconds
+        # A pause the worker has not reported yet (it reports once it resumes).
+        if (
+            assignment.preempted_at is not None
+            and not assignment.future.done()
+            and (
+                assignment.last_pause_reported_at is None or assignment.last_pause_reported_at < assignment.preempted_at
+            )
+        ):
+            paused += now - assignment.preempted_at
+        return paused
+
+
+current_video_pause_clock: ContextVar[VideoPauseClock | None] = ContextVar("current_video_pause_clock", default=None)
 
 
 class ClassifierSupervisor:
@@ -74,6 +121,8 @@ class ClassifierSupervisor:
         restart_window_seconds: float = 60.0,
         restart_threshold: int = 3,
         breaker_cooldown_seconds: float = 60.0,
+        hot_standby: bool = False,
+        video_preemption: bool = True,
     ) -> None:
         self._worker_counts = {
             "live": max(1, int(live_worker_count)),
@@ -125,6 +174,9 @@ class ClassifierSupervisor:
                 "last_runtime_recovery": None,
                 "circuit_open": False,
                 "circuit_open_until_monotonic": None,
+                "last_startup_seconds": None,
+                "standby_ready": False,
+                "standby_promotions": 0,
             },
             "background": {
                 "workers": 0,
@@ -135,6 +187,9 @@ class ClassifierSupervisor:
                 "last_runtime_recovery": None,
                 "circuit_open": False,
                 "circuit_open_until_monotonic": None,
+                "last_startup_seconds": None,
+                "standby_ready": False,
+                "standby_promotions": 0,
             },
             "video": {
                 "workers": 0,
@@ -145,6 +200,13 @@ class ClassifierSupervisor:
                 "last_runtime_recovery": None,
                 "circuit_open": False,
                 "circuit_open_until_monotonic": None,
+                "last_startup_seconds": None,
+                "standby_ready": False,
+                "standby_promotions": 0,
+                "preemption_requests": 0,
+                "preemptions": 0,
+                "preemption_delay_seconds": 0.0,
+                "last_preemption": None,
             },
             "late_results_ignored": 0,
         }
@@ -172,6 +234,24 @@ class ClassifierSupervisor:
         # large "Elite" models.
         self._global_init_lock = asyncio.Lock()
 
+        # Optional pre-loaded spare per priority. Replacing a crashed or hung
+        # worker then swaps in a ready process instead of paying a full model
+        # load while live work waits.
+        self._hot_standby = bool(hot_standby)
+        self._standby_workers: dict[WorkPriority, Any | None] = {"live": None, "background": None, "video": None}
+        self._standby_tasks: dict[WorkPriority, asyncio.Task[None] | None] = {
+            "live": None,
+            "background": None,
+            "video": None,
+        }
+
+        # Cooperative preemption: while live requests are in flight, busy video
+        # workers pause between frames (see ClassifierWorkerProcess) so live
+        # inference gets the host's cores, and resume once live work drains.
+        self._video_preemption = bool(video_preemption)
+        self._live_requests_in_flight = 0
+        self._preempted_video_workers: set[str] = set()
+
     async def start(self, priority: WorkPriority | None = None) -> None:
         priorities: tuple[WorkPriority, ...]
         if priority is None:
@@ -196,6 +276,8 @@ class ClassifierSupervisor:
                 await self._watchdog_task
             except asyncio.CancelledError:
                 pass
+        for priority in ("live", "background", "video"):
+            await self._discard_standby(priority)
         for priority in ("live", "background", "video"):
             for slot in self._slots[priority]:
                 if slot.worker is not None:
@@ -226,6 +308,8 @@ class ClassifierSupervisor:
             priorities = (priority,)
 
         for p in priorities:
+            # A standby loaded the previous configuration; never promote it.
+            await self._discard_standby(p)
             async with self._start_locks[p]:
                 for index, slot in enumerate(list(self._slots[p])):
                     if slot.worker is not None:
@@ -240,6 +324,7 @@ class ClassifierSupervisor:
                             ),
                             kill=True,
                         )
+            self._schedule_standby(p)
 
     def get_metrics(self) -> dict[str, Any]:
         return {
@@ -312,6 +397,74 @@ class ClassifierSupervisor:
         lease_token: int,
         build_message: Callable[[_WorkerSlot, str], dict[str, Any]],
         progress_callback: Callable[..., Awaitable[None] | None] | None = None,
+    ) -> list[dict[str, Any]]:
+        live_work = self.live_work() if priority == "live" else contextlib.nullcontext()
+        async with live_work:
+            return await self._dispatch_request(
+                priority=priority,
+                work_id=work_id,
+                lease_token=lease_token,
+                build_message=build_message,
+                progress_callback=progress_callback,
+            )
+
+    @contextlib.asynccontextmanager
+    async def live_work(self) -> AsyncIterator[None]:
+        """Hold busy video workers paused between frames while live inference runs.
+
+        Live requests through this supervisor enter it automatically; in-process
+        live inference enters it around its own executor call.
+        """
+        if not self._video_preemption:
+            yield
+            return
+        self._live_requests_in_flight += 1
+        try:
+            await self._preempt_video_workers()
+            yield
+        finally:
+            self._live_requests_in_flight -= 1
+            if self._live_requests_in_flight == 0:
+                await self._resume_video_workers()
+
+    async def _preempt_video_workers(self) -> None:
+        now = time.monotonic()
+        for slot in self._slots["video"]:
+            assignment = self._assignments.get(slot.worker_name)
+            if slot.worker is None or assignment is None:
+                continue
+            if assignment.preempted_at is None:
+                assignment.preempted_at = now
+            if slot.worker_name in self._preempted_video_workers:
+                continue
+            self._preempted_video_workers.add(slot.worker_name)
+            self._metrics["video"]["preemption_requests"] += 1
+            # A worker that cannot take the message is left to the watchdog.
+            with contextlib.suppress(Exception):
+                await slot.worker.send(build_preempt_request(worker_generation=slot.worker_generation))
+
+    async def _resume_video_workers(self) -> None:
+        now = time.monotonic()
+        preempted, self._preempted_video_workers = self._preempted_video_workers, set()
+        for slot in self._slots["video"]:
+            if slot.worker_name not in preempted:
+                continue
+            assignment = self._assignments.get(slot.worker_name)
+            if assignment is not None and assignment.preempted_at is not None:
+                assignment.paused_seconds += now - assignment.preempted_at
+                assignment.preempted_at = None
+            if slot.worker is not None:
+                with contextlib.suppress(Exception):
+                    await slot.worker.send(build_resume_request(worker_generation=slot.worker_generation))
+
+    async def _dispatch_request(
+        self,
+        *,
+        priority: WorkPriority,
+        work_id: str,
+        lease_token: int,
+        build_message: Callable[[_WorkerSlot, str], dict[str, Any]],
+        progress_callback: Callable[..., Awaitable[None] | None] | None = None,
     ) -> list[dict[str, Any]]:
         await self.start(priority)
         self._refresh_circuit_state(priority)
@@ -349,6 +502,9 @@ class ClassifierSupervisor:
                 progress_callback=progress_callback,
             )
             self._assignments[slot.worker_name] = assignment
+            pause_clock = current_video_pause_clock.get()
+            if priority == "video" and pause_clock is not None:
+                pause_clock.assignment = assignment
 
         try:
             await slot.worker.send(build_message(slot, request_id))
@@ -370,6 +526,8 @@ class ClassifierSupervisor:
                 async with self._condition:
                     self._condition.notify_all()
             raise assignment_error from exc
+        if priority == "video" and self._live_requests_in_flight and self._video_preemption:
+            await self._preempt_video_workers()
         return await future
 
     async def abort_request(
@@ -457,6 +615,7 @@ class ClassifierSupervisor:
             self._metrics[priority]["workers"] = len(slots)
             self._pool_started[priority] = True
             self._metrics[priority]["workers"] = self._active_worker_count(priority)
+            self._schedule_standby(priority)
 
     async def _wait_for_idle_slot(
         self, priority: WorkPriority, request_key: tuple[WorkPriority, str, int]
@@ -495,8 +654,22 @@ class ClassifierSupervisor:
             self._metrics[priority]["workers"] = self._active_worker_count(priority)
 
     async def _spawn_worker(self, priority: WorkPriority, index: int, generation: int) -> _WorkerSlot:
-        worker_name = f"{priority}-{index}"
+        worker = await self._start_worker(
+            priority, index=index, worker_name=f"{priority}-{index}", generation=generation
+        )
+        return self._attach_worker(priority, index, generation, worker)
+
+    async def _start_worker(
+        self,
+        priority: WorkPriority,
+        *,
+        index: int,
+        worker_name: str,
+        generation: int,
+        record_failure: bool = True,
+    ) -> Any:
         worker = None
+        started_at = time.monotonic()
         try:
             if self._worker_factory is None:
                 worker = ClassifierWorkerClient(
@@ -518,14 +691,24 @@ class ClassifierSupervisor:
                 await worker.wait_until_ready(timeout_seconds=self._worker_ready_timeout_seconds[priority])
         except TimeoutError as exc:
             await self._close_failed_worker(worker)
-            self._record_start_failure(priority, worker, reason="startup_timeout")
+            if record_failure:
+                self._record_start_failure(priority, worker, reason="startup_timeout")
             raise ClassifierWorkerStartupTimeoutError(
                 f"worker startup timed out worker={worker_name} generation={generation} timeout={self._worker_ready_timeout_seconds[priority]}"
             ) from exc
+        except asyncio.CancelledError:
+            await self._close_failed_worker(worker)
+            raise
         except Exception as exc:
             await self._close_failed_worker(worker)
-            self._record_start_failure(priority, worker, reason="startup_failed")
+            if record_failure:
+                self._record_start_failure(priority, worker, reason="startup_failed")
             raise ClassifierWorkerExitedError(str(exc) or "worker failed during startup") from exc
+        self._metrics[priority]["last_startup_seconds"] = round(time.monotonic() - started_at, 3)
+        return worker
+
+    def _attach_worker(self, priority: WorkPriority, index: int, generation: int, worker: Any) -> _WorkerSlot:
+        worker_name = f"{priority}-{index}"
         consumer_task = asyncio.create_task(self._consume_worker_events(worker_name, generation, worker))
         self._consumer_tasks.add(consumer_task)
         consumer_task.add_done_callback(self._consumer_tasks.discard)
@@ -538,6 +721,55 @@ class ClassifierSupervisor:
             consumer_task=consumer_task,
         )
 
+    def _schedule_standby(self, priority: WorkPriority) -> None:
+        if not self._hot_standby or not self._pool_started[priority]:
+            return
+        if self._standby_workers[priority] is not None:
+            return
+        task = self._standby_tasks[priority]
+        if task is not None and not task.done():
+            return
+        self._standby_tasks[priority] = asyncio.create_task(self._prepare_standby(priority))
+
+    async def _prepare_standby(self, priority: WorkPriority) -> None:
+        try:
+            worker = await self._start_worker(
+                priority,
+                index=-1,
+                worker_name=f"{priority}-standby",
+                generation=1,
+                record_failure=False,
+            )
+        except (ClassifierWorkerStartupTimeoutError, ClassifierWorkerExitedError):
+            # A missing standby only costs the old cold-start path; the next
+            # replacement schedules another attempt.
+            return
+        self._standby_workers[priority] = worker
+        self._metrics[priority]["standby_ready"] = True
+
+    def _take_standby(self, priority: WorkPriority) -> Any | None:
+        worker = self._standby_workers[priority]
+        self._standby_workers[priority] = None
+        self._metrics[priority]["standby_ready"] = False
+        if worker is None:
+            return None
+        if worker.get_status().get("exit_code") is not None:
+            return None
+        return worker
+
+    async def _discard_standby(self, priority: WorkPriority) -> None:
+        task = self._standby_tasks[priority]
+        self._standby_tasks[priority] = None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        worker = self._take_standby(priority)
+        if worker is not None:
+            await self._close_failed_worker(worker)
+
     async def _close_failed_worker(self, worker: Any) -> None:
         if worker is None:
             return
@@ -618,6 +850,17 @@ class ClassifierSupervisor:
                         progress_task.add_done_callback(self._progress_tasks.discard)
                         progress_task.add_done_callback(self._consume_progress_exception)
                 continue
+            if message["type"] == "video_preemption":
+                if assignment is None or (
+                    assignment.worker_generation != generation
+                    or message.get("request_id") != assignment.request_id
+                    or message.get("work_id") != assignment.work_id
+                    or int(message.get("lease_token") or -1) != assignment.lease_token
+                ):
+                    self._metrics["late_results_ignored"] += 1
+                    continue
+                self._record_video_preemption(assignment, message)
+                continue
             if assignment is None:
                 self._metrics["late_results_ignored"] += 1
                 continue
@@ -683,7 +926,7 @@ class ClassifierSupervisor:
                             kill=True,
                         )
                         continue
-                    if now - assignment.started_at > self._hard_deadline_seconds[priority]:
+                    if assignment.elapsed_seconds(now) > self._hard_deadline_seconds[priority]:
                         await self._replace_worker(
                             priority,
                             index,
@@ -716,7 +959,12 @@ class ClassifierSupervisor:
         self._metrics[priority]["last_stderr_truncated_bytes"] = int(worker_status.get("stderr_truncated_bytes") or 0)
         self._record_restart(priority)
         try:
-            new_slot = await self._spawn_worker(priority, index, generation=slot.worker_generation + 1)
+            standby = self._take_standby(priority)
+            if standby is not None:
+                new_slot = self._attach_worker(priority, index, slot.worker_generation + 1, standby)
+                self._metrics[priority]["standby_promotions"] += 1
+            else:
+                new_slot = await self._spawn_worker(priority, index, generation=slot.worker_generation + 1)
         except ClassifierWorkerStartupTimeoutError:
             self._record_unavailable_slot(priority, index, "startup_timeout")
         except Exception:
@@ -731,9 +979,28 @@ class ClassifierSupervisor:
 
             self._slots[priority][index] = new_slot
             self._metrics[priority]["workers"] = self._active_worker_count(priority)
+        if reason != "pool_restart":
+            # restart_pool schedules its own standby once every slot has the
+            # new configuration, so it never competes for the init lock.
+            self._schedule_standby(priority)
         async with self._condition:
             self._condition.notify_all()
 
+    def _record_video_preemption(self, assignment: _Assignment, message: dict[str, Any]) -> None:
+        paused_seconds = max(0.0, float(message.get("paused_seconds") or 0.0))
+        assignment.reported_paused_seconds += paused_seconds
+        assignment.last_pause_reported_at = time.monotonic()
+        video_metrics = self._metrics["video"]
+        video_metrics["preemptions"] += 1
+        video_metrics["preemption_delay_seconds"] = round(video_metrics["preemption_delay_seconds"] + paused_seconds, 3)
+        video_metrics["last_preemption"] = {
+            "work_id": message.get("work_id"),
+            "current_frame": message.get("current_frame"),
+            "total_frames": message.get("total_frames"),
+            "paused_seconds": round(paused_seconds, 3),
+            "frames_by_source": dict(message.get("frames_by_source") or {}),
+        }
+
     def _find_slot(self, worker_name: str) -> _WorkerSlot | None:
         for priority in ("live", "background", "video"):
             for slot in self._slots[priority]:
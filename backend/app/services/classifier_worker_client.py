@@ -11,6 +11,14 @@ from .classifier_worker_protocol import decode_protocol_message, encode_protocol
 ProcessFactory = Callable[..., Awaitable[Any]]
 
 
+def _worker_environment() -> dict[str, str]:
+    # Workers build their own ClassifierService; they must not publish their
+    # model-loading phases over the web shell's startup status file.
+    env = dict(os.environ)
+    env.pop("YA_WAMF_STARTUP_STATUS_PATH", None)
+    return env
+
+
 class ClassifierWorkerClient:
     def __init__(
         self,
@@ -96,12 +104,23 @@ class ClassifierWorkerClient:
             return
         self._process.terminate()
         await self.wait_closed()
+        await self._release_process()
 
     async def kill(self) -> None:
         if self._process is None:
             return
         self._process.kill()
         await self.wait_closed()
+        await self._release_process()
+
+    async def _release_process(self) -> None:
+        # _closed fires on the first stream to end; reap the child and close
+        # stdin so the subprocess transport is finished while its loop is alive
+        # instead of being torn down later by the garbage collector.
+        await self._process.wait()
+        stdin = getattr(self._process, "stdin", None)
+        if stdin is not None:
+            stdin.close()
 
     def get_status(self) -> dict[str, Any]:
         return {
@@ -225,5 +244,6 @@ class ClassifierWorkerClient:
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
             cwd=backend_root,
+            env=_worker_environment(),
             limit=512 * 1024,
         )
@@ -1,7 +1,10 @@
 import asyncio
+import contextlib
 import os
 import inspect
 import sys
+import threading
+import time
 from base64 import b64decode
 from io import BytesIO
 from typing import Any, Awaitable, Callable
@@ -15,6 +18,7 @@ from .classifier_worker_protocol import (
     build_ready_event,
     build_runtime_recovery_event,
     build_result_event,
+    build_video_preemption_event,
     decode_protocol_message,
     encode_protocol_message,
 )
@@ -51,6 +55,7 @@ class ClassifierWorkerProcess:
         heartbeat_interval_seconds: float = 1.0,
         progress_emit_timeout_seconds: float = 1.0,
         runtime_recovery_getter: Callable[[], dict[str, Any] | None] | None = None,
+        video_preemption_max_pause_seconds: float = 10.0,
     ) -> None:
         self.reader = reader
         self.writer = writer
@@ -64,9 +69,16 @@ class ClassifierWorkerProcess:
         # timeout path without real-time waits.
         self.progress_emit_timeout_seconds = max(0.01, float(progress_emit_timeout_seconds))
         self.runtime_recovery_getter = runtime_recovery_getter
+        # A preempted video pauses between frames until resumed, but for at most this
+        # long per frame, so background video still advances if a resume is lost.
+        self.video_preemption_max_pause_seconds = max(0.01, float(video_preemption_max_pause_seconds))
         self._closed = False
         self._busy = False
         self._current_request_id: str | None = None
+        self._video_task: asyncio.Task[None] | None = None
+        self._video_preempt_requested = threading.Event()
+        self._video_resumed = threading.Event()
+        self._video_resumed.set()
 
     @staticmethod
     def encode_message(message: dict[str, Any]) -> bytes:
@@ -81,13 +93,27 @@ class ClassifierWorkerProcess:
                 if not raw:
                     break
                 message = decode_protocol_message(raw)
+                if message["type"] == "preempt":
+                    self._set_video_preempted(True)
+                    continue
+                if message["type"] == "resume":
+                    self._set_video_preempted(False)
+                    continue
+                if message["type"] == "shutdown":
+                    # No resume follows a shutdown; let the running video finish its
+                    # remaining frames instead of stalling each one for the max pause.
+                    self._set_video_preempted(False)
+                # Only preempt/resume are read alongside a running video; requests stay sequential.
+                await self._wait_for_video_task()
                 if message["type"] == "shutdown":
                     break
                 if message["type"] == "classify":
                     await self._handle_classify(message)
                 if message["type"] == "classify_video":
-                    await self._handle_classify_video(message)
+                    self._video_task = asyncio.create_task(self._handle_classify_video(message))
         finally:
+            self._set_video_preempted(False)
+            await self._wait_for_video_task()
             self._closed = True
             heartbeat_task.cancel()
             try:
@@ -98,6 +124,21 @@ class ClassifierWorkerProcess:
             if callable(close):
                 close()
 
+    def _set_video_preempted(self, preempted: bool) -> None:
+        if preempted:
+            self._video_resumed.clear()
+            self._video_preempt_requested.set()
+        else:
+            self._video_preempt_requested.clear()
+            self._video_resumed.set()
+
+    async def _wait_for_video_task(self) -> None:
+        task = self._video_task
+        if task is None:
+            return
+        self._video_task = None
+        await task
+
     async def _emit(self, message: dict[str, Any]) -> None:
         self.writer.write(encode_protocol_message(message))
         await self.writer.drain()
@@ -226,13 +267,43 @@ class ClassifierWorkerProcess:
                     # if the parent process is slow to consume progress updates.
                     return None
 
-            results = await self._run_classify_video(
-                video_path=message["video_path"],
-                stride=int(message.get("stride") or 5),
-                max_frames=message.get("max_frames"),
-                progress_callback=_progress_callback,
-                input_context=message.get("input_context"),
-            )
+            def _preemption_point(current_frame: int, total_frames: int, scores_by_input_source: dict) -> None:
+                if not self._video_preempt_requested.is_set():
+                    return None
+                # The paused thread keeps its per-source score accumulators; the
+                # checkpoint tells the parent how far each source got before yielding.
+                frames_by_source = {source: len(scores) for source, scores in dict(scores_by_input_source).items()}
+                paused_at = time.monotonic()
+                self._video_resumed.wait(timeout=self.video_preemption_max_pause_seconds)
+                future = asyncio.run_coroutine_threadsafe(
+                    self._emit(
+                        build_video_preemption_event(
+                            worker_generation=self.worker_generation,
+                            request_id=str(message["request_id"]),
+                            work_id=str(message["work_id"]),
+                            lease_token=int(message["lease_token"]),
+                            current_frame=int(current_frame),
+                            total_frames=int(total_frames),
+                            paused_seconds=time.monotonic() - paused_at,
+                            frames_by_source=frames_by_source,
+                        )
+                    ),
+                    loop,
+                )
+                with contextlib.suppress(Exception):
+                    future.result(timeout=self.progress_emit_timeout_seconds)
+                return None
+
+            video_kwargs: dict[str, Any] = {
+                "video_path": message["video_path"],
+                "stride": int(message.get("stride") or 5),
+                "max_frames": message.get("max_frames"),
+                "progress_callback": _progress_callback,
+                "input_context": message.get("input_context"),
+            }
+            if self._classify_video_accepts("preemption_point"):
+                video_kwargs["preemption_point"] = _preemption_point
+            results = await self._run_classify_video(**video_kwargs)
             after_recovery = self._runtime_recovery_snapshot()
             if after_recovery is not None and after_recovery != before_recovery:
                 await self._emit(
@@ -286,6 +357,9 @@ class ClassifierWorkerProcess:
         )
 
     def _classify_video_accepts_input_context(self) -> bool:
+        return self._classify_video_accepts("input_context")
+
+    def _classify_video_accepts(self, parameter_name: str) -> bool:
         if self.classify_video_fn is None:
             return False
         try:
@@ -293,7 +367,7 @@ class ClassifierWorkerProcess:
         except (TypeError, ValueError):
             return False
         return any(
-            param.kind == inspect.Parameter.VAR_KEYWORD or param.name == "input_context"
+            param.kind == inspect.Parameter.VAR_KEYWORD or param.name == parameter_name
             for param in signature.parameters.values()
         )
 
@@ -359,6 +433,7 @@ async def run_worker_main(
     heartbeat_interval_seconds: float = 1.0,
     writer: Any | None = None,
     runtime_recovery_getter: Callable[[], dict[str, Any] | None] | None = None,
+    video_preemption_max_pause_seconds: float = 10.0,
 ) -> None:
     loop = asyncio.get_running_loop()
     reader = asyncio.StreamReader(limit=WORKER_PROTOCOL_STREAM_LIMIT_BYTES)
@@ -375,6 +450,7 @@ async def run_worker_main(
         worker_generation=worker_generation,
         heartbeat_interval_seconds=heartbeat_interval_seconds,
         runtime_recovery_getter=runtime_recovery_getter,
+        video_preemption_max_pause_seconds=video_preemption_max_pause_seconds,
     )
     await worker.run()
 
@@ -409,6 +485,7 @@ def _build_default_classify_fn() -> Callable[..., list[dict[str, Any]]]:
 def main() -> None:
     worker_generation = int(sys.argv[2]) if len(sys.argv) > 2 else 1
     heartbeat_interval_seconds = float(os.getenv("CLASSIFIER_WORKER_HEARTBEAT_INTERVAL_SECONDS", "1.0"))
+    video_preemption_max_pause_seconds = float(os.getenv("CLASSIFIER_VIDEO_PREEMPTION_MAX_PAUSE_SECONDS", "10"))
     protocol_stdout = os.fdopen(os.dup(sys.stdout.fileno()), "wb", closefd=True)
     os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
     asyncio.run(
@@ -419,6 +496,7 @@ def main() -> None:
             heartbeat_interval_seconds=heartbeat_interval_seconds,
             writer=_StdoutWriter(protocol_stdout),
             runtime_recovery_getter=getattr(classify_fn, "_runtime_recovery_getter", None),
+            video_preemption_max_pause_seconds=video_preemption_max_pause_seconds,
         )
     )
 
@@ -19,7 +19,18 @@ _REQUIRED_FIELDS: dict[str, tuple[str, ...]] = {
         "top_label",
     ),
     "classify": ("worker_generation", "request_id", "work_id", "lease_token", "image_b64"),
+    "video_preemption": (
+        "worker_generation",
+        "request_id",
+        "work_id",
+        "lease_token",
+        "current_frame",
+        "total_frames",
+        "paused_seconds",
+    ),
     "classify_video": ("worker_generation", "request_id", "work_id", "lease_token", "video_path"),
+    "preempt": ("worker_generation",),
+    "resume": ("worker_generation",),
     "shutdown": (),
 }
 
@@ -221,5 +232,39 @@ def build_progress_event(
     return message
 
 
+def build_video_preemption_event(
+    *,
+    worker_generation: int,
+    request_id: str,
+    work_id: str,
+    lease_token: int,
+    current_frame: int,
+    total_frames: int,
+    paused_seconds: float,
+    frames_by_source: dict[str, int] | None = None,
+) -> dict[str, Any]:
+    message = {
+        "type": "video_preemption",
+        "worker_generation": int(worker_generation),
+        "request_id": str(request_id),
+        "work_id": str(work_id),
+        "lease_token": int(lease_token),
+        "current_frame": int(current_frame),
+        "total_frames": int(total_frames),
+        "paused_seconds": float(paused_seconds),
+    }
+    if frames_by_source is not None:
+        message["frames_by_source"] = {str(source): int(count) for source, count in frames_by_source.items()}
+    return message
+
+
+def build_preempt_request(*, worker_generation: int) -> dict[str, Any]:
+    return {"type": "preempt", "worker_generation": int(worker_generation)}
+
+
+def build_resume_request(*, worker_generation: int) -> dict[str, Any]:
+    return {"type": "resume", "worker_generation": int(worker_generation)}
+
+
 def build_shutdown_request() -> dict[str, Any]:
     return {"type": "shutdown"}
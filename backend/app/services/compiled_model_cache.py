@@ -0,0 +1,241 @@
+"""Persistent caches for compiled/optimized classifier models.
+
+Every classifier worker process loads its model from scratch: OpenVINO
+recompiles the graph for the target device and ONNX Runtime re-runs its graph
+optimizer. On small Intel boxes that is most of a worker's start-up time, and
+it is paid on boot, after ``restart_pool`` and after every heartbeat timeout.
+
+Two caches live under ``COMPILED_MODEL_CACHE_DIR`` (default
+``/data/compiled_model_cache`` when the data volume exists):
+
+- ``openvino/<runtime>/`` is handed to OpenVINO as ``CACHE_DIR``. OpenVINO keys
+  blobs by model, device and compile properties itself; the runtime
+  subdirectory keeps blobs from an older runtime or driver from being reused.
+- ``onnxruntime/<key>.onnx`` holds ORT-optimized graphs. The key covers the
+  model artifact digest, the inference runtime signature, the execution
+  providers and the session options, because optimized graphs can contain
+  hardware-specific kernels.
+
+The runtime signature comes from
+``model_validation.current_inference_runtime_signature`` so the caches are
+invalidated by the same runtime, driver and hardware changes that invalidate
+provider validation. Everything here is fail-soft: a cache that cannot be read
+or written falls back to a normal load.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+log = structlog.get_logger()
+
+COMPILED_MODEL_CACHE_MAX_BYTES = max(0, int(os.getenv("COMPILED_MODEL_CACHE_MAX_BYTES", str(4 * 1024**3))))
+DIGESTS_FILENAME = "digests.json"
+ONNXRUNTIME_SUBDIR = "onnxruntime"
+OPENVINO_SUBDIR = "openvino"
+# ORT serializes optimized graphs as a single protobuf, which cannot exceed 2 GB.
+# Larger models and models with external weight files are loaded uncached.
+_ORT_SERIALIZABLE_MAX_BYTES = 1536 * 1024**2
+
+_digest_lock = threading.Lock()
+_digest_memo: dict[tuple[str, int, int], str] = {}
+
+
+def compiled_model_cache_root() -> Path:
+    """Resolved at call time so tests (and re-configuration) see the current env."""
+    configured = str(os.getenv("COMPILED_MODEL_CACHE_DIR") or "").strip()
+    if configured:
+        return Path(configured)
+    if os.path.isdir("/data"):
+        return Path("/data/compiled_model_cache")
+    return Path(tempfile.gettempdir()) / "yawamf_compiled_model_cache"
+
+
+def _runtime_signature() -> str:
+    from app.services.model_validation import current_inference_runtime_signature
+
+    return current_inference_runtime_signature()
+
+
+def model_artifact_digest(model_path: str | os.PathLike[str]) -> str:
+    """SHA-256 of the model file, memoized by path, size and mtime.
+
+    The memo is persisted next to the caches so a restarted worker does not
+    re-hash a multi-hundred-megabyte model before it can reuse the cache.
+    """
+    path = Path(model_path).resolve()
+    stat = path.stat()
+    identity = (str(path), int(stat.st_size), int(stat.st_mtime_ns))
+    memo_key = f"{identity[0]}:{identity[1]}:{identity[2]}"
+    with _digest_lock:
+        cached = _digest_memo.get(identity)
+        if cached:
+            return cached
+        digests_path = compiled_model_cache_root() / DIGESTS_FILENAME
+        persisted = _read_json(digests_path)
+        digest = str(persisted.get(memo_key) or "")
+        if not digest:
+            hasher = hashlib.sha256()
+            with open(path, "rb") as handle:
+                for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            persisted = {key: value for key, value in persisted.items() if not key.startswith(f"{identity[0]}:")}
+            persisted[memo_key] = digest
+            _write_json_atomic(digests_path, persisted)
+        _digest_memo[identity] = digest
+        return digest
+
+
+def compiled_model_cache_key(
+    model_path: str | os.PathLike[str],
+    *,
+    runtime: str,
+    device: str,
+    options: dict[str, Any] | None = None,
+) -> str:
+    identity = {
+        "artifact_sha256": model_artifact_digest(model_path),
+        "runtime_signature": _runtime_signature(),
+        "runtime": str(runtime),
+        "device": str(device),
+        "options": dict(options or {}),
+    }
+    encoded = json.dumps(identity, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:32]
+
+
+def openvino_cache_dir() -> str:
+    """``CACHE_DIR`` for OpenVINO cores; ``OPENVINO_CACHE_DIR`` still wins when set."""
+    configured = str(os.getenv("OPENVINO_CACHE_DIR") or "").strip()
+    if configured:
+        cache_dir = Path(configured)
+    else:
+        cache_dir = compiled_model_cache_root() / OPENVINO_SUBDIR / _runtime_signature()[:16]
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        log.warning("Compiled model cache directory unavailable", path=str(cache_dir), error=str(exc))
+        cache_dir = Path(tempfile.gettempdir()) / "openvino_cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    return str(cache_dir)
+
+
+def onnxruntime_optimized_model_path(
+    model_path: str | os.PathLike[str],
+    *,
+    providers: list[str],
+    options: dict[str, Any] | None = None,
+) -> Path | None:
+    """Where the ORT-optimized graph for this model/runtime lives, or None if uncacheable."""
+    source = Path(model_path)
+    try:
+        if source.stat().st_size > _ORT_SERIALIZABLE_MAX_BYTES or _has_external_weights(source):
+            return None
+        key = compiled_model_cache_key(
+            source,
+            runtime="onnxruntime",
+            device=",".join(providers),
+            options=options,
+        )
+    except OSError as exc:
+        log.debug("ORT optimized model cache unavailable", model_path=str(source), error=str(exc))
+        return None
+    return compiled_model_cache_root() / ONNXRUNTIME_SUBDIR / f"{key}.onnx"
+
+
+def staging_path(target: Path) -> Path:
+    """Per-process temp name next to ``target`` so concurrent workers never share a partial file."""
+    return target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def touch(path: Path) -> None:
+    """Mark a cache entry as recently used; pruning evicts by mtime."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def publish_staged(staged: Path, target: Path) -> bool:
+    try:
+        if not staged.is_file() or staged.stat().st_size == 0:
+            return False
+        os.replace(staged, target)
+        return True
+    except OSError as exc:
+        log.warning("Failed to publish optimized model cache entry", path=str(target), error=str(exc))
+        return False
+    finally:
+        try:
+            staged.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def prune(max_bytes: int = COMPILED_MODEL_CACHE_MAX_BYTES) -> int:
+    """Drop the least recently used cache files until the cache fits ``max_bytes``."""
+    root = compiled_model_cache_root()
+    files: list[tuple[float, int, Path]] = []
+    for subdir in (ONNXRUNTIME_SUBDIR, OPENVINO_SUBDIR):
+        base = root / subdir
+        if not base.is_dir():
+            continue
+        for path in base.rglob("*"):
+            try:
+                if path.is_file():
+                    stat = path.stat()
+                    files.append((stat.st_mtime, stat.st_size, path))
+            except OSError:
+                continue
+    total = sum(size for _mtime, size, _path in files)
+    removed = 0
+    for _mtime, size, path in sorted(files):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+def _has_external_weights(model_path: Path) -> bool:
+    stem = model_path.name
+    return any(
+        (model_path.parent / candidate).exists()
+        for candidate in (f"{stem}.data", f"{stem}_data", f"{model_path.stem}.data", f"{model_path.stem}.onnx_data")
+    )
+
+
+def _read_json(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_json_atomic(path: Path, payload: dict[str, Any]) -> None:
+    staged = staging_path(path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staged.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(staged, path)
+    except OSError as exc:
+        log.debug("Failed to persist model digest memo", path=str(path), error=str(exc))
+    finally:
+        try:
+            staged.unlink(missing_ok=True)
+        except OSError:
+            pass
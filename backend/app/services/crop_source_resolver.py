@@ -3,11 +3,13 @@ from __future__ import annotations
 from io import BytesIO
 from typing import Any, Callable
 
-from PIL import Image
 import structlog
 
 from app.models.ai_models import ClassificationInputContext
 from app.services.media_cache import media_cache
+from app.utils.lazy_imports import lazy_module
+
+Image = lazy_module("PIL.Image")
 
 log = structlog.get_logger()
 
@@ -0,0 +1,210 @@
+"""Streaming detection export (NDJSON or CSV) for the owner.
+
+Paging ``/events`` to pull history out re-ran the taxonomy join, the Frigate
+clip checks and per-row localized-name lookups for every 500 rows. The export
+instead walks ``detections`` oldest first in ``(detection_time, id)`` keyset
+order, with names resolved from one preloaded cache map and no Frigate calls.
+
+The requested range is split into date shards, each read with a single cursor
+on its own pooled connection, so no read transaction spans a whole multi-year
+export (a long-lived reader would hold back WAL checkpoints). Every record
+carries an ``export_cursor``; passing the last one received as ``after``
+resumes the export right behind it.
+"""
+
+from __future__ import annotations
+
+import base64
+import csv
+import io
+import json
+import os
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from app.database import get_db
+from app.repositories.detection_repository import Detection, DetectionRepository
+from app.services.taxonomy.taxonomy_service import taxonomy_service
+from app.utils.api_datetime import serialize_api_datetime, utc_naive_now
+from app.utils.canonical_species import user_facing_species_fields
+
+EXPORT_SHARD_DAYS = max(1, int(os.environ.get("EXPORT_SHARD_DAYS", "7")))
+# Records encoded per chunk handed to the response.
+EXPORT_FLUSH_ROWS = max(1, int(os.environ.get("EXPORT_FLUSH_ROWS", "500")))
+
+EXPORT_FIELDS = (
+    "id",
+    "frigate_event",
+    "detection_time",
+    "camera_name",
+    "display_name",
+    "category_name",
+    "common_name",
+    "scientific_name",
+    "taxa_id",
+    "score",
+    "is_hidden",
+    "is_favorite",
+    "manual_tagged",
+    "audio_confirmed",
+    "audio_species",
+    "audio_score",
+    "video_classification_label",
+    "video_classification_score",
+    "video_classification_status",
+    "temperature",
+    "weather_condition",
+    "export_cursor",
+)
+
+
+@dataclass(frozen=True)
+class ExportFilters:
+    """The get_all filters an export accepts; ``end`` is exclusive."""
+
+    start: datetime | None = None
+    end: datetime | None = None
+    species: str | None = None
+    species_any: list[str] | None = None
+    taxa_id: int | None = None
+    camera: str | None = None
+    include_hidden: bool = False
+    favorite_only: bool = False
+    audio_confirmed_only: bool = False
+
+
+def encode_export_cursor(stored_time: str, detection_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{stored_time}|{detection_id}".encode()).decode().rstrip("=")
+
+
+def decode_export_cursor(token: str) -> tuple[str, int]:
+    """Inverse of :func:`encode_export_cursor`; raises ValueError on a malformed token."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        stored_time, _, detection_id = raw.rpartition("|")
+        datetime.fromisoformat(stored_time)
+        return stored_time, int(detection_id)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid export cursor") from exc
+
+
+def date_shards(start: datetime, end: datetime, days: int) -> list[tuple[datetime, datetime]]:
+    """Split ``[start, end)`` into consecutive half-open shards of ``days`` days."""
+    shards = []
+    step = timedelta(days=max(1, days))
+    cursor = start
+    while cursor < end:
+        shard_end = min(cursor + step, end)
+        shards.append((cursor, shard_end))
+        cursor = shard_end
+    return shards
+
+
+def _export_record(
+    stored_time: str,
+    detection: Detection,
+    names: dict[int, str],
+    unknown_labels: list[str],
+) -> dict[str, Any]:
+    species = user_facing_species_fields(
+        display_name=detection.display_name,
+        category_name=detection.category_name,
+        scientific_name=detection.scientific_name,
+        common_name=detection.common_name,
+        taxa_id=detection.taxa_id,
+        extra_unknown_labels=unknown_labels,
+    )
+    taxa_id = species["taxa_id"]
+    common_name = (names.get(taxa_id) if isinstance(taxa_id, int) else None) or species["common_name"]
+    return {
+        "id": detection.id,
+        "frigate_event": detection.frigate_event,
+        "detection_time": serialize_api_datetime(detection.detection_time),
+        "camera_name": detection.camera_name,
+        "display_name": species["display_name"],
+        "category_name": species["category_name"],
+        "common_name": common_name,
+        "scientific_name": species["scientific_name"],
+        "taxa_id": taxa_id,
+        "score": detection.score,
+        "is_hidden": detection.is_hidden,
+        "is_favorite": detection.is_favorite,
+        "manual_tagged": detection.manual_tagged,
+        "audio_confirmed": detection.audio_confirmed,
+        "audio_species": detection.audio_species,
+        "audio_score": detection.audio_score,
+        "video_classification_label": detection.video_classification_label,
+        "video_classification_score": detection.video_classification_score,
+        "video_classification_status": detection.video_classification_status,
+        "temperature": detection.temperature,
+        "weather_condition": detection.weather_condition,
+        "export_cursor": encode_export_cursor(stored_time, int(detection.id or 0)),
+    }
+
+
+async def iter_export_records(
+    filters: ExportFilters,
+    *,
+    lang: str,
+    unknown_labels: list[str],
+    after: tuple[str, int] | None = None,
+    shard_days: int | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield export records oldest first, shard by shard."""
+    async with get_db() as db:
+        names = await taxonomy_service.load_cached_common_names(db, lang)
+        start = filters.start or await DetectionRepository(db).get_oldest_detection_date()
+    if start is None:
+        return
+    # Rows detected after the export started are left for a resumed export.
+    end = filters.end or utc_naive_now()
+    if after is not None:
+        start = max(start, datetime.fromisoformat(after[0]).replace(tzinfo=None))
+
+    for index, (shard_start, shard_end) in enumerate(date_shards(start, end, shard_days or EXPORT_SHARD_DAYS)):
+        async with get_db() as db:
+            rows = DetectionRepository(db).iter_export(
+                start_date=shard_start,
+                # get_all's end bound is inclusive; shards are half-open.
+                end_date=shard_end - timedelta(microseconds=1),
+                species=filters.species,
+                species_any=filters.species_any,
+                taxa_id=filters.taxa_id,
+                camera=filters.camera,
+                include_hidden=filters.include_hidden,
+                favorite_only=filters.favorite_only,
+                audio_confirmed_only=filters.audio_confirmed_only,
+                after=after if index == 0 else None,
+            )
+            async for stored_time, detection in rows:
+                yield _export_record(stored_time, detection, names, unknown_labels)
+
+
+async def iter_ndjson(records: AsyncIterator[dict[str, Any]]) -> AsyncIterator[bytes]:
+    lines: list[str] = []
+    async for record in records:
+        lines.append(json.dumps(record, separators=(",", ":"), default=str))
+        if len(lines) >= EXPORT_FLUSH_ROWS:
+            yield ("\n".join(lines) + "\n").encode()
+            lines.clear()
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+async def iter_csv(records: AsyncIterator[dict[str, Any]]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    pending = 0
+    async for record in records:
+        writer.writerow(record)
+        pending += 1
+        if pending >= EXPORT_FLUSH_ROWS:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+    if buffer.tell():
+        yield buffer.getvalue().encode()
@@ -6,6 +6,7 @@ from app.config import settings
 from app.repositories.detection_repository import DetectionRepository, Detection
 from app.services.classifier_service import ClassifierService
 from app.services.broadcaster import broadcaster
+from app.services.taxonomy.label_taxonomy_table import label_taxonomy_table
 from app.services.taxonomy.taxonomy_service import taxonomy_service
 from app.services.birdweather_service import birdweather_service
 from app.utils.classifier_labels import normalize_classifier_label
@@ -20,7 +21,7 @@ from app.utils.blocked_species import is_blocked_species
 from app.utils.frigate import normalize_sub_label
 from app.utils.api_datetime import serialize_api_datetime, utc_naive_from_timestamp
 from app.utils.tasks import create_background_task
-from app.database import get_db
+from app.database import get_db, run_batched_write
 
 log = structlog.get_logger()
 TAXONOMY_LOOKUP_TIMEOUT_SECONDS = max(0.5, float(os.getenv("TAXONOMY_LOOKUP_TIMEOUT_SECONDS", "3")))
@@ -317,6 +318,35 @@ class DetectionService:
             extra_labels=extra,
         )
 
+    async def _resolve_label_taxonomy(self, label: str) -> dict:
+        """Taxonomy for a classifier label: the preloaded table first, then a bounded lookup."""
+        cached = label_taxonomy_table.get(label)
+        if cached is not None:
+            return cached.names()
+        taxonomy: dict = {}
+        try:
+            taxonomy = await asyncio.wait_for(
+                taxonomy_service.get_names(label),
+                timeout=TAXONOMY_LOOKUP_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            log.warning(
+                "Taxonomy lookup timed out during detection save",
+                label=label,
+                timeout_seconds=TAXONOMY_LOOKUP_TIMEOUT_SECONDS,
+            )
+        except Exception as e:
+            log.warning(
+                "Taxonomy lookup failed during detection save",
+                label=label,
+                error=str(e),
+            )
+        if not isinstance(taxonomy, dict):
+            return {}
+        if taxonomy:
+            label_taxonomy_table.remember(label, taxonomy)
+        return taxonomy
+
     async def save_detection(
         self,
         frigate_event: str,
@@ -345,26 +375,8 @@ class DetectionService:
 
         # 1. Normalize names (Bidirectional Scientific <-> Common)
         label = rewrite_label(classification["label"])
-        taxonomy: dict = {}
-        try:
-            taxonomy = await asyncio.wait_for(
-                taxonomy_service.get_names(label),
-                timeout=TAXONOMY_LOOKUP_TIMEOUT_SECONDS,
-            )
-        except asyncio.TimeoutError:
-            log.warning(
-                "Taxonomy lookup timed out during detection save",
-                label=label,
-                timeout_seconds=TAXONOMY_LOOKUP_TIMEOUT_SECONDS,
-            )
-        except Exception as e:
-            log.warning(
-                "Taxonomy lookup failed during detection save",
-                label=label,
-                error=str(e),
-            )
-        if not isinstance(taxonomy, dict):
-            taxonomy = {}
+        # Hidden labels discard their taxonomy below, so skip the lookup entirely.
+        taxonomy: dict = {} if should_hide_species_label(label) else await self._resolve_label_taxonomy(label)
 
         scientific_name = taxonomy.get("scientific_name")
         common_name = taxonomy.get("common_name")
@@ -406,12 +418,16 @@ class DetectionService:
             display_lang = getattr(settings.notifications, "notification_language", None)
             localized_name = None
             if display_lang and display_lang != "en" and taxa_id:
-                try:
-                    localized_name = await taxonomy_service.get_localized_common_name(taxa_id, display_lang)
-                except Exception as exc:
-                    log.debug(
-                        "Localized display name lookup failed", taxa_id=taxa_id, lang=display_lang, error=str(exc)
-                    )
+                localized_name = label_taxonomy_table.localized_name(label_taxonomy_table.get(label), display_lang)
+                if not localized_name:
+                    try:
+                        localized_name = await taxonomy_service.get_localized_common_name(taxa_id, display_lang)
+                    except Exception as exc:
+                        log.debug(
+                            "Localized display name lookup failed", taxa_id=taxa_id, lang=display_lang, error=str(exc)
+                        )
+                    if localized_name:
+                        label_taxonomy_table.remember(label, taxonomy, lang=display_lang, localized=localized_name)
 
             if localized_name:
                 display_name = localized_name
@@ -456,8 +472,11 @@ class DetectionService:
                 taxa_id=taxa_id,
             )
 
-            # Atomic upsert: insert or update only if score is higher
-            was_inserted, was_updated = await repo.upsert_if_higher_score(detection)
+            # Atomic upsert: insert or update only if score is higher. Goes through the
+            # batching writer; it returns after commit, so the read below sees the row.
+            was_inserted, was_updated = await run_batched_write(
+                lambda conn: DetectionRepository(conn).upsert_if_higher_score(detection)
+            )
             changed = was_inserted or was_updated
 
             if changed:
@@ -586,17 +605,19 @@ class DetectionService:
             # This marks the job as 'completed' so the stale watchdog and re-queue logic
             # don't pick it up again. HQ crop refinement deliberately leaves that state alone.
             if persist_video_result:
-                await repo.update_video_classification(
-                    frigate_event=frigate_event,
-                    label=None if hidden_video_label and not manual_tagged else normalized_video_label,
-                    score=video_score,
-                    index=video_index,
-                    status="completed",
-                    provider=video_provider,
-                    backend=video_backend,
-                    model_id=video_model_id,
-                    input_source=video_input_source,
-                    blocked=is_blocked,
+                await run_batched_write(
+                    lambda conn: DetectionRepository(conn).update_video_classification(
+                        frigate_event=frigate_event,
+                        label=None if hidden_video_label and not manual_tagged else normalized_video_label,
+                        score=video_score,
+                        index=video_index,
+                        status="completed",
+                        provider=video_provider,
+                        backend=video_backend,
+                        model_id=video_model_id,
+                        input_source=video_input_source,
+                        blocked=is_blocked,
+                    )
                 )
 
             if is_blocked:
@@ -704,7 +725,11 @@ class DetectionService:
                 )
 
                 # Get taxonomy for new label
-                taxonomy = await taxonomy_service.get_names(new_species)
+                cached_taxonomy = label_taxonomy_table.get(new_species)
+                if cached_taxonomy is not None:
+                    taxonomy = cached_taxonomy.names()
+                else:
+                    taxonomy = await taxonomy_service.get_names(new_species)
                 scientific_name = taxonomy.get("scientific_name")
                 common_name = taxonomy.get("common_name")
                 taxa_id = taxonomy.get("taxa_id")
@@ -751,19 +776,21 @@ class DetectionService:
                 else:
                     audio_confirmed, audio_species, audio_score = False, None, None
 
-                primary_updated = await repo.update_primary_classification(
-                    frigate_event=frigate_event,
-                    display_name=display_name,
-                    category_name=new_species,
-                    score=video_score,
-                    detection_index=video_index,
-                    scientific_name=scientific_name,
-                    common_name=common_name,
-                    taxa_id=taxa_id,
-                    audio_confirmed=audio_confirmed,
-                    audio_species=audio_species,
-                    audio_score=audio_score,
-                    manual_override=manual_tagged,
+                primary_updated = await run_batched_write(
+                    lambda conn: DetectionRepository(conn).update_primary_classification(
+                        frigate_event=frigate_event,
+                        display_name=display_name,
+                        category_name=new_species,
+                        score=video_score,
+                        detection_index=video_index,
+                        scientific_name=scientific_name,
+                        common_name=common_name,
+                        taxa_id=taxa_id,
+                        audio_confirmed=audio_confirmed,
+                        audio_species=audio_species,
+                        audio_score=audio_score,
+                        manual_override=manual_tagged,
+                    )
                 )
                 if not primary_updated:
                     log.info(
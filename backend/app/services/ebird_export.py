@@ -0,0 +1,450 @@
+"""Streaming eBird Record Format CSV export.
+
+The export used to load every visible detection into a list, enrich names over
+that list and only then aggregate and emit checklists, so memory grew with the
+size of the history and no byte reached the client until the whole table had
+been read. Here the distinct names that may need an English lookup come from
+one small grouped query up front. Detections are then read newest first in
+``(detection_time, id)`` keyset pages, each page on its own pooled connection,
+and a checklist is a (date, camera) pair: because the rows arrive in time order
+a day is complete as soon as the first row of an earlier day shows up, so only
+the current day's checklists are held in memory and each finished day is
+written out straight away.
+
+eBird spreadsheet import is strict about column order and often treats headers
+as data, so rows are emitted headerless in the standard 19-column format.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import math
+import os
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+import structlog
+
+from app.config import settings
+from app.database import get_db
+from app.repositories.ebird_repository import EbirdRepository
+from app.services.taxonomy.taxonomy_service import taxonomy_service
+
+log = structlog.get_logger()
+
+# Detections read per keyset page; one pooled connection is held per page.
+EBIRD_EXPORT_CHUNK_ROWS = max(1, int(os.environ.get("EBIRD_EXPORT_CHUNK_ROWS", "1000")))
+EBIRD_EXPORT_ENRICH_CONCURRENCY = 5
+
+
+def _format_ebird_row(
+    *,
+    export_common_name: str,
+    scientific_name: str | None,
+    checklist_start: datetime,
+    count: int,
+    best_score: float,
+    camera_name: str | None,
+    duration_minutes: int,
+    video_classification_provider: str | None,
+    video_classification_backend: str | None,
+    used_scientific_fallback: bool = False,
+) -> list[str]:
+    date_str = checklist_start.strftime("%m/%d/%Y")
+    time_str = checklist_start.strftime("%H:%M")
+
+    genus = ""
+    species = ""
+    if scientific_name:
+        parts = scientific_name.strip().split(" ", 1)
+        if len(parts) > 0:
+            genus = parts[0]
+        if len(parts) > 1:
+            species = parts[1]
+
+    location_name = f"Home ({camera_name})" if camera_name else "Home"
+    lat = settings.location.latitude
+    lon = settings.location.longitude
+    state = str(getattr(settings.location, "state", "") or "").strip()
+    country = str(getattr(settings.location, "country", "") or "").strip()
+    submission_parts = ["Exported from YA-WAMF"]
+
+    provider = str(video_classification_provider or "").strip()
+    backend = str(video_classification_backend or "").strip()
+    if provider:
+        submission_parts.append(f"provider {provider}")
+    if backend:
+        submission_parts.append(f"backend {backend}")
+
+    try:
+        confidence = float(best_score)
+    except (TypeError, ValueError):
+        confidence = None
+    if confidence is not None and math.isfinite(confidence):
+        submission_parts.append(f"confidence {confidence:.2f}")
+
+    if used_scientific_fallback:
+        submission_parts.append("common name unavailable")
+    submission_comment = "; ".join(submission_parts)
+
+    species_comment_parts: list[str] = []
+    if confidence is not None and math.isfinite(confidence):
+        species_comment_parts.append(f"AI confidence {confidence:.2f}")
+    if used_scientific_fallback:
+        species_comment_parts.append("common name unavailable")
+    species_comment = "; ".join(species_comment_parts)
+
+    # Feeder cameras can fire many detections for the same visiting bird, so a
+    # checklist row should stay conservative instead of turning trigger count
+    # into claimed individual abundance for eBird import.
+    return [
+        export_common_name,
+        genus,
+        species,
+        "1",
+        species_comment,
+        location_name,
+        f"{lat:.6f}" if lat is not None else "",
+        f"{lon:.6f}" if lon is not None else "",
+        date_str,
+        time_str,
+        state,
+        country,
+        "Stationary",
+        "1",
+        str(max(0, int(duration_minutes))),
+        "N",
+        "",
+        "",
+        submission_comment,
+    ]
+
+
+def _is_english_safe_name(value: str | None) -> bool:
+    candidate = str(value or "").strip()
+    if not candidate:
+        return False
+    if candidate.lower() == "unknown bird":
+        return False
+    return candidate.isascii()
+
+
+def _resolve_export_common_name(
+    *,
+    display_name: str | None,
+    common_name: str | None,
+    english_common_name: str | None,
+    scientific_name: str | None,
+) -> str:
+    # Pre-compute the scientific name in lowercase for comparison.
+    # This guards against the case where the scientific name was stored verbatim
+    # in the common_name or display_name field (e.g. "Parus major" as common name),
+    # which happens with manual tags by scientific name or taxonomy cache corruption.
+    sci_lower = str(scientific_name or "").strip().lower()
+
+    def is_usable_common_name(val: str | None) -> bool:
+        if not _is_english_safe_name(val):
+            return False
+        # Reject if the value IS the scientific name — it is not a common name.
+        if sci_lower and str(val).strip().lower() == sci_lower:
+            return False
+        return True
+
+    # 1. Prefer the resolved English common name from taxonomy cache
+    if is_usable_common_name(english_common_name):
+        return str(english_common_name).strip()
+
+    # 2. Try the stored common name (e.g. from model labels)
+    if is_usable_common_name(common_name):
+        return str(common_name).strip()
+
+    # 3. Try the display name
+    if is_usable_common_name(display_name):
+        return str(display_name).strip()
+
+    # 4. Fall back to the scientific name.
+    # eBird import accepts scientific names in the Common Name column when matched
+    # against their taxonomy, so this is safe as a last resort.
+    if scientific_name and scientific_name.strip():
+        return str(scientific_name).strip()
+
+    return ""
+
+
+def _is_exportable_ebird_detection(
+    *,
+    display_name: str | None,
+    common_name: str | None,
+    english_common_name: str | None,
+    scientific_name: str | None,
+) -> bool:
+    normalized_display = str(display_name or "").strip().lower()
+    normalized_common = str(common_name or "").strip().lower()
+
+    if normalized_display == "unknown bird" or normalized_common == "unknown bird":
+        return False
+
+    if not _resolve_export_common_name(
+        display_name=display_name,
+        common_name=common_name,
+        english_common_name=english_common_name,
+        scientific_name=scientific_name,
+    ):
+        return False
+    return True
+
+
+def _parse_detection_time(value: object) -> datetime | None:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            try:
+                return datetime.strptime(value, "%Y-%m-%d %H:%M:%S.%f")
+            except ValueError:
+                return None
+    return None
+
+
+def _needs_english_lookup(
+    *, scientific_name: str, english_common_name: str | None, common_name: str | None, display_name: str | None
+) -> bool:
+    sci_lower = scientific_name.strip().lower()
+
+    def locally_usable(val: str | None) -> bool:
+        v = str(val or "").strip()
+        return bool(v) and v.lower() != sci_lower and _is_english_safe_name(v)
+
+    return not (locally_usable(english_common_name) or locally_usable(common_name) or locally_usable(display_name))
+
+
+async def _enrich_english(sci: str, semaphore: asyncio.Semaphore) -> tuple[str, str | None]:
+    async with semaphore:
+        try:
+            tax = await taxonomy_service.get_names(sci)
+            taxa_id = tax.get("taxa_id")
+            if taxa_id:
+                en = await taxonomy_service.get_localized_common_name(taxa_id, "en")
+                if en and _is_english_safe_name(en) and en.strip().lower() != sci.strip().lower():
+                    return sci, en
+            # taxonomy_cache common_name as fallback (already English
+            # when populated by _lookup_inaturalist with locale=en)
+            common = tax.get("common_name")
+            if common and _is_english_safe_name(common) and common.strip().lower() != sci.strip().lower():
+                return sci, common
+        except Exception as exc:
+            log.warning("eBird export enrichment failed", scientific_name=sci, error=str(exc))
+    return sci, None
+
+
+@dataclass
+class _ExportNames:
+    # Local English name per (taxa_id, scientific_name), from taxonomy_translations / taxonomy_cache.
+    english: dict[tuple[int | None, str | None], str | None]
+    # English names looked up through taxonomy_service for species with no usable local name.
+    enriched: dict[str, str]
+
+
+async def _load_export_names(start: datetime | None, end_exclusive: datetime | None) -> _ExportNames:
+    """Resolve English names once per distinct species name before any row is streamed.
+
+    For species where no local source provides a usable English common name
+    (e.g. taxonomy_cache only has a localised name like "Большая синица" and
+    taxonomy_translations has no English entry), try a taxonomy lookup.
+    get_localized_common_name('en') checks taxonomy_translations first and only
+    calls iNaturalist if no English entry is cached yet. Species whose
+    common_name or display_name is already usable English are left alone so
+    e.g. "Common Blackbird" is not replaced by a different iNat preferred name.
+    """
+    async with get_db() as db:
+        groups = await EbirdRepository(db).get_export_name_groups(start=start, end_exclusive=end_exclusive)
+
+    english: dict[tuple[int | None, str | None], str | None] = {}
+    sci_to_enrich: set[str] = set()
+    for taxa_id, scientific_name, common_name, display_name, english_common_name in groups:
+        english[(taxa_id, scientific_name)] = english_common_name
+        if not scientific_name or not _is_exportable_ebird_detection(
+            display_name=display_name,
+            common_name=common_name,
+            english_common_name=english_common_name,
+            scientific_name=scientific_name,
+        ):
+            continue
+        if _needs_english_lookup(
+            scientific_name=scientific_name,
+            english_common_name=english_common_name,
+            common_name=common_name,
+            display_name=display_name,
+        ):
+            sci_to_enrich.add(scientific_name)
+
+    enriched: dict[str, str] = {}
+    if sci_to_enrich:
+        semaphore = asyncio.Semaphore(EBIRD_EXPORT_ENRICH_CONCURRENCY)
+        pairs = await asyncio.gather(*(_enrich_english(sci, semaphore) for sci in sci_to_enrich))
+        enriched = {sci: name for sci, name in pairs if name}
+    return _ExportNames(english=english, enriched=enriched)
+
+
+async def _iter_export_rows(
+    start: datetime | None, end_exclusive: datetime | None, chunk_rows: int
+) -> AsyncIterator[tuple]:
+    """Yield visible detections newest first, one keyset page per pooled connection.
+
+    The connection is released before the page's rows are handed on, so a slow
+    client never pins a reader (or an open read transaction) between pages.
+    """
+    before: tuple[object, int] | None = None
+    while True:
+        async with get_db() as db:
+            rows = await EbirdRepository(db).get_export_page(
+                start=start, end_exclusive=end_exclusive, before=before, limit=chunk_rows
+            )
+        for row in rows:
+            yield tuple(row)
+        if len(rows) < chunk_rows:
+            return
+        before = (rows[-1][4], int(rows[-1][0]))
+
+
+@dataclass
+class _SpeciesTally:
+    count: int
+    best_score: float
+    scientific_name: str | None
+    provider: str | None
+    backend: str | None
+
+
+@dataclass
+class _ChecklistDay:
+    """Checklists of one date: one per camera, each spanning its first to last detection."""
+
+    spans: dict[str | None, tuple[datetime, datetime]] = field(default_factory=dict)
+    # Keyed by (camera, export common name) in first-seen order, which is the output order.
+    species: dict[tuple[str | None, str], _SpeciesTally] = field(default_factory=dict)
+
+    def add(
+        self,
+        *,
+        dt: datetime,
+        camera_name: str | None,
+        export_name: str,
+        score: float,
+        scientific_name: str | None,
+        provider: str | None,
+        backend: str | None,
+    ) -> None:
+        span = self.spans.get(camera_name)
+        self.spans[camera_name] = (min(span[0], dt), max(span[1], dt)) if span else (dt, dt)
+
+        tally = self.species.get((camera_name, export_name))
+        if tally is None:
+            self.species[(camera_name, export_name)] = _SpeciesTally(1, score, scientific_name, provider, backend)
+            return
+        tally.count += 1
+        # Keep metadata from the highest-scoring detection
+        if score > tally.best_score:
+            tally.best_score = score
+            tally.scientific_name = scientific_name
+            tally.provider = provider
+            tally.backend = backend
+
+    def write(self, writer) -> None:
+        """Emit one row per species per checklist."""
+        for (camera_name, export_name), tally in self.species.items():
+            start_dt, end_dt = self.spans[camera_name]
+            # Detect when the export name is a scientific name fallback.
+            sci_lower = str(tally.scientific_name or "").strip().lower()
+            writer.writerow(
+                _format_ebird_row(
+                    export_common_name=export_name,
+                    scientific_name=tally.scientific_name,
+                    checklist_start=start_dt,
+                    count=tally.count,
+                    best_score=tally.best_score,
+                    camera_name=camera_name,
+                    duration_minutes=max(0, int((end_dt - start_dt).total_seconds() // 60)),
+                    video_classification_provider=tally.provider,
+                    video_classification_backend=tally.backend,
+                    used_scientific_fallback=bool(sci_lower and export_name.strip().lower() == sci_lower),
+                )
+            )
+
+
+def _score(value: object) -> float:
+    try:
+        score = float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return float("nan")
+    return score if math.isfinite(score) else float("nan")
+
+
+async def iter_ebird_csv(
+    *, start: datetime | None, end_exclusive: datetime | None, chunk_rows: int | None = None
+) -> AsyncIterator[str]:
+    """Yield the eBird CSV for non-hidden detections in ``[start, end_exclusive)``, one day at a time."""
+    names = await _load_export_names(start, end_exclusive)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_MINIMAL)
+    current_day: date | None = None
+    checklists = _ChecklistDay()
+
+    async for (
+        _id,
+        taxa_id,
+        display_name,
+        scientific_name,
+        detection_time,
+        score,
+        camera_name,
+        common_name,
+        provider,
+        backend,
+    ) in _iter_export_rows(start, end_exclusive, chunk_rows or EBIRD_EXPORT_CHUNK_ROWS):
+        english_common_name = names.english.get((taxa_id, scientific_name))
+        if not _is_exportable_ebird_detection(
+            display_name=display_name,
+            common_name=common_name,
+            english_common_name=english_common_name,
+            scientific_name=scientific_name,
+        ):
+            continue
+        dt = _parse_detection_time(detection_time)
+        if dt is None:
+            continue
+
+        # Rows arrive newest first, so a new date means the previous one is complete.
+        if dt.date() != current_day:
+            if checklists.species:
+                checklists.write(writer)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+            current_day = dt.date()
+            checklists = _ChecklistDay()
+
+        checklists.add(
+            dt=dt,
+            camera_name=camera_name,
+            export_name=_resolve_export_common_name(
+                display_name=display_name,
+                common_name=common_name,
+                english_common_name=english_common_name or names.enriched.get(scientific_name or ""),
+                scientific_name=scientific_name,
+            ),
+            score=_score(score),
+            scientific_name=scientific_name,
+            provider=provider,
+            backend=backend,
+        )
+
+    if checklists.species:
+        checklists.write(writer)
+        yield buffer.getvalue()
@@ -7,6 +7,7 @@ import httpx
 import structlog
 
 from app.config import settings
+from app.services.reference_cache import reference_cache
 
 log = structlog.get_logger()
 
@@ -150,7 +151,9 @@ class EbirdService:
             "maxResults": max_results,
             "locale": settings.ebird.locale,
         }
-        return await self._fetch_json(path, params)
+        # Served stale-while-revalidate; coordinates are rounded so nearby requests share an entry.
+        cache_key = f"{path}|{lat:.3f}|{lng:.3f}|{dist_km}|{back_days}|{max_results}|{settings.ebird.locale}"
+        return await reference_cache.get_json("ebird_recent", cache_key, lambda: self._fetch_json(path, params))
 
     async def get_taxonomy(self, locale: Optional[str] = None) -> List[Dict[str, Any]]:
         effective_locale = await self.resolve_locale(locale)
@@ -0,0 +1,452 @@
+"""Isolated side-car process for model evaluation.
+
+The eval harness used to score candidates by activating each one on the live
+ClassifierService, which misclassified or stalled live detections for the
+length of a run. The side-car instead loads the candidate in its own
+CPU-capped child process (``python -m app.services.eval.sidecar <model_id>``)
+with a process-local model selection, so ``active_model.json`` and the live
+classifier are never touched.
+
+Protocol: JSON lines over stdin/stdout. The child emits ``ready`` (with the
+resolved model spec and classifier status) or ``error``, then answers each
+``classify_batch`` request of image paths with a ``batch_result`` carrying
+top-5 predictions, per-image inference latency and, for tensor-capable models,
+preprocessing time. ``shutdown`` is answered with a
+final ``closed`` status snapshot and tensor-cache statistics.
+
+When given a cache directory the child reuses preprocessed input tensors
+across models (see ``app.services.eval.tensor_cache``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, Optional
+
+import structlog
+
+from app.services.eval.tensor_cache import PreprocessedTensorCache, image_key
+
+log = structlog.get_logger()
+
+MODEL_EVAL_SIDECAR_CPU_LIMIT = max(1, int(os.getenv("MODEL_EVAL_SIDECAR_CPU_LIMIT", "1")))
+MODEL_EVAL_SIDECAR_NICE = max(0, min(19, int(os.getenv("MODEL_EVAL_SIDECAR_NICE", "10"))))
+MODEL_EVAL_SIDECAR_BATCH_SIZE = max(1, int(os.getenv("MODEL_EVAL_SIDECAR_BATCH_SIZE", "8")))
+MODEL_EVAL_SIDECAR_START_TIMEOUT_SECONDS = max(1.0, float(os.getenv("MODEL_EVAL_SIDECAR_START_TIMEOUT_SECONDS", "300")))
+MODEL_EVAL_SIDECAR_BATCH_TIMEOUT_SECONDS = max(1.0, float(os.getenv("MODEL_EVAL_SIDECAR_BATCH_TIMEOUT_SECONDS", "300")))
+SIDECAR_STREAM_LIMIT_BYTES = 4 * 1024 * 1024
+
+# Thread-pool knobs honoured by the numeric runtimes the classifier can load.
+_THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "TFLITE_NUM_THREADS",
+)
+
+
+class EvalSidecarError(RuntimeError):
+    pass
+
+
+def encode_sidecar_message(message: dict[str, Any]) -> bytes:
+    return (json.dumps(message, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+
+
+def decode_sidecar_message(raw: bytes | str) -> dict[str, Any]:
+    try:
+        decoded = raw.decode("utf-8") if isinstance(raw, bytes) else str(raw)
+        payload = json.loads(decoded)
+    except Exception as exc:
+        raise ValueError("invalid sidecar message") from exc
+    if not isinstance(payload, dict) or not isinstance(payload.get("type"), str):
+        raise ValueError("sidecar message must be an object with a type")
+    return payload
+
+
+def sidecar_environment(cpu_limit: int = MODEL_EVAL_SIDECAR_CPU_LIMIT) -> dict[str, str]:
+    """Environment for the child with every runtime thread pool capped."""
+    env = dict(os.environ)
+    threads = str(max(1, int(cpu_limit)))
+    for name in _THREAD_ENV_VARS:
+        env[name] = threads
+    env["MODEL_EVAL_SIDECAR_CPU_LIMIT"] = threads
+    env["PYTHONUNBUFFERED"] = "1"
+    return env
+
+
+def apply_cpu_cap(cpu_limit: int, nice: int) -> list[int] | None:
+    """Pin the current process to ``cpu_limit`` CPUs and lower its priority.
+
+    Both calls are best-effort: platforms without ``sched_setaffinity`` or
+    containers that forbid renicing simply run uncapped beyond the thread-pool
+    limits set in the environment.
+    """
+    if nice > 0:
+        try:
+            os.nice(nice)
+        except (AttributeError, OSError):
+            pass
+    getter = getattr(os, "sched_getaffinity", None)
+    setter = getattr(os, "sched_setaffinity", None)
+    if getter is None or setter is None:
+        return None
+    try:
+        available = sorted(getter(0))
+        # Take the highest-numbered CPUs; the live service tends to be
+        # scheduled from CPU 0 upwards.
+        pinned = available[-max(1, int(cpu_limit)) :]
+        setter(0, set(pinned))
+        return pinned
+    except OSError:
+        return None
+
+
+class EvalSidecar:
+    """Parent-side handle for one model's side-car process."""
+
+    def __init__(
+        self,
+        model_id: str,
+        *,
+        cpu_limit: int = MODEL_EVAL_SIDECAR_CPU_LIMIT,
+        start_timeout_seconds: float = MODEL_EVAL_SIDECAR_START_TIMEOUT_SECONDS,
+        batch_timeout_seconds: float = MODEL_EVAL_SIDECAR_BATCH_TIMEOUT_SECONDS,
+        tensor_cache_dir: str | os.PathLike[str] | None = None,
+        process_factory: Any | None = None,
+    ) -> None:
+        self.model_id = str(model_id)
+        self.tensor_cache_dir = str(tensor_cache_dir) if tensor_cache_dir else None
+        self.cpu_limit = max(1, int(cpu_limit))
+        self.start_timeout_seconds = float(start_timeout_seconds)
+        self.batch_timeout_seconds = float(batch_timeout_seconds)
+        self._process_factory = process_factory or self._spawn_process
+        self._process: Any = None
+        self.ready_payload: dict[str, Any] = {}
+
+    async def start(self) -> dict[str, Any]:
+        self._process = await self._process_factory(
+            model_id=self.model_id,
+            cpu_limit=self.cpu_limit,
+            tensor_cache_dir=self.tensor_cache_dir,
+        )
+        try:
+            message = await self._read_message(self.start_timeout_seconds)
+        except BaseException:
+            await self.close()
+            raise
+        if message.get("type") == "error":
+            await self.close()
+            raise EvalSidecarError(str(message.get("error") or "sidecar failed to start"))
+        if message.get("type") != "ready":
+            await self.close()
+            raise EvalSidecarError(f"unexpected sidecar message: {message.get('type')}")
+        self.ready_payload = message
+        return message
+
+    async def classify_batch(self, image_paths: list[str]) -> list[dict[str, Any]]:
+        await self._send({"type": "classify_batch", "paths": [str(path) for path in image_paths]})
+        message = await self._read_message(self.batch_timeout_seconds)
+        if message.get("type") != "batch_result":
+            raise EvalSidecarError(str(message.get("error") or f"unexpected sidecar message: {message.get('type')}"))
+        return list(message.get("items") or [])
+
+    async def close(self) -> dict[str, Any]:
+        """Ask the child to exit and return its final status snapshot."""
+        process = self._process
+        if process is None:
+            return {}
+        self._process = None
+        final: dict[str, Any] = {}
+        try:
+            if getattr(process, "returncode", None) is None:
+                process.stdin.write(encode_sidecar_message({"type": "shutdown"}))
+                await process.stdin.drain()
+                message = await self._read_message(10.0, process=process)
+                if message.get("type") == "closed":
+                    final = message
+        except Exception:
+            pass
+        try:
+            await asyncio.wait_for(process.wait(), timeout=10.0)
+        except Exception:
+            try:
+                process.kill()
+                await process.wait()
+            except Exception:
+                pass
+        return final
+
+    async def __aenter__(self) -> "EvalSidecar":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_exc: Any) -> None:
+        await self.close()
+
+    async def _send(self, message: dict[str, Any]) -> None:
+        if self._process is None:
+            raise EvalSidecarError("sidecar is not running")
+        self._process.stdin.write(encode_sidecar_message(message))
+        await self._process.stdin.drain()
+
+    async def _read_message(self, timeout_seconds: float, *, process: Any | None = None) -> dict[str, Any]:
+        process = process or self._process
+        if process is None:
+            raise EvalSidecarError("sidecar is not running")
+        deadline = time.monotonic() + max(0.01, float(timeout_seconds))
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise EvalSidecarError("sidecar timed out")
+            try:
+                raw = await asyncio.wait_for(process.stdout.readline(), timeout=remaining)
+            except asyncio.TimeoutError as exc:
+                raise EvalSidecarError("sidecar timed out") from exc
+            if not raw:
+                raise EvalSidecarError("sidecar exited unexpectedly")
+            try:
+                return decode_sidecar_message(raw)
+            except ValueError:
+                # Native libraries occasionally print banners to stdout before
+                # the child redirects it; skip anything that isn't protocol.
+                continue
+
+    async def _spawn_process(self, *, model_id: str, cpu_limit: int, tensor_cache_dir: str | None) -> Any:
+        backend_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+        return await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            "app.services.eval.sidecar",
+            model_id,
+            tensor_cache_dir or "",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            cwd=backend_root,
+            env=sidecar_environment(cpu_limit),
+            limit=SIDECAR_STREAM_LIMIT_BYTES,
+        )
+
+
+def _tensor_model(classifier: Any) -> Any | None:
+    """The loaded bird model, if it can classify preprocessed tensors directly."""
+    bird = (getattr(classifier, "_models", None) or {}).get("bird")
+    if all(callable(getattr(bird, name, None)) for name in ("preprocessing_plan", "preprocess", "classify_tensor")):
+        return bird
+    return None
+
+
+def _classify_tensor_path(
+    classifier: Any,
+    bird: Any,
+    path: str,
+    *,
+    tensor_cache: PreprocessedTensorCache | None,
+    plan: dict[str, Any],
+    item: dict[str, Any],
+) -> list[dict[str, Any]]:
+    from app.utils.image_io import load_rgb_image
+
+    key = image_key(path) if tensor_cache is not None else None
+    tensor = tensor_cache.get(key, plan) if tensor_cache is not None and key is not None else None
+    if tensor is None:
+        if tensor_cache is not None:
+            item["tensor_cache"] = "miss"
+        t0 = time.monotonic()
+        image = load_rgb_image(path)
+        # Crop resolution runs before preprocessing in the live pipeline, so
+        # the cached tensor is the cropped representation; the crop detector
+        # and policy are part of the plan.
+        crop_image, _diagnostics = classifier._resolve_bird_classification_image(image)
+        tensor = bird.preprocess(crop_image)
+        item["preprocess_ms"] = (time.monotonic() - t0) * 1000.0
+        if tensor_cache is not None and key is not None:
+            tensor_cache.put(key, plan, tensor)
+    else:
+        item["tensor_cache"] = "hit"
+        item["preprocess_ms"] = 0.0
+    t0 = time.monotonic()
+    try:
+        results = bird.classify_tensor(tensor, top_k=5)
+    except Exception:
+        # Let the service apply its runtime recovery (e.g. GPU -> CPU). The
+        # timing then covers the whole classify call, so no preprocessing split.
+        image = load_rgb_image(path)
+        item["preprocess_ms"] = None
+        t0 = time.monotonic()
+        results = classifier.classify(image)
+    item["latency_ms"] = (time.monotonic() - t0) * 1000.0
+    return results
+
+
+def classify_paths(
+    classifier: Any,
+    image_paths: list[str],
+    *,
+    tensor_cache: PreprocessedTensorCache | None = None,
+    crop_plan: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    """Child-side batch body: classify each path one image at a time.
+
+    When the bird model classifies preprocessed tensors directly,
+    ``latency_ms`` times inference only and ``preprocess_ms`` times decode,
+    crop and preprocessing (0 on a tensor-cache hit), whether or not a cache
+    is configured. Otherwise ``latency_ms`` times the whole classify call and
+    ``preprocess_ms`` is None.
+    """
+    from app.utils.image_io import load_rgb_image
+
+    bird = _tensor_model(classifier)
+    plan = {"model": bird.preprocessing_plan(), "crop": crop_plan or {}} if bird is not None else None
+    items: list[dict[str, Any]] = []
+    for path in image_paths:
+        item: dict[str, Any] = {"path": path, "top5": [], "latency_ms": None, "preprocess_ms": None, "error": None}
+        if bird is not None and plan is not None:
+            try:
+                results = _classify_tensor_path(classifier, bird, path, tensor_cache=tensor_cache, plan=plan, item=item)
+            except Exception as exc:
+                item["error"] = f"classify_failed: {exc}"
+                items.append(item)
+                continue
+        else:
+            try:
+                image = load_rgb_image(path)
+            except Exception as exc:
+                item["error"] = f"image_open_failed: {exc}"
+                items.append(item)
+                continue
+            t0 = time.monotonic()
+            try:
+                results = classifier.classify(image)
+            except Exception as exc:
+                item["error"] = f"classify_failed: {exc}"
+                items.append(item)
+                continue
+            item["latency_ms"] = (time.monotonic() - t0) * 1000.0
+        item["top5"] = [
+            {"label": result.get("label"), "score": float(result.get("score") or 0.0)}
+            for result in list(results or [])[:5]
+        ]
+        items.append(item)
+    return items
+
+
+def _crop_plan(spec: dict[str, Any]) -> dict[str, Any]:
+    """Everything that decides the cropped tensor besides the model's own preprocessing."""
+    from app.services.bird_crop_service import bird_crop_service
+
+    return {
+        "crop_generator": spec.get("crop_generator") or {},
+        "crop_policy": bird_crop_service.get_classification_candidate_crop_policy(),
+        "crop_models": bird_crop_service.get_model_fingerprint(),
+    }
+
+
+def _load_candidate(model_id: str) -> tuple[Any, dict[str, Any]]:
+    from app.services.classifier_service import ClassifierService
+    from app.services.model_manager import model_manager
+
+    if not model_manager.select_model_for_process(model_id):
+        raise EvalSidecarError(f"model is not installed or cannot be selected: {model_id}")
+    spec = dict(model_manager.get_active_model_spec() or {})
+    if str(spec.get("model_id") or "") != model_id:
+        # get_active_model_spec silently falls back to the bundled model; that
+        # would score the wrong network under the candidate's name.
+        raise EvalSidecarError(f"model spec resolved to {spec.get('model_id')!r} instead of {model_id!r}")
+    # worker_process_mode loads the bird model in-process via
+    # _build_bird_model_for_backend instead of spawning supervised workers.
+    return ClassifierService(worker_process_mode=True), spec
+
+
+def _classifier_status(classifier: Any) -> dict[str, Any]:
+    try:
+        return dict(classifier.get_status() or {})
+    except Exception as exc:
+        return {"status_error": str(exc)}
+
+
+def run_sidecar(model_id: str, *, stdin: Any, stdout: Any, tensor_cache_dir: str | None = None) -> int:
+    def _emit(message: dict[str, Any]) -> None:
+        stdout.write(encode_sidecar_message(message))
+        stdout.flush()
+
+    def _closing_status() -> dict[str, Any]:
+        final: dict[str, Any] = {"type": "closed", "status": _classifier_status(classifier)}
+        if tensor_cache is not None:
+            tensor_cache.flush()
+            final["tensor_cache"] = tensor_cache.stats()
+        return final
+
+    pinned = apply_cpu_cap(MODEL_EVAL_SIDECAR_CPU_LIMIT, MODEL_EVAL_SIDECAR_NICE)
+    try:
+        classifier, spec = _load_candidate(model_id)
+    except Exception as exc:
+        _emit({"type": "error", "error": str(exc)})
+        return 1
+
+    tensor_cache = PreprocessedTensorCache(tensor_cache_dir) if tensor_cache_dir else None
+    crop_plan = _crop_plan(spec) if tensor_cache is not None else None
+    _emit(
+        {
+            "type": "ready",
+            "model_id": model_id,
+            "pid": os.getpid(),
+            "cpu_affinity": pinned,
+            "spec": spec,
+            "status": _classifier_status(classifier),
+        }
+    )
+    try:
+        for raw in iter(stdin.readline, b""):
+            try:
+                message = decode_sidecar_message(raw)
+            except ValueError as exc:
+                _emit({"type": "error", "error": str(exc)})
+                continue
+            message_type = message["type"]
+            if message_type == "shutdown":
+                _emit(_closing_status())
+                break
+            if message_type == "classify_batch":
+                items = classify_paths(
+                    classifier,
+                    list(message.get("paths") or []),
+                    tensor_cache=tensor_cache,
+                    crop_plan=crop_plan,
+                )
+                _emit({"type": "batch_result", "items": items})
+                continue
+            _emit({"type": "error", "error": f"unknown message type: {message_type}"})
+    finally:
+        try:
+            asyncio.run(classifier.shutdown())
+        except Exception:
+            pass
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = list(sys.argv[1:] if argv is None else argv)
+    if not args:
+        sys.stderr.write("usage: python -m app.services.eval.sidecar <model_id> [tensor_cache_dir]\n")
+        return 2
+    # Keep the protocol channel clean: anything the model runtimes print goes
+    # to stderr instead of corrupting the JSON-lines stream.
+    protocol_stdout = os.fdopen(os.dup(sys.stdout.fileno()), "wb", closefd=True)
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    return run_sidecar(
+        args[0],
+        stdin=sys.stdin.buffer,
+        stdout=protocol_stdout,
+        tensor_cache_dir=args[1] if len(args) > 1 and args[1] else None,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""Content-addressed on-disk cache of preprocessed classifier input tensors.
+
+Model evaluation scores the same panel images against every installed
+classifier, and most of that time goes to JPEG decoding and resize/normalize
+rather than inference. Tensors are keyed by (image content hash, preprocessing
+plan). The plan is a JSON description of everything the model's preprocessing
+depends on, so models that share an input size and normalization share
+entries.
+
+Layout under the cache root::
+
+    <plan_key>/plan.json         the plan the key was derived from
+    <plan_key>/index.json        {"shards": [...], "entries": {image_key: [shard, row]}}
+    <plan_key>/shard-00000.npy   stacked tensors, read back with mmap_mode="r"
+
+Shards are written once and never modified, so readers memory-map them and
+stream rows without re-decoding. A single writer per cache root is assumed
+(eval runs are serialized by ``ModelEvalRunner``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Optional
+
+import structlog
+
+from app.utils.lazy_imports import lazy_module
+
+np = lazy_module("numpy")
+
+log = structlog.get_logger()
+
+DEFAULT_SHARD_ROWS = 256
+INDEX_FILENAME = "index.json"
+PLAN_FILENAME = "plan.json"
+
+# Bumped whenever the on-disk layout changes so stale shards are never reused.
+CACHE_LAYOUT_VERSION = 1
+
+
+def plan_key(plan: dict[str, Any]) -> str:
+    payload = json.dumps({"v": CACHE_LAYOUT_VERSION, "plan": plan}, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def image_key(path: str | os.PathLike[str]) -> str:
+    """SHA-256 of the file bytes; hashing is far cheaper than decoding."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PreprocessedTensorCache:
+    def __init__(self, root: str | os.PathLike[str], *, shard_rows: int = DEFAULT_SHARD_ROWS) -> None:
+        self.root = Path(root)
+        self.shard_rows = max(1, int(shard_rows))
+        self._indexes: dict[str, dict[str, Any]] = {}
+        self._plans: dict[str, dict[str, Any]] = {}
+        self._mmaps: dict[tuple[str, str], np.ndarray] = {}
+        self._pending: dict[str, list[tuple[str, np.ndarray]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+
+    def get(self, key: str, plan: dict[str, Any]) -> Optional[np.ndarray]:
+        """Return the cached batched tensor (``[1, ...]``) or None."""
+        pkey = plan_key(plan)
+        for pending_key, tensor in self._pending.get(pkey, ()):
+            if pending_key == key:
+                self.hits += 1
+                return tensor[np.newaxis, ...]
+        location = self._index(pkey)["entries"].get(key)
+        if location is None:
+            self.misses += 1
+            return None
+        shard_name, row = location
+        try:
+            shard = self._shard(pkey, shard_name)
+            tensor = np.array(shard[int(row)])
+        except (OSError, ValueError, IndexError) as exc:
+            log.warning("tensor_cache_read_failed", plan_key=pkey, shard=shard_name, error=str(exc))
+            self.misses += 1
+            return None
+        self.hits += 1
+        return tensor[np.newaxis, ...]
+
+    def put(self, key: str, plan: dict[str, Any], tensor: np.ndarray) -> None:
+        """Queue a batched tensor for the plan's next shard."""
+        array = np.asarray(tensor)
+        if array.ndim < 2 or array.shape[0] != 1:
+            return
+        pkey = plan_key(plan)
+        self._plans.setdefault(pkey, dict(plan))
+        pending = self._pending.setdefault(pkey, [])
+        if pending and pending[0][1].shape != array.shape[1:]:
+            return
+        if key in self._index(pkey)["entries"] or any(existing == key for existing, _ in pending):
+            return
+        pending.append((key, np.ascontiguousarray(array[0])))
+        if len(pending) >= self.shard_rows:
+            self._flush_plan(pkey)
+
+    def flush(self) -> None:
+        for pkey in list(self._pending):
+            self._flush_plan(pkey)
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stored": self.stored,
+            "reuse_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+    def prune(self, max_bytes: int) -> int:
+        """Drop least recently written plans until the cache fits ``max_bytes``."""
+        if not self.root.is_dir():
+            return 0
+        plans: list[tuple[float, int, Path]] = []
+        for plan_dir in self.root.iterdir():
+            if not plan_dir.is_dir():
+                continue
+            size = sum(item.stat().st_size for item in plan_dir.iterdir() if item.is_file())
+            index_path = plan_dir / INDEX_FILENAME
+            mtime = index_path.stat().st_mtime if index_path.exists() else 0.0
+            plans.append((mtime, size, plan_dir))
+        total = sum(size for _mtime, size, _dir in plans)
+        removed = 0
+        for _mtime, size, plan_dir in sorted(plans):
+            if total <= max_bytes:
+                break
+            shutil.rmtree(plan_dir, ignore_errors=True)
+            self._indexes.pop(plan_dir.name, None)
+            self._mmaps = {k: v for k, v in self._mmaps.items() if k[0] != plan_dir.name}
+            total -= size
+            removed += 1
+        return removed
+
+    def _index(self, pkey: str) -> dict[str, Any]:
+        index = self._indexes.get(pkey)
+        if index is None:
+            index = {"shards": [], "entries": {}}
+            index_path = self.root / pkey / INDEX_FILENAME
+            if index_path.exists():
+                try:
+                    loaded = json.loads(index_path.read_text(encoding="utf-8"))
+                    index = {
+                        "shards": list(loaded.get("shards") or []),
+                        "entries": dict(loaded.get("entries") or {}),
+                    }
+                except (OSError, ValueError) as exc:
+                    log.warning("tensor_cache_index_unreadable", plan_key=pkey, error=str(exc))
+            self._indexes[pkey] = index
+        return index
+
+    def _shard(self, pkey: str, shard_name: str) -> np.ndarray:
+        cached = self._mmaps.get((pkey, shard_name))
+        if cached is None:
+            cached = np.load(self.root / pkey / shard_name, mmap_mode="r")
+            self._mmaps[(pkey, shard_name)] = cached
+        return cached
+
+    def _flush_plan(self, pkey: str) -> None:
+        pending = self._pending.pop(pkey, [])
+        if not pending:
+            return
+        plan_dir = self.root / pkey
+        try:
+            plan_dir.mkdir(parents=True, exist_ok=True)
+            index = self._index(pkey)
+            shard_name = f"shard-{len(index['shards']):05d}.npy"
+            stacked = np.stack([tensor for _key, tensor in pending])
+            temporary_shard = plan_dir / f"{shard_name}.tmp"
+            with open(temporary_shard, "wb") as handle:
+                np.save(handle, stacked)
+            os.replace(temporary_shard, plan_dir / shard_name)
+            index["shards"].append(shard_name)
+            for row, (key, _tensor) in enumerate(pending):
+                index["entries"][key] = [shard_name, row]
+            plan_path = plan_dir / PLAN_FILENAME
+            if not plan_path.exists():
+                plan_path.write_text(json.dumps(self._plans.get(pkey, {}), sort_keys=True, default=str), "utf-8")
+            temporary_index = plan_dir / f"{INDEX_FILENAME}.tmp"
+            temporary_index.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+            os.replace(temporary_index, plan_dir / INDEX_FILENAME)
+            self.stored += len(pending)
+        except OSError as exc:
+            log.warning("tensor_cache_write_failed", plan_key=pkey, error=str(exc))
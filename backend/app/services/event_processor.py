@@ -9,7 +9,6 @@ from datetime import datetime, timezone
 from typing import Optional, Dict, Any, Tuple
 from types import SimpleNamespace
 from io import BytesIO
-from PIL import Image
 
 from app.config import settings
 from app.services.classification_admission import ClassificationLeaseExpiredError
@@ -32,8 +31,10 @@ from app.services.audio.audio_service import audio_service
 from app.services.weather_service import weather_service
 from app.services.notification_orchestrator import NotificationOrchestrator
 from app.services.notification_dispatcher import notification_dispatcher
+from app.services.taxonomy.label_taxonomy_table import label_taxonomy_table
 from app.services.taxonomy.taxonomy_service import taxonomy_service
 from app.services.error_diagnostics import error_diagnostics_history
+from app.services.event_track_index import event_track_indexes
 from app.services.full_visit_clip_service import full_visit_clip_service
 from app.services.mqtt_service import mqtt_service
 from app.utils.frigate import parse_sub_label
@@ -42,11 +43,14 @@ from app.utils.frigate import parse_sub_label
 from app.services.notification_service import notification_service  # noqa: F401
 from app.database import get_db
 from app.repositories.detection_repository import DetectionRepository
+from app.utils.lazy_imports import lazy_module
+
+Image = lazy_module("PIL.Image")
 
 log = structlog.get_logger()
 
 
-def decode_image_bytes(contents: bytes) -> Image.Image:
+def decode_image_bytes(contents: bytes) -> "Image.Image":
     image = Image.open(BytesIO(contents))
     image.load()
     return image
@@ -94,6 +98,13 @@ EVENT_SNAPSHOT_RECOVERY_EXTRA_RETRIES = max(
 # Frigate's continuous recording when no snapshot/thumbnail is available.
 RECORDING_FRAME_FALLBACK_BEFORE_SECONDS = max(0, int(os.getenv("RECORDING_FRAME_FALLBACK_BEFORE_SECONDS", "2")))
 RECORDING_FRAME_FALLBACK_AFTER_SECONDS = max(1, int(os.getenv("RECORDING_FRAME_FALLBACK_AFTER_SECONDS", "8")))
+# Per-event refresh state is forgotten on `end`; this TTL bounds entries for
+# events whose terminal message never arrives.
+LIVE_EVENT_REFRESH_STATE_TTL_SECONDS = max(
+    60.0,
+    float(os.getenv("LIVE_EVENT_REFRESH_STATE_TTL_SECONDS", "3600")),
+)
+LIVE_EVENT_REFRESH_SCORE_EPSILON = 0.005
 _CLASSIFY_SNAPSHOT_OVERLOADED = object()
 _CLASSIFY_SNAPSHOT_TIMED_OUT = object()
 
@@ -134,7 +145,7 @@ class EventProcessor:
         # via the constructor keep working because resolve_live_classifier()
         # leaves non-ClassifierService references untouched.
         self._classifier_ref: ClassifierService | None = classifier
-        self.detection_service = DetectionService(self.classifier)
+        self._detection_service: DetectionService | None = None
         self.notification_orchestrator = NotificationOrchestrator()
         self._false_positive_tombstones: dict[str, float] = {}
         self._started_events = 0
@@ -152,6 +163,19 @@ class EventProcessor:
         self._last_critical_failure_monotonic: float | None = None
         self._last_critical_failure: dict[str, Any] | None = None
         self._active_live_event_keys: set[str] = set()
+        self._live_event_refresh_state: dict[str, dict[str, Any]] = {}
+        self._live_event_refresh_classifications = 0
+        self._live_event_refresh_avoided = 0
+        self._live_event_refresh_reasons: Counter[str] = Counter()
+        self._live_event_refresh_recent: deque[dict[str, Any]] = deque(maxlen=20)
+
+    @property
+    def detection_service(self) -> DetectionService:
+        # Built on first use: startup constructs the processor for MQTT intake
+        # while the classifier is still loading in its own lifecycle phase.
+        if self._detection_service is None:
+            self._detection_service = DetectionService(self.classifier)
+        return self._detection_service
 
     @property
     def classifier(self) -> ClassifierService:
@@ -339,6 +363,7 @@ class EventProcessor:
             "critical_failure_active": critical_failure_active,
             "has_unresolved_post_failure_work": has_unresolved_post_failure_work,
             "recent_outcomes": list(self._recent_outcomes),
+            "live_event_refresh": self._live_event_refresh_status(),
         }
 
     async def _run_stage(
@@ -413,6 +438,9 @@ class EventProcessor:
             return False, fallback
 
     async def _lookup_taxonomy_aliases(self, query: str, event_id: str | None = None) -> Dict[str, Any]:
+        cached = label_taxonomy_table.get(query)
+        if cached is not None:
+            return cached.names()
         try:
             taxonomy = await asyncio.wait_for(
                 taxonomy_service.get_names(query),
@@ -471,6 +499,7 @@ class EventProcessor:
         self._started_events += 1
         started = time.monotonic()
         recovering_terminal_event = False
+        refresh_reason: str | None = None
 
         if event.is_false_positive:
             self._mark_false_positive_tombstone(event.frigate_event)
@@ -498,7 +527,12 @@ class EventProcessor:
                 )
                 self._record_drop(event.frigate_event, "end_recovery_lookup_failed")
                 return
-            if existing_detection is not None:
+            refresh_reason = (
+                self._live_event_refresh_reason(event, terminal=True) if existing_detection is not None else None
+            )
+            if existing_detection is not None and refresh_reason is None:
+                self._note_live_event_refresh_avoided(event)
+                self._finish_live_event_refresh(event)
                 await self._handle_terminal_event_enrichment(event)
                 duration_ms = (time.monotonic() - started) * 1000.0
                 self._record_completed(event.frigate_event, duration_ms)
@@ -509,11 +543,19 @@ class EventProcessor:
                 )
                 return
             recovering_terminal_event = True
-            log.info(
-                "Retrying missing initial detection from final Frigate event state",
-                event_id=event.frigate_event,
-                camera=event.camera,
-            )
+            if refresh_reason is not None:
+                log.info(
+                    "Running final live event classification on improved Frigate snapshot",
+                    event_id=event.frigate_event,
+                    camera=event.camera,
+                    reason=refresh_reason,
+                )
+            else:
+                log.info(
+                    "Retrying missing initial detection from final Frigate event state",
+                    event_id=event.frigate_event,
+                    camera=event.camera,
+                )
 
         if event_type == "update":
             try:
@@ -526,17 +568,51 @@ class EventProcessor:
                 )
                 self._record_drop(event.frigate_event, "update_recovery_lookup_failed")
                 return
-            if existing_detection is not None:
+            refresh_reason = (
+                self._live_event_refresh_reason(event, terminal=False) if existing_detection is not None else None
+            )
+            if existing_detection is not None and refresh_reason is None:
+                self._note_live_event_refresh_avoided(event)
                 duration_ms = (time.monotonic() - started) * 1000.0
                 self._record_completed(event.frigate_event, duration_ms)
                 self._record_recent_outcome(event.frigate_event, "update_already_ingested")
                 return
-            log.info(
-                "Retrying failed initial ingest from Frigate update",
-                event_id=event.frigate_event,
-                camera=event.camera,
+            if refresh_reason is not None:
+                log.info(
+                    "Re-classifying live event after Frigate snapshot change",
+                    event_id=event.frigate_event,
+                    camera=event.camera,
+                    reason=refresh_reason,
+                )
+            else:
+                log.info(
+                    "Retrying failed initial ingest from Frigate update",
+                    event_id=event.frigate_event,
+                    camera=event.camera,
+                )
+
+        try:
+            await self._classify_and_save_event(
+                event,
+                started=started,
+                recovering_terminal_event=recovering_terminal_event,
+                refresh_reason=refresh_reason,
             )
+        finally:
+            if recovering_terminal_event:
+                # Forget the refresh state even when the final pass fails so it
+                # does not linger until the TTL and suppress later retries.
+                self._finish_live_event_refresh(event)
 
+    async def _classify_and_save_event(
+        self,
+        event: EventData,
+        *,
+        started: float,
+        recovering_terminal_event: bool,
+        refresh_reason: str | None,
+    ) -> None:
+        """Classify an admitted event snapshot, then save and notify."""
         if not recovering_terminal_event and self._is_stale_live_event(event):
             age_seconds = round(self._live_event_age_seconds(event), 1)
             log.info(
@@ -578,6 +654,9 @@ class EventProcessor:
         finally:
             self._release_live_event_key(event)
 
+        if classification_result and isinstance(classification_result, tuple):
+            self._note_live_event_classified(event, refresh_reason)
+
         if classification_result is _CLASSIFY_SNAPSHOT_OVERLOADED:
             self._record_drop(event.frigate_event, "classify_snapshot_overloaded", stage="classify_snapshot")
             return
@@ -684,16 +763,22 @@ class EventProcessor:
 
     async def _handle_terminal_event_enrichment(self, event: EventData) -> None:
         """Schedule final media work only after the detection is durable."""
+        event_data = {
+            "start_time": event.start_time_ts,
+            "end_time": getattr(event, "end_time_ts", None),
+            "data": event.data,
+            **({"snapshot": event.snapshot} if event.snapshot else {}),
+        }
+        try:
+            # Build the track index once, before any clip consumer decodes frames.
+            await event_track_indexes.record_event_end(event.frigate_event, event_data)
+        except Exception as exc:
+            log.debug("Event track index build failed", event_id=event.frigate_event, error=str(exc))
         try:
             if media_cache.has_snapshot(event.frigate_event):
                 high_quality_snapshot_service.schedule_final_replacement(
                     event.frigate_event,
-                    event_data={
-                        "start_time": event.start_time_ts,
-                        "end_time": getattr(event, "end_time_ts", None),
-                        "data": event.data,
-                        **({"snapshot": event.snapshot} if event.snapshot else {}),
-                    },
+                    event_data=event_data,
                 )
         except Exception as exc:
             log.warning(
@@ -711,6 +796,139 @@ class EventProcessor:
                 error=str(exc),
             )
 
+    def _live_event_refresh_enabled(self) -> bool:
+        return bool(getattr(settings.classification, "live_event_refresh_enabled", False))
+
+    def _live_event_refresh_min_interval_seconds(self) -> float:
+        try:
+            return max(1.0, float(getattr(settings.classification, "live_event_refresh_min_interval_seconds", 30.0)))
+        except (TypeError, ValueError):
+            return 30.0
+
+    @staticmethod
+    def _optional_float(value: Any) -> float | None:
+        try:
+            return float(value) if value is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    def _event_snapshot_signature(self, event: EventData) -> tuple[float | None, float | None]:
+        snapshot = getattr(event, "snapshot", None)
+        if not isinstance(snapshot, dict):
+            return None, None
+        return self._optional_float(snapshot.get("frame_time")), self._optional_float(snapshot.get("score"))
+
+    def _prune_live_event_refresh_state(self, now: float) -> None:
+        expired = [
+            event_id
+            for event_id, state in self._live_event_refresh_state.items()
+            if now - float(state.get("last_seen_monotonic", now)) >= LIVE_EVENT_REFRESH_STATE_TTL_SECONDS
+        ]
+        for event_id in expired:
+            self._live_event_refresh_state.pop(event_id, None)
+
+    def _live_event_refresh_reason(self, event: EventData, *, terminal: bool) -> str | None:
+        """Decide whether an already-ingested event is worth classifying again.
+
+        Returns the refresh reason, or None when the update/end message carries
+        no better evidence than the snapshot that was last classified.
+        """
+        if not self._live_event_refresh_enabled():
+            return None
+        state = self._live_event_refresh_state.get(event.frigate_event)
+        if state is None:
+            # No baseline (e.g. after a restart): classify one update to establish
+            # it, but never turn a terminal message into an extra pass.
+            return None if terminal else "no_baseline"
+        state["last_seen_monotonic"] = time.monotonic()
+
+        top_score = self._optional_float(getattr(event, "frigate_score", None))
+        best_top_score = state.get("top_score")
+        if top_score is not None and (
+            best_top_score is None or top_score > best_top_score + LIVE_EVENT_REFRESH_SCORE_EPSILON
+        ):
+            return "top_score_improved"
+
+        frame_time, snapshot_score = self._event_snapshot_signature(event)
+        if frame_time is not None and frame_time == state.get("snapshot_frame_time"):
+            # Same snapshot frame as last time: Frigate would serve the same image.
+            return None
+        if terminal:
+            # The final pass only catches a snapshot that changed after the last
+            # classification; the minimum interval no longer matters.
+            return "final_snapshot_changed" if frame_time is not None else None
+        best_snapshot_score = state.get("snapshot_score")
+        if snapshot_score is not None and (
+            best_snapshot_score is None or snapshot_score > best_snapshot_score + LIVE_EVENT_REFRESH_SCORE_EPSILON
+        ):
+            return "snapshot_improved"
+        elapsed = time.monotonic() - float(state.get("last_classified_monotonic", 0.0))
+        if elapsed >= self._live_event_refresh_min_interval_seconds():
+            return "min_interval_elapsed"
+        return None
+
+    def _note_live_event_classified(self, event: EventData, reason: str | None) -> None:
+        if not self._live_event_refresh_enabled():
+            return
+        now = time.monotonic()
+        self._prune_live_event_refresh_state(now)
+        state = self._live_event_refresh_state.setdefault(
+            event.frigate_event,
+            {"classifications": 0, "avoided": 0},
+        )
+        frame_time, snapshot_score = self._event_snapshot_signature(event)
+        top_score = self._optional_float(getattr(event, "frigate_score", None))
+        if top_score is not None:
+            state["top_score"] = max(top_score, state.get("top_score") or top_score)
+        if snapshot_score is not None:
+            state["snapshot_score"] = max(snapshot_score, state.get("snapshot_score") or snapshot_score)
+        state["snapshot_frame_time"] = frame_time
+        state["last_classified_monotonic"] = now
+        state["last_seen_monotonic"] = now
+        state["classifications"] = int(state.get("classifications", 0)) + 1
+        if reason is not None:
+            self._live_event_refresh_classifications += 1
+            self._live_event_refresh_reasons[reason] += 1
+
+    def _note_live_event_refresh_avoided(self, event: EventData) -> None:
+        state = self._live_event_refresh_state.get(event.frigate_event)
+        if state is None or not self._live_event_refresh_enabled():
+            return
+        self._live_event_refresh_avoided += 1
+        state["avoided"] = int(state.get("avoided", 0)) + 1
+
+    def _finish_live_event_refresh(self, event: EventData) -> None:
+        state = self._live_event_refresh_state.pop(event.frigate_event, None)
+        if state is None:
+            return
+        self._live_event_refresh_recent.append(
+            {
+                "event_id": event.frigate_event,
+                "classifications": int(state.get("classifications", 0)),
+                "classifications_avoided": int(state.get("avoided", 0)),
+                "timestamp": self._utc_now(),
+            }
+        )
+
+    def _live_event_refresh_status(self) -> dict[str, Any]:
+        recent = list(self._live_event_refresh_recent)
+        avoided_per_event = (
+            round(sum(item["classifications_avoided"] for item in recent) / len(recent), 2) if recent else None
+        )
+        return {
+            "enabled": self._live_event_refresh_enabled(),
+            "min_interval_seconds": self._live_event_refresh_min_interval_seconds(),
+            "tracked_events": len(self._live_event_refresh_state),
+            "refresh_classifications": self._live_event_refresh_classifications,
+            "refresh_reasons": dict(self._live_event_refresh_reasons),
+            "classifications_avoided": self._live_event_refresh_avoided,
+            "classifications_avoided_by_event": {
+                event_id: int(state.get("avoided", 0)) for event_id, state in self._live_event_refresh_state.items()
+            },
+            "recent_completed_events": recent,
+            "avg_classifications_avoided_per_event": avoided_per_event,
+        }
+
     def _prune_false_positive_tombstones(self) -> None:
         now = time.monotonic()
         expired = [event_id for event_id, expiry in self._false_positive_tombstones.items() if expiry <= now]
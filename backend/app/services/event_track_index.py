@@ -0,0 +1,377 @@
+"""Per-event track index built from Frigate ``path_data`` and ``data.box``.
+
+Frigate reports a tracked object's trajectory as ``path_data`` points (the
+tracked box's bottom-centre, normalized, with a capture timestamp) and the size
+of its best box as ``data.box``. The index resolves those once per event into
+timestamped boxes with their area and whether the box sits fully inside the
+frame. Clip consumers (video classification, HQ snapshot extraction, timeline
+previews) use it to decode frames where the bird is in view instead of
+re-deriving the trajectory for every frame they look at.
+
+Frigate only reports one box size per event, so every point shares the area of
+the best box; the in-view flag is what varies along the track.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, ClassVar, Optional
+
+import structlog
+
+log = structlog.get_logger()
+
+EVENT_TRACK_MAX_POINTS = 240
+# A box closer than this to a frame edge is treated as clipped by it.
+EVENT_TRACK_EDGE_MARGIN = 0.005
+# Coverage assumed beyond the first/last path point when the event bounds are unknown.
+EVENT_TRACK_POINT_HALF_WIDTH_SECONDS = 0.5
+EVENT_TRACK_MEMORY_ENTRIES = 256
+
+
+def _finite(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _box_size(raw_box: Any) -> Optional[tuple[float, float]]:
+    if not isinstance(raw_box, (list, tuple)) or len(raw_box) != 4:
+        return None
+    width = _finite(raw_box[2])
+    height = _finite(raw_box[3])
+    if width is None or height is None or not (0.0 < width <= 1.0) or not (0.0 < height <= 1.0):
+        return None
+    return width, height
+
+
+def _box_bottom_center(raw_box: Any) -> Optional[tuple[float, float]]:
+    if not isinstance(raw_box, (list, tuple)) or len(raw_box) != 4:
+        return None
+    values = [_finite(value) for value in raw_box]
+    if any(value is None for value in values):
+        return None
+    x, y, width, height = values  # type: ignore[misc]
+    if not (0.0 <= x <= 1.0 and 0.0 <= y <= 1.0 and 0.0 < width <= 1.0 and 0.0 < height <= 1.0):
+        return None
+    return x + width / 2.0, y + height
+
+
+@dataclass(frozen=True)
+class TrackPoint:
+    """One Frigate path sample: bottom-centre position and the box it implies."""
+
+    timestamp: float
+    x: float
+    y: float
+    box: Optional[tuple[float, float, float, float]]
+    area: Optional[float]
+    in_view: bool
+
+    @property
+    def normalized(self) -> bool:
+        return 0.0 <= self.x <= 1.0 and 0.0 <= self.y <= 1.0
+
+
+@dataclass(frozen=True)
+class EventTrackIndex:
+    """Timestamp-ordered track of one Frigate event."""
+
+    VERSION: ClassVar[int] = 1
+
+    start_time: Optional[float]
+    end_time: Optional[float]
+    box_size: Optional[tuple[float, float]]
+    anchor: Optional[tuple[float, float]]
+    points: tuple[TrackPoint, ...]
+
+    @classmethod
+    def from_event_data(cls, event_data: Optional[dict[str, Any]]) -> Optional["EventTrackIndex"]:
+        """Build the index from a Frigate event payload, or ``None`` without path data."""
+        if not isinstance(event_data, dict):
+            return None
+        raw_payload = event_data.get("data")
+        payload = raw_payload if isinstance(raw_payload, dict) else {}
+        return cls.from_path_data(
+            payload.get("path_data"),
+            payload.get("box"),
+            start_time=event_data.get("start_time"),
+            end_time=event_data.get("end_time"),
+        )
+
+    @classmethod
+    def from_path_data(
+        cls,
+        path_data: Any,
+        box: Any,
+        *,
+        start_time: Any = None,
+        end_time: Any = None,
+    ) -> Optional["EventTrackIndex"]:
+        box_size = _box_size(box)
+        points: list[TrackPoint] = []
+        for item in path_data if isinstance(path_data, list) else []:
+            if not isinstance(item, (list, tuple)) or len(item) < 2:
+                continue
+            point = item[0]
+            if not isinstance(point, (list, tuple)) or len(point) < 2:
+                continue
+            x, y, timestamp = _finite(point[0]), _finite(point[1]), _finite(item[1])
+            if x is None or y is None or timestamp is None:
+                continue
+            points.append(cls._track_point(timestamp, x, y, box_size))
+            if len(points) >= EVENT_TRACK_MAX_POINTS:
+                break
+        if not points:
+            return None
+        points.sort(key=lambda point: point.timestamp)
+        return cls(
+            start_time=_finite(start_time),
+            end_time=_finite(end_time),
+            box_size=box_size,
+            anchor=_box_bottom_center(box),
+            points=tuple(points),
+        )
+
+    @staticmethod
+    def _track_point(
+        timestamp: float,
+        x: float,
+        y: float,
+        box_size: Optional[tuple[float, float]],
+    ) -> TrackPoint:
+        normalized = 0.0 <= x <= 1.0 and 0.0 <= y <= 1.0
+        if box_size is None or not normalized:
+            return TrackPoint(timestamp, x, y, None, None, normalized)
+        width, height = box_size
+        # Frigate path_data stores the tracked box's bottom-centre point.
+        raw_left = x - width / 2.0
+        raw_top = y - height
+        margin = EVENT_TRACK_EDGE_MARGIN
+        in_view = raw_left >= margin and raw_left + width <= 1.0 - margin and raw_top >= margin and y <= 1.0 - margin
+        left = max(0.0, min(1.0 - width, raw_left))
+        top = max(0.0, min(1.0 - height, raw_top))
+        return TrackPoint(timestamp, x, y, (left, top, width, height), width * height, in_view)
+
+    @classmethod
+    def from_dict(cls, payload: Any) -> Optional["EventTrackIndex"]:
+        if not isinstance(payload, dict) or payload.get("version") != cls.VERSION:
+            return None
+        raw_size = payload.get("box_size")
+        box_size = _box_size([0.0, 0.0, *raw_size]) if isinstance(raw_size, list) and len(raw_size) == 2 else None
+        raw_anchor = payload.get("anchor")
+        anchor = None
+        if isinstance(raw_anchor, (list, tuple)) and len(raw_anchor) == 2:
+            anchor_x, anchor_y = _finite(raw_anchor[0]), _finite(raw_anchor[1])
+            if anchor_x is not None and anchor_y is not None:
+                anchor = (anchor_x, anchor_y)
+        points: list[TrackPoint] = []
+        for item in payload.get("points") or []:
+            if not isinstance(item, (list, tuple)) or len(item) != 3:
+                continue
+            timestamp, x, y = (_finite(value) for value in item)
+            if timestamp is not None and x is not None and y is not None:
+                points.append(cls._track_point(timestamp, x, y, box_size))
+        if not points:
+            return None
+        points.sort(key=lambda point: point.timestamp)
+        return cls(
+            start_time=_finite(payload.get("start_time")),
+            end_time=_finite(payload.get("end_time")),
+            box_size=box_size,
+            anchor=anchor,
+            points=tuple(points),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": self.VERSION,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "box_size": list(self.box_size) if self.box_size is not None else None,
+            "anchor": list(self.anchor) if self.anchor is not None else None,
+            "points": [[point.timestamp, point.x, point.y] for point in self.points],
+        }
+
+    def box_at(self, timestamp: float, *, max_distance_seconds: float) -> Optional[list[float]]:
+        """Return the tracked box nearest ``timestamp``, or ``None`` if no sample is close enough."""
+        boxed = [point for point in self.points if point.box is not None]
+        if not boxed:
+            return None
+        timestamps = [point.timestamp for point in boxed]
+        position = bisect.bisect_left(timestamps, timestamp)
+        neighbours = boxed[max(0, position - 1) : position + 1]
+        nearest = min(neighbours, key=lambda point: abs(point.timestamp - timestamp))
+        if abs(nearest.timestamp - timestamp) > max_distance_seconds:
+            return None
+        return list(nearest.box)  # type: ignore[arg-type]
+
+    def relevant_timestamps(self) -> list[float]:
+        """Order path timestamps by how well they show the bird.
+
+        Points nearest the bottom-centre of Frigate's best box come first, then
+        the middle, last and first samples. In-view points precede points whose
+        box touches a frame edge.
+        """
+        ordered: list[TrackPoint] = []
+        seen: set[float] = set()
+
+        def add(point: TrackPoint) -> None:
+            if point.timestamp not in seen:
+                seen.add(point.timestamp)
+                ordered.append(point)
+
+        if self.anchor is not None:
+            anchor_x, anchor_y = self.anchor
+            for point in sorted(
+                (point for point in self.points if point.normalized),
+                key=lambda point: ((point.x - anchor_x) ** 2 + (point.y - anchor_y) ** 2, point.timestamp),
+            ):
+                add(point)
+        for index in (len(self.points) // 2, len(self.points) - 1, 0):
+            add(self.points[index])
+        return [point.timestamp for point in ordered if point.in_view] + [
+            point.timestamp for point in ordered if not point.in_view
+        ]
+
+    def visible_spans(self) -> list[tuple[float, float]]:
+        """Timestamp ranges during which the bird is in view.
+
+        The object is tracked for the whole event, so each moment takes the
+        in-view flag of its nearest path point; ranges run between midpoints of
+        neighbouring points and out to the event's start and end.
+        """
+        half_width = EVENT_TRACK_POINT_HALF_WIDTH_SECONDS
+        first, last = self.points[0].timestamp, self.points[-1].timestamp
+        track_start = min(first, self.start_time) if self.start_time is not None else first - half_width
+        track_end = max(last, self.end_time) if self.end_time is not None else last + half_width
+        spans: list[tuple[float, float]] = []
+        for position, point in enumerate(self.points):
+            if not point.in_view:
+                continue
+            low = track_start if position == 0 else (self.points[position - 1].timestamp + point.timestamp) / 2.0
+            high = (
+                track_end
+                if position == len(self.points) - 1
+                else (point.timestamp + self.points[position + 1].timestamp) / 2.0
+            )
+            if spans and low <= spans[-1][1]:
+                spans[-1] = (spans[-1][0], max(spans[-1][1], high))
+            else:
+                spans.append((low, high))
+        return spans
+
+    def visible_frame_ranges(self, *, clip_start: float, fps: float, frame_count: int) -> list[tuple[int, int]]:
+        """Inclusive frame-index ranges of a clip starting at ``clip_start`` where the bird is in view."""
+        if frame_count <= 0 or not math.isfinite(fps) or fps <= 0.0 or not math.isfinite(clip_start):
+            return []
+        ranges: list[tuple[int, int]] = []
+        for span_start, span_end in self.visible_spans():
+            first = max(0, int(math.floor((span_start - clip_start) * fps)))
+            last = min(frame_count - 1, int(math.ceil((span_end - clip_start) * fps)))
+            if last < first:
+                continue
+            if ranges and first <= ranges[-1][1] + 1:
+                ranges[-1] = (ranges[-1][0], max(ranges[-1][1], last))
+            else:
+                ranges.append((first, last))
+        return ranges
+
+    def nearest_visible_offset(self, offset: float, *, clip_start: float, max_distance_seconds: float) -> float:
+        """Move a clip offset into the nearest visible span when one is within reach."""
+        timestamp = clip_start + offset
+        best: Optional[float] = None
+        for span_start, span_end in self.visible_spans():
+            candidate = min(max(timestamp, span_start), span_end)
+            if best is None or abs(candidate - timestamp) < abs(best - timestamp):
+                best = candidate
+        if best is None or abs(best - timestamp) > max_distance_seconds:
+            return offset
+        return max(0.0, best - clip_start)
+
+
+class EventTrackIndexStore:
+    """In-memory LRU over track indexes persisted in the media cache.
+
+    The media cache is imported lazily so classifier worker processes can use
+    ``EventTrackIndex`` without initializing cache directories.
+    """
+
+    def __init__(self, max_entries: int = EVENT_TRACK_MEMORY_ENTRIES):
+        self._max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[str, EventTrackIndex] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, event_id: str, index: EventTrackIndex) -> None:
+        with self._lock:
+            self._entries[event_id] = index
+            self._entries.move_to_end(event_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    async def record_event_end(
+        self,
+        event_id: str,
+        event_data: Optional[dict[str, Any]],
+    ) -> Optional[EventTrackIndex]:
+        """Build the final index for an ended event and cache it alongside its media."""
+        from app.services.media_cache import media_cache
+
+        index = EventTrackIndex.from_event_data(event_data)
+        if index is None:
+            return None
+        self._remember(event_id, index)
+        await media_cache.cache_track_index(event_id, index.to_dict())
+        log.debug(
+            "Recorded event track index",
+            event_id=event_id,
+            points=len(index.points),
+            in_view=sum(1 for point in index.points if point.in_view),
+        )
+        return index
+
+    def get_sync(
+        self,
+        event_id: Optional[str],
+        event_data: Optional[dict[str, Any]] = None,
+    ) -> Optional[EventTrackIndex]:
+        """Return the cached index for an event, building it from ``event_data`` when none was recorded."""
+        from app.services.media_cache import media_cache
+
+        if event_id:
+            with self._lock:
+                index = self._entries.get(event_id)
+                if index is not None:
+                    self._entries.move_to_end(event_id)
+                    return index
+            index = EventTrackIndex.from_dict(media_cache.get_track_index_sync(event_id))
+            if index is not None:
+                self._remember(event_id, index)
+                return index
+        index = EventTrackIndex.from_event_data(event_data)
+        if index is not None and event_id:
+            self._remember(event_id, index)
+        return index
+
+    async def get(
+        self,
+        event_id: Optional[str],
+        event_data: Optional[dict[str, Any]] = None,
+    ) -> Optional[EventTrackIndex]:
+        return await asyncio.to_thread(self.get_sync, event_id, event_data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+event_track_indexes = EventTrackIndexStore()
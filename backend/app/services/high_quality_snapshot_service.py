@@ -4,24 +4,27 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import math
 import os
+import statistics
 import sys
 import tempfile
+import time
 import hashlib
 from io import BytesIO
 from collections import Counter, deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Optional
 
-import cv2
-import numpy as np
 import structlog
-from PIL import Image
 
 from app.config import settings
 from app.services.bird_crop_service import bird_crop_service
+from app.services.event_track_index import EventTrackIndex, event_track_indexes
 from app.services.frigate_client import frigate_client
 from app.services.hq_classification_refinement import (
     HQ_REFINEMENT_MIN_TEMPORAL_SEPARATION_SECONDS,
@@ -36,6 +39,11 @@ from app.utils.canonical_species import should_hide_species_label
 from app.utils.classifier_labels import normalize_classifier_label
 from app.utils.tasks import create_background_task
 from app.utils.image_io import decode_image_bytes
+from app.utils.lazy_imports import lazy_module
+
+cv2 = lazy_module("cv2")
+np = lazy_module("numpy")
+Image = lazy_module("PIL.Image")
 
 log = structlog.get_logger()
 
@@ -60,6 +68,9 @@ HQ_MODEL_CROP_MIN_CLASSIFIER_ADVANTAGE = 0.02
 HQ_CLIP_REPLACEMENT_MIN_CLASSIFIER_ADVANTAGE = 0.02
 HQ_PATH_HINT_MAX_DISTANCE_SECONDS = 0.75
 HQ_PROCESSING_PIPELINE = "high_quality_snapshot"
+# Threads for candidate JPEG encoding, decoding and image-quality metrics.
+HQ_MEDIA_WORKERS = max(1, int(os.environ.get("HQ_MEDIA_WORKERS", "2")))
+HQ_LATENCY_SAMPLES = 200
 # Four total attempts over roughly one hour. Event media is normally ready in
 # seconds; continued absence after this bounded window is terminal unless an
 # owner explicitly regenerates it with newly available media.
@@ -118,6 +129,11 @@ class HighQualitySnapshotService:
         self._selected_sources: Counter[str] = Counter()
         self._classification_refinements: Counter[str] = Counter()
         self._last_result: dict[str, str] | None = None
+        self._media_executor = ThreadPoolExecutor(max_workers=HQ_MEDIA_WORKERS, thread_name_prefix="hq_media")
+        self._scheduled_at: dict[str, float] = {}
+        self._processing_started_at: dict[str, float] = {}
+        self._end_to_end_latencies: deque[float] = deque(maxlen=HQ_LATENCY_SAMPLES)
+        self._processing_latencies: deque[float] = deque(maxlen=HQ_LATENCY_SAMPLES)
 
     def enabled(self) -> bool:
         return bool(
@@ -151,6 +167,7 @@ class HighQualitySnapshotService:
             if not self._defer_event(event_id):
                 self._crop_event_hints.pop(event_id, None)
                 return False
+        self._scheduled_at.setdefault(event_id, time.monotonic())
         self._scheduled_total += 1
         return True
 
@@ -183,6 +200,7 @@ class HighQualitySnapshotService:
                 self._final_refresh_ids.discard(event_id)
                 self._crop_event_hints.pop(event_id, None)
                 return False
+        self._scheduled_at.setdefault(event_id, time.monotonic())
         self._scheduled_total += 1
         return True
 
@@ -194,6 +212,7 @@ class HighQualitySnapshotService:
 
     async def _process_event_once(self, event_id: str) -> str:
         """Fetch the clip, derive a frame, and atomically replace the cached snapshot."""
+        self._processing_started_at[event_id] = time.monotonic()
         if not self.enabled():
             self._crop_event_hints.pop(event_id, None)
             return self._record_outcome(event_id, "disabled")
@@ -329,6 +348,7 @@ class HighQualitySnapshotService:
             return self._record_outcome(event_id, "duplicate")
 
         self._active_ids.add(event_id)
+        self._processing_started_at[event_id] = time.monotonic()
         try:
             crop_event_data = (
                 event_data if isinstance(event_data, dict) else await self._load_event_data_for_crop(event_id)
@@ -442,35 +462,64 @@ class HighQualitySnapshotService:
     ) -> dict[str, Any]:
         preferred_indices = await self._load_preferred_frame_indices(event_id, clip_variant=clip_variant)
 
-        raw_candidates: list[dict[str, Any]] = []
+        # Scoring is pipelined with extraction: each decoded frame's candidates
+        # are scored as one batch while the extractor moves on to the next
+        # frame, and the final Frigate snapshot is fetched concurrently.
+        loop = asyncio.get_running_loop()
+        scoring_batches: list[asyncio.Future] = []
+
+        def score_frame_candidates(payloads: list[dict[str, Any]]) -> None:
+            scoring_batches.append(asyncio.ensure_future(self._score_snapshot_candidates(payloads)))
+
+        def on_frame_candidates(payloads: list[dict[str, Any]]) -> None:
+            if payloads:
+                loop.call_soon_threadsafe(score_frame_candidates, payloads)
+
+        final_candidates_task = asyncio.ensure_future(
+            self._load_final_frigate_snapshot_candidates(event_id, event_data)
+        )
         extraction_error: Exception | None = None
-        tmp_path = await asyncio.to_thread(_write_temp_clip, clip_bytes)
         try:
+            tmp_path = await asyncio.to_thread(_write_temp_clip, clip_bytes)
             try:
-                raw_candidates = await asyncio.to_thread(
-                    self._extract_snapshot_candidate_payloads_from_clip_path,
-                    tmp_path,
-                    event_id=event_id,
-                    event_data=event_data,
-                    clip_variant=clip_variant,
-                    override_frame_indices=preferred_indices,
-                )
-            except Exception as exc:
-                extraction_error = exc
-                log.warning(
-                    "High-quality clip candidate extraction failed; trying final Frigate snapshot",
-                    event_id=event_id,
-                    error=str(exc),
-                )
+                try:
+                    await asyncio.to_thread(
+                        self._extract_snapshot_candidate_payloads_from_clip_path,
+                        tmp_path,
+                        event_id=event_id,
+                        event_data=event_data,
+                        clip_variant=clip_variant,
+                        override_frame_indices=preferred_indices,
+                        on_frame_candidates=on_frame_candidates,
+                    )
+                except Exception as exc:
+                    extraction_error = exc
+                    log.warning(
+                        "High-quality clip candidate extraction failed; trying final Frigate snapshot",
+                        event_id=event_id,
+                        error=str(exc),
+                    )
+            finally:
+                with contextlib.suppress(Exception):
+                    await asyncio.to_thread(tmp_path.unlink, missing_ok=True)
+
+            # Let callbacks queued by the extraction thread run before reading the batches.
+            await asyncio.sleep(0)
+            final_candidates = await final_candidates_task
+            if final_candidates:
+                scoring_batches.append(asyncio.ensure_future(self._score_snapshot_candidates(final_candidates)))
+            if not scoring_batches and extraction_error is not None:
+                raise extraction_error
+            scored_batches = await asyncio.gather(*scoring_batches)
         finally:
-            with contextlib.suppress(Exception):
-                await asyncio.to_thread(tmp_path.unlink, missing_ok=True)
-
-        raw_candidates.extend(await self._load_final_frigate_snapshot_candidates(event_id, event_data))
-        if not raw_candidates and extraction_error is not None:
-            raise extraction_error
+            pending = [task for task in (final_candidates_task, *scoring_batches) if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
-        return await self._score_and_select_snapshot_candidates(event_id, raw_candidates)
+        scored = [candidate for batch in scored_batches for candidate in batch if candidate is not None]
+        return await self._select_snapshot_candidates(event_id, scored)
 
     async def _score_and_select_snapshot_candidates(
         self,
@@ -478,12 +527,14 @@ class HighQualitySnapshotService:
         raw_candidates: list[dict[str, Any]],
     ) -> dict[str, Any]:
         """Score, select, and bound candidates independent of their media source."""
-        scored: list[dict[str, Any]] = []
-        for candidate in raw_candidates:
-            enriched = await self._score_snapshot_candidate(candidate)
-            if enriched is not None:
-                scored.append(enriched)
+        scored = [candidate for candidate in await self._score_snapshot_candidates(raw_candidates) if candidate]
+        return await self._select_snapshot_candidates(event_id, scored)
 
+    async def _select_snapshot_candidates(
+        self,
+        event_id: str,
+        scored: list[dict[str, Any]],
+    ) -> dict[str, Any]:
         if not scored:
             return {"selected_candidate": None, "candidates": []}
 
@@ -757,7 +808,15 @@ class HighQualitySnapshotService:
         event_data: Optional[dict[str, Any]] = None,
         clip_variant: str = "event",
         override_frame_indices: Optional[list[int]] = None,
+        on_frame_candidates: Optional[Callable[[list[dict[str, Any]]], None]] = None,
     ) -> list[dict[str, Any]]:
+        """Decode candidate frames and build crop payloads for each of them.
+
+        Payloads carry the decoded ``image`` rather than JPEG bytes; encoding
+        happens while the candidate is scored. ``on_frame_candidates`` receives
+        each frame's payloads as soon as they exist so scoring can overlap
+        with decoding the next frame.
+        """
         cap = cv2.VideoCapture(str(clip_path))
         if not cap.isOpened():
             raise ValueError(f"Unable to open clip for snapshot extraction: {clip_path}")
@@ -765,6 +824,7 @@ class HighQualitySnapshotService:
         try:
             frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
             fps = float(cap.get(cv2.CAP_PROP_FPS) or 0.0)
+            track_index = event_track_indexes.get_sync(event_id, event_data)
             if override_frame_indices is not None:
                 safe_count = max(frame_count, 1)
                 fallback_indices = self._candidate_frame_indices(
@@ -772,6 +832,7 @@ class HighQualitySnapshotService:
                     fps=fps,
                     event_data=event_data,
                     clip_variant=clip_variant,
+                    track_index=track_index,
                 )
                 candidate_indices = self._select_temporally_diverse_frame_indices(
                     [*override_frame_indices, *fallback_indices],
@@ -785,6 +846,7 @@ class HighQualitySnapshotService:
                     fps=fps,
                     event_data=event_data,
                     clip_variant=clip_variant,
+                    track_index=track_index,
                 )[:HQ_MAX_CROP_SCORING_FRAMES]
             seen: set[str] = set()
             used_frame_indices: list[int] = []
@@ -808,13 +870,14 @@ class HighQualitySnapshotService:
                     event_data,
                     frame_offset_seconds=frame_offset_seconds,
                     clip_variant=clip_variant,
+                    track_index=track_index,
                 )
+                frame_results: list[dict[str, Any]] = []
                 for source_mode, candidate_image, crop_result in self._candidate_images_for_frame(
                     base_image,
                     event_data=frame_event_data,
                     event_id=event_id,
                 ):
-                    image_bytes = self._encode_pil_to_jpeg_bytes(candidate_image)
                     candidate_id = self._build_snapshot_candidate_id(
                         event_id,
                         frame_index=frame_index,
@@ -825,7 +888,7 @@ class HighQualitySnapshotService:
                     seen.add(candidate_id)
                     thumbnail_ref = f"{candidate_id}__thumb"
                     image_ref = f"{candidate_id}__image"
-                    results.append(
+                    frame_results.append(
                         {
                             "candidate_id": candidate_id,
                             "frame_index": int(frame_index),
@@ -846,10 +909,12 @@ class HighQualitySnapshotService:
                             "image_height": int(candidate_image.height),
                             "frame_width": int(base_image.width),
                             "frame_height": int(base_image.height),
-                            "image_bytes": image_bytes,
-                            "thumbnail_bytes": self._thumbnail_bytes_for_candidate(candidate_image),
+                            "image": candidate_image,
                         }
                     )
+                results.extend(frame_results)
+                if on_frame_candidates is not None:
+                    on_frame_candidates(frame_results)
             return results
         finally:
             cap.release()
@@ -924,6 +989,25 @@ class HighQualitySnapshotService:
             log.warning("Final Frigate snapshot decode failed", event_id=event_id, error=str(exc))
             return []
 
+        return await asyncio.get_running_loop().run_in_executor(
+            self._media_executor,
+            functools.partial(
+                self._build_final_snapshot_candidates,
+                event_id,
+                image,
+                event_data,
+                clean_copy_available=clean_copy_available,
+            ),
+        )
+
+    def _build_final_snapshot_candidates(
+        self,
+        event_id: str,
+        image: Image.Image,
+        event_data: dict[str, Any],
+        *,
+        clean_copy_available: bool,
+    ) -> list[dict[str, Any]]:
         candidates = [
             self._build_final_snapshot_candidate_payload(
                 event_id,
@@ -1020,6 +1104,7 @@ class HighQualitySnapshotService:
         *,
         frame_offset_seconds: Optional[float],
         clip_variant: str,
+        track_index: Optional[EventTrackIndex] = None,
     ) -> Optional[dict[str, Any]]:
         """Return a Frigate hint translated to the tracked position at this frame.
 
@@ -1036,22 +1121,9 @@ class HighQualitySnapshotService:
             return None
         raw_payload = event_data.get("data")
         payload = raw_payload if isinstance(raw_payload, dict) else {}
-        path_points: list[tuple[float, float, float]] = []
-        for item in payload.get("path_data") or []:
-            if not isinstance(item, (list, tuple)) or len(item) < 2:
-                continue
-            point = item[0]
-            if not isinstance(point, (list, tuple)) or len(point) < 2:
-                continue
-            try:
-                x = float(point[0])
-                y = float(point[1])
-                timestamp = float(item[1])
-            except (TypeError, ValueError):
-                continue
-            if all(math.isfinite(value) for value in (x, y, timestamp)) and 0.0 <= x <= 1.0 and 0.0 <= y <= 1.0:
-                path_points.append((timestamp, x, y))
-        if not path_points:
+        if track_index is None:
+            track_index = EventTrackIndex.from_event_data(event_data)
+        if track_index is None or not any(point.normalized for point in track_index.points):
             return event_data
         try:
             start_time = float(event_data.get("start_time"))
@@ -1060,75 +1132,85 @@ class HighQualitySnapshotService:
             return None
         if not math.isfinite(start_time) or not math.isfinite(offset) or offset < 0.0:
             return None
-        target_timestamp = start_time + offset
-        point_timestamp, bottom_center_x, bottom_y = min(
-            path_points,
-            key=lambda item: abs(item[0] - target_timestamp),
+        tracked_box = track_index.box_at(
+            start_time + offset,
+            max_distance_seconds=HQ_PATH_HINT_MAX_DISTANCE_SECONDS,
         )
-        if abs(point_timestamp - target_timestamp) > HQ_PATH_HINT_MAX_DISTANCE_SECONDS:
+        if tracked_box is None:
             return None
 
-        raw_box = payload.get("box")
-        if not isinstance(raw_box, (list, tuple)) or len(raw_box) != 4:
-            return None
-        try:
-            _left, _top, width, height = [float(value) for value in raw_box]
-        except (TypeError, ValueError):
-            return None
-        if (
-            not all(math.isfinite(value) for value in (width, height))
-            or not (0.0 < width <= 1.0)
-            or not (0.0 < height <= 1.0)
-        ):
-            return None
-
-        # Frigate path_data stores the tracked box's bottom-centre point.
-        left = max(0.0, min(1.0 - width, bottom_center_x - width / 2.0))
-        top = max(0.0, min(1.0 - height, bottom_y - height))
         adjusted_payload = dict(payload)
-        adjusted_payload["box"] = [left, top, width, height]
+        adjusted_payload["box"] = tracked_box
         adjusted_event = dict(event_data)
         adjusted_event["data"] = adjusted_payload
         return adjusted_event
 
     async def _score_snapshot_candidate(self, candidate: dict[str, Any]) -> Optional[dict[str, Any]]:
+        return (await self._score_snapshot_candidates([candidate]))[0]
+
+    async def _score_snapshot_candidates(self, candidates: list[dict[str, Any]]) -> list[Optional[dict[str, Any]]]:
+        """Score a group of candidates with one batched classifier call.
+
+        JPEG encoding and image-quality metrics run on the media pool while the
+        classifier works. Returns one entry per input; ``None`` marks a
+        candidate whose image could not be decoded.
+        """
+        if not candidates:
+            return []
+        loop = asyncio.get_running_loop()
+        images = await asyncio.gather(*(self._candidate_image(candidate) for candidate in candidates))
+        usable = [(candidate, image) for candidate, image in zip(candidates, images) if image is not None]
+        media_tasks = [
+            loop.run_in_executor(self._media_executor, self._candidate_media_and_quality, candidate, image)
+            for candidate, image in usable
+        ]
+        try:
+            classifications = await self._classify_snapshot_candidates(usable)
+            media = await asyncio.gather(*media_tasks)
+        finally:
+            for task in media_tasks:
+                task.cancel()
+
+        scored_by_id: dict[int, dict[str, Any]] = {}
+        for (candidate, _image), (label, score, index), (encoded, image_quality_score) in zip(
+            usable, classifications, media
+        ):
+            enriched = dict(candidate)
+            enriched.pop("image", None)
+            enriched.update(encoded)
+            enriched["classifier_label"] = label
+            enriched["classifier_score"] = score
+            enriched["classifier_index"] = index
+            enriched["image_quality_score"] = image_quality_score
+            enriched["ranking_score"] = (score * 0.85) + (image_quality_score * 0.15)
+            scored_by_id[id(candidate)] = enriched
+        return [scored_by_id.get(id(candidate)) for candidate in candidates]
+
+    async def _candidate_image(self, candidate: dict[str, Any]) -> Optional[Image.Image]:
+        image = candidate.get("image")
+        if isinstance(image, Image.Image):
+            return image
         image_bytes = candidate.get("image_bytes")
         if not isinstance(image_bytes, (bytes, bytearray)) or not image_bytes:
             return None
         try:
-            image = await asyncio.to_thread(decode_image_bytes, bytes(image_bytes), convert_rgb=True)
+            return await asyncio.get_running_loop().run_in_executor(
+                self._media_executor,
+                functools.partial(decode_image_bytes, bytes(image_bytes), convert_rgb=True),
+            )
         except Exception:
             return None
 
-        classifier_score = 0.0
-        classifier_label = None
-        classifier_index = None
-        try:
-            classifier_module = sys.modules.get("app.services.classifier_service")
-            classifier = (
-                getattr(classifier_module, "_classifier_instance", None) if classifier_module is not None else None
-            )
-            if classifier is not None and callable(getattr(classifier, "classify_async_background", None)):
-                results = await classifier.classify_async_background(
-                    image,
-                    input_context={
-                        "is_cropped": (
-                            bool(candidate.get("input_is_cropped"))
-                            if candidate.get("input_is_cropped") is not None
-                            else candidate.get("source_mode") != "full_frame"
-                        )
-                    },
-                    queue_timeout_seconds=HQ_CANDIDATE_INFERENCE_QUEUE_TIMEOUT_SECONDS,
-                )
-                if results:
-                    top_result = results[0]
-                    classifier_label = top_result.get("label")
-                    classifier_score = float(top_result.get("score") or 0.0)
-                    classifier_index = int(top_result.get("index") or 0)
-        except Exception as e:
-            log.debug(
-                "Snapshot candidate classifier scoring failed", candidate_id=candidate.get("candidate_id"), error=str(e)
-            )
+    def _candidate_media_and_quality(
+        self,
+        candidate: dict[str, Any],
+        image: Image.Image,
+    ) -> tuple[dict[str, bytes], float]:
+        """Encode deferred candidate media and compute the image-quality score (runs on the media pool)."""
+        encoded: dict[str, bytes] = {}
+        if "image" in candidate:
+            encoded["image_bytes"] = self._encode_pil_to_jpeg_bytes(image)
+            encoded["thumbnail_bytes"] = self._thumbnail_bytes_for_candidate(image)
 
         grayscale = cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2GRAY)
         sharpness = float(cv2.Laplacian(grayscale, cv2.CV_64F).var())
@@ -1136,15 +1218,78 @@ class HighQualitySnapshotService:
         exposure_score = float(((grayscale >= 8) & (grayscale <= 247)).mean())
         resolution_score = min(1.0, math.sqrt(image.width * image.height) / 512.0)
         image_quality_score = (sharpness_score * 0.45) + (exposure_score * 0.35) + (resolution_score * 0.20)
-        ranking_score = (classifier_score * 0.85) + (image_quality_score * 0.15)
+        return encoded, image_quality_score
 
-        enriched = dict(candidate)
-        enriched["classifier_label"] = classifier_label
-        enriched["classifier_score"] = classifier_score
-        enriched["classifier_index"] = classifier_index
-        enriched["image_quality_score"] = image_quality_score
-        enriched["ranking_score"] = ranking_score
-        return enriched
+    async def _classify_snapshot_candidates(
+        self,
+        usable: list[tuple[dict[str, Any], Image.Image]],
+    ) -> list[tuple[Optional[str], float, Optional[int]]]:
+        unscored: list[tuple[Optional[str], float, Optional[int]]] = [(None, 0.0, None)] * len(usable)
+        classifier_module = sys.modules.get("app.services.classifier_service")
+        classifier = getattr(classifier_module, "_classifier_instance", None) if classifier_module is not None else None
+        if classifier is None or not usable:
+            return unscored
+        images = [image for _candidate, image in usable]
+        contexts = [
+            {
+                "is_cropped": (
+                    bool(candidate.get("input_is_cropped"))
+                    if candidate.get("input_is_cropped") is not None
+                    else candidate.get("source_mode") != "full_frame"
+                )
+            }
+            for candidate, _image in usable
+        ]
+        try:
+            classify_batch = getattr(classifier, "classify_batch_async_background", None)
+            if callable(classify_batch):
+                batch_results: list[Any] = await classify_batch(
+                    images,
+                    input_contexts=contexts,
+                    queue_timeout_seconds=HQ_CANDIDATE_INFERENCE_QUEUE_TIMEOUT_SECONDS,
+                )
+            elif callable(getattr(classifier, "classify_async_background", None)):
+                batch_results = await asyncio.gather(
+                    *(
+                        classifier.classify_async_background(
+                            image,
+                            input_context=context,
+                            queue_timeout_seconds=HQ_CANDIDATE_INFERENCE_QUEUE_TIMEOUT_SECONDS,
+                        )
+                        for image, context in zip(images, contexts)
+                    ),
+                    return_exceptions=True,
+                )
+            else:
+                return unscored
+        except Exception as e:
+            log.debug("Snapshot candidate classifier scoring failed", candidates=len(usable), error=str(e))
+            return unscored
+
+        classifications: list[tuple[Optional[str], float, Optional[int]]] = []
+        for (candidate, _image), results in zip(usable, batch_results):
+            try:
+                if isinstance(results, BaseException):
+                    raise results
+                if not results:
+                    classifications.append((None, 0.0, None))
+                    continue
+                top_result = results[0]
+                classifications.append(
+                    (
+                        top_result.get("label"),
+                        float(top_result.get("score") or 0.0),
+                        int(top_result.get("index") or 0),
+                    )
+                )
+            except Exception as e:
+                log.debug(
+                    "Snapshot candidate classifier scoring failed",
+                    candidate_id=candidate.get("candidate_id"),
+                    error=str(e),
+                )
+                classifications.append((None, 0.0, None))
+        return classifications
 
     async def _apply_classification_refinement(self, event_id: str, candidates: list[dict[str, Any]]) -> bool:
         """Promote a trustworthy crop consensus through the canonical detection write path."""
@@ -1398,6 +1543,10 @@ class HighQualitySnapshotService:
         self._classification_refinements.clear()
         self._reconciled_total = 0
         self._last_result = None
+        self._scheduled_at.clear()
+        self._processing_started_at.clear()
+        self._end_to_end_latencies.clear()
+        self._processing_latencies.clear()
 
     @staticmethod
     def _task_belongs_to_current_open_loop(task: asyncio.Task, current_loop: asyncio.AbstractEventLoop) -> bool:
@@ -1493,6 +1642,11 @@ class HighQualitySnapshotService:
             "classification_refinements": dict(self._classification_refinements),
             "crop_policy": "best_available",
             "last_result": self._last_result,
+            "latency_seconds": {
+                "samples": len(self._end_to_end_latencies),
+                "end_to_end": self._latency_summary(self._end_to_end_latencies),
+                "processing": self._latency_summary(self._processing_latencies),
+            },
         }
 
     def get_jobs_snapshot(self) -> list[dict[str, object]]:
@@ -2017,6 +2171,7 @@ class HighQualitySnapshotService:
         fps: float,
         event_data: Optional[dict[str, Any]] = None,
         clip_variant: str = "event",
+        track_index: Optional[EventTrackIndex] = None,
     ) -> list[int]:
         if frame_count <= 0:
             return [0]
@@ -2027,6 +2182,7 @@ class HighQualitySnapshotService:
                 frame_count=frame_count,
                 fps=fps,
                 event_data=event_data,
+                track_index=track_index,
             )
         mid = frame_count // 2
         center_weighted_anchors = [mid, frame_count // 4, (frame_count * 3) // 4]
@@ -2150,6 +2306,7 @@ class HighQualitySnapshotService:
         frame_count: int,
         fps: float,
         event_data: Optional[dict[str, Any]],
+        track_index: Optional[EventTrackIndex] = None,
     ) -> list[int]:
         if frame_count <= 0 or fps <= 0.0 or not isinstance(event_data, dict):
             return []
@@ -2160,30 +2317,14 @@ class HighQualitySnapshotService:
         if not math.isfinite(start_time):
             return []
 
-        raw_payload = event_data.get("data")
-        payload = raw_payload if isinstance(raw_payload, dict) else {}
-        path_points: list[tuple[float, float, float]] = []
-        for item in payload.get("path_data") or []:
-            if not isinstance(item, (list, tuple)) or len(item) < 2:
-                continue
-            point = item[0]
-            if not isinstance(point, (list, tuple)) or len(point) < 2:
-                continue
-            try:
-                x = float(point[0])
-                y = float(point[1])
-                timestamp = float(item[1])
-            except (TypeError, ValueError):
-                continue
-            if math.isfinite(x) and math.isfinite(y) and math.isfinite(timestamp):
-                path_points.append((timestamp, x, y))
-        if not path_points:
+        if track_index is None:
+            track_index = EventTrackIndex.from_event_data(event_data)
+        if track_index is None:
             return []
 
-        ordered_timestamps = self._ordered_path_timestamps_for_crop(payload, path_points)
         clip_duration_seconds = float(frame_count) / float(fps)
         indices: list[int] = []
-        for target_time in ordered_timestamps:
+        for target_time in track_index.relevant_timestamps():
             offset_seconds = max(0.0, target_time - start_time)
             offset_seconds = min(offset_seconds, max(0.0, clip_duration_seconds))
             indices.append(int(round(offset_seconds * fps)))
@@ -2194,44 +2335,11 @@ class HighQualitySnapshotService:
         payload: dict[str, Any],
         path_points: list[tuple[float, float, float]],
     ) -> list[float]:
-        ordered: list[float] = []
-        seen: set[float] = set()
-
-        def add_timestamp(timestamp: float) -> None:
-            if timestamp in seen:
-                return
-            seen.add(timestamp)
-            ordered.append(timestamp)
-
-        box_bottom_center = self._normalized_box_bottom_center(payload)
-        if box_bottom_center is not None:
-            bottom_center_x, bottom_y = box_bottom_center
-            normalized_points = [item for item in path_points if 0.0 <= item[1] <= 1.0 and 0.0 <= item[2] <= 1.0]
-            for timestamp, _x, _y in sorted(
-                normalized_points,
-                key=lambda item: ((item[1] - bottom_center_x) ** 2 + (item[2] - bottom_y) ** 2, item[0]),
-            ):
-                add_timestamp(timestamp)
-
-        by_time = sorted(path_points, key=lambda item: item[0])
-        fallback_indices = [len(by_time) // 2, len(by_time) - 1, 0]
-        for index in fallback_indices:
-            add_timestamp(by_time[index][0])
-        return ordered
-
-    def _normalized_box_bottom_center(self, payload: dict[str, Any]) -> Optional[tuple[float, float]]:
-        raw_box = payload.get("box")
-        if not isinstance(raw_box, (list, tuple)) or len(raw_box) != 4:
-            return None
-        try:
-            x, y, width, height = [float(value) for value in raw_box]
-        except (TypeError, ValueError):
-            return None
-        if not all(math.isfinite(value) for value in (x, y, width, height)):
-            return None
-        if not (0.0 <= x <= 1.0 and 0.0 <= y <= 1.0 and 0.0 < width <= 1.0 and 0.0 < height <= 1.0):
-            return None
-        return x + width / 2.0, y + height
+        track_index = EventTrackIndex.from_path_data(
+            [[[x, y], timestamp] for timestamp, x, y in path_points],
+            payload.get("box"),
+        )
+        return track_index.relevant_timestamps() if track_index is not None else []
 
     def _extract_snapshot_from_clip_path(
         self,
@@ -2432,8 +2540,33 @@ class HighQualitySnapshotService:
     def _record_outcome(self, event_id: str, result: str) -> str:
         self._outcomes[result] += 1
         self._last_result = {"event_id": event_id, "result": result}
+        if result != "duplicate":
+            self._record_latency(event_id, replaced=result in {"replaced", "bird_crop_replaced"})
         return result
 
+    def _record_latency(self, event_id: str, *, replaced: bool) -> None:
+        """Sample how long a replacement took, from scheduling and from the start of processing."""
+        now = time.monotonic()
+        started_at = self._processing_started_at.pop(event_id, None)
+        scheduled_at = self._scheduled_at.pop(event_id, None)
+        if not replaced or started_at is None:
+            return
+        self._processing_latencies.append(now - started_at)
+        self._end_to_end_latencies.append(now - (scheduled_at if scheduled_at is not None else started_at))
+
+    @staticmethod
+    def _latency_summary(values: deque[float]) -> dict[str, float | None]:
+        if not values:
+            return {"p50": None, "p95": None, "max": None, "last": None}
+        ordered = sorted(values)
+        p95_index = max(0, min(len(ordered) - 1, math.ceil(len(ordered) * 0.95) - 1))
+        return {
+            "p50": round(float(statistics.median(ordered)), 3),
+            "p95": round(ordered[p95_index], 3),
+            "max": round(ordered[-1], 3),
+            "last": round(values[-1], 3),
+        }
+
     async def _processing_retry_allowed(self, event_id: str, *, now: datetime) -> bool:
         try:
             async with get_db() as db:
@@ -0,0 +1,194 @@
+"""Persistent memo of classifier results for reprocessing jobs.
+
+Analyze-unknowns runs, manual reclassification, restored video jobs and
+historical backfills repeatedly classify media whose bytes have not changed
+since the previous run. Each result is stored in ``inference_memo`` under
+(media content hash, model artifact hash, input policy hash), so a job only
+re-infers when the media, the model artifact or the preprocessing/crop
+policy changed. Only the compact top-k base result is kept (personalised
+re-ranking is applied after the lookup). Rows are evicted least recently
+used above ``INFERENCE_MEMO_MAX_ENTRIES``. Storage failures never fail the
+caller: a failed lookup is a miss and a failed store is dropped.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from app.database import get_db
+from app.repositories.inference_memo_repository import InferenceMemoRepository
+from app.utils.api_datetime import utc_naive_now
+
+log = structlog.get_logger()
+
+INFERENCE_MEMO_MAX_ENTRIES = max(1, int(os.environ.get("INFERENCE_MEMO_MAX_ENTRIES", "20000")))
+INFERENCE_MEMO_TOP_K = max(1, int(os.environ.get("INFERENCE_MEMO_TOP_K", "10")))
+# Size-bound eviction runs once per this many stores.
+INFERENCE_MEMO_EVICT_EVERY = 50
+
+
+@dataclass(frozen=True)
+class InferenceMemoKey:
+    kind: str
+    media_sha256: str
+    model_sha256: str
+    policy_sha256: str
+
+
+@dataclass(frozen=True)
+class InferenceMemoEntry:
+    results: list[dict]
+    diagnostics: dict[str, Any] | None
+
+
+def image_content_sha256(image: Any) -> str:
+    """Hash decoded pixels, so re-encoded copies of the same frame share a key."""
+    digest = hashlib.sha256()
+    digest.update(f"{image.mode}:{image.size[0]}x{image.size[1]}:".encode("ascii"))
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def file_content_sha256(path: str | os.PathLike[str]) -> str | None:
+    digest = hashlib.sha256()
+    try:
+        with Path(path).open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def policy_sha256(policy: dict[str, Any]) -> str:
+    encoded = json.dumps(policy, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    item = getattr(value, "item", None)
+    if callable(item):
+        return item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _compact_results(results: list[dict]) -> list[dict]:
+    """Keep the first ``INFERENCE_MEMO_TOP_K`` results with their JSON-representable fields."""
+    compact: list[dict] = []
+    for result in results[:INFERENCE_MEMO_TOP_K]:
+        if not isinstance(result, dict):
+            continue
+        entry: dict[str, Any] = {}
+        for key, value in result.items():
+            try:
+                entry[key] = json.loads(json.dumps(value, default=_json_default))
+            except (TypeError, ValueError):
+                continue
+        compact.append(entry)
+    return compact
+
+
+class InferenceMemoService:
+    """Look up and record classifier results for unchanged (media, model, policy) inputs."""
+
+    def __init__(self, max_entries: int | None = None, evict_every: int | None = None) -> None:
+        self.max_entries = max_entries or INFERENCE_MEMO_MAX_ENTRIES
+        self.evict_every = evict_every or INFERENCE_MEMO_EVICT_EVERY
+        self._stores_since_evict = 0
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "errors": 0}
+
+    async def get(self, key: InferenceMemoKey) -> InferenceMemoEntry | None:
+        try:
+            async with get_db() as db:
+                repo = InferenceMemoRepository(db)
+                row = await repo.get(key.media_sha256, key.model_sha256, key.policy_sha256)
+                if row is not None and row.kind == key.kind:
+                    await repo.touch(key.media_sha256, key.model_sha256, key.policy_sha256, utc_naive_now())
+        except Exception as exc:
+            self._stats["errors"] += 1
+            log.warning("inference_memo_read_failed", kind=key.kind, error=str(exc))
+            row = None
+        if row is None or row.kind != key.kind:
+            self._stats["misses"] += 1
+            return None
+        try:
+            results = json.loads(row.results)
+            diagnostics = json.loads(row.diagnostics) if row.diagnostics else None
+        except ValueError:
+            self._stats["misses"] += 1
+            return None
+        self._stats["hits"] += 1
+        return InferenceMemoEntry(results=list(results), diagnostics=diagnostics)
+
+    async def put(
+        self,
+        key: InferenceMemoKey,
+        results: list[dict],
+        *,
+        diagnostics: dict[str, Any] | None = None,
+    ) -> None:
+        compact = _compact_results(results)
+        if not compact:
+            return
+        try:
+            encoded_diagnostics = json.dumps(diagnostics, default=_json_default) if diagnostics else None
+        except (TypeError, ValueError):
+            encoded_diagnostics = None
+        try:
+            async with get_db() as db:
+                await InferenceMemoRepository(db).put(
+                    key.media_sha256,
+                    key.model_sha256,
+                    key.policy_sha256,
+                    kind=key.kind,
+                    results=json.dumps(compact),
+                    diagnostics=encoded_diagnostics,
+                    created_at=utc_naive_now(),
+                )
+        except Exception as exc:
+            self._stats["errors"] += 1
+            log.warning("inference_memo_write_failed", kind=key.kind, error=str(exc))
+            return
+        self._stats["stores"] += 1
+        self._stores_since_evict += 1
+        if self._stores_since_evict >= self.evict_every:
+            self._stores_since_evict = 0
+            await self.evict()
+
+    async def evict(self) -> int:
+        try:
+            async with get_db() as db:
+                evicted = await InferenceMemoRepository(db).evict(self.max_entries)
+        except Exception as exc:
+            self._stats["errors"] += 1
+            log.warning("inference_memo_evict_failed", error=str(exc))
+            return 0
+        if evicted:
+            self._stats["evictions"] += evicted
+            log.info("inference_memo_evicted", count=evicted, max_entries=self.max_entries)
+        return evicted
+
+    async def clear(self) -> int:
+        async with get_db() as db:
+            return await InferenceMemoRepository(db).clear()
+
+    def get_status(self) -> dict[str, Any]:
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else None,
+            "max_entries": self.max_entries,
+            "top_k": INFERENCE_MEMO_TOP_K,
+        }
+
+    def reset_stats(self) -> None:
+        self._stores_since_evict = 0
+        self._stats = dict.fromkeys(self._stats, 0)
+
+
+inference_memo = InferenceMemoService()
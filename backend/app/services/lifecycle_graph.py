@@ -0,0 +1,136 @@
+"""Dependency-ordered, concurrent startup of the web shell's lifecycle phases.
+
+Each phase names the phases it needs; a phase starts as soon as all of them
+have finished (successfully or with a non-fatal failure, matching the old
+sequential order where a degraded phase never blocked the next one). Phases
+with no path between them run concurrently. A fatal failure cancels every
+phase still pending or running and re-raises.
+
+The returned report holds per-phase offsets/durations and the critical path:
+the dependency chain that determined when the last phase finished.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable
+
+
+@dataclass(frozen=True)
+class LifecyclePhase:
+    name: str
+    action: Callable[[], Awaitable[Any]]
+    depends_on: tuple[str, ...] = ()
+    fatal: bool = False
+    startup_phase: str | None = None
+    startup_progress: int | None = None
+
+
+# Runs one phase; returns False when a non-fatal phase failed (and was recorded).
+PhaseRunner = Callable[[LifecyclePhase], Awaitable[Any]]
+
+
+def validate_lifecycle_graph(phases: Iterable[LifecyclePhase]) -> list[LifecyclePhase]:
+    """Return phases in a dependency-respecting order; raise ValueError on bad graphs."""
+    by_name: dict[str, LifecyclePhase] = {}
+    for phase in phases:
+        if phase.name in by_name:
+            raise ValueError(f"duplicate lifecycle phase: {phase.name}")
+        by_name[phase.name] = phase
+    for phase in by_name.values():
+        missing = [dep for dep in phase.depends_on if dep not in by_name]
+        if missing:
+            raise ValueError(f"lifecycle phase {phase.name} depends on unknown phase(s): {', '.join(missing)}")
+
+    ordered: list[LifecyclePhase] = []
+    remaining = dict(by_name)
+    resolved: set[str] = set()
+    while remaining:
+        ready = [phase for phase in remaining.values() if all(dep in resolved for dep in phase.depends_on)]
+        if not ready:
+            raise ValueError(f"lifecycle dependency cycle among: {', '.join(sorted(remaining))}")
+        for phase in ready:
+            ordered.append(phase)
+            resolved.add(phase.name)
+            del remaining[phase.name]
+    return ordered
+
+
+def critical_path(timings: dict[str, dict[str, Any]]) -> list[str]:
+    """Walk back from the last phase to finish through the dependency that finished last."""
+    if not timings:
+        return []
+    # Ties (sub-0.1 ms phases) go to the phase recorded last, i.e. that finished last.
+    current: str | None = max(reversed(timings), key=lambda name: timings[name]["finished_ms"])
+    path: list[str] = []
+    while current is not None:
+        path.append(current)
+        deps = [dep for dep in reversed(timings) if dep in timings[current]["depends_on"]]
+        current = max(deps, key=lambda name: timings[name]["finished_ms"]) if deps else None
+    path.reverse()
+    return path
+
+
+async def run_lifecycle_graph(
+    phases: Iterable[LifecyclePhase],
+    run_phase: PhaseRunner,
+    *,
+    clock: Callable[[], float] = time.monotonic,
+) -> dict[str, Any]:
+    ordered = validate_lifecycle_graph(phases)
+    origin = clock()
+    timings: dict[str, dict[str, Any]] = {}
+    tasks: dict[str, asyncio.Task] = {}
+
+    def _offset_ms(value: float) -> float:
+        return round(max(0.0, value - origin) * 1000.0, 1)
+
+    async def _run(phase: LifecyclePhase) -> None:
+        if phase.depends_on:
+            await asyncio.wait([tasks[dep] for dep in phase.depends_on])
+        started = clock()
+        status = "failed"
+        try:
+            result = await run_phase(phase)
+            status = "degraded" if result is False else "ok"
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        finally:
+            finished = clock()
+            timings[phase.name] = {
+                "depends_on": list(phase.depends_on),
+                "started_ms": _offset_ms(started),
+                "finished_ms": _offset_ms(finished),
+                "duration_ms": round(max(0.0, finished - started) * 1000.0, 1),
+                "status": status,
+            }
+
+    # Tasks only start running at the first await below, so every dependency
+    # task exists before any phase looks it up.
+    for phase in ordered:
+        tasks[phase.name] = asyncio.create_task(_run(phase), name=f"lifecycle:{phase.name}")
+
+    try:
+        done, pending = await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+        failed = next((task for task in done if not task.cancelled() and task.exception() is not None), None)
+        if failed is not None:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise failed.exception()
+    except asyncio.CancelledError:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+
+    path = critical_path(timings)
+    return {
+        "total_ms": _offset_ms(clock()),
+        "phases": timings,
+        "critical_path": path,
+        "critical_path_ms": timings[path[-1]]["finished_ms"] if path else 0.0,
+    }
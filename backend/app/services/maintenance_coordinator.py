@@ -1,4 +1,5 @@
 import asyncio
+import time
 from collections import Counter
 from typing import Any
 
@@ -21,6 +22,8 @@ class MaintenanceCoordinator:
         self._lock = asyncio.Lock()
         # holder_id → kind
         self._holders: dict[str, str] = {}
+        # task name → latest progress from the time-sliced maintenance scheduler
+        self._scheduled_tasks: dict[str, dict[str, Any]] = {}
 
     def _default_per_kind_capacity(self) -> int:
         """Per-kind default. Retains the `max_concurrent` setting semantics as
@@ -94,6 +97,20 @@ class MaintenanceCoordinator:
         counts = Counter(self._holders.values())
         return self._build_status(active_total=len(self._holders), counts=dict(counts))
 
+    def report_scheduled_task(self, name: str, progress: dict[str, Any]) -> None:
+        self._scheduled_tasks[str(name)] = dict(progress)
+
+    def _scheduled_task_status(self) -> dict[str, dict[str, Any]]:
+        now = time.time()
+        status: dict[str, dict[str, Any]] = {}
+        for name, progress in self._scheduled_tasks.items():
+            entry = dict(progress)
+            # Lag: how long this task has been due without finishing its pass.
+            due_since = entry.pop("due_since", None)
+            entry["lag_seconds"] = round(max(0.0, now - float(due_since)), 1) if due_since is not None else 0.0
+            status[name] = entry
+        return status
+
     async def reset(self) -> None:
         async with self._lock:
             self._holders.clear()
@@ -116,6 +133,7 @@ class MaintenanceCoordinator:
             "active_total": active_total,
             "available": max(0, default_capacity - active_total),
             "active_by_kind": counts,
+            "scheduled_tasks": self._scheduled_task_status(),
         }
 
 
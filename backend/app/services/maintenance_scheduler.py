@@ -0,0 +1,296 @@
+"""Time-sliced scheduled maintenance.
+
+Scheduled maintenance used to be one monolithic pass (retention deletes, a full
+media-cache walk, share-link cleanup, the media-integrity scan and analyze
+unknowns back to back) that competed with live traffic for the DB pool and
+disk. Each task now runs as small resumable slices: a slice does a bounded
+amount of work and returns a cursor, the scheduler paces slices to the task's
+budget (rows or file operations per second) and only starts one while live
+intake and classification are not under pressure. Cursors are persisted next to
+the database, so a restart resumes a half-finished pass instead of restarting
+it. Per-task progress and lag are reported through ``maintenance_coordinator``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Sequence
+
+import structlog
+
+from app.database import _get_db_path
+from app.services.maintenance_coordinator import maintenance_coordinator
+
+log = structlog.get_logger()
+
+STATE_FILENAME = "maintenance_scheduler_state.json"
+STATE_VERSION = 1
+MAINTENANCE_PRESSURE_POLL_SECONDS = max(1.0, float(os.getenv("MAINTENANCE_PRESSURE_POLL_SECONDS", "15")))
+# Sustained pressure must not starve maintenance forever (retention would grow
+# the DB without bound); after this long a deferred slice runs anyway.
+MAINTENANCE_MAX_DEFER_SECONDS = max(60.0, float(os.getenv("MAINTENANCE_MAX_DEFER_SECONDS", "1800")))
+# Per-task budgets: retention deletes are counted in rows, the media-cache walk
+# in files examined (each is a stat and possibly an unlink).
+MAINTENANCE_RETENTION_SLICE_ROWS = max(1, int(os.getenv("MAINTENANCE_RETENTION_SLICE_ROWS", "500")))
+MAINTENANCE_RETENTION_ROWS_PER_SECOND = max(1.0, float(os.getenv("MAINTENANCE_RETENTION_ROWS_PER_SECOND", "1000")))
+MAINTENANCE_MEDIA_SLICE_FILES = max(1, int(os.getenv("MAINTENANCE_MEDIA_SLICE_FILES", "200")))
+MAINTENANCE_MEDIA_FILES_PER_SECOND = max(1.0, float(os.getenv("MAINTENANCE_MEDIA_FILES_PER_SECOND", "400")))
+
+
+@dataclass(frozen=True)
+class SliceResult:
+    processed: int
+    done: bool
+    cursor: dict[str, Any] = field(default_factory=dict)
+    stats: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class MaintenanceTask:
+    name: str
+    run_slice: Callable[[dict[str, Any]], Awaitable[SliceResult]]
+    # Budget in the task's own units (rows, file operations) per second; the
+    # scheduler sleeps ``processed / units_per_second`` after each slice.
+    units_per_second: float
+    enabled: Callable[[], bool] = lambda: True
+
+
+def live_pressure_reason() -> str | None:
+    """Why maintenance should wait right now, or None when pressure is low."""
+    from app.services.mqtt_service import mqtt_service
+
+    if mqtt_service.is_under_pressure("elevated"):
+        return "mqtt_pressure"
+    # Never construct the classifier just to ask about its queues.
+    classifier_module = sys.modules.get("app.services.classifier_service")
+    classifier = getattr(classifier_module, "_classifier_instance", None) if classifier_module is not None else None
+    if classifier is not None:
+        try:
+            admission = classifier.get_admission_status()
+        except Exception:
+            admission = {}
+        if admission.get("background_throttled"):
+            return "classification_pressure"
+    return None
+
+
+def _utc_iso(timestamp: float | None) -> str | None:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+class MaintenanceScheduler:
+    def __init__(
+        self,
+        *,
+        state_path: Path | None = None,
+        pressure_probe: Callable[[], str | None] = live_pressure_reason,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._state_path = state_path
+        self._pressure_probe = pressure_probe
+        self._sleep = sleep
+        self._clock = clock
+        self._wall_clock = wall_clock
+
+    @property
+    def state_path(self) -> Path:
+        if self._state_path is not None:
+            return self._state_path
+        return Path(_get_db_path()).expanduser().parent / STATE_FILENAME
+
+    async def seconds_until_due(self, interval_seconds: float) -> float:
+        """0 when a pass is unfinished or overdue, otherwise the wait until the next one."""
+        state = await asyncio.to_thread(self._load_state_sync)
+        current = state.get("pass") or {}
+        completed_at = current.get("completed_at")
+        if not current or completed_at is None:
+            return 0.0
+        return max(0.0, float(completed_at) + float(interval_seconds) - self._wall_clock())
+
+    async def run_forever(
+        self,
+        tasks: Callable[[], Sequence[MaintenanceTask]],
+        *,
+        interval_seconds: float,
+        should_continue: Callable[[], bool] = lambda: True,
+    ) -> None:
+        # A pass missed during downtime (or cut short by a restart) runs at
+        # startup; otherwise wait out the rest of the interval.
+        while should_continue():
+            wait_seconds = await self.seconds_until_due(interval_seconds)
+            if wait_seconds > 0:
+                await self._sleep(min(wait_seconds, 3600.0))
+                continue
+            await self.run_pass(tasks(), should_continue=should_continue)
+
+    async def run_pass(
+        self,
+        tasks: Sequence[MaintenanceTask],
+        *,
+        should_continue: Callable[[], bool] = lambda: True,
+    ) -> dict[str, dict[str, Any]]:
+        """Run (or resume) one maintenance pass; returns per-task progress."""
+        state = await asyncio.to_thread(self._load_state_sync)
+        current = state.get("pass") or {}
+        if not current or current.get("completed_at") is not None:
+            current = {"id": uuid.uuid4().hex[:12], "started_at": self._wall_clock(), "completed_at": None}
+            state = {"version": STATE_VERSION, "pass": current, "tasks": {}}
+            await asyncio.to_thread(self._save_state_sync, state)
+        pass_id = current["id"]
+
+        for task in tasks:
+            entry = state["tasks"].get(task.name)
+            if not isinstance(entry, dict) or entry.get("pass_id") != pass_id:
+                entry = {"pass_id": pass_id, "cursor": {}, "done": False, "processed": 0, "slices": 0, "stats": {}}
+                state["tasks"][task.name] = entry
+            if not entry["done"] and not task.enabled():
+                entry.update(done=True, skipped=True)
+                await asyncio.to_thread(self._save_state_sync, state)
+            self._report(task.name, entry, current, status="done" if entry["done"] else "pending")
+
+        for task in tasks:
+            entry = state["tasks"][task.name]
+            if entry["done"]:
+                continue
+            finished = await self._run_task(task, entry, state, should_continue=should_continue)
+            if not finished:
+                return dict(state["tasks"])
+
+        current["completed_at"] = self._wall_clock()
+        await asyncio.to_thread(self._save_state_sync, state)
+        for task in tasks:
+            self._report(task.name, state["tasks"][task.name], current, status="done")
+        log.info(
+            "Scheduled maintenance pass completed",
+            pass_id=pass_id,
+            duration_seconds=round(current["completed_at"] - float(current["started_at"]), 1),
+            tasks={name: entry.get("stats", {}) for name, entry in state["tasks"].items()},
+        )
+        return dict(state["tasks"])
+
+    async def _run_task(
+        self,
+        task: MaintenanceTask,
+        entry: dict[str, Any],
+        state: dict[str, Any],
+        *,
+        should_continue: Callable[[], bool],
+    ) -> bool:
+        current = state["pass"]
+        while True:
+            if not should_continue():
+                return False
+            await self._wait_for_low_pressure(task, entry, current)
+            self._report(task.name, entry, current, status="running")
+            try:
+                result = await task.run_slice(dict(entry["cursor"]))
+            except Exception as e:
+                # Like the old monolithic pass, one failing task must not block
+                # the others; it is retried from scratch on the next pass.
+                log.error("Scheduled maintenance slice failed", task=task.name, error=str(e))
+                entry.update(done=True, error=str(e))
+                await asyncio.to_thread(self._save_state_sync, state)
+                self._report(task.name, entry, current, status="failed")
+                return True
+            entry["slices"] += 1
+            entry["processed"] += max(0, int(result.processed))
+            for key, value in result.stats.items():
+                entry["stats"][key] = entry["stats"].get(key, 0) + value
+            entry["cursor"] = dict(result.cursor)
+            entry["done"] = bool(result.done)
+            entry["last_slice_at"] = self._wall_clock()
+            await asyncio.to_thread(self._save_state_sync, state)
+            if entry["done"]:
+                self._report(task.name, entry, current, status="done")
+                return True
+            self._report(task.name, entry, current, status="paced")
+            if result.processed > 0 and task.units_per_second > 0:
+                await self._sleep(result.processed / task.units_per_second)
+
+    async def _wait_for_low_pressure(
+        self,
+        task: MaintenanceTask,
+        entry: dict[str, Any],
+        current: dict[str, Any],
+    ) -> None:
+        deferred_since: float | None = None
+        while (reason := self._pressure_probe()) is not None:
+            now = self._clock()
+            if deferred_since is None:
+                deferred_since = now
+            elif now - deferred_since >= MAINTENANCE_MAX_DEFER_SECONDS:
+                log.warning(
+                    "Running maintenance slice despite sustained pressure",
+                    task=task.name,
+                    reason=reason,
+                    deferred_seconds=round(now - deferred_since, 1),
+                )
+                return
+            self._report(task.name, entry, current, status="deferred", deferred_reason=reason)
+            await self._sleep(MAINTENANCE_PRESSURE_POLL_SECONDS)
+
+    def _report(
+        self,
+        name: str,
+        entry: dict[str, Any],
+        current: dict[str, Any],
+        *,
+        status: str,
+        deferred_reason: str | None = None,
+    ) -> None:
+        if entry.get("skipped"):
+            status = "skipped"
+        elif entry.get("error"):
+            status = "failed"
+        maintenance_coordinator.report_scheduled_task(
+            name,
+            {
+                "status": status,
+                "pass_id": current.get("id"),
+                "pass_started_at": _utc_iso(current.get("started_at")),
+                "due_since": None if entry.get("done") else current.get("started_at"),
+                "slices": entry.get("slices", 0),
+                "processed": entry.get("processed", 0),
+                "stats": dict(entry.get("stats") or {}),
+                "cursor": dict(entry.get("cursor") or {}),
+                "last_slice_at": _utc_iso(entry.get("last_slice_at")),
+                "deferred_reason": deferred_reason,
+                "error": entry.get("error"),
+            },
+        )
+
+    def _load_state_sync(self) -> dict[str, Any]:
+        try:
+            payload = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != STATE_VERSION:
+            return {}
+        if not isinstance(payload.get("pass"), dict) or not isinstance(payload.get("tasks"), dict):
+            return {}
+        return payload
+
+    def _save_state_sync(self, state: dict[str, Any]) -> None:
+        path = self.state_path
+        temporary = path.with_name(f"{path.name}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary.write_text(json.dumps(state, sort_keys=True), encoding="utf-8")
+            os.replace(temporary, path)
+        except OSError as exc:
+            log.warning("Failed to persist maintenance cursors", path=str(path), error=str(exc))
+
+
+maintenance_scheduler = MaintenanceScheduler()
@@ -11,10 +11,8 @@ from pathlib import Path
 
 import aiofiles
 import aiosqlite
-import cv2
 import structlog
 from fastapi import HTTPException, UploadFile
-from PIL import Image, ImageOps
 
 from app.config import settings
 from app.database import get_db
@@ -25,6 +23,11 @@ from app.services.taxonomy.taxonomy_service import taxonomy_service
 from app.utils.api_datetime import utc_naive_datetime, utc_naive_now
 from app.utils.image_io import load_rgb_image
 from app.utils.tasks import create_background_task
+from app.utils.lazy_imports import lazy_module
+
+cv2 = lazy_module("cv2")
+Image = lazy_module("PIL.Image")
+ImageOps = lazy_module("PIL.ImageOps")
 
 
 log = structlog.get_logger()
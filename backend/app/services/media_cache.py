@@ -1,8 +1,11 @@
 """Media cache service for storing snapshots and clips locally."""
 
 import asyncio
+import heapq
 import json
 import os
+import shutil
+import stat
 import time
 import uuid
 import aiofiles
@@ -22,6 +25,10 @@ CACHE_BASE_DIR = Path(os.getenv("MEDIA_CACHE_DIR", "/config/media_cache"))
 SNAPSHOTS_DIR = CACHE_BASE_DIR / "snapshots"
 CLIPS_DIR = CACHE_BASE_DIR / "clips"
 PREVIEWS_DIR = CACHE_BASE_DIR / "previews"
+# Hard links to clips that are being read by a long-running job. Retention
+# and cleanup passes only glob the top level of CLIPS_DIR, so pinned links
+# keep the bytes alive until the job releases them.
+PINNED_CLIPS_DIR = CLIPS_DIR / ".pinned"
 
 # Frigate returns a ~78-byte stub body for clips whose recordings were not
 # retained (expired or never saved).  Any cached file smaller than this
@@ -242,6 +249,18 @@ class MediaCacheService:
             raise ValueError(f"Invalid preview manifest path for event: {event_id}")
         return path
 
+    def _track_index_path(self, event_id: str) -> Path:
+        """Get the path for a cached event track index (kept with the preview assets)."""
+        safe_id = self._sanitize_event_id(event_id)
+        path = PREVIEWS_DIR / f"{safe_id}.track"
+        try:
+            resolved = path.resolve()
+            if not resolved.is_relative_to(PREVIEWS_DIR):
+                raise ValueError(f"Path traversal detected: {event_id}")
+        except (ValueError, OSError):
+            raise ValueError(f"Invalid track index path for event: {event_id}")
+        return path
+
     def _invalidate_recording_clip_duration_cache(self, path: Path) -> None:
         self._recording_clip_duration_cache.pop(str(path), None)
 
@@ -274,6 +293,29 @@ class MediaCacheService:
             ns=(now_ns, int(stat_result.st_mtime_ns)),
         )
 
+    async def _write_chunks_atomic(self, path: Path, chunks) -> int:
+        """Stream chunks to a temp file in the same directory, then atomically replace.
+
+        Replacing (rather than truncating in place) leaves any pinned hard link to
+        the previous file intact.
+        """
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        total_size = 0
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                async for chunk in chunks:
+                    if chunk:
+                        await f.write(chunk)
+                        total_size += len(chunk)
+            await asyncio.to_thread(tmp_path.replace, path)
+            return total_size
+        except BaseException:
+            try:
+                await asyncio.to_thread(_unlink_if_present, tmp_path)
+            except Exception:
+                pass
+            raise
+
     async def _write_bytes_atomic(self, path: Path, data: bytes) -> Path:
         """Write bytes to a temp file in the same directory, then atomically replace."""
         tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
@@ -520,8 +562,7 @@ class MediaCacheService:
             return None
         try:
             path = self._clip_path(event_id)
-            async with aiofiles.open(path, "wb") as f:
-                await f.write(clip_bytes)
+            await self._write_bytes_atomic(path, clip_bytes)
             log.debug("Cached clip", event_id=event_id, size=len(clip_bytes))
             return path
         except Exception as e:
@@ -549,12 +590,7 @@ class MediaCacheService:
             return None
         try:
             path = self._clip_path(event_id)
-            total_size = 0
-            async with aiofiles.open(path, "wb") as f:
-                async for chunk in chunks:
-                    if chunk:
-                        await f.write(chunk)
-                        total_size += len(chunk)
+            total_size = await self._write_chunks_atomic(path, chunks)
 
             if total_size < _MIN_VALID_CLIP_BYTES:
                 log.warning(
@@ -597,8 +633,7 @@ class MediaCacheService:
             return None
         try:
             path = self._recording_clip_path(event_id)
-            async with aiofiles.open(path, "wb") as f:
-                await f.write(clip_bytes)
+            await self._write_bytes_atomic(path, clip_bytes)
             self._invalidate_recording_clip_duration_cache(path)
             log.debug("Cached recording clip", event_id=event_id, size=len(clip_bytes))
             await self._emit_recording_clip_cached(event_id)
@@ -620,12 +655,7 @@ class MediaCacheService:
             return None
         try:
             path = self._recording_clip_path(event_id)
-            total_size = 0
-            async with aiofiles.open(path, "wb") as f:
-                async for chunk in chunks:
-                    if chunk:
-                        await f.write(chunk)
-                        total_size += len(chunk)
+            total_size = await self._write_chunks_atomic(path, chunks)
 
             if total_size < _MIN_VALID_CLIP_BYTES:
                 log.warning(
@@ -736,6 +766,42 @@ class MediaCacheService:
                 pass
         return None
 
+    def _pin_clip_sync(self, path: Path) -> Path:
+        PINNED_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
+        pinned = PINNED_CLIPS_DIR / f"{uuid.uuid4().hex}{path.suffix or '.mp4'}"
+        try:
+            os.link(path, pinned)
+        except OSError:
+            # Hard links are unsupported on some mounts; a copy pins just as well.
+            shutil.copyfile(path, pinned)
+        return pinned
+
+    async def pin_clip(self, path: Path) -> Path:
+        """Return a private link to a cached clip that eviction cannot delete or replace.
+
+        The caller removes the returned path when done; cached clips are only ever
+        replaced atomically, so the link keeps the bytes it was taken from.
+        """
+        return await asyncio.to_thread(self._pin_clip_sync, Path(path))
+
+    def _clear_pinned_clips_sync(self) -> int:
+        removed = 0
+        if not PINNED_CLIPS_DIR.is_dir():
+            return 0
+        for path in PINNED_CLIPS_DIR.iterdir():
+            try:
+                path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                log.warning("Failed to remove stale pinned clip", path=str(path), error=str(e))
+        return removed
+
+    async def clear_pinned_clips(self) -> int:
+        """Drop pins left behind by jobs that never released them (e.g. a crash)."""
+        return await asyncio.to_thread(self._clear_pinned_clips_sync)
+
     def get_recording_clip_duration_seconds(self, event_id: str) -> Optional[float]:
         """Return the measured duration of a valid cached recording clip.
 
@@ -814,6 +880,30 @@ class MediaCacheService:
             log.error("Failed to read cached preview manifest", event_id=event_id, error=str(e))
             return None
 
+    async def cache_track_index(self, event_id: str, track_index: dict) -> bool:
+        """Cache the JSON track index built from an ended event's Frigate path data."""
+        if not self._available:
+            return False
+        try:
+            encoded = json.dumps(track_index, sort_keys=True, separators=(",", ":")).encode("utf-8")
+            await self._write_bytes_atomic(self._track_index_path(event_id), encoded)
+            return True
+        except Exception as e:
+            log.warning("Failed to cache event track index", event_id=event_id, error=str(e))
+            return False
+
+    def get_track_index_sync(self, event_id: str) -> Optional[dict]:
+        """Read a cached event track index, if present and valid."""
+        try:
+            path = self._track_index_path(event_id)
+            if not path.exists():
+                return None
+            parsed = json.loads(path.read_text(encoding="utf-8"))
+            return parsed if isinstance(parsed, dict) else None
+        except Exception as e:
+            log.debug("Failed to read cached event track index", event_id=event_id, error=str(e))
+            return None
+
     def get_preview_sprite_path(self, event_id: str) -> Optional[Path]:
         """Get path to a cached preview sprite if it exists and has content."""
         try:
@@ -865,6 +955,10 @@ class MediaCacheService:
             if await aiofiles.os.path.exists(preview_manifest_path):
                 await aiofiles.os.remove(preview_manifest_path)
 
+            track_index_path = self._track_index_path(event_id)
+            if await aiofiles.os.path.exists(track_index_path):
+                await aiofiles.os.remove(track_index_path)
+
             log.debug("Deleted cached media", event_id=event_id)
         except Exception as e:
             log.error("Failed to delete cached media", event_id=event_id, error=str(e))
@@ -1004,6 +1098,106 @@ class MediaCacheService:
         log.info("Media cache cleanup complete", **stats)
         return stats
 
+    async def cleanup_old_media_slice(
+        self,
+        retention_days: int,
+        protected_event_ids: Optional[set[str]] = None,
+        *,
+        cursor: Optional[dict] = None,
+        max_files: int = 200,
+    ) -> dict:
+        return await asyncio.to_thread(
+            self._cleanup_old_media_slice_sync,
+            retention_days,
+            protected_event_ids,
+            cursor,
+            max_files,
+        )
+
+    def _cleanup_old_media_slice_sync(
+        self,
+        retention_days: int,
+        protected_event_ids: Optional[set[str]],
+        cursor: Optional[dict],
+        max_files: int,
+    ) -> dict:
+        """Examine at most ``max_files`` cached files, resuming after ``cursor``.
+
+        Same rules as ``_cleanup_old_media_sync`` (empty files always go, then
+        age-based deletion that skips protected events), but files are visited
+        in name order per directory so the walk can stop anywhere and resume
+        from the returned cursor. ``done`` is true once every directory has
+        been walked.
+        """
+        protected_ids = protected_event_ids or set()
+        cutoff_timestamp = (datetime.now() - timedelta(days=retention_days)).timestamp() if retention_days > 0 else None
+        budget = max(1, int(max_files))
+        directories = (
+            ("snapshots", SNAPSHOTS_DIR, ".jpg"),
+            ("clips", CLIPS_DIR, ".mp4"),
+            ("previews", PREVIEWS_DIR, None),
+        )
+        position = dict(cursor or {})
+        directory_index = int(position.get("directory", 0) or 0)
+        after = str(position.get("after") or "")
+        stats = {
+            "snapshots_deleted": 0,
+            "clips_deleted": 0,
+            "previews_deleted": 0,
+            "bytes_freed": 0,
+            "protected_skipped": 0,
+            "scanned": 0,
+        }
+
+        while directory_index < len(directories) and budget > 0:
+            kind, directory, suffix = directories[directory_index]
+            try:
+                with os.scandir(directory) as entries:
+                    # Listing names is cheap next to the stat/unlink work below;
+                    # only the next ``budget`` names past the cursor are examined.
+                    names = heapq.nsmallest(
+                        budget,
+                        (
+                            entry.name
+                            for entry in entries
+                            if entry.name > after and (suffix is None or entry.name.endswith(suffix))
+                        ),
+                    )
+            except FileNotFoundError:
+                names = []
+            for name in names:
+                after = name
+                budget -= 1
+                stats["scanned"] += 1
+                path = directory / name
+                try:
+                    info = path.stat()
+                    if not stat.S_ISREG(info.st_mode):
+                        continue
+                    if info.st_size > 0:
+                        if path.stem in protected_ids:
+                            stats["protected_skipped"] += 1
+                            continue
+                        if cutoff_timestamp is None or info.st_mtime >= cutoff_timestamp:
+                            continue
+                    path.unlink()
+                    stats[f"{kind}_deleted"] += 1
+                    stats["bytes_freed"] += info.st_size
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    log.warning("Failed to delete cached media file", path=str(path), error=str(e))
+            if budget > 0:
+                directory_index += 1
+                after = ""
+
+        done = directory_index >= len(directories)
+        return {
+            **stats,
+            "done": done,
+            "cursor": {} if done else {"directory": directory_index, "after": after},
+        }
+
     async def cleanup_orphaned_media(self, valid_event_ids: set[str]) -> dict:
         return await asyncio.to_thread(self._cleanup_orphaned_media_sync, valid_event_ids)
 
@@ -1044,7 +1238,7 @@ class MediaCacheService:
 
         # Clean orphaned preview artifacts
         for path in PREVIEWS_DIR.glob("*"):
-            if path.suffix not in (".jpg", ".json"):
+            if path.suffix not in (".jpg", ".json", ".track"):
                 continue
             event_id = path.stem
             if event_id not in valid_event_ids:
@@ -0,0 +1,384 @@
+"""Bulk reconciliation of local detections against Frigate's retained events.
+
+The media-integrity scan used to ask Frigate about every detection with one
+``GET /api/events/<id>`` each, which on a large database is hundreds of
+thousands of requests per night. This engine instead walks time windows in
+ascending order, pages Frigate's bird event list for each window with
+``FrigateClient.list_events`` and merge-diffs the sorted event ids against the
+detections stored for the same window. Only detections that cannot be placed in
+a listed window (event ids without a Frigate timestamp prefix, or rows whose
+stored time is skewed away from the id) are confirmed one by one.
+
+Frigate retention expires events oldest first, so after a full pass the engine
+persists a watermark per media kind:
+
+- ``retention_floor``: the oldest window that still had a present detection.
+- ``verified_through``: when the last pass finished.
+
+An incremental pass only re-checks the boundary (from the floor forward until
+a window is fully present again) plus the detections recorded since the last
+pass. Manual scans from the settings page always run the full pass.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Literal
+
+import structlog
+
+from app.config import settings
+from app.database import _get_db_path, get_db
+from app.repositories.detection_repository import DetectionRepository, MediaReconciliationRow
+from app.services.frigate_client import FrigateEventsFetchError, frigate_client
+from app.services.frigate_missing_policy import apply_missing_policy, clear_missing_state_if_present
+from app.utils.api_datetime import utc_naive_from_timestamp
+
+log = structlog.get_logger()
+
+MediaKind = Literal["clip", "snapshot", "media"]
+
+MEDIA_RECONCILE_WINDOW_SECONDS = max(3600, int(os.getenv("MEDIA_RECONCILE_WINDOW_SECONDS", "86400")))
+MEDIA_RECONCILE_MATCH_MARGIN_SECONDS = max(0, int(os.getenv("MEDIA_RECONCILE_MATCH_MARGIN_SECONDS", "3600")))
+MEDIA_RECONCILE_PAGE_LIMIT = max(50, int(os.getenv("MEDIA_RECONCILE_PAGE_LIMIT", "500")))
+MEDIA_RECONCILE_MAX_PAGES_PER_WINDOW = 200
+MEDIA_RECONCILE_CONFIRM_CONCURRENCY = 8
+STATE_FILENAME = "media_reconciliation_state.json"
+STATE_VERSION = 1
+
+# Frigate event ids are "<start_time>-<random suffix>".
+_EVENT_ID_TIMESTAMP = re.compile(r"^(\d{9,11}(?:\.\d+)?)-")
+
+
+class ReconciliationIncompleteError(RuntimeError):
+    """Frigate's event listing for a window could not be read completely."""
+
+
+def event_id_timestamp(event_id: str) -> float | None:
+    match = _EVENT_ID_TIMESTAMP.match(str(event_id or ""))
+    return float(match.group(1)) if match else None
+
+
+def merge_diff(local_ids: list[str], remote_ids: list[str]) -> tuple[list[str], list[str]]:
+    """Split sorted ``local_ids`` into (present, absent) against sorted ``remote_ids``."""
+    present: list[str] = []
+    absent: list[str] = []
+    remote_index = 0
+    for local_id in local_ids:
+        while remote_index < len(remote_ids) and remote_ids[remote_index] < local_id:
+            remote_index += 1
+        if remote_index < len(remote_ids) and remote_ids[remote_index] == local_id:
+            present.append(local_id)
+        else:
+            absent.append(local_id)
+    return present, absent
+
+
+def missing_media_reason(kind: MediaKind, event_data: dict[str, Any]) -> str | None:
+    if kind == "clip":
+        return None if bool(event_data.get("has_clip", False)) else "clip_unavailable"
+    if kind == "snapshot":
+        return None if bool(event_data.get("has_snapshot", True)) else "snapshot_unavailable"
+    reasons: list[str] = []
+    if settings.frigate.clips_enabled and not bool(event_data.get("has_clip", False)):
+        reasons.append("clip_unavailable")
+    if not bool(event_data.get("has_snapshot", True)):
+        reasons.append("snapshot_unavailable")
+    return ",".join(reasons) or None
+
+
+def _epoch(value: datetime) -> float:
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+@dataclass
+class _RunStats:
+    kind: MediaKind
+    mode: str
+    checked: int = 0
+    missing: int = 0
+    deleted_count: int = 0
+    marked_missing_count: int = 0
+    kept_count: int = 0
+    cleared_missing_count: int = 0
+    frigate_calls: int = 0
+    confirmed_individually: int = 0
+    windows: int = 0
+    cameras_expiring: set[str] = field(default_factory=set)
+
+    def result(self, status: str = "completed", message: str | None = None) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "status": status,
+            "deleted_count": self.deleted_count,
+            "marked_missing_count": self.marked_missing_count,
+            "kept_count": self.kept_count,
+            "cleared_missing_count": self.cleared_missing_count,
+            "checked": self.checked,
+            "missing": self.missing,
+            "mode": self.mode,
+            "frigate_calls": self.frigate_calls,
+        }
+        if message:
+            payload["message"] = message
+        return payload
+
+
+class MediaReconciliationService:
+    def __init__(self, state_path: Path | None = None) -> None:
+        self._state_path = state_path
+        self._lock = asyncio.Lock()
+
+    @property
+    def state_path(self) -> Path:
+        if self._state_path is not None:
+            return self._state_path
+        return Path(_get_db_path()).expanduser().parent / STATE_FILENAME
+
+    async def reconcile(self, kind: MediaKind, *, full: bool = True) -> dict[str, Any]:
+        """Reconcile detections for ``kind`` and apply the configured missing policy."""
+        async with self._lock:
+            return await self._reconcile_locked(kind, full=full)
+
+    async def _reconcile_locked(self, kind: MediaKind, *, full: bool) -> dict[str, Any]:
+        state = {} if full else await asyncio.to_thread(self._load_state_sync, kind)
+        stats = _RunStats(kind=kind, mode="incremental" if state else "full")
+        if kind == "clip" and not settings.frigate.clips_enabled:
+            return stats.result("skipped", "Clip fetching is disabled in settings.")
+
+        async with get_db() as db:
+            bounds = await DetectionRepository(db).get_frigate_detection_time_bounds()
+        if bounds is None:
+            return stats.result(message="No detections found")
+
+        stats.frigate_calls += 1
+        try:
+            version = await frigate_client.get_version()
+        except Exception:
+            version = None
+        if not version:
+            return stats.result("failed", "Frigate is not reachable. Aborting purge.")
+
+        started_at = time.time()
+        oldest = _epoch(bounds[0])
+        end = max(started_at, _epoch(bounds[1]) + 1.0)
+        try:
+            if state:
+                fresh_start = max(oldest, float(state["verified_through"]) - MEDIA_RECONCILE_MATCH_MARGIN_SECONDS)
+                floor = await self._scan(
+                    stats,
+                    start=max(oldest, float(state["retention_floor"])),
+                    end=fresh_start,
+                    stop_when_present=True,
+                )
+                fresh_floor = await self._scan(stats, start=fresh_start, end=end, stop_when_present=False)
+                floor = floor if floor is not None else fresh_floor
+            else:
+                floor = await self._scan(stats, start=oldest, end=end, stop_when_present=False)
+        except ReconciliationIncompleteError as exc:
+            log.warning("Media reconciliation aborted", kind=kind, error=str(exc), frigate_calls=stats.frigate_calls)
+            return stats.result("failed", f"Frigate event history could not be read completely: {exc}")
+
+        await asyncio.to_thread(
+            self._save_state_sync,
+            kind,
+            {
+                "retention_floor": floor if floor is not None else started_at,
+                "verified_through": started_at,
+                "last_frigate_calls": stats.frigate_calls,
+                "last_checked": stats.checked,
+                "last_mode": stats.mode,
+            },
+        )
+        log.info(
+            "Media reconciliation completed",
+            kind=kind,
+            mode=stats.mode,
+            windows=stats.windows,
+            checked=stats.checked,
+            missing=stats.missing,
+            frigate_calls=stats.frigate_calls,
+            confirmed_individually=stats.confirmed_individually,
+        )
+        return stats.result()
+
+    async def _scan(self, stats: _RunStats, *, start: float, end: float, stop_when_present: bool) -> float | None:
+        """Reconcile ``[start, end)`` window by window; return the first window holding a present detection.
+
+        With ``stop_when_present`` the scan ends at the first window in which
+        every detection is present and every camera that was expiring earlier
+        in the scan is represented, i.e. once it has crossed the retention
+        boundary for all cameras.
+        """
+        floor: float | None = None
+        window_start = start
+        while window_start < end:
+            window_end = min(end, window_start + MEDIA_RECONCILE_WINDOW_SECONDS)
+            async with get_db() as db:
+                rows = await DetectionRepository(db).list_media_reconciliation_rows(
+                    detected_from=utc_naive_from_timestamp(window_start),
+                    detected_before=utc_naive_from_timestamp(window_end),
+                )
+            if rows:
+                stats.windows += 1
+                present_cameras, missing_cameras = await self._reconcile_window(
+                    stats, rows, window_start=window_start, window_end=window_end
+                )
+                if present_cameras and floor is None:
+                    floor = window_start
+                stats.cameras_expiring |= missing_cameras
+                if stop_when_present and not missing_cameras and stats.cameras_expiring <= present_cameras:
+                    return floor
+            window_start = window_end
+        return floor
+
+    async def _reconcile_window(
+        self,
+        stats: _RunStats,
+        rows: list[MediaReconciliationRow],
+        *,
+        window_start: float,
+        window_end: float,
+    ) -> tuple[set[str], set[str]]:
+        listed_after = window_start - MEDIA_RECONCILE_MATCH_MARGIN_SECONDS
+        listed_before = window_end + MEDIA_RECONCILE_MATCH_MARGIN_SECONDS
+        listed = await self._list_window(stats, after=listed_after, before=listed_before)
+
+        decidable: list[str] = []
+        undecidable: list[str] = []
+        for row in rows:
+            id_ts = event_id_timestamp(row.frigate_event)
+            if id_ts is not None and listed_after <= id_ts < listed_before:
+                decidable.append(row.frigate_event)
+            else:
+                undecidable.append(row.frigate_event)
+        present_ids, absent_ids = merge_diff(decidable, sorted(listed))
+
+        outcomes: dict[str, str | None] = {event_id: "event_not_found" for event_id in absent_ids}
+        for event_id in present_ids:
+            outcomes[event_id] = missing_media_reason(stats.kind, listed[event_id])
+        if undecidable:
+            outcomes.update(await self._confirm_individually(stats, undecidable))
+
+        present_cameras: set[str] = set()
+        missing_cameras: set[str] = set()
+        async with get_db() as db:
+            repo = DetectionRepository(db)
+            for row in rows:
+                stats.checked += 1
+                error = outcomes.get(row.frigate_event)
+                if error:
+                    stats.missing += 1
+                    missing_cameras.add(row.camera_name)
+                    counts = await apply_missing_policy(
+                        repo=repo,
+                        frigate_event=row.frigate_event,
+                        error=error,
+                        source="maintenance_scan",
+                        media_kind=stats.kind,
+                    )
+                    stats.deleted_count += counts["deleted_count"]
+                    stats.marked_missing_count += counts["marked_missing_count"]
+                    stats.kept_count += counts["kept_count"]
+                    continue
+                present_cameras.add(row.camera_name)
+                if row.frigate_status != "present" and await clear_missing_state_if_present(
+                    repo=repo,
+                    frigate_event=row.frigate_event,
+                    source="maintenance_scan",
+                    media_kind=stats.kind,
+                ):
+                    stats.cleared_missing_count += 1
+        return present_cameras, missing_cameras
+
+    async def _list_window(self, stats: _RunStats, *, after: float, before: float) -> dict[str, dict[str, Any]]:
+        """Page Frigate's bird events in ``[after, before)`` newest-first into an id map."""
+        events: dict[str, dict[str, Any]] = {}
+        cursor_before = before
+        for _page in range(MEDIA_RECONCILE_MAX_PAGES_PER_WINDOW):
+            stats.frigate_calls += 1
+            try:
+                page = await frigate_client.list_events(
+                    after=after,
+                    before=cursor_before,
+                    label="bird",
+                    has_snapshot=False,
+                    limit=MEDIA_RECONCILE_PAGE_LIMIT,
+                )
+            except FrigateEventsFetchError as exc:
+                raise ReconciliationIncompleteError(str(exc)) from exc
+            new_events = 0
+            oldest: float | None = None
+            for event in page:
+                event_id = str(event.get("id") or "")
+                if event_id and event_id not in events:
+                    events[event_id] = event
+                    new_events += 1
+                start_time = event.get("start_time")
+                if isinstance(start_time, (int, float)):
+                    oldest = float(start_time) if oldest is None else min(oldest, float(start_time))
+            if len(page) < MEDIA_RECONCILE_PAGE_LIMIT:
+                return events
+            if oldest is None or new_events == 0:
+                raise ReconciliationIncompleteError("Frigate event pagination did not advance")
+            # Keep the oldest timestamp inclusive so events sharing it across a
+            # page boundary are not skipped; duplicates are dropped by id.
+            cursor_before = oldest + 1e-6
+        raise ReconciliationIncompleteError("Frigate event history exceeded the per-window page budget")
+
+    async def _confirm_individually(self, stats: _RunStats, event_ids: list[str]) -> dict[str, str | None]:
+        semaphore = asyncio.Semaphore(MEDIA_RECONCILE_CONFIRM_CONCURRENCY)
+
+        async def check(event_id: str) -> tuple[str, str | None]:
+            async with semaphore:
+                event_data, error = await frigate_client.get_event_with_error(event_id)
+            if not event_data:
+                return event_id, error or "event_not_found"
+            return event_id, missing_media_reason(stats.kind, event_data)
+
+        stats.frigate_calls += len(event_ids)
+        stats.confirmed_individually += len(event_ids)
+        return dict(await asyncio.gather(*(check(event_id) for event_id in event_ids)))
+
+    def _load_state_sync(self, kind: MediaKind) -> dict[str, Any]:
+        try:
+            payload = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != STATE_VERSION:
+            return {}
+        entry = (payload.get("kinds") or {}).get(kind)
+        if not isinstance(entry, dict):
+            return {}
+        try:
+            float(entry["retention_floor"])
+            float(entry["verified_through"])
+        except (KeyError, TypeError, ValueError):
+            return {}
+        return entry
+
+    def _save_state_sync(self, kind: MediaKind, entry: dict[str, Any]) -> None:
+        path = self.state_path
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            payload = {}
+        if not isinstance(payload, dict) or payload.get("version") != STATE_VERSION:
+            payload = {"version": STATE_VERSION, "kinds": {}}
+        payload.setdefault("kinds", {})[kind] = entry
+        temporary = path.with_name(f"{path.name}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+            os.replace(temporary, path)
+        except OSError as exc:
+            log.warning("Failed to persist media reconciliation watermark", path=str(path), error=str(exc))
+
+
+media_reconciliation_service = MediaReconciliationService()
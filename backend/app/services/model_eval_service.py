@@ -1,10 +1,12 @@
 """Model evaluation harness — orchestrates a single eval run end to end.
 
 Loads the species panel, fetches labeled images, then for every installed
-classifier model: activates the model via ModelManager, runs the live
-ClassifierService pipeline against each image, records latency / accuracy /
+classifier model: loads the model in an isolated side-car process (see
+``app.services.eval.sidecar``), runs batched inference over the panel while
+yielding to live detections, records latency / throughput / accuracy /
 provider info, and writes summary / runtime / confusion / per-image artifacts
-to disk. Image cache is removed at the end of the run.
+to disk. The live classifier and persisted active model are never swapped for
+the accuracy pass. Image cache is removed at the end of the run.
 
 Only one run is allowed at a time. State for the active run is held in the
 service singleton; finished runs are read back off disk on request so history
@@ -28,7 +30,6 @@ from typing import Any, Optional
 
 import httpx
 import structlog
-from app.utils.image_io import load_rgb_image
 
 from app.config import settings
 from app.services.broadcaster import broadcaster
@@ -37,6 +38,8 @@ from app.services.eval.image_fetcher import (
     cleanup_image_dir,
     fetch_panel_images,
 )
+from app.services.eval.sidecar import MODEL_EVAL_SIDECAR_BATCH_SIZE, EvalSidecar
+from app.services.eval.tensor_cache import PreprocessedTensorCache
 from app.services.eval.species_panel import (
     SpeciesEntry,
     build_panel,
@@ -59,6 +62,23 @@ CONFUSIONS_FILENAME = "confusions.csv"
 DEVICE_MATRIX_FILENAME = "device_matrix.json"
 IMAGES_SUBDIR = "images"
 
+# Preprocessed panel tensors are shared across models (and runs) whose
+# preprocessing plans match; see app.services.eval.tensor_cache.
+MODEL_EVAL_TENSOR_CACHE_ENABLED = os.getenv("MODEL_EVAL_TENSOR_CACHE_ENABLED", "true").strip().lower() not in {
+    "0",
+    "false",
+    "no",
+    "off",
+}
+MODEL_EVAL_TENSOR_CACHE_MAX_BYTES = max(0, int(os.getenv("MODEL_EVAL_TENSOR_CACHE_MAX_BYTES", str(2 * 1024**3))))
+TENSOR_CACHE_SUBDIR = ".tensor-cache"
+
+# Eval batches yield to live detections: while the live admission lane is
+# saturated (or MQTT reports high pressure) the next batch waits, up to a cap
+# so a permanently busy feeder cannot wedge the run.
+MODEL_EVAL_THROTTLE_POLL_SECONDS = max(0.05, float(os.getenv("MODEL_EVAL_THROTTLE_POLL_SECONDS", "0.5")))
+MODEL_EVAL_THROTTLE_MAX_WAIT_SECONDS = max(0.0, float(os.getenv("MODEL_EVAL_THROTTLE_MAX_WAIT_SECONDS", "30")))
+
 
 class ModelEvalAlreadyRunning(RuntimeError):
     pass
@@ -139,7 +159,7 @@ class ModelEvalRunner:
             return []
         rows: list[dict[str, Any]] = []
         for entry in sorted(root.iterdir(), reverse=True):
-            if not entry.is_dir():
+            if not entry.is_dir() or entry.name.startswith("."):
                 continue
             summary_path = entry / SUMMARY_FILENAME
             row = {
@@ -454,6 +474,16 @@ class ModelEvalRunner:
                 if norm and norm not in panel_label_to_taxa:
                     panel_label_to_taxa[norm] = entry.taxa_id
 
+        tensor_cache_root = _tensor_cache_root()
+        tensor_cache_totals = {"hits": 0, "misses": 0}
+        if tensor_cache_root is not None:
+            try:
+                await asyncio.to_thread(
+                    PreprocessedTensorCache(tensor_cache_root).prune, MODEL_EVAL_TENSOR_CACHE_MAX_BYTES
+                )
+            except OSError as e:
+                log.warning("model_eval_tensor_cache_prune_failed", error=str(e))
+
         try:
             for model_idx, model in enumerate(classifiers):
                 await self._emit(
@@ -462,37 +492,23 @@ class ModelEvalRunner:
                     progress={
                         "done": model_idx,
                         "total": len(classifiers),
-                        "label": f"activating {model.id}",
+                        "label": f"loading {model.id}",
                     },
                 )
-                activated = await model_manager.activate_model(model.id)
-                if not activated:
-                    log.warning("model_eval_activation_failed", model_id=model.id)
-                    skipped_models.append(
-                        {
-                            "model_id": model.id,
-                            "reason": "activation_failed",
-                            "detail": (
-                                "model_manager.activate_model returned False. Common cause: "
-                                "family models with eu/na variants whose top-level dir lacks "
-                                "model.onnx — model_manager validates the parent dir."
-                            ),
-                            "ready": getattr(model, "ready", None),
-                            "ready_reason": getattr(model, "reason", None),
-                        }
-                    )
-                    continue
-                # Reload classifier_service to pick up the new active model.
+                # Each candidate gets its own CPU-capped side-car process; the
+                # live classifier and the persisted active model are untouched.
+                sidecar = EvalSidecar(model.id, tensor_cache_dir=tensor_cache_root)
                 try:
-                    if hasattr(classifier_service, "reload_bird_model"):
-                        await classifier_service.reload_bird_model()
+                    ready = await sidecar.start()
                 except Exception as e:
-                    log.warning("model_eval_reload_failed", model_id=model.id, error=str(e))
+                    log.warning("model_eval_sidecar_start_failed", model_id=model.id, error=str(e))
                     skipped_models.append(
                         {
                             "model_id": model.id,
-                            "reason": "reload_failed",
+                            "reason": "sidecar_start_failed",
                             "detail": str(e),
+                            "ready": getattr(model, "ready", None),
+                            "ready_reason": getattr(model, "reason", None),
                         }
                     )
                     continue
@@ -507,17 +523,20 @@ class ModelEvalRunner:
                 processed = 0
                 taxa_cache: dict[str, Optional[int]] = {}
                 confusions: dict[tuple[int, int], dict[str, Any]] = {}
+                busy_seconds = 0.0
+                throttled_seconds = 0.0
+                tensor_cache_hits = tensor_cache_misses = 0
+                final_status: dict[str, Any] = {}
 
-                images_for_model = sum(len(images_by_taxa.get(e.taxa_id, [])) for e in usable_panel)
+                work = [
+                    (entry, fetched) for entry in usable_panel for fetched in images_by_taxa.get(entry.taxa_id) or []
+                ]
+                images_for_model = len(work)
                 last_emit_at = time.monotonic()
-                for entry in usable_panel:
-                    images = images_by_taxa.get(entry.taxa_id) or []
-                    for fetched in images:
-                        try:
-                            img = await asyncio.to_thread(load_rgb_image, fetched.local_path)
-                        except Exception as e:
-                            log.warning("model_eval_image_open_failed", path=fetched.local_path, error=str(e))
-                            continue
+                try:
+                    for batch_start in range(0, len(work), MODEL_EVAL_SIDECAR_BATCH_SIZE):
+                        batch = work[batch_start : batch_start + MODEL_EVAL_SIDECAR_BATCH_SIZE]
+                        throttled_seconds += await _wait_for_live_headroom(classifier_service)
 
                         # Refresh the progress label every ~2 s so the UI
                         # doesn't look frozen on slow models.
@@ -534,118 +553,142 @@ class ModelEvalRunner:
                                 },
                             )
 
-                        t0 = time.monotonic()
-                        try:
-                            results = await classifier_service.classify_async(img)
-                        except Exception as e:
-                            log.warning(
-                                "model_eval_classify_failed",
-                                model_id=model.id,
-                                taxa_id=entry.taxa_id,
-                                error=str(e),
-                            )
-                            continue
-                        latency_ms = (time.monotonic() - t0) * 1000.0
-                        latencies.append(latency_ms)
-
-                        top5 = list(results or [])[:5]
-                        # Resolve labels → taxa_ids using the offline panel
-                        # map. Predictions that don't match any panel species
-                        # keep taxa_id=None: they were never going to count
-                        # toward an accuracy hit (we only score panel species)
-                        # and the iNat round-trips per non-matching prediction
-                        # were the dominant runtime cost in v1.
-                        for r in top5:
-                            label = (r.get("label") or "").strip()
-                            r["taxa_id"] = (
-                                _resolve_label_taxa(label, panel_label_to_taxa, taxa_cache) if label else None
-                            )
+                        batch_t0 = time.monotonic()
+                        items = await sidecar.classify_batch([fetched.local_path for _entry, fetched in batch])
+                        busy_seconds += time.monotonic() - batch_t0
+
+                        for (entry, fetched), item in zip(batch, items):
+                            if item.get("tensor_cache") == "hit":
+                                tensor_cache_hits += 1
+                            elif item.get("tensor_cache") == "miss":
+                                tensor_cache_misses += 1
+                            if item.get("error") or item.get("latency_ms") is None:
+                                log.warning(
+                                    "model_eval_classify_failed",
+                                    model_id=model.id,
+                                    taxa_id=entry.taxa_id,
+                                    path=fetched.local_path,
+                                    error=item.get("error"),
+                                )
+                                continue
+                            latency_ms = float(item["latency_ms"])
+                            latencies.append(latency_ms)
+
+                            top5 = [dict(r) for r in list(item.get("top5") or [])[:5]]
+                            # Resolve labels → taxa_ids using the offline panel
+                            # map. Predictions that don't match any panel species
+                            # keep taxa_id=None: they were never going to count
+                            # toward an accuracy hit (we only score panel species)
+                            # and the iNat round-trips per non-matching prediction
+                            # were the dominant runtime cost in v1.
+                            for r in top5:
+                                label = (r.get("label") or "").strip()
+                                r["taxa_id"] = (
+                                    _resolve_label_taxa(label, panel_label_to_taxa, taxa_cache) if label else None
+                                )
 
-                        top1 = top5[0] if top5 else None
-                        is_top1_unknown = bool(top1 and is_unknown_species_label(top1.get("label") or ""))
-                        if is_top1_unknown:
-                            abstention_count += 1
-                            if float(top1.get("score") or 0.0) >= 0.90:
-                                high_conf_unknown_count += 1
-
-                        # Match each prediction against the expected entry by
-                        # taxa_id OR by case-folded scientific/common name.
-                        # The name fallback catches iNat's duplicate-taxa
-                        # situation where the same species (e.g. Pica pica)
-                        # gets resolved to different taxa_ids through
-                        # different code paths.
-                        match_flags = [_is_correct_match(r, entry) for r in top5]
-                        if match_flags and match_flags[0]:
-                            top1_hits += 1
-                        if any(match_flags[:3]):
-                            top3_hits += 1
-                        if any(match_flags[:5]):
-                            top5_hits += 1
-                        if entry.panel == "shared_core":
-                            shared_core_total += 1
-                            if match_flags and match_flags[0]:
-                                shared_core_top1 += 1
-                        else:
-                            regional_total += 1
+                            top1 = top5[0] if top5 else None
+                            is_top1_unknown = bool(top1 and is_unknown_species_label(top1.get("label") or ""))
+                            if is_top1_unknown:
+                                abstention_count += 1
+                                if float(top1.get("score") or 0.0) >= 0.90:
+                                    high_conf_unknown_count += 1
+
+                            # Match each prediction against the expected entry by
+                            # taxa_id OR by case-folded scientific/common name.
+                            # The name fallback catches iNat's duplicate-taxa
+                            # situation where the same species (e.g. Pica pica)
+                            # gets resolved to different taxa_ids through
+                            # different code paths.
+                            match_flags = [_is_correct_match(r, entry) for r in top5]
                             if match_flags and match_flags[0]:
-                                regional_top1 += 1
-
-                        # Confusion: only when top-1 was wrong and resolved
-                        ids = [r.get("taxa_id") for r in top5]
-                        if top1 and match_flags and not match_flags[0] and ids[0] is not None and not is_top1_unknown:
-                            key = (entry.taxa_id, ids[0])
-                            cur = confusions.get(key)
-                            if cur is None:
-                                confusions[key] = {
-                                    "expected_taxa": entry.taxa_id,
-                                    "expected_common": entry.common_name,
-                                    "predicted_taxa": ids[0],
-                                    "predicted_common": top1.get("label") or "",
-                                    "count": 1,
-                                    "score_sum": float(top1.get("score") or 0.0),
-                                }
+                                top1_hits += 1
+                            if any(match_flags[:3]):
+                                top3_hits += 1
+                            if any(match_flags[:5]):
+                                top5_hits += 1
+                            if entry.panel == "shared_core":
+                                shared_core_total += 1
+                                if match_flags and match_flags[0]:
+                                    shared_core_top1 += 1
                             else:
-                                cur["count"] += 1
-                                cur["score_sum"] += float(top1.get("score") or 0.0)
-
-                        processed += 1
-
-                        if results_fp is not None:
-                            await asyncio.to_thread(
-                                results_fp.write,
-                                json.dumps(
-                                    {
-                                        "model_id": model.id,
-                                        "taxa_id": entry.taxa_id,
+                                regional_total += 1
+                                if match_flags and match_flags[0]:
+                                    regional_top1 += 1
+
+                            # Confusion: only when top-1 was wrong and resolved
+                            ids = [r.get("taxa_id") for r in top5]
+                            if (
+                                top1
+                                and match_flags
+                                and not match_flags[0]
+                                and ids[0] is not None
+                                and not is_top1_unknown
+                            ):
+                                key = (entry.taxa_id, ids[0])
+                                cur = confusions.get(key)
+                                if cur is None:
+                                    confusions[key] = {
+                                        "expected_taxa": entry.taxa_id,
                                         "expected_common": entry.common_name,
-                                        "expected_scientific": entry.scientific_name,
-                                        "panel": entry.panel,
-                                        "image_path": fetched.local_path,
-                                        "image_source": fetched.source,
-                                        "image_url": fetched.source_url,
-                                        "top5": [
-                                            {
-                                                "label": r.get("label"),
-                                                "score": float(r.get("score") or 0.0),
-                                                "taxa_id": r.get("taxa_id"),
-                                            }
-                                            for r in top5
-                                        ],
-                                        "latency_ms": round(latency_ms, 2),
-                                        "correct_top1": bool(match_flags and match_flags[0]),
+                                        "predicted_taxa": ids[0],
+                                        "predicted_common": top1.get("label") or "",
+                                        "count": 1,
+                                        "score_sum": float(top1.get("score") or 0.0),
                                     }
+                                else:
+                                    cur["count"] += 1
+                                    cur["score_sum"] += float(top1.get("score") or 0.0)
+
+                            processed += 1
+
+                            if results_fp is not None:
+                                await asyncio.to_thread(
+                                    results_fp.write,
+                                    json.dumps(
+                                        {
+                                            "model_id": model.id,
+                                            "taxa_id": entry.taxa_id,
+                                            "expected_common": entry.common_name,
+                                            "expected_scientific": entry.scientific_name,
+                                            "panel": entry.panel,
+                                            "image_path": fetched.local_path,
+                                            "image_source": fetched.source,
+                                            "image_url": fetched.source_url,
+                                            "top5": [
+                                                {
+                                                    "label": r.get("label"),
+                                                    "score": float(r.get("score") or 0.0),
+                                                    "taxa_id": r.get("taxa_id"),
+                                                }
+                                                for r in top5
+                                            ],
+                                            "latency_ms": round(latency_ms, 2),
+                                            "correct_top1": bool(match_flags and match_flags[0]),
+                                        }
+                                    )
+                                    + "\n",
                                 )
-                                + "\n",
-                            )
+                except Exception as e:
+                    log.warning("model_eval_sidecar_failed", model_id=model.id, error=str(e))
+                    skipped_models.append(
+                        {
+                            "model_id": model.id,
+                            "reason": "sidecar_failed",
+                            "detail": str(e),
+                            "ready": getattr(model, "ready", None),
+                            "ready_reason": getattr(model, "reason", None),
+                        }
+                    )
+                    continue
+                finally:
+                    final_status = dict((await sidecar.close()).get("status") or {})
 
                 # Per-model summary
-                status = _classifier_status_snapshot(classifier_service)
+                status = final_status or dict(ready.get("status") or {})
                 provider_info = _provider_summary(status)
                 health_snapshot = _inference_health_for(status)
-                try:
-                    active_spec = dict(model_manager.get_active_model_spec() or {})
-                except Exception:
-                    active_spec = {}
+                active_spec = dict(ready.get("spec") or {})
                 summary = {
                     "model_id": model.id,
                     "active_provider": provider_info.get("active_provider"),
@@ -664,6 +707,12 @@ class ModelEvalRunner:
                     "mean_latency_ms": round(statistics.fmean(latencies), 2) if latencies else None,
                     "p50_latency_ms": round(_percentile(latencies, 50), 2) if latencies else None,
                     "p95_latency_ms": round(_percentile(latencies, 95), 2) if latencies else None,
+                    "throughput_images_per_second": (
+                        round(processed / busy_seconds, 3) if processed and busy_seconds > 0 else None
+                    ),
+                    "throttled_seconds": round(throttled_seconds, 2),
+                    "tensor_cache_hits": tensor_cache_hits,
+                    "tensor_cache_misses": tensor_cache_misses,
                     "startup_benchmark_ms": provider_info.get("startup_benchmark_ms"),
                     "latency_drift_ratio": _drift_ratio(latencies, provider_info.get("startup_benchmark_ms")),
                     "shared_core_top1": _safe_div(shared_core_top1, shared_core_total),
@@ -673,11 +722,14 @@ class ModelEvalRunner:
                 }
                 summary["warnings"] = sanity_checks.collect(summary, region_label=region_label)
                 model_summaries.append(summary)
+                tensor_cache_totals["hits"] += tensor_cache_hits
+                tensor_cache_totals["misses"] += tensor_cache_misses
 
                 runtime_payload[model.id] = {
                     **provider_info,
                     "measured_mean_ms": summary["mean_latency_ms"],
                     "measured_p95_ms": summary["p95_latency_ms"],
+                    "throughput_images_per_second": summary["throughput_images_per_second"],
                     "drift_factor": summary["latency_drift_ratio"],
                     "inference_health": health_snapshot,
                     "ready": model.ready,
@@ -701,6 +753,7 @@ class ModelEvalRunner:
                         region_label=region_label,
                         models=model_summaries,
                         skipped_models=skipped_models,
+                        tensor_cache=_tensor_cache_summary(tensor_cache_root, tensor_cache_totals),
                     ),
                 )
                 await _write_runtime(run_dir, runtime_payload)
@@ -721,7 +774,7 @@ class ModelEvalRunner:
         finally:
             if results_fp is not None:
                 await asyncio.to_thread(results_fp.close)
-            # Restore original active model
+            # Restore original active model (only the device sweep activates)
             if original_active and original_active != model_manager.active_model_id:
                 try:
                     await model_manager.activate_model(original_active)
@@ -746,6 +799,7 @@ class ModelEvalRunner:
             region_label=region_label,
             models=model_summaries,
             skipped_models=skipped_models,
+            tensor_cache=_tensor_cache_summary(tensor_cache_root, tensor_cache_totals),
         )
         await _write_summary(run_dir, envelope)
         await _write_runtime(run_dir, runtime_payload)
@@ -1148,6 +1202,39 @@ def _compatibility_model_summaries(payload: dict[str, Any] | None) -> list[dict[
     return summaries
 
 
+def _tensor_cache_root() -> Optional[Path]:
+    if not MODEL_EVAL_TENSOR_CACHE_ENABLED:
+        return None
+    configured = os.environ.get("MODEL_EVAL_TENSOR_CACHE_DIR", "").strip()
+    return Path(configured) if configured else _eval_runs_root() / TENSOR_CACHE_SUBDIR
+
+
+def _live_pressure_high(classifier_service: Any) -> bool:
+    try:
+        admission = classifier_service.get_admission_status()
+        live = dict(admission.get("live") or {})
+        capacity = int(live.get("capacity") or 0)
+        if int(live.get("queued") or 0) > 0 or (capacity > 0 and int(live.get("running") or 0) >= capacity):
+            return True
+    except Exception:
+        pass
+    try:
+        from app.services.mqtt_service import mqtt_service
+
+        return bool(mqtt_service.is_under_pressure("high"))
+    except Exception:
+        return False
+
+
+async def _wait_for_live_headroom(classifier_service: Any) -> float:
+    """Sleep while live classification is saturated; return seconds waited."""
+    waited = 0.0
+    while waited < MODEL_EVAL_THROTTLE_MAX_WAIT_SECONDS and _live_pressure_high(classifier_service):
+        await asyncio.sleep(MODEL_EVAL_THROTTLE_POLL_SECONDS)
+        waited += MODEL_EVAL_THROTTLE_POLL_SECONDS
+    return waited
+
+
 def _safe_div(numerator: int, denominator: int) -> float:
     if not denominator:
         return 0.0
@@ -1224,9 +1311,10 @@ def _build_summary_envelope(
     region_label: Optional[str],
     models: list[dict[str, Any]],
     skipped_models: Optional[list[dict[str, Any]]] = None,
+    tensor_cache: Optional[dict[str, Any]] = None,
 ) -> dict[str, Any]:
     shared_core = sum(1 for e in panel if e.panel == "shared_core")
-    return {
+    envelope = {
         "run_id": run_id,
         "started_at": started_at.isoformat(),
         "finished_at": finished_at.isoformat() if finished_at else None,
@@ -1248,6 +1336,20 @@ def _build_summary_envelope(
             "personalized_rerank_enabled": getattr(settings.classification, "personalized_rerank_enabled", None),
         },
     }
+    if tensor_cache is not None:
+        envelope["tensor_cache"] = tensor_cache
+    return envelope
+
+
+def _tensor_cache_summary(root: Optional[Path], totals: dict[str, int]) -> Optional[dict[str, Any]]:
+    if root is None:
+        return None
+    lookups = totals["hits"] + totals["misses"]
+    return {
+        "hits": totals["hits"],
+        "misses": totals["misses"],
+        "reuse_ratio": round(totals["hits"] / lookups, 4) if lookups else None,
+    }
 
 
 def _list_eval_images(root: Path, extensions: set[str], limit: int) -> list[str]:
@@ -1397,19 +1499,6 @@ def _resolve_label_taxa(
     return None
 
 
-def _classifier_status_snapshot(classifier_service: Any) -> dict[str, Any]:
-    """Capture a single classifier-service status snapshot. Empty dict on failure."""
-    try:
-        getter = getattr(classifier_service, "get_status", None)
-        if callable(getter):
-            snap = getter()
-            if isinstance(snap, dict):
-                return snap
-    except Exception as e:
-        log.warning("model_eval_status_failed", error=str(e))
-    return {}
-
-
 def _provider_summary(status: dict[str, Any]) -> dict[str, Any]:
     """Pull provider/device/benchmark info out of a classifier_service.get_status()."""
     active_provider = status.get("active_provider")
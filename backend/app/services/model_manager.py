@@ -748,6 +748,13 @@ class ModelManager:
             os.replace(temporary_path, config_path)
             self.active_model_id = model_id
 
+    def _commit_active_model_id(self, model_id: str, *, persist: bool) -> None:
+        if persist:
+            self._save_active_model_id(model_id)
+            return
+        with self._active_model_lock:
+            self.active_model_id = model_id
+
     def _is_classifier_installed(self, model_id: str) -> bool:
         """Return whether a current classifier has a complete runnable artifact."""
         if is_retired_model(model_id):
@@ -2040,7 +2047,15 @@ class ModelManager:
         """Set a model active without blocking the async event loop on filesystem checks."""
         return await asyncio.to_thread(self._activate_model_sync, model_id)
 
-    def _activate_model_sync(self, model_id: str) -> bool:
+    def select_model_for_process(self, model_id: str) -> bool:
+        """Point this process at a model without persisting the selection.
+
+        Isolated evaluation processes use this so the live selection in
+        ``active_model.json`` is never rewritten while candidates are scored.
+        """
+        return self._activate_model_sync(model_id, persist=False)
+
+    def _activate_model_sync(self, model_id: str, *, persist: bool = True) -> bool:
         """Set a model as active."""
         if is_retired_model(model_id):
             log.warning("Activation rejected: classifier has been retired", model_id=model_id)
@@ -2075,19 +2090,19 @@ class ModelManager:
                         model_dir=check_dir,
                     )
                     return False
-            self._save_active_model_id(model_id)
+            self._commit_active_model_id(model_id, persist=persist)
             return True
 
         # 2. Special case for mobilenet_v2_birds (default model)
         if model_id == "mobilenet_v2_birds":
             # Check legacy flat files in MODELS_DIR
             if os.path.exists(os.path.join(MODELS_DIR, "model.tflite")):
-                self._save_active_model_id(model_id)
+                self._commit_active_model_id(model_id, persist=persist)
                 return True
 
             # Check bundled assets
             if os.path.exists(os.path.join(BUNDLED_MODELS_DIR, "model.tflite")):
-                self._save_active_model_id(model_id)
+                self._commit_active_model_id(model_id, persist=persist)
                 return True
 
         log.warning("Activation failed: model not found", model_id=model_id)
@@ -1,6 +1,7 @@
 import asyncio
 import contextlib
 import json
+from collections import deque
 import os
 import structlog
 import uuid
@@ -32,6 +33,9 @@ MQTT_TOPIC_STALL_GRACE_SECONDS = max(10.0, float(os.getenv("MQTT_TOPIC_STALL_GRA
 MQTT_WATCHDOG_INTERVAL_SECONDS = max(10.0, float(os.getenv("MQTT_WATCHDOG_INTERVAL_SECONDS", "30")))
 MAX_HANDLER_WAIT_SECONDS = max(30.0, float(os.getenv("MQTT_MAX_HANDLER_WAIT_SECONDS", "120")))
 MQTT_MAX_CONSECUTIVE_NO_FRIGATE_RECONNECTS = max(1, int(os.getenv("MQTT_MAX_CONSECUTIVE_NO_FRIGATE_RECONNECTS", "5")))
+# Messages accepted while startup is still bringing downstream services up
+# are held (oldest dropped first) and replayed in broker order once released.
+MQTT_PRE_READY_BUFFER_SIZE = max(1, int(os.getenv("MQTT_PRE_READY_BUFFER_SIZE", "500")))
 MQTT_HANDLER_WAIT_EXHAUSTION_HEALTH_WINDOW_SECONDS = max(
     30.0,
     float(os.getenv("MQTT_HANDLER_WAIT_EXHAUSTION_HEALTH_WINDOW_SECONDS", "120")),
@@ -76,6 +80,11 @@ class MQTTService:
         self._last_handler_slot_wait_exhausted_monotonic: float | None = None
         self._frigate_availability: str | None = None  # "online", "offline", or None (never seen)
         self._frigate_availability_monotonic: float | None = None  # monotonic time of last payload
+        self._event_processor = None
+        self._dispatch_held = False
+        self._pre_ready_buffer: deque[tuple[str, bytes, str | None]] = deque()
+        self._pre_ready_dropped = 0
+        self._pre_ready_replayed = 0
         # Simplified Client ID: yawamf-{git_hash}
         # version format is usually "2.0.0+abc1234"
         git_hash = version.split("+")[-1] if "+" in version else "unknown"
@@ -186,6 +195,13 @@ class MQTTService:
             "stall_recovery_warning_active": stall_recovery_warning_active,
             "stall_recovery_warning_age_threshold_seconds": birdnet_active_age_threshold,
             "intentional_reconnect_pending": self._intentional_reconnect,
+            "pre_ready": {
+                "holding": self._dispatch_held,
+                "buffered": len(self._pre_ready_buffer),
+                "capacity": MQTT_PRE_READY_BUFFER_SIZE,
+                "dropped": self._pre_ready_dropped,
+                "replayed": self._pre_ready_replayed,
+            },
             "frigate_availability": {
                 "status": self._frigate_availability if self._frigate_availability is not None else "unknown",
                 "last_seen_age_seconds": (
@@ -499,7 +515,13 @@ class MQTTService:
             label = str(after.get("label") or "").strip().lower()
             false_positive = bool(after.get("false_positive", False))
             event_id = str(after.get("id") or "").strip()
-            should_process = bool(label == "bird" and (false_positive or event_type in {"new", "end"}))
+            # Updates are only admitted when live refresh is enabled; the event
+            # processor then decides whether the snapshot improved enough to
+            # re-classify, and queued updates collapse per event in the meantime.
+            admitted_types = {"new", "end"}
+            if getattr(settings.classification, "live_event_refresh_enabled", False):
+                admitted_types.add("update")
+            should_process = bool(label == "bird" and (false_positive or event_type in admitted_types))
             return {
                 "event_id": event_id or None,
                 "should_process": should_process,
@@ -648,6 +670,40 @@ class MQTTService:
             task.add_done_callback(_cleanup)
         return task
 
+    def hold_dispatch(self) -> None:
+        """Buffer incoming messages instead of dispatching them (startup, before workers are up)."""
+        self._dispatch_held = True
+
+    async def release_dispatch(self) -> None:
+        """Replay buffered messages in arrival order, then dispatch directly again."""
+        while self._pre_ready_buffer:
+            kind, payload, event_id = self._pre_ready_buffer.popleft()
+            if not self.running or self._event_processor is None:
+                continue
+            await self._wait_for_handler_slot()
+            self._dispatch(kind, self._event_processor, payload, event_id)
+            self._pre_ready_replayed += 1
+        # No await between the emptiness check and this flag flip, so a message
+        # arriving concurrently is either replayed above or dispatched directly.
+        self._dispatch_held = False
+
+    def _buffer_pre_ready(self, kind: str, payload: bytes, event_id: str | None) -> None:
+        if len(self._pre_ready_buffer) >= MQTT_PRE_READY_BUFFER_SIZE:
+            self._pre_ready_buffer.popleft()
+            self._pre_ready_dropped += 1
+            if self._pre_ready_dropped == 1 or self._pre_ready_dropped % 100 == 0:
+                log.warning(
+                    "MQTT pre-ready buffer full; dropping oldest message",
+                    capacity=MQTT_PRE_READY_BUFFER_SIZE,
+                    dropped=self._pre_ready_dropped,
+                )
+        self._pre_ready_buffer.append((kind, payload, event_id))
+
+    def _dispatch(self, kind: str, event_processor, payload: bytes, event_id: str | None) -> asyncio.Task:
+        if kind == "frigate":
+            return self._schedule_frigate_message(event_processor, payload, event_id=event_id)
+        return self._schedule_audio_message(event_processor, payload)
+
     def _schedule_audio_message(self, event_processor, payload: bytes) -> asyncio.Task:
         task = create_background_task(
             self._dispatch_audio_message(event_processor, payload),
@@ -759,6 +815,7 @@ class MQTTService:
 
     async def start(self, event_processor):
         self.running = True
+        self._event_processor = event_processor
 
         # Validate MQTT settings
         if not settings.frigate.mqtt_server:
@@ -843,6 +900,9 @@ class MQTTService:
                                 meta = self._parse_frigate_payload_meta(message.payload)
                                 if meta is not None and not meta.get("should_process", False):
                                     continue
+                                if self._dispatch_held:
+                                    self._buffer_pre_ready("frigate", message.payload, (meta or {}).get("event_id"))
+                                    continue
                                 await self._wait_for_handler_slot()
                                 self._schedule_frigate_message(
                                     event_processor,
@@ -851,8 +911,11 @@ class MQTTService:
                                 )
                             elif topic == birdnet_topic:
                                 log.info("Received MQTT message on birdnet topic", payload_len=len(message.payload))
-                                await self._wait_for_handler_slot()
-                                self._schedule_audio_message(event_processor, message.payload)
+                                if self._dispatch_held:
+                                    self._buffer_pre_ready("birdnet", message.payload, None)
+                                else:
+                                    await self._wait_for_handler_slot()
+                                    self._schedule_audio_message(event_processor, message.payload)
                                 now = self._now_monotonic()
                                 no_frigate_after_previous_reconnect = bool(
                                     self._topic_message_counts.get(frigate_topic, 0) <= 0
@@ -1011,6 +1074,8 @@ class MQTTService:
 
     async def stop(self):
         self.running = False
+        self._pre_ready_buffer.clear()
+        self._dispatch_held = False
         await self._drain_in_flight_tasks()
         self.client = None
         self._connection_started_monotonic = None
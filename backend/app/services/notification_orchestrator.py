@@ -3,7 +3,7 @@ from typing import Optional, Dict, Any
 import structlog
 
 from app.config import settings
-from app.database import get_db
+from app.database import get_db, run_batched_write
 from app.repositories.detection_repository import DetectionRepository
 from app.services.frigate_client import frigate_client
 from app.services.notification_service import notification_service
@@ -50,9 +50,7 @@ class NotificationOrchestrator:
         return settings.notifications.notify_on_update and was_updated and not already_notified, was_updated
 
     async def _mark_notified(self, event_id: str) -> None:
-        async with get_db() as db:
-            repo = DetectionRepository(db)
-            await repo.mark_notified(event_id)
+        await run_batched_write(lambda conn: DetectionRepository(conn).mark_notified(event_id))
 
     async def _get_detection(self, event_id: str):
         async with get_db() as db:
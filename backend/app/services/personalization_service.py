@@ -7,6 +7,7 @@ from typing import Optional
 import structlog
 
 from app.database import get_db
+from app.repositories.schema_snapshot import get_schema_snapshot
 
 log = structlog.get_logger()
 
@@ -177,11 +178,7 @@ class PersonalizationService:
             return 0, []
 
         async with get_db() as db:
-            async with db.execute(
-                "SELECT 1 FROM sqlite_master WHERE type='table' AND name = 'classification_feedback' LIMIT 1"
-            ) as cursor:
-                table_exists = await cursor.fetchone()
-            if not table_exists:
+            if not (await get_schema_snapshot(db)).has_table("classification_feedback"):
                 return 0, []
 
             async with db.execute(
@@ -229,11 +226,7 @@ class PersonalizationService:
         }
 
         async with get_db() as db:
-            async with db.execute(
-                "SELECT 1 FROM sqlite_master WHERE type='table' AND name = 'classification_feedback' LIMIT 1"
-            ) as cursor:
-                table_exists = await cursor.fetchone()
-            if not table_exists:
+            if not (await get_schema_snapshot(db)).has_table("classification_feedback"):
                 return summary
 
             async with db.execute("SELECT COUNT(*) FROM classification_feedback") as cursor:
@@ -0,0 +1,274 @@
+"""Persistent stale-while-revalidate cache for upstream reference data.
+
+Seasonality histograms, eBird sightings, GBIF taxon keys and BirdNET-Go
+spectrograms come from third-party APIs that are slow, rate limited or
+occasionally offline. Entries live in the ``reference_cache`` table (JSON
+inline, binary payloads as files under ``REFERENCE_CACHE_DIR``) so they
+survive restarts. Species summaries keep their own ``species_info_cache``
+table and only use the single-flight and background-refresh helpers.
+
+Each source has a TTL. A fresh entry is served as is; a stale one is served
+immediately while a single background task refreshes it; only a miss waits
+for the upstream. Concurrent misses for the same key share one fetch. Blob
+files are evicted least recently used once they exceed
+``REFERENCE_CACHE_MAX_BLOB_BYTES``. Cache storage failures never fail the
+request: the value is fetched and returned uncached.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, TypeVar
+
+import structlog
+
+from app.database import get_db
+from app.repositories.reference_cache_repository import ReferenceCacheEntry, ReferenceCacheRepository
+from app.utils.api_datetime import utc_naive_now
+from app.utils.tasks import create_background_task
+
+log = structlog.get_logger()
+
+T = TypeVar("T")
+
+REFERENCE_CACHE_DIR = Path(
+    os.getenv("REFERENCE_CACHE_DIR", str(Path(os.getenv("DATA_DIR", "/data")) / "reference_cache"))
+)
+REFERENCE_CACHE_MAX_BLOB_BYTES = max(1, int(os.environ.get("REFERENCE_CACHE_MAX_BLOB_BYTES", str(256 * 1024 * 1024))))
+# A failed background refresh is not retried for this long; the stale entry keeps being served.
+REFERENCE_CACHE_RETRY_SECONDS = max(0.0, float(os.environ.get("REFERENCE_CACHE_RETRY_SECONDS", "60")))
+# Blob hits refresh accessed_at (the eviction order) at most this often.
+REFERENCE_CACHE_TOUCH_INTERVAL = timedelta(hours=1)
+# Expired-entry pruning runs once per this many stores.
+REFERENCE_CACHE_PRUNE_EVERY = 100
+
+
+@dataclass(frozen=True)
+class ReferenceSource:
+    ttl: timedelta
+    # How long past the TTL a stale entry may still be served; None serves it indefinitely.
+    max_stale: timedelta | None = None
+
+
+REFERENCE_SOURCES: dict[str, ReferenceSource] = {
+    "inat_seasonality": ReferenceSource(ttl=timedelta(days=7)),
+    "ebird_recent": ReferenceSource(ttl=timedelta(minutes=30), max_stale=timedelta(days=2)),
+    "gbif_taxon_key": ReferenceSource(ttl=timedelta(days=7)),
+    "birdnet_spectrogram": ReferenceSource(ttl=timedelta(days=30)),
+}
+
+
+class ReferenceCacheService:
+    """Single-flight, stale-while-revalidate access to ``reference_cache``."""
+
+    def __init__(self, blob_dir: Path | None = None, max_blob_bytes: int | None = None) -> None:
+        self.blob_dir = blob_dir or REFERENCE_CACHE_DIR
+        self.max_blob_bytes = max_blob_bytes or REFERENCE_CACHE_MAX_BLOB_BYTES
+        self._inflight: dict[tuple[str, str], asyncio.Task] = {}
+        self._refresh_failed_at: dict[tuple[str, str], float] = {}
+        self._stores_since_prune = 0
+
+    async def get_json(self, source: str, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the JSON-serializable value for ``(source, key)``, fetching it on a miss."""
+
+        async def fetch_and_store() -> Any:
+            value = await fetch()
+            await self._store(source, key, payload=json.dumps(value), blob_path=None, blob_bytes=0, media_type=None)
+            return value
+
+        entry = await self._load(source, key)
+        if entry is not None and entry.payload is not None:
+            state = self._freshness(source, entry)
+            if state != "expired":
+                if state == "stale":
+                    self.refresh_in_background(source, key, fetch_and_store)
+                return json.loads(entry.payload)
+        return await self.coalesce(source, key, fetch_and_store)
+
+    async def get_blob(
+        self, source: str, key: str, fetch: Callable[[], Awaitable[tuple[bytes, str]]]
+    ) -> tuple[bytes, str]:
+        """Return ``(content, media_type)`` for a binary payload, fetching it on a miss."""
+
+        async def fetch_and_store() -> tuple[bytes, str]:
+            content, media_type = await fetch()
+            path = self._blob_path(source, key)
+            try:
+                await asyncio.to_thread(_write_atomic, path, content)
+            except OSError as exc:
+                log.warning("reference_cache_blob_write_failed", source=source, error=str(exc))
+                return content, media_type
+            await self._store(
+                source, key, payload=None, blob_path=str(path), blob_bytes=len(content), media_type=media_type
+            )
+            await self._evict_blobs()
+            return content, media_type
+
+        entry = await self._load(source, key)
+        state = self._freshness(source, entry) if entry is not None else "expired"
+        if entry is not None and entry.blob_path and state != "expired":
+            try:
+                content = await asyncio.to_thread(Path(entry.blob_path).read_bytes)
+            except OSError:
+                content = None
+            if content is not None:
+                if state == "stale":
+                    self.refresh_in_background(source, key, fetch_and_store)
+                elif utc_naive_now() - entry.accessed_at >= REFERENCE_CACHE_TOUCH_INTERVAL:
+                    await self._touch(source, key)
+                return content, entry.media_type or "application/octet-stream"
+        return await self.coalesce(source, key, fetch_and_store)
+
+    async def coalesce(self, source: str, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run ``factory`` once for concurrent callers of the same key and share its result."""
+        flight_key = (source, key)
+        task = self._inflight.get(flight_key)
+        if task is None:
+            task = self._start(flight_key, factory())
+        return await asyncio.shield(task)
+
+    def refresh_in_background(self, source: str, key: str, factory: Callable[[], Awaitable[Any]]) -> None:
+        """Refresh a stale entry without blocking the caller (no-op while one is already running)."""
+        flight_key = (source, key)
+        if flight_key in self._inflight:
+            return
+        failed_at = self._refresh_failed_at.get(flight_key)
+        if failed_at is not None and time.monotonic() - failed_at < REFERENCE_CACHE_RETRY_SECONDS:
+            return
+
+        async def refresh() -> None:
+            try:
+                await factory()
+                self._refresh_failed_at.pop(flight_key, None)
+            except Exception as exc:
+                self._refresh_failed_at[flight_key] = time.monotonic()
+                log.warning("reference_cache_refresh_failed", source=source, key=key, error=str(exc))
+
+        self._start(flight_key, refresh(), background=True)
+
+    async def invalidate(self, source: str, key: str | None = None) -> None:
+        """Drop one entry, or every entry of ``source``, with its blob files."""
+        try:
+            async with get_db() as db:
+                blob_paths = await ReferenceCacheRepository(db).delete(source, key)
+        except Exception as exc:
+            log.warning("reference_cache_invalidate_failed", source=source, error=str(exc))
+            return
+        await asyncio.to_thread(_unlink_all, blob_paths)
+
+    def _start(self, flight_key: tuple[str, str], coro: Awaitable[Any], *, background: bool = False) -> asyncio.Task:
+        name = f"reference_cache:{flight_key[0]}"
+        task = create_background_task(coro, name=name) if background else asyncio.ensure_future(coro)
+        self._inflight[flight_key] = task
+
+        def _done(finished: asyncio.Task) -> None:
+            if self._inflight.get(flight_key) is finished:
+                del self._inflight[flight_key]
+            # Every awaiting caller may have been cancelled; mark the outcome retrieved.
+            if not finished.cancelled():
+                finished.exception()
+
+        task.add_done_callback(_done)
+        return task
+
+    def _freshness(self, source: str, entry: ReferenceCacheEntry) -> str:
+        config = REFERENCE_SOURCES[source]
+        age = utc_naive_now() - entry.fetched_at
+        if age < config.ttl:
+            return "fresh"
+        if config.max_stale is None or age < config.ttl + config.max_stale:
+            return "stale"
+        return "expired"
+
+    def _blob_path(self, source: str, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.blob_dir / source / f"{digest}.bin"
+
+    async def _load(self, source: str, key: str) -> ReferenceCacheEntry | None:
+        try:
+            async with get_db() as db:
+                return await ReferenceCacheRepository(db).get(source, key)
+        except Exception as exc:
+            log.warning("reference_cache_read_failed", source=source, error=str(exc))
+            return None
+
+    async def _store(
+        self,
+        source: str,
+        key: str,
+        *,
+        payload: str | None,
+        blob_path: str | None,
+        blob_bytes: int,
+        media_type: str | None,
+    ) -> None:
+        try:
+            async with get_db() as db:
+                await ReferenceCacheRepository(db).put(
+                    source,
+                    key,
+                    payload=payload,
+                    blob_path=blob_path,
+                    blob_bytes=blob_bytes,
+                    media_type=media_type,
+                    fetched_at=utc_naive_now(),
+                )
+        except Exception as exc:
+            log.warning("reference_cache_write_failed", source=source, error=str(exc))
+            return
+        self._stores_since_prune += 1
+        if self._stores_since_prune >= REFERENCE_CACHE_PRUNE_EVERY:
+            self._stores_since_prune = 0
+            await self._prune_expired()
+
+    async def _touch(self, source: str, key: str) -> None:
+        try:
+            async with get_db() as db:
+                await ReferenceCacheRepository(db).touch(source, key, utc_naive_now())
+        except Exception as exc:
+            log.debug("reference_cache_touch_failed", source=source, error=str(exc))
+
+    async def _evict_blobs(self) -> None:
+        try:
+            async with get_db() as db:
+                blob_paths = await ReferenceCacheRepository(db).evict_blobs(self.max_blob_bytes)
+        except Exception as exc:
+            log.warning("reference_cache_evict_failed", error=str(exc))
+            return
+        if blob_paths:
+            await asyncio.to_thread(_unlink_all, blob_paths)
+            log.info("reference_cache_blobs_evicted", count=len(blob_paths))
+
+    async def _prune_expired(self) -> None:
+        now = utc_naive_now()
+        blob_paths: list[str] = []
+        try:
+            async with get_db() as db:
+                repo = ReferenceCacheRepository(db)
+                for source, config in REFERENCE_SOURCES.items():
+                    if config.max_stale is not None:
+                        blob_paths += await repo.delete_fetched_before(source, now - config.ttl - config.max_stale)
+        except Exception as exc:
+            log.warning("reference_cache_prune_failed", error=str(exc))
+        await asyncio.to_thread(_unlink_all, blob_paths)
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.{time.monotonic_ns()}.tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+
+
+def _unlink_all(paths: list[str]) -> None:
+    for path in paths:
+        Path(path).unlink(missing_ok=True)
+
+
+reference_cache = ReferenceCacheService()
@@ -5,9 +5,10 @@ from __future__ import annotations
 import json
 import os
 import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Literal, TypedDict
+from typing import Any, Literal, NotRequired, TypedDict
 
 
 StartupState = Literal["starting", "ready", "failed"]
@@ -19,6 +20,10 @@ class StartupStatusPayload(TypedDict):
     progress: int
     started_at: str
     updated_at: str
+    phase_durations_ms: dict[str, float]
+    import_profile: NotRequired[dict[str, Any]]
+    time_to_first_http_ok_ms: NotRequired[float]
+    lifecycle: NotRequired[dict[str, Any]]
 
 
 def _utc_now() -> str:
@@ -26,29 +31,47 @@ def _utc_now() -> str:
 
 
 class StartupStatusPublisher:
-    """Atomically publish bounded progress without making startup depend on it."""
+    """Atomically publish bounded progress without making startup depend on it.
+
+    Time spent in each phase is accumulated in ``phase_durations_ms`` so slow
+    boots (model compilation, worker readiness) show where the time went. The
+    web shell's import profile and the time until it first answered an HTTP
+    request with a 2xx are recorded alongside as cold-start regression metrics.
+    """
 
     def __init__(self, path: str | Path | None):
         self._path = Path(path) if path else None
         self._lock = threading.Lock()
         started_at = _utc_now()
+        self._phase_started_monotonic = time.monotonic()
+        self._origin_monotonic = self._phase_started_monotonic
         self._payload: StartupStatusPayload = {
             "status": "starting",
             "phase": "launching",
             "progress": 0,
             "started_at": started_at,
             "updated_at": started_at,
+            "phase_durations_ms": {},
         }
 
     def snapshot(self) -> StartupStatusPayload:
         with self._lock:
-            return dict(self._payload)
+            payload = dict(self._payload)
+            payload["phase_durations_ms"] = dict(self._payload["phase_durations_ms"])
+            if "import_profile" in self._payload:
+                payload["import_profile"] = dict(self._payload["import_profile"])
+            if "lifecycle" in self._payload:
+                payload["lifecycle"] = dict(self._payload["lifecycle"])
+            return payload
 
     def publish(self, phase: str, progress: int) -> None:
         with self._lock:
             if self._payload["status"] != "starting":
                 return
-            self._payload["phase"] = str(phase or "launching")
+            next_phase = str(phase or "launching")
+            if next_phase != self._payload["phase"]:
+                self._close_phase_locked()
+            self._payload["phase"] = next_phase
             self._payload["progress"] = max(self._payload["progress"], min(99, max(0, int(progress))))
             self._payload["updated_at"] = _utc_now()
             self._write_locked()
@@ -57,6 +80,8 @@ class StartupStatusPublisher:
         with self._lock:
             if self._payload["status"] == "failed":
                 return
+            if self._payload["status"] == "starting":
+                self._close_phase_locked()
             self._payload.update(
                 status="ready",
                 phase="ready",
@@ -65,10 +90,38 @@ class StartupStatusPublisher:
             )
             self._write_locked()
 
+    @property
+    def first_http_ok_recorded(self) -> bool:
+        return "time_to_first_http_ok_ms" in self._payload
+
+    def record_import_profile(self, profile: dict[str, Any], *, started_monotonic: float | None = None) -> None:
+        """Attach the import profile; ``started_monotonic`` moves the cold-start origin earlier."""
+        with self._lock:
+            if started_monotonic is not None:
+                self._origin_monotonic = min(self._origin_monotonic, float(started_monotonic))
+            self._payload["import_profile"] = dict(profile)
+            self._write_locked()
+
+    def record_lifecycle(self, report: dict[str, Any]) -> None:
+        """Attach the lifecycle graph report: per-phase timings and the critical path."""
+        with self._lock:
+            self._payload["lifecycle"] = dict(report)
+            self._write_locked()
+
+    def mark_first_http_ok(self) -> None:
+        """Record time-to-first-2xx once; later calls are no-ops."""
+        with self._lock:
+            if "time_to_first_http_ok_ms" in self._payload:
+                return
+            elapsed_ms = max(0.0, (time.monotonic() - self._origin_monotonic) * 1000.0)
+            self._payload["time_to_first_http_ok_ms"] = round(elapsed_ms, 1)
+            self._write_locked()
+
     def mark_failed(self, phase: str) -> None:
         with self._lock:
             if self._payload["status"] != "starting":
                 return
+            self._close_phase_locked()
             self._payload.update(
                 status="failed",
                 phase=str(phase or self._payload["phase"]),
@@ -76,6 +129,14 @@ class StartupStatusPublisher:
             )
             self._write_locked()
 
+    def _close_phase_locked(self) -> None:
+        now = time.monotonic()
+        phase = self._payload["phase"]
+        durations = self._payload["phase_durations_ms"]
+        elapsed_ms = max(0.0, (now - self._phase_started_monotonic) * 1000.0)
+        durations[phase] = round(durations.get(phase, 0.0) + elapsed_ms, 1)
+        self._phase_started_monotonic = now
+
     def _write_locked(self) -> None:
         if self._path is None:
             return
@@ -0,0 +1,276 @@
+"""In-memory taxonomy resolution for the active bird model's label set.
+
+The classifier can only ever emit one of its labels, so instead of resolving
+taxonomy per detection (a non-indexed ``LOWER(...)`` scan of
+``taxonomy_cache`` plus translation lookups, sometimes an iNaturalist call)
+the label list is resolved once when the bird model is loaded or reloaded.
+
+The table is an immutable mapping swapped atomically on every change, so the
+save path reads it without locks or awaits. Labels the database cache cannot
+resolve are looked up from iNaturalist in the background, one per second like
+``TaxonomyService.run_background_sync``; until then callers fall back to
+``TaxonomyService`` and ``remember`` the answer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Optional
+
+import structlog
+
+from app.config import settings
+from app.database import get_db
+from app.services.taxonomy.taxonomy_service import _parenthetical_aliases, taxonomy_service
+from app.utils.canonical_species import rewrite_label, should_hide_species_label
+
+log = structlog.get_logger()
+
+LABEL_TAXONOMY_REMOTE_LOOKUP_INTERVAL_SECONDS = max(
+    0.0, float(os.getenv("LABEL_TAXONOMY_REMOTE_LOOKUP_INTERVAL_SECONDS", "1.0"))
+)
+
+
+@dataclass(frozen=True)
+class LabelTaxonomy:
+    scientific_name: Optional[str]
+    common_name: Optional[str]
+    taxa_id: Optional[int]
+    localized_names: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+
+    def names(self) -> dict[str, Any]:
+        """Same shape as ``TaxonomyService.get_names``."""
+        return {
+            "scientific_name": self.scientific_name,
+            "common_name": self.common_name,
+            "taxa_id": self.taxa_id,
+        }
+
+
+def _key(name: str | None) -> str:
+    return str(name or "").strip().lower()
+
+
+def configured_languages() -> tuple[str, ...]:
+    """Non-English languages the save path localizes display names into."""
+    lang = str(getattr(settings.notifications, "notification_language", None) or "").strip()
+    return (lang,) if lang and lang != "en" else ()
+
+
+class LabelTaxonomyTable:
+    def __init__(self) -> None:
+        self._entries: Mapping[str, LabelTaxonomy] = MappingProxyType({})
+        self._languages: tuple[str, ...] = ()
+        self._model_key: str | None = None
+        self._labels: tuple[str, ...] = ()
+        self._loaded = False
+        self._pending: tuple[str | None, tuple[str, ...]] | None = None
+        self._started = False
+        self._task: asyncio.Task | None = None
+        self._status: dict[str, Any] = {"labels": 0, "resolved": 0, "unresolved": 0, "remote_lookups": 0}
+
+    def get(self, name: str | None) -> LabelTaxonomy | None:
+        return self._entries.get(_key(name))
+
+    def localized_name(self, entry: LabelTaxonomy | None, lang: str | None) -> Optional[str]:
+        if entry is None or not lang:
+            return None
+        return entry.localized_names.get(lang)
+
+    def remember(
+        self,
+        name: str,
+        taxonomy: Mapping[str, Any],
+        *,
+        lang: str | None = None,
+        localized: str | None = None,
+    ) -> None:
+        """Record a resolution made outside the table (copy-on-write)."""
+        key = _key(name)
+        if not key or not self._loaded or not isinstance(taxonomy, Mapping):
+            return
+        current = self._entries.get(key)
+        localized_names = dict(current.localized_names) if current else {}
+        if lang and localized:
+            localized_names[lang] = localized
+        entry = LabelTaxonomy(
+            scientific_name=taxonomy.get("scientific_name"),
+            common_name=taxonomy.get("common_name"),
+            taxa_id=taxonomy.get("taxa_id"),
+            localized_names=MappingProxyType(localized_names),
+        )
+        entries = dict(self._entries)
+        for alias in {key, _key(entry.scientific_name), _key(entry.common_name)} - {""}:
+            entries.setdefault(alias, entry)
+        entries[key] = entry
+        self._entries = MappingProxyType(entries)
+
+    def request_rebuild(self, labels: Iterable[str], *, model_key: str | None) -> None:
+        """Resolve ``labels`` for the active model; deferred until ``start`` outside the event loop."""
+        self._pending = (model_key, tuple(labels))
+        if self._started:
+            self._schedule_pending()
+
+    def refresh(self) -> None:
+        """Re-resolve the current label set, e.g. after the taxonomy cache was rewritten."""
+        if self._loaded:
+            self.request_rebuild(self._labels, model_key=self._model_key)
+
+    async def start(self) -> None:
+        self._started = True
+        self._schedule_pending()
+
+    async def stop(self) -> None:
+        self._started = False
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def status(self) -> dict[str, Any]:
+        return {
+            **self._status,
+            "loaded": self._loaded,
+            "model_key": self._model_key,
+            "languages": list(self._languages),
+        }
+
+    def _schedule_pending(self) -> None:
+        if self._pending is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        model_key, labels = self._pending
+        self._pending = None
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = loop.create_task(self.rebuild(labels, model_key=model_key), name="label_taxonomy_preload")
+
+    async def rebuild(self, labels: Iterable[str], *, model_key: str | None, resolve_remote: bool = True) -> None:
+        labels = tuple(labels)
+        queries: list[str] = []
+        seen: set[str] = set()
+        for raw in labels:
+            label = rewrite_label(raw)
+            if not _key(label) or _key(label) in seen or should_hide_species_label(label):
+                continue
+            seen.add(_key(label))
+            queries.append(label)
+        languages = configured_languages()
+        try:
+            by_name, translations = await self._load_cache(languages)
+        except Exception as exc:
+            log.warning("Label taxonomy preload failed", model_key=model_key, error=str(exc))
+            return
+
+        entries: dict[str, LabelTaxonomy] = {}
+        aliases: list[tuple[str, LabelTaxonomy]] = []
+        unresolved: list[str] = []
+        for label in queries:
+            row = by_name.get(_key(label))
+            if row is None:
+                for alias in _parenthetical_aliases(label):
+                    row = by_name.get(_key(alias)) if alias else None
+                    if row is not None:
+                        break
+            if row is None:
+                unresolved.append(label)
+                continue
+            entry = self._entry(label, row, translations)
+            entries[_key(label)] = entry
+            aliases.extend(((_key(entry.scientific_name), entry), (_key(entry.common_name), entry)))
+        # Scientific/common aliases let audio-correlation lookups hit the table
+        # too; a label never gets shadowed by another label's alias.
+        for alias, entry in aliases:
+            if alias:
+                entries.setdefault(alias, entry)
+        self._entries = MappingProxyType(entries)
+        self._languages = languages
+        self._model_key = model_key
+        self._labels = labels
+        self._loaded = True
+        self._status = {
+            "labels": len(queries),
+            "resolved": len(queries) - len(unresolved),
+            "unresolved": len(unresolved),
+            "remote_lookups": 0,
+        }
+        log.info(
+            "Label taxonomy table loaded",
+            model_key=model_key,
+            labels=len(queries),
+            unresolved=len(unresolved),
+            languages=list(languages),
+        )
+        if resolve_remote:
+            await self._resolve_remote(unresolved, languages)
+
+    async def _resolve_remote(self, labels: list[str], languages: tuple[str, ...]) -> None:
+        for label in labels:
+            if self.get(label) is not None:
+                continue
+            try:
+                taxonomy = await taxonomy_service.get_names(label)
+                self.remember(label, taxonomy)
+                taxa_id = taxonomy.get("taxa_id") if isinstance(taxonomy, dict) else None
+                for lang in languages if taxa_id else ():
+                    localized = await taxonomy_service.get_localized_common_name(taxa_id, lang)
+                    if localized:
+                        self.remember(label, taxonomy, lang=lang, localized=localized)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                log.debug("Label taxonomy remote lookup failed", label=label, error=str(exc))
+            self._status["remote_lookups"] += 1
+            self._status["unresolved"] = max(0, self._status["unresolved"] - 1)
+            await asyncio.sleep(LABEL_TAXONOMY_REMOTE_LOOKUP_INTERVAL_SECONDS)
+
+    async def _load_cache(
+        self, languages: tuple[str, ...]
+    ) -> tuple[dict[str, tuple[Any, ...]], dict[int, dict[str, str]]]:
+        by_name: dict[str, tuple[Any, ...]] = {}
+        translations: dict[int, dict[str, str]] = {}
+        async with get_db() as db:
+            async with db.execute(
+                "SELECT scientific_name, common_name, taxa_id, is_not_found FROM taxonomy_cache"
+            ) as cursor:
+                rows = await cursor.fetchall()
+            if languages:
+                placeholders = ",".join("?" for _ in languages)
+                async with db.execute(
+                    f"SELECT taxa_id, language_code, common_name FROM taxonomy_translations "
+                    f"WHERE language_code IN ({placeholders})",
+                    languages,
+                ) as cursor:
+                    for taxa_id, lang, common_name in await cursor.fetchall():
+                        if taxa_id is not None and common_name:
+                            translations.setdefault(int(taxa_id), {})[str(lang)] = str(common_name)
+        for row in rows:
+            for name in (row[0], row[1]):
+                if _key(name):
+                    by_name.setdefault(_key(name), tuple(row))
+        return by_name, translations
+
+    @staticmethod
+    def _entry(label: str, row: tuple[Any, ...], translations: dict[int, dict[str, str]]) -> LabelTaxonomy:
+        if row[3]:
+            # Cached "not found": mirror TaxonomyService.get_names.
+            return LabelTaxonomy(scientific_name=label, common_name=None, taxa_id=None)
+        taxa_id = int(row[2]) if row[2] is not None else None
+        return LabelTaxonomy(
+            scientific_name=row[0],
+            common_name=row[1],
+            taxa_id=taxa_id,
+            localized_names=MappingProxyType(dict(translations.get(taxa_id, {})) if taxa_id is not None else {}),
+        )
+
+
+label_taxonomy_table = LabelTaxonomyTable()
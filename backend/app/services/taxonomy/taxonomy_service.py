@@ -275,6 +275,28 @@ class TaxonomyService:
                 return row[0]
         return None
 
+    async def load_cached_common_names(self, db: aiosqlite.Connection, lang: str) -> dict[int, str]:
+        """taxa_id -> common name for ``lang`` from the local caches only (no iNaturalist calls).
+
+        English names come from taxonomy_cache; other languages overlay
+        taxonomy_translations, so untranslated taxa keep their English name.
+        """
+        names: dict[int, str] = {}
+        async with db.execute(
+            "SELECT taxa_id, common_name FROM taxonomy_cache "
+            "WHERE taxa_id IS NOT NULL AND is_not_found = 0 AND common_name IS NOT NULL"
+        ) as cursor:
+            async for row in cursor:
+                names.setdefault(int(row[0]), str(row[1]))
+        if lang != "en":
+            async with db.execute(
+                "SELECT taxa_id, common_name FROM taxonomy_translations WHERE language_code = ?", (lang,)
+            ) as cursor:
+                async for row in cursor:
+                    if row[1]:
+                        names[int(row[0])] = str(row[1])
+        return names
+
     async def _save_translation_to_cache(
         self, taxa_id: int, lang: str, common_name: str, db: Optional[aiosqlite.Connection] = None
     ):
@@ -493,6 +515,10 @@ class TaxonomyService:
             self._sync_status["current_item"] = "Completed"
             self._sync_status["is_running"] = False
 
+            from app.services.taxonomy.label_taxonomy_table import label_taxonomy_table
+
+            label_taxonomy_table.refresh()
+
         except Exception as e:
             log.error("Taxonomy sync failed", error=str(e))
             self._sync_status["error"] = str(e)
@@ -7,8 +7,9 @@ import statistics
 from collections import Counter
 from dataclasses import dataclass
 from typing import Iterable
+from app.utils.lazy_imports import lazy_module
 
-import numpy as np
+np = lazy_module("numpy")
 
 
 VIDEO_MIN_EVALUATED_FRAMES = 3
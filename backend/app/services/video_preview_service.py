@@ -7,9 +7,12 @@ from io import BytesIO
 from math import ceil
 from pathlib import Path
 
-import cv2
 import structlog
-from PIL import Image
+from app.services.event_track_index import EventTrackIndex
+from app.utils.lazy_imports import lazy_module
+
+cv2 = lazy_module("cv2")
+Image = lazy_module("PIL.Image")
 
 log = structlog.get_logger()
 
@@ -39,7 +42,29 @@ class VideoPreviewService:
         candidate = int(duration_seconds // 3)
         return max(self.min_frames, min(self.max_frames, candidate))
 
-    def generate(self, clip_path: Path) -> tuple[bytes, list[PreviewCue]]:
+    def _track_aligned_timestamps(
+        self,
+        timestamps: list[float],
+        duration: float,
+        track_index: EventTrackIndex | None,
+    ) -> list[float]:
+        """Move each tile within its own cue slot towards a moment where the bird is in view."""
+        if track_index is None or track_index.start_time is None or len(timestamps) < 2:
+            return timestamps
+        reach = duration / (len(timestamps) - 1) / 2.0
+        return [
+            min(
+                duration,
+                track_index.nearest_visible_offset(t, clip_start=track_index.start_time, max_distance_seconds=reach),
+            )
+            for t in timestamps
+        ]
+
+    def generate(
+        self,
+        clip_path: Path,
+        track_index: EventTrackIndex | None = None,
+    ) -> tuple[bytes, list[PreviewCue]]:
         cap = cv2.VideoCapture(str(clip_path))
         if not cap.isOpened():
             raise ValueError(f"Unable to open clip for previews: {clip_path}")
@@ -59,6 +84,7 @@ class VideoPreviewService:
                 for i in range(target_frames):
                     t = (duration * i) / (target_frames - 1)
                     timestamps.append(max(0.0, min(duration, t)))
+                timestamps = self._track_aligned_timestamps(timestamps, duration, track_index)
 
             rgb_frames: list[Image.Image] = []
             accepted_timestamps: list[float] = []
@@ -1,9 +1,13 @@
 """Synchronous image decoding helpers intended for ``asyncio.to_thread`` calls."""
 
+from __future__ import annotations
+
 from io import BytesIO
 from pathlib import Path
 
-from PIL import Image
+from app.utils.lazy_imports import lazy_module
+
+Image = lazy_module("PIL.Image")
 
 
 def decode_image_bytes(contents: bytes, *, convert_rgb: bool = False) -> Image.Image:
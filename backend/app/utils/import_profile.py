@@ -0,0 +1,153 @@
+"""In-process import-time profile of the web shell's cold start.
+
+``app.main`` starts the profiler before anything else and stops it once its
+module-level imports are done; the report is published through
+``startup_status``. It always carries the total import time, the number of
+modules loaded and which heavy inference stacks were imported, so accidentally
+eager imports are visible on every boot.
+
+With ``YA_WAMF_IMPORT_PROFILE=1`` every import statement that loads a new
+module is also timed (cumulative and self time, like the columns of
+``python -X importtime``). That tracing wraps ``builtins.__import__``, which
+makes the hook the reported location of import-time warnings, so it is off
+unless explicitly enabled.
+"""
+
+from __future__ import annotations
+
+import builtins
+import importlib.util
+import os
+import sys
+import threading
+import time
+from typing import Any
+
+# Stacks whose import at web-shell boot is a cold-start regression: the web
+# process only needs them once an image is decoded or a model runs.
+HEAVY_MODULES = (
+    "numpy",
+    "cv2",
+    "PIL.Image",
+    "onnxruntime",
+    "openvino",
+    "tflite_runtime",
+    "ai_edge_litert",
+    "tensorflow",
+    "torch",
+)
+
+IMPORT_PROFILE_TOP_N = 15
+IMPORT_PROFILE_TRACE = os.environ.get("YA_WAMF_IMPORT_PROFILE", "").strip() == "1"
+
+
+def _resolve_name(name: str, globals_: Any, level: int) -> str:
+    if level <= 0:
+        return name
+    package = (globals_ or {}).get("__package__") or (globals_ or {}).get("__name__", "")
+    try:
+        return importlib.util.resolve_name("." * level + name, package)
+    except (ImportError, ValueError):
+        return name
+
+
+def _pending_submodule(package_name: str, fromlist: Any) -> str | None:
+    package = sys.modules.get(package_name)
+    if not fromlist or not hasattr(package, "__path__"):
+        return None
+    for item in fromlist:
+        if item != "*" and f"{package_name}.{item}" not in sys.modules and not hasattr(package, item):
+            return f"{package_name}.{item}"
+    return None
+
+
+class ImportProfiler:
+    def __init__(self, *, top_n: int = IMPORT_PROFILE_TOP_N) -> None:
+        self.top_n = max(1, int(top_n))
+        self.started_monotonic: float | None = None
+        self.traced = False
+        self._baseline_module_count = 0
+        self._running = False
+        self._original_import: Any = None
+        self._hook: Any = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._records: list[tuple[str, float, float]] = []
+        self._elapsed_s = 0.0
+        self._report: dict[str, Any] | None = None
+
+    @property
+    def active(self) -> bool:
+        return self._running
+
+    def start(self, *, trace: bool = True) -> None:
+        """Start timing; ``trace`` also times each import through an ``__import__`` hook."""
+        if self.active:
+            return
+        self._running = True
+        self.traced = bool(trace)
+        self.started_monotonic = time.monotonic()
+        self._baseline_module_count = len(sys.modules)
+        if self.traced:
+            self._original_import = builtins.__import__
+            self._hook = self._profiled_import
+            builtins.__import__ = self._hook
+
+    def stop(self) -> dict[str, Any]:
+        """Uninstall the hook and return the report (idempotent)."""
+        if self.active:
+            if self._hook is not None and builtins.__import__ is self._hook:
+                builtins.__import__ = self._original_import
+            self._hook = None
+            self._running = False
+            self._elapsed_s = time.monotonic() - (self.started_monotonic or time.monotonic())
+            self._report = self._build_report()
+        return dict(self._report or self._build_report())
+
+    def _profiled_import(self, name: str, globals=None, locals=None, fromlist=(), level: int = 0):
+        original = self._original_import
+        resolved = _resolve_name(name, globals, level)
+        if self._hook is None:
+            return original(name, globals, locals, fromlist, level)
+        if resolved in sys.modules:
+            # ``from package import submodule`` loads through the same call.
+            resolved = _pending_submodule(resolved, fromlist)
+            if resolved is None:
+                return original(name, globals, locals, fromlist, level)
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        frame = [0.0]
+        stack.append(frame)
+        started = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - started
+            stack.pop()
+            if stack:
+                stack[-1][0] += elapsed
+            with self._lock:
+                self._records.append((resolved, elapsed, max(0.0, elapsed - frame[0])))
+
+    def _build_report(self) -> dict[str, Any]:
+        with self._lock:
+            records = list(self._records)
+        slowest = sorted(records, key=lambda record: record[1], reverse=True)[: self.top_n]
+        modules_imported = len(records) if self.traced else max(0, len(sys.modules) - self._baseline_module_count)
+        return {
+            "total_ms": round(self._elapsed_s * 1000.0, 1),
+            "traced": self.traced,
+            "modules_imported": modules_imported,
+            "slowest": [
+                {"module": module, "cumulative_ms": round(cumulative * 1000.0, 1), "self_ms": round(own * 1000.0, 1)}
+                for module, cumulative, own in slowest
+            ],
+            "heavy_modules_loaded": [module for module in HEAVY_MODULES if module in sys.modules],
+        }
+
+
+# Imported first by ``app.main``; profiling starts here so every later
+# module-level import of the web shell is covered.
+startup_import_profiler = ImportProfiler()
+startup_import_profiler.start(trace=IMPORT_PROFILE_TRACE)
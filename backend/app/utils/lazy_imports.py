@@ -0,0 +1,76 @@
+"""Deferred imports for the image and numeric stacks.
+
+The web shell imports most services at boot, but numpy, OpenCV and Pillow are
+only needed once an image is decoded or a model runs — and in subprocess mode
+that happens in ``classifier_worker_process``. ``lazy_module`` returns a
+stand-in that performs the real import on first attribute access, so a module
+can keep writing ``np.asarray(...)`` without paying for numpy at import time.
+
+Modules using these stand-ins need ``from __future__ import annotations`` (or
+quoted annotations) so signatures do not resolve ``np.ndarray`` at import.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from typing import Any
+
+_MISSING = object()
+
+
+class LazyModule(types.ModuleType):
+    """Module stand-in that imports ``target`` on first attribute access.
+
+    Attribute reads delegate to the real module (nothing is copied), so
+    patching the real module in tests stays visible through the stand-in.
+    Setting an attribute on the stand-in stores a shadow in its own
+    ``__dict__`` (read before any delegation) without importing anything;
+    restoring the real module's value drops the shadow again.
+    """
+
+    def __init__(self, target: str) -> None:
+        super().__init__(target)
+        self.__dict__["_lazy_target"] = target
+
+    def _load(self) -> types.ModuleType:
+        target = self.__dict__["_lazy_target"]
+        module = sys.modules.get(target)
+        if module is None:
+            module = importlib.import_module(target)
+        return module
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") and name.endswith("__") and name not in {"__version__", "__file__", "__path__"}:
+            raise AttributeError(name)
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Only an already-imported module can be holding this value; never import to find out.
+        module = sys.modules.get(self.__dict__["_lazy_target"])
+        if module is not None and value is getattr(module, name, _MISSING):
+            self.__dict__.pop(name, None)
+        else:
+            self.__dict__[name] = value
+
+    def __delattr__(self, name: str) -> None:
+        if self.__dict__.pop(name, _MISSING) is _MISSING:
+            raise AttributeError(name)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        target = self.__dict__["_lazy_target"]
+        state = "loaded" if target in sys.modules else "deferred"
+        return f"<lazy module {target!r} ({state})>"
+
+
+def lazy_module(target: str) -> Any:
+    """Return an already-imported module, or a stand-in that imports it on first use."""
+    return sys.modules.get(target) or LazyModule(target)
+
+
+def is_loaded(target: str) -> bool:
+    return target in sys.modules
@@ -0,0 +1,91 @@
+"""Add covering/partial indexes for the detections hot queries.
+
+Every dashboard, events and leaderboard query filters out hidden detections
+with ``(is_hidden = 0 OR is_hidden IS NULL)`` and then ranges or orders on
+``detection_time``. SQLite answered that by OR-ing two lookups on
+``idx_detections_hidden`` and sorting the result in a temp B-tree. The partial
+index below carries exactly the visible rows, ordered by time, and covers the
+columns the leaderboard/timeline aggregates and visible counts read, so those
+queries never touch the table. ``idx_detections_hidden`` is replaced by a
+partial index over the (few) hidden rows: left in place, a stale or sampled
+statistic is enough for the planner to go back to the OR plan.
+
+Revision ID: a3b4c5d6e7f9
+Revises: f0a1b2c3d4e5
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "a3b4c5d6e7f9"
+down_revision: Union[str, None] = "f0a1b2c3d4e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VISIBLE_PREDICATE = "(is_hidden = 0 OR is_hidden IS NULL)"
+# is_hidden is repeated as the last column so a visible-rows COUNT is covered.
+VISIBLE_TIME_COLUMNS = [
+    "detection_time",
+    "taxa_id",
+    "scientific_name",
+    "display_name",
+    "common_name",
+    "score",
+    "camera_name",
+    "is_hidden",
+]
+
+
+def _indexes(table: str) -> set[str]:
+    rows = op.get_bind().execute(sa.text(f"PRAGMA index_list({table})")).fetchall()
+    return {row[1] for row in rows}
+
+
+def _columns(table: str) -> set[str]:
+    rows = op.get_bind().execute(sa.text(f"PRAGMA table_info({table})")).fetchall()
+    return {row[1] for row in rows}
+
+
+def upgrade() -> None:
+    if "idx_detections_visible_time" not in _indexes("detections"):
+        op.create_index(
+            "idx_detections_visible_time",
+            "detections",
+            VISIBLE_TIME_COLUMNS,
+            sqlite_where=sa.text(VISIBLE_PREDICATE),
+        )
+    if "idx_detections_hidden_time" not in _indexes("detections"):
+        op.create_index(
+            "idx_detections_hidden_time",
+            "detections",
+            ["detection_time"],
+            sqlite_where=sa.text("is_hidden = 1"),
+        )
+    if "idx_detections_hidden" in _indexes("detections"):
+        op.drop_index("idx_detections_hidden", table_name="detections")
+    if "canonical_key" in _columns("species_daily_rollup") and "idx_species_rollup_canonical_date" not in _indexes(
+        "species_daily_rollup"
+    ):
+        op.create_index(
+            "idx_species_rollup_canonical_date",
+            "species_daily_rollup",
+            ["canonical_key", "rollup_date"],
+        )
+    # Fresh statistics for the new indexes; the pool keeps them current afterwards.
+    op.execute("ANALYZE detections")
+    op.execute("ANALYZE species_daily_rollup")
+
+
+def downgrade() -> None:
+    if "idx_species_rollup_canonical_date" in _indexes("species_daily_rollup"):
+        op.drop_index("idx_species_rollup_canonical_date", table_name="species_daily_rollup")
+    if "idx_detections_hidden" not in _indexes("detections"):
+        op.create_index("idx_detections_hidden", "detections", ["is_hidden"])
+    if "idx_detections_hidden_time" in _indexes("detections"):
+        op.drop_index("idx_detections_hidden_time", table_name="detections")
+    if "idx_detections_visible_time" in _indexes("detections"):
+        op.drop_index("idx_detections_visible_time", table_name="detections")
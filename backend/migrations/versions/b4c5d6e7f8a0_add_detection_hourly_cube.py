@@ -0,0 +1,181 @@
+"""Add the hourly UTC activity cube.
+
+Timelines, the activity heatmap and the daily summary grouped raw
+``detections`` rows by hour on every request; an "all" span read the whole
+table. ``detection_hourly_cube`` holds one row per (UTC hour, canonical
+species, camera) with the visible detection count, the sum and count of
+non-null scores (so averages skip unscored rows, as ``AVG`` did) and the
+score max, and is kept current by triggers on ``detections`` so every write path
+(pipeline upserts, manual tags, hide/unhide, deletes, timezone repair)
+updates it in the same transaction.
+
+The canonical key is derived from the row alone
+(taxa_id, else scientific name, else display name) so a delete always lands
+on the bucket its insert incremented. ``score_max`` is not invertible: when
+a removed row may have held the max, the trigger recomputes it from the
+bucket's remaining rows, which the camera/time index keeps to an hour of one
+camera.
+
+Revision ID: b4c5d6e7f8a0
+Revises: a3b4c5d6e7f9
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "b4c5d6e7f8a0"
+down_revision: Union[str, None] = "a3b4c5d6e7f9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGGERS = (
+    "trg_detection_hourly_cube_insert",
+    "trg_detection_hourly_cube_update",
+    "trg_detection_hourly_cube_delete",
+)
+
+
+def _bucket(row: str) -> str:
+    return f"strftime('%Y-%m-%d %H:00:00', {row}.detection_time)"
+
+
+def _key(row: str) -> str:
+    return f"COALESCE(CAST({row}.taxa_id AS TEXT), LOWER({row}.scientific_name), LOWER({row}.display_name), '')"
+
+
+def _camera(row: str) -> str:
+    return f"COALESCE({row}.camera_name, '')"
+
+
+def _visible(row: str) -> str:
+    return f"({row}.is_hidden = 0 OR {row}.is_hidden IS NULL) AND {row}.detection_time IS NOT NULL"
+
+
+def _scored(row: str) -> str:
+    return f"({row}.score IS NOT NULL)"
+
+
+def _same_bucket(row: str) -> str:
+    return f"bucket_hour = {_bucket(row)} AND canonical_key = {_key(row)} AND camera_name = {_camera(row)}"
+
+
+def _add(row: str) -> str:
+    return f"""
+        INSERT INTO detection_hourly_cube
+            (bucket_hour, canonical_key, camera_name, detection_count, score_sum, score_count, score_max)
+        SELECT {_bucket(row)}, {_key(row)}, {_camera(row)}, 1, COALESCE({row}.score, 0), {_scored(row)},
+               COALESCE({row}.score, 0)
+        WHERE {_visible(row)}
+        ON CONFLICT (bucket_hour, canonical_key, camera_name) DO UPDATE SET
+            detection_count = detection_count + 1,
+            score_sum = score_sum + excluded.score_sum,
+            score_count = score_count + excluded.score_count,
+            score_max = MAX(score_max, excluded.score_max);
+    """
+
+
+def _remove(row: str) -> str:
+    # Runs after the row is gone (or changed), so the max is recomputed from what remains.
+    remaining_max = f"""
+        SELECT COALESCE(MAX(COALESCE(d.score, 0)), 0)
+        FROM detections d
+        WHERE d.camera_name IS {row}.camera_name
+          AND d.detection_time >= {_bucket(row)}
+          AND d.detection_time < datetime({_bucket(row)}, '+1 hour')
+          AND {_visible("d")}
+          AND {_bucket("d")} = {_bucket(row)}
+          AND {_key("d")} = {_key(row)}
+    """
+    return f"""
+        UPDATE detection_hourly_cube SET
+            detection_count = detection_count - 1,
+            score_sum = score_sum - COALESCE({row}.score, 0),
+            score_count = score_count - {_scored(row)}
+        WHERE {_same_bucket(row)} AND {_visible(row)};
+        DELETE FROM detection_hourly_cube
+        WHERE {_same_bucket(row)} AND detection_count <= 0;
+        UPDATE detection_hourly_cube SET score_max = ({remaining_max})
+        WHERE {_same_bucket(row)} AND {_visible(row)} AND score_max <= COALESCE({row}.score, 0);
+    """
+
+
+def _tables() -> set[str]:
+    rows = op.get_bind().execute(sa.text("SELECT name FROM sqlite_master WHERE type = 'table'")).fetchall()
+    return {row[0] for row in rows}
+
+
+def upgrade() -> None:
+    if "detection_hourly_cube" not in _tables():
+        op.create_table(
+            "detection_hourly_cube",
+            sa.Column("bucket_hour", sa.Text(), nullable=False),
+            sa.Column("canonical_key", sa.Text(), nullable=False),
+            sa.Column("camera_name", sa.Text(), nullable=False),
+            sa.Column("detection_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("score_sum", sa.Float(), nullable=False, server_default="0"),
+            sa.Column("score_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("score_max", sa.Float(), nullable=False, server_default="0"),
+            sa.PrimaryKeyConstraint("bucket_hour", "canonical_key", "camera_name"),
+        )
+
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.execute(
+        f"""
+        CREATE TRIGGER trg_detection_hourly_cube_insert AFTER INSERT ON detections
+        BEGIN
+            {_add("NEW")}
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER trg_detection_hourly_cube_update
+        AFTER UPDATE OF detection_time, score, display_name, scientific_name, taxa_id, camera_name, is_hidden
+        ON detections
+        WHEN OLD.detection_time IS NOT NEW.detection_time
+          OR OLD.score IS NOT NEW.score
+          OR OLD.display_name IS NOT NEW.display_name
+          OR OLD.scientific_name IS NOT NEW.scientific_name
+          OR OLD.taxa_id IS NOT NEW.taxa_id
+          OR OLD.camera_name IS NOT NEW.camera_name
+          OR OLD.is_hidden IS NOT NEW.is_hidden
+        BEGIN
+            {_add("NEW")}
+            {_remove("OLD")}
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER trg_detection_hourly_cube_delete AFTER DELETE ON detections
+        BEGIN
+            {_remove("OLD")}
+        END
+        """
+    )
+
+    op.execute("DELETE FROM detection_hourly_cube")
+    op.execute(
+        f"""
+        INSERT INTO detection_hourly_cube
+            (bucket_hour, canonical_key, camera_name, detection_count, score_sum, score_count, score_max)
+        SELECT {_bucket("d")}, {_key("d")}, {_camera("d")}, COUNT(*),
+               SUM(COALESCE(d.score, 0)), COUNT(d.score), MAX(COALESCE(d.score, 0))
+        FROM detections d
+        WHERE {_visible("d")}
+        GROUP BY 1, 2, 3
+        """
+    )
+    op.execute("ANALYZE detection_hourly_cube")
+
+
+def downgrade() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    if "detection_hourly_cube" in _tables():
+        op.drop_table("detection_hourly_cube")
@@ -0,0 +1,60 @@
+"""Add the persistent reference-data cache.
+
+iNaturalist seasonality, eBird recent/notable sightings, GBIF taxon keys and
+BirdNET-Go spectrograms were fetched from upstream on every request and only
+ever cached in process memory, so a restart or an upstream outage emptied
+them. ``reference_cache`` keeps one row per (source, key): JSON payloads
+inline, binary payloads as files on disk referenced by ``blob_path``.
+``accessed_at`` drives size-bounded eviction of the blobs.
+
+Revision ID: c5d6e7f8a9b1
+Revises: b4c5d6e7f8a0
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "c5d6e7f8a9b1"
+down_revision: Union[str, None] = "b4c5d6e7f8a0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _tables() -> set[str]:
+    rows = op.get_bind().execute(sa.text("SELECT name FROM sqlite_master WHERE type = 'table'")).fetchall()
+    return {row[0] for row in rows}
+
+
+def upgrade() -> None:
+    if "reference_cache" in _tables():
+        return
+    op.create_table(
+        "reference_cache",
+        sa.Column("source", sa.Text(), nullable=False),
+        sa.Column("cache_key", sa.Text(), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=True),
+        sa.Column("blob_path", sa.Text(), nullable=True),
+        sa.Column("blob_bytes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("media_type", sa.Text(), nullable=True),
+        sa.Column("fetched_at", sa.TIMESTAMP(), nullable=False),
+        sa.Column("accessed_at", sa.TIMESTAMP(), nullable=False),
+        sa.PrimaryKeyConstraint("source", "cache_key"),
+    )
+    op.create_index("idx_reference_cache_fetched", "reference_cache", ["source", "fetched_at"])
+    op.create_index(
+        "idx_reference_cache_blob_access",
+        "reference_cache",
+        ["accessed_at"],
+        sqlite_where=sa.text("blob_path IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    if "reference_cache" in _tables():
+        op.drop_index("idx_reference_cache_blob_access", table_name="reference_cache")
+        op.drop_index("idx_reference_cache_fetched", table_name="reference_cache")
+        op.drop_table("reference_cache")
@@ -0,0 +1,60 @@
+"""Record AI job identity and timing on ai_usage_log rows.
+
+AI provider calls now run through a queue. Each usage row carries the job it
+belongs to, how long the job waited for a provider slot and how long the
+provider call took, so per-job token usage and throughput can be reported.
+
+Revision ID: d6e7f8a9b0c2
+Revises: c5d6e7f8a9b1
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "d6e7f8a9b0c2"
+down_revision: Union[str, None] = "c5d6e7f8a9b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JOB_COLUMNS = ("job_id", "queue_ms", "duration_ms")
+
+
+def _columns(table: str) -> set[str]:
+    rows = op.get_bind().execute(sa.text(f"PRAGMA table_info({table})")).fetchall()
+    return {row[1] for row in rows}
+
+
+def _indexes(table: str) -> set[str]:
+    rows = op.get_bind().execute(sa.text(f"PRAGMA index_list({table})")).fetchall()
+    return {row[1] for row in rows}
+
+
+def upgrade() -> None:
+    columns = _columns("ai_usage_log")
+    if "job_id" not in columns:
+        op.add_column("ai_usage_log", sa.Column("job_id", sa.Text(), nullable=True))
+    if "queue_ms" not in columns:
+        op.add_column("ai_usage_log", sa.Column("queue_ms", sa.Integer(), nullable=True))
+    if "duration_ms" not in columns:
+        op.add_column("ai_usage_log", sa.Column("duration_ms", sa.Integer(), nullable=True))
+    if "idx_ai_usage_job" not in _indexes("ai_usage_log"):
+        op.create_index(
+            "idx_ai_usage_job",
+            "ai_usage_log",
+            ["timestamp", "job_id"],
+            sqlite_where=sa.text("job_id IS NOT NULL"),
+        )
+
+
+def downgrade() -> None:
+    if "idx_ai_usage_job" in _indexes("ai_usage_log"):
+        op.drop_index("idx_ai_usage_job", table_name="ai_usage_log")
+    columns = _columns("ai_usage_log")
+    with op.batch_alter_table("ai_usage_log", schema=None) as batch_op:
+        for column in JOB_COLUMNS:
+            if column in columns:
+                batch_op.drop_column(column)
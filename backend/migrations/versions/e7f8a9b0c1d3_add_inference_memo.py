@@ -0,0 +1,53 @@
+"""Add the persistent inference memo.
+
+Reprocessing jobs (analyze unknowns, manual reclassification, restored video
+jobs, backfill) re-ran the classifier on media whose bytes had not changed
+since the last run. ``inference_memo`` keeps the compact top-k result per
+(media content hash, model artifact hash, preprocessing/crop policy hash) so
+those jobs only re-infer when the input or the model changed.
+``accessed_at`` drives the size-bounded eviction.
+
+Revision ID: e7f8a9b0c1d3
+Revises: d6e7f8a9b0c2
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "e7f8a9b0c1d3"
+down_revision: Union[str, None] = "d6e7f8a9b0c2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _tables() -> set[str]:
+    rows = op.get_bind().execute(sa.text("SELECT name FROM sqlite_master WHERE type = 'table'")).fetchall()
+    return {row[0] for row in rows}
+
+
+def upgrade() -> None:
+    if "inference_memo" in _tables():
+        return
+    op.create_table(
+        "inference_memo",
+        sa.Column("media_sha256", sa.Text(), nullable=False),
+        sa.Column("model_sha256", sa.Text(), nullable=False),
+        sa.Column("policy_sha256", sa.Text(), nullable=False),
+        sa.Column("kind", sa.Text(), nullable=False),
+        sa.Column("results", sa.Text(), nullable=False),
+        sa.Column("diagnostics", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.TIMESTAMP(), nullable=False),
+        sa.Column("accessed_at", sa.TIMESTAMP(), nullable=False),
+        sa.PrimaryKeyConstraint("media_sha256", "model_sha256", "policy_sha256"),
+    )
+    op.create_index("idx_inference_memo_accessed", "inference_memo", ["accessed_at"])
+
+
+def downgrade() -> None:
+    if "inference_memo" in _tables():
+        op.drop_index("idx_inference_memo_accessed", table_name="inference_memo")
+        op.drop_table("inference_memo")
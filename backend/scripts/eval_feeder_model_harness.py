@@ -620,10 +620,11 @@ async def temporary_model_settings(
     classification = settings.classification
     original_region_override = getattr(classification, "bird_model_region_override", "auto")
 
+    # Process-local selection only: the harness must never rewrite the
+    # persisted active model that the live service restarts with.
     if model_id and model_id != original_active_model_id:
-        activated = await model_manager.activate_model(model_id)
-        if not activated:
-            raise RuntimeError(f"model is not installed or cannot be activated: {model_id}")
+        if not model_manager.select_model_for_process(model_id):
+            raise RuntimeError(f"model is not installed or cannot be selected: {model_id}")
 
     crop_model_overrides = dict(original_crop_model_overrides)
     crop_source_overrides = dict(original_crop_source_overrides)
@@ -642,8 +643,8 @@ async def temporary_model_settings(
         model_manager._diagnostic_crop_model_overrides = original_crop_model_overrides
         model_manager._diagnostic_crop_source_overrides = original_crop_source_overrides
         classification.bird_model_region_override = original_region_override
-        if original_active_model_id and getattr(model_manager, "active_model_id", None) != original_active_model_id:
-            await model_manager.activate_model(original_active_model_id)
+        if original_active_model_id:
+            model_manager.active_model_id = original_active_model_id
 
 
 def _write_outputs(rows: list[FeederEvalResult], output_dir: Path) -> None:
@@ -700,7 +701,9 @@ async def run_harness(
                 source_mode=source_mode,
                 region_override=region_override,
             ):
-                classifier = ClassifierService()
+                # Load the candidate in this process; supervised workers would
+                # read the persisted selection instead of the one above.
+                classifier = ClassifierService(worker_process_mode=True)
                 try:
                     for case in cases:
                         mode_rows.append(
@@ -52,6 +52,12 @@ try:
 except ImportError:
     ORT_AVAILABLE = False
 
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(_BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(_BACKEND_DIR))
+
+from app.services.eval.tensor_cache import PreprocessedTensorCache, image_key  # noqa: E402
+
 
 # ---------------------------------------------------------------------------
 # Preprocessing helpers
@@ -77,6 +83,15 @@ def _resize_direct(img: Image.Image, size: int) -> Image.Image:
     return img.resize((size, size), Image.BICUBIC)
 
 
+def preprocessing_plan(config: dict) -> dict[str, Any]:
+    """Inputs ``preprocess_image`` depends on; the tensor-cache key for a model."""
+    return {
+        "pipeline": "eval_model_accuracy.preprocess_image",
+        "input_size": config.get("input_size", 224),
+        "preprocessing": config.get("preprocessing", {}),
+    }
+
+
 def preprocess_image(img_path: Path, config: dict) -> np.ndarray:
     """Preprocess a single image according to model_config.json parameters."""
     pre = config.get("preprocessing", {})
@@ -244,8 +259,9 @@ def download_cub200(dest_dir: Path) -> None:
 
 
 class ModelEvaluator:
-    def __init__(self, model_dir: Path) -> None:
+    def __init__(self, model_dir: Path, tensor_cache: PreprocessedTensorCache | None = None) -> None:
         self.model_dir = model_dir
+        self.tensor_cache = tensor_cache
         config_path = model_dir / "model_config.json"
         labels_path = model_dir / "labels.txt"
         model_path = model_dir / "model.onnx"
@@ -267,6 +283,7 @@ class ModelEvaluator:
         so.inter_op_num_threads = 2
         self.session = ort.InferenceSession(str(model_path), so, providers=providers)
         self.input_name = self.session.get_inputs()[0].name
+        self.plan = preprocessing_plan(self.config)
 
         print(f"Loaded model: {model_dir.name}")
         print(f"  Labels: {len(self.labels)}, Input: {self.config.get('input_size')}px")
@@ -274,8 +291,7 @@ class ModelEvaluator:
 
     def predict(self, img_path: Path) -> tuple[list[str], list[float]]:
         """Return top-5 (label, score) pairs."""
-        tensor = preprocess_image(img_path, self.config)
-        outputs = self.session.run(None, {self.input_name: tensor})[0][0]
+        outputs = self.session.run(None, {self.input_name: self._input_tensor(img_path)})[0][0]
         # Softmax
         exp = np.exp(outputs - outputs.max())
         probs = exp / exp.sum()
@@ -285,6 +301,16 @@ class ModelEvaluator:
             [float(probs[i]) for i in top5_idx],
         )
 
+    def _input_tensor(self, img_path: Path) -> np.ndarray:
+        if self.tensor_cache is None:
+            return preprocess_image(img_path, self.config)
+        key = image_key(img_path)
+        tensor = self.tensor_cache.get(key, self.plan)
+        if tensor is None:
+            tensor = preprocess_image(img_path, self.config)
+            self.tensor_cache.put(key, self.plan, tensor)
+        return tensor
+
     def evaluate(
         self,
         samples: list[tuple[Path, str]],
@@ -498,6 +524,12 @@ def main() -> int:
     parser.add_argument("--verbose", action="store_true", help="Print per-image wrong predictions")
     parser.add_argument("--output_json", type=str, default=None, help="Write full results to JSON")
     parser.add_argument("--output_csv", type=str, default=None, help="Write threshold sweep to CSV")
+    parser.add_argument(
+        "--tensor_cache_dir",
+        type=str,
+        default=None,
+        help="Reuse preprocessed tensors across thresholds, models and runs with the same preprocessing",
+    )
     args = parser.parse_args()
 
     if not ORT_AVAILABLE:
@@ -511,7 +543,8 @@ def main() -> int:
         download_cub200(dataset_dir)
 
     print(f"\nLoading model from {model_dir} ...")
-    evaluator = ModelEvaluator(model_dir)
+    tensor_cache = PreprocessedTensorCache(args.tensor_cache_dir) if args.tensor_cache_dir else None
+    evaluator = ModelEvaluator(model_dir, tensor_cache=tensor_cache)
 
     # Read recommended threshold from model_config if not specified
     threshold = args.threshold
@@ -557,6 +590,11 @@ def main() -> int:
             Path(args.output_json).write_text(json.dumps(results, indent=2))
             print(f"JSON saved to {args.output_json}")
 
+    if tensor_cache is not None:
+        tensor_cache.flush()
+        stats = tensor_cache.stats()
+        print(f"Tensor cache: {stats['hits']} hits, {stats['misses']} misses, reuse ratio {stats['reuse_ratio']}")
+
     return 0
 
 
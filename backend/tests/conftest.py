@@ -62,6 +62,7 @@ def pytest_configure(config):
     os.environ["DATA_DIR"] = os.path.join(temp_dir, "data")
     os.environ["CONFIG_DIR"] = os.path.join(temp_dir, "config")
     os.environ["CONFIG_FILE"] = os.path.join(temp_dir, "config", "config.json")
+    os.environ["COMPILED_MODEL_CACHE_DIR"] = os.path.join(temp_dir, "compiled_model_cache")
 
     # Create necessary directories
     Path(os.environ["MEDIA_CACHE_DIR"]).mkdir(parents=True, exist_ok=True)
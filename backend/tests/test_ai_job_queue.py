@@ -0,0 +1,338 @@
+"""AI job queue behaviour against a local fake Claude-compatible provider."""
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+import pytest_asyncio
+
+import app.services.ai_job_queue as ai_job_queue_module
+from app.config import settings
+from app.database import close_db, get_db, init_db
+from app.main import app
+from app.repositories.ai_usage_repository import AIUsageRepository
+from app.routers import ai as ai_router
+from app.services.ai_job_queue import AIJobQueue, ai_job_queue
+from app.services.ai_service import AI_PROVIDER_BASE_URLS, AIAnalysisError, AIService, ai_service
+from app.utils.api_datetime import utc_naive_now
+
+
+class _FakeProvider:
+    """Threaded HTTP server answering ``/v1/messages`` like the Anthropic API."""
+
+    def __init__(self, *, delay: float = 0.0, rate_limit_first: int = 0) -> None:
+        self.delay = delay
+        self.rate_limit_first = rate_limit_first
+        self.requests: list[tuple[float, dict]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def _handle(self, handler: BaseHTTPRequestHandler) -> None:
+        body = json.loads(handler.rfile.read(int(handler.headers["Content-Length"])))
+        with self._lock:
+            self.requests.append((time.monotonic(), body))
+            throttled = len(self.requests) <= self.rate_limit_first
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if throttled:
+                status, headers, payload = 429, {"Retry-After": "1"}, {"error": {"message": "slow down"}}
+            else:
+                status, headers = 200, {}
+                payload = {
+                    "content": [{"text": "## Appearance\nA fine bird."}],
+                    "usage": {"input_tokens": 120, "output_tokens": 30},
+                }
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        raw = json.dumps(payload).encode("utf-8")
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(raw)))
+        handler.end_headers()
+        handler.wfile.write(raw)
+
+    def __enter__(self) -> "_FakeProvider":
+        provider = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                provider._handle(self)
+
+            def log_message(self, format, *args):
+                return
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        host, port = self._server.server_address
+        self.base_url = f"http://{host}:{port}"
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        assert self._server is not None and self._thread is not None
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=5)
+        return False
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def db():
+    await init_db()
+    yield
+    await close_db()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def claude_settings():
+    llm = settings.llm
+    original = (llm.enabled, llm.api_key, llm.provider, llm.model)
+    clips = (settings.frigate.clips_enabled, settings.frigate.recording_clip_enabled)
+    llm.enabled, llm.api_key, llm.provider, llm.model = True, "test-key", "claude", "fake-vision"
+    ai_job_queue.reset()
+    ai_service.frame_cache.clear()
+    yield
+    llm.enabled, llm.api_key, llm.provider, llm.model = original
+    settings.frigate.clips_enabled, settings.frigate.recording_clip_enabled = clips
+    ai_job_queue.reset()
+    ai_service.frame_cache.clear()
+    await ai_service.close()
+
+
+@pytest.fixture
+def provider():
+    with _FakeProvider(delay=0.1) as fake, patch.dict(AI_PROVIDER_BASE_URLS, {"claude": fake.base_url}):
+        yield fake
+
+
+async def _usage_rows(job_ids: set[str]) -> list[tuple]:
+    # Usage rows are written by background tasks; give them a moment to land.
+    for _ in range(50):
+        async with get_db() as db:
+            placeholders = ",".join("?" for _ in job_ids)
+            async with db.execute(
+                "SELECT job_id, queue_ms, duration_ms, input_tokens FROM ai_usage_log "
+                f"WHERE job_id IN ({placeholders})",
+                tuple(job_ids),
+            ) as cursor:
+                rows = await cursor.fetchall()
+        if len(rows) >= len(job_ids):
+            return rows
+        await asyncio.sleep(0.05)
+    return rows
+
+
+def _analyze(service: AIService, species: str = "Blue Tit"):
+    return lambda: service.analyze_detection(
+        species=species, image_data=None, metadata={"time": "08:15"}, image_list=[b"frame-1", b"frame-2"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_queue_caps_provider_concurrency_and_tags_usage_with_job_ids(provider):
+    service = AIService()
+    queue = AIJobQueue(concurrency=2, requests_per_minute=600, burst=10)
+    try:
+        results = await asyncio.gather(*(queue.run("analysis", _analyze(service)) for _ in range(6)))
+    finally:
+        await service.close()
+
+    assert all(result.startswith("## Appearance") for result in results)
+    assert provider.max_in_flight == 2
+    jobs = queue.status()["recent_jobs"]
+    assert {job["status"] for job in jobs} == {"succeeded"}
+    assert sum(job["input_tokens"] for job in jobs) == 6 * 120
+
+    rows = await _usage_rows({job["job_id"] for job in jobs})
+    assert len(rows) == 6
+    assert all(duration_ms >= 100 for _job, _queue_ms, duration_ms, _tokens in rows)
+    # Four of the six jobs had to wait for one of the two provider slots.
+    assert sum(1 for _job, queue_ms, _duration, _tokens in rows if queue_ms >= 90) >= 4
+
+    async with get_db() as db:
+        stats = await AIUsageRepository(db).get_job_stats(utc_naive_now() - timedelta(hours=1), utc_naive_now())
+    assert stats["jobs"] >= 6
+    assert stats["avg_tokens_per_job"] == 150
+    assert stats["jobs_per_hour"] > 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_batch_job_honours_retry_after_and_interactive_calls_fail_fast():
+    service = AIService()
+    queue = AIJobQueue(concurrency=2, requests_per_minute=600, burst=10)
+    with (
+        _FakeProvider(rate_limit_first=1) as fake,
+        patch.dict(AI_PROVIDER_BASE_URLS, {"claude": fake.base_url}),
+        patch.object(ai_job_queue_module, "AI_QUEUE_INTERACTIVE_MAX_WAIT_SECONDS", 0.2),
+    ):
+        try:
+            batch_job = asyncio.ensure_future(queue.run("analysis", _analyze(service), batch_id="batch-1"))
+            while not fake.requests:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.1)
+            interactive = await queue.run("analysis", _analyze(service))
+            result = await batch_job
+        finally:
+            await service.close()
+
+    assert isinstance(interactive, AIAnalysisError)
+    assert interactive.http_status_hint == 429
+    assert interactive.retry_after_seconds == 1
+
+    assert result.startswith("## Appearance")
+    assert len(fake.requests) == 2, "the interactive call never reached the paused provider"
+    assert fake.requests[1][0] - fake.requests[0][0] >= 0.95
+    batch_jobs = [job for job in queue.status()["recent_jobs"] if job["batch_id"] == "batch-1"]
+    assert batch_jobs[0]["attempts"] == 2
+
+
+@pytest.mark.asyncio
+async def test_interactive_call_gives_up_when_batch_jobs_hold_every_slot():
+    service = AIService()
+    queue = AIJobQueue(concurrency=1, requests_per_minute=600, burst=10)
+    with (
+        _FakeProvider(delay=1.0) as fake,
+        patch.dict(AI_PROVIDER_BASE_URLS, {"claude": fake.base_url}),
+        patch.object(ai_job_queue_module, "AI_QUEUE_INTERACTIVE_MAX_WAIT_SECONDS", 0.2),
+    ):
+        try:
+            batch_jobs = [
+                asyncio.ensure_future(queue.run("analysis", _analyze(service), batch_id="batch-1")) for _ in range(2)
+            ]
+            while not fake.requests:
+                await asyncio.sleep(0.01)
+            started = time.monotonic()
+            interactive = await queue.run("analysis", _analyze(service))
+            waited = time.monotonic() - started
+            batch_results = await asyncio.gather(*batch_jobs)
+        finally:
+            await service.close()
+
+    assert isinstance(interactive, AIAnalysisError)
+    assert interactive.http_status_hint == 429
+    assert waited < 0.6, "the interactive call waited for a batch job to free the slot"
+    assert all(result.startswith("## Appearance") for result in batch_results)
+    assert len(fake.requests) == 2
+    assert queue.status()["lanes"][0]["waiting"] == 0
+
+
+@pytest.mark.asyncio
+async def test_provider_client_is_recreated_for_a_new_event_loop():
+    service = AIService()
+
+    async def pooled_client():
+        return service._client("claude")
+
+    first = await pooled_client()
+    first_again = await pooled_client()
+    # A fresh loop in another thread, as a worker thread or a second test loop would run.
+    other_loop_client = await asyncio.to_thread(asyncio.run, pooled_client())
+    current = await pooled_client()
+    await service.close()
+
+    assert first is first_again
+    assert other_loop_client is not first
+    assert current is not first and current is not other_loop_client
+
+
+@pytest.mark.asyncio
+async def test_claude_request_marks_the_stable_prompt_prefix_cacheable(provider):
+    service = AIService()
+    try:
+        await service.analyze_detection(
+            species="Blue Tit", image_data=None, metadata={"time": "08:15"}, image_list=[b"frame-1"]
+        )
+    finally:
+        await service.close()
+
+    content = provider.requests[0][1]["messages"][0]["content"]
+    assert [part["type"] for part in content] == ["text", "image", "text"]
+    assert content[0]["cache_control"] == {"type": "ephemeral"}
+    assert content[0]["text"].startswith("You are an expert ornithologist")
+    assert "Blue Tit" not in content[0]["text"]
+    assert "Species identified by system: Blue Tit" in content[2]["text"]
+
+
+@pytest.mark.asyncio
+async def test_clip_frames_are_extracted_once_per_event():
+    settings.frigate.recording_clip_enabled = False
+    settings.frigate.clips_enabled = True
+    event_id = f"evt-{uuid.uuid4().hex[:8]}"
+    with (
+        patch.object(ai_router.frigate_client, "get_clip_with_error", AsyncMock(return_value=(b"clip", None))) as clip,
+        patch.object(ai_service, "extract_frames_from_clip", return_value=[b"a", b"b"]) as extract,
+    ):
+        first = await ai_router._load_ai_analysis_frames(event_id, frame_count=2, lang="en")
+        second = await ai_router._load_ai_analysis_frames(event_id, frame_count=2, lang="en")
+
+    assert first == second == ([b"a", b"b"], "event")
+    clip.assert_awaited_once()
+    extract.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_analyze_today_queues_unanalyzed_detections_from_the_local_day(provider):
+    settings.frigate.recording_clip_enabled = False
+    settings.frigate.clips_enabled = False
+    prefix = uuid.uuid4().hex[:8]
+    now = utc_naive_now()
+    rows = [
+        (f"{prefix}-new-1", now, 0, None),
+        (f"{prefix}-new-2", now - timedelta(seconds=5), 0, None),
+        (f"{prefix}-done", now, 0, "Already analyzed"),
+        (f"{prefix}-hidden", now, 1, None),
+        (f"{prefix}-old", now - timedelta(days=2), 0, None),
+    ]
+    async with get_db() as db:
+        # Keep other tests' detections out of the batch; restored below.
+        async with db.execute("SELECT id FROM detections WHERE ai_analysis IS NULL") as cursor:
+            others = [row[0] for row in await cursor.fetchall()]
+        await db.executemany("UPDATE detections SET ai_analysis = 'seeded' WHERE id = ?", [(id_,) for id_ in others])
+        await db.executemany(
+            """INSERT INTO detections (detection_time, detection_index, score, display_name, category_name,
+                                       frigate_event, camera_name, is_hidden, ai_analysis)
+               VALUES (?, 1, 0.9, 'Blue Tit', 'Blue Tit', ?, 'garden', ?, ?)""",
+            [(time_, event_id, hidden, analysis) for event_id, time_, hidden, analysis in rows],
+        )
+        await db.commit()
+
+    with patch.object(ai_router.frigate_client, "get_snapshot", AsyncMock(return_value=b"jpeg")):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post("/api/ai/analyze/today", headers={"X-Timezone": "UTC"})
+            assert response.status_code == 202
+            body = response.json()
+            assert body["queued"] == 2
+            await ai_job_queue.wait_for_batch(body["batch_id"])
+            status = (await client.get("/api/ai/queue")).json()
+
+    async with get_db() as db:
+        async with db.execute(
+            "SELECT frigate_event, ai_analysis FROM detections WHERE frigate_event LIKE ?", (f"{prefix}-%",)
+        ) as cursor:
+            analyses = dict(await cursor.fetchall())
+        await db.executemany("UPDATE detections SET ai_analysis = NULL WHERE id = ?", [(id_,) for id_ in others])
+        await db.commit()
+    assert analyses[f"{prefix}-new-1"].startswith("## Appearance")
+    assert analyses[f"{prefix}-new-2"].startswith("## Appearance")
+    assert analyses[f"{prefix}-done"] == "Already analyzed"
+    assert analyses[f"{prefix}-hidden"] is None
+    assert analyses[f"{prefix}-old"] is None
+    assert len(provider.requests) == 2
+
+    [batch] = [batch for batch in status["batches"] if batch["batch_id"] == body["batch_id"]]
+    assert (batch["completed"], batch["failed"], batch["running"]) == (2, 0, False)
@@ -1,3 +1,4 @@
+import asyncio
 import importlib
 import sys
 import types
@@ -437,6 +438,46 @@ def test_cancel_stuck_tasks_skips_already_done_tasks(monkeypatch):
     assert not cancelled
 
 
+def test_cancel_stuck_tasks_ages_jobs_from_inference_slot_acquisition(monkeypatch):
+    """Time spent prefetched behind the inference gate never counts as stuck."""
+    service = _build_service(monkeypatch)
+    module = importlib.import_module("app.services.auto_video_classifier_service")
+    max_age = module._MAX_JOB_AGE_SECONDS
+
+    cancelled = []
+
+    class QueuedTask:
+        def __init__(self, event_id):
+            self.event_id = event_id
+
+        def done(self):
+            return False
+
+        def cancel(self):
+            cancelled.append(self.event_id)
+
+    service._active_tasks = {"evt-waiting": QueuedTask("evt-waiting"), "evt-analyzing": QueuedTask("evt-analyzing")}
+    service._active_metadata = {
+        "evt-waiting": {"source": "live", "started_at": 0.0, "phase": "waiting_for_inference"},
+        "evt-analyzing": {"source": "live", "started_at": 0.0, "phase": "analyzing"},
+    }
+
+    with patch("app.services.auto_video_classifier_service.time.monotonic", return_value=max_age - 10):
+        asyncio.run(service._acquire_inference_slot("evt-analyzing"))
+
+    with patch("app.services.auto_video_classifier_service.time.monotonic", return_value=max_age + 60):
+        count = service._cancel_stuck_tasks()
+
+    assert count == 0
+    assert not cancelled
+
+    with patch("app.services.auto_video_classifier_service.time.monotonic", return_value=2 * max_age):
+        count = service._cancel_stuck_tasks()
+
+    assert count == 1
+    assert cancelled == ["evt-analyzing"]
+
+
 def test_coordinator_slot_available_after_stuck_task_cancelled(monkeypatch):
     """Simulates Milirey's bundle: coordinator.available=0, job running for 920s.
 
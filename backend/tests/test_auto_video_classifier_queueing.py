@@ -1,12 +1,15 @@
 import asyncio
 import contextlib
+import os
 import types
 import time
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from app.services import auto_video_classifier_service as auto_video_classifier_module
+from app.services import media_cache as media_cache_module
 from app.config import settings
 
 AutoVideoClassifierService = auto_video_classifier_module.AutoVideoClassifierService
@@ -1042,19 +1045,13 @@ async def test_load_preferred_clip_uses_cached_event_clip_before_polling_frigate
 
     valid_clip = b"\x00\x00\x00\x18ftypisomcachedclip"
     fake_path = MagicMock()
-    fake_path.read_bytes = MagicMock(return_value=valid_clip)
+    fake_path.read_bytes = MagicMock(side_effect=AssertionError("cached clips are read in place"))
 
     monkeypatch.setattr(
         auto_video_classifier_module.media_cache,
         "get_clip_path",
         lambda event_id: fake_path,
     )
-    monkeypatch.setattr(
-        service,
-        "_clip_decodes",
-        AsyncMock(return_value=True),
-    )
-
     monkeypatch.setattr(
         auto_video_classifier_module,
         "Path",
@@ -1076,7 +1073,7 @@ async def test_load_preferred_clip_uses_cached_event_clip_before_polling_frigate
         "evt-cached-event-clip", skip_delay=True
     )
 
-    assert clip_bytes == valid_clip
+    assert clip_bytes == auto_video_classifier_module.CachedClip(path=fake_path)
     assert clip_error is None
     assert clip_variant == "event"
     assert clip_start_timestamp is None
@@ -1104,7 +1101,6 @@ async def test_load_preferred_clip_classifies_retained_partial_recording(monkeyp
     monkeypatch.setattr(auto_video_classifier_module.media_cache, "get_clip_path", lambda event_id: None)
     monkeypatch.setattr(auto_video_classifier_module, "Path", lambda path: fake_path)
     monkeypatch.setattr(_asyncio, "to_thread", AsyncMock(return_value=valid_clip))
-    monkeypatch.setattr(service, "_clip_decodes", AsyncMock(return_value=True))
     wait_for_clip_mock = AsyncMock(return_value=(None, "clip_not_found"))
     monkeypatch.setattr(service, "_wait_for_clip", wait_for_clip_mock)
 
@@ -1113,8 +1109,80 @@ async def test_load_preferred_clip_classifies_retained_partial_recording(monkeyp
         skip_delay=True,
     )
 
-    assert clip_bytes == valid_clip
+    assert clip_bytes == auto_video_classifier_module.CachedClip(path=fake_path)
     assert clip_error is None
     assert clip_variant == "recording"
     assert clip_start_timestamp == 100.0
     wait_for_clip_mock.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_process_event_classifies_pinned_cached_clip_without_copying(monkeypatch, tmp_path):
+    service = AutoVideoClassifierService()
+    cached_path = tmp_path / "evt-in-place.mp4"
+    clip_bytes = b"\x00\x00\x00\x18ftypisomcachedclip"
+    cached_path.write_bytes(clip_bytes)
+
+    monkeypatch.setattr(
+        auto_video_classifier_module.frigate_client,
+        "get_event_with_error",
+        AsyncMock(return_value=({"has_clip": True, "data": {}}, None)),
+    )
+    monkeypatch.setattr(auto_video_classifier_module.broadcaster, "broadcast", AsyncMock())
+    monkeypatch.setattr(settings.media_cache, "high_quality_event_snapshots", False)
+    monkeypatch.setattr(service, "_update_status", AsyncMock())
+    monkeypatch.setattr(service, "_save_results", AsyncMock())
+    monkeypatch.setattr(
+        service,
+        "_load_preferred_clip",
+        AsyncMock(return_value=(auto_video_classifier_module.CachedClip(path=cached_path), None, "event", None)),
+    )
+    mkstemp = MagicMock(side_effect=AssertionError("cached clips must not be copied"))
+    monkeypatch.setattr(auto_video_classifier_module.tempfile, "mkstemp", mkstemp)
+    monkeypatch.setattr(media_cache_module, "PINNED_CLIPS_DIR", tmp_path / "pinned")
+    read_back: list[bytes] = []
+
+    async def _classify_while_cache_is_cleaned(video_path, **_kwargs):
+        # A cleanup pass evicts the cached clip mid-classification.
+        assert os.path.samefile(video_path, cached_path)
+        cached_path.unlink()
+        read_back.append(Path(video_path).read_bytes())
+        return [{"label": "Robin", "score": 0.9, "index": 1}]
+
+    service._classifier = MagicMock()
+    service._classifier.classify_video_async = _classify_while_cache_is_cleaned
+
+    await service._process_event("evt-in-place", "cam1", skip_delay=True)
+
+    assert read_back == [clip_bytes]
+    assert list((tmp_path / "pinned").iterdir()) == []
+    stages = service.get_status()["pipeline"]["stages"]
+    assert stages["fetch"]["completed"] == 1
+    assert stages["inference"]["completed"] == 1
+    assert stages["persist"]["completed"] == 1
+    assert all(stage["active"] == 0 for stage in stages.values())
+
+
+@pytest.mark.asyncio
+async def test_inference_gate_holds_prefetched_job_until_slot_frees(monkeypatch):
+    service = AutoVideoClassifierService()
+    monkeypatch.setattr(service, "_inference_limit", lambda: 1)
+
+    await service._acquire_inference_slot("evt-running")
+    service._enter_pipeline_stage("evt-prefetched", "fetch")
+    waiter = asyncio.create_task(service._acquire_inference_slot("evt-prefetched"))
+    await asyncio.sleep(0)
+
+    stages = service._pipeline_status()["stages"]
+    assert not waiter.done()
+    assert stages["inference"]["active"] == 1
+    assert stages["inference"]["backlog"] == 1
+    assert stages["fetch"]["active"] == 0
+
+    service._enter_pipeline_stage("evt-running", "persist")
+    await asyncio.wait_for(waiter, timeout=1.0)
+
+    stages = service._pipeline_status()["stages"]
+    assert stages["inference"]["active"] == 1
+    assert stages["inference"]["backlog"] == 0
+    assert stages["persist"]["active"] == 1
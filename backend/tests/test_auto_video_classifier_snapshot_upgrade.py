@@ -2,6 +2,7 @@ import asyncio
 import contextlib
 import os
 import tempfile
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -14,6 +15,7 @@ from app.services.classifier_service import (
     BackgroundImageClassificationUnavailableError,
     VideoClassificationWorkerError,
 )
+from app.services.classifier_supervisor import current_video_pause_clock
 from app.services.error_diagnostics import error_diagnostics_history
 
 AutoVideoClassifierService = auto_video_classifier_module.AutoVideoClassifierService
@@ -605,6 +607,27 @@ async def test_process_event_passes_event_id_into_video_classification_context()
     }
 
 
+def _minimal_mp4_bytes(mdat_payload: bytes = b"frame-data") -> bytes:
+    ftyp = b"\x00\x00\x00\x18ftypisom\x00\x00\x02\x00isomiso2"
+    moov = b"\x00\x00\x00\x08moov"
+    mdat = (8 + len(mdat_payload)).to_bytes(4, "big") + b"mdat" + mdat_payload
+    return ftyp + moov + mdat
+
+
+def test_mp4_container_probe_accepts_complete_clip_and_rejects_truncated(tmp_path):
+    complete = tmp_path / "complete.mp4"
+    complete.write_bytes(_minimal_mp4_bytes())
+    truncated = tmp_path / "truncated.mp4"
+    truncated.write_bytes(_minimal_mp4_bytes()[:-4])
+    no_moov = tmp_path / "no_moov.mp4"
+    no_moov.write_bytes(_minimal_mp4_bytes().replace(b"moov", b"free"))
+
+    assert AutoVideoClassifierService._mp4_container_complete_sync(complete) is True
+    assert AutoVideoClassifierService._mp4_container_complete_sync(truncated) is False
+    assert AutoVideoClassifierService._mp4_container_complete_sync(no_moov) is False
+    assert AutoVideoClassifierService._mp4_container_complete_sync(tmp_path / "missing.mp4") is False
+
+
 @pytest.mark.asyncio
 async def test_process_event_prefers_cached_recording_clip_when_available():
     service = AutoVideoClassifierService()
@@ -618,7 +641,7 @@ async def test_process_event_prefers_cached_recording_clip_when_available():
     # Write a real temp file so asyncio.to_thread(Path(...).read_bytes) succeeds.
     fd, recording_path = tempfile.mkstemp(suffix=".mp4")
     try:
-        os.write(fd, b"\x00\x00\x00\x18ftyprecording-clip-bytes")
+        os.write(fd, _minimal_mp4_bytes())
         os.close(fd)
 
         with (
@@ -633,7 +656,6 @@ async def test_process_event_prefers_cached_recording_clip_when_available():
                 "_get_valid_cached_recording_clip_path",
                 new=AsyncMock(return_value=(recording_path, "cam1", 1, 2)),
             ),
-            patch.object(AutoVideoClassifierService, "_clip_decodes", new=AsyncMock(return_value=True)),
         ):
             await service._process_event("evt-recording-preferred", "cam1", skip_delay=True)
     finally:
@@ -678,7 +700,6 @@ async def test_process_event_falls_back_to_event_clip_when_cached_recording_is_i
                 "_get_valid_cached_recording_clip_path",
                 new=AsyncMock(return_value=(recording_path, "cam1", 1, 2)),
             ),
-            patch.object(AutoVideoClassifierService, "_clip_decodes", new=AsyncMock(return_value=False)),
         ):
             await service._process_event("evt-recording-invalid", "cam1", skip_delay=True)
     finally:
@@ -872,6 +893,50 @@ async def test_process_event_timeout_diagnostic_includes_job_source_and_clip_con
         error_diagnostics_history.clear()
 
 
+@pytest.mark.asyncio
+async def test_process_event_preempted_video_longer_than_timeout_is_not_a_timeout():
+    async def _preempted_classify_video(*_args, **_kwargs):
+        # The supervisor attaches the request to the caller's pause clock; the
+        # worker then reports 0.5s spent paused for live inference.
+        pause_clock = current_video_pause_clock.get()
+        pause_clock.assignment = SimpleNamespace(
+            reported_paused_seconds=0.5,
+            last_pause_reported_at=None,
+            preempted_at=None,
+        )
+        await asyncio.sleep(0.4)
+        return [{"label": "Robin", "score": 0.92, "index": 1}]
+
+    service = AutoVideoClassifierService()
+    service._classifier = MagicMock()
+    service._classifier.classify_video_async = _preempted_classify_video
+    service._update_status = AsyncMock()  # type: ignore[method-assign]
+    service._save_results = AsyncMock()  # type: ignore[method-assign]
+    service._auto_delete_if_missing = AsyncMock()  # type: ignore[method-assign]
+    service._wait_for_clip = AsyncMock(return_value=(b"clip-bytes", None))  # type: ignore[method-assign]
+    service._record_timeout = MagicMock()  # type: ignore[method-assign]
+    error_diagnostics_history.clear()
+
+    try:
+        with (
+            patch.object(
+                auto_video_classifier_module.frigate_client,
+                "get_event_with_error",
+                new=AsyncMock(return_value=({"has_clip": True}, None)),
+            ),
+            patch.object(auto_video_classifier_module.broadcaster, "broadcast", new=AsyncMock()),
+            patch.object(settings.classification, "video_classification_timeout_seconds", 0.2),
+        ):
+            await service._process_event("evt-video-preempted", "cam1", skip_delay=True)
+
+        service._record_timeout.assert_not_called()
+        service._save_results.assert_awaited_once()
+        snapshot = error_diagnostics_history.snapshot(limit=20)
+        assert not any(item["reason_code"] == "video_timeout" for item in snapshot["events"])
+    finally:
+        error_diagnostics_history.clear()
+
+
 @pytest.mark.asyncio
 async def test_process_event_maintenance_timeout_falls_back_to_snapshot_without_breaker_failure():
     service = AutoVideoClassifierService()
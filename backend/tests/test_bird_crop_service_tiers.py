@@ -1,3 +1,4 @@
+import numpy as np
 from PIL import Image
 
 from app.config import settings
@@ -204,6 +205,117 @@ def test_classification_tiles_cover_frame_with_overlap_and_a_hard_four_call_boun
     assert boxes[0][3] > boxes[2][1]
 
 
+class _ColourBirdSession:
+    """Fake YOLOX session: each saturated colour patch is one bird with a fixed confidence."""
+
+    CONFIDENCE = {0: 0.9, 1: 0.7, 2: 0.5}
+
+    def __init__(self):
+        self.batch_sizes: list[int] = []
+
+    def run(self, _output_names, feeds):
+        batch = feeds["images"]
+        self.batch_sizes.append(batch.shape[0])
+        outputs = []
+        for tensor in batch:
+            rows = []
+            for channel, confidence in self.CONFIDENCE.items():
+                others = [index for index in range(3) if index != channel]
+                mask = (tensor[channel] > 0.6) & (tensor[others[0]] < 0.3) & (tensor[others[1]] < 0.3)
+                ys, xs = np.nonzero(mask)
+                if xs.size:
+                    rows.append([xs.min(), ys.min(), xs.max() + 1, ys.max() + 1, confidence, 16.0])
+            outputs.append(rows + [[0.0, 0.0, 0.0, 0.0, 0.0, 0.0]] * (3 - len(rows)))
+        return [np.asarray(outputs, dtype=np.float32)]
+
+
+def _tile_fixture(birds) -> Image.Image:
+    image = Image.new("RGB", (1000, 800), "white")
+    for colour, box in birds:
+        image.paste(colour, box)
+    return image
+
+
+def _sequential_sliced_crop(service, image):
+    """The pre-batching tile loop: one detector call and selection per tile."""
+    tile_boxes = service._classification_tile_boxes(image.size)
+    selected = []
+    for tile_box in tile_boxes:
+        result, _available = service._generate_classification_candidate_for_tier(image.crop(tile_box), strategy="s")
+        if result.get("reason") == "selected":
+            selected.append(
+                service._restore_region_result_to_image(
+                    image, result, region_box=tile_box, strategy="sliced_2x2", tile_count=len(tile_boxes)
+                )
+            )
+    return max(selected, key=lambda result: result["confidence"]) if selected else None
+
+
+def test_batched_tile_detection_selects_the_same_crop_as_per_tile_calls(monkeypatch):
+    red, green, blue = (255, 0, 0), (0, 255, 0), (0, 0, 255)
+    fixtures = [
+        [(green, (80, 60, 200, 180))],
+        [(red, (470, 350, 560, 440))],  # inside every tile's overlap
+        [(blue, (40, 40, 140, 140)), (green, (760, 600, 900, 740))],
+        [(red, (560, 100, 680, 220)), (green, (100, 500, 220, 620))],
+        [(blue, (860, 700, 880, 720))],  # too small everywhere
+    ]
+    sessions = []
+
+    def _load(tier, *, dynamic_batch):
+        session = _ColourBirdSession()
+        sessions.append(session)
+        return {
+            "session": session,
+            "input_name": "images",
+            "input_width": 416,
+            "input_height": 416,
+            "detector_tier": tier,
+            "dynamic_batch": dynamic_batch,
+        }
+
+    for birds in fixtures:
+        image = _tile_fixture(birds)
+        batched = BirdCropService(detector_tier="accurate")
+        monkeypatch.setattr(batched, "_load_model_for_tier", lambda tier: _load(tier, dynamic_batch=True))
+        sequential = BirdCropService(detector_tier="accurate")
+        monkeypatch.setattr(sequential, "_load_model_for_tier", lambda tier: _load(tier, dynamic_batch=False))
+
+        result = batched._generate_sliced_classification_candidate_crop(image)
+        expected = _sequential_sliced_crop(sequential, image)
+
+        assert sessions[-2].batch_sizes == [4]
+        assert sessions[-1].batch_sizes == [1, 1, 1, 1]
+        if expected is None:
+            assert result is None
+            continue
+        assert result["box"] == expected["box"]
+        assert result["confidence"] == expected["confidence"]
+        assert result["tile_count"] == 4
+
+
+def test_cross_tile_merge_drops_only_lower_scoring_copies_from_other_tiles():
+    service = BirdCropService(detector_tier="accurate")
+    tile_boxes = [(0, 0, 600, 500), (400, 0, 1000, 500)]
+    tile_candidates = [
+        [
+            {"box": (450, 100, 550, 200), "confidence": 0.8},
+            {"box": (100, 300, 200, 400), "confidence": 0.6},
+            {"box": (105, 305, 205, 405), "confidence": 0.5},  # same tile: left for selection
+        ],
+        [
+            {"box": (52, 102, 152, 202), "confidence": 0.7},  # same bird seen by the first tile
+            {"box": (400, 300, 500, 400), "confidence": 0.4},
+            {"box": None, "confidence": 0.9},
+        ],
+    ]
+
+    merged = service._merge_tile_candidates(tile_candidates, tile_boxes, (1000, 500))
+
+    assert merged[0] == tile_candidates[0]
+    assert merged[1] == tile_candidates[1][1:]
+
+
 def test_classification_candidate_does_not_slice_small_images(monkeypatch):
     service = BirdCropService(detector_tier="accurate", expand_ratio=0.0)
     monkeypatch.setattr(service, "_load_model_for_tier", lambda tier: {"tier": tier})
@@ -1,10 +1,14 @@
 import asyncio
+import contextlib
 
 import pytest
 
 from app.services import classification_admission as classification_admission_module
 from app.services.classification_admission import (
+    AdmissionCapacityController,
+    CapacitySignals,
     ClassificationAdmissionCoordinator,
+    ClassificationAdmissionTimeoutError,
     ClassificationLeaseExpiredError,
 )
 
@@ -302,3 +306,124 @@ async def test_submit_tolerates_timeout_race_after_item_was_already_admitted(mon
     assert result == "background"
 
     await coordinator.shutdown()
+
+
+async def _simulate_bursty_live_load(capacity_controller: AdmissionCapacityController | None) -> tuple[float, dict]:
+    """Three bursts of live snapshots over a steady background backlog on a three-core host."""
+    coordinator = ClassificationAdmissionCoordinator(
+        live_capacity=1,
+        background_capacity=2,
+        live_lease_timeout_seconds=5.0,
+        background_lease_timeout_seconds=5.0,
+        capacity_controller=capacity_controller,
+    )
+    host_cores = asyncio.Semaphore(3)
+    stop_background = asyncio.Event()
+
+    def on_core(seconds: float):
+        async def run():
+            async with host_cores:
+                await asyncio.sleep(seconds)
+
+        return run
+
+    async def background_feeder():
+        while not stop_background.is_set():
+            with contextlib.suppress(ClassificationAdmissionTimeoutError):
+                await coordinator.submit(
+                    priority="background",
+                    kind="video_classification",
+                    runner=on_core(0.04),
+                    queue_timeout_seconds=5.0,
+                )
+
+    async def live_event() -> bool:
+        try:
+            await coordinator.submit(
+                priority="live",
+                kind="snapshot_classification",
+                runner=on_core(0.03),
+                queue_timeout_seconds=0.1,
+            )
+        except ClassificationAdmissionTimeoutError:
+            return False
+        return True
+
+    feeders = [asyncio.create_task(background_feeder()) for _ in range(3)]
+    outcomes: list[bool] = []
+    for _burst in range(3):
+        await asyncio.sleep(0.2)
+        outcomes.extend(await asyncio.gather(*(live_event() for _ in range(8))))
+    stop_background.set()
+    await asyncio.gather(*feeders)
+    metrics = coordinator.get_metrics()
+    await coordinator.shutdown()
+    return outcomes.count(False) / len(outcomes), metrics
+
+
+@pytest.mark.asyncio
+async def test_adaptive_capacity_drops_fewer_live_events_under_bursty_load():
+    fixed_drop_rate, fixed_metrics = await _simulate_bursty_live_load(None)
+    adaptive_drop_rate, adaptive_metrics = await _simulate_bursty_live_load(
+        AdmissionCapacityController(
+            live_bounds=(1, 3),
+            background_bounds=(1, 2),
+            interval_seconds=0.01,
+            live_queue_wait_target_seconds=0.02,
+            live_hold_seconds=0.1,
+        )
+    )
+
+    # A single live slot serves about four 30 ms snapshots inside the 100 ms queue timeout.
+    assert fixed_drop_rate >= 0.25
+    assert fixed_metrics["capacity_controller"] is None
+    assert adaptive_drop_rate < fixed_drop_rate / 2
+
+    controller_metrics = adaptive_metrics["capacity_controller"]
+    reasons = [decision["reason"] for decision in controller_metrics["history"]]
+    assert "live_queue_wait" in reasons or "live_rejections" in reasons
+    assert "live_pressure_cleared" in reasons
+    grown = next(d for d in controller_metrics["history"] if d["reason"] in {"live_queue_wait", "live_rejections"})
+    assert grown["live_capacity"][1] > grown["live_capacity"][0]
+    assert grown["background_capacity"] == [2, 1]
+    # Between bursts both pools return to their starting sizes.
+    assert (adaptive_metrics["live"]["capacity"], adaptive_metrics["background"]["capacity"]) == (1, 2)
+
+
+def test_capacity_controller_sheds_background_on_host_load_and_grows_it_for_a_backlog():
+    cpu_percent = 95.0
+    controller = AdmissionCapacityController(
+        live_bounds=(2, 4),
+        background_bounds=(1, 3),
+        background_queue_wait_target_seconds=1.0,
+        cpu_percent_provider=lambda: cpu_percent,
+    )
+    assert controller.clamp_initial(1, 2) == (2, 2)
+
+    def signals(**overrides) -> CapacitySignals:
+        _lease, cpu = controller.observe_host()
+        values = {
+            "live_queue_wait_seconds": 0.0,
+            "background_queue_wait_seconds": 3.0,
+            "live_queued": 0,
+            "live_running": 0,
+            "background_queued": 4,
+            "live_rejected": 0,
+            "cpu_percent": cpu,
+        }
+        values.update(overrides)
+        return CapacitySignals(**values)
+
+    assert controller.decide(signals(), live_capacity=2, background_capacity=2, now=100.0) == (2, 1)
+    inflated = signals(lease_latency_inflation=3.0)
+    cpu_percent = 20.0
+    assert controller.decide(inflated, live_capacity=2, background_capacity=1, now=101.0) is None
+    # Headroom restores the starting size first, then grows into the backlog.
+    assert controller.decide(signals(), live_capacity=2, background_capacity=1, now=102.0) == (2, 2)
+    assert controller.decide(signals(), live_capacity=2, background_capacity=2, now=103.0) == (2, 3)
+    assert controller.decide(signals(), live_capacity=2, background_capacity=3, now=104.0) is None
+
+    metrics = controller.get_metrics()
+    assert [d["reason"] for d in metrics["history"]] == ["cpu_high", "live_pressure_cleared", "background_backlog"]
+    assert metrics["evaluations"] == 5
+    assert metrics["history"][0]["signals"]["cpu_percent"] == 95.0
@@ -1,5 +1,6 @@
 import pytest
 import numpy as np
+import cv2  # loaded before fixtures patch os.path.exists (cv2 bootstraps from disk)
 import sys
 import types
 import asyncio
@@ -313,6 +314,24 @@ def test_onnx_model_instance_aggregates_grouped_nabirds_species_scores():
     assert results[1]["score"] == pytest.approx(0.25, rel=1e-3)
 
 
+def test_onnx_model_instance_classify_tensor_matches_classify_and_exposes_shared_plan():
+    model = ONNXModelInstance("test", "model.onnx", "labels.txt", input_size=8)
+    model.loaded = True
+    model.labels = ["Robin", "Sparrow"]
+    mock_session = MagicMock()
+    mock_session.get_inputs.return_value = [types.SimpleNamespace(name="input")]
+    mock_session.run.return_value = [np.array([[0.2, 1.5]], dtype=np.float32)]
+    model.session = mock_session
+    image = Image.new("RGB", (16, 16), color="white")
+
+    tensor = model.preprocess(image)
+
+    assert tensor.shape == (1, 3, 8, 8)
+    assert model.classify_tensor(tensor, top_k=2) == model.classify(image, top_k=2)
+    openvino = OpenVINOModelInstance("test", "model.onnx", "labels.txt", input_size=8)
+    assert model.preprocessing_plan() == openvino.preprocessing_plan()
+
+
 @pytest.mark.parametrize("method_name", ["classify", "classify_raw"])
 def test_onnx_model_instance_surfaces_runtime_failure_for_provider_recovery(method_name):
     model = ONNXModelInstance(
@@ -1796,8 +1815,6 @@ async def test_classify_video_ignores_unknown_frames_when_known_evidence_exists(
             return True
 
         def get(self, prop):
-            import cv2
-
             if prop == cv2.CAP_PROP_FRAME_COUNT:
                 return len(frames)
             if prop == cv2.CAP_PROP_FPS:
@@ -3719,8 +3736,6 @@ async def test_classifier_service_classify_video_forwards_input_context_to_frame
             return True
 
         def get(self, prop):
-            import cv2
-
             if prop == cv2.CAP_PROP_FRAME_COUNT:
                 return len(frames)
             return 0
@@ -5565,6 +5580,32 @@ def test_openvino_import_supports_top_level_core_when_runtime_module_missing():
     assert support["import_path"] == "openvino.Core"
 
 
+def test_acceleration_capabilities_report_openvino_without_importing_it(monkeypatch):
+    unprobed = classifier_service_module._UNPROBED
+    for name in ("_OPENVINO_SUPPORT", "OpenVINOCore", "OPENVINO_AVAILABLE"):
+        monkeypatch.setattr(classifier_service_module, name, unprobed)
+    monkeypatch.setattr(
+        classifier_service_module,
+        "_detect_openvino_support",
+        MagicMock(side_effect=AssertionError("status must not import openvino")),
+    )
+    monkeypatch.setattr(classifier_service_module.importlib.util, "find_spec", lambda name: object())
+    monkeypatch.setattr(classifier_service_module.importlib.metadata, "version", lambda name: "2026.1.0")
+    monkeypatch.setattr(
+        classifier_service_module,
+        "_probe_openvino_devices_safe",
+        lambda: {"ok": True, "devices": ["CPU", "GPU"], "gpu_probe_error": None},
+    )
+
+    with patch("app.services.classifier_service._onnx_available", return_value=False):
+        caps = _detect_acceleration_capabilities()
+
+    assert caps["openvino_available"] is True
+    assert caps["openvino_version"] == "2026.1.0"
+    assert caps["intel_gpu_available"] is True
+    assert classifier_service_module._OPENVINO_SUPPORT is unprobed
+
+
 def test_reconcile_ort_active_provider_downgrades_cuda_when_session_is_cpu_only():
     active, reason = _reconcile_ort_active_provider(
         requested_active_provider="cuda",
@@ -10,6 +10,8 @@ from app.services.classifier_supervisor import (
     ClassifierWorkerExitedError,
     ClassifierWorkerHeartbeatTimeoutError,
     ClassifierWorkerStartupTimeoutError,
+    VideoPauseClock,
+    current_video_pause_clock,
 )
 
 
@@ -1197,3 +1199,206 @@ async def test_classifier_supervisor_fails_fast_on_zero_workers():
         )
 
     await supervisor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_classifier_supervisor_promotes_hot_standby_on_heartbeat_timeout():
+    created: list[_FakeWorker] = []
+
+    async def _factory(*, worker_name: str, worker_generation: int, **_kwargs):
+        worker = _FakeWorker(worker_name, worker_generation)
+        created.append(worker)
+        return worker
+
+    supervisor = ClassifierSupervisor(
+        live_worker_count=1,
+        background_worker_count=1,
+        heartbeat_timeout_seconds=0.05,
+        hard_deadline_seconds=1.0,
+        worker_factory=_factory,
+        watchdog_interval_seconds=0.01,
+        hot_standby=True,
+    )
+    await supervisor.start("live")
+    await asyncio.sleep(0.01)
+    standby = _find_worker(created, "live-standby", 1)
+    assert supervisor.get_metrics()["live"]["standby_ready"] is True
+
+    task = asyncio.create_task(
+        supervisor.classify(
+            priority="live",
+            work_id="live-standby-1",
+            lease_token=1,
+            image_b64="payload",
+            camera_name="front",
+            model_id="default",
+        )
+    )
+    await asyncio.sleep(0.01)
+    created[0].last_heartbeat_monotonic = time.monotonic() - 1.0
+
+    with pytest.raises(ClassifierWorkerHeartbeatTimeoutError):
+        await task
+
+    metrics = supervisor.get_metrics()["live"]
+    assert metrics["standby_promotions"] == 1
+    assert supervisor._slots["live"][0].worker is standby
+    assert supervisor._slots["live"][0].worker_generation == 2
+
+    # The promoted standby serves the next request under the slot's name.
+    follow_up = asyncio.create_task(
+        supervisor.classify(
+            priority="live",
+            work_id="live-standby-2",
+            lease_token=2,
+            image_b64="payload",
+            camera_name="front",
+            model_id="default",
+        )
+    )
+    await asyncio.sleep(0.01)
+    request = standby.sent_messages[-1]
+    standby.events.put_nowait(
+        {
+            "type": "result",
+            "worker_generation": 1,
+            "request_id": request["request_id"],
+            "work_id": "live-standby-2",
+            "lease_token": 2,
+            "results": [{"label": "Robin", "score": 0.9}],
+        }
+    )
+    assert await follow_up == [{"label": "Robin", "score": 0.9}]
+
+    # A fresh standby is prepared for the next failure.
+    await asyncio.sleep(0.01)
+    assert sum(1 for worker in created if worker.worker_name == "live-standby") == 2
+
+    await supervisor.shutdown()
+    assert all(worker.closed for worker in created if worker.worker_name == "live-standby" and worker is not standby)
+
+
+@pytest.mark.asyncio
+async def test_classifier_supervisor_restart_pool_discards_stale_standby():
+    created: list[_FakeWorker] = []
+
+    async def _factory(*, worker_name: str, worker_generation: int, **_kwargs):
+        worker = _FakeWorker(worker_name, worker_generation)
+        created.append(worker)
+        return worker
+
+    supervisor = ClassifierSupervisor(
+        live_worker_count=1,
+        background_worker_count=1,
+        heartbeat_timeout_seconds=0.05,
+        hard_deadline_seconds=1.0,
+        worker_factory=_factory,
+        hot_standby=True,
+    )
+    await supervisor.start("live")
+    await asyncio.sleep(0.01)
+    stale_standby = _find_worker(created, "live-standby", 1)
+
+    await supervisor.restart_pool("live")
+
+    assert stale_standby.terminated is True
+    assert supervisor._slots["live"][0].worker is not stale_standby
+    assert supervisor.get_metrics()["live"]["standby_promotions"] == 0
+
+    await supervisor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_classifier_supervisor_preempts_video_while_live_work_runs():
+    created: list[_FakeWorker] = []
+
+    async def _factory(*, worker_name: str, worker_generation: int, **_kwargs):
+        worker = _FakeWorker(worker_name, worker_generation)
+        created.append(worker)
+        return worker
+
+    supervisor = ClassifierSupervisor(
+        live_worker_count=1,
+        background_worker_count=1,
+        heartbeat_timeout_seconds=5.0,
+        hard_deadline_seconds=5.0,
+        video_hard_deadline_seconds=0.15,
+        worker_factory=_factory,
+        watchdog_interval_seconds=0.01,
+    )
+    await supervisor.start()
+    live_worker = _find_worker(created, "live-0", 1)
+    video_worker = _find_worker(created, "video-0", 1)
+
+    pause_clock = VideoPauseClock()
+    token = current_video_pause_clock.set(pause_clock)
+    video_task = asyncio.create_task(
+        supervisor.classify_video(work_id="video-1", lease_token=3, video_path="/tmp/demo.mp4", max_frames=4)
+    )
+    current_video_pause_clock.reset(token)
+    await asyncio.sleep(0.01)
+    video_request_id = video_worker.sent_messages[0]["request_id"]
+    live_task = asyncio.create_task(
+        supervisor.classify(
+            priority="live",
+            work_id="live-1",
+            lease_token=1,
+            image_b64="payload",
+            camera_name="front",
+            model_id="default",
+        )
+    )
+    await asyncio.sleep(0.01)
+    assert [message["type"] for message in video_worker.sent_messages] == ["classify_video", "preempt"]
+
+    # Time spent preempted does not count towards the video hard deadline.
+    await asyncio.sleep(0.2)
+    assert not video_task.done()
+    assert pause_clock.paused_seconds() >= 0.2
+    await live_worker.events.put(
+        {
+            "type": "result",
+            "worker_generation": 1,
+            "request_id": live_worker.sent_messages[0]["request_id"],
+            "work_id": "live-1",
+            "lease_token": 1,
+            "results": [{"label": "Robin", "score": 0.91}],
+        }
+    )
+    assert (await live_task)[0]["label"] == "Robin"
+    assert [message["type"] for message in video_worker.sent_messages] == ["classify_video", "preempt", "resume"]
+
+    for event in (
+        {
+            "type": "video_preemption",
+            "worker_generation": 1,
+            "request_id": video_request_id,
+            "work_id": "video-1",
+            "lease_token": 3,
+            "current_frame": 2,
+            "total_frames": 4,
+            "paused_seconds": 0.21,
+            "frames_by_source": {"full_frame": 2, "model_crop": 1},
+        },
+        {
+            "type": "result",
+            "worker_generation": 1,
+            "request_id": video_request_id,
+            "work_id": "video-1",
+            "lease_token": 3,
+            "results": [{"label": "Robin", "score": 0.8}],
+        },
+    ):
+        await video_worker.events.put(event)
+    assert (await asyncio.wait_for(video_task, timeout=1.0))[0]["score"] == 0.8
+    # Once the worker reports the pause, the caller's budget is the reported time.
+    assert pause_clock.paused_seconds() == pytest.approx(0.21)
+
+    video_metrics = supervisor.get_metrics()["video"]
+    assert video_metrics["preemption_requests"] == 1
+    assert video_metrics["preemptions"] == 1
+    assert video_metrics["preemption_delay_seconds"] == 0.21
+    assert video_metrics["last_preemption"]["frames_by_source"] == {"full_frame": 2, "model_crop": 1}
+    assert video_metrics["restarts"] == 0
+
+    await supervisor.shutdown()
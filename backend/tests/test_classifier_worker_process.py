@@ -1,4 +1,6 @@
 import asyncio
+import threading
+import time
 
 import pytest
 
@@ -6,6 +8,9 @@ from app.services.classifier_worker_process import ClassifierWorkerProcess
 from app.services.classifier_worker_protocol import (
     build_classify_request,
     build_classify_video_request,
+    build_preempt_request,
+    build_resume_request,
+    build_shutdown_request,
     decode_protocol_message,
 )
 
@@ -467,3 +472,128 @@ async def test_classifier_worker_process_does_not_fail_video_classification_when
     assert any(message["type"] == "progress" for message in writer.messages)
     assert any(message["type"] == "result" and message["results"][0]["label"] == "Robin" for message in writer.messages)
     assert not any(message["type"] == "error" for message in writer.messages)
+
+
+@pytest.mark.asyncio
+async def test_classifier_worker_process_pauses_video_between_frames_while_preempted():
+    reader = asyncio.StreamReader()
+    writer = _MemoryWriter()
+    first_frame_done = threading.Event()
+    continue_video = threading.Event()
+
+    def _classify_video_fn(
+        *,
+        video_path: str,
+        stride: int,
+        max_frames: int | None,
+        progress_callback,
+        preemption_point,
+    ):
+        scores_by_input_source = {"full_frame": [], "model_crop": []}
+        preemption_point(0, 2, scores_by_input_source)
+        scores_by_input_source["full_frame"].append([0.9, 0.1])
+        first_frame_done.set()
+        continue_video.wait(timeout=5)
+        preemption_point(1, 2, scores_by_input_source)
+        return [{"label": "Robin", "score": 0.91, "index": 0}]
+
+    process = ClassifierWorkerProcess(
+        reader=reader,
+        writer=writer,
+        classify_fn=lambda **_: [],
+        classify_video_fn=_classify_video_fn,
+        worker_generation=16,
+        heartbeat_interval_seconds=0.5,
+    )
+
+    task = asyncio.create_task(process.run())
+    reader.feed_data(
+        process.encode_message(
+            build_classify_video_request(
+                worker_generation=16,
+                request_id="req-video-preempt",
+                work_id="video-4",
+                lease_token=10,
+                video_path="/tmp/demo.mp4",
+            )
+        )
+    )
+    await asyncio.wait_for(asyncio.to_thread(first_frame_done.wait, 5), timeout=5)
+
+    # The worker reads the preempt message while the video is still running.
+    reader.feed_data(process.encode_message(build_preempt_request(worker_generation=16)))
+    await asyncio.sleep(0.02)
+    continue_video.set()
+    await asyncio.sleep(0.1)
+    assert not any(message["type"] in {"result", "video_preemption"} for message in writer.messages)
+
+    reader.feed_data(process.encode_message(build_resume_request(worker_generation=16)))
+    reader.feed_eof()
+    await asyncio.wait_for(task, timeout=5)
+
+    preemptions = [message for message in writer.messages if message["type"] == "video_preemption"]
+    assert len(preemptions) == 1
+    assert preemptions[0]["current_frame"] == 1
+    assert preemptions[0]["frames_by_source"] == {"full_frame": 1, "model_crop": 0}
+    assert preemptions[0]["paused_seconds"] >= 0.05
+    assert writer.messages.index(preemptions[0]) < next(
+        index for index, message in enumerate(writer.messages) if message["type"] == "result"
+    )
+
+
+@pytest.mark.asyncio
+async def test_classifier_worker_process_stops_pausing_preempted_video_on_shutdown():
+    reader = asyncio.StreamReader()
+    writer = _MemoryWriter()
+    first_frame_done = threading.Event()
+    continue_video = threading.Event()
+
+    def _classify_video_fn(
+        *,
+        video_path: str,
+        stride: int,
+        max_frames: int | None,
+        progress_callback,
+        preemption_point,
+    ):
+        scores_by_input_source = {"full_frame": [[0.9, 0.1]]}
+        first_frame_done.set()
+        continue_video.wait(timeout=5)
+        for frame in range(1, 4):
+            preemption_point(frame, 4, scores_by_input_source)
+        return [{"label": "Robin", "score": 0.91, "index": 0}]
+
+    process = ClassifierWorkerProcess(
+        reader=reader,
+        writer=writer,
+        classify_fn=lambda **_: [],
+        classify_video_fn=_classify_video_fn,
+        worker_generation=17,
+        heartbeat_interval_seconds=0.5,
+        video_preemption_max_pause_seconds=2.0,
+    )
+
+    task = asyncio.create_task(process.run())
+    reader.feed_data(
+        process.encode_message(
+            build_classify_video_request(
+                worker_generation=17,
+                request_id="req-video-shutdown",
+                work_id="video-5",
+                lease_token=11,
+                video_path="/tmp/demo.mp4",
+            )
+        )
+    )
+    await asyncio.wait_for(asyncio.to_thread(first_frame_done.wait, 5), timeout=5)
+    reader.feed_data(process.encode_message(build_preempt_request(worker_generation=17)))
+    reader.feed_data(process.encode_message(build_shutdown_request()))
+    await asyncio.sleep(0.02)
+    continue_video.set()
+
+    started = time.monotonic()
+    # Three remaining frames would stall 2s each if the preempt flag survived shutdown.
+    await asyncio.wait_for(task, timeout=1.0)
+
+    assert time.monotonic() - started < 1.0
+    assert any(message["type"] == "result" for message in writer.messages)
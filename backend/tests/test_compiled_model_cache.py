@@ -0,0 +1,124 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import classifier_service as classifier_service_module
+from app.services import compiled_model_cache
+
+
+@pytest.fixture
+def cache_root(tmp_path, monkeypatch):
+    root = tmp_path / "compiled"
+    monkeypatch.setenv("COMPILED_MODEL_CACHE_DIR", str(root))
+    monkeypatch.delenv("OPENVINO_CACHE_DIR", raising=False)
+    monkeypatch.setattr(compiled_model_cache, "_runtime_signature", lambda: "a" * 64)
+    monkeypatch.setattr(compiled_model_cache, "_digest_memo", {})
+    return root
+
+
+def _model(tmp_path, content: bytes = b"onnx-graph"):
+    path = tmp_path / "model.onnx"
+    path.write_bytes(content)
+    return path
+
+
+def test_cache_key_tracks_model_content_and_runtime_signature(cache_root, tmp_path, monkeypatch):
+    model = _model(tmp_path)
+    key = compiled_model_cache.compiled_model_cache_key(model, runtime="onnxruntime", device="CPUExecutionProvider")
+
+    assert key == compiled_model_cache.compiled_model_cache_key(
+        model, runtime="onnxruntime", device="CPUExecutionProvider"
+    )
+    assert (cache_root / compiled_model_cache.DIGESTS_FILENAME).is_file()
+
+    monkeypatch.setattr(compiled_model_cache, "_runtime_signature", lambda: "b" * 64)
+    assert key != compiled_model_cache.compiled_model_cache_key(
+        model, runtime="onnxruntime", device="CPUExecutionProvider"
+    )
+
+    monkeypatch.setattr(compiled_model_cache, "_runtime_signature", lambda: "a" * 64)
+    model.write_bytes(b"replaced-onnx-graph")
+    assert key != compiled_model_cache.compiled_model_cache_key(
+        model, runtime="onnxruntime", device="CPUExecutionProvider"
+    )
+
+
+def test_openvino_cache_dir_is_namespaced_by_runtime_unless_overridden(cache_root, tmp_path, monkeypatch):
+    assert compiled_model_cache.openvino_cache_dir() == str(cache_root / "openvino" / ("a" * 16))
+
+    override = tmp_path / "ov-override"
+    monkeypatch.setenv("OPENVINO_CACHE_DIR", str(override))
+    assert compiled_model_cache.openvino_cache_dir() == str(override)
+    assert override.is_dir()
+
+
+def test_models_with_external_weights_are_not_cached(cache_root, tmp_path):
+    model = _model(tmp_path)
+    (tmp_path / "model.onnx.data").write_bytes(b"weights")
+
+    assert compiled_model_cache.onnxruntime_optimized_model_path(model, providers=["CPUExecutionProvider"]) is None
+
+
+def test_prune_evicts_least_recently_used_entries(cache_root):
+    ort_dir = cache_root / "onnxruntime"
+    ort_dir.mkdir(parents=True)
+    old = ort_dir / "old.onnx"
+    new = ort_dir / "new.onnx"
+    old.write_bytes(b"x" * 10)
+    new.write_bytes(b"y" * 10)
+    os.utime(old, (1_000, 1_000))
+    os.utime(new, (2_000, 2_000))
+
+    assert compiled_model_cache.prune(max_bytes=15) == 1
+    assert not old.exists()
+    assert new.exists()
+
+
+class _FakeOrt:
+    class GraphOptimizationLevel:
+        ORT_ENABLE_ALL = "all"
+        ORT_DISABLE_ALL = "disabled"
+
+    def __init__(self) -> None:
+        self.sessions: list[SimpleNamespace] = []
+
+    class SessionOptions:
+        def __init__(self) -> None:
+            self.graph_optimization_level = None
+            self.intra_op_num_threads = None
+            self.optimized_model_filepath = ""
+
+    def InferenceSession(self, path, sess_options=None, providers=None):
+        if sess_options.optimized_model_filepath:
+            with open(sess_options.optimized_model_filepath, "wb") as handle:
+                handle.write(b"optimized-graph")
+        session = SimpleNamespace(
+            path=path,
+            optimization_level=sess_options.graph_optimization_level,
+            providers=list(providers or []),
+        )
+        self.sessions.append(session)
+        return session
+
+
+def test_onnxruntime_session_reuses_serialized_optimized_graph(cache_root, tmp_path, monkeypatch):
+    fake_ort = _FakeOrt()
+    monkeypatch.setattr(classifier_service_module, "ort", fake_ort, raising=False)
+    model = _model(tmp_path)
+
+    first, first_state = classifier_service_module._create_onnxruntime_session(str(model), ["CPUExecutionProvider"])
+    second, second_state = classifier_service_module._create_onnxruntime_session(str(model), ["CPUExecutionProvider"])
+
+    assert first_state == "stored"
+    assert first.path == str(model)
+    assert first.optimization_level == "all"
+    assert second_state == "hit"
+    assert second.path.startswith(str(cache_root / "onnxruntime"))
+    assert second.optimization_level == "disabled"
+    assert list((cache_root / "onnxruntime").glob("*.tmp")) == []
+
+    _cuda_session, cuda_state = classifier_service_module._create_onnxruntime_session(
+        str(model), ["CUDAExecutionProvider", "CPUExecutionProvider"]
+    )
+    assert cuda_state == "stored"
@@ -257,6 +257,13 @@ CLASSIFICATION_ENV_PRECEDENCE_CASES = [
         20.0,
         22.5,
     ),
+    (
+        "worker_hot_standby_enabled",
+        "CLASSIFICATION__WORKER_HOT_STANDBY_ENABLED",
+        "true",
+        False,
+        True,
+    ),
     (
         "worker_restart_window_seconds",
         "CLASSIFICATION__WORKER_RESTART_WINDOW_SECONDS",
@@ -280,6 +287,20 @@ CLASSIFICATION_ENV_PRECEDENCE_CASES = [
         True,
         False,
     ),
+    (
+        "live_event_refresh_enabled",
+        "CLASSIFICATION__LIVE_EVENT_REFRESH_ENABLED",
+        "true",
+        False,
+        True,
+    ),
+    (
+        "live_event_refresh_min_interval_seconds",
+        "CLASSIFICATION__LIVE_EVENT_REFRESH_MIN_INTERVAL_SECONDS",
+        "45.0",
+        30.0,
+        45.0,
+    ),
     (
         "ai_pricing_json",
         "CLASSIFICATION__AI_PRICING_JSON",
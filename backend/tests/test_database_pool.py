@@ -1,6 +1,8 @@
+import sqlite3
+
 import pytest
 
-from app.database import DatabasePool
+from app.database import DatabasePool, RoutedConnection, is_read_statement
 
 
 @pytest.mark.asyncio
@@ -9,19 +11,24 @@ async def test_close_all_closes_tracked_connections_even_when_checked_out(tmp_pa
     pool = DatabasePool(str(db_path), pool_size=2)
     await pool.initialize()
 
-    checked_out = await pool.acquire()
+    checked_out = await pool.acquire_reader()
+    checked_out_writer = await pool.acquire_writer()
 
     assert pool._initialized is True
-    assert len(pool._all_connections) == 2
+    assert len(pool.readers._connections) == 2
+    assert len(pool.writer._connections) == 1
 
     await pool.close_all()
 
     assert pool._initialized is False
-    assert pool._pool.qsize() == 0
-    assert len(pool._all_connections) == 0
+    assert pool.readers._queue.qsize() == 0
+    assert len(pool.readers._connections) == 0
+    assert len(pool.writer._connections) == 0
 
     with pytest.raises(Exception):
         await checked_out.execute("SELECT 1")
+    with pytest.raises(Exception):
+        await checked_out_writer.execute("SELECT 1")
 
 
 @pytest.mark.asyncio
@@ -42,7 +49,7 @@ async def test_acquire_wait_max_ms_is_windowed_and_lifetime_is_preserved(tmp_pat
     now = [1_000.0]
     monkeypatch.setattr(database_module.time, "monotonic", lambda: now[0])
 
-    pool._record_wait_sample(waited_ms=10_000.0)
+    pool.readers._record_wait_sample(waited_ms=10_000.0)
 
     status = pool.get_status()
     assert status["acquire_wait_max_ms"] == 10_000.0
@@ -50,7 +57,7 @@ async def test_acquire_wait_max_ms_is_windowed_and_lifetime_is_preserved(tmp_pat
 
     # Advance past the window; the old sample should age out of the live max
     now[0] += 5.0
-    pool._record_wait_sample(waited_ms=50.0)
+    pool.readers._record_wait_sample(waited_ms=50.0)
 
     status = pool.get_status()
     assert status["acquire_wait_max_ms"] == 50.0, "Stale sample should have aged out of the live windowed max"
@@ -76,11 +83,191 @@ async def test_acquire_wait_sample_buffer_is_bounded(tmp_path, monkeypatch):
     ts = [1_000.0]
     monkeypatch.setattr(database_module.time, "monotonic", lambda: ts[0])
     for i in range(50_000):
-        pool._record_wait_sample(waited_ms=float(i % 100))
+        pool.readers._record_wait_sample(waited_ms=float(i % 100))
         ts[0] += 0.001
 
-    assert len(pool._wait_samples) <= database_module.DB_POOL_WAIT_SAMPLE_CAP, (
+    assert len(pool.readers._wait_samples) <= database_module.DB_POOL_WAIT_SAMPLE_CAP, (
         "Sample buffer must be capped to prevent unbounded growth"
     )
 
     await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_routed_connection_sends_reads_to_readers_and_writes_to_the_writer(tmp_path):
+    db_path = tmp_path / "pool-routing.db"
+    pool = DatabasePool(str(db_path), pool_size=2)
+    await pool.initialize()
+    try:
+        setup = RoutedConnection(pool)
+        await setup.execute("CREATE TABLE birds (name TEXT)")
+        await setup.commit()
+        await setup.close()
+
+        db = RoutedConnection(pool)
+        async with db.execute("SELECT COUNT(*) FROM birds") as cursor:
+            assert (await cursor.fetchone())[0] == 0
+        assert db._reader is not None and db._writer is None
+
+        await db.execute("INSERT INTO birds (name) VALUES ('robin')")
+        assert db._writer is not None
+        # Inside the write transaction reads stay on the writer and see the row.
+        async with db.execute("SELECT COUNT(*) FROM birds") as cursor:
+            assert (await cursor.fetchone())[0] == 1
+        assert pool.writer._queue.qsize() == 0
+
+        await db.commit()
+        assert db._writer is None
+        assert pool.writer._queue.qsize() == 1
+        async with db.execute("SELECT COUNT(*) FROM birds") as cursor:
+            assert (await cursor.fetchone())[0] == 1
+        await db.close()
+
+        reader = await pool.acquire_reader()
+        with pytest.raises(sqlite3.OperationalError):
+            await reader.execute("INSERT INTO birds (name) VALUES ('wren')")
+        await pool.readers.release(reader)
+
+        status = pool.get_status()
+        assert status["pools"]["write"]["acquire_count"] == 2
+        assert status["pools"]["read"]["acquire_count"] >= 2
+        assert status["wal"]["size_bytes"] > 0
+    finally:
+        await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_explicit_begin_keeps_a_read_modify_write_on_the_writer(tmp_path):
+    pool = DatabasePool(str(tmp_path / "pool-begin.db"), pool_size=1)
+    await pool.initialize()
+    try:
+        db = RoutedConnection(pool)
+        await db.execute("CREATE TABLE birds (name TEXT)")
+        await db.commit()
+
+        await db.execute("BEGIN IMMEDIATE")
+        async with db.execute("SELECT COUNT(*) FROM birds") as cursor:
+            seen = (await cursor.fetchone())[0]
+        await db.execute("INSERT INTO birds (name) VALUES (?)", (f"bird-{seen}",))
+        await db.commit()
+
+        assert db._reader is None
+        await db.close()
+    finally:
+        await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_batched_write_under_an_uncommitted_routed_write_joins_its_transaction(tmp_path, monkeypatch):
+    from app import database as database_module
+    from app.db_write_batcher import DatabaseWriteBatcher
+
+    pool = DatabasePool(str(tmp_path / "pool-nested.db"), pool_size=1)
+    await pool.initialize()
+    batcher = DatabaseWriteBatcher(pool.writer_connection, window_ms=1.0, max_batch_ops=8)
+    await batcher.start()
+    monkeypatch.setattr(database_module, "_db_pool", pool)
+    monkeypatch.setattr(database_module, "_db_write_batcher", batcher)
+
+    async def _insert(conn):
+        await conn.execute("INSERT INTO birds (name) VALUES ('wren')")
+        await conn.commit()
+        return "wren"
+
+    async def _fail(conn):
+        await conn.execute("INSERT INTO birds (name) VALUES ('doomed')")
+        raise RuntimeError("boom")
+
+    async def _names():
+        reader = await pool.acquire_reader()
+        try:
+            async with reader.execute("SELECT name FROM birds ORDER BY name") as cursor:
+                return [row[0] for row in await cursor.fetchall()]
+        finally:
+            await pool.readers.release(reader)
+
+    try:
+        db = RoutedConnection(pool)
+        await db.execute("CREATE TABLE birds (name TEXT)")
+        await db.commit()
+
+        await db.execute("INSERT INTO birds (name) VALUES ('robin')")
+        # The handler still holds the writer; queueing behind it would deadlock.
+        assert await database_module.run_batched_write(_insert) == "wren"
+        with pytest.raises(RuntimeError, match="boom"):
+            await database_module.run_batched_write(_fail)
+        assert await _names() == []
+
+        await db.commit()
+        await db.close()
+        assert await _names() == ["robin", "wren"]
+        assert batcher.get_status()["batch_count"] == 0
+
+        # Once the writer is released, batched writes queue through the batcher again.
+        assert await database_module.run_batched_write(_insert) == "wren"
+        assert batcher.get_status()["batch_count"] == 1
+    finally:
+        await batcher.stop()
+        await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_explicit_checkpoint_records_result_and_truncates_large_wal(tmp_path, monkeypatch):
+    from app import database as database_module
+
+    monkeypatch.setattr(database_module, "DB_WAL_CHECKPOINT_INTERVAL_SECONDS", 0.0)
+    monkeypatch.setattr(database_module, "DB_WAL_TRUNCATE_BYTES", 1)
+    pool = DatabasePool(str(tmp_path / "pool-checkpoint.db"), pool_size=1)
+    await pool.initialize()
+    try:
+        db = RoutedConnection(pool)
+        await db.execute("CREATE TABLE birds (name TEXT)")
+        await db.execute("INSERT INTO birds (name) VALUES ('robin')")
+        await db.commit()
+        await db.close()
+        assert pool.wal_size_bytes() > 0
+
+        result = await pool.checkpoint()
+
+        assert result["mode"] == "TRUNCATE"
+        assert result["busy"] is False
+        assert result["wal_bytes_after"] == 0
+        assert pool.get_status()["wal"]["last_checkpoint"]["mode"] == "TRUNCATE"
+    finally:
+        await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_refresh_statistics_is_visible_to_readers(tmp_path, monkeypatch):
+    from app import database as database_module
+
+    monkeypatch.setattr(database_module, "DB_ANALYZE_INTERVAL_SECONDS", 0.0)
+    pool = DatabasePool(str(tmp_path / "pool-analyze.db"), pool_size=1)
+    await pool.initialize()
+    try:
+        db = RoutedConnection(pool)
+        await db.execute("CREATE TABLE birds (name TEXT)")
+        await db.execute("CREATE INDEX idx_birds_name ON birds(name)")
+        await db.executemany("INSERT INTO birds (name) VALUES (?)", [(f"bird-{i}",) for i in range(20)])
+        await db.commit()
+
+        await pool.refresh_statistics()
+
+        # Served by a read-only connection, which reloads the new statistics.
+        async with db.execute("SELECT stat FROM sqlite_stat1 WHERE idx = 'idx_birds_name'") as cursor:
+            assert (await cursor.fetchone())[0] == "20 1"
+        await db.close()
+        assert pool.get_status()["statistics"]["analyze_count"] == 1
+    finally:
+        await pool.close_all()
+
+
+def test_is_read_statement_classifies_reads_conservatively():
+    assert is_read_statement("\n  SELECT * FROM detections")
+    assert is_read_statement("WITH recent AS (SELECT 1) SELECT * FROM recent")
+    assert is_read_statement("PRAGMA table_info(detections)")
+    assert not is_read_statement("WITH doomed AS (SELECT id FROM detections) DELETE FROM detections")
+    assert not is_read_statement("PRAGMA journal_mode=WAL")
+    assert not is_read_statement("PRAGMA wal_checkpoint(PASSIVE)")
+    assert not is_read_statement("BEGIN")
+    assert not is_read_statement("UPDATE detections SET score = 1")
@@ -0,0 +1,139 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import aiosqlite
+import pytest
+
+from app.db_write_batcher import DatabaseWriteBatcher
+
+
+async def _make_batcher(db_path, *, window_ms=50.0, max_batch_ops=64):
+    async with aiosqlite.connect(db_path) as setup:
+        await setup.execute("CREATE TABLE items (name TEXT PRIMARY KEY, value INTEGER)")
+        await setup.commit()
+
+    commits = []
+    conn = await aiosqlite.connect(db_path)
+    real_commit = conn.commit
+
+    async def counting_commit():
+        commits.append(1)
+        await real_commit()
+
+    conn.commit = counting_commit
+    writer_lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def writer():
+        async with writer_lock:
+            try:
+                yield conn
+            finally:
+                await conn.rollback()
+
+    batcher = DatabaseWriteBatcher(writer, window_ms=window_ms, max_batch_ops=max_batch_ops)
+    await batcher.start()
+    return batcher, commits, conn
+
+
+def _insert(name, value):
+    async def op(conn):
+        await conn.execute("INSERT INTO items (name, value) VALUES (?, ?)", (name, value))
+        # Repository methods commit themselves; inside a batch that is deferred.
+        await conn.commit()
+        return name
+
+    return op
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_share_one_commit_and_are_visible_on_return(tmp_path):
+    db_path = str(tmp_path / "batch.db")
+    batcher, commits, conn = await _make_batcher(db_path)
+    try:
+        results = await asyncio.gather(*(batcher.submit(_insert(f"bird-{i}", i)) for i in range(5)))
+
+        assert results == [f"bird-{i}" for i in range(5)]
+        assert len(commits) == 1
+        # Read-your-writes: a separate connection sees every row once submit returned.
+        async with aiosqlite.connect(db_path) as reader:
+            async with reader.execute("SELECT COUNT(*) FROM items") as cursor:
+                assert (await cursor.fetchone())[0] == 5
+
+        status = batcher.get_status()
+        assert status["batch_count"] == 1
+        assert status["op_count"] == 5
+        assert status["batch_size_max"] == 5
+        assert status["commit_latency_max_ms"] >= 0.0
+    finally:
+        await batcher.stop()
+        await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_failing_write_is_rolled_back_alone(tmp_path):
+    db_path = str(tmp_path / "batch-failure.db")
+    batcher, commits, conn = await _make_batcher(db_path)
+
+    async def half_written_then_fails(conn):
+        await conn.execute("INSERT INTO items (name, value) VALUES ('partial', 1)")
+        raise ValueError("boom")
+
+    try:
+        results = await asyncio.gather(
+            batcher.submit(_insert("robin", 1)),
+            batcher.submit(half_written_then_fails),
+            batcher.submit(_insert("wren", 2)),
+            return_exceptions=True,
+        )
+
+        assert results[0] == "robin"
+        assert isinstance(results[1], ValueError)
+        assert results[2] == "wren"
+        assert len(commits) == 1
+        async with aiosqlite.connect(db_path) as reader:
+            async with reader.execute("SELECT name FROM items ORDER BY name") as cursor:
+                assert [row[0] for row in await cursor.fetchall()] == ["robin", "wren"]
+        assert batcher.get_status()["failed_op_count"] == 1
+    finally:
+        await batcher.stop()
+        await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_batches_are_capped_and_stop_drains_queued_writes(tmp_path):
+    db_path = str(tmp_path / "batch-cap.db")
+    batcher, commits, conn = await _make_batcher(db_path, max_batch_ops=2)
+
+    pending = [asyncio.create_task(batcher.submit(_insert(f"bird-{i}", i))) for i in range(5)]
+    await asyncio.sleep(0)
+    await batcher.stop()
+    await conn.close()
+
+    assert all(task.done() and not task.exception() for task in pending)
+    assert len(commits) == 3
+    async with aiosqlite.connect(db_path) as reader:
+        async with reader.execute("SELECT COUNT(*) FROM items") as cursor:
+            assert (await cursor.fetchone())[0] == 5
+    assert batcher.running is False
+
+
+@pytest.mark.asyncio
+async def test_batched_writes_share_the_writer_schema_snapshot(tmp_path):
+    from app.repositories.schema_snapshot import get_schema_snapshot
+
+    db_path = str(tmp_path / "batch-schema.db")
+    batcher, _commits, conn = await _make_batcher(db_path)
+
+    async def snapshot(conn):
+        return await get_schema_snapshot(conn)
+
+    try:
+        first = await batcher.submit(snapshot)
+        second = await batcher.submit(snapshot)
+
+        assert first.has_table("items")
+        assert second is first
+    finally:
+        await batcher.stop()
+        await conn.close()
@@ -0,0 +1,154 @@
+import os
+import subprocess
+import sys
+from datetime import datetime, timedelta
+
+import aiosqlite
+import pytest
+
+from app.repositories.detection_repository import Detection, DetectionRepository
+
+HOUR = datetime(2026, 3, 14, 9, 0, 0)
+
+
+@pytest.fixture
+def migrated_db_path(tmp_path):
+    db_path = tmp_path / "cube.db"
+    env = os.environ.copy()
+    env["DB_PATH"] = str(db_path)
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=os.path.join(os.path.dirname(__file__), ".."),
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    return str(db_path)
+
+
+def _detection(event: str, minute: int, score: float, *, taxa_id: int | None = 1, camera: str = "cam_1") -> Detection:
+    return Detection(
+        detection_time=HOUR + timedelta(minutes=minute),
+        detection_index=0,
+        score=score,
+        display_name="Blue Tit" if taxa_id else "Wren",
+        category_name="Bird",
+        frigate_event=event,
+        camera_name=camera,
+        taxa_id=taxa_id,
+    )
+
+
+async def _cube(db: aiosqlite.Connection) -> list[tuple]:
+    async with db.execute(
+        "SELECT bucket_hour, canonical_key, camera_name, detection_count, ROUND(score_sum, 6), score_count, score_max "
+        "FROM detection_hourly_cube ORDER BY 1, 2, 3"
+    ) as cursor:
+        return [tuple(row) for row in await cursor.fetchall()]
+
+
+@pytest.mark.asyncio
+async def test_cube_tracks_inserts_hides_moves_and_deletes(migrated_db_path):
+    async with aiosqlite.connect(migrated_db_path) as db:
+        repo = DetectionRepository(db)
+        await repo.create(_detection("evt-a", 5, 0.9))
+        await repo.create(_detection("evt-b", 40, 0.6))
+        await repo.create(_detection("evt-c", 50, 0.7, taxa_id=None, camera="cam_2"))
+
+        assert await _cube(db) == [
+            ("2026-03-14 09:00:00", "1", "cam_1", 2, 1.5, 2, 0.9),
+            ("2026-03-14 09:00:00", "wren", "cam_2", 1, 0.7, 1, 0.7),
+        ]
+
+        # Hiding the bucket's best row drops it from the count and recomputes the max.
+        await repo.toggle_hidden("evt-a")
+        await repo.update_detection_time_by_id(
+            (await repo.get_by_frigate_event("evt-c")).id, HOUR + timedelta(hours=1, minutes=5)
+        )
+        assert await _cube(db) == [
+            ("2026-03-14 09:00:00", "1", "cam_1", 1, 0.6, 1, 0.6),
+            ("2026-03-14 10:00:00", "wren", "cam_2", 1, 0.7, 1, 0.7),
+        ]
+
+        await repo.delete_by_frigate_event("evt-b")
+        assert await _cube(db) == [("2026-03-14 10:00:00", "wren", "cam_2", 1, 0.7, 1, 0.7)]
+
+        metrics = await repo.get_timebucket_metrics(HOUR, HOUR + timedelta(hours=2), "hour")
+        assert metrics == {"2026-03-14T10:00:00Z": {"count": 1, "unique_species": 1, "avg_confidence": 0.7}}
+        assert await repo.get_activity_heatmap_utc_hourly_counts(HOUR, HOUR + timedelta(hours=2)) == [
+            (HOUR + timedelta(hours=1), 1)
+        ]
+
+
+@pytest.mark.asyncio
+async def test_hourly_reads_cover_the_partial_first_hour(migrated_db_path):
+    async with aiosqlite.connect(migrated_db_path) as db:
+        repo = DetectionRepository(db)
+        await repo.create(_detection("evt-early", 5, 0.8))
+        await repo.create(_detection("evt-late", 55, 0.8, camera="cam_2"))
+
+        counts = await repo.get_timebucket_counts_hourly(HOUR + timedelta(minutes=30), HOUR + timedelta(hours=1))
+        metrics = await repo.get_timebucket_metrics(HOUR, HOUR + timedelta(hours=1), "hour")
+
+    assert counts == {"2026-03-14T09:00:00Z": 2}
+    # Same species on two cameras is still one species.
+    assert metrics["2026-03-14T09:00:00Z"]["unique_species"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rebuild_hourly_cube_repairs_drift_in_chunks(migrated_db_path):
+    async with aiosqlite.connect(migrated_db_path) as db:
+        repo = DetectionRepository(db)
+        for day in range(5):
+            detection = _detection(f"evt-{day}", 10, 0.5 + day / 10)
+            detection.detection_time += timedelta(days=day)
+            await repo.create(detection)
+        expected = await _cube(db)
+
+        await db.execute("UPDATE detection_hourly_cube SET detection_count = 99")
+        await db.execute(
+            "INSERT INTO detection_hourly_cube (bucket_hour, canonical_key, camera_name, detection_count) "
+            "VALUES ('2020-01-01 00:00:00', 'stale', 'cam_1', 3)"
+        )
+        await db.commit()
+
+        written = await repo.rebuild_hourly_cube(chunk_days=2)
+
+        assert written == 5
+        assert await _cube(db) == expected
+
+
+@pytest.mark.asyncio
+async def test_hourly_avg_confidence_averages_scored_rows_only(migrated_db_path):
+    async with aiosqlite.connect(migrated_db_path) as db:
+        repo = DetectionRepository(db)
+        # Two detections in the bucket, only one of which carries a score.
+        await db.execute(
+            "INSERT INTO detection_hourly_cube "
+            "(bucket_hour, canonical_key, camera_name, detection_count, score_sum, score_count, score_max) "
+            "VALUES ('2026-03-14 09:00:00', '1', 'cam_1', 2, 0.8, 1, 0.8)"
+        )
+        await db.commit()
+
+        metrics = await repo.get_timebucket_metrics(HOUR, HOUR + timedelta(hours=1), "hour")
+
+    assert metrics == {"2026-03-14T09:00:00Z": {"count": 2, "unique_species": 1, "avg_confidence": 0.8}}
+
+
+@pytest.mark.asyncio
+async def test_compare_species_counts_share_the_cube_hour_bounds(migrated_db_path):
+    async with aiosqlite.connect(migrated_db_path) as db:
+        repo = DetectionRepository(db)
+        await repo.create(_detection("evt-early", 5, 0.8))
+        await repo.create(_detection("evt-late", 55, 0.8))
+        start, end = HOUR + timedelta(minutes=30), HOUR + timedelta(hours=1)
+
+        totals = await repo.get_timebucket_counts_hourly(start, end)
+        by_label = await repo.get_timebucket_species_counts(start, end, "hour", {"Blue Tit": ["Blue Tit"]})
+        by_name = await repo.get_timebucket_species_counts_for_names(start, end, "hour", ["Blue Tit"])
+
+    assert totals == {"2026-03-14T09:00:00Z": 2}
+    assert by_label == {"2026-03-14T09:00:00Z": {"Blue Tit": 2}}
+    assert by_name == {"2026-03-14T09:00:00Z": {"Blue Tit": 2}}
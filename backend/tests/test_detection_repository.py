@@ -1,7 +1,8 @@
 import pytest
 import aiosqlite
 from datetime import datetime, timedelta
-from app.repositories.detection_repository import DetectionRepository, Detection
+from app.repositories.detection_repository import DetectionRepository, Detection, _detection_filter_sql
+from app.repositories.schema_snapshot import invalidate_schema_snapshots
 
 
 async def _create_detections_table(db: aiosqlite.Connection) -> None:
@@ -146,6 +147,62 @@ async def test_get_all_can_target_one_frigate_event():
         assert [detection.frigate_event for detection in detections] == ["evt-two"]
 
 
+@pytest.mark.asyncio
+async def test_schema_snapshot_is_shared_across_repositories_until_invalidated():
+    async with aiosqlite.connect(":memory:") as db:
+        await _create_detections_table(db)
+        await db.commit()
+        statements: list[str] = []
+        await db.set_trace_callback(statements.append)
+
+        assert await DetectionRepository(db).get_count() == 0
+        assert await DetectionRepository(db).get_count() == 0
+        assert sum("sqlite_master" in statement for statement in statements) == 1
+
+        # A table added later is only seen once the snapshot is invalidated.
+        await _create_taxonomy_tables(db)
+        await db.commit()
+        assert await DetectionRepository(db)._table_exists("taxonomy_cache") is False
+        invalidate_schema_snapshots()
+        assert await DetectionRepository(db)._table_exists("taxonomy_cache") is True
+
+
+@pytest.mark.asyncio
+async def test_get_all_reuses_identical_query_text_for_the_same_filter_shape():
+    async with aiosqlite.connect(":memory:") as db:
+        await _create_detections_table(db)
+        await db.commit()
+        repo = DetectionRepository(db)
+
+        first, first_params = await repo._detection_filter(
+            start_date=datetime(2026, 1, 1),
+            end_date=None,
+            species=None,
+            species_any=None,
+            taxa_id=None,
+            camera="birdcam",
+            include_hidden=False,
+            favorites="any",
+            audio_confirmed_only=False,
+        )
+        second, second_params = await repo._detection_filter(
+            start_date=datetime(2026, 2, 1),
+            end_date=None,
+            species=None,
+            species_any=None,
+            taxa_id=None,
+            camera="feeder",
+            include_hidden=False,
+            favorites="any",
+            audio_confirmed_only=False,
+        )
+
+        assert first == second
+        assert first_params != second_params
+        assert _detection_filter_sql("list", first, "newest") is _detection_filter_sql("list", second, "newest")
+        assert "d.camera_name = ?" in _detection_filter_sql("count", first, None)
+
+
 @pytest.mark.asyncio
 async def test_mark_and_clear_frigate_missing_state():
     async with aiosqlite.connect(":memory:") as db:
@@ -1260,6 +1317,31 @@ async def test_delete_audio_detections_older_than_purges_only_old_rows():
         assert remaining == ["NewBird"]
 
 
+@pytest.mark.asyncio
+async def test_delete_audio_detections_older_than_max_chunks_deletes_in_resumable_slices():
+    async with aiosqlite.connect(":memory:") as db:
+        await _create_audio_detections_table(db)
+        await db.commit()
+        repo = DetectionRepository(db)
+
+        old_time = datetime.utcnow() - timedelta(days=30)
+        for seq in range(5):
+            await repo.insert_audio_detection(
+                timestamp=old_time,
+                species="OldBird",
+                confidence=0.9,
+                sensor_id="cam_1",
+                raw_data={"seq": seq},
+                scientific_name="Erithacus rubecula",
+            )
+
+        cutoff = datetime.utcnow() - timedelta(days=7)
+        assert await repo.delete_audio_detections_older_than(cutoff, chunk_size=2, max_chunks=1) == 2
+        assert await repo.delete_audio_detections_older_than(cutoff, chunk_size=2, max_chunks=1) == 2
+        assert await repo.delete_audio_detections_older_than(cutoff, chunk_size=2, max_chunks=1) == 1
+        assert await repo.delete_audio_detections_older_than(cutoff, chunk_size=2, max_chunks=1) == 0
+
+
 @pytest.mark.asyncio
 async def test_delete_audio_detections_older_than_returns_zero_when_nothing_expired():
     async with aiosqlite.connect(":memory:") as db:
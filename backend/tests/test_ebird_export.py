@@ -1,5 +1,10 @@
 import csv
 import io
+import os
+import sqlite3
+import subprocess
+import sys
+import textwrap
 import uuid
 from datetime import datetime
 from unittest.mock import AsyncMock, patch
@@ -11,8 +16,15 @@ import pytest_asyncio
 from app.config import settings
 from app.database import get_db
 from app.main import app
+from app.repositories.ebird_repository import EbirdRepository
+from app.services.ebird_export import iter_ebird_csv
 from app.services.taxonomy.taxonomy_service import taxonomy_service
 
+RSS_FIXTURE_ROWS = max(1000, int(os.environ.get("EBIRD_EXPORT_RSS_FIXTURE_ROWS", "1000000")))
+# One reader's 64 MB page cache (filled by walking a table this size) plus headroom;
+# buffering the rows in Python takes several hundred MB at 1M detections.
+RSS_BUDGET_MB = 96
+
 
 @pytest_asyncio.fixture
 async def client():
@@ -803,3 +815,105 @@ async def test_ebird_export_uses_taxonomy_translations_english_via_scientific_na
     rows = _read_csv_rows(response.text)
     assert len(rows) == 1
     assert rows[0][0] == "Eurasian Blue Tit"
+
+
+@pytest.mark.asyncio
+async def test_ebird_export_yields_each_day_before_reading_older_pages():
+    settings.ebird.enabled = False
+    settings.ebird.api_key = None
+
+    for day, hour in ((12, 9), (12, 9), (11, 8), (10, 7)):
+        await _insert_detection(
+            frigate_event=f"evt-{uuid.uuid4().hex[:8]}",
+            detection_time=datetime(2026, 3, day, hour, 0, 0),
+            score=0.9,
+            display_name="Great Tit",
+            scientific_name="Parus major",
+            common_name="Great Tit",
+        )
+
+    pages: list[int] = []
+    get_export_page = EbirdRepository.get_export_page
+
+    async def counting_page(self, **kwargs):
+        rows = await get_export_page(self, **kwargs)
+        pages.append(len(rows))
+        return rows
+
+    chunks: list[tuple[int, str]] = []
+    with patch.object(EbirdRepository, "get_export_page", counting_page):
+        async for chunk in iter_ebird_csv(start=None, end_exclusive=None, chunk_rows=1):
+            chunks.append((len(pages), chunk))
+
+    # One-row pages: 12 March is written once the first 11 March row is read,
+    # and the two detections sharing a timestamp both survive the keyset.
+    assert [read for read, _chunk in chunks] == [3, 4, 5]
+    rows = [_read_csv_rows(chunk) for _read, chunk in chunks]
+    assert [(r[0][8], r[0][3]) for r in rows] == [("03/12/2026", "1"), ("03/11/2026", "1"), ("03/10/2026", "1")]
+
+
+def test_ebird_export_peak_rss_stays_flat_for_a_million_detections(tmp_path):
+    db_path = tmp_path / "ebird_rss.db"
+    env = os.environ.copy()
+    env["DB_PATH"] = str(db_path)
+    env["DB_POOL_SIZE"] = "1"
+    backend_dir = os.path.join(os.path.dirname(__file__), "..")
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=backend_dir,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < ?)
+            INSERT INTO detections (
+                detection_time, detection_index, score, display_name, category_name, frigate_event,
+                camera_name, is_hidden, scientific_name, common_name, taxa_id
+            )
+            SELECT
+                datetime('2026-03-01', '-' || n || ' minutes'), 0, (n % 100) / 100.0,
+                'Species ' || (n % 60), 'Species ' || (n % 60), 'event-' || n,
+                'camera_' || (n % 4), 0, 'Genus species' || (n % 60), 'Common ' || (n % 60), 1000 + (n % 60)
+            FROM seq
+            """,
+            (RSS_FIXTURE_ROWS,),
+        )
+
+    # A fresh interpreter, so the high-water mark reflects only this export.
+    script = textwrap.dedent(
+        """
+        import asyncio, resource
+        from app.database import close_db, init_db
+        from app.services.ebird_export import iter_ebird_csv
+
+        async def main():
+            await init_db()
+            baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            rows = 0
+            async for chunk in iter_ebird_csv(start=None, end_exclusive=None):
+                rows += chunk.count("\\n")
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            await close_db()
+            print(rows, (peak - baseline) // 1024)
+
+        asyncio.run(main())
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=backend_dir,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=600,
+    )
+    rows, growth_mb = (int(value) for value in result.stdout.split()[-2:])
+    # One row per species per (day, camera) checklist; n minutes before 1 March falls on day (n + 1439) // 1440.
+    assert rows == len({((n + 1439) // 1440, n % 4, n % 60) for n in range(1, RSS_FIXTURE_ROWS + 1)})
+    assert growth_mb < RSS_BUDGET_MB, f"export grew peak RSS by {growth_mb} MB"
@@ -0,0 +1,230 @@
+import asyncio
+import io
+import json
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.services.eval import sidecar
+from app.services.eval.sidecar import (
+    EvalSidecar,
+    EvalSidecarError,
+    classify_paths,
+    encode_sidecar_message,
+    run_sidecar,
+    sidecar_environment,
+)
+from app.services.eval.tensor_cache import PreprocessedTensorCache
+
+
+class _FakeClassifier:
+    def __init__(self):
+        self.calls = 0
+        self.shut_down = False
+
+    def classify(self, image):
+        self.calls += 1
+        return [{"label": f"bird-{i}", "score": 0.9 - i * 0.1} for i in range(7)]
+
+    def get_status(self):
+        return {"active_provider": "cpu"}
+
+    async def shutdown(self):
+        self.shut_down = True
+
+
+def _lines(buffer: io.BytesIO) -> list[dict]:
+    return [json.loads(line) for line in buffer.getvalue().splitlines() if line.strip()]
+
+
+def test_sidecar_environment_caps_thread_pools():
+    env = sidecar_environment(2)
+
+    assert env["OMP_NUM_THREADS"] == "2"
+    assert env["OPENBLAS_NUM_THREADS"] == "2"
+    assert env["MODEL_EVAL_SIDECAR_CPU_LIMIT"] == "2"
+
+
+def test_run_sidecar_serves_batches_with_top5_and_latency(tmp_path, monkeypatch):
+    image_path = tmp_path / "bird.jpg"
+    Image.new("RGB", (8, 8), color="red").save(image_path)
+    classifier = _FakeClassifier()
+    monkeypatch.setattr(sidecar, "apply_cpu_cap", lambda *_args: [3])
+    monkeypatch.setattr(sidecar, "_load_candidate", lambda model_id: (classifier, {"model_id": model_id}))
+    stdin = io.BytesIO(
+        encode_sidecar_message({"type": "classify_batch", "paths": [str(image_path), str(tmp_path / "missing.jpg")]})
+        + encode_sidecar_message({"type": "shutdown"})
+    )
+    stdout = io.BytesIO()
+
+    assert run_sidecar("candidate", stdin=stdin, stdout=stdout) == 0
+
+    ready, batch, closed = _lines(stdout)
+    assert ready["type"] == "ready"
+    assert ready["spec"] == {"model_id": "candidate"}
+    assert ready["cpu_affinity"] == [3]
+    assert batch["type"] == "batch_result"
+    first, second = batch["items"]
+    assert len(first["top5"]) == 5
+    assert first["latency_ms"] >= 0
+    assert second["error"].startswith("image_open_failed")
+    assert closed == {"type": "closed", "status": {"active_provider": "cpu"}}
+    assert classifier.calls == 1
+    assert classifier.shut_down is True
+
+
+def test_run_sidecar_reports_load_failure(monkeypatch):
+    def _fail(model_id):
+        raise EvalSidecarError(f"model spec resolved to 'mobilenet_v2_birds' instead of {model_id!r}")
+
+    monkeypatch.setattr(sidecar, "apply_cpu_cap", lambda *_args: None)
+    monkeypatch.setattr(sidecar, "_load_candidate", _fail)
+    stdout = io.BytesIO()
+
+    assert run_sidecar("candidate", stdin=io.BytesIO(), stdout=stdout) == 1
+    assert _lines(stdout)[0]["type"] == "error"
+
+
+class _FakeStdin:
+    def __init__(self, process):
+        self.process = process
+
+    def write(self, data):
+        self.process.requests.append(json.loads(data))
+
+    async def drain(self):
+        return None
+
+
+class _FakeProcess:
+    def __init__(self, responses):
+        self.requests: list[dict] = []
+        self.returncode = None
+        self.stdin = _FakeStdin(self)
+        self.stdout = asyncio.StreamReader()
+        for response in responses:
+            self.stdout.feed_data(response)
+        self.stdout.feed_eof()
+
+    async def wait(self):
+        self.returncode = 0
+        return 0
+
+    def kill(self):
+        self.returncode = -9
+
+
+@pytest.mark.asyncio
+async def test_eval_sidecar_client_round_trip_skips_stdout_noise():
+    process = _FakeProcess(
+        [
+            b"OpenVINO banner\n",
+            encode_sidecar_message({"type": "ready", "spec": {"model_id": "candidate"}}),
+            encode_sidecar_message({"type": "batch_result", "items": [{"path": "a.jpg", "latency_ms": 4.0}]}),
+            encode_sidecar_message({"type": "closed", "status": {"active_provider": "cpu"}}),
+        ]
+    )
+
+    async def factory(*, model_id, cpu_limit, tensor_cache_dir):
+        assert tensor_cache_dir is None
+        assert model_id == "candidate"
+        assert cpu_limit == 1
+        return process
+
+    client = EvalSidecar("candidate", cpu_limit=1, process_factory=factory)
+    ready = await client.start()
+    items = await client.classify_batch(["a.jpg"])
+    final = await client.close()
+
+    assert ready["spec"]["model_id"] == "candidate"
+    assert items == [{"path": "a.jpg", "latency_ms": 4.0}]
+    assert final["status"] == {"active_provider": "cpu"}
+    assert [request["type"] for request in process.requests] == ["classify_batch", "shutdown"]
+
+
+@pytest.mark.asyncio
+async def test_eval_sidecar_start_raises_on_child_error():
+    process = _FakeProcess([encode_sidecar_message({"type": "error", "error": "model is not installed"})])
+
+    async def factory(**_kwargs):
+        return process
+
+    with pytest.raises(EvalSidecarError, match="not installed"):
+        await EvalSidecar("candidate", process_factory=factory).start()
+
+
+class _TensorBird:
+    def __init__(self):
+        self.preprocessed = 0
+        self.tensor_calls = 0
+
+    def preprocessing_plan(self):
+        return {"runtime": "nchw_float32", "input_size": 2}
+
+    def preprocess(self, image):
+        self.preprocessed += 1
+        return np.zeros((1, 3, 2, 2), dtype=np.float32)
+
+    def classify_tensor(self, tensor, top_k=5):
+        self.tensor_calls += 1
+        return [{"label": "Pica pica", "score": 0.8}]
+
+
+class _TensorClassifier(_FakeClassifier):
+    def __init__(self, bird):
+        super().__init__()
+        self._models = {"bird": bird}
+
+    def _resolve_bird_classification_image(self, image):
+        return image, {}
+
+
+def test_classify_paths_reuses_preprocessed_tensors_across_models(tmp_path):
+    image_path = tmp_path / "bird.jpg"
+    Image.new("RGB", (8, 8), color="red").save(image_path)
+    cache_dir = tmp_path / "cache"
+    first_bird, second_bird = _TensorBird(), _TensorBird()
+
+    first_cache = PreprocessedTensorCache(cache_dir)
+    first = classify_paths(_TensorClassifier(first_bird), [str(image_path)], tensor_cache=first_cache)
+    first_cache.flush()
+    second_cache = PreprocessedTensorCache(cache_dir)
+    second = classify_paths(_TensorClassifier(second_bird), [str(image_path)], tensor_cache=second_cache)
+
+    assert first[0]["tensor_cache"] == "miss"
+    assert second[0]["tensor_cache"] == "hit"
+    assert second[0]["top5"] == [{"label": "Pica pica", "score": 0.8}]
+    assert (first_bird.preprocessed, second_bird.preprocessed) == (1, 0)
+    assert second_bird.tensor_calls == 1
+    assert second_cache.stats()["hits"] == 1
+
+
+def test_classify_paths_times_inference_alone_with_and_without_cache(tmp_path):
+    image_path = tmp_path / "bird.jpg"
+    Image.new("RGB", (8, 8), color="red").save(image_path)
+    bird = _TensorBird()
+
+    uncached = classify_paths(_TensorClassifier(bird), [str(image_path)])
+    cache = PreprocessedTensorCache(tmp_path / "cache")
+    miss, hit = (classify_paths(_TensorClassifier(bird), [str(image_path)], tensor_cache=cache) for _ in range(2))
+
+    # Every path times classify_tensor; decode/crop/preprocess is reported apart.
+    assert bird.tensor_calls == 3
+    assert uncached[0]["preprocess_ms"] >= 0 and "tensor_cache" not in uncached[0]
+    assert miss[0]["tensor_cache"] == "miss" and miss[0]["preprocess_ms"] >= 0
+    assert hit[0]["tensor_cache"] == "hit" and hit[0]["preprocess_ms"] == 0.0
+    assert all(item[0]["latency_ms"] >= 0 for item in (uncached, miss, hit))
+
+
+def test_crop_plan_tracks_crop_detector_and_policy(monkeypatch):
+    from app.services.bird_crop_service import bird_crop_service
+
+    monkeypatch.setattr(bird_crop_service, "get_model_fingerprint", lambda: {"fast": ["a.onnx", 1, 1]})
+    monkeypatch.setattr(bird_crop_service, "get_classification_candidate_crop_policy", lambda: {"tier": "fast"})
+    before = sidecar._crop_plan({"crop_generator": {"enabled": True}})
+    monkeypatch.setattr(bird_crop_service, "get_model_fingerprint", lambda: {"fast": ["b.onnx", 2, 2]})
+    after = sidecar._crop_plan({"crop_generator": {"enabled": True}})
+
+    assert before["crop_policy"] == {"tier": "fast"}
+    assert before != after
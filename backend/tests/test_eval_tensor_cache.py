@@ -0,0 +1,64 @@
+import numpy as np
+
+from app.services.eval.tensor_cache import PreprocessedTensorCache, image_key, plan_key
+
+
+PLAN = {"runtime": "nchw_float32", "input_size": 4, "preprocessing": {"resize_mode": "letterbox"}}
+
+
+def _tensor(value: float) -> np.ndarray:
+    return np.full((1, 3, 4, 4), value, dtype=np.float32)
+
+
+def test_image_key_is_content_addressed(tmp_path):
+    first = tmp_path / "a.jpg"
+    second = tmp_path / "b.jpg"
+    first.write_bytes(b"same bytes")
+    second.write_bytes(b"same bytes")
+
+    assert image_key(first) == image_key(second)
+
+
+def test_plan_key_ignores_dict_ordering_but_not_values():
+    reordered = {"preprocessing": {"resize_mode": "letterbox"}, "input_size": 4, "runtime": "nchw_float32"}
+
+    assert plan_key(PLAN) == plan_key(reordered)
+    assert plan_key(PLAN) != plan_key({**PLAN, "input_size": 8})
+
+
+def test_tensors_round_trip_through_memory_mapped_shards(tmp_path):
+    writer = PreprocessedTensorCache(tmp_path, shard_rows=2)
+    for index in range(3):
+        writer.put(f"img-{index}", PLAN, _tensor(float(index)))
+    writer.flush()
+
+    reader = PreprocessedTensorCache(tmp_path)
+    restored = reader.get("img-2", PLAN)
+
+    assert restored is not None
+    assert restored.shape == (1, 3, 4, 4)
+    assert float(restored[0, 0, 0, 0]) == 2.0
+    assert reader.get("img-1", {**PLAN, "input_size": 8}) is None
+    assert reader.stats() == {"hits": 1, "misses": 1, "stored": 0, "reuse_ratio": 0.5}
+    assert sorted(path.name for path in (tmp_path / plan_key(PLAN)).glob("shard-*.npy")) == [
+        "shard-00000.npy",
+        "shard-00001.npy",
+    ]
+
+
+def test_pending_tensors_are_served_before_flush(tmp_path):
+    cache = PreprocessedTensorCache(tmp_path)
+    cache.put("img", PLAN, _tensor(1.0))
+
+    assert cache.get("img", PLAN) is not None
+    assert not (tmp_path / plan_key(PLAN)).exists()
+
+
+def test_prune_drops_oldest_plans_first(tmp_path):
+    cache = PreprocessedTensorCache(tmp_path)
+    cache.put("img", PLAN, _tensor(1.0))
+    cache.put("img", {**PLAN, "input_size": 8}, _tensor(1.0))
+    cache.flush()
+
+    assert cache.prune(max_bytes=0) == 2
+    assert cache.get("img", PLAN) is None
@@ -1714,3 +1714,116 @@ def test_record_stage_failure_defaults_unknown_exception_type():
 
     kwargs = mock_history.record.call_args.kwargs
     assert kwargs["context"]["error_type"] == "UnknownError"
+
+
+def _refresh_payload(event_type: str, *, top_score: float, frame_time: float, snapshot_score: float) -> bytes:
+    return (
+        '{"type":"%s","after":{"id":"evt-refresh-1","label":"bird","camera":"cam1","start_time":1700000000,'
+        '"top_score":%s,"snapshot":{"frame_time":%s,"score":%s}}}' % (event_type, top_score, frame_time, snapshot_score)
+    ).encode()
+
+
+@pytest.mark.asyncio
+async def test_live_event_refresh_classifies_only_improved_updates_and_final_pass():
+    processor = EventProcessor(MagicMock())
+    processor.detection_service.get_detection_by_frigate_event = AsyncMock(return_value=None)
+    processor._classify_snapshot = AsyncMock(return_value=None)  # type: ignore[method-assign]
+    processor._handle_terminal_event_enrichment = AsyncMock()  # type: ignore[method-assign]
+
+    with (
+        patch("app.services.event_processor.settings.classification.live_event_refresh_enabled", True, create=True),
+        patch(
+            "app.services.event_processor.settings.classification.live_event_refresh_min_interval_seconds",
+            300.0,
+            create=True,
+        ),
+    ):
+        # Classification "succeeds" for the baseline so the refresh state is seeded.
+        processor._classify_snapshot.return_value = ([], None, "unavailable")
+        await processor.process_mqtt_message(_refresh_payload("new", top_score=0.7, frame_time=1.0, snapshot_score=0.7))
+        assert processor._classify_snapshot.await_count == 1
+
+        processor.detection_service.get_detection_by_frigate_event = AsyncMock(return_value=MagicMock())
+        # Same snapshot frame and score: skipped.
+        await processor.process_mqtt_message(
+            _refresh_payload("update", top_score=0.7, frame_time=1.0, snapshot_score=0.7)
+        )
+        # New frame but not better, and the interval has not elapsed: skipped.
+        await processor.process_mqtt_message(
+            _refresh_payload("update", top_score=0.7, frame_time=2.0, snapshot_score=0.6)
+        )
+        assert processor._classify_snapshot.await_count == 1
+
+        # Better top score: re-classified.
+        await processor.process_mqtt_message(
+            _refresh_payload("update", top_score=0.9, frame_time=3.0, snapshot_score=0.9)
+        )
+        assert processor._classify_snapshot.await_count == 2
+
+        # End with the same snapshot that was last classified: no final pass.
+        await processor.process_mqtt_message(_refresh_payload("end", top_score=0.9, frame_time=3.0, snapshot_score=0.9))
+        assert processor._classify_snapshot.await_count == 2
+        processor._handle_terminal_event_enrichment.assert_awaited_once()
+
+        status = processor.get_status()["live_event_refresh"]
+
+    assert status["enabled"] is True
+    assert status["refresh_classifications"] == 1
+    assert status["refresh_reasons"] == {"top_score_improved": 1}
+    assert status["classifications_avoided"] == 3
+    assert status["tracked_events"] == 0
+    assert status["recent_completed_events"][0]["event_id"] == "evt-refresh-1"
+    assert status["recent_completed_events"][0]["classifications"] == 2
+    assert status["recent_completed_events"][0]["classifications_avoided"] == 3
+
+
+@pytest.mark.asyncio
+async def test_live_event_refresh_runs_final_pass_when_end_snapshot_changed():
+    processor = EventProcessor(MagicMock())
+    processor.detection_service.get_detection_by_frigate_event = AsyncMock(return_value=None)
+    processor._classify_snapshot = AsyncMock(return_value=([], None, "unavailable"))  # type: ignore[method-assign]
+    processor._handle_terminal_event_enrichment = AsyncMock()  # type: ignore[method-assign]
+
+    with patch("app.services.event_processor.settings.classification.live_event_refresh_enabled", True, create=True):
+        await processor.process_mqtt_message(_refresh_payload("new", top_score=0.8, frame_time=1.0, snapshot_score=0.8))
+        processor.detection_service.get_detection_by_frigate_event = AsyncMock(return_value=MagicMock())
+        await processor.process_mqtt_message(_refresh_payload("end", top_score=0.8, frame_time=5.0, snapshot_score=0.7))
+
+    assert processor._classify_snapshot.await_count == 2
+    assert processor.get_status()["live_event_refresh"]["refresh_reasons"] == {"final_snapshot_changed": 1}
+
+
+@pytest.mark.asyncio
+async def test_live_event_refresh_state_is_cleared_when_final_pass_fails():
+    processor = EventProcessor(MagicMock())
+    processor.detection_service.get_detection_by_frigate_event = AsyncMock(return_value=None)
+    processor._classify_snapshot = AsyncMock(return_value=([], None, "unavailable"))  # type: ignore[method-assign]
+    processor._handle_terminal_event_enrichment = AsyncMock()  # type: ignore[method-assign]
+
+    with patch("app.services.event_processor.settings.classification.live_event_refresh_enabled", True, create=True):
+        await processor.process_mqtt_message(_refresh_payload("new", top_score=0.8, frame_time=1.0, snapshot_score=0.8))
+        assert processor.get_status()["live_event_refresh"]["tracked_events"] == 1
+
+        processor.detection_service.get_detection_by_frigate_event = AsyncMock(return_value=MagicMock())
+        processor._classify_snapshot.side_effect = RuntimeError("classifier down")
+        await processor.process_mqtt_message(_refresh_payload("end", top_score=0.8, frame_time=5.0, snapshot_score=0.7))
+
+        status = processor.get_status()["live_event_refresh"]
+
+    assert processor._classify_snapshot.await_count == 2
+    assert status["tracked_events"] == 0
+    assert status["recent_completed_events"][0]["event_id"] == "evt-refresh-1"
+
+
+@pytest.mark.asyncio
+async def test_live_event_refresh_disabled_keeps_updates_ingest_only():
+    processor = EventProcessor(MagicMock())
+    processor.detection_service.get_detection_by_frigate_event = AsyncMock(return_value=MagicMock())
+    processor._classify_snapshot = AsyncMock()  # type: ignore[method-assign]
+
+    await processor.process_mqtt_message(_refresh_payload("update", top_score=0.99, frame_time=9.0, snapshot_score=0.9))
+
+    processor._classify_snapshot.assert_not_awaited()
+    status = processor.get_status()["live_event_refresh"]
+    assert status["enabled"] is False
+    assert status["classifications_avoided"] == 0
@@ -0,0 +1,114 @@
+import pytest
+
+from app.services import media_cache as media_cache_module
+from app.services.classifier_service import _select_tracked_video_frame_indices
+from app.services.event_track_index import EventTrackIndex, EventTrackIndexStore
+from app.services.video_preview_service import VideoPreviewService
+
+
+def _event(path_data, *, box=(0.40, 0.40, 0.20, 0.20), start_time=100.0, end_time=110.0):
+    return {
+        "start_time": start_time,
+        "end_time": end_time,
+        "data": {"box": list(box), "path_data": path_data},
+    }
+
+
+def test_track_points_carry_boxes_area_and_in_view_flags():
+    index = EventTrackIndex.from_event_data(
+        _event(
+            [
+                [[0.50, 0.60], 101.0],
+                [[0.05, 0.60], 104.0],  # box would hang off the left edge
+                [[0.50, 1.00], 106.0],  # box sits on the bottom edge
+            ]
+        )
+    )
+
+    assert index is not None
+    assert [point.in_view for point in index.points] == [True, False, False]
+    assert index.points[0].box == pytest.approx((0.40, 0.40, 0.20, 0.20))
+    assert index.points[1].box == pytest.approx((0.0, 0.40, 0.20, 0.20))
+    assert index.points[0].area == pytest.approx(0.04)
+    assert index.box_at(101.5, max_distance_seconds=0.75) == pytest.approx([0.40, 0.40, 0.20, 0.20])
+    assert index.box_at(102.5, max_distance_seconds=0.75) is None
+    assert EventTrackIndex.from_dict(index.to_dict()) == index
+
+
+def test_track_without_path_data_is_absent():
+    assert EventTrackIndex.from_event_data({"start_time": 100.0, "data": {"box": [0.1, 0.1, 0.2, 0.2]}}) is None
+    assert EventTrackIndex.from_event_data(None) is None
+
+
+def test_visible_frames_exclude_the_stretch_nearest_an_edge_clipped_point():
+    index = EventTrackIndex.from_event_data(
+        _event(
+            [
+                [[0.50, 0.60], 101.0],
+                [[0.50, 0.60], 103.0],
+                [[0.05, 0.60], 105.0],
+                [[0.50, 0.60], 107.0],
+            ]
+        )
+    )
+
+    assert index.visible_spans() == [(100.0, 104.0), (106.0, 110.0)]
+    assert index.visible_frame_ranges(clip_start=100.0, fps=10.0, frame_count=80) == [(0, 40), (60, 79)]
+
+
+def test_video_sampling_only_decodes_frames_where_the_bird_is_in_view():
+    index = EventTrackIndex.from_event_data(
+        _event([[[0.50, 0.60], 102.0], [[0.02, 0.60], 104.0]], start_time=100.0, end_time=106.0)
+    )
+
+    indices = _select_tracked_video_frame_indices(
+        index,
+        clip_start=100.0,
+        fps=10.0,
+        total_frames=60,
+        sample_count=30,
+    )
+
+    # In view from the event start until halfway to the edge-clipped point.
+    assert indices is not None
+    assert all(0 <= frame <= 30 for frame in indices)
+    # 31 in-view frames, sampled at most once per 0.25 s (two frames at 10 fps).
+    assert len(indices) == 16
+    for track, clip_start in ((None, 100.0), (index, 200.0)):
+        assert (
+            _select_tracked_video_frame_indices(
+                track, clip_start=clip_start, fps=10.0, total_frames=60, sample_count=30
+            )
+            is None
+        )
+
+
+def test_preview_tiles_move_towards_in_view_moments_within_their_slot():
+    index = EventTrackIndex.from_event_data(
+        _event([[[0.02, 0.60], 100.5], [[0.50, 0.60], 104.0], [[0.02, 0.60], 109.5]])
+    )
+
+    aligned = VideoPreviewService()._track_aligned_timestamps([0.0, 5.0, 10.0], 10.0, index)
+
+    # Only 102.25..106.75 is in view; the last tile is further than half a slot away.
+    assert aligned == pytest.approx([2.25, 5.0, 10.0])
+    aligned = VideoPreviewService()._track_aligned_timestamps([0.0, 2.0, 4.0, 6.0, 8.0], 8.0, index)
+    assert aligned == pytest.approx([0.0, 2.25, 4.0, 6.0, 8.0])
+
+
+@pytest.mark.asyncio
+async def test_store_persists_the_index_recorded_at_event_end(tmp_path, monkeypatch):
+    previews = tmp_path / "previews"
+    previews.mkdir()
+    monkeypatch.setattr(media_cache_module, "PREVIEWS_DIR", previews)
+    event_data = _event([[[0.50, 0.60], 101.0], [[0.60, 0.70], 103.0]])
+
+    recorded = await EventTrackIndexStore().record_event_end("evt-track", event_data)
+
+    assert recorded is not None
+    assert (previews / "evt-track.track").exists()
+    # A fresh store (e.g. after a restart) reads the cached index without event data.
+    assert EventTrackIndexStore().get_sync("evt-track") == recorded
+    assert EventTrackIndexStore().get_sync("evt-unknown") is None
+    await media_cache_module.media_cache.delete_cached_media("evt-track")
+    assert not (previews / "evt-track.track").exists()
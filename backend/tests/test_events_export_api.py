@@ -0,0 +1,96 @@
+import csv
+import io
+import json
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+
+from app.main import app
+from app.database import get_db, init_db, close_db
+from app.services import detection_export
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_test_db():
+    await init_db()
+    try:
+        async with get_db() as db:
+            await db.execute("DELETE FROM detections")
+            await db.execute("DELETE FROM taxonomy_cache WHERE taxa_id = 12727")
+            await db.execute("DELETE FROM taxonomy_translations WHERE taxa_id = 12727")
+            await db.execute(
+                """
+                INSERT INTO detections (frigate_event, camera_name, detection_time, detection_index, score,
+                                        display_name, category_name, scientific_name, common_name, taxa_id, is_hidden)
+                VALUES
+                ('export_3', 'cam1', '2026-01-20 08:00:00', 1, 0.7, 'Robin', 'Robin', 'Turdus migratorius', 'Robin', 12727, 0),
+                ('export_1', 'cam1', '2026-01-01 10:00:00', 1, 0.9, 'Robin', 'Robin', 'Turdus migratorius', 'Robin', 12727, 0),
+                ('export_2', 'cam2', '2026-01-01 10:00:00', 1, 0.8, 'Robin', 'Robin', 'Turdus migratorius', 'Robin', 12727, 0),
+                ('export_hidden', 'cam1', '2026-01-05 10:00:00', 1, 0.9, 'Robin', 'Robin', 'Turdus migratorius', 'Robin', 12727, 1)
+                """
+            )
+            await db.execute(
+                "INSERT INTO taxonomy_cache (scientific_name, common_name, taxa_id) "
+                "VALUES ('Turdus migratorius', 'American Robin', 12727)"
+            )
+            await db.execute(
+                "INSERT INTO taxonomy_translations (taxa_id, language_code, common_name) "
+                "VALUES (12727, 'de', 'Wanderdrossel')"
+            )
+            await db.commit()
+        yield
+    finally:
+        async with get_db() as db:
+            await db.execute("DELETE FROM taxonomy_cache WHERE taxa_id = 12727")
+            await db.execute("DELETE FROM taxonomy_translations WHERE taxa_id = 12727")
+            await db.commit()
+        await close_db()
+
+
+def _ndjson(text: str) -> list[dict]:
+    return [json.loads(line) for line in text.splitlines() if line]
+
+
+@pytest.mark.asyncio
+async def test_export_streams_ndjson_oldest_first_across_shards(monkeypatch):
+    monkeypatch.setattr(detection_export, "EXPORT_SHARD_DAYS", 1)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        res = await client.get("/api/events/export", headers={"Accept-Language": "de"})
+
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    records = _ndjson(res.text)
+    # Same-time rows are ordered by id; hidden rows follow get_all's default.
+    assert [r["frigate_event"] for r in records] == ["export_1", "export_2", "export_3"]
+    assert {r["common_name"] for r in records} == {"Wanderdrossel"}
+    assert records[0]["detection_time"] == "2026-01-01T10:00:00Z"
+
+
+@pytest.mark.asyncio
+async def test_export_resumes_after_cursor_and_applies_filters():
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        first = _ndjson((await client.get("/api/events/export")).text)
+        resumed = await client.get("/api/events/export", params={"after": first[0]["export_cursor"]})
+        camera = await client.get("/api/events/export", params={"camera": "cam2", "include_hidden": "true"})
+        bad = await client.get("/api/events/export", params={"after": "not-a-cursor"})
+
+    assert [r["frigate_event"] for r in _ndjson(resumed.text)] == ["export_2", "export_3"]
+    assert [r["frigate_event"] for r in _ndjson(camera.text)] == ["export_2"]
+    assert bad.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_export_csv_has_header_and_english_names_by_default():
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        res = await client.get(
+            "/api/events/export",
+            params={"format": "csv", "start_date": "2026-01-01", "end_date": "2026-01-10", "include_hidden": "true"},
+        )
+
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(res.text)))
+    assert [row["frigate_event"] for row in rows] == ["export_1", "export_2", "export_hidden"]
+    assert rows[0]["common_name"] == "American Robin"
+    assert list(rows[0]) == list(detection_export.EXPORT_FIELDS)
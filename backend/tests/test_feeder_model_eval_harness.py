@@ -186,10 +186,13 @@ def test_diagnostic_overrides_and_active_model_restored_after_evaluation_failure
         _diagnostic_crop_model_overrides = {"medium_birds": "on"}
         _diagnostic_crop_source_overrides = {"medium_birds": "high_quality"}
 
-        async def activate_model(self, model_id: str) -> bool:
+        def select_model_for_process(self, model_id: str) -> bool:
             self.active_model_id = model_id
             return True
 
+        async def activate_model(self, model_id: str) -> bool:
+            raise AssertionError("harness must not persist the active model")
+
     settings = _Settings()
     manager = _Manager()
 
@@ -2386,7 +2386,15 @@ async def test_generate_candidates_uses_stored_top_frames_when_present(tmp_path,
 
     used_indices: list[int] = []
 
-    def fake_extract(clip_path, *, event_id, event_data=None, clip_variant="event", override_frame_indices=None):
+    def fake_extract(
+        clip_path,
+        *,
+        event_id,
+        event_data=None,
+        clip_variant="event",
+        override_frame_indices=None,
+        on_frame_candidates=None,
+    ):
         if override_frame_indices is not None:
             used_indices.extend(override_frame_indices)
         return []
@@ -2417,7 +2425,15 @@ async def test_generate_candidates_falls_back_when_no_stored_top_frames(tmp_path
 
     used_override: list = []
 
-    def fake_extract(clip_path, *, event_id, event_data=None, clip_variant="event", override_frame_indices=None):
+    def fake_extract(
+        clip_path,
+        *,
+        event_id,
+        event_data=None,
+        clip_variant="event",
+        override_frame_indices=None,
+        on_frame_candidates=None,
+    ):
         used_override.append(override_frame_indices)
         return []
 
@@ -2432,3 +2448,109 @@ async def test_generate_candidates_falls_back_when_no_stored_top_frames(tmp_path
 
     assert len(used_override) == 1
     assert used_override[0] is None  # fallback: no override, use default logic
+
+
+@pytest.mark.asyncio
+async def test_generate_candidates_scores_each_frame_as_one_batch_while_extracting(monkeypatch):
+    import threading
+
+    from app.services import classifier_service as classifier_module
+
+    service = hq_module.HighQualitySnapshotService()
+    first_frame_scored = threading.Event()
+    batch_sizes: list[int] = []
+
+    async def classify_batch_async_background(images, *, input_contexts, queue_timeout_seconds):
+        batch_sizes.append(len(images))
+        assert [context["is_cropped"] for context in input_contexts] == [False, True][: len(images)]
+        first_frame_scored.set()
+        return [[{"label": "Robin", "score": 0.5 + 0.1 * index, "index": 7}] for index in range(len(images))]
+
+    monkeypatch.setattr(
+        classifier_module,
+        "_classifier_instance",
+        SimpleNamespace(classify_batch_async_background=classify_batch_async_background),
+    )
+
+    async def no_preferred(event_id, *, clip_variant):
+        return None
+
+    async def no_expected_labels(event_id):
+        return set()
+
+    def payload(frame_index: int, source_mode: str, color: str) -> dict:
+        return {
+            "candidate_id": f"evt-batch__{frame_index}__{source_mode}",
+            "frame_index": frame_index,
+            "source_mode": source_mode,
+            "thumbnail_ref": f"evt-batch__{frame_index}__{source_mode}__thumb",
+            "image_ref": f"evt-batch__{frame_index}__{source_mode}__image",
+            "image": Image.new("RGB", (48, 48), color=color),
+        }
+
+    overlapped: list[bool] = []
+
+    def fake_extract(
+        clip_path,
+        *,
+        event_id,
+        event_data=None,
+        clip_variant="event",
+        override_frame_indices=None,
+        on_frame_candidates=None,
+    ):
+        first = [payload(3, "full_frame", "green"), payload(3, "frigate_hint_crop", "blue")]
+        on_frame_candidates(first)
+        # The first frame is scored while this thread is still "decoding" the next one.
+        overlapped.append(first_frame_scored.wait(timeout=5))
+        second = [payload(9, "full_frame", "red")]
+        on_frame_candidates(second)
+        return [*first, *second]
+
+    monkeypatch.setattr(service, "_load_preferred_frame_indices", no_preferred)
+    monkeypatch.setattr(service, "_load_expected_species_labels", no_expected_labels)
+    monkeypatch.setattr(service, "_extract_snapshot_candidate_payloads_from_clip_path", fake_extract)
+
+    bundle = await service.generate_snapshot_candidates_from_clip_bytes("evt-batch", b"clip-bytes")
+
+    assert overlapped == [True]
+    assert batch_sizes == [2, 1]
+    assert {candidate["frame_index"] for candidate in bundle["candidates"]} == {3, 9}
+    for candidate in bundle["candidates"]:
+        assert "image" not in candidate
+        assert candidate["image_bytes"].startswith(b"\xff\xd8")
+        assert candidate["thumbnail_bytes"].startswith(b"\xff\xd8")
+    scores = {candidate["candidate_id"]: candidate["classifier_score"] for candidate in bundle["candidates"]}
+    assert scores["evt-batch__3__frigate_hint_crop"] == pytest.approx(0.6)
+    assert bundle["selected_candidate"] is not None
+
+
+@pytest.mark.asyncio
+async def test_status_reports_end_to_end_latency_for_replaced_snapshots(tmp_path, monkeypatch):
+    cache_service = _make_cache_service(tmp_path, monkeypatch)
+    await cache_service.cache_snapshot("evt_latency", b"frigate-bytes")
+    monkeypatch.setattr(settings.media_cache, "high_quality_event_snapshots", True, raising=False)
+    service = hq_module.HighQualitySnapshotService()
+
+    async def fake_generate(event_id, clip_bytes, event_data=None, clip_variant="event"):
+        await asyncio.sleep(0.02)
+        return {
+            "selected_candidate": {
+                "candidate_id": "cand-latency",
+                "image_bytes": _jpeg_bytes("green", size=(40, 40)),
+                "source_mode": "full_frame",
+                "snapshot_source": "hq_candidate_full_frame",
+            },
+            "candidates": [],
+        }
+
+    monkeypatch.setattr(service, "generate_snapshot_candidates_from_clip_bytes", fake_generate)
+    monkeypatch.setattr(service, "_persist_snapshot_candidates", AsyncMock())
+
+    assert service.get_status()["latency_seconds"]["samples"] == 0
+    assert await service.replace_from_clip_bytes("evt_latency", b"clip-bytes") == "replaced"
+
+    latency = service.get_status()["latency_seconds"]
+    assert latency["samples"] == 1
+    assert latency["end_to_end"]["last"] >= 0.02
+    assert latency["processing"]["p50"] == latency["processing"]["p95"] == latency["processing"]["last"]
@@ -0,0 +1,92 @@
+import builtins
+import json
+import os
+import subprocess
+import sys
+import warnings
+from pathlib import Path
+
+from app.utils.import_profile import ImportProfiler
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_import_profiler_reports_cumulative_and_self_time_and_restores_import(tmp_path, monkeypatch):
+    package = tmp_path / "profiled_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("from . import leaf\n", encoding="utf-8")
+    (package / "leaf.py").write_text("import time\ntime.sleep(0.02)\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    original_import = builtins.__import__
+
+    profiler = ImportProfiler()
+    profiler.start()
+    try:
+        import profiled_pkg  # noqa: F401
+    finally:
+        report = profiler.stop()
+        for name in ("profiled_pkg", "profiled_pkg.leaf"):
+            sys.modules.pop(name, None)
+
+    assert builtins.__import__ is original_import
+    by_module = {entry["module"]: entry for entry in report["slowest"]}
+    assert by_module["profiled_pkg.leaf"]["cumulative_ms"] >= 20.0
+    assert by_module["profiled_pkg"]["cumulative_ms"] >= by_module["profiled_pkg.leaf"]["cumulative_ms"]
+    assert by_module["profiled_pkg"]["self_ms"] < by_module["profiled_pkg.leaf"]["cumulative_ms"]
+    assert profiler.stop() == report
+
+
+def test_web_shell_import_defers_inference_stacks_and_classifier_construction():
+    """Cold-start regression guard: importing app.main must stay free of inference stacks."""
+    probe = (
+        "import json, sys\n"
+        "import app.main\n"
+        "from app.services import classifier_service\n"
+        "from app.services.startup_status import startup_status\n"
+        "print(json.dumps({\n"
+        "    'profile': startup_status.snapshot()['import_profile'],\n"
+        "    'classifier_built': classifier_service._classifier_instance is not None,\n"
+        "    'lazy_heavy': [m for m in ('numpy', 'cv2', 'PIL.Image') if m in sys.modules],\n"
+        "}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=BACKEND_ROOT,
+        env={**os.environ, "PYTHONWARNINGS": "ignore"},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    payload = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert payload["classifier_built"] is False
+    assert payload["lazy_heavy"] == []
+    assert payload["profile"]["heavy_modules_loaded"] == []
+    assert payload["profile"]["modules_imported"] > 0
+    assert payload["profile"]["total_ms"] > 0
+
+
+def test_untraced_profile_leaves_import_untouched_and_still_counts_modules(tmp_path, monkeypatch):
+    (tmp_path / "untraced_leaf.py").write_text(
+        "import warnings\nwarnings.warn('leaf', stacklevel=2)\n", encoding="utf-8"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    original_import = builtins.__import__
+
+    profiler = ImportProfiler()
+    profiler.start(trace=False)
+    try:
+        assert builtins.__import__ is original_import
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            import untraced_leaf  # noqa: F401
+    finally:
+        report = profiler.stop()
+        sys.modules.pop("untraced_leaf", None)
+
+    # An import-time warning aimed at the importer is not attributed to a profiling hook.
+    assert Path(caught[0].filename) == Path(__file__)
+    assert report["traced"] is False
+    assert report["slowest"] == []
+    assert report["modules_imported"] >= 1
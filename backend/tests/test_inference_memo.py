@@ -0,0 +1,133 @@
+import dataclasses
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from PIL import Image
+
+from app.database import close_db, init_db
+from app.services.classifier_service import ClassifierService
+from app.services.inference_memo import InferenceMemoKey, InferenceMemoService, inference_memo
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def db():
+    await init_db()
+    await inference_memo.clear()
+    inference_memo.reset_stats()
+    yield
+    await inference_memo.clear()
+    inference_memo.reset_stats()
+    await close_db()
+
+
+def _stub_init_bird_model(self):
+    self._models["bird"] = MagicMock(loaded=True, error=None, labels=[])
+
+
+@pytest_asyncio.fixture
+async def service(tmp_path):
+    model_path = tmp_path / "model.onnx"
+    model_path.write_bytes(b"weights-v1")
+    labels_path = tmp_path / "labels.txt"
+    labels_path.write_text("Robin\nWren\n")
+    with patch.object(ClassifierService, "_init_bird_model", new=_stub_init_bird_model):
+        classifier = ClassifierService()
+    classifier._image_execution_mode = "in_process"
+    spec = {"model_id": "birds", "model_path": str(model_path), "labels_path": str(labels_path), "input_size": 224}
+    with patch.object(classifier, "_resolve_active_bird_model_spec", return_value=spec):
+        yield classifier, model_path
+    await classifier.shutdown()
+
+
+def _counting_inference(results):
+    calls = []
+
+    async def run(*args, **kwargs):
+        calls.append(args)
+        return [dict(result) for result in results]
+
+    return run, calls
+
+
+@pytest.mark.asyncio
+async def test_unchanged_image_reuses_the_memo_until_the_model_artifact_changes(service):
+    classifier, model_path = service
+    run, calls = _counting_inference([{"label": "Robin", "score": 0.91, "index": 0}, {"label": "Wren", "score": 0.05}])
+    image = Image.new("RGB", (64, 48), "red")
+
+    with patch.object(classifier, "_run_coordinated_executor_inference", side_effect=run):
+        first = await classifier.classify_async_background(image, memoize=True)
+        # A re-decoded copy of the same pixels is the same media.
+        second = await classifier.classify_async_background(image.copy(), memoize=True)
+        await classifier.classify_async_background(Image.new("RGB", (64, 48), "blue"), memoize=True)
+        await classifier.classify_async_background(image)
+        assert len(calls) == 3
+
+        model_path.write_bytes(b"weights-v2-retrained")
+        changed = await classifier.classify_async_background(image, memoize=True)
+
+    assert first == second == changed
+    assert second[0] == {"label": "Robin", "score": 0.91, "index": 0}
+    assert len(calls) == 4
+    status = inference_memo.get_status()
+    assert (status["hits"], status["misses"], status["stores"]) == (1, 3, 3)
+    assert status["hit_rate"] == 0.25
+
+
+@pytest.mark.asyncio
+async def test_memoized_video_replays_frame_progress_and_diagnostics(service, tmp_path):
+    classifier, _model_path = service
+    clip = tmp_path / "clip.mp4"
+    clip.write_bytes(b"clip-bytes")
+    runs = []
+
+    async def fake_video_inference(video_path, stride, max_frames, progress_callback, input_context, **_kwargs):
+        runs.append(video_path)
+        for frame in (1, 2):
+            await progress_callback(frame, 2, 0.4 * frame, "Robin", "thumb", frame * 10, 50, "birds", frame * 0.5)
+        return [{"label": "Robin", "score": 0.8}, {"_video_diagnostics": {"frames_classified": 2}}]
+
+    async def classify(progress, diagnostics):
+        async def on_progress(*args):
+            progress.append(args)
+
+        return await classifier.classify_video_async(
+            str(clip),
+            max_frames=2,
+            progress_callback=on_progress,
+            diagnostics_callback=diagnostics.append,
+            memoize=True,
+        )
+
+    with patch.object(classifier, "_run_video_inference", side_effect=fake_video_inference):
+        first_progress, first_diagnostics = [], []
+        first = await classify(first_progress, first_diagnostics)
+        replay_progress, replay_diagnostics = [], []
+        replayed = await classify(replay_progress, replay_diagnostics)
+
+    assert len(runs) == 1
+    assert first == replayed == [{"label": "Robin", "score": 0.8}]
+    assert [args[:4] + args[5:] for args in replay_progress] == [args[:4] + args[5:] for args in first_progress]
+    assert [args[4] for args in replay_progress] == [None, None]
+    assert first_diagnostics == [{"frames_classified": 2}]
+    assert replay_diagnostics == [{"frames_classified": 2, "inference_memo": "hit"}]
+
+
+@pytest.mark.asyncio
+async def test_memo_evicts_least_recently_used_rows_above_its_size_bound():
+    memo = InferenceMemoService(max_entries=2, evict_every=1)
+    keys = [InferenceMemoKey("image", uuid.uuid4().hex, "model", "policy") for _ in range(3)]
+
+    await memo.put(keys[0], [{"label": "Robin", "score": 0.9}])
+    await memo.put(keys[1], [{"label": "Wren", "score": 0.8}])
+    assert await memo.get(keys[0]) is not None
+    await memo.put(keys[2], [{"label": "Jay", "score": 0.7}])
+
+    assert await memo.get(keys[1]) is None
+    assert (await memo.get(keys[0])).results == [{"label": "Robin", "score": 0.9}]
+    assert await memo.get(keys[2]) is not None
+    assert memo.get_status()["evictions"] == 1
+    # A video key never answers an image lookup for the same hashes.
+    assert await memo.get(dataclasses.replace(keys[0], kind="video")) is None
@@ -0,0 +1,119 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytest_asyncio
+
+from app.config import settings
+from app.database import get_db
+from app.services.detection_service import DetectionService
+from app.services.taxonomy.label_taxonomy_table import LabelTaxonomyTable
+
+
+@pytest_asyncio.fixture
+async def taxonomy_rows():
+    async with get_db() as db:
+        await db.execute("DELETE FROM taxonomy_cache")
+        await db.execute("DELETE FROM taxonomy_translations")
+        await db.executemany(
+            """INSERT INTO taxonomy_cache (scientific_name, common_name, taxa_id, is_not_found, last_updated)
+               VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)""",
+            [
+                ("Parus major", "Great Tit", 13094, 0),
+                ("Cardinalis cardinalis", "Northern Cardinal", 9083, 0),
+                ("Mystery finch", None, None, 1),
+            ],
+        )
+        await db.execute(
+            "INSERT INTO taxonomy_translations (taxa_id, language_code, common_name) VALUES (?, ?, ?)",
+            (13094, "de", "Kohlmeise"),
+        )
+        await db.commit()
+    yield
+    async with get_db() as db:
+        await db.execute("DELETE FROM taxonomy_cache")
+        await db.execute("DELETE FROM taxonomy_translations")
+        await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_rebuild_resolves_label_set_from_cache_with_aliases_and_translations(taxonomy_rows, monkeypatch):
+    monkeypatch.setattr(settings.notifications, "notification_language", "de")
+    table = LabelTaxonomyTable()
+
+    await table.rebuild(
+        ["Parus major", "Cardinalis cardinalis (Northern Cardinal)", "Mystery finch", "Unseen warbler", "background"],
+        model_key="test-model",
+        resolve_remote=False,
+    )
+
+    great_tit = table.get("parus major")
+    assert great_tit is not None
+    assert great_tit.names() == {"scientific_name": "Parus major", "common_name": "Great Tit", "taxa_id": 13094}
+    assert table.localized_name(great_tit, "de") == "Kohlmeise"
+    assert table.get("Great Tit") is great_tit
+    assert table.get("Cardinalis cardinalis (Northern Cardinal)").taxa_id == 9083
+    assert table.get("Mystery finch").names() == {
+        "scientific_name": "Mystery finch",
+        "common_name": None,
+        "taxa_id": None,
+    }
+    assert table.get("Unseen warbler") is None
+    assert table.status()["unresolved"] == 1
+    assert table.status()["model_key"] == "test-model"
+
+
+@pytest.mark.asyncio
+async def test_remember_is_copy_on_write_and_ignored_before_first_build():
+    table = LabelTaxonomyTable()
+    table.remember("Parus major", {"scientific_name": "Parus major", "common_name": "Great Tit", "taxa_id": 1})
+    assert table.get("Parus major") is None
+
+    await table.rebuild([], model_key="m", resolve_remote=False)
+    before = table._entries
+    table.remember("Parus major", {"scientific_name": "Parus major", "common_name": "Great Tit", "taxa_id": 1})
+
+    assert table.get("Great Tit").taxa_id == 1
+    assert "parus major" not in before
+
+
+@pytest.mark.asyncio
+async def test_save_detection_uses_preloaded_taxonomy_without_lookups(taxonomy_rows, monkeypatch):
+    monkeypatch.setattr(settings.notifications, "notification_language", "de")
+    monkeypatch.setattr(settings.classification, "blocked_labels", [])
+    monkeypatch.setattr(settings.classification, "blocked_species", [])
+    table = LabelTaxonomyTable()
+    await table.rebuild(["Parus major"], model_key="test-model", resolve_remote=False)
+
+    with (
+        patch("app.services.detection_service.label_taxonomy_table", table),
+        patch("app.services.detection_service.taxonomy_service") as taxonomy_service,
+        patch("app.services.detection_service.get_db") as get_db_mock,
+        patch("app.services.detection_service.DetectionRepository") as repo_cls,
+        patch("app.services.detection_service.broadcaster") as broadcaster,
+        patch(
+            "app.services.detection_service.create_background_task", side_effect=lambda coro, name=None: coro.close()
+        ),
+    ):
+        taxonomy_service.get_names = AsyncMock()
+        taxonomy_service.get_localized_common_name = AsyncMock()
+        get_db_mock.return_value.__aenter__.return_value = AsyncMock()
+        repo = repo_cls.return_value
+        repo.upsert_if_higher_score = AsyncMock(return_value=(True, True))
+        repo.get_by_frigate_event = AsyncMock(return_value=None)
+        repo.get_taxonomy_names = AsyncMock(return_value=None)
+        broadcaster.broadcast = AsyncMock()
+
+        changed, inserted = await DetectionService(MagicMock()).save_detection(
+            frigate_event="evt-preloaded",
+            camera="cam1",
+            start_time=1700000000,
+            classification={"label": "Parus major", "score": 0.93, "index": 1},
+        )
+
+    assert (changed, inserted) == (True, True)
+    taxonomy_service.get_names.assert_not_awaited()
+    taxonomy_service.get_localized_common_name.assert_not_awaited()
+    detection = repo.upsert_if_higher_score.await_args.args[0]
+    assert detection.taxa_id == 13094
+    assert detection.common_name == "Great Tit"
+    assert detection.display_name == "Kohlmeise"
@@ -0,0 +1,47 @@
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from app.utils.lazy_imports import LazyModule
+
+
+def test_lazy_module_patch_is_dropped_once_the_real_value_is_restored(monkeypatch: pytest.MonkeyPatch):
+    proxy = LazyModule("json")
+    original_dumps = json.dumps
+
+    monkeypatch.setattr(proxy, "dumps", lambda *_args, **_kwargs: "patched")
+    assert proxy.dumps({}) == "patched"
+    assert json.dumps is original_dumps
+    monkeypatch.undo()
+
+    # Nothing is left on the stand-in to shadow later patches of the real module.
+    assert "dumps" not in vars(proxy)
+    monkeypatch.setattr(json, "dumps", lambda *_args, **_kwargs: "real-patched")
+    assert proxy.dumps({}) == "real-patched"
+    monkeypatch.undo()
+    assert json.dumps is original_dumps
+
+
+def test_lazy_module_mock_patch_leaves_the_real_module_intact():
+    proxy = LazyModule("json")
+    original_dumps = json.dumps
+
+    with patch.object(proxy, "dumps", return_value="mocked"):
+        assert proxy.dumps({}) == "mocked"
+
+    assert json.dumps is original_dumps
+    assert proxy.dumps is original_dumps
+
+
+def test_lazy_module_setattr_does_not_import_the_target():
+    target = "app_lazy_imports_never_imported"
+    proxy = LazyModule(target)
+
+    proxy.flag = "shadow"
+
+    assert proxy.flag == "shadow"
+    assert target not in sys.modules
+    del proxy.flag
+    assert "flag" not in vars(proxy)
@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+from app.services.lifecycle_graph import (
+    LifecyclePhase,
+    critical_path,
+    run_lifecycle_graph,
+    validate_lifecycle_graph,
+)
+
+
+async def _noop() -> None:
+    return None
+
+
+async def _run(phase: LifecyclePhase):
+    return await phase.action()
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_graph_runs_independent_phases_concurrently_after_dependencies():
+    events: list[str] = []
+    both_running = asyncio.Event()
+    running = 0
+
+    def overlapping(name: str):
+        async def action() -> None:
+            nonlocal running
+            events.append(f"{name}:start")
+            running += 1
+            if running == 2:
+                both_running.set()
+            await asyncio.wait_for(both_running.wait(), timeout=1.0)
+            running -= 1
+            events.append(f"{name}:end")
+
+        return action
+
+    async def release() -> None:
+        events.append("release")
+
+    report = await run_lifecycle_graph(
+        [
+            LifecyclePhase("release", release, depends_on=("db", "model")),
+            LifecyclePhase("db", overlapping("db")),
+            LifecyclePhase("model", overlapping("model")),
+        ],
+        _run,
+    )
+
+    assert events[-1] == "release"
+    assert set(report["phases"]) == {"db", "model", "release"}
+    assert report["phases"]["release"]["status"] == "ok"
+    assert report["critical_path"][-1] == "release"
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_graph_non_fatal_failure_does_not_block_dependents():
+    async def runner(phase: LifecyclePhase):
+        return phase.name != "telemetry"
+
+    report = await run_lifecycle_graph(
+        [LifecyclePhase("telemetry", _noop), LifecyclePhase("mqtt", _noop, depends_on=("telemetry",))],
+        runner,
+    )
+
+    assert report["phases"]["telemetry"]["status"] == "degraded"
+    assert report["phases"]["mqtt"]["status"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_graph_fatal_failure_cancels_running_phases_and_reraises():
+    cancelled = asyncio.Event()
+
+    async def slow() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def broken() -> None:
+        await asyncio.sleep(0)
+        raise RuntimeError("db unavailable")
+
+    with pytest.raises(RuntimeError, match="db unavailable"):
+        await run_lifecycle_graph(
+            [
+                LifecyclePhase("db", broken, fatal=True),
+                LifecyclePhase("model", slow),
+                LifecyclePhase("mqtt", _noop, depends_on=("db",)),
+            ],
+            _run,
+        )
+
+    assert cancelled.is_set()
+
+
+def test_critical_path_follows_latest_finishing_dependency():
+    timings = {
+        "db": {"depends_on": [], "finished_ms": 300.0},
+        "model": {"depends_on": [], "finished_ms": 900.0},
+        "reconcile": {"depends_on": [], "finished_ms": 50.0},
+        "classifier": {"depends_on": ["reconcile"], "finished_ms": 950.0},
+        "release": {"depends_on": ["db", "classifier"], "finished_ms": 1000.0},
+    }
+
+    assert critical_path(timings) == ["reconcile", "classifier", "release"]
+
+
+def test_validate_lifecycle_graph_rejects_unknown_dependencies_and_cycles():
+    with pytest.raises(ValueError, match="unknown phase"):
+        validate_lifecycle_graph([LifecyclePhase("mqtt", _noop, depends_on=("db",))])
+    with pytest.raises(ValueError, match="cycle"):
+        validate_lifecycle_graph(
+            [LifecyclePhase("a", _noop, depends_on=("b",)), LifecyclePhase("b", _noop, depends_on=("a",))]
+        )
+
+
+def test_startup_graph_keeps_serving_when_the_classifier_fails_to_load():
+    from app.main import _startup_lifecycle_phases
+
+    phases = {phase.name: phase for phase in _startup_lifecycle_phases()}
+
+    validate_lifecycle_graph(list(phases.values()))
+    assert not phases["classifier_init"].fatal
+    assert [name for name, phase in phases.items() if phase.fatal] == ["db_init"]
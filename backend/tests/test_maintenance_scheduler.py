@@ -0,0 +1,116 @@
+import pytest
+
+import app.services.maintenance_scheduler as scheduler_module
+from app.services.maintenance_coordinator import maintenance_coordinator
+from app.services.maintenance_scheduler import MaintenanceScheduler, MaintenanceTask, SliceResult
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _scheduler(tmp_path, clock: _Clock, pressure=lambda: None) -> MaintenanceScheduler:
+    return MaintenanceScheduler(
+        state_path=tmp_path / "maintenance_state.json",
+        pressure_probe=pressure,
+        sleep=clock.sleep,
+        clock=clock,
+        wall_clock=clock,
+    )
+
+
+def _counting_task(name: str, total: int, per_slice: int, seen: list, *, units_per_second: float = 10.0):
+    async def run_slice(cursor: dict) -> SliceResult:
+        offset = int(cursor.get("offset", 0))
+        processed = min(per_slice, total - offset)
+        seen.append((name, offset))
+        return SliceResult(
+            processed=processed,
+            done=offset + processed >= total,
+            cursor={"offset": offset + processed},
+            stats={"deleted_count": processed},
+        )
+
+    return MaintenanceTask(name, run_slice, units_per_second=units_per_second)
+
+
+@pytest.mark.asyncio
+async def test_run_pass_paces_slices_to_budget_and_resumes_from_persisted_cursor(tmp_path):
+    clock = _Clock()
+    seen: list = []
+    budget = {"slices": 2}
+
+    def should_continue() -> bool:
+        budget["slices"] -= 1
+        return budget["slices"] >= 0
+
+    tasks = [_counting_task("retention", total=25, per_slice=10, seen=seen)]
+    await _scheduler(tmp_path, clock).run_pass(tasks, should_continue=should_continue)
+    assert seen == [("retention", 0), ("retention", 10)]
+    assert clock.sleeps == [1.0, 1.0]  # 10 rows at 10 rows/s
+
+    # A fresh scheduler (i.e. after a restart) picks the pass up at the cursor.
+    resumed = _scheduler(tmp_path, clock)
+    assert await resumed.seconds_until_due(3600) == 0.0
+    progress = await resumed.run_pass(tasks)
+
+    assert seen[-1] == ("retention", 20)
+    assert progress["retention"]["processed"] == 25
+    assert progress["retention"]["stats"] == {"deleted_count": 25}
+    assert await resumed.seconds_until_due(3600) == 3600.0
+
+
+@pytest.mark.asyncio
+async def test_slices_wait_for_low_pressure_but_are_not_starved(tmp_path, monkeypatch):
+    monkeypatch.setattr(scheduler_module, "MAINTENANCE_PRESSURE_POLL_SECONDS", 10.0)
+    monkeypatch.setattr(scheduler_module, "MAINTENANCE_MAX_DEFER_SECONDS", 60.0)
+    clock = _Clock()
+    seen: list = []
+    pressure = {"reason": "mqtt_pressure", "polls": 0}
+
+    def probe():
+        pressure["polls"] += 1
+        return pressure["reason"] if pressure["polls"] <= 3 else None
+
+    await _scheduler(tmp_path, clock, probe).run_pass([_counting_task("media", total=1, per_slice=1, seen=seen)])
+    assert clock.sleeps[:3] == [10.0, 10.0, 10.0]
+    assert seen == [("media", 0)]
+
+    # Sustained pressure: the slice runs once the maximum deferral elapses.
+    starved_clock = _Clock()
+    always = _scheduler(tmp_path / "starved", starved_clock, lambda: "classification_pressure")
+    await always.run_pass([_counting_task("audio", total=1, per_slice=1, seen=seen)])
+    assert seen[-1] == ("audio", 0)
+    assert sum(starved_clock.sleeps) == 60.0
+
+
+@pytest.mark.asyncio
+async def test_failed_task_does_not_block_the_pass_and_progress_reaches_coordinator(tmp_path):
+    clock = _Clock()
+    seen: list = []
+
+    async def broken(cursor: dict) -> SliceResult:
+        raise RuntimeError("disk unavailable")
+
+    disabled = MaintenanceTask("analyze_unknowns", broken, units_per_second=0, enabled=lambda: False)
+    await _scheduler(tmp_path, clock).run_pass(
+        [MaintenanceTask("media_integrity_scan", broken, units_per_second=0), disabled]
+        + [_counting_task("share_link_cleanup", total=1, per_slice=1, seen=seen)]
+    )
+
+    assert seen == [("share_link_cleanup", 0)]
+    scheduled = maintenance_coordinator.get_status_nowait()["scheduled_tasks"]
+    assert scheduled["media_integrity_scan"]["status"] == "failed"
+    assert scheduled["media_integrity_scan"]["error"] == "disk unavailable"
+    assert scheduled["analyze_unknowns"]["status"] == "skipped"
+    assert scheduled["share_link_cleanup"]["status"] == "done"
+    assert scheduled["share_link_cleanup"]["lag_seconds"] == 0.0
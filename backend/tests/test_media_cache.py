@@ -335,3 +335,22 @@ async def test_thumbnail_cache_uses_distinct_key_from_snapshot_cache(tmp_path, m
     assert thumbnail_path == snapshots / f"{event_id}_thumb.jpg"
     assert await service.get_snapshot(event_id) == b"snapshot-bytes"
     assert await service.get_thumbnail(event_id) == b"thumbnail-bytes"
+
+
+@pytest.mark.asyncio
+async def test_pinned_clip_keeps_its_bytes_after_the_cached_clip_is_replaced_or_evicted(tmp_path, monkeypatch):
+    service, _snapshots = _make_service(tmp_path, monkeypatch)
+    pinned_dir = tmp_path / "media_cache" / "clips" / ".pinned"
+    monkeypatch.setattr(media_cache_module, "PINNED_CLIPS_DIR", pinned_dir)
+    original = b"\x00\x00\x00\x18ftypisom" + b"a" * 2048
+
+    clip_path = await service.cache_clip("evt_pin", original)
+    pinned = await service.pin_clip(clip_path)
+
+    await service.cache_clip("evt_pin", b"\x00\x00\x00\x18ftypisom" + b"b" * 4096)
+    assert pinned.read_bytes() == original
+    clip_path.unlink()
+    assert pinned.read_bytes() == original
+
+    assert await service.clear_pinned_clips() == 1
+    assert list(pinned_dir.iterdir()) == []
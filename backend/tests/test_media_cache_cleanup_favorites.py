@@ -67,3 +67,48 @@ async def test_cleanup_old_media_preserves_protected_event_ids(tmp_path, monkeyp
     assert not stale_clip.exists()
     assert not stale_preview.exists()
     assert stats["protected_skipped"] >= 3
+
+
+@pytest.mark.asyncio
+async def test_cleanup_old_media_slice_walks_in_resumable_bounded_slices(tmp_path, monkeypatch):
+    import os
+
+    cache_base = tmp_path / "media_cache"
+    snapshots = cache_base / "snapshots"
+    clips = cache_base / "clips"
+    previews = cache_base / "previews"
+    for directory in (snapshots, clips, previews):
+        directory.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setattr(media_cache_module, "SNAPSHOTS_DIR", snapshots)
+    monkeypatch.setattr(media_cache_module, "CLIPS_DIR", clips)
+    monkeypatch.setattr(media_cache_module, "PREVIEWS_DIR", previews)
+    service = media_cache_module.MediaCacheService()
+
+    old_time = (datetime.now() - timedelta(days=3)).timestamp()
+    old_files = [snapshots / "evt_a.jpg", snapshots / "evt_b.jpg", clips / "evt_c.mp4", snapshots / "evt_keep.jpg"]
+    for path in old_files:
+        path.write_bytes(b"x")
+        os.utime(path, (old_time, old_time))
+    fresh = clips / "evt_fresh.mp4"
+    fresh.write_bytes(b"x")
+    empty = previews / "evt_empty.json"
+    empty.write_bytes(b"")
+
+    cursor: dict = {}
+    slices = 0
+    deleted = 0
+    while True:
+        result = await service.cleanup_old_media_slice(1, {"evt_keep"}, cursor=cursor, max_files=2)
+        slices += 1
+        assert result["scanned"] <= 2
+        deleted += result["snapshots_deleted"] + result["clips_deleted"] + result["previews_deleted"]
+        if result["done"]:
+            break
+        cursor = result["cursor"]
+
+    assert slices >= 3
+    assert deleted == 4
+    assert (snapshots / "evt_keep.jpg").exists()
+    assert fresh.exists()
+    assert not empty.exists()
+    assert not any(path.exists() for path in old_files[:3])
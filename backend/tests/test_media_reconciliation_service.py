@@ -0,0 +1,200 @@
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+
+from app.config import settings
+from app.database import get_db
+from app.repositories.detection_repository import Detection, DetectionRepository
+from app.services import media_reconciliation_service as reconciliation_module
+from app.services.media_reconciliation_service import MediaReconciliationService, merge_diff
+from app.utils.api_datetime import utc_naive_from_timestamp
+
+DAY = 86400.0
+
+
+@pytest.fixture(autouse=True)
+def reset_missing_policy_settings():
+    original_clips_enabled = settings.frigate.clips_enabled
+    original_behavior = settings.maintenance.frigate_missing_behavior
+    settings.frigate.clips_enabled = True
+    settings.maintenance.frigate_missing_behavior = "mark_missing"
+    yield
+    settings.frigate.clips_enabled = original_clips_enabled
+    settings.maintenance.frigate_missing_behavior = original_behavior
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clear_detections_table():
+    async with get_db() as db:
+        await DetectionRepository(db).delete_all()
+    yield
+    async with get_db() as db:
+        await DetectionRepository(db).delete_all()
+
+
+class _FakeFrigate:
+    """Frigate event history with a movable retention floor."""
+
+    def __init__(self) -> None:
+        self.events: dict[str, dict] = {}
+        self.retained_after = 0.0
+        self.list_calls: list[tuple[float, float]] = []
+
+    def add(self, event_id: str, start_time: float, *, has_clip: bool = True) -> None:
+        self.events[event_id] = {
+            "id": event_id,
+            "start_time": start_time,
+            "has_clip": has_clip,
+            "has_snapshot": True,
+        }
+
+    async def list_events(self, after=None, before=None, label=None, camera=None, has_snapshot=True, limit=100):
+        self.list_calls.append((after, before))
+        matching = [
+            event
+            for event in self.events.values()
+            if event["start_time"] >= self.retained_after and after < event["start_time"] < before
+        ]
+        matching.sort(key=lambda event: event["start_time"], reverse=True)
+        return matching[:limit]
+
+
+async def _insert(event_id: str, start_time: float) -> None:
+    async with get_db() as db:
+        await DetectionRepository(db).create(
+            Detection(
+                detection_time=utc_naive_from_timestamp(start_time),
+                detection_index=1,
+                score=0.9,
+                display_name="Bird",
+                category_name="Bird",
+                frigate_event=event_id,
+                camera_name="cam_1",
+            )
+        )
+
+
+async def _status(event_id: str) -> str | None:
+    async with get_db() as db:
+        detection = await DetectionRepository(db).get_by_frigate_event(event_id)
+    return detection.frigate_status if detection else None
+
+
+def test_merge_diff_splits_sorted_ids():
+    present, absent = merge_diff(["a", "c", "d", "f"], ["b", "c", "e", "f", "g"])
+
+    assert present == ["c", "f"]
+    assert absent == ["a", "d"]
+
+
+@pytest.mark.asyncio
+async def test_full_then_incremental_reconciliation_only_rechecks_retention_boundary(tmp_path):
+    now = time.time()
+    oldest = now - 10 * DAY
+    frigate = _FakeFrigate()
+    frigate.retained_after = now - 7 * DAY
+    layout = {
+        "expired": [oldest, oldest + 60, oldest + 120],
+        "aging": [now - 5 * DAY + 3600, now - 5 * DAY + 3660],
+        "recent": [now - DAY + 3600, now - DAY + 3660],
+    }
+    ids: dict[str, list[str]] = {}
+    for group, timestamps in layout.items():
+        for index, ts in enumerate(timestamps):
+            event_id = f"{ts:.6f}-{group}{index}"
+            ids.setdefault(group, []).append(event_id)
+            frigate.add(event_id, ts)
+            await _insert(event_id, ts)
+
+    service = MediaReconciliationService(state_path=tmp_path / "state.json")
+    get_event = AsyncMock(return_value=(None, "event_not_found"))
+    with (
+        patch.object(reconciliation_module.frigate_client, "get_version", new=AsyncMock(return_value="0.17.1")),
+        patch.object(reconciliation_module.frigate_client, "list_events", new=frigate.list_events),
+        patch.object(reconciliation_module.frigate_client, "get_event_with_error", new=get_event),
+    ):
+        full = await service.reconcile("media", full=False)
+
+        assert full["mode"] == "full"
+        assert full["checked"] == 7
+        assert full["missing"] == 3
+        assert full["marked_missing_count"] == 3
+        assert full["frigate_calls"] == 1 + len(frigate.list_calls)
+        assert full["frigate_calls"] < full["checked"]
+        get_event.assert_not_awaited()
+        for event_id in ids["expired"]:
+            assert await _status(event_id) == "missing"
+        for event_id in ids["aging"] + ids["recent"]:
+            assert await _status(event_id) == "present"
+
+        newest = now - 1800
+        new_id = f"{newest:.6f}-new"
+        frigate.add(new_id, newest)
+        await _insert(new_id, newest)
+        frigate.retained_after = now - 3 * DAY
+        frigate.list_calls.clear()
+
+        incremental = await service.reconcile("media", full=False)
+
+    assert incremental["mode"] == "incremental"
+    assert incremental["missing"] == 2
+    assert incremental["checked"] == 5
+    assert incremental["frigate_calls"] == 1 + len(frigate.list_calls)
+    assert all(after >= oldest + 4 * DAY for after, _before in frigate.list_calls)
+    get_event.assert_not_awaited()
+    for event_id in ids["aging"]:
+        assert await _status(event_id) == "missing"
+    for event_id in ids["recent"] + [new_id]:
+        assert await _status(event_id) == "present"
+
+
+@pytest.mark.asyncio
+async def test_listing_pages_keep_events_sharing_the_page_boundary_timestamp(tmp_path, monkeypatch):
+    monkeypatch.setattr(reconciliation_module, "MEDIA_RECONCILE_PAGE_LIMIT", 3)
+    now = time.time()
+    frigate = _FakeFrigate()
+    timestamps = [now - 600, now - 500, now - 500, now - 400, now - 300]
+    for index, ts in enumerate(timestamps):
+        event_id = f"{ts:.6f}-shared{index}"
+        frigate.add(event_id, ts, has_clip=index != 4)
+        await _insert(event_id, ts)
+
+    service = MediaReconciliationService(state_path=tmp_path / "state.json")
+    with (
+        patch.object(reconciliation_module.frigate_client, "get_version", new=AsyncMock(return_value="0.17.1")),
+        patch.object(reconciliation_module.frigate_client, "list_events", new=frigate.list_events),
+        patch.object(reconciliation_module.frigate_client, "get_event_with_error", new=AsyncMock()) as get_event,
+    ):
+        result = await service.reconcile("clip")
+
+    assert result["checked"] == 5
+    assert result["missing"] == 1
+    assert len(frigate.list_calls) > 1
+    get_event.assert_not_awaited()
+    assert await _status(f"{timestamps[4]:.6f}-shared4") == "missing"
+
+
+@pytest.mark.asyncio
+async def test_failed_listing_aborts_without_applying_policy_or_advancing_watermark(tmp_path):
+    now = time.time()
+    event_id = f"{now - 60:.6f}-unreadable"
+    await _insert(event_id, now - 60)
+    state_path = tmp_path / "state.json"
+    service = MediaReconciliationService(state_path=state_path)
+
+    with (
+        patch.object(reconciliation_module.frigate_client, "get_version", new=AsyncMock(return_value="0.17.1")),
+        patch.object(
+            reconciliation_module.frigate_client,
+            "list_events",
+            new=AsyncMock(side_effect=reconciliation_module.FrigateEventsFetchError("unreachable")),
+        ),
+    ):
+        result = await service.reconcile("media", full=False)
+
+    assert result["status"] == "failed"
+    assert result["missing"] == 0
+    assert not state_path.exists()
+    assert await _status(event_id) == "present"
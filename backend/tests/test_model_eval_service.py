@@ -14,6 +14,7 @@ import asyncio
 import json
 from pathlib import Path
 from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
@@ -565,3 +566,115 @@ async def test_start_rejects_when_already_running(tmp_path: Path, monkeypatch):
                 await runner._task
             except asyncio.CancelledError:
                 pass
+
+
+@pytest.mark.asyncio
+async def test_accuracy_pass_runs_in_sidecar_without_touching_live_model(tmp_path, monkeypatch):
+    from app.services import classifier_service as classifier_module
+    from app.services import model_eval_service
+    from app.services.eval.image_fetcher import FetchedImage
+    from app.services.model_manager import model_manager
+
+    runner = ModelEvalRunner()
+    entry = SpeciesEntry(891696, "Pica pica", "Eurasian Magpie", "shared_core")
+    images = [
+        FetchedImage(891696, "Pica pica", "Eurasian Magpie", "inat", f"https://x/{i}", str(tmp_path / f"{i}.jpg"))
+        for i in range(3)
+    ]
+    sidecars: list[Any] = []
+
+    class _FakeSidecar:
+        def __init__(self, model_id, *, tensor_cache_dir=None):
+            self.model_id = model_id
+            self.tensor_cache_dir = tensor_cache_dir
+            self.batches: list[list[str]] = []
+            self.closed = False
+            sidecars.append(self)
+
+        async def start(self):
+            return {"type": "ready", "spec": {"model_id": self.model_id, "runtime": "onnx"}, "status": {}}
+
+        async def classify_batch(self, paths):
+            self.batches.append(list(paths))
+            return [
+                {
+                    "path": p,
+                    "top5": [{"label": "Pica pica", "score": 0.9}],
+                    "latency_ms": 5.0,
+                    "tensor_cache": "hit" if len(self.batches) > 1 else "miss",
+                }
+                for p in paths
+            ]
+
+        async def close(self):
+            self.closed = True
+            return {"type": "closed", "status": {"active_provider": "cpu"}}
+
+    class _LiveClassifier:
+        def get_admission_status(self):
+            return {"live": {"capacity": 2, "queued": 0, "running": 0}}
+
+        async def reload_bird_model(self):
+            raise AssertionError("live classifier must not be reloaded")
+
+    async def build_panel(**_kwargs):
+        return [entry]
+
+    async def fetch_panel_images(**_kwargs):
+        return {entry.taxa_id: images}
+
+    async def list_installed_models():
+        return [SimpleNamespace(id="candidate", ready=True, reason=None, metadata=None)]
+
+    async def activate_model(_model_id):
+        raise AssertionError("accuracy pass must not activate models")
+
+    async def emit(*_args, **_kwargs):
+        return None
+
+    monkeypatch.setenv("YAWAMF_EVAL_RUNS_DIR", str(tmp_path))
+    monkeypatch.setattr(model_eval_service, "build_panel", build_panel)
+    monkeypatch.setattr(model_eval_service, "fetch_panel_images", fetch_panel_images)
+    monkeypatch.setattr(model_eval_service, "EvalSidecar", _FakeSidecar)
+    monkeypatch.setattr(model_eval_service, "MODEL_EVAL_SIDECAR_BATCH_SIZE", 2)
+    monkeypatch.setattr(classifier_module, "get_classifier", lambda: _LiveClassifier())
+    monkeypatch.setattr(model_manager, "list_installed_models", list_installed_models)
+    monkeypatch.setattr(model_manager, "activate_model", activate_model)
+    monkeypatch.setattr(runner, "_emit", emit)
+
+    (tmp_path / ".tensor-cache").mkdir()
+    await runner._do_run(run_id="run-1", run_dir=tmp_path, include_per_image=False, region_override=None)
+
+    assert [len(batch) for batch in sidecars[0].batches] == [2, 1]
+    assert sidecars[0].closed is True
+    summary = json.loads((tmp_path / SUMMARY_FILENAME).read_text())
+    model_summary = summary["models"][0]
+    assert model_summary["model_id"] == "candidate"
+    assert model_summary["images_evaluated"] == 3
+    assert model_summary["top1_accuracy"] == 1.0
+    assert model_summary["throughput_images_per_second"] > 0
+    assert model_summary["active_provider"] == "cpu"
+    assert model_summary["tensor_cache_misses"] == 2
+    assert model_summary["tensor_cache_hits"] == 1
+    assert summary["tensor_cache"] == {"hits": 1, "misses": 2, "reuse_ratio": 0.3333}
+    assert sidecars[0].tensor_cache_dir == tmp_path / ".tensor-cache"
+    assert [row["run_id"] for row in runner.list_runs()] == []
+
+
+@pytest.mark.asyncio
+async def test_wait_for_live_headroom_yields_while_live_lane_is_saturated(monkeypatch):
+    from app.services import model_eval_service
+
+    polls = {"count": 0}
+
+    class _Classifier:
+        def get_admission_status(self):
+            polls["count"] += 1
+            queued = 1 if polls["count"] <= 2 else 0
+            return {"live": {"capacity": 1, "queued": queued, "running": 0}}
+
+    monkeypatch.setattr(model_eval_service, "MODEL_EVAL_THROTTLE_POLL_SECONDS", 0.01)
+    waited = await model_eval_service._wait_for_live_headroom(_Classifier())
+
+    assert waited == pytest.approx(0.02)
+    assert polls["count"] == 3
@@ -935,6 +935,20 @@ async def test_activate_model_rejects_incomplete_classifier_install(monkeypatch,
     assert manager.active_model_id != "convnext_large_inat21"
 
 
+def test_select_model_for_process_does_not_persist_selection(monkeypatch, tmp_path):
+    monkeypatch.setattr("app.services.model_manager.MODELS_DIR", str(tmp_path))
+    bundled_dir = tmp_path / "bundled"
+    bundled_dir.mkdir()
+    (bundled_dir / "model.tflite").write_bytes(b"tflite")
+    monkeypatch.setattr("app.services.model_manager.BUNDLED_MODELS_DIR", str(bundled_dir))
+
+    manager = ModelManager()
+
+    assert manager.select_model_for_process("mobilenet_v2_birds") is True
+    assert manager.active_model_id == "mobilenet_v2_birds"
+    assert not (tmp_path / "active_model.json").exists()
+
+
 def test_get_active_model_spec_falls_back_to_bundled_model_with_registry_contract(monkeypatch, tmp_path):
     monkeypatch.setattr("app.services.model_manager.MODELS_DIR", str(tmp_path))
 
@@ -169,6 +169,42 @@ async def test_schedule_frigate_message_allows_parallel_processing_for_different
     assert processor.max_active >= 2
 
 
+@pytest.mark.asyncio
+async def test_release_dispatch_replays_pre_ready_buffer_in_arrival_order():
+    service = MQTTService("test+abc123")
+    service.running = True
+    processor = _RecordingAudioProcessor()
+    processor.release.set()
+    service._event_processor = processor
+
+    service.hold_dispatch()
+    for index in range(3):
+        service._buffer_pre_ready("birdnet", json.dumps({"n": index}).encode(), None)
+    assert processor.payloads == []
+    assert service.get_status()["pre_ready"]["buffered"] == 3
+
+    await service.release_dispatch()
+    await service._drain_in_flight_tasks()
+
+    assert [payload["n"] for payload in processor.payloads] == [0, 1, 2]
+    status = service.get_status()["pre_ready"]
+    assert status["holding"] is False
+    assert status["buffered"] == 0
+    assert status["replayed"] == 3
+
+
+def test_pre_ready_buffer_drops_oldest_when_full(monkeypatch):
+    monkeypatch.setattr(mqtt_module, "MQTT_PRE_READY_BUFFER_SIZE", 2)
+    service = MQTTService("test+abc123")
+    service.hold_dispatch()
+
+    for event_id in ("evt-1", "evt-2", "evt-3"):
+        service._buffer_pre_ready("frigate", _frigate_payload(event_id, "new"), event_id)
+
+    assert [entry[2] for entry in service._pre_ready_buffer] == ["evt-2", "evt-3"]
+    assert service.get_status()["pre_ready"]["dropped"] == 1
+
+
 @pytest.mark.asyncio
 async def test_dispatch_frigate_message_times_out_and_returns(monkeypatch):
     service = MQTTService("test+abc123")
@@ -223,6 +259,18 @@ async def test_parse_frigate_payload_meta_skips_non_actionable_updates():
     assert meta["should_process"] is False
 
 
+@pytest.mark.asyncio
+async def test_parse_frigate_payload_meta_admits_updates_when_live_refresh_enabled():
+    service = MQTTService("test+abc123")
+
+    payload = _frigate_payload("evt-update", "update", false_positive=False)
+    with patch.object(mqtt_module.settings.classification, "live_event_refresh_enabled", True, create=True):
+        meta = service._parse_frigate_payload_meta(payload)
+
+    assert meta is not None
+    assert meta["should_process"] is True
+
+
 @pytest.mark.asyncio
 async def test_parse_frigate_payload_meta_processes_end_events():
     service = MQTTService("test+abc123")
@@ -0,0 +1,206 @@
+"""EXPLAIN QUERY PLAN regression suite for the detections hot queries.
+
+Builds a migrated database seeded with ``QUERY_PLAN_FIXTURE_ROWS`` detections
+(500k by default), refreshes planner statistics the way the pool does, runs the
+real repository methods and fails if any statement they issue plans a full scan
+of ``detections``, ``species_daily_rollup`` or ``detection_hourly_cube``.
+"""
+
+import os
+import re
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime, timedelta
+
+import aiosqlite
+import pytest
+
+from app.database import DB_ANALYZE_LIMIT
+from app.repositories.detection_repository import DetectionRepository
+from app.repositories.ebird_repository import EbirdRepository
+
+FIXTURE_ROWS = max(1000, int(os.environ.get("QUERY_PLAN_FIXTURE_ROWS", "500000")))
+SPECIES_COUNT = 60
+HOT_TABLES = ("detections", "species_daily_rollup", "detection_hourly_cube")
+# "SCAN d" / "SCAN detections" without "USING ... INDEX" reads every table row.
+_FULL_SCAN = re.compile(r"^SCAN (\w+)(?: AS (\w+))?$")
+
+
+def _upgrade_db(db_path):
+    env = os.environ.copy()
+    env["DB_PATH"] = str(db_path)
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=os.path.join(os.path.dirname(__file__), ".."),
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def _seed(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < ?)
+        INSERT INTO detections (
+            detection_time, detection_index, score, display_name, category_name, frigate_event,
+            camera_name, is_hidden, scientific_name, common_name, taxa_id
+        )
+        SELECT
+            datetime('now', '-' || n || ' minutes'), 0, (n % 100) / 100.0,
+            'Species ' || (n % ?), 'Species ' || (n % ?), 'event-' || n,
+            'camera_' || (n % 4), CASE WHEN n % 50 = 0 THEN 1 ELSE 0 END,
+            'Genus species' || (n % ?), 'Common ' || (n % ?), 1000 + (n % ?)
+        FROM seq
+        """,
+        (FIXTURE_ROWS, *([SPECIES_COUNT] * 5)),
+    )
+    conn.execute(
+        """
+        WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < ?)
+        INSERT INTO taxonomy_cache (scientific_name, common_name, taxa_id)
+        SELECT 'Genus species' || n, 'Common ' || n, 1000 + n FROM seq
+        """,
+        (SPECIES_COUNT - 1,),
+    )
+    conn.execute(
+        "INSERT INTO detection_favorites (detection_id, created_at) "
+        "SELECT id, detection_time FROM detections WHERE id % 997 = 0"
+    )
+    conn.execute(
+        """
+        INSERT INTO species_daily_rollup (
+            rollup_date, canonical_key, display_name, scientific_name, common_name, taxa_id,
+            detection_count, camera_count, first_seen, last_seen
+        )
+        SELECT date(detection_time), CAST(taxa_id AS TEXT), MAX(display_name), MAX(scientific_name),
+               MAX(common_name), taxa_id, COUNT(*), COUNT(DISTINCT camera_name),
+               MIN(detection_time), MAX(detection_time)
+        FROM detections
+        GROUP BY date(detection_time), taxa_id
+        """
+    )
+    conn.commit()
+    # Same ANALYZE as DatabasePool.refresh_statistics.
+    conn.execute(f"PRAGMA analysis_limit={DB_ANALYZE_LIMIT}")
+    conn.execute("ANALYZE")
+    conn.commit()
+
+
+@pytest.fixture(scope="module")
+def fixture_db_path(tmp_path_factory):
+    db_path = tmp_path_factory.mktemp("query_plans") / "hot_queries.db"
+    _upgrade_db(db_path)
+    conn = sqlite3.connect(str(db_path))
+    try:
+        _seed(conn)
+    finally:
+        conn.close()
+    return str(db_path)
+
+
+def _full_scans(conn: sqlite3.Connection, statement: str) -> list[str]:
+    plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {statement}")]
+    aliases = set(HOT_TABLES)
+    for table in HOT_TABLES:
+        aliases.update(re.findall(rf"\b{table}\s+(?:AS\s+)?(\w+)", statement, flags=re.IGNORECASE))
+    scans = []
+    for detail in plan:
+        match = _FULL_SCAN.match(detail.strip())
+        if match and (match.group(2) or match.group(1)) in aliases:
+            scans.append(detail)
+    return scans
+
+
+async def _assert_no_full_scans(db_path: str, call) -> None:
+    async with aiosqlite.connect(db_path) as db:
+        statements: list[str] = []
+        await db.set_trace_callback(statements.append)
+        await call(DetectionRepository(db))
+        await db.set_trace_callback(None)
+
+    hot = [s for s in statements if s.lstrip().upper().startswith(("SELECT", "WITH"))]
+    hot = [s for s in hot if any(table in s for table in HOT_TABLES)]
+    assert hot, "the call issued no query against the hot tables"
+    with sqlite3.connect(db_path) as conn:
+        regressions = {s.strip()[:200]: scans for s in hot if (scans := _full_scans(conn, s))}
+    assert regressions == {}
+
+
+def _now() -> datetime:
+    return datetime.utcnow()
+
+
+async def _drain_export(repo, **kwargs):
+    async for _ in repo.iter_export(start_date=_now() - timedelta(days=7), end_date=_now(), **kwargs):
+        pass
+
+
+HOT_QUERIES = {
+    "events_list": lambda repo: repo.get_all(limit=50, offset=500),
+    "events_list_window": lambda repo: repo.get_all(start_date=_now() - timedelta(days=3), end_date=_now()),
+    "events_list_species": lambda repo: repo.get_all(species="Species 7", limit=25),
+    "events_list_camera": lambda repo: repo.get_all(camera="camera_2", limit=25),
+    "events_count": lambda repo: repo.get_count(),
+    "events_count_window": lambda repo: repo.get_count(start_date=_now() - timedelta(days=7), end_date=_now()),
+    "events_export": _drain_export,
+    "events_export_resume": lambda repo: _drain_export(repo, after=("2000-01-01 00:00:00", 0)),
+    "leaderboard_base": lambda repo: repo.get_species_leaderboard_base(),
+    "leaderboard_window": lambda repo: repo.get_species_leaderboard_window(
+        _now() - timedelta(days=1), _now(), _now() - timedelta(days=2), _now() - timedelta(days=1)
+    ),
+    "unified_window_metrics": lambda repo: repo.get_unified_species_window_metrics(30),
+    "timebucket_counts": lambda repo: repo.get_timebucket_species_counts(
+        _now() - timedelta(days=7), _now(), "hour", {"Species 3": ["Species 3"], "Species 4": ["Species 4"]}
+    ),
+    "hourly_counts": lambda repo: repo.get_timebucket_counts_hourly(_now() - timedelta(days=1), _now()),
+    "hourly_metrics": lambda repo: repo.get_timebucket_metrics(_now() - timedelta(days=7), _now(), "hour"),
+    "activity_heatmap": lambda repo: repo.get_activity_heatmap_utc_hourly_counts(_now() - timedelta(days=30), _now()),
+    "ebird_export_names": lambda repo: EbirdRepository(repo.db).get_export_name_groups(start=None, end_exclusive=None),
+    "ebird_export_page": lambda repo: EbirdRepository(repo.db).get_export_page(
+        start=None, end_exclusive=None, before=(_now() - timedelta(days=3), 10**9), limit=1000
+    ),
+    "ai_unanalyzed_today": lambda repo: repo.list_unanalyzed_event_ids(_now() - timedelta(days=1), _now()),
+    "rollup_metrics": lambda repo: repo.get_rollup_metrics(30),
+    "rollup_metrics_for_species": lambda repo: repo.get_rollup_metrics_for_species(["Species 3"], 30),
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+async def test_hot_query_does_not_regress_to_full_scan(fixture_db_path, name):
+    await _assert_no_full_scans(fixture_db_path, HOT_QUERIES[name])
+
+
+def test_visible_rows_use_partial_time_index(fixture_db_path):
+    with sqlite3.connect(fixture_db_path) as conn:
+        plan = " ".join(
+            row[3]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT d.id FROM detections d "
+                "WHERE (d.is_hidden = 0 OR d.is_hidden IS NULL) AND d.detection_time >= ? "
+                "ORDER BY d.detection_time DESC LIMIT 50",
+                ("2000-01-01",),
+            )
+        )
+    assert "idx_detections_visible_time" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_visible_count_is_answered_from_the_covering_index(fixture_db_path):
+    with sqlite3.connect(fixture_db_path) as conn:
+        plan = [
+            row[3]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM detections d WHERE (d.is_hidden = 0 OR d.is_hidden IS NULL)"
+            )
+        ]
+    assert plan == ["SCAN d USING COVERING INDEX idx_detections_visible_time"]
+
+
+def test_full_scan_detector_flags_unindexed_predicates(fixture_db_path):
+    with sqlite3.connect(fixture_db_path) as conn:
+        assert _full_scans(conn, "SELECT COUNT(*) FROM detections d WHERE d.weather_condition = 'rain'") == ["SCAN d"]
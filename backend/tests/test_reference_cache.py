@@ -0,0 +1,157 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.database import close_db, get_db, init_db
+from app.main import app
+from app.models import SpeciesInfo
+from app.repositories.species_repository import SpeciesRepository
+from app.routers import species as species_router
+from app.services.reference_cache import ReferenceCacheService, reference_cache
+from app.utils.api_datetime import utc_naive_now
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def db():
+    await init_db()
+    yield
+    await close_db()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ReferenceCacheService(blob_dir=tmp_path / "reference_cache", max_blob_bytes=10)
+
+
+def _key() -> str:
+    return f"key-{uuid.uuid4().hex}"
+
+
+async def _age(source: str, key: str, age: timedelta) -> None:
+    async with get_db() as db:
+        await db.execute(
+            "UPDATE reference_cache SET fetched_at = ?, accessed_at = ? WHERE source = ? AND cache_key = ?",
+            (utc_naive_now() - age, utc_naive_now() - age, source, key),
+        )
+        await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch_and_later_reads_hit_the_table(cache):
+    key = _key()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"month_of_year": {"1": 3}}
+
+    results = await asyncio.gather(*(cache.get_json("inat_seasonality", key, fetch) for _ in range(5)))
+    assert results == [{"month_of_year": {"1": 3}}] * 5
+    assert calls == 1
+
+    # A new service instance (a restart) still serves it without going upstream.
+    restarted = ReferenceCacheService(blob_dir=cache.blob_dir)
+    assert await restarted.get_json("inat_seasonality", key, fetch) == {"month_of_year": {"1": 3}}
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_one_background_refresh_runs(cache):
+    key = _key()
+    await cache.get_json("gbif_taxon_key", key, lambda: asyncio.sleep(0, result={"usage_key": 1}))
+    await _age("gbif_taxon_key", key, timedelta(days=8))
+
+    refreshed = asyncio.Event()
+
+    async def slow_fetch():
+        await refreshed.wait()
+        return {"usage_key": 2}
+
+    assert await cache.get_json("gbif_taxon_key", key, slow_fetch) == {"usage_key": 1}
+    assert await cache.get_json("gbif_taxon_key", key, slow_fetch) == {"usage_key": 1}
+    assert len(cache._inflight) == 1
+
+    refreshed.set()
+    await asyncio.gather(*cache._inflight.values())
+    assert await cache.get_json("gbif_taxon_key", key, slow_fetch) == {"usage_key": 2}
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_serving_stale_data_and_expired_entries_refetch(cache):
+    key = _key()
+    await cache.get_json("ebird_recent", key, lambda: asyncio.sleep(0, result=[{"speciesCode": "eurrob1"}]))
+    await _age("ebird_recent", key, timedelta(hours=1))
+
+    async def offline():
+        raise ConnectionError("upstream offline")
+
+    assert await cache.get_json("ebird_recent", key, offline) == [{"speciesCode": "eurrob1"}]
+    await asyncio.gather(*cache._inflight.values())
+    assert await cache.get_json("ebird_recent", key, offline) == [{"speciesCode": "eurrob1"}]
+    assert cache._inflight == {}, "a failed refresh is not retried inside the retry window"
+
+    # Past max_stale the entry is no longer served and a miss surfaces the upstream error.
+    await _age("ebird_recent", key, timedelta(days=3))
+    with pytest.raises(ConnectionError):
+        await cache.get_json("ebird_recent", key, offline)
+
+
+@pytest.mark.asyncio
+async def test_blobs_are_stored_on_disk_and_evicted_least_recently_used(cache):
+    keys = [_key() for _ in range(3)]
+    for index, key in enumerate(keys):
+        png = b"png" + bytes([index])
+        content, media_type = await cache.get_blob(
+            "birdnet_spectrogram", key, lambda png=png: asyncio.sleep(0, result=(png, "image/png"))
+        )
+        assert (content, media_type) == (png, "image/png")
+        await _age("birdnet_spectrogram", key, timedelta(minutes=10 - index))
+
+    # 12 bytes against a 10 byte budget: the least recently used blob goes, file included.
+    async with get_db() as db:
+        async with db.execute(
+            "SELECT cache_key FROM reference_cache WHERE source = 'birdnet_spectrogram' AND cache_key IN (?, ?, ?)",
+            keys,
+        ) as cursor:
+            remaining = {row[0] for row in await cursor.fetchall()}
+    assert keys[0] not in remaining
+    assert not cache._blob_path("birdnet_spectrogram", keys[0]).exists()
+    assert Path(cache._blob_path("birdnet_spectrogram", keys[2])).read_bytes() == b"png\x02"
+
+    async def unreachable():
+        raise AssertionError("cached blob should be served from disk")
+
+    assert await cache.get_blob("birdnet_spectrogram", keys[2], unreachable) == (b"png\x02", "image/png")
+
+
+@pytest.mark.asyncio
+async def test_species_info_serves_stale_summary_and_refreshes_in_background():
+    species_name = f"Stale Finch {uuid.uuid4().hex[:6]}"
+    async with get_db() as db:
+        await SpeciesRepository(db).save_cached_info(
+            species_name=species_name,
+            taxa_id=None,
+            language="en",
+            values={"title": species_name, "extract": "Cached summary", "source": "wikipedia"},
+            cached_at=datetime.now() - timedelta(days=2),
+        )
+        await db.commit()
+
+    fresh = SpeciesInfo(title=species_name, extract="Fresh summary", cached_at=datetime.now())
+    fetch = AsyncMock(return_value=fresh)
+    with patch.object(species_router, "_fetch_species_info", fetch):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get(f"/api/species/{species_name}/info")
+        assert response.status_code == 200
+        assert response.json()["extract"] == "Cached summary"
+        await asyncio.gather(*reference_cache._inflight.values())
+
+    fetch.assert_awaited_once_with(species_name, None, "en")
@@ -47,7 +47,9 @@ def test_startup_status_failure_exposes_only_bounded_operational_fields(tmp_path
         "progress": 70,
         "started_at": payload["started_at"],
         "updated_at": payload["updated_at"],
+        "phase_durations_ms": payload["phase_durations_ms"],
     }
+    assert set(payload["phase_durations_ms"]) == {"launching", "database"}
 
 
 def test_startup_status_is_a_safe_noop_without_a_configured_path():
@@ -58,3 +60,57 @@ def test_startup_status_is_a_safe_noop_without_a_configured_path():
 
     assert publisher.snapshot()["status"] == "ready"
     assert publisher.snapshot()["progress"] == 100
+
+
+def test_startup_status_times_each_phase_until_ready(tmp_path, monkeypatch):
+    clock = iter([10.0, 10.5, 12.0, 12.25])
+    monkeypatch.setattr("app.services.startup_status.time.monotonic", lambda: next(clock))
+    publisher = StartupStatusPublisher(tmp_path / "startup-status.json")
+
+    publisher.publish("loading_model", 30)
+    publisher.publish("loading_model", 40)
+    publisher.publish("database", 70)
+    publisher.mark_ready()
+
+    assert publisher.snapshot()["phase_durations_ms"] == {
+        "launching": 500.0,
+        "loading_model": 1500.0,
+        "database": 250.0,
+    }
+
+
+def test_startup_status_records_import_profile_and_first_http_ok_once(tmp_path, monkeypatch):
+    clock = iter([100.0, 101.5, 103.0])
+    monkeypatch.setattr("app.services.startup_status.time.monotonic", lambda: next(clock))
+    status_path = tmp_path / "startup-status.json"
+    publisher = StartupStatusPublisher(status_path)
+
+    publisher.record_import_profile({"total_ms": 900.0, "heavy_modules_loaded": []}, started_monotonic=99.0)
+    publisher.mark_ready()
+    publisher.mark_first_http_ok()
+    publisher.mark_first_http_ok()
+
+    payload = json.loads(status_path.read_text(encoding="utf-8"))
+    assert payload["status"] == "ready"
+    assert payload["import_profile"] == {"total_ms": 900.0, "heavy_modules_loaded": []}
+    assert payload["time_to_first_http_ok_ms"] == 4000.0
+    assert publisher.first_http_ok_recorded is True
+
+
+def test_startup_status_records_lifecycle_report_after_ready(tmp_path):
+    status_path = tmp_path / "startup-status.json"
+    publisher = StartupStatusPublisher(status_path)
+    report = {
+        "total_ms": 900.0,
+        "phases": {"db_init": {"depends_on": [], "started_ms": 0.0, "finished_ms": 400.0}},
+        "critical_path": ["db_init"],
+        "critical_path_ms": 400.0,
+    }
+
+    publisher.mark_ready()
+    publisher.record_lifecycle(report)
+
+    payload = json.loads(status_path.read_text(encoding="utf-8"))
+    assert payload["status"] == "ready"
+    assert payload["lifecycle"]["critical_path"] == ["db_init"]
+    assert publisher.snapshot()["lifecycle"] == report
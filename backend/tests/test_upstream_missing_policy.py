@@ -19,6 +19,13 @@ def reset_missing_policy_settings():
     settings.maintenance.frigate_missing_behavior = original_behavior
 
 
+@pytest.fixture(autouse=True)
+def isolated_reconciliation_state(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        settings_router.media_reconciliation_service, "_state_path", tmp_path / "media_reconciliation_state.json"
+    )
+
+
 @pytest_asyncio.fixture(autouse=True)
 async def clear_detections_table():
     async with get_db() as db:
@@ -55,6 +62,7 @@ async def test_purge_missing_media_marks_detection_when_behavior_is_mark_missing
 
     with (
         patch.object(settings_router.frigate_client, "get_version", new=AsyncMock(return_value="0.17.1")),
+        patch.object(settings_router.frigate_client, "list_events", new=AsyncMock(return_value=[])),
         patch.object(
             settings_router.frigate_client,
             "get_event_with_error",
@@ -92,6 +100,7 @@ async def test_purge_missing_media_deletes_detection_when_behavior_is_delete():
 
     with (
         patch.object(settings_router.frigate_client, "get_version", new=AsyncMock(return_value="0.17.1")),
+        patch.object(settings_router.frigate_client, "list_events", new=AsyncMock(return_value=[])),
         patch.object(
             settings_router.frigate_client,
             "get_event_with_error",
@@ -133,6 +142,7 @@ async def test_purge_missing_all_media_marks_if_either_clip_or_snapshot_is_missi
 
     with (
         patch.object(settings_router.frigate_client, "get_version", new=AsyncMock(return_value="0.17.1")),
+        patch.object(settings_router.frigate_client, "list_events", new=AsyncMock(return_value=[])),
         patch.object(
             settings_router.frigate_client,
             "get_event_with_error",
@@ -166,6 +176,7 @@ async def test_purge_missing_all_media_clears_stale_missing_state_when_media_ret
 
     with (
         patch.object(settings_router.frigate_client, "get_version", new=AsyncMock(return_value="0.17.1")),
+        patch.object(settings_router.frigate_client, "list_events", new=AsyncMock(return_value=[])),
         patch.object(
             settings_router.frigate_client,
             "get_event_with_error",